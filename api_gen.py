@@ -6,6 +6,7 @@ Run via `./shell/api_gen.sh`.
 It generates API and formats user and generated APIs.
 """
 
+import ast
 import os
 import re
 import shutil
@@ -145,6 +146,93 @@ def export_version_string(api_init_fname):
         f.write(contents)
 
 
+LAZY_INIT_TEMPLATE = """{header}import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+{imports}
+
+_LAZY_ATTRIBUTES = {{
+{attributes}
+}}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        )
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+"""
+
+
+def make_lazy_init_files(package_dir):
+    """Makes the API packages import their attributes on first access.
+
+    The imports of every `__init__.py` file are moved under `TYPE_CHECKING`,
+    for static analysis, and replaced by a PEP 562 `__getattr__`.
+
+    Args:
+        package_dir: The directory of the `keras` package.
+    """
+    for root, dirnames, fnames in os.walk(package_dir):
+        if root == package_dir and "src" in dirnames:
+            dirnames.remove("src")
+        if "__init__.py" not in fnames:
+            continue
+        fpath = os.path.join(root, "__init__.py")
+        with open(fpath) as f:
+            module = ast.parse(f.read())
+        if any(isinstance(node, ast.If) for node in module.body):
+            # Already lazy.
+            continue
+        imports = []
+        attributes = []
+        for node in module.body:
+            if not isinstance(node, ast.ImportFrom):
+                continue
+            for alias in node.names:
+                name = alias.asname or alias.name
+                imports.append(
+                    f"    from {node.module} import {alias.name} as {name}"
+                )
+                source_path = os.path.join(
+                    os.path.dirname(package_dir),
+                    *f"{node.module}.{alias.name}".split("."),
+                )
+                if os.path.isdir(source_path) or os.path.exists(
+                    f"{source_path}.py"
+                ):
+                    source = (f"{node.module}.{alias.name}", None)
+                else:
+                    source = (node.module, alias.name)
+                attributes.append(f"    {name!r}: {source!r},")
+        if not imports:
+            continue
+        docstring = ast.get_docstring(module)
+        with open(fpath, "w") as f:
+            f.write(
+                LAZY_INIT_TEMPLATE.format(
+                    header=f'"""{docstring}\n"""\n\n' if docstring else "",
+                    imports="\n".join(imports),
+                    attributes="\n".join(attributes),
+                )
+            )
+
+
 def build():
     root_path = os.path.dirname(os.path.abspath(__file__))
     code_api_dir = os.path.join(root_path, PACKAGE, "api")
@@ -170,6 +258,8 @@ def build():
         export_version_string(build_api_init_fname)
         # Creates `_tf_keras` with full keras API
         create_legacy_directory(package_dir=os.path.join(build_dir, PACKAGE))
+        # Load the API lazily
+        make_lazy_init_files(package_dir=os.path.join(build_dir, PACKAGE))
         # Copy back the keras/api and keras/__init__.py from build directory
         if os.path.exists(build_src_dir):
             shutil.rmtree(build_src_dir)
@@ -0,0 +1,89 @@
+"""Benchmark the startup time of `import keras`.
+
+For each backend, runs fresh Python processes importing Keras, and reports:
+
+- The time of `import keras`, and the number of modules it loads.
+- The time of the first access to `keras.layers`, which loads the layers and
+  the backend, and the number of modules loaded by then.
+
+The times are the medians over `--num_runs` processes.
+
+```
+python3 -m benchmarks.import_benchmark.import_benchmark \
+    --backends=jax,tensorflow,torch,numpy \
+    --num_runs=5
+```
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+from absl import app
+from absl import flags
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list(
+    "backends", ["jax", "tensorflow", "torch", "numpy"], "Backends to test."
+)
+flags.DEFINE_integer("num_runs", 5, "Number of processes per backend.")
+
+CHILD_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import keras
+import_time = time.perf_counter() - start
+import_modules = len(sys.modules)
+
+start = time.perf_counter()
+keras.layers.Dense
+access_time = time.perf_counter() - start
+print(json.dumps({
+    "import_time": import_time,
+    "import_modules": import_modules,
+    "access_time": access_time,
+    "access_modules": len(sys.modules),
+}))
+"""
+
+
+def run(backend):
+    env = dict(os.environ, KERAS_BACKEND=backend)
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(_):
+    for backend in FLAGS.backends:
+        try:
+            results = [run(backend) for _ in range(FLAGS.num_runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{backend}: failed\n{e.stderr}")
+            continue
+        median = {
+            key: np.median([r[key] for r in results]) for key in results[0]
+        }
+        print(
+            f"{backend}:\n"
+            f"  import keras: {median['import_time'] * 1000:.1f} ms, "
+            f"{median['import_modules']:.0f} modules\n"
+            f"  first access to keras.layers: "
+            f"{median['access_time'] * 1000:.1f} ms, "
+            f"{median['access_modules']:.0f} modules"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
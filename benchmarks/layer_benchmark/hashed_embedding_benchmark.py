@@ -0,0 +1,126 @@
+"""Benchmark `keras.layers.HashedEmbedding` against `keras.layers.Embedding`.
+
+For each configuration, this reports the memory used by the layer weights,
+the lookup throughput of the forward pass and the collision rate, i.e. the
+fraction of distinct ids that share their embedding with another id. Ids are
+drawn from a Zipf distribution to mimic categorical features such as user or
+item ids.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.layer_benchmark.hashed_embedding_benchmark \
+    --vocabulary_size=10000000 \
+    --num_buckets=100000 \
+    --num_samples=100000 \
+    --batch_size=1024
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer(
+    "vocabulary_size",
+    10_000_000,
+    "Size of the id space the ids are drawn from.",
+)
+flags.DEFINE_integer(
+    "num_buckets",
+    100_000,
+    "Number of rows of each table of the hashed embeddings.",
+)
+flags.DEFINE_integer("output_dim", 32, "Dimension of the embeddings.")
+flags.DEFINE_integer("num_samples", 100_000, "Number of ids to look up.")
+flags.DEFINE_integer("batch_size", 1024, "Batch size of the lookups.")
+flags.DEFINE_float("zipf_exponent", 1.2, "Exponent of the id distribution.")
+flags.DEFINE_bool(
+    "include_full_table",
+    True,
+    "If True, also benchmark a full `Embedding` table of `vocabulary_size` "
+    "rows as the reference.",
+)
+
+
+def get_configs():
+    configs = {
+        "hashing_trick": {"num_hashes": 1},
+        "multi_hash_2": {"num_hashes": 2},
+        "multi_hash_3": {"num_hashes": 3},
+        "quotient_remainder": {
+            "strategy": "quotient_remainder",
+            "combiner": "multiply",
+        },
+        "multi_hash_2_admission": {
+            "num_hashes": 2,
+            "admission_threshold": 2,
+        },
+    }
+    return {
+        name: lambda config=config: keras.layers.HashedEmbedding(
+            FLAGS.num_buckets, FLAGS.output_dim, **config
+        )
+        for name, config in configs.items()
+    }
+
+
+def generate_ids():
+    ids = np.random.zipf(FLAGS.zipf_exponent, size=(FLAGS.num_samples,))
+    # Scatter the frequent ids over the id space.
+    return (ids * 2654435761 % FLAGS.vocabulary_size).astype("int32")
+
+
+def collision_rate(layer, ids):
+    unique_ids = np.unique(ids)
+    if not isinstance(layer, keras.layers.HashedEmbedding):
+        return 0.0
+    rows = keras.ops.convert_to_numpy(layer.compute_bucket_indices(unique_ids))
+    _, inverse, counts = np.unique(
+        rows, axis=0, return_inverse=True, return_counts=True
+    )
+    return float(np.mean(counts[inverse.reshape(-1)] > 1))
+
+
+def benchmark_layer(name, layer, ids):
+    model = keras.Sequential([keras.Input((), dtype="int32"), layer])
+    num_bytes = sum(
+        np.prod(w.shape) * np.dtype(w.dtype).itemsize for w in model.weights
+    )
+    # Warm up to exclude tracing and compilation from the timing.
+    model.predict(ids[: FLAGS.batch_size], verbose=0)
+    start = time.time()
+    model.predict(ids, batch_size=FLAGS.batch_size, verbose=0)
+    throughput = len(ids) / (time.time() - start)
+    print(
+        f"{name}: memory={num_bytes / 2**20:.1f} MiB, "
+        f"throughput={throughput:.0f} lookups/s, "
+        f"collision_rate={collision_rate(layer, ids):.4f}"
+    )
+
+
+def main(_):
+    ids = generate_ids()
+    print(
+        f"{len(np.unique(ids))} distinct ids out of {len(ids)} lookups, "
+        f"vocabulary_size={FLAGS.vocabulary_size}"
+    )
+    if FLAGS.include_full_table:
+        benchmark_layer(
+            "full_table",
+            keras.layers.Embedding(FLAGS.vocabulary_size, FLAGS.output_dim),
+            ids,
+        )
+    for name, layer_fn in get_configs().items():
+        benchmark_layer(name, layer_fn(), ids)
+
+
+if __name__ == "__main__":
+    app.run(main)
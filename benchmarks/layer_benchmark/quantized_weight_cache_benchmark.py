@@ -0,0 +1,120 @@
+"""Benchmark the inference weight cache of quantized `Dense`/`EinsumDense`.
+
+`int4` and `gptq` layers unpack (and for `gptq` dequantize) their kernels in
+every call. This measures the per-request latency of eager inference on a
+quantized transformer block for each value of `inference_weight_cache`, and
+the memory used by the cached kernels.
+
+Run it once per backend to compare backends:
+
+```
+KERAS_BACKEND=jax python3 -m \
+    benchmarks.layer_benchmark.quantized_weight_cache_benchmark \
+    --mode=int4 \
+    --hidden_dim=1024 \
+    --sequence_length=32 \
+    --num_requests=50
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+from keras.src.quantizers.gptq_config import GPTQConfig
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_enum("mode", "int4", ["int4", "gptq"], "Quantization mode.")
+flags.DEFINE_integer("hidden_dim", 1024, "Hidden dimension of the block.")
+flags.DEFINE_integer("num_heads", 8, "Number of attention heads.")
+flags.DEFINE_integer("sequence_length", 32, "Number of tokens per request.")
+flags.DEFINE_integer("num_requests", 50, "Number of timed requests.")
+
+
+def get_transformer_block():
+    hidden_dim = FLAGS.hidden_dim
+    inputs = keras.Input((FLAGS.sequence_length, hidden_dim))
+    x = keras.layers.LayerNormalization()(inputs)
+    x = keras.layers.MultiHeadAttention(
+        FLAGS.num_heads, hidden_dim // FLAGS.num_heads
+    )(x, x)
+    x = keras.layers.Add()([inputs, x])
+    y = keras.layers.LayerNormalization()(x)
+    y = keras.layers.Dense(4 * hidden_dim, activation="gelu")(y)
+    y = keras.layers.Dense(hidden_dim)(y)
+    outputs = keras.layers.Add()([x, y])
+    return keras.Model(inputs, outputs)
+
+
+def quantize(model):
+    if FLAGS.mode == "int4":
+        model.quantize("int4")
+        return
+    # Fill the GPTQ variables with random values instead of running the
+    # calibration, which doesn't change the cost of inference.
+    config = GPTQConfig(
+        dataset=None, tokenizer=None, weight_bits=4, group_size=128
+    )
+    for layer in model._flatten_layers():
+        if isinstance(layer, (keras.layers.Dense, keras.layers.EinsumDense)):
+            layer.quantize("gptq", config=config)
+            layer.quantized_kernel.assign(
+                np.random.randint(
+                    0, 256, layer.quantized_kernel.shape, dtype="uint8"
+                )
+            )
+            layer.kernel_zero.assign(
+                np.full(layer.kernel_zero.shape, 8, dtype="uint8")
+            )
+            layer.g_idx.assign(
+                np.arange(layer.g_idx.shape[0], dtype="float32")
+                // config.group_size
+            )
+            layer.is_gptq_calibrated = True
+
+
+def get_cache_size(model):
+    num_bytes = 0
+    for layer in model._flatten_layers():
+        cached_value = getattr(layer, "_weight_cache", None)
+        if cached_value is not None and cached_value._value is not None:
+            value = keras.ops.convert_to_numpy(cached_value._value)
+            num_bytes += value.nbytes
+    return num_bytes
+
+
+def benchmark_cache_mode(model, cache_mode, x):
+    for layer in model._flatten_layers():
+        if hasattr(layer, "inference_weight_cache"):
+            layer.inference_weight_cache = cache_mode
+    # The first request materializes the cache.
+    keras.ops.convert_to_numpy(model(x))
+    latencies = []
+    for _ in range(FLAGS.num_requests):
+        start = time.perf_counter()
+        keras.ops.convert_to_numpy(model(x))
+        latencies.append(time.perf_counter() - start)
+    print(
+        f"{keras.backend.backend()} {FLAGS.mode} "
+        f"inference_weight_cache={cache_mode}: "
+        f"median latency={1000 * np.median(latencies):.2f} ms, "
+        f"p90 latency={1000 * np.percentile(latencies, 90):.2f} ms, "
+        f"cache size={get_cache_size(model) / 2**20:.1f} MiB"
+    )
+
+
+def main(_):
+    model = get_transformer_block()
+    quantize(model)
+    x = np.random.random((1, FLAGS.sequence_length, FLAGS.hidden_dim))
+    x = x.astype("float32")
+    for cache_mode in (None, "unpacked", "dequantized"):
+        benchmark_cache_mode(model, cache_mode, x)
+
+
+if __name__ == "__main__":
+    app.run(main)
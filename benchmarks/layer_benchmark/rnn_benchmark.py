@@ -10,8 +10,15 @@ python3 -m benchmarks.layer_benchmark.rnn_benchmark \
     --batch_size=256 \
     --jit_compile=True
 ```
+
+`benchmark_fused_rnn` compares the fused LSTM/GRU implementations of the
+current backend (`use_cudnn="auto"`) against the generic per-step loop
+(`use_cudnn=False`).
 """
 
+import time
+
+import numpy as np
 import tensorflow as tf
 from absl import app
 from absl import flags
@@ -247,6 +254,31 @@ def benchmark_time_distributed(
     )
 
 
+def benchmark_fused_rnn(
+    num_samples,
+    batch_size,
+    jit_compile=True,
+):
+    data = np.random.normal(size=(num_samples, 256, 256)).astype("float32")
+    for layer_name in ("LSTM", "GRU"):
+        throughputs = {}
+        for use_cudnn in ("auto", False):
+            layer = getattr(keras.layers, layer_name)(32, use_cudnn=use_cudnn)
+            model = keras.Sequential([keras.Input(shape=(256, 256)), layer])
+            model.compile(jit_compile=jit_compile)
+            # Warm up to exclude tracing and compilation from the timing.
+            model.predict(data[:batch_size], batch_size=batch_size, verbose=0)
+            start = time.time()
+            model.predict(data, batch_size=batch_size, verbose=0)
+            throughputs[use_cudnn] = num_samples / (time.time() - start)
+        print(
+            f"{layer_name} predict on {keras.backend.backend()}: "
+            f"fused={throughputs['auto']:.0f} samples/s, "
+            f"generic={throughputs[False]:.0f} samples/s, "
+            f"speedup={throughputs['auto'] / throughputs[False]:.2f}x"
+        )
+
+
 BENCHMARK_NAMES = {
     "benchmark_conv_lstm1d": benchmark_conv_lstm1d,
     "benchmark_conv_lstm2d": benchmark_conv_lstm2d,
@@ -256,6 +288,7 @@ BENCHMARK_NAMES = {
     "benchmark_simple_rnn": benchmark_simple_rnn,
     "benchmark_bidirectional": benchmark_bidirectional,
     "benchmark_time_distributed": benchmark_time_distributed,
+    "benchmark_fused_rnn": benchmark_fused_rnn,
 }
 
 
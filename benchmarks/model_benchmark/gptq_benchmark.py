@@ -0,0 +1,90 @@
+"""Benchmark the wall time and peak memory of GPTQ calibration.
+
+Quantizes a stack of `Dense` blocks with GPTQ, and reports the time taken by
+`model.quantize()` and the peak resident memory of the process. Run it once
+per configuration, since the peak memory of a process never decreases:
+
+```
+python3 -m benchmarks.model_benchmark.gptq_benchmark \
+    --num_blocks=4 \
+    --hidden_dim=1024 \
+    --num_samples=128 \
+    --num_workers=4 \
+    --offload_dir=/tmp/gptq
+```
+"""
+
+import resource
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+from keras.src.quantizers.gptq_config import GPTQConfig
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_blocks", 4, "Number of blocks to quantize.")
+flags.DEFINE_integer("hidden_dim", 1024, "Hidden dimension of the blocks.")
+flags.DEFINE_integer("vocab_size", 1000, "Vocabulary size of the model.")
+flags.DEFINE_integer("num_samples", 128, "Number of calibration samples.")
+flags.DEFINE_integer("sequence_length", 256, "Tokens per calibration sample.")
+flags.DEFINE_integer("num_workers", 1, "Number of calibration threads.")
+flags.DEFINE_string(
+    "offload_dir", None, "Directory to offload the activations to."
+)
+
+
+class Block(keras.layers.Layer):
+    def __init__(self, hidden_dim, **kwargs):
+        super().__init__(**kwargs)
+        self.up = keras.layers.Dense(4 * hidden_dim, activation="gelu")
+        self.down = keras.layers.Dense(hidden_dim)
+
+    def call(self, inputs):
+        return inputs + self.down(self.up(inputs))
+
+
+def main(_):
+    model = keras.Sequential(
+        [keras.layers.Embedding(FLAGS.vocab_size, FLAGS.hidden_dim)]
+        + [Block(FLAGS.hidden_dim) for _ in range(FLAGS.num_blocks)]
+    )
+    model.build((None, FLAGS.sequence_length))
+    dataset = np.random.randint(
+        0,
+        FLAGS.vocab_size,
+        (FLAGS.num_samples, FLAGS.sequence_length),
+        dtype="int32",
+    )
+    config = GPTQConfig(
+        dataset=dataset,
+        # The dataset is already tokenized, so the tokenizer isn't used.
+        tokenizer=str.split,
+        num_samples=FLAGS.num_samples,
+        sequence_length=FLAGS.sequence_length,
+        group_size=128,
+        quantization_layer_structure={
+            "pre_block_layers": [model.layers[0]],
+            "sequential_blocks": model.layers[1:],
+        },
+        num_workers=FLAGS.num_workers,
+        offload_dir=FLAGS.offload_dir,
+    )
+
+    start = time.perf_counter()
+    model.quantize("gptq", config=config)
+    wall_time = time.perf_counter() - start
+    # `ru_maxrss` is in KiB on Linux.
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+    print(
+        f"{keras.backend.backend()} num_workers={FLAGS.num_workers} "
+        f"offload_dir={FLAGS.offload_dir}: "
+        f"wall time={wall_time:.1f} s, peak memory={peak_memory:.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
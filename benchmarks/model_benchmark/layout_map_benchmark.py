@@ -0,0 +1,107 @@
+"""Benchmark the startup time of a large model sharded with a `LayoutMap`.
+
+Builds a deep stack of transformer-like blocks under `ModelParallel`, with a
+layout map containing many rules, and reports:
+
+- The time to resolve the layouts of all the variables with the `LayoutMap`,
+  compared to searching every rule for every variable (the behavior before
+  the `LayoutMap` index).
+- The time to build the model under the distribution.
+
+Runs on the JAX backend, with simulated CPU devices:
+
+```
+XLA_FLAGS=--xla_force_host_platform_device_count=8 KERAS_BACKEND=jax \
+    python3 -m benchmarks.model_benchmark.layout_map_benchmark \
+    --num_blocks=500 \
+    --num_rules=200
+```
+"""
+
+import re
+import time
+
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_blocks", 500, "Number of blocks of the model.")
+flags.DEFINE_integer("num_rules", 200, "Number of rules of the layout map.")
+flags.DEFINE_integer("hidden_dim", 16, "Hidden dimension of the blocks.")
+
+
+def get_layout_map(device_mesh):
+    layout_map = keras.distribution.LayoutMap(device_mesh)
+    # Rules for blocks of other models sharing the map, which never match.
+    for i in range(FLAGS.num_rules - 4):
+        layout_map[f"decoder_{i}/.*/kernel"] = (None, "model")
+    layout_map[".*query.*kernel"] = (None, "model")
+    layout_map[".*value.*kernel"] = (None, "model")
+    layout_map["ffw_up.*kernel"] = (None, "model")
+    layout_map["ffw_down.*kernel"] = ("model", None)
+    return layout_map
+
+
+def get_model():
+    hidden_dim = FLAGS.hidden_dim
+    inputs = keras.Input((hidden_dim,))
+    x = inputs
+    for i in range(FLAGS.num_blocks):
+        query = keras.layers.Dense(hidden_dim, name=f"query_{i}")(x)
+        value = keras.layers.Dense(hidden_dim, name=f"value_{i}")(x)
+        x = keras.layers.LayerNormalization(name=f"norm_{i}")(query + value)
+        y = keras.layers.Dense(2 * hidden_dim, name=f"ffw_up_{i}")(x)
+        x = x + keras.layers.Dense(hidden_dim, name=f"ffw_down_{i}")(y)
+    return keras.Model(inputs, x)
+
+
+def search_all_rules(layout_map, path):
+    matching_keys = [k for k in layout_map if re.search(k, path)]
+    return layout_map[matching_keys[0]] if matching_keys else None
+
+
+def main(_):
+    devices = keras.distribution.list_devices()
+    device_mesh = keras.distribution.DeviceMesh(
+        (1, len(devices)), ("batch", "model"), devices
+    )
+    layout_map = get_layout_map(device_mesh)
+    distribution = keras.distribution.ModelParallel(layout_map=layout_map)
+
+    start = time.perf_counter()
+    with distribution.scope():
+        model = get_model()
+    build_time = time.perf_counter() - start
+
+    paths = [v.path for v in model.variables]
+    start = time.perf_counter()
+    for path in paths:
+        search_all_rules(layout_map, path)
+    search_time = time.perf_counter() - start
+
+    # A new map, so that no resolution is memoized.
+    layout_map = get_layout_map(device_mesh)
+    start = time.perf_counter()
+    for path in paths:
+        layout_map[path]
+    index_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for path in paths:
+        layout_map[path]
+    memoized_time = time.perf_counter() - start
+
+    print(
+        f"{len(paths)} variables, {len(layout_map)} rules, "
+        f"{len(devices)} devices:\n"
+        f"  model build time: {build_time:.2f} s\n"
+        f"  layout resolution, searching all rules: {search_time:.3f} s\n"
+        f"  layout resolution, LayoutMap: {index_time:.3f} s\n"
+        f"  layout resolution, LayoutMap (memoized): {memoized_time:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,100 @@
+"""Benchmark optimizer state sharding with `DataParallel`.
+
+Trains an MLP with `Adam` under `DataParallel`, with replicated optimizer
+variables, with sharded optimizer variables (`shard_optimizer_state=True`),
+and with sharded optimizer variables and gradients (`shard_gradients=True`),
+and reports for each:
+
+- The memory taken on one device by the model variables and the optimizer
+  variables.
+- The training throughput, in samples per second.
+
+Runs on the JAX backend, with simulated CPU devices:
+
+```
+XLA_FLAGS=--xla_force_host_platform_device_count=8 KERAS_BACKEND=jax \
+    python3 -m benchmarks.model_benchmark.optimizer_state_sharding_benchmark \
+    --hidden_dim=1024 \
+    --num_layers=4
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("hidden_dim", 1024, "Hidden dimension of the model.")
+flags.DEFINE_integer("num_layers", 4, "Number of hidden layers.")
+flags.DEFINE_integer("batch_size", 256, "Global batch size.")
+flags.DEFINE_integer("num_steps", 20, "Number of timed training steps.")
+
+
+def get_model():
+    inputs = keras.Input((FLAGS.hidden_dim,))
+    x = inputs
+    for _ in range(FLAGS.num_layers):
+        x = keras.layers.Dense(FLAGS.hidden_dim, activation="relu")(x)
+    outputs = keras.layers.Dense(10)(x)
+    return keras.Model(inputs, outputs)
+
+
+def bytes_on_first_device(variables):
+    total = 0
+    for variable in variables:
+        shard = variable.value.addressable_shards[0].data
+        total += shard.size * shard.dtype.itemsize
+    return total
+
+
+def benchmark(shard_optimizer_state, shard_gradients):
+    keras.utils.clear_session()
+    distribution = keras.distribution.DataParallel(
+        shard_optimizer_state=shard_optimizer_state,
+        shard_gradients=shard_gradients,
+    )
+    num_samples = FLAGS.batch_size * FLAGS.num_steps
+    x = np.random.normal(size=(num_samples, FLAGS.hidden_dim))
+    y = np.random.normal(size=(num_samples, 10))
+    with distribution.scope():
+        model = get_model()
+        model.compile(optimizer="adam", loss="mse")
+        # Build the optimizer and compile the train step.
+        model.fit(x[: FLAGS.batch_size], y[: FLAGS.batch_size], verbose=0)
+        start = time.perf_counter()
+        model.fit(x, y, batch_size=FLAGS.batch_size, verbose=0)
+        elapsed = time.perf_counter() - start
+    return (
+        bytes_on_first_device(model.trainable_variables),
+        bytes_on_first_device(model.optimizer.variables),
+        num_samples / elapsed,
+    )
+
+
+def main(_):
+    num_devices = len(keras.distribution.list_devices())
+    print(f"{num_devices} devices, hidden_dim={FLAGS.hidden_dim}:")
+    for name, shard_optimizer_state, shard_gradients in (
+        ("replicated", False, False),
+        ("sharded optimizer state", True, False),
+        ("sharded optimizer state and gradients", True, True),
+    ):
+        model_bytes, optimizer_bytes, throughput = benchmark(
+            shard_optimizer_state, shard_gradients
+        )
+        print(
+            f"  {name}:\n"
+            f"    model variables per device: {model_bytes / 2**20:.1f} MiB\n"
+            "    optimizer variables per device: "
+            f"{optimizer_bytes / 2**20:.1f} MiB\n"
+            f"    throughput: {throughput:.0f} samples/s"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,109 @@
+"""Benchmark pipeline parallelism with `PipelineParallel`.
+
+Trains a deep MLP on one device, and with `PipelineParallel` with the
+`"gpipe"` and `"1f1b"` schedules, and reports for each:
+
+- The memory taken on one device by the model variables and the optimizer
+  variables.
+- The training throughput, in samples per second.
+
+Runs on the JAX backend, with simulated CPU devices:
+
+```
+XLA_FLAGS=--xla_force_host_platform_device_count=4 KERAS_BACKEND=jax \
+    python3 -m benchmarks.model_benchmark.pipeline_parallel_benchmark \
+    --hidden_dim=1024 \
+    --num_layers=8 \
+    --num_microbatches=8
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("hidden_dim", 1024, "Hidden dimension of the model.")
+flags.DEFINE_integer("num_layers", 8, "Number of hidden layers.")
+flags.DEFINE_integer("batch_size", 256, "Global batch size.")
+flags.DEFINE_integer("num_steps", 10, "Number of timed training steps.")
+flags.DEFINE_integer("num_microbatches", 8, "Number of micro-batches.")
+
+
+def get_model():
+    inputs = keras.Input((FLAGS.hidden_dim,))
+    x = inputs
+    for _ in range(FLAGS.num_layers):
+        x = keras.layers.Dense(FLAGS.hidden_dim, activation="relu")(x)
+    outputs = keras.layers.Dense(10)(x)
+    return keras.Model(inputs, outputs)
+
+
+def bytes_on_first_device(variables):
+    total = 0
+    for variable in variables:
+        for shard in variable.value.addressable_shards:
+            if shard.device.id == 0:
+                total += shard.data.size * shard.data.dtype.itemsize
+    return total
+
+
+def benchmark(distribution):
+    keras.utils.clear_session()
+    num_samples = FLAGS.batch_size * FLAGS.num_steps
+    x = np.random.normal(size=(num_samples, FLAGS.hidden_dim))
+    y = np.random.normal(size=(num_samples, 10))
+
+    def run():
+        model = get_model()
+        model.compile(optimizer="adam", loss="mse")
+        # Build the optimizer and compile the train step.
+        model.fit(x[: FLAGS.batch_size], y[: FLAGS.batch_size], verbose=0)
+        start = time.perf_counter()
+        model.fit(x, y, batch_size=FLAGS.batch_size, verbose=0)
+        elapsed = time.perf_counter() - start
+        return (
+            bytes_on_first_device(model.trainable_variables),
+            bytes_on_first_device(model.optimizer.variables),
+            num_samples / elapsed,
+        )
+
+    if distribution is None:
+        return run()
+    with distribution.scope():
+        return run()
+
+
+def main(_):
+    num_devices = len(keras.distribution.list_devices())
+    print(
+        f"{num_devices} stages, {FLAGS.num_layers} layers, "
+        f"hidden_dim={FLAGS.hidden_dim}:"
+    )
+    for name, schedule in (
+        ("single device", None),
+        ("pipeline, gpipe", "gpipe"),
+        ("pipeline, 1f1b", "1f1b"),
+    ):
+        distribution = None
+        if schedule is not None:
+            distribution = keras.distribution.PipelineParallel(
+                num_microbatches=FLAGS.num_microbatches, schedule=schedule
+            )
+        model_bytes, optimizer_bytes, throughput = benchmark(distribution)
+        print(
+            f"  {name}:\n"
+            f"    model variables per device: {model_bytes / 2**20:.1f} MiB\n"
+            "    optimizer variables per device: "
+            f"{optimizer_bytes / 2**20:.1f} MiB\n"
+            f"    throughput: {throughput:.0f} samples/s"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,83 @@
+"""Benchmark int8 post-training quantization of convolutional models.
+
+Quantizes the convolutions (and dense layers) of an image classification
+model with `model.quantize("int8")` and reports the size of the weights and
+the CPU inference latency of the float and quantized models.
+
+Run it once per backend to compare backends:
+
+```
+KERAS_BACKEND=jax python3 -m \
+    benchmarks.model_benchmark.quantized_conv_benchmark \
+    --model=MobileNetV3Small \
+    --batch_size=1 \
+    --num_batches=50
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+MODELS = {
+    "MobileNetV3Small": keras.applications.MobileNetV3Small,
+    "MobileNetV3Large": keras.applications.MobileNetV3Large,
+    "EfficientNetB0": keras.applications.EfficientNetB0,
+}
+
+flags.DEFINE_enum(
+    "model", "MobileNetV3Small", list(MODELS.keys()), "Model to benchmark."
+)
+flags.DEFINE_integer("image_size", 224, "Height and width of the images.")
+flags.DEFINE_integer("batch_size", 1, "Number of images per batch.")
+flags.DEFINE_integer("num_batches", 50, "Number of timed batches.")
+
+
+def get_weights_size(model):
+    return sum(
+        np.prod(v.shape) * np.dtype(v.dtype).itemsize for v in model.weights
+    )
+
+
+def benchmark_model(model, name, x):
+    # The first call compiles the predict function.
+    keras.ops.convert_to_numpy(model.predict_on_batch(x))
+    latencies = []
+    for _ in range(FLAGS.num_batches):
+        start = time.perf_counter()
+        keras.ops.convert_to_numpy(model.predict_on_batch(x))
+        latencies.append(time.perf_counter() - start)
+    print(
+        f"{keras.backend.backend()} {FLAGS.model} {name}: "
+        f"weights size={get_weights_size(model) / 2**20:.2f} MiB, "
+        f"median latency={1000 * np.median(latencies):.2f} ms, "
+        f"p90 latency={1000 * np.percentile(latencies, 90):.2f} ms"
+    )
+    return model.predict_on_batch(x)
+
+
+def main(_):
+    shape = (FLAGS.image_size, FLAGS.image_size, 3)
+    model = MODELS[FLAGS.model](
+        weights=None, input_shape=shape, classifier_activation=None
+    )
+    x = np.random.uniform(0, 255, (FLAGS.batch_size,) + shape)
+    x = x.astype("float32")
+
+    y_float = benchmark_model(model, "float32", x)
+    model.quantize("int8")
+    y_int8 = benchmark_model(model, "int8", x)
+    error = np.max(
+        np.abs(keras.ops.convert_to_numpy(y_float - y_int8)), axis=-1
+    )
+    print(f"mean max absolute error of the logits: {np.mean(error):.2e}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,108 @@
+"""Compare static (calibrated) and dynamic int8 activation quantization.
+
+Dynamic quantization computes the scale of the inputs of each int8 layer with
+an abs-max reduction in every call. Static quantization calibrates the scales
+once with an observer. This reports, for a transformer block, the error of
+the outputs of each quantized model relative to the float model, and the CPU
+inference latency.
+
+Run it once per backend to compare backends:
+
+```
+KERAS_BACKEND=jax python3 -m \
+    benchmarks.model_benchmark.static_quantization_benchmark \
+    --hidden_dim=512 \
+    --sequence_length=128 \
+    --batch_size=8 \
+    --num_batches=20
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("hidden_dim", 512, "Hidden dimension of the block.")
+flags.DEFINE_integer("num_heads", 8, "Number of attention heads.")
+flags.DEFINE_integer("sequence_length", 128, "Number of tokens per sample.")
+flags.DEFINE_integer("batch_size", 8, "Number of samples per batch.")
+flags.DEFINE_integer("num_batches", 20, "Number of timed batches.")
+flags.DEFINE_integer(
+    "num_calibration_batches", 8, "Number of calibration batches."
+)
+
+
+def get_transformer_block():
+    hidden_dim = FLAGS.hidden_dim
+    inputs = keras.Input((FLAGS.sequence_length, hidden_dim))
+    x = keras.layers.LayerNormalization()(inputs)
+    x = keras.layers.MultiHeadAttention(
+        FLAGS.num_heads, hidden_dim // FLAGS.num_heads
+    )(x, x)
+    x = keras.layers.Add()([inputs, x])
+    y = keras.layers.LayerNormalization()(x)
+    y = keras.layers.Dense(4 * hidden_dim, activation="gelu")(y)
+    y = keras.layers.Dense(hidden_dim)(y)
+    outputs = keras.layers.Add()([x, y])
+    return keras.Model(inputs, outputs)
+
+
+def get_data(num_samples, seed):
+    rng = np.random.default_rng(seed)
+    shape = (num_samples, FLAGS.sequence_length, FLAGS.hidden_dim)
+    # Heavy-tailed activations, with a few outlier features.
+    x = rng.standard_t(df=4, size=shape).astype("float32")
+    x[..., :4] *= 10.0
+    return x
+
+
+def benchmark(name, model, x, y_float):
+    batch = x[: FLAGS.batch_size]
+    # The first call compiles the predict function.
+    model.predict_on_batch(batch)
+    latencies = []
+    for _ in range(FLAGS.num_batches):
+        start = time.perf_counter()
+        keras.ops.convert_to_numpy(model.predict_on_batch(batch))
+        latencies.append(time.perf_counter() - start)
+    y = model.predict(x, batch_size=FLAGS.batch_size, verbose=0)
+    error = np.mean(np.square(y - y_float)) / np.mean(np.square(y_float))
+    print(
+        f"{keras.backend.backend()} {name}: "
+        f"relative error={error:.2e}, "
+        f"median latency={1000 * np.median(latencies):.2f} ms, "
+        f"p90 latency={1000 * np.percentile(latencies, 90):.2f} ms"
+    )
+
+
+def main(_):
+    model = get_transformer_block()
+    weights = model.get_weights()
+    x_calibration = get_data(
+        FLAGS.num_calibration_batches * FLAGS.batch_size, seed=0
+    )
+    x = get_data(4 * FLAGS.batch_size, seed=1)
+    y_float = model.predict(x, batch_size=FLAGS.batch_size, verbose=0)
+    benchmark("float32", model, x, y_float)
+
+    model.quantize("int8")
+    benchmark("int8 dynamic", model, x, y_float)
+
+    for observer in ("minmax", "moving_average", "percentile", "mse"):
+        model = get_transformer_block()
+        model.set_weights(weights)
+        config = keras.quantizers.StaticInt8QuantizationConfig(
+            x_calibration, observer=observer, batch_size=FLAGS.batch_size
+        )
+        model.quantize(config=config)
+        benchmark(f"int8 static ({observer})", model, x, y_float)
+
+
+if __name__ == "__main__":
+    app.run(main)
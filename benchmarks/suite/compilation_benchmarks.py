@@ -0,0 +1,82 @@
+"""Benchmarks of the time to the first train step, in fresh Python processes.
+
+The first step compiles the train function, unless its executable is found
+in the persistent compilation cache. The times include the startup of the
+Python interpreter and the import of Keras (see the `import` group).
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import keras
+from benchmarks.suite import harness
+
+_FIRST_STEP = """
+import sys
+
+import numpy as np
+
+import keras
+
+if len(sys.argv) > 1:
+    keras.config.enable_compilation_cache(sys.argv[1])
+model = keras.Sequential(
+    [keras.Input((256,))]
+    + [keras.layers.Dense(256, activation="relu") for _ in range(8)]
+    + [keras.layers.Dense(10)]
+)
+model.compile(optimizer="adam", loss="mse", jit_compile=True)
+model.train_on_batch(np.ones((64, 256)), np.ones((64, 10)))
+"""
+
+# The temporary directories, removed when the process exits.
+_TEMP_DIRS = []
+
+
+def _check_compiling_backend():
+    if keras.config.backend() in ("numpy", "openvino"):
+        raise harness.SkipBenchmark(
+            f"the {keras.config.backend()} backend doesn't compile functions"
+        )
+
+
+def _first_step(*args):
+    env = dict(os.environ, KERAS_BACKEND=keras.config.backend())
+    subprocess.run(
+        [sys.executable, "-c", _FIRST_STEP, *args], env=env, check=True
+    )
+
+
+def _get_temp_dir():
+    temp_dir = tempfile.TemporaryDirectory()
+    _TEMP_DIRS.append(temp_dir)
+    return temp_dir.name
+
+
+@harness.register("compilation", warmup=1, min_runs=3, max_runs=10)
+def first_train_step_no_cache():
+    _check_compiling_backend()
+    return _first_step
+
+
+@harness.register("compilation", warmup=1, min_runs=3, max_runs=10)
+def first_train_step_cold_cache():
+    _check_compiling_backend()
+    cache_dir = _get_temp_dir()
+
+    def first_step():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        _first_step(cache_dir)
+
+    return first_step
+
+
+@harness.register("compilation", warmup=1, min_runs=3, max_runs=10)
+def first_train_step_warm_cache():
+    _check_compiling_backend()
+    cache_dir = _get_temp_dir()
+    # The warmup run populates the cache.
+    return lambda: _first_step(cache_dir)
@@ -0,0 +1,115 @@
+"""Benchmarks of an epoch of iteration over the data adapters.
+
+The batches are produced in the format the trainer of the active backend
+consumes, e.g. a `tf.data.Dataset` with TensorFlow.
+"""
+
+import numpy as np
+
+import keras
+from benchmarks.suite import harness
+from keras.src.trainers import data_adapters
+
+NUM_SAMPLES = 4096
+BATCH_SIZE = 64
+
+
+def _get_arrays():
+    x = np.random.normal(size=(NUM_SAMPLES, 32)).astype("float32")
+    y = np.random.randint(0, 10, size=(NUM_SAMPLES,))
+    return x, y
+
+
+def _iterate(adapter):
+    backend = keras.config.backend()
+    if backend == "jax":
+        iterator = adapter.get_jax_iterator()
+    elif backend == "tensorflow":
+        iterator = adapter.get_tf_dataset()
+    elif backend == "torch":
+        iterator = adapter.get_torch_dataloader()
+    else:
+        iterator = adapter.get_numpy_iterator()
+    num_batches = 0
+    for _ in iterator:
+        num_batches += 1
+    return num_batches
+
+
+class _PyDataset(keras.utils.PyDataset):
+    def __init__(self, x, y, **kwargs):
+        super().__init__(**kwargs)
+        self.x = x
+        self.y = y
+
+    def __len__(self):
+        return len(self.x) // BATCH_SIZE
+
+    def __getitem__(self, index):
+        batch = slice(index * BATCH_SIZE, (index + 1) * BATCH_SIZE)
+        return self.x[batch], self.y[batch]
+
+
+@harness.register("data")
+def numpy_arrays():
+    x, y = _get_arrays()
+    adapter = data_adapters.get_data_adapter(x, y, batch_size=BATCH_SIZE)
+    return lambda: _iterate(adapter)
+
+
+@harness.register("data")
+def numpy_arrays_shuffled():
+    x, y = _get_arrays()
+    adapter = data_adapters.get_data_adapter(
+        x, y, batch_size=BATCH_SIZE, shuffle=True
+    )
+    return lambda: _iterate(adapter)
+
+
+@harness.register("data")
+def py_dataset():
+    x, y = _get_arrays()
+    adapter = data_adapters.get_data_adapter(_PyDataset(x, y))
+    return lambda: _iterate(adapter)
+
+
+@harness.register("data")
+def generator():
+    x, y = _get_arrays()
+
+    def make_adapter():
+        def batches():
+            for i in range(0, NUM_SAMPLES, BATCH_SIZE):
+                yield x[i : i + BATCH_SIZE], y[i : i + BATCH_SIZE]
+
+        return data_adapters.get_data_adapter(batches())
+
+    # A generator can only be iterated once.
+    return lambda: _iterate(make_adapter())
+
+
+@harness.register("data")
+def tf_dataset():
+    try:
+        import tensorflow as tf
+    except ImportError:
+        raise harness.SkipBenchmark("TensorFlow isn't installed")
+    x, y = _get_arrays()
+    dataset = tf.data.Dataset.from_tensor_slices((x, y)).batch(BATCH_SIZE)
+    adapter = data_adapters.get_data_adapter(dataset)
+    return lambda: _iterate(adapter)
+
+
+@harness.register("data")
+def torch_dataloader():
+    try:
+        import torch
+    except ImportError:
+        raise harness.SkipBenchmark("PyTorch isn't installed")
+    x, y = _get_arrays()
+    dataset = torch.utils.data.TensorDataset(
+        torch.from_numpy(x), torch.from_numpy(y)
+    )
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=BATCH_SIZE)
+    adapter = data_adapters.get_data_adapter(dataloader)
+    return lambda: _iterate(adapter)
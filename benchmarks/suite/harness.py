@@ -0,0 +1,286 @@
+"""Registry, timing and baseline comparison of the benchmark suite."""
+
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# The registered benchmarks, by name.
+BENCHMARKS = {}
+
+
+class Benchmark:
+    """A benchmark of the suite.
+
+    Args:
+        name: The name of the benchmark, `"{group}/{function name}"`.
+        group: The group of the benchmark, e.g. `"layers"`.
+        setup: A function preparing the benchmark, e.g. creating a model,
+            and returning the function to time. It may raise
+            `SkipBenchmark` when the benchmark can't run, e.g. when an
+            optional dependency isn't installed.
+        warmup: Number of untimed runs, e.g. for tracing and compilation.
+        min_runs: Minimum number of timed runs.
+        max_runs: Maximum number of timed runs.
+    """
+
+    def __init__(self, name, group, setup, warmup, min_runs, max_runs):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.warmup = warmup
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+
+
+class SkipBenchmark(Exception):
+    """Raised by the setup of a benchmark that can't run."""
+
+
+def register(group, warmup=2, min_runs=5, max_runs=1000):
+    """Registers a benchmark setup function in `group`.
+
+    The decorated function prepares the benchmark and returns the function
+    to time. The outputs of the timed function are converted to NumPy, so
+    that the time includes the asynchronous computations of the backend.
+
+    ```python
+    @harness.register("layers")
+    def dense():
+        layer = keras.layers.Dense(64)
+        x = np.ones((32, 64), dtype="float32")
+        return lambda: layer(x)
+    ```
+    """
+
+    def decorator(setup):
+        name = f"{group}/{setup.__name__}"
+        if name in BENCHMARKS:
+            raise ValueError(f"The benchmark {name} is already registered.")
+        BENCHMARKS[name] = Benchmark(
+            name, group, setup, warmup, min_runs, max_runs
+        )
+        return setup
+
+    return decorator
+
+
+def get_benchmarks(groups=None, pattern=None):
+    """Returns the registered benchmarks in `groups` matching `pattern`."""
+    benchmarks = []
+    for benchmark in BENCHMARKS.values():
+        if groups and benchmark.group not in groups:
+            continue
+        if pattern and not re.search(pattern, benchmark.name):
+            continue
+        benchmarks.append(benchmark)
+    return benchmarks
+
+
+def synchronize(outputs):
+    """Waits for `outputs` by converting them to NumPy."""
+    from keras import ops
+    from keras import tree
+
+    return tree.map_structure(
+        lambda x: ops.convert_to_numpy(x) if ops.is_tensor(x) else x, outputs
+    )
+
+
+def time_function(fn, warmup=2, min_runs=5, max_runs=1000, min_time=1.0):
+    """Times the runs of `fn`.
+
+    After `warmup` untimed runs, `fn` is run at least `min_runs` times and
+    until `min_time` seconds have elapsed, up to `max_runs` times.
+
+    Returns:
+        A dict with the `"num_runs"` and the `"median"`, `"p99"` (99th
+        percentile), `"mean"`, `"min"`, `"max"` and `"stdev"` of the time of a
+        run, in seconds.
+    """
+    for _ in range(warmup):
+        synchronize(fn())
+    times = []
+    start = time.perf_counter()
+    while len(times) < max_runs and (
+        len(times) < min_runs or time.perf_counter() - start < min_time
+    ):
+        run_start = time.perf_counter()
+        synchronize(fn())
+        times.append(time.perf_counter() - run_start)
+    times = np.asarray(times)
+    return {
+        "num_runs": len(times),
+        "median": float(np.median(times)),
+        "p99": float(np.percentile(times, 99)),
+        "mean": float(np.mean(times)),
+        "min": float(np.min(times)),
+        "max": float(np.max(times)),
+        "stdev": float(np.std(times)),
+    }
+
+
+def run_benchmarks(benchmarks, min_time=1.0, print_fn=print):
+    """Runs `benchmarks` and returns their results by name.
+
+    The result of a benchmark is the dict returned by `time_function()`
+    with its `"group"`, or `{"group": ..., "skipped": reason}` if it was
+    skipped.
+    """
+    results = {}
+    for benchmark in benchmarks:
+        try:
+            fn = benchmark.setup()
+        except SkipBenchmark as e:
+            results[benchmark.name] = {
+                "group": benchmark.group,
+                "skipped": str(e),
+            }
+            print_fn(f"{benchmark.name}: skipped ({e})")
+            continue
+        result = time_function(
+            fn,
+            warmup=benchmark.warmup,
+            min_runs=benchmark.min_runs,
+            max_runs=benchmark.max_runs,
+            min_time=min_time,
+        )
+        results[benchmark.name] = {"group": benchmark.group, **result}
+        print_fn(
+            f"{benchmark.name}: {format_time(result['median'])} "
+            f"(median of {result['num_runs']} runs, "
+            f"p99 {format_time(result['p99'])}, "
+            f"stdev {format_time(result['stdev'])})"
+        )
+    return results
+
+
+def get_environment():
+    """Returns the metadata of the environment the benchmarks run in."""
+    import keras
+
+    backend = keras.config.backend()
+    try:
+        # The backends are named after their framework's module.
+        backend_version = __import__(backend).__version__
+    except (ImportError, AttributeError):
+        backend_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "keras_version": keras.version(),
+        "git_commit": commit,
+        "backend": backend,
+        "backend_version": backend_version,
+        "numpy_version": np.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "argv": sys.argv,
+    }
+
+
+def save_results(filepath, environment, results):
+    with open(filepath, "w") as f:
+        json.dump(
+            {"environment": environment, "benchmarks": results}, f, indent=2
+        )
+
+
+def load_results(filepath):
+    with open(filepath) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.1):
+    """Compares the median times of `results` with a baseline.
+
+    Args:
+        results: The results returned by `run_benchmarks()`.
+        baseline: The results of the baseline, as loaded by
+            `load_results()`.
+        threshold: The relative slowdown of the median time above which a
+            benchmark is flagged as a regression, e.g. `0.1` for 10%. The
+            speedups above it are flagged as improvements.
+
+    Returns:
+        A list of dicts with the `"name"`, the `"baseline"` and `"current"`
+        median times, their `"ratio"`, and the `"status"`: `"regression"`,
+        `"improvement"`, `"unchanged"`, `"new"` (not in the baseline) or
+        `"skipped"`.
+    """
+    baseline = baseline["benchmarks"]
+    rows = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        row = {
+            "name": name,
+            "baseline": None,
+            "current": result.get("median"),
+            "ratio": None,
+        }
+        if "skipped" in result:
+            row["status"] = "skipped"
+        elif reference is None or "median" not in reference:
+            row["status"] = "new"
+        else:
+            row["baseline"] = reference["median"]
+            row["ratio"] = result["median"] / reference["median"]
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "regression"
+            elif row["ratio"] < 1 / (1 + threshold):
+                row["status"] = "improvement"
+            else:
+                row["status"] = "unchanged"
+        rows.append(row)
+    return rows
+
+
+def get_environment_mismatches(environment, baseline):
+    """Returns the environment fields differing from the baseline's.
+
+    The comparison of times is only meaningful on the same machine, backend
+    and dependencies.
+    """
+    fields = [
+        "backend",
+        "backend_version",
+        "numpy_version",
+        "python_version",
+        "machine",
+        "processor",
+        "cpu_count",
+    ]
+    reference = baseline["environment"]
+    return [
+        f"{field}: {reference.get(field)} -> {environment.get(field)}"
+        for field in fields
+        if reference.get(field) != environment.get(field)
+    ]
+
+
+def format_time(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
@@ -0,0 +1,32 @@
+"""Benchmarks of the startup time of Keras, in fresh Python processes.
+
+The times include the startup of the Python interpreter.
+"""
+
+import os
+import subprocess
+import sys
+
+import keras
+from benchmarks.suite import harness
+
+
+def _run_python(code):
+    env = dict(os.environ, KERAS_BACKEND=keras.config.backend())
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+@harness.register("import", warmup=1, min_runs=3, max_runs=10)
+def python_startup():
+    # The reference for the other benchmarks of the group.
+    return lambda: _run_python("pass")
+
+
+@harness.register("import", warmup=1, min_runs=3, max_runs=10)
+def import_keras():
+    return lambda: _run_python("import keras")
+
+
+@harness.register("import", warmup=1, min_runs=3, max_runs=10)
+def import_keras_layers():
+    return lambda: _run_python("import keras; keras.layers.Dense")
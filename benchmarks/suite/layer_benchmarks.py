@@ -0,0 +1,80 @@
+"""Benchmarks of the eager forward pass of common layers."""
+
+import numpy as np
+
+import keras
+from benchmarks.suite import harness
+
+
+def _forward(layer, *inputs):
+    layer(*inputs)
+    return lambda: layer(*inputs)
+
+
+@harness.register("layers")
+def dense():
+    x = np.random.normal(size=(64, 256)).astype("float32")
+    return _forward(keras.layers.Dense(256, activation="relu"), x)
+
+
+@harness.register("layers")
+def einsum_dense():
+    x = np.random.normal(size=(16, 32, 128)).astype("float32")
+    layer = keras.layers.EinsumDense("abc,cd->abd", output_shape=(None, 128))
+    return _forward(layer, x)
+
+
+@harness.register("layers")
+def conv2d():
+    x = np.random.normal(size=(16, 32, 32, 16)).astype("float32")
+    return _forward(keras.layers.Conv2D(32, 3, padding="same"), x)
+
+
+@harness.register("layers")
+def depthwise_conv2d():
+    x = np.random.normal(size=(16, 32, 32, 16)).astype("float32")
+    return _forward(keras.layers.DepthwiseConv2D(3, padding="same"), x)
+
+
+@harness.register("layers")
+def max_pooling2d():
+    x = np.random.normal(size=(16, 32, 32, 16)).astype("float32")
+    return _forward(keras.layers.MaxPooling2D(), x)
+
+
+@harness.register("layers")
+def batch_normalization():
+    x = np.random.normal(size=(64, 256)).astype("float32")
+    return _forward(keras.layers.BatchNormalization(), x)
+
+
+@harness.register("layers")
+def layer_normalization():
+    x = np.random.normal(size=(64, 256)).astype("float32")
+    return _forward(keras.layers.LayerNormalization(), x)
+
+
+@harness.register("layers")
+def embedding():
+    x = np.random.randint(0, 1000, size=(64, 32))
+    return _forward(keras.layers.Embedding(1000, 64), x)
+
+
+@harness.register("layers")
+def lstm():
+    x = np.random.normal(size=(16, 20, 32)).astype("float32")
+    return _forward(keras.layers.LSTM(32), x)
+
+
+@harness.register("layers")
+def multi_head_attention():
+    x = np.random.normal(size=(8, 32, 64)).astype("float32")
+    layer = keras.layers.MultiHeadAttention(num_heads=4, key_dim=16)
+    return _forward(layer, x, x)
+
+
+@harness.register("layers")
+def call_overhead():
+    # On a tiny input, the time is the overhead of `Layer.__call__`.
+    x = np.ones((1, 4), dtype="float32")
+    return _forward(keras.layers.ReLU(), x)
@@ -0,0 +1,63 @@
+"""Benchmarks of eager `keras.ops` calls."""
+
+import numpy as np
+
+from benchmarks.suite import harness
+from keras import ops
+
+
+def _tensor(*shape):
+    return ops.convert_to_tensor(np.random.normal(size=shape).astype("float32"))
+
+
+@harness.register("ops")
+def matmul():
+    x = _tensor(256, 256)
+    y = _tensor(256, 256)
+    return lambda: ops.matmul(x, y)
+
+
+@harness.register("ops")
+def einsum():
+    x = _tensor(8, 64, 32)
+    y = _tensor(8, 32, 64)
+    return lambda: ops.einsum("bij,bjk->bik", x, y)
+
+
+@harness.register("ops")
+def conv():
+    x = _tensor(8, 32, 32, 16)
+    kernel = _tensor(3, 3, 16, 32)
+    return lambda: ops.conv(x, kernel, padding="same")
+
+
+@harness.register("ops")
+def softmax():
+    x = _tensor(64, 1024)
+    return lambda: ops.softmax(x)
+
+
+@harness.register("ops")
+def elementwise():
+    x = _tensor(256, 256)
+    y = _tensor(256, 256)
+    return lambda: ops.tanh(ops.add(ops.multiply(x, y), x))
+
+
+@harness.register("ops")
+def reduction():
+    x = _tensor(256, 1024)
+    return lambda: ops.mean(x, axis=-1)
+
+
+@harness.register("ops")
+def top_k():
+    x = _tensor(64, 1024)
+    return lambda: ops.top_k(x, k=8)
+
+
+@harness.register("ops")
+def dispatch_overhead():
+    # On a scalar, the time is the overhead of dispatching an op.
+    x = ops.convert_to_tensor(1.0)
+    return lambda: ops.add(x, x)
@@ -0,0 +1,136 @@
+"""Run the benchmark suite and compare the results with a baseline.
+
+The suite runs on the backend set by `KERAS_BACKEND`, on CPU by default. It
+writes the median time of each benchmark with the metadata of the
+environment to a JSON file, which can be used as the baseline of a later
+run. With a baseline, the benchmarks slower by more than `--threshold` are
+reported as regressions, and the process exits with status 1.
+
+```
+KERAS_BACKEND=jax python3 -m benchmarks.suite.run \
+    --output=/tmp/baseline.json
+# ... change the code ...
+KERAS_BACKEND=jax python3 -m benchmarks.suite.run \
+    --output=/tmp/results.json \
+    --baseline=/tmp/baseline.json \
+    --threshold=0.1
+```
+"""
+
+import os
+import sys
+
+from absl import app
+from absl import flags
+
+FLAGS = flags.FLAGS
+
+GROUPS = [
+    "layers",
+    "ops",
+    "tree",
+    "training",
+    "data",
+    "saving",
+    "import",
+    "compilation",
+]
+
+flags.DEFINE_list("groups", GROUPS, "Groups of benchmarks to run.")
+flags.DEFINE_string(
+    "filter", None, "Regex selecting the benchmarks to run by name."
+)
+flags.DEFINE_string("output", None, "Path of the JSON file of the results.")
+flags.DEFINE_string(
+    "baseline", None, "Path of the JSON results to compare with."
+)
+flags.DEFINE_float(
+    "threshold",
+    0.1,
+    "Relative slowdown of the median time flagged as a regression.",
+)
+flags.DEFINE_float(
+    "min_time",
+    1.0,
+    "Minimum time in seconds of the timed runs of each benchmark.",
+)
+flags.DEFINE_bool(
+    "cpu", True, "Whether to hide the accelerators and run on CPU."
+)
+flags.DEFINE_bool("list", False, "Whether to only list the benchmarks.")
+
+
+def main(_):
+    if FLAGS.cpu:
+        # This must be set before the backend is imported.
+        os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
+        os.environ["JAX_PLATFORMS"] = "cpu"
+    unknown_groups = set(FLAGS.groups) - set(GROUPS)
+    if unknown_groups:
+        raise ValueError(
+            f"Unknown groups: {sorted(unknown_groups)}. "
+            f"Expected groups in {GROUPS}."
+        )
+
+    # Importing the modules registers their benchmarks.
+    from benchmarks.suite import compilation_benchmarks  # noqa: F401
+    from benchmarks.suite import data_benchmarks  # noqa: F401
+    from benchmarks.suite import harness
+    from benchmarks.suite import import_benchmarks  # noqa: F401
+    from benchmarks.suite import layer_benchmarks  # noqa: F401
+    from benchmarks.suite import op_benchmarks  # noqa: F401
+    from benchmarks.suite import saving_benchmarks  # noqa: F401
+    from benchmarks.suite import training_benchmarks  # noqa: F401
+    from benchmarks.suite import tree_benchmarks  # noqa: F401
+
+    benchmarks = harness.get_benchmarks(FLAGS.groups, FLAGS.filter)
+    if FLAGS.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return
+
+    environment = harness.get_environment()
+    print(
+        f"Running {len(benchmarks)} benchmarks with the "
+        f"{environment['backend']} backend."
+    )
+    results = harness.run_benchmarks(benchmarks, min_time=FLAGS.min_time)
+    if FLAGS.output:
+        harness.save_results(FLAGS.output, environment, results)
+        print(f"Results written to {FLAGS.output}")
+    if not FLAGS.baseline:
+        return
+
+    baseline = harness.load_results(FLAGS.baseline)
+    mismatches = harness.get_environment_mismatches(environment, baseline)
+    if mismatches:
+        print(
+            "Warning: the environment differs from the baseline's, the "
+            "times may not be comparable:\n  " + "\n  ".join(mismatches)
+        )
+    rows = harness.compare(results, baseline, FLAGS.threshold)
+    name_width = max(len(row["name"]) for row in rows)
+    print(
+        f"\n{'Benchmark':<{name_width}}  {'Baseline':>10}  "
+        f"{'Current':>10}  {'Change':>8}  Status"
+    )
+    for row in rows:
+        change = f"{(row['ratio'] - 1) * 100:+.1f}%" if row["ratio"] else "-"
+        print(
+            f"{row['name']:<{name_width}}  "
+            f"{harness.format_time(row['baseline']):>10}  "
+            f"{harness.format_time(row['current']):>10}  "
+            f"{change:>8}  {row['status']}"
+        )
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(
+            f"\nRegressions above {FLAGS.threshold * 100:.0f}%: "
+            f"{', '.join(row['name'] for row in regressions)}"
+        )
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,75 @@
+"""Benchmarks of saving and loading models and weights."""
+
+import os
+import tempfile
+
+import numpy as np
+
+import keras
+from benchmarks.suite import harness
+
+# The temporary directories, removed when the process exits.
+_TEMP_DIRS = []
+
+
+def _get_model():
+    model = keras.Sequential(
+        [keras.Input((256,))]
+        + [keras.layers.Dense(256, activation="relu") for _ in range(8)]
+        + [keras.layers.Dense(10)]
+    )
+    model.compile(optimizer="adam", loss="mse")
+    # Save the optimizer variables too, as after training.
+    model.optimizer.build(model.trainable_variables)
+    return model
+
+
+def _get_temp_path(filename):
+    temp_dir = tempfile.TemporaryDirectory()
+    _TEMP_DIRS.append(temp_dir)
+    return os.path.join(temp_dir.name, filename)
+
+
+@harness.register("saving")
+def save_model():
+    model = _get_model()
+    filepath = _get_temp_path("model.keras")
+    return lambda: model.save(filepath)
+
+
+@harness.register("saving")
+def load_model():
+    model = _get_model()
+    filepath = _get_temp_path("model.keras")
+    model.save(filepath)
+    return lambda: keras.saving.load_model(filepath)
+
+
+@harness.register("saving")
+def save_weights():
+    model = _get_model()
+    filepath = _get_temp_path("model.weights.h5")
+    return lambda: model.save_weights(filepath)
+
+
+@harness.register("saving")
+def load_weights():
+    model = _get_model()
+    filepath = _get_temp_path("model.weights.h5")
+    model.save_weights(filepath)
+    return lambda: model.load_weights(filepath)
+
+
+@harness.register("saving")
+def serialize_model():
+    model = _get_model()
+    return lambda: keras.saving.deserialize_keras_object(
+        keras.saving.serialize_keras_object(model)
+    )
+
+
+@harness.register("saving")
+def set_weights():
+    model = _get_model()
+    weights = model.get_weights()
+    return lambda: model.set_weights([np.copy(w) for w in weights])
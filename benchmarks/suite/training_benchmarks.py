@@ -0,0 +1,201 @@
+"""Benchmarks of the `fit()`, `evaluate()` and `predict()` loops.
+
+The first (warmup) run compiles the step functions, so the timed runs
+measure the steady-state loops.
+"""
+
+import numpy as np
+
+import keras
+from benchmarks.suite import harness
+
+NUM_SAMPLES = 2048
+BATCH_SIZE = 64
+
+
+def _check_trainable_backend():
+    if keras.config.backend() in ("numpy", "openvino"):
+        raise harness.SkipBenchmark(
+            f"the {keras.config.backend()} backend doesn't support training"
+        )
+
+
+def _mlp():
+    model = keras.Sequential(
+        [
+            keras.Input((64,)),
+            keras.layers.Dense(256, activation="relu"),
+            keras.layers.Dense(256, activation="relu"),
+            keras.layers.Dense(10, activation="softmax"),
+        ]
+    )
+    model.compile(
+        optimizer="adam",
+        loss="sparse_categorical_crossentropy",
+        metrics=["accuracy"],
+    )
+    x = np.random.normal(size=(NUM_SAMPLES, 64)).astype("float32")
+    y = np.random.randint(0, 10, size=(NUM_SAMPLES,))
+    return model, x, y
+
+
+def _cnn():
+    model = keras.Sequential(
+        [
+            keras.Input((28, 28, 1)),
+            keras.layers.Conv2D(16, 3, activation="relu"),
+            keras.layers.MaxPooling2D(),
+            keras.layers.Conv2D(32, 3, activation="relu"),
+            keras.layers.GlobalAveragePooling2D(),
+            keras.layers.Dense(10, activation="softmax"),
+        ]
+    )
+    model.compile(
+        optimizer="adam",
+        loss="sparse_categorical_crossentropy",
+        metrics=["accuracy"],
+    )
+    x = np.random.normal(size=(NUM_SAMPLES // 4, 28, 28, 1)).astype("float32")
+    y = np.random.randint(0, 10, size=(NUM_SAMPLES // 4,))
+    return model, x, y
+
+
+def _multi_output(num_heads=32):
+    # The step overhead of the compiled losses and metrics grows with the
+    # number of outputs.
+    inputs = keras.Input((64,))
+    features = keras.layers.Dense(64, activation="relu")(inputs)
+    outputs = {
+        f"head_{i}": keras.layers.Dense(1, name=f"head_{i}")(features)
+        for i in range(num_heads)
+    }
+    model = keras.Model(inputs, outputs)
+    model.compile(
+        optimizer="adam",
+        loss="mse",
+        metrics={name: ["mae"] for name in outputs},
+    )
+    x = np.random.normal(size=(BATCH_SIZE, 64)).astype("float32")
+    y = {
+        name: np.random.normal(size=(BATCH_SIZE, 1)).astype("float32")
+        for name in outputs
+    }
+    return model, x, y
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def fit_mlp():
+    _check_trainable_backend()
+    model, x, y = _mlp()
+    return lambda: model.fit(x, y, batch_size=BATCH_SIZE, verbose=0)
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def evaluate_mlp():
+    model, x, y = _mlp()
+    return lambda: model.evaluate(x, y, batch_size=BATCH_SIZE, verbose=0)
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def predict_mlp():
+    model, x, _ = _mlp()
+    return lambda: model.predict(x, batch_size=BATCH_SIZE, verbose=0)
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def fit_cnn():
+    _check_trainable_backend()
+    model, x, y = _cnn()
+    return lambda: model.fit(x, y, batch_size=BATCH_SIZE, verbose=0)
+
+
+@harness.register("training")
+def train_on_batch_mlp():
+    _check_trainable_backend()
+    model, x, y = _mlp()
+    x, y = x[:BATCH_SIZE], y[:BATCH_SIZE]
+    return lambda: model.train_on_batch(x, y)
+
+
+@harness.register("training")
+def predict_on_batch_mlp():
+    model, x, _ = _mlp()
+    x = x[:BATCH_SIZE]
+    return lambda: model.predict_on_batch(x)
+
+
+@harness.register("training")
+def train_on_batch_multi_output():
+    _check_trainable_backend()
+    model, x, y = _multi_output()
+    return lambda: model.train_on_batch(x, y)
+
+
+@harness.register("training")
+def compute_loss_multi_output():
+    # The eager loss computation of a 32-head model, outside of the step
+    # function.
+    model, x, y = _multi_output()
+    y = {name: keras.ops.convert_to_tensor(v) for name, v in y.items()}
+    y_pred = model(x)
+    return lambda: model.compute_loss(x, y, y_pred)
+
+
+@harness.register("training")
+def compute_metrics_multi_output():
+    model, x, y = _multi_output()
+    y = {name: keras.ops.convert_to_tensor(v) for name, v in y.items()}
+    y_pred = model(x)
+    return lambda: model.compute_metrics(x, y, y_pred)
+
+
+def _online_request():
+    # A single request to a small model, as in online serving.
+    model, x, _ = _mlp()
+    x = x[:1]
+    model.predict_on_batch(x)
+    return model, x
+
+
+@harness.register("training")
+def predict_online():
+    model, x = _online_request()
+    return lambda: model.predict(x, verbose=0)
+
+
+@harness.register("training")
+def predict_on_batch_online():
+    model, x = _online_request()
+    return lambda: model.predict_on_batch(x)
+
+
+@harness.register("training")
+def predict_on_tensors_online():
+    model, x = _online_request()
+    x = keras.ops.convert_to_tensor(x)
+    return lambda: model.predict_on_tensors(x)
+
+
+def _variable_batch_sizes(shape_buckets=None):
+    # Requests of 16 distinct batch sizes to a freshly compiled predict
+    # function, so that the time includes a compilation per padded shape.
+    model, x, _ = _mlp()
+    model.compile(shape_buckets=shape_buckets)
+    batches = [x[:batch_size] for batch_size in range(1, 33, 2)]
+
+    def predict():
+        model.make_predict_function(force=True)
+        for batch in batches:
+            model.predict_on_batch(batch)
+
+    return predict
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def predict_on_batch_variable_batch_sizes():
+    return _variable_batch_sizes()
+
+
+@harness.register("training", warmup=1, min_runs=3)
+def predict_on_batch_variable_batch_sizes_bucketed():
+    return _variable_batch_sizes(keras.utils.ShapeBuckets())
@@ -0,0 +1,77 @@
+"""Benchmarks of the `keras.tree` utilities on nested batch structures.
+
+The trainers and layers flatten and pack the same structures at every step,
+so these benchmarks measure the overhead of the tree implementation. A run
+makes `NUM_CALLS` calls: divide the times by `NUM_CALLS` for the per-call
+overhead.
+"""
+
+import numpy as np
+
+from benchmarks.suite import harness
+from keras.src import tree
+
+NUM_CALLS = 100
+
+
+def _batch():
+    # A typical `(x, y, sample_weight)` batch of a multi-input model.
+    x = {
+        "image": np.ones((8, 32, 32, 3), dtype="float32"),
+        "text": np.ones((8, 16), dtype="int32"),
+        "mask": np.ones((8, 16), dtype="bool"),
+    }
+    y = [np.ones((8, 10), dtype="float32"), np.ones((8, 1), dtype="float32")]
+    return x, y, None
+
+
+def _repeat(fn):
+    def run():
+        for _ in range(NUM_CALLS):
+            fn()
+
+    return run
+
+
+@harness.register("tree")
+def flatten():
+    batch = _batch()
+    return _repeat(lambda: tree.flatten(batch))
+
+
+@harness.register("tree")
+def flatten_with_cached_def():
+    batch = _batch()
+    return _repeat(lambda: tree.flatten_with_cached_def(batch))
+
+
+@harness.register("tree")
+def pack_sequence_as():
+    batch = _batch()
+    leaves = tree.flatten(batch)
+    return _repeat(lambda: tree.pack_sequence_as(batch, leaves))
+
+
+@harness.register("tree")
+def unflatten():
+    batch = _batch()
+    leaves, treedef = tree.flatten_with_cached_def(batch)
+    return _repeat(lambda: tree.unflatten(treedef, leaves))
+
+
+@harness.register("tree")
+def map_structure():
+    batch = _batch()
+    return _repeat(lambda: tree.map_structure(np.asarray, batch))
+
+
+@harness.register("tree")
+def map_with_cached_def():
+    # The equivalent of `map_structure` with a kept definition.
+    batch = _batch()
+    _, treedef = tree.flatten_with_cached_def(batch)
+    return _repeat(
+        lambda: tree.unflatten(
+            treedef, [np.asarray(x) for x in tree.flatten(batch)]
+        )
+    )
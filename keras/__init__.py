@@ -6,8 +6,17 @@ import os  # isort: skip
 # Add everything in /api/ to the module search path.
 __path__.append(os.path.join(os.path.dirname(__file__), "api"))  # noqa: F405
 
-from keras.api import *  # noqa: F403, E402
-from keras.api import __version__  # noqa: E402
+# The public API is loaded lazily, on first access.
+from keras.api import __all__  # noqa: E402
+from keras.api import __dir__  # noqa: E402
+from keras.api import __getattr__ as _api_getattr  # noqa: E402
+
+
+def __getattr__(name):
+    value = _api_getattr(name)
+    globals()[name] = value
+    return value
+
 
 # Don't pollute namespace.
 del os
@@ -4,64 +4,154 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras import _tf_keras as _tf_keras
-from keras import activations as activations
-from keras import applications as applications
-from keras import backend as backend
-from keras import callbacks as callbacks
-from keras import config as config
-from keras import constraints as constraints
-from keras import datasets as datasets
-from keras import distillation as distillation
-from keras import distribution as distribution
-from keras import dtype_policies as dtype_policies
-from keras import export as export
-from keras import initializers as initializers
-from keras import layers as layers
-from keras import legacy as legacy
-from keras import losses as losses
-from keras import metrics as metrics
-from keras import mixed_precision as mixed_precision
-from keras import models as models
-from keras import ops as ops
-from keras import optimizers as optimizers
-from keras import preprocessing as preprocessing
-from keras import quantizers as quantizers
-from keras import random as random
-from keras import regularizers as regularizers
-from keras import saving as saving
-from keras import tree as tree
-from keras import utils as utils
-from keras import visualization as visualization
-from keras import wrappers as wrappers
-from keras.src.backend import Variable as Variable
-from keras.src.backend import device as device
-from keras.src.backend import name_scope as name_scope
-from keras.src.backend.common.keras_tensor import KerasTensor as KerasTensor
-from keras.src.backend.common.remat import RematScope as RematScope
-from keras.src.backend.common.remat import remat as remat
-from keras.src.backend.common.stateless_scope import (
-    StatelessScope as StatelessScope,
-)
-from keras.src.backend.common.symbolic_scope import (
-    SymbolicScope as SymbolicScope,
-)
-from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
-from keras.src.dtype_policies.dtype_policy import (
-    FloatDTypePolicy as FloatDTypePolicy,
-)
-from keras.src.initializers.initializer import Initializer as Initializer
-from keras.src.layers.core.input_layer import Input as Input
-from keras.src.layers.input_spec import InputSpec as InputSpec
-from keras.src.layers.layer import Layer as Layer
-from keras.src.losses.loss import Loss as Loss
-from keras.src.metrics.metric import Metric as Metric
-from keras.src.models.model import Model as Model
-from keras.src.models.sequential import Sequential as Sequential
-from keras.src.ops.function import Function as Function
-from keras.src.ops.operation import Operation as Operation
-from keras.src.optimizers.optimizer import Optimizer as Optimizer
-from keras.src.quantizers.quantizers import Quantizer as Quantizer
-from keras.src.regularizers.regularizers import Regularizer as Regularizer
-from keras.src.version import __version__ as __version__
-from keras.src.version import version as version
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras import _tf_keras as _tf_keras
+    from keras import activations as activations
+    from keras import applications as applications
+    from keras import backend as backend
+    from keras import callbacks as callbacks
+    from keras import config as config
+    from keras import constraints as constraints
+    from keras import datasets as datasets
+    from keras import distillation as distillation
+    from keras import distribution as distribution
+    from keras import dtype_policies as dtype_policies
+    from keras import export as export
+    from keras import initializers as initializers
+    from keras import layers as layers
+    from keras import legacy as legacy
+    from keras import losses as losses
+    from keras import metrics as metrics
+    from keras import mixed_precision as mixed_precision
+    from keras import models as models
+    from keras import ops as ops
+    from keras import optimizers as optimizers
+    from keras import preprocessing as preprocessing
+    from keras import quantizers as quantizers
+    from keras import random as random
+    from keras import regularizers as regularizers
+    from keras import saving as saving
+    from keras import tree as tree
+    from keras import utils as utils
+    from keras import visualization as visualization
+    from keras import wrappers as wrappers
+    from keras.src.backend import Variable as Variable
+    from keras.src.backend import device as device
+    from keras.src.backend import name_scope as name_scope
+    from keras.src.backend.common.keras_tensor import KerasTensor as KerasTensor
+    from keras.src.backend.common.remat import RematScope as RematScope
+    from keras.src.backend.common.remat import remat as remat
+    from keras.src.backend.common.stateless_scope import (
+        StatelessScope as StatelessScope,
+    )
+    from keras.src.backend.common.symbolic_scope import (
+        SymbolicScope as SymbolicScope,
+    )
+    from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
+    from keras.src.dtype_policies.dtype_policy import (
+        FloatDTypePolicy as FloatDTypePolicy,
+    )
+    from keras.src.initializers.initializer import Initializer as Initializer
+    from keras.src.layers.core.input_layer import Input as Input
+    from keras.src.layers.input_spec import InputSpec as InputSpec
+    from keras.src.layers.layer import Layer as Layer
+    from keras.src.losses.loss import Loss as Loss
+    from keras.src.metrics.metric import Metric as Metric
+    from keras.src.models.model import Model as Model
+    from keras.src.models.sequential import Sequential as Sequential
+    from keras.src.ops.function import Function as Function
+    from keras.src.ops.operation import Operation as Operation
+    from keras.src.optimizers.optimizer import Optimizer as Optimizer
+    from keras.src.quantizers.quantizers import Quantizer as Quantizer
+    from keras.src.regularizers.regularizers import Regularizer as Regularizer
+    from keras.src.version import __version__ as __version__
+    from keras.src.version import version as version
+
+_LAZY_ATTRIBUTES = {
+    "_tf_keras": ("keras._tf_keras", None),
+    "activations": ("keras.activations", None),
+    "applications": ("keras.applications", None),
+    "backend": ("keras.backend", None),
+    "callbacks": ("keras.callbacks", None),
+    "config": ("keras.config", None),
+    "constraints": ("keras.constraints", None),
+    "datasets": ("keras.datasets", None),
+    "distillation": ("keras.distillation", None),
+    "distribution": ("keras.distribution", None),
+    "dtype_policies": ("keras.dtype_policies", None),
+    "export": ("keras.export", None),
+    "initializers": ("keras.initializers", None),
+    "layers": ("keras.layers", None),
+    "legacy": ("keras.legacy", None),
+    "losses": ("keras.losses", None),
+    "metrics": ("keras.metrics", None),
+    "mixed_precision": ("keras.mixed_precision", None),
+    "models": ("keras.models", None),
+    "ops": ("keras.ops", None),
+    "optimizers": ("keras.optimizers", None),
+    "preprocessing": ("keras.preprocessing", None),
+    "quantizers": ("keras.quantizers", None),
+    "random": ("keras.random", None),
+    "regularizers": ("keras.regularizers", None),
+    "saving": ("keras.saving", None),
+    "tree": ("keras.tree", None),
+    "utils": ("keras.utils", None),
+    "visualization": ("keras.visualization", None),
+    "wrappers": ("keras.wrappers", None),
+    "Variable": ("keras.src.backend", "Variable"),
+    "device": ("keras.src.backend", "device"),
+    "name_scope": ("keras.src.backend", "name_scope"),
+    "KerasTensor": ("keras.src.backend.common.keras_tensor", "KerasTensor"),
+    "RematScope": ("keras.src.backend.common.remat", "RematScope"),
+    "remat": ("keras.src.backend.common.remat", "remat"),
+    "StatelessScope": (
+        "keras.src.backend.common.stateless_scope",
+        "StatelessScope",
+    ),
+    "SymbolicScope": (
+        "keras.src.backend.common.symbolic_scope",
+        "SymbolicScope",
+    ),
+    "DTypePolicy": ("keras.src.dtype_policies.dtype_policy", "DTypePolicy"),
+    "FloatDTypePolicy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "FloatDTypePolicy",
+    ),
+    "Initializer": ("keras.src.initializers.initializer", "Initializer"),
+    "Input": ("keras.src.layers.core.input_layer", "Input"),
+    "InputSpec": ("keras.src.layers.input_spec", "InputSpec"),
+    "Layer": ("keras.src.layers.layer", "Layer"),
+    "Loss": ("keras.src.losses.loss", "Loss"),
+    "Metric": ("keras.src.metrics.metric", "Metric"),
+    "Model": ("keras.src.models.model", "Model"),
+    "Sequential": ("keras.src.models.sequential", "Sequential"),
+    "Function": ("keras.src.ops.function", "Function"),
+    "Operation": ("keras.src.ops.operation", "Operation"),
+    "Optimizer": ("keras.src.optimizers.optimizer", "Optimizer"),
+    "Quantizer": ("keras.src.quantizers.quantizers", "Quantizer"),
+    "Regularizer": ("keras.src.regularizers.regularizers", "Regularizer"),
+    "__version__": ("keras.src.version", "__version__"),
+    "version": ("keras.src.version", "version"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1 +1,28 @@
-from keras._tf_keras import keras
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras._tf_keras import keras as keras
+
+_LAZY_ATTRIBUTES = {
+    "keras": ("keras._tf_keras.keras", None),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
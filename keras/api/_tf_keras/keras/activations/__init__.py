@@ -4,38 +4,101 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.activations import deserialize as deserialize
-from keras.src.activations import get as get
-from keras.src.activations import serialize as serialize
-from keras.src.activations.activations import celu as celu
-from keras.src.activations.activations import elu as elu
-from keras.src.activations.activations import exponential as exponential
-from keras.src.activations.activations import gelu as gelu
-from keras.src.activations.activations import glu as glu
-from keras.src.activations.activations import hard_shrink as hard_shrink
-from keras.src.activations.activations import hard_sigmoid as hard_sigmoid
-from keras.src.activations.activations import hard_silu as hard_silu
-from keras.src.activations.activations import hard_silu as hard_swish
-from keras.src.activations.activations import hard_tanh as hard_tanh
-from keras.src.activations.activations import leaky_relu as leaky_relu
-from keras.src.activations.activations import linear as linear
-from keras.src.activations.activations import log_sigmoid as log_sigmoid
-from keras.src.activations.activations import log_softmax as log_softmax
-from keras.src.activations.activations import mish as mish
-from keras.src.activations.activations import relu as relu
-from keras.src.activations.activations import relu6 as relu6
-from keras.src.activations.activations import selu as selu
-from keras.src.activations.activations import sigmoid as sigmoid
-from keras.src.activations.activations import silu as silu
-from keras.src.activations.activations import silu as swish
-from keras.src.activations.activations import soft_shrink as soft_shrink
-from keras.src.activations.activations import softmax as softmax
-from keras.src.activations.activations import softplus as softplus
-from keras.src.activations.activations import softsign as softsign
-from keras.src.activations.activations import sparse_plus as sparse_plus
-from keras.src.activations.activations import sparse_sigmoid as sparse_sigmoid
-from keras.src.activations.activations import sparsemax as sparsemax
-from keras.src.activations.activations import squareplus as squareplus
-from keras.src.activations.activations import tanh as tanh
-from keras.src.activations.activations import tanh_shrink as tanh_shrink
-from keras.src.activations.activations import threshold as threshold
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.activations import deserialize as deserialize
+    from keras.src.activations import get as get
+    from keras.src.activations import serialize as serialize
+    from keras.src.activations.activations import celu as celu
+    from keras.src.activations.activations import elu as elu
+    from keras.src.activations.activations import exponential as exponential
+    from keras.src.activations.activations import gelu as gelu
+    from keras.src.activations.activations import glu as glu
+    from keras.src.activations.activations import hard_shrink as hard_shrink
+    from keras.src.activations.activations import hard_sigmoid as hard_sigmoid
+    from keras.src.activations.activations import hard_silu as hard_silu
+    from keras.src.activations.activations import hard_silu as hard_swish
+    from keras.src.activations.activations import hard_tanh as hard_tanh
+    from keras.src.activations.activations import leaky_relu as leaky_relu
+    from keras.src.activations.activations import linear as linear
+    from keras.src.activations.activations import log_sigmoid as log_sigmoid
+    from keras.src.activations.activations import log_softmax as log_softmax
+    from keras.src.activations.activations import mish as mish
+    from keras.src.activations.activations import relu as relu
+    from keras.src.activations.activations import relu6 as relu6
+    from keras.src.activations.activations import selu as selu
+    from keras.src.activations.activations import sigmoid as sigmoid
+    from keras.src.activations.activations import silu as silu
+    from keras.src.activations.activations import silu as swish
+    from keras.src.activations.activations import soft_shrink as soft_shrink
+    from keras.src.activations.activations import softmax as softmax
+    from keras.src.activations.activations import softplus as softplus
+    from keras.src.activations.activations import softsign as softsign
+    from keras.src.activations.activations import sparse_plus as sparse_plus
+    from keras.src.activations.activations import (
+        sparse_sigmoid as sparse_sigmoid,
+    )
+    from keras.src.activations.activations import sparsemax as sparsemax
+    from keras.src.activations.activations import squareplus as squareplus
+    from keras.src.activations.activations import tanh as tanh
+    from keras.src.activations.activations import tanh_shrink as tanh_shrink
+    from keras.src.activations.activations import threshold as threshold
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.activations", "deserialize"),
+    "get": ("keras.src.activations", "get"),
+    "serialize": ("keras.src.activations", "serialize"),
+    "celu": ("keras.src.activations.activations", "celu"),
+    "elu": ("keras.src.activations.activations", "elu"),
+    "exponential": ("keras.src.activations.activations", "exponential"),
+    "gelu": ("keras.src.activations.activations", "gelu"),
+    "glu": ("keras.src.activations.activations", "glu"),
+    "hard_shrink": ("keras.src.activations.activations", "hard_shrink"),
+    "hard_sigmoid": ("keras.src.activations.activations", "hard_sigmoid"),
+    "hard_silu": ("keras.src.activations.activations", "hard_silu"),
+    "hard_swish": ("keras.src.activations.activations", "hard_silu"),
+    "hard_tanh": ("keras.src.activations.activations", "hard_tanh"),
+    "leaky_relu": ("keras.src.activations.activations", "leaky_relu"),
+    "linear": ("keras.src.activations.activations", "linear"),
+    "log_sigmoid": ("keras.src.activations.activations", "log_sigmoid"),
+    "log_softmax": ("keras.src.activations.activations", "log_softmax"),
+    "mish": ("keras.src.activations.activations", "mish"),
+    "relu": ("keras.src.activations.activations", "relu"),
+    "relu6": ("keras.src.activations.activations", "relu6"),
+    "selu": ("keras.src.activations.activations", "selu"),
+    "sigmoid": ("keras.src.activations.activations", "sigmoid"),
+    "silu": ("keras.src.activations.activations", "silu"),
+    "swish": ("keras.src.activations.activations", "silu"),
+    "soft_shrink": ("keras.src.activations.activations", "soft_shrink"),
+    "softmax": ("keras.src.activations.activations", "softmax"),
+    "softplus": ("keras.src.activations.activations", "softplus"),
+    "softsign": ("keras.src.activations.activations", "softsign"),
+    "sparse_plus": ("keras.src.activations.activations", "sparse_plus"),
+    "sparse_sigmoid": ("keras.src.activations.activations", "sparse_sigmoid"),
+    "sparsemax": ("keras.src.activations.activations", "sparsemax"),
+    "squareplus": ("keras.src.activations.activations", "squareplus"),
+    "tanh": ("keras.src.activations.activations", "tanh"),
+    "tanh_shrink": ("keras.src.activations.activations", "tanh_shrink"),
+    "threshold": ("keras.src.activations.activations", "threshold"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
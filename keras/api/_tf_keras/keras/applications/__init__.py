@@ -4,80 +4,209 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.applications import convnext as convnext
-from keras.applications import densenet as densenet
-from keras.applications import efficientnet as efficientnet
-from keras.applications import efficientnet_v2 as efficientnet_v2
-from keras.applications import imagenet_utils as imagenet_utils
-from keras.applications import inception_resnet_v2 as inception_resnet_v2
-from keras.applications import inception_v3 as inception_v3
-from keras.applications import mobilenet as mobilenet
-from keras.applications import mobilenet_v2 as mobilenet_v2
-from keras.applications import mobilenet_v3 as mobilenet_v3
-from keras.applications import nasnet as nasnet
-from keras.applications import resnet as resnet
-from keras.applications import resnet50 as resnet50
-from keras.applications import resnet_v2 as resnet_v2
-from keras.applications import vgg16 as vgg16
-from keras.applications import vgg19 as vgg19
-from keras.applications import xception as xception
-from keras.src.applications.convnext import ConvNeXtBase as ConvNeXtBase
-from keras.src.applications.convnext import ConvNeXtLarge as ConvNeXtLarge
-from keras.src.applications.convnext import ConvNeXtSmall as ConvNeXtSmall
-from keras.src.applications.convnext import ConvNeXtTiny as ConvNeXtTiny
-from keras.src.applications.convnext import ConvNeXtXLarge as ConvNeXtXLarge
-from keras.src.applications.densenet import DenseNet121 as DenseNet121
-from keras.src.applications.densenet import DenseNet169 as DenseNet169
-from keras.src.applications.densenet import DenseNet201 as DenseNet201
-from keras.src.applications.efficientnet import EfficientNetB0 as EfficientNetB0
-from keras.src.applications.efficientnet import EfficientNetB1 as EfficientNetB1
-from keras.src.applications.efficientnet import EfficientNetB2 as EfficientNetB2
-from keras.src.applications.efficientnet import EfficientNetB3 as EfficientNetB3
-from keras.src.applications.efficientnet import EfficientNetB4 as EfficientNetB4
-from keras.src.applications.efficientnet import EfficientNetB5 as EfficientNetB5
-from keras.src.applications.efficientnet import EfficientNetB6 as EfficientNetB6
-from keras.src.applications.efficientnet import EfficientNetB7 as EfficientNetB7
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2B0 as EfficientNetV2B0,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2B1 as EfficientNetV2B1,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2B2 as EfficientNetV2B2,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2B3 as EfficientNetV2B3,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2L as EfficientNetV2L,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2M as EfficientNetV2M,
-)
-from keras.src.applications.efficientnet_v2 import (
-    EfficientNetV2S as EfficientNetV2S,
-)
-from keras.src.applications.inception_resnet_v2 import (
-    InceptionResNetV2 as InceptionResNetV2,
-)
-from keras.src.applications.inception_v3 import InceptionV3 as InceptionV3
-from keras.src.applications.mobilenet import MobileNet as MobileNet
-from keras.src.applications.mobilenet_v2 import MobileNetV2 as MobileNetV2
-from keras.src.applications.mobilenet_v3 import (
-    MobileNetV3Large as MobileNetV3Large,
-)
-from keras.src.applications.mobilenet_v3 import (
-    MobileNetV3Small as MobileNetV3Small,
-)
-from keras.src.applications.nasnet import NASNetLarge as NASNetLarge
-from keras.src.applications.nasnet import NASNetMobile as NASNetMobile
-from keras.src.applications.resnet import ResNet50 as ResNet50
-from keras.src.applications.resnet import ResNet101 as ResNet101
-from keras.src.applications.resnet import ResNet152 as ResNet152
-from keras.src.applications.resnet_v2 import ResNet50V2 as ResNet50V2
-from keras.src.applications.resnet_v2 import ResNet101V2 as ResNet101V2
-from keras.src.applications.resnet_v2 import ResNet152V2 as ResNet152V2
-from keras.src.applications.vgg16 import VGG16 as VGG16
-from keras.src.applications.vgg19 import VGG19 as VGG19
-from keras.src.applications.xception import Xception as Xception
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.applications import convnext as convnext
+    from keras.applications import densenet as densenet
+    from keras.applications import efficientnet as efficientnet
+    from keras.applications import efficientnet_v2 as efficientnet_v2
+    from keras.applications import imagenet_utils as imagenet_utils
+    from keras.applications import inception_resnet_v2 as inception_resnet_v2
+    from keras.applications import inception_v3 as inception_v3
+    from keras.applications import mobilenet as mobilenet
+    from keras.applications import mobilenet_v2 as mobilenet_v2
+    from keras.applications import mobilenet_v3 as mobilenet_v3
+    from keras.applications import nasnet as nasnet
+    from keras.applications import resnet as resnet
+    from keras.applications import resnet50 as resnet50
+    from keras.applications import resnet_v2 as resnet_v2
+    from keras.applications import vgg16 as vgg16
+    from keras.applications import vgg19 as vgg19
+    from keras.applications import xception as xception
+    from keras.src.applications.convnext import ConvNeXtBase as ConvNeXtBase
+    from keras.src.applications.convnext import ConvNeXtLarge as ConvNeXtLarge
+    from keras.src.applications.convnext import ConvNeXtSmall as ConvNeXtSmall
+    from keras.src.applications.convnext import ConvNeXtTiny as ConvNeXtTiny
+    from keras.src.applications.convnext import ConvNeXtXLarge as ConvNeXtXLarge
+    from keras.src.applications.densenet import DenseNet121 as DenseNet121
+    from keras.src.applications.densenet import DenseNet169 as DenseNet169
+    from keras.src.applications.densenet import DenseNet201 as DenseNet201
+    from keras.src.applications.efficientnet import (
+        EfficientNetB0 as EfficientNetB0,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB1 as EfficientNetB1,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB2 as EfficientNetB2,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB3 as EfficientNetB3,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB4 as EfficientNetB4,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB5 as EfficientNetB5,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB6 as EfficientNetB6,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB7 as EfficientNetB7,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2B0 as EfficientNetV2B0,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2B1 as EfficientNetV2B1,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2B2 as EfficientNetV2B2,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2B3 as EfficientNetV2B3,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2L as EfficientNetV2L,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2M as EfficientNetV2M,
+    )
+    from keras.src.applications.efficientnet_v2 import (
+        EfficientNetV2S as EfficientNetV2S,
+    )
+    from keras.src.applications.inception_resnet_v2 import (
+        InceptionResNetV2 as InceptionResNetV2,
+    )
+    from keras.src.applications.inception_v3 import InceptionV3 as InceptionV3
+    from keras.src.applications.mobilenet import MobileNet as MobileNet
+    from keras.src.applications.mobilenet_v2 import MobileNetV2 as MobileNetV2
+    from keras.src.applications.mobilenet_v3 import (
+        MobileNetV3Large as MobileNetV3Large,
+    )
+    from keras.src.applications.mobilenet_v3 import (
+        MobileNetV3Small as MobileNetV3Small,
+    )
+    from keras.src.applications.nasnet import NASNetLarge as NASNetLarge
+    from keras.src.applications.nasnet import NASNetMobile as NASNetMobile
+    from keras.src.applications.resnet import ResNet50 as ResNet50
+    from keras.src.applications.resnet import ResNet101 as ResNet101
+    from keras.src.applications.resnet import ResNet152 as ResNet152
+    from keras.src.applications.resnet_v2 import ResNet50V2 as ResNet50V2
+    from keras.src.applications.resnet_v2 import ResNet101V2 as ResNet101V2
+    from keras.src.applications.resnet_v2 import ResNet152V2 as ResNet152V2
+    from keras.src.applications.vgg16 import VGG16 as VGG16
+    from keras.src.applications.vgg19 import VGG19 as VGG19
+    from keras.src.applications.xception import Xception as Xception
+
+_LAZY_ATTRIBUTES = {
+    "convnext": ("keras.applications.convnext", None),
+    "densenet": ("keras.applications.densenet", None),
+    "efficientnet": ("keras.applications.efficientnet", None),
+    "efficientnet_v2": ("keras.applications.efficientnet_v2", None),
+    "imagenet_utils": ("keras.applications.imagenet_utils", None),
+    "inception_resnet_v2": ("keras.applications.inception_resnet_v2", None),
+    "inception_v3": ("keras.applications.inception_v3", None),
+    "mobilenet": ("keras.applications.mobilenet", None),
+    "mobilenet_v2": ("keras.applications.mobilenet_v2", None),
+    "mobilenet_v3": ("keras.applications.mobilenet_v3", None),
+    "nasnet": ("keras.applications.nasnet", None),
+    "resnet": ("keras.applications.resnet", None),
+    "resnet50": ("keras.applications.resnet50", None),
+    "resnet_v2": ("keras.applications.resnet_v2", None),
+    "vgg16": ("keras.applications.vgg16", None),
+    "vgg19": ("keras.applications.vgg19", None),
+    "xception": ("keras.applications.xception", None),
+    "ConvNeXtBase": ("keras.src.applications.convnext", "ConvNeXtBase"),
+    "ConvNeXtLarge": ("keras.src.applications.convnext", "ConvNeXtLarge"),
+    "ConvNeXtSmall": ("keras.src.applications.convnext", "ConvNeXtSmall"),
+    "ConvNeXtTiny": ("keras.src.applications.convnext", "ConvNeXtTiny"),
+    "ConvNeXtXLarge": ("keras.src.applications.convnext", "ConvNeXtXLarge"),
+    "DenseNet121": ("keras.src.applications.densenet", "DenseNet121"),
+    "DenseNet169": ("keras.src.applications.densenet", "DenseNet169"),
+    "DenseNet201": ("keras.src.applications.densenet", "DenseNet201"),
+    "EfficientNetB0": ("keras.src.applications.efficientnet", "EfficientNetB0"),
+    "EfficientNetB1": ("keras.src.applications.efficientnet", "EfficientNetB1"),
+    "EfficientNetB2": ("keras.src.applications.efficientnet", "EfficientNetB2"),
+    "EfficientNetB3": ("keras.src.applications.efficientnet", "EfficientNetB3"),
+    "EfficientNetB4": ("keras.src.applications.efficientnet", "EfficientNetB4"),
+    "EfficientNetB5": ("keras.src.applications.efficientnet", "EfficientNetB5"),
+    "EfficientNetB6": ("keras.src.applications.efficientnet", "EfficientNetB6"),
+    "EfficientNetB7": ("keras.src.applications.efficientnet", "EfficientNetB7"),
+    "EfficientNetV2B0": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2B0",
+    ),
+    "EfficientNetV2B1": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2B1",
+    ),
+    "EfficientNetV2B2": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2B2",
+    ),
+    "EfficientNetV2B3": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2B3",
+    ),
+    "EfficientNetV2L": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2L",
+    ),
+    "EfficientNetV2M": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2M",
+    ),
+    "EfficientNetV2S": (
+        "keras.src.applications.efficientnet_v2",
+        "EfficientNetV2S",
+    ),
+    "InceptionResNetV2": (
+        "keras.src.applications.inception_resnet_v2",
+        "InceptionResNetV2",
+    ),
+    "InceptionV3": ("keras.src.applications.inception_v3", "InceptionV3"),
+    "MobileNet": ("keras.src.applications.mobilenet", "MobileNet"),
+    "MobileNetV2": ("keras.src.applications.mobilenet_v2", "MobileNetV2"),
+    "MobileNetV3Large": (
+        "keras.src.applications.mobilenet_v3",
+        "MobileNetV3Large",
+    ),
+    "MobileNetV3Small": (
+        "keras.src.applications.mobilenet_v3",
+        "MobileNetV3Small",
+    ),
+    "NASNetLarge": ("keras.src.applications.nasnet", "NASNetLarge"),
+    "NASNetMobile": ("keras.src.applications.nasnet", "NASNetMobile"),
+    "ResNet50": ("keras.src.applications.resnet", "ResNet50"),
+    "ResNet101": ("keras.src.applications.resnet", "ResNet101"),
+    "ResNet152": ("keras.src.applications.resnet", "ResNet152"),
+    "ResNet50V2": ("keras.src.applications.resnet_v2", "ResNet50V2"),
+    "ResNet101V2": ("keras.src.applications.resnet_v2", "ResNet101V2"),
+    "ResNet152V2": ("keras.src.applications.resnet_v2", "ResNet152V2"),
+    "VGG16": ("keras.src.applications.vgg16", "VGG16"),
+    "VGG19": ("keras.src.applications.vgg19", "VGG19"),
+    "Xception": ("keras.src.applications.xception", "Xception"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
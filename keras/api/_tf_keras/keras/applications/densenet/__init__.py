@@ -4,10 +4,46 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.applications.densenet import DenseNet121 as DenseNet121
-from keras.src.applications.densenet import DenseNet169 as DenseNet169
-from keras.src.applications.densenet import DenseNet201 as DenseNet201
-from keras.src.applications.densenet import (
-    decode_predictions as decode_predictions,
-)
-from keras.src.applications.densenet import preprocess_input as preprocess_input
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.applications.densenet import DenseNet121 as DenseNet121
+    from keras.src.applications.densenet import DenseNet169 as DenseNet169
+    from keras.src.applications.densenet import DenseNet201 as DenseNet201
+    from keras.src.applications.densenet import (
+        decode_predictions as decode_predictions,
+    )
+    from keras.src.applications.densenet import (
+        preprocess_input as preprocess_input,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "DenseNet121": ("keras.src.applications.densenet", "DenseNet121"),
+    "DenseNet169": ("keras.src.applications.densenet", "DenseNet169"),
+    "DenseNet201": ("keras.src.applications.densenet", "DenseNet201"),
+    "decode_predictions": (
+        "keras.src.applications.densenet",
+        "decode_predictions",
+    ),
+    "preprocess_input": ("keras.src.applications.densenet", "preprocess_input"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,162 +4,372 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.backend.common.dtypes import result_type as result_type
-from keras.src.backend.common.global_state import clear_session as clear_session
-from keras.src.backend.common.keras_tensor import (
-    is_keras_tensor as is_keras_tensor,
-)
-from keras.src.backend.common.variables import is_float_dtype as is_float_dtype
-from keras.src.backend.common.variables import is_int_dtype as is_int_dtype
-from keras.src.backend.common.variables import (
-    standardize_dtype as standardize_dtype,
-)
-from keras.src.backend.config import backend as backend
-from keras.src.backend.config import epsilon as epsilon
-from keras.src.backend.config import floatx as floatx
-from keras.src.backend.config import image_data_format as image_data_format
-from keras.src.backend.config import set_epsilon as set_epsilon
-from keras.src.backend.config import set_floatx as set_floatx
-from keras.src.backend.config import (
-    set_image_data_format as set_image_data_format,
-)
-from keras.src.legacy.backend import abs as abs
-from keras.src.legacy.backend import all as all
-from keras.src.legacy.backend import any as any
-from keras.src.legacy.backend import arange as arange
-from keras.src.legacy.backend import argmax as argmax
-from keras.src.legacy.backend import argmin as argmin
-from keras.src.legacy.backend import batch_dot as batch_dot
-from keras.src.legacy.backend import batch_flatten as batch_flatten
-from keras.src.legacy.backend import batch_get_value as batch_get_value
-from keras.src.legacy.backend import batch_normalization as batch_normalization
-from keras.src.legacy.backend import batch_set_value as batch_set_value
-from keras.src.legacy.backend import bias_add as bias_add
-from keras.src.legacy.backend import binary_crossentropy as binary_crossentropy
-from keras.src.legacy.backend import (
-    binary_focal_crossentropy as binary_focal_crossentropy,
-)
-from keras.src.legacy.backend import cast as cast
-from keras.src.legacy.backend import cast_to_floatx as cast_to_floatx
-from keras.src.legacy.backend import (
-    categorical_crossentropy as categorical_crossentropy,
-)
-from keras.src.legacy.backend import (
-    categorical_focal_crossentropy as categorical_focal_crossentropy,
-)
-from keras.src.legacy.backend import clip as clip
-from keras.src.legacy.backend import concatenate as concatenate
-from keras.src.legacy.backend import constant as constant
-from keras.src.legacy.backend import conv1d as conv1d
-from keras.src.legacy.backend import conv2d as conv2d
-from keras.src.legacy.backend import conv2d_transpose as conv2d_transpose
-from keras.src.legacy.backend import conv3d as conv3d
-from keras.src.legacy.backend import cos as cos
-from keras.src.legacy.backend import count_params as count_params
-from keras.src.legacy.backend import ctc_batch_cost as ctc_batch_cost
-from keras.src.legacy.backend import ctc_decode as ctc_decode
-from keras.src.legacy.backend import (
-    ctc_label_dense_to_sparse as ctc_label_dense_to_sparse,
-)
-from keras.src.legacy.backend import cumprod as cumprod
-from keras.src.legacy.backend import cumsum as cumsum
-from keras.src.legacy.backend import depthwise_conv2d as depthwise_conv2d
-from keras.src.legacy.backend import dot as dot
-from keras.src.legacy.backend import dropout as dropout
-from keras.src.legacy.backend import dtype as dtype
-from keras.src.legacy.backend import elu as elu
-from keras.src.legacy.backend import equal as equal
-from keras.src.legacy.backend import eval as eval
-from keras.src.legacy.backend import exp as exp
-from keras.src.legacy.backend import expand_dims as expand_dims
-from keras.src.legacy.backend import eye as eye
-from keras.src.legacy.backend import flatten as flatten
-from keras.src.legacy.backend import foldl as foldl
-from keras.src.legacy.backend import foldr as foldr
-from keras.src.legacy.backend import gather as gather
-from keras.src.legacy.backend import get_value as get_value
-from keras.src.legacy.backend import gradients as gradients
-from keras.src.legacy.backend import greater as greater
-from keras.src.legacy.backend import greater_equal as greater_equal
-from keras.src.legacy.backend import hard_sigmoid as hard_sigmoid
-from keras.src.legacy.backend import in_top_k as in_top_k
-from keras.src.legacy.backend import int_shape as int_shape
-from keras.src.legacy.backend import is_sparse as is_sparse
-from keras.src.legacy.backend import l2_normalize as l2_normalize
-from keras.src.legacy.backend import less as less
-from keras.src.legacy.backend import less_equal as less_equal
-from keras.src.legacy.backend import log as log
-from keras.src.legacy.backend import map_fn as map_fn
-from keras.src.legacy.backend import max as max
-from keras.src.legacy.backend import maximum as maximum
-from keras.src.legacy.backend import mean as mean
-from keras.src.legacy.backend import min as min
-from keras.src.legacy.backend import minimum as minimum
-from keras.src.legacy.backend import (
-    moving_average_update as moving_average_update,
-)
-from keras.src.legacy.backend import name_scope as name_scope
-from keras.src.legacy.backend import ndim as ndim
-from keras.src.legacy.backend import not_equal as not_equal
-from keras.src.legacy.backend import one_hot as one_hot
-from keras.src.legacy.backend import ones as ones
-from keras.src.legacy.backend import ones_like as ones_like
-from keras.src.legacy.backend import permute_dimensions as permute_dimensions
-from keras.src.legacy.backend import pool2d as pool2d
-from keras.src.legacy.backend import pool3d as pool3d
-from keras.src.legacy.backend import pow as pow
-from keras.src.legacy.backend import prod as prod
-from keras.src.legacy.backend import random_bernoulli as random_bernoulli
-from keras.src.legacy.backend import random_normal as random_normal
-from keras.src.legacy.backend import (
-    random_normal_variable as random_normal_variable,
-)
-from keras.src.legacy.backend import random_uniform as random_uniform
-from keras.src.legacy.backend import (
-    random_uniform_variable as random_uniform_variable,
-)
-from keras.src.legacy.backend import relu as relu
-from keras.src.legacy.backend import repeat as repeat
-from keras.src.legacy.backend import repeat_elements as repeat_elements
-from keras.src.legacy.backend import reshape as reshape
-from keras.src.legacy.backend import resize_images as resize_images
-from keras.src.legacy.backend import resize_volumes as resize_volumes
-from keras.src.legacy.backend import reverse as reverse
-from keras.src.legacy.backend import rnn as rnn
-from keras.src.legacy.backend import round as round
-from keras.src.legacy.backend import separable_conv2d as separable_conv2d
-from keras.src.legacy.backend import set_value as set_value
-from keras.src.legacy.backend import shape as shape
-from keras.src.legacy.backend import sigmoid as sigmoid
-from keras.src.legacy.backend import sign as sign
-from keras.src.legacy.backend import sin as sin
-from keras.src.legacy.backend import softmax as softmax
-from keras.src.legacy.backend import softplus as softplus
-from keras.src.legacy.backend import softsign as softsign
-from keras.src.legacy.backend import (
-    sparse_categorical_crossentropy as sparse_categorical_crossentropy,
-)
-from keras.src.legacy.backend import spatial_2d_padding as spatial_2d_padding
-from keras.src.legacy.backend import spatial_3d_padding as spatial_3d_padding
-from keras.src.legacy.backend import sqrt as sqrt
-from keras.src.legacy.backend import square as square
-from keras.src.legacy.backend import squeeze as squeeze
-from keras.src.legacy.backend import stack as stack
-from keras.src.legacy.backend import std as std
-from keras.src.legacy.backend import stop_gradient as stop_gradient
-from keras.src.legacy.backend import sum as sum
-from keras.src.legacy.backend import switch as switch
-from keras.src.legacy.backend import tanh as tanh
-from keras.src.legacy.backend import temporal_padding as temporal_padding
-from keras.src.legacy.backend import tile as tile
-from keras.src.legacy.backend import to_dense as to_dense
-from keras.src.legacy.backend import transpose as transpose
-from keras.src.legacy.backend import truncated_normal as truncated_normal
-from keras.src.legacy.backend import update as update
-from keras.src.legacy.backend import update_add as update_add
-from keras.src.legacy.backend import update_sub as update_sub
-from keras.src.legacy.backend import var as var
-from keras.src.legacy.backend import variable as variable
-from keras.src.legacy.backend import zeros as zeros
-from keras.src.legacy.backend import zeros_like as zeros_like
-from keras.src.utils.naming import get_uid as get_uid
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.backend.common.dtypes import result_type as result_type
+    from keras.src.backend.common.global_state import (
+        clear_session as clear_session,
+    )
+    from keras.src.backend.common.keras_tensor import (
+        is_keras_tensor as is_keras_tensor,
+    )
+    from keras.src.backend.common.variables import (
+        is_float_dtype as is_float_dtype,
+    )
+    from keras.src.backend.common.variables import is_int_dtype as is_int_dtype
+    from keras.src.backend.common.variables import (
+        standardize_dtype as standardize_dtype,
+    )
+    from keras.src.backend.config import backend as backend
+    from keras.src.backend.config import epsilon as epsilon
+    from keras.src.backend.config import floatx as floatx
+    from keras.src.backend.config import image_data_format as image_data_format
+    from keras.src.backend.config import set_epsilon as set_epsilon
+    from keras.src.backend.config import set_floatx as set_floatx
+    from keras.src.backend.config import (
+        set_image_data_format as set_image_data_format,
+    )
+    from keras.src.legacy.backend import abs as abs
+    from keras.src.legacy.backend import all as all
+    from keras.src.legacy.backend import any as any
+    from keras.src.legacy.backend import arange as arange
+    from keras.src.legacy.backend import argmax as argmax
+    from keras.src.legacy.backend import argmin as argmin
+    from keras.src.legacy.backend import batch_dot as batch_dot
+    from keras.src.legacy.backend import batch_flatten as batch_flatten
+    from keras.src.legacy.backend import batch_get_value as batch_get_value
+    from keras.src.legacy.backend import (
+        batch_normalization as batch_normalization,
+    )
+    from keras.src.legacy.backend import batch_set_value as batch_set_value
+    from keras.src.legacy.backend import bias_add as bias_add
+    from keras.src.legacy.backend import (
+        binary_crossentropy as binary_crossentropy,
+    )
+    from keras.src.legacy.backend import (
+        binary_focal_crossentropy as binary_focal_crossentropy,
+    )
+    from keras.src.legacy.backend import cast as cast
+    from keras.src.legacy.backend import cast_to_floatx as cast_to_floatx
+    from keras.src.legacy.backend import (
+        categorical_crossentropy as categorical_crossentropy,
+    )
+    from keras.src.legacy.backend import (
+        categorical_focal_crossentropy as categorical_focal_crossentropy,
+    )
+    from keras.src.legacy.backend import clip as clip
+    from keras.src.legacy.backend import concatenate as concatenate
+    from keras.src.legacy.backend import constant as constant
+    from keras.src.legacy.backend import conv1d as conv1d
+    from keras.src.legacy.backend import conv2d as conv2d
+    from keras.src.legacy.backend import conv2d_transpose as conv2d_transpose
+    from keras.src.legacy.backend import conv3d as conv3d
+    from keras.src.legacy.backend import cos as cos
+    from keras.src.legacy.backend import count_params as count_params
+    from keras.src.legacy.backend import ctc_batch_cost as ctc_batch_cost
+    from keras.src.legacy.backend import ctc_decode as ctc_decode
+    from keras.src.legacy.backend import (
+        ctc_label_dense_to_sparse as ctc_label_dense_to_sparse,
+    )
+    from keras.src.legacy.backend import cumprod as cumprod
+    from keras.src.legacy.backend import cumsum as cumsum
+    from keras.src.legacy.backend import depthwise_conv2d as depthwise_conv2d
+    from keras.src.legacy.backend import dot as dot
+    from keras.src.legacy.backend import dropout as dropout
+    from keras.src.legacy.backend import dtype as dtype
+    from keras.src.legacy.backend import elu as elu
+    from keras.src.legacy.backend import equal as equal
+    from keras.src.legacy.backend import eval as eval
+    from keras.src.legacy.backend import exp as exp
+    from keras.src.legacy.backend import expand_dims as expand_dims
+    from keras.src.legacy.backend import eye as eye
+    from keras.src.legacy.backend import flatten as flatten
+    from keras.src.legacy.backend import foldl as foldl
+    from keras.src.legacy.backend import foldr as foldr
+    from keras.src.legacy.backend import gather as gather
+    from keras.src.legacy.backend import get_value as get_value
+    from keras.src.legacy.backend import gradients as gradients
+    from keras.src.legacy.backend import greater as greater
+    from keras.src.legacy.backend import greater_equal as greater_equal
+    from keras.src.legacy.backend import hard_sigmoid as hard_sigmoid
+    from keras.src.legacy.backend import in_top_k as in_top_k
+    from keras.src.legacy.backend import int_shape as int_shape
+    from keras.src.legacy.backend import is_sparse as is_sparse
+    from keras.src.legacy.backend import l2_normalize as l2_normalize
+    from keras.src.legacy.backend import less as less
+    from keras.src.legacy.backend import less_equal as less_equal
+    from keras.src.legacy.backend import log as log
+    from keras.src.legacy.backend import map_fn as map_fn
+    from keras.src.legacy.backend import max as max
+    from keras.src.legacy.backend import maximum as maximum
+    from keras.src.legacy.backend import mean as mean
+    from keras.src.legacy.backend import min as min
+    from keras.src.legacy.backend import minimum as minimum
+    from keras.src.legacy.backend import (
+        moving_average_update as moving_average_update,
+    )
+    from keras.src.legacy.backend import name_scope as name_scope
+    from keras.src.legacy.backend import ndim as ndim
+    from keras.src.legacy.backend import not_equal as not_equal
+    from keras.src.legacy.backend import one_hot as one_hot
+    from keras.src.legacy.backend import ones as ones
+    from keras.src.legacy.backend import ones_like as ones_like
+    from keras.src.legacy.backend import (
+        permute_dimensions as permute_dimensions,
+    )
+    from keras.src.legacy.backend import pool2d as pool2d
+    from keras.src.legacy.backend import pool3d as pool3d
+    from keras.src.legacy.backend import pow as pow
+    from keras.src.legacy.backend import prod as prod
+    from keras.src.legacy.backend import random_bernoulli as random_bernoulli
+    from keras.src.legacy.backend import random_normal as random_normal
+    from keras.src.legacy.backend import (
+        random_normal_variable as random_normal_variable,
+    )
+    from keras.src.legacy.backend import random_uniform as random_uniform
+    from keras.src.legacy.backend import (
+        random_uniform_variable as random_uniform_variable,
+    )
+    from keras.src.legacy.backend import relu as relu
+    from keras.src.legacy.backend import repeat as repeat
+    from keras.src.legacy.backend import repeat_elements as repeat_elements
+    from keras.src.legacy.backend import reshape as reshape
+    from keras.src.legacy.backend import resize_images as resize_images
+    from keras.src.legacy.backend import resize_volumes as resize_volumes
+    from keras.src.legacy.backend import reverse as reverse
+    from keras.src.legacy.backend import rnn as rnn
+    from keras.src.legacy.backend import round as round
+    from keras.src.legacy.backend import separable_conv2d as separable_conv2d
+    from keras.src.legacy.backend import set_value as set_value
+    from keras.src.legacy.backend import shape as shape
+    from keras.src.legacy.backend import sigmoid as sigmoid
+    from keras.src.legacy.backend import sign as sign
+    from keras.src.legacy.backend import sin as sin
+    from keras.src.legacy.backend import softmax as softmax
+    from keras.src.legacy.backend import softplus as softplus
+    from keras.src.legacy.backend import softsign as softsign
+    from keras.src.legacy.backend import (
+        sparse_categorical_crossentropy as sparse_categorical_crossentropy,
+    )
+    from keras.src.legacy.backend import (
+        spatial_2d_padding as spatial_2d_padding,
+    )
+    from keras.src.legacy.backend import (
+        spatial_3d_padding as spatial_3d_padding,
+    )
+    from keras.src.legacy.backend import sqrt as sqrt
+    from keras.src.legacy.backend import square as square
+    from keras.src.legacy.backend import squeeze as squeeze
+    from keras.src.legacy.backend import stack as stack
+    from keras.src.legacy.backend import std as std
+    from keras.src.legacy.backend import stop_gradient as stop_gradient
+    from keras.src.legacy.backend import sum as sum
+    from keras.src.legacy.backend import switch as switch
+    from keras.src.legacy.backend import tanh as tanh
+    from keras.src.legacy.backend import temporal_padding as temporal_padding
+    from keras.src.legacy.backend import tile as tile
+    from keras.src.legacy.backend import to_dense as to_dense
+    from keras.src.legacy.backend import transpose as transpose
+    from keras.src.legacy.backend import truncated_normal as truncated_normal
+    from keras.src.legacy.backend import update as update
+    from keras.src.legacy.backend import update_add as update_add
+    from keras.src.legacy.backend import update_sub as update_sub
+    from keras.src.legacy.backend import var as var
+    from keras.src.legacy.backend import variable as variable
+    from keras.src.legacy.backend import zeros as zeros
+    from keras.src.legacy.backend import zeros_like as zeros_like
+    from keras.src.utils.naming import get_uid as get_uid
+
+_LAZY_ATTRIBUTES = {
+    "result_type": ("keras.src.backend.common.dtypes", "result_type"),
+    "clear_session": ("keras.src.backend.common.global_state", "clear_session"),
+    "is_keras_tensor": (
+        "keras.src.backend.common.keras_tensor",
+        "is_keras_tensor",
+    ),
+    "is_float_dtype": ("keras.src.backend.common.variables", "is_float_dtype"),
+    "is_int_dtype": ("keras.src.backend.common.variables", "is_int_dtype"),
+    "standardize_dtype": (
+        "keras.src.backend.common.variables",
+        "standardize_dtype",
+    ),
+    "backend": ("keras.src.backend.config", "backend"),
+    "epsilon": ("keras.src.backend.config", "epsilon"),
+    "floatx": ("keras.src.backend.config", "floatx"),
+    "image_data_format": ("keras.src.backend.config", "image_data_format"),
+    "set_epsilon": ("keras.src.backend.config", "set_epsilon"),
+    "set_floatx": ("keras.src.backend.config", "set_floatx"),
+    "set_image_data_format": (
+        "keras.src.backend.config",
+        "set_image_data_format",
+    ),
+    "abs": ("keras.src.legacy.backend", "abs"),
+    "all": ("keras.src.legacy.backend", "all"),
+    "any": ("keras.src.legacy.backend", "any"),
+    "arange": ("keras.src.legacy.backend", "arange"),
+    "argmax": ("keras.src.legacy.backend", "argmax"),
+    "argmin": ("keras.src.legacy.backend", "argmin"),
+    "batch_dot": ("keras.src.legacy.backend", "batch_dot"),
+    "batch_flatten": ("keras.src.legacy.backend", "batch_flatten"),
+    "batch_get_value": ("keras.src.legacy.backend", "batch_get_value"),
+    "batch_normalization": ("keras.src.legacy.backend", "batch_normalization"),
+    "batch_set_value": ("keras.src.legacy.backend", "batch_set_value"),
+    "bias_add": ("keras.src.legacy.backend", "bias_add"),
+    "binary_crossentropy": ("keras.src.legacy.backend", "binary_crossentropy"),
+    "binary_focal_crossentropy": (
+        "keras.src.legacy.backend",
+        "binary_focal_crossentropy",
+    ),
+    "cast": ("keras.src.legacy.backend", "cast"),
+    "cast_to_floatx": ("keras.src.legacy.backend", "cast_to_floatx"),
+    "categorical_crossentropy": (
+        "keras.src.legacy.backend",
+        "categorical_crossentropy",
+    ),
+    "categorical_focal_crossentropy": (
+        "keras.src.legacy.backend",
+        "categorical_focal_crossentropy",
+    ),
+    "clip": ("keras.src.legacy.backend", "clip"),
+    "concatenate": ("keras.src.legacy.backend", "concatenate"),
+    "constant": ("keras.src.legacy.backend", "constant"),
+    "conv1d": ("keras.src.legacy.backend", "conv1d"),
+    "conv2d": ("keras.src.legacy.backend", "conv2d"),
+    "conv2d_transpose": ("keras.src.legacy.backend", "conv2d_transpose"),
+    "conv3d": ("keras.src.legacy.backend", "conv3d"),
+    "cos": ("keras.src.legacy.backend", "cos"),
+    "count_params": ("keras.src.legacy.backend", "count_params"),
+    "ctc_batch_cost": ("keras.src.legacy.backend", "ctc_batch_cost"),
+    "ctc_decode": ("keras.src.legacy.backend", "ctc_decode"),
+    "ctc_label_dense_to_sparse": (
+        "keras.src.legacy.backend",
+        "ctc_label_dense_to_sparse",
+    ),
+    "cumprod": ("keras.src.legacy.backend", "cumprod"),
+    "cumsum": ("keras.src.legacy.backend", "cumsum"),
+    "depthwise_conv2d": ("keras.src.legacy.backend", "depthwise_conv2d"),
+    "dot": ("keras.src.legacy.backend", "dot"),
+    "dropout": ("keras.src.legacy.backend", "dropout"),
+    "dtype": ("keras.src.legacy.backend", "dtype"),
+    "elu": ("keras.src.legacy.backend", "elu"),
+    "equal": ("keras.src.legacy.backend", "equal"),
+    "eval": ("keras.src.legacy.backend", "eval"),
+    "exp": ("keras.src.legacy.backend", "exp"),
+    "expand_dims": ("keras.src.legacy.backend", "expand_dims"),
+    "eye": ("keras.src.legacy.backend", "eye"),
+    "flatten": ("keras.src.legacy.backend", "flatten"),
+    "foldl": ("keras.src.legacy.backend", "foldl"),
+    "foldr": ("keras.src.legacy.backend", "foldr"),
+    "gather": ("keras.src.legacy.backend", "gather"),
+    "get_value": ("keras.src.legacy.backend", "get_value"),
+    "gradients": ("keras.src.legacy.backend", "gradients"),
+    "greater": ("keras.src.legacy.backend", "greater"),
+    "greater_equal": ("keras.src.legacy.backend", "greater_equal"),
+    "hard_sigmoid": ("keras.src.legacy.backend", "hard_sigmoid"),
+    "in_top_k": ("keras.src.legacy.backend", "in_top_k"),
+    "int_shape": ("keras.src.legacy.backend", "int_shape"),
+    "is_sparse": ("keras.src.legacy.backend", "is_sparse"),
+    "l2_normalize": ("keras.src.legacy.backend", "l2_normalize"),
+    "less": ("keras.src.legacy.backend", "less"),
+    "less_equal": ("keras.src.legacy.backend", "less_equal"),
+    "log": ("keras.src.legacy.backend", "log"),
+    "map_fn": ("keras.src.legacy.backend", "map_fn"),
+    "max": ("keras.src.legacy.backend", "max"),
+    "maximum": ("keras.src.legacy.backend", "maximum"),
+    "mean": ("keras.src.legacy.backend", "mean"),
+    "min": ("keras.src.legacy.backend", "min"),
+    "minimum": ("keras.src.legacy.backend", "minimum"),
+    "moving_average_update": (
+        "keras.src.legacy.backend",
+        "moving_average_update",
+    ),
+    "name_scope": ("keras.src.legacy.backend", "name_scope"),
+    "ndim": ("keras.src.legacy.backend", "ndim"),
+    "not_equal": ("keras.src.legacy.backend", "not_equal"),
+    "one_hot": ("keras.src.legacy.backend", "one_hot"),
+    "ones": ("keras.src.legacy.backend", "ones"),
+    "ones_like": ("keras.src.legacy.backend", "ones_like"),
+    "permute_dimensions": ("keras.src.legacy.backend", "permute_dimensions"),
+    "pool2d": ("keras.src.legacy.backend", "pool2d"),
+    "pool3d": ("keras.src.legacy.backend", "pool3d"),
+    "pow": ("keras.src.legacy.backend", "pow"),
+    "prod": ("keras.src.legacy.backend", "prod"),
+    "random_bernoulli": ("keras.src.legacy.backend", "random_bernoulli"),
+    "random_normal": ("keras.src.legacy.backend", "random_normal"),
+    "random_normal_variable": (
+        "keras.src.legacy.backend",
+        "random_normal_variable",
+    ),
+    "random_uniform": ("keras.src.legacy.backend", "random_uniform"),
+    "random_uniform_variable": (
+        "keras.src.legacy.backend",
+        "random_uniform_variable",
+    ),
+    "relu": ("keras.src.legacy.backend", "relu"),
+    "repeat": ("keras.src.legacy.backend", "repeat"),
+    "repeat_elements": ("keras.src.legacy.backend", "repeat_elements"),
+    "reshape": ("keras.src.legacy.backend", "reshape"),
+    "resize_images": ("keras.src.legacy.backend", "resize_images"),
+    "resize_volumes": ("keras.src.legacy.backend", "resize_volumes"),
+    "reverse": ("keras.src.legacy.backend", "reverse"),
+    "rnn": ("keras.src.legacy.backend", "rnn"),
+    "round": ("keras.src.legacy.backend", "round"),
+    "separable_conv2d": ("keras.src.legacy.backend", "separable_conv2d"),
+    "set_value": ("keras.src.legacy.backend", "set_value"),
+    "shape": ("keras.src.legacy.backend", "shape"),
+    "sigmoid": ("keras.src.legacy.backend", "sigmoid"),
+    "sign": ("keras.src.legacy.backend", "sign"),
+    "sin": ("keras.src.legacy.backend", "sin"),
+    "softmax": ("keras.src.legacy.backend", "softmax"),
+    "softplus": ("keras.src.legacy.backend", "softplus"),
+    "softsign": ("keras.src.legacy.backend", "softsign"),
+    "sparse_categorical_crossentropy": (
+        "keras.src.legacy.backend",
+        "sparse_categorical_crossentropy",
+    ),
+    "spatial_2d_padding": ("keras.src.legacy.backend", "spatial_2d_padding"),
+    "spatial_3d_padding": ("keras.src.legacy.backend", "spatial_3d_padding"),
+    "sqrt": ("keras.src.legacy.backend", "sqrt"),
+    "square": ("keras.src.legacy.backend", "square"),
+    "squeeze": ("keras.src.legacy.backend", "squeeze"),
+    "stack": ("keras.src.legacy.backend", "stack"),
+    "std": ("keras.src.legacy.backend", "std"),
+    "stop_gradient": ("keras.src.legacy.backend", "stop_gradient"),
+    "sum": ("keras.src.legacy.backend", "sum"),
+    "switch": ("keras.src.legacy.backend", "switch"),
+    "tanh": ("keras.src.legacy.backend", "tanh"),
+    "temporal_padding": ("keras.src.legacy.backend", "temporal_padding"),
+    "tile": ("keras.src.legacy.backend", "tile"),
+    "to_dense": ("keras.src.legacy.backend", "to_dense"),
+    "transpose": ("keras.src.legacy.backend", "transpose"),
+    "truncated_normal": ("keras.src.legacy.backend", "truncated_normal"),
+    "update": ("keras.src.legacy.backend", "update"),
+    "update_add": ("keras.src.legacy.backend", "update_add"),
+    "update_sub": ("keras.src.legacy.backend", "update_sub"),
+    "var": ("keras.src.legacy.backend", "var"),
+    "variable": ("keras.src.legacy.backend", "variable"),
+    "zeros": ("keras.src.legacy.backend", "zeros"),
+    "zeros_like": ("keras.src.legacy.backend", "zeros_like"),
+    "get_uid": ("keras.src.utils.naming", "get_uid"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,33 +4,106 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.callbacks.backup_and_restore import (
-    BackupAndRestore as BackupAndRestore,
-)
-from keras.src.callbacks.callback import Callback as Callback
-from keras.src.callbacks.callback_list import CallbackList as CallbackList
-from keras.src.callbacks.csv_logger import CSVLogger as CSVLogger
-from keras.src.callbacks.early_stopping import EarlyStopping as EarlyStopping
-from keras.src.callbacks.history import History as History
-from keras.src.callbacks.lambda_callback import LambdaCallback as LambdaCallback
-from keras.src.callbacks.learning_rate_scheduler import (
-    LearningRateScheduler as LearningRateScheduler,
-)
-from keras.src.callbacks.model_checkpoint import (
-    ModelCheckpoint as ModelCheckpoint,
-)
-from keras.src.callbacks.orbax_checkpoint import (
-    OrbaxCheckpoint as OrbaxCheckpoint,
-)
-from keras.src.callbacks.progbar_logger import ProgbarLogger as ProgbarLogger
-from keras.src.callbacks.reduce_lr_on_plateau import (
-    ReduceLROnPlateau as ReduceLROnPlateau,
-)
-from keras.src.callbacks.remote_monitor import RemoteMonitor as RemoteMonitor
-from keras.src.callbacks.swap_ema_weights import (
-    SwapEMAWeights as SwapEMAWeights,
-)
-from keras.src.callbacks.tensorboard import TensorBoard as TensorBoard
-from keras.src.callbacks.terminate_on_nan import (
-    TerminateOnNaN as TerminateOnNaN,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.callbacks.backup_and_restore import (
+        BackupAndRestore as BackupAndRestore,
+    )
+    from keras.src.callbacks.callback import Callback as Callback
+    from keras.src.callbacks.callback_list import CallbackList as CallbackList
+    from keras.src.callbacks.csv_logger import CSVLogger as CSVLogger
+    from keras.src.callbacks.early_stopping import (
+        EarlyStopping as EarlyStopping,
+    )
+    from keras.src.callbacks.history import History as History
+    from keras.src.callbacks.lambda_callback import (
+        LambdaCallback as LambdaCallback,
+    )
+    from keras.src.callbacks.learning_rate_scheduler import (
+        LearningRateScheduler as LearningRateScheduler,
+    )
+    from keras.src.callbacks.model_checkpoint import (
+        ModelCheckpoint as ModelCheckpoint,
+    )
+    from keras.src.callbacks.orbax_checkpoint import (
+        OrbaxCheckpoint as OrbaxCheckpoint,
+    )
+    from keras.src.callbacks.progbar_logger import (
+        ProgbarLogger as ProgbarLogger,
+    )
+    from keras.src.callbacks.reduce_lr_on_plateau import (
+        ReduceLROnPlateau as ReduceLROnPlateau,
+    )
+    from keras.src.callbacks.remote_monitor import (
+        RemoteMonitor as RemoteMonitor,
+    )
+    from keras.src.callbacks.step_profiler import StepProfiler as StepProfiler
+    from keras.src.callbacks.swap_ema_weights import (
+        SwapEMAWeights as SwapEMAWeights,
+    )
+    from keras.src.callbacks.tensorboard import TensorBoard as TensorBoard
+    from keras.src.callbacks.terminate_on_nan import (
+        TerminateOnNaN as TerminateOnNaN,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "BackupAndRestore": (
+        "keras.src.callbacks.backup_and_restore",
+        "BackupAndRestore",
+    ),
+    "Callback": ("keras.src.callbacks.callback", "Callback"),
+    "CallbackList": ("keras.src.callbacks.callback_list", "CallbackList"),
+    "CSVLogger": ("keras.src.callbacks.csv_logger", "CSVLogger"),
+    "EarlyStopping": ("keras.src.callbacks.early_stopping", "EarlyStopping"),
+    "History": ("keras.src.callbacks.history", "History"),
+    "LambdaCallback": ("keras.src.callbacks.lambda_callback", "LambdaCallback"),
+    "LearningRateScheduler": (
+        "keras.src.callbacks.learning_rate_scheduler",
+        "LearningRateScheduler",
+    ),
+    "ModelCheckpoint": (
+        "keras.src.callbacks.model_checkpoint",
+        "ModelCheckpoint",
+    ),
+    "OrbaxCheckpoint": (
+        "keras.src.callbacks.orbax_checkpoint",
+        "OrbaxCheckpoint",
+    ),
+    "ProgbarLogger": ("keras.src.callbacks.progbar_logger", "ProgbarLogger"),
+    "ReduceLROnPlateau": (
+        "keras.src.callbacks.reduce_lr_on_plateau",
+        "ReduceLROnPlateau",
+    ),
+    "RemoteMonitor": ("keras.src.callbacks.remote_monitor", "RemoteMonitor"),
+    "StepProfiler": ("keras.src.callbacks.step_profiler", "StepProfiler"),
+    "SwapEMAWeights": (
+        "keras.src.callbacks.swap_ema_weights",
+        "SwapEMAWeights",
+    ),
+    "TensorBoard": ("keras.src.callbacks.tensorboard", "TensorBoard"),
+    "TerminateOnNaN": (
+        "keras.src.callbacks.terminate_on_nan",
+        "TerminateOnNaN",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,54 +4,169 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.backend.config import backend as backend
-from keras.src.backend.config import (
-    disable_flash_attention as disable_flash_attention,
-)
-from keras.src.backend.config import (
-    enable_flash_attention as enable_flash_attention,
-)
-from keras.src.backend.config import epsilon as epsilon
-from keras.src.backend.config import floatx as floatx
-from keras.src.backend.config import image_data_format as image_data_format
-from keras.src.backend.config import (
-    is_flash_attention_enabled as is_flash_attention_enabled,
-)
-from keras.src.backend.config import is_nnx_enabled as is_nnx_enabled
-from keras.src.backend.config import max_epochs as max_epochs
-from keras.src.backend.config import max_steps_per_epoch as max_steps_per_epoch
-from keras.src.backend.config import set_epsilon as set_epsilon
-from keras.src.backend.config import set_floatx as set_floatx
-from keras.src.backend.config import (
-    set_image_data_format as set_image_data_format,
-)
-from keras.src.backend.config import set_max_epochs as set_max_epochs
-from keras.src.backend.config import (
-    set_max_steps_per_epoch as set_max_steps_per_epoch,
-)
-from keras.src.dtype_policies.dtype_policy import dtype_policy as dtype_policy
-from keras.src.dtype_policies.dtype_policy import (
-    set_dtype_policy as set_dtype_policy,
-)
-from keras.src.saving.serialization_lib import (
-    enable_unsafe_deserialization as enable_unsafe_deserialization,
-)
-from keras.src.utils.backend_utils import set_backend as set_backend
-from keras.src.utils.io_utils import (
-    disable_interactive_logging as disable_interactive_logging,
-)
-from keras.src.utils.io_utils import (
-    enable_interactive_logging as enable_interactive_logging,
-)
-from keras.src.utils.io_utils import (
-    is_interactive_logging_enabled as is_interactive_logging_enabled,
-)
-from keras.src.utils.traceback_utils import (
-    disable_traceback_filtering as disable_traceback_filtering,
-)
-from keras.src.utils.traceback_utils import (
-    enable_traceback_filtering as enable_traceback_filtering,
-)
-from keras.src.utils.traceback_utils import (
-    is_traceback_filtering_enabled as is_traceback_filtering_enabled,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.backend.config import backend as backend
+    from keras.src.backend.config import (
+        disable_flash_attention as disable_flash_attention,
+    )
+    from keras.src.backend.config import (
+        enable_flash_attention as enable_flash_attention,
+    )
+    from keras.src.backend.config import epsilon as epsilon
+    from keras.src.backend.config import floatx as floatx
+    from keras.src.backend.config import image_data_format as image_data_format
+    from keras.src.backend.config import (
+        is_flash_attention_enabled as is_flash_attention_enabled,
+    )
+    from keras.src.backend.config import is_nnx_enabled as is_nnx_enabled
+    from keras.src.backend.config import max_epochs as max_epochs
+    from keras.src.backend.config import (
+        max_steps_per_epoch as max_steps_per_epoch,
+    )
+    from keras.src.backend.config import set_epsilon as set_epsilon
+    from keras.src.backend.config import set_floatx as set_floatx
+    from keras.src.backend.config import (
+        set_image_data_format as set_image_data_format,
+    )
+    from keras.src.backend.config import set_max_epochs as set_max_epochs
+    from keras.src.backend.config import (
+        set_max_steps_per_epoch as set_max_steps_per_epoch,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        dtype_policy as dtype_policy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        set_dtype_policy as set_dtype_policy,
+    )
+    from keras.src.saving.serialization_lib import (
+        enable_unsafe_deserialization as enable_unsafe_deserialization,
+    )
+    from keras.src.utils.backend_utils import set_backend as set_backend
+    from keras.src.utils.compilation_cache import (
+        compilation_cache_directory as compilation_cache_directory,
+    )
+    from keras.src.utils.compilation_cache import (
+        disable_compilation_cache as disable_compilation_cache,
+    )
+    from keras.src.utils.compilation_cache import (
+        enable_compilation_cache as enable_compilation_cache,
+    )
+    from keras.src.utils.io_utils import (
+        disable_interactive_logging as disable_interactive_logging,
+    )
+    from keras.src.utils.io_utils import (
+        enable_interactive_logging as enable_interactive_logging,
+    )
+    from keras.src.utils.io_utils import (
+        is_interactive_logging_enabled as is_interactive_logging_enabled,
+    )
+    from keras.src.utils.traceback_utils import (
+        disable_traceback_filtering as disable_traceback_filtering,
+    )
+    from keras.src.utils.traceback_utils import (
+        enable_traceback_filtering as enable_traceback_filtering,
+    )
+    from keras.src.utils.traceback_utils import (
+        is_traceback_filtering_enabled as is_traceback_filtering_enabled,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "backend": ("keras.src.backend.config", "backend"),
+    "disable_flash_attention": (
+        "keras.src.backend.config",
+        "disable_flash_attention",
+    ),
+    "enable_flash_attention": (
+        "keras.src.backend.config",
+        "enable_flash_attention",
+    ),
+    "epsilon": ("keras.src.backend.config", "epsilon"),
+    "floatx": ("keras.src.backend.config", "floatx"),
+    "image_data_format": ("keras.src.backend.config", "image_data_format"),
+    "is_flash_attention_enabled": (
+        "keras.src.backend.config",
+        "is_flash_attention_enabled",
+    ),
+    "is_nnx_enabled": ("keras.src.backend.config", "is_nnx_enabled"),
+    "max_epochs": ("keras.src.backend.config", "max_epochs"),
+    "max_steps_per_epoch": ("keras.src.backend.config", "max_steps_per_epoch"),
+    "set_epsilon": ("keras.src.backend.config", "set_epsilon"),
+    "set_floatx": ("keras.src.backend.config", "set_floatx"),
+    "set_image_data_format": (
+        "keras.src.backend.config",
+        "set_image_data_format",
+    ),
+    "set_max_epochs": ("keras.src.backend.config", "set_max_epochs"),
+    "set_max_steps_per_epoch": (
+        "keras.src.backend.config",
+        "set_max_steps_per_epoch",
+    ),
+    "dtype_policy": ("keras.src.dtype_policies.dtype_policy", "dtype_policy"),
+    "set_dtype_policy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "set_dtype_policy",
+    ),
+    "enable_unsafe_deserialization": (
+        "keras.src.saving.serialization_lib",
+        "enable_unsafe_deserialization",
+    ),
+    "set_backend": ("keras.src.utils.backend_utils", "set_backend"),
+    "compilation_cache_directory": (
+        "keras.src.utils.compilation_cache",
+        "compilation_cache_directory",
+    ),
+    "disable_compilation_cache": (
+        "keras.src.utils.compilation_cache",
+        "disable_compilation_cache",
+    ),
+    "enable_compilation_cache": (
+        "keras.src.utils.compilation_cache",
+        "enable_compilation_cache",
+    ),
+    "disable_interactive_logging": (
+        "keras.src.utils.io_utils",
+        "disable_interactive_logging",
+    ),
+    "enable_interactive_logging": (
+        "keras.src.utils.io_utils",
+        "enable_interactive_logging",
+    ),
+    "is_interactive_logging_enabled": (
+        "keras.src.utils.io_utils",
+        "is_interactive_logging_enabled",
+    ),
+    "disable_traceback_filtering": (
+        "keras.src.utils.traceback_utils",
+        "disable_traceback_filtering",
+    ),
+    "enable_traceback_filtering": (
+        "keras.src.utils.traceback_utils",
+        "enable_traceback_filtering",
+    ),
+    "is_traceback_filtering_enabled": (
+        "keras.src.utils.traceback_utils",
+        "is_traceback_filtering_enabled",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,15 +4,53 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.constraints import deserialize as deserialize
-from keras.src.constraints import get as get
-from keras.src.constraints import serialize as serialize
-from keras.src.constraints.constraints import Constraint as Constraint
-from keras.src.constraints.constraints import MaxNorm as MaxNorm
-from keras.src.constraints.constraints import MaxNorm as max_norm
-from keras.src.constraints.constraints import MinMaxNorm as MinMaxNorm
-from keras.src.constraints.constraints import MinMaxNorm as min_max_norm
-from keras.src.constraints.constraints import NonNeg as NonNeg
-from keras.src.constraints.constraints import NonNeg as non_neg
-from keras.src.constraints.constraints import UnitNorm as UnitNorm
-from keras.src.constraints.constraints import UnitNorm as unit_norm
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.constraints import deserialize as deserialize
+    from keras.src.constraints import get as get
+    from keras.src.constraints import serialize as serialize
+    from keras.src.constraints.constraints import Constraint as Constraint
+    from keras.src.constraints.constraints import MaxNorm as MaxNorm
+    from keras.src.constraints.constraints import MaxNorm as max_norm
+    from keras.src.constraints.constraints import MinMaxNorm as MinMaxNorm
+    from keras.src.constraints.constraints import MinMaxNorm as min_max_norm
+    from keras.src.constraints.constraints import NonNeg as NonNeg
+    from keras.src.constraints.constraints import NonNeg as non_neg
+    from keras.src.constraints.constraints import UnitNorm as UnitNorm
+    from keras.src.constraints.constraints import UnitNorm as unit_norm
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.constraints", "deserialize"),
+    "get": ("keras.src.constraints", "get"),
+    "serialize": ("keras.src.constraints", "serialize"),
+    "Constraint": ("keras.src.constraints.constraints", "Constraint"),
+    "MaxNorm": ("keras.src.constraints.constraints", "MaxNorm"),
+    "max_norm": ("keras.src.constraints.constraints", "MaxNorm"),
+    "MinMaxNorm": ("keras.src.constraints.constraints", "MinMaxNorm"),
+    "min_max_norm": ("keras.src.constraints.constraints", "MinMaxNorm"),
+    "NonNeg": ("keras.src.constraints.constraints", "NonNeg"),
+    "non_neg": ("keras.src.constraints.constraints", "NonNeg"),
+    "UnitNorm": ("keras.src.constraints.constraints", "UnitNorm"),
+    "unit_norm": ("keras.src.constraints.constraints", "UnitNorm"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
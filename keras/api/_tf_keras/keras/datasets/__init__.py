@@ -4,11 +4,45 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.datasets import boston_housing as boston_housing
-from keras.datasets import california_housing as california_housing
-from keras.datasets import cifar10 as cifar10
-from keras.datasets import cifar100 as cifar100
-from keras.datasets import fashion_mnist as fashion_mnist
-from keras.datasets import imdb as imdb
-from keras.datasets import mnist as mnist
-from keras.datasets import reuters as reuters
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.datasets import boston_housing as boston_housing
+    from keras.datasets import california_housing as california_housing
+    from keras.datasets import cifar10 as cifar10
+    from keras.datasets import cifar100 as cifar100
+    from keras.datasets import fashion_mnist as fashion_mnist
+    from keras.datasets import imdb as imdb
+    from keras.datasets import mnist as mnist
+    from keras.datasets import reuters as reuters
+
+_LAZY_ATTRIBUTES = {
+    "boston_housing": ("keras.datasets.boston_housing", None),
+    "california_housing": ("keras.datasets.california_housing", None),
+    "cifar10": ("keras.datasets.cifar10", None),
+    "cifar100": ("keras.datasets.cifar100", None),
+    "fashion_mnist": ("keras.datasets.fashion_mnist", None),
+    "imdb": ("keras.datasets.imdb", None),
+    "mnist": ("keras.datasets.mnist", None),
+    "reuters": ("keras.datasets.reuters", None),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,6 +4,35 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.datasets.reuters import get_label_names as get_label_names
-from keras.src.datasets.reuters import get_word_index as get_word_index
-from keras.src.datasets.reuters import load_data as load_data
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.datasets.reuters import get_label_names as get_label_names
+    from keras.src.datasets.reuters import get_word_index as get_word_index
+    from keras.src.datasets.reuters import load_data as load_data
+
+_LAZY_ATTRIBUTES = {
+    "get_label_names": ("keras.src.datasets.reuters", "get_label_names"),
+    "get_word_index": ("keras.src.datasets.reuters", "get_word_index"),
+    "load_data": ("keras.src.datasets.reuters", "load_data"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,78 +4,215 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.initializers import deserialize as deserialize
-from keras.src.initializers import get as get
-from keras.src.initializers import serialize as serialize
-from keras.src.initializers.constant_initializers import STFT as STFT
-from keras.src.initializers.constant_initializers import STFT as STFTInitializer
-from keras.src.initializers.constant_initializers import STFT as stft
-from keras.src.initializers.constant_initializers import Constant as Constant
-from keras.src.initializers.constant_initializers import Constant as constant
-from keras.src.initializers.constant_initializers import Identity as Identity
-from keras.src.initializers.constant_initializers import (
-    Identity as IdentityInitializer,
-)
-from keras.src.initializers.constant_initializers import Identity as identity
-from keras.src.initializers.constant_initializers import Ones as Ones
-from keras.src.initializers.constant_initializers import Ones as ones
-from keras.src.initializers.constant_initializers import Zeros as Zeros
-from keras.src.initializers.constant_initializers import Zeros as zeros
-from keras.src.initializers.initializer import Initializer as Initializer
-from keras.src.initializers.random_initializers import (
-    GlorotNormal as GlorotNormal,
-)
-from keras.src.initializers.random_initializers import (
-    GlorotNormal as glorot_normal,
-)
-from keras.src.initializers.random_initializers import (
-    GlorotUniform as GlorotUniform,
-)
-from keras.src.initializers.random_initializers import (
-    GlorotUniform as glorot_uniform,
-)
-from keras.src.initializers.random_initializers import HeNormal as HeNormal
-from keras.src.initializers.random_initializers import HeNormal as he_normal
-from keras.src.initializers.random_initializers import HeUniform as HeUniform
-from keras.src.initializers.random_initializers import HeUniform as he_uniform
-from keras.src.initializers.random_initializers import (
-    LecunNormal as LecunNormal,
-)
-from keras.src.initializers.random_initializers import (
-    LecunNormal as lecun_normal,
-)
-from keras.src.initializers.random_initializers import (
-    LecunUniform as LecunUniform,
-)
-from keras.src.initializers.random_initializers import (
-    LecunUniform as lecun_uniform,
-)
-from keras.src.initializers.random_initializers import Orthogonal as Orthogonal
-from keras.src.initializers.random_initializers import (
-    Orthogonal as OrthogonalInitializer,
-)
-from keras.src.initializers.random_initializers import Orthogonal as orthogonal
-from keras.src.initializers.random_initializers import (
-    RandomNormal as RandomNormal,
-)
-from keras.src.initializers.random_initializers import (
-    RandomNormal as random_normal,
-)
-from keras.src.initializers.random_initializers import (
-    RandomUniform as RandomUniform,
-)
-from keras.src.initializers.random_initializers import (
-    RandomUniform as random_uniform,
-)
-from keras.src.initializers.random_initializers import (
-    TruncatedNormal as TruncatedNormal,
-)
-from keras.src.initializers.random_initializers import (
-    TruncatedNormal as truncated_normal,
-)
-from keras.src.initializers.random_initializers import (
-    VarianceScaling as VarianceScaling,
-)
-from keras.src.initializers.random_initializers import (
-    VarianceScaling as variance_scaling,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.initializers import deserialize as deserialize
+    from keras.src.initializers import get as get
+    from keras.src.initializers import serialize as serialize
+    from keras.src.initializers.constant_initializers import STFT as STFT
+    from keras.src.initializers.constant_initializers import (
+        STFT as STFTInitializer,
+    )
+    from keras.src.initializers.constant_initializers import STFT as stft
+    from keras.src.initializers.constant_initializers import (
+        Constant as Constant,
+    )
+    from keras.src.initializers.constant_initializers import (
+        Constant as constant,
+    )
+    from keras.src.initializers.constant_initializers import (
+        Identity as Identity,
+    )
+    from keras.src.initializers.constant_initializers import (
+        Identity as IdentityInitializer,
+    )
+    from keras.src.initializers.constant_initializers import (
+        Identity as identity,
+    )
+    from keras.src.initializers.constant_initializers import Ones as Ones
+    from keras.src.initializers.constant_initializers import Ones as ones
+    from keras.src.initializers.constant_initializers import Zeros as Zeros
+    from keras.src.initializers.constant_initializers import Zeros as zeros
+    from keras.src.initializers.initializer import Initializer as Initializer
+    from keras.src.initializers.random_initializers import (
+        GlorotNormal as GlorotNormal,
+    )
+    from keras.src.initializers.random_initializers import (
+        GlorotNormal as glorot_normal,
+    )
+    from keras.src.initializers.random_initializers import (
+        GlorotUniform as GlorotUniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        GlorotUniform as glorot_uniform,
+    )
+    from keras.src.initializers.random_initializers import HeNormal as HeNormal
+    from keras.src.initializers.random_initializers import HeNormal as he_normal
+    from keras.src.initializers.random_initializers import (
+        HeUniform as HeUniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        HeUniform as he_uniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        LecunNormal as LecunNormal,
+    )
+    from keras.src.initializers.random_initializers import (
+        LecunNormal as lecun_normal,
+    )
+    from keras.src.initializers.random_initializers import (
+        LecunUniform as LecunUniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        LecunUniform as lecun_uniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        Orthogonal as Orthogonal,
+    )
+    from keras.src.initializers.random_initializers import (
+        Orthogonal as OrthogonalInitializer,
+    )
+    from keras.src.initializers.random_initializers import (
+        Orthogonal as orthogonal,
+    )
+    from keras.src.initializers.random_initializers import (
+        RandomNormal as RandomNormal,
+    )
+    from keras.src.initializers.random_initializers import (
+        RandomNormal as random_normal,
+    )
+    from keras.src.initializers.random_initializers import (
+        RandomUniform as RandomUniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        RandomUniform as random_uniform,
+    )
+    from keras.src.initializers.random_initializers import (
+        TruncatedNormal as TruncatedNormal,
+    )
+    from keras.src.initializers.random_initializers import (
+        TruncatedNormal as truncated_normal,
+    )
+    from keras.src.initializers.random_initializers import (
+        VarianceScaling as VarianceScaling,
+    )
+    from keras.src.initializers.random_initializers import (
+        VarianceScaling as variance_scaling,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.initializers", "deserialize"),
+    "get": ("keras.src.initializers", "get"),
+    "serialize": ("keras.src.initializers", "serialize"),
+    "STFT": ("keras.src.initializers.constant_initializers", "STFT"),
+    "STFTInitializer": ("keras.src.initializers.constant_initializers", "STFT"),
+    "stft": ("keras.src.initializers.constant_initializers", "STFT"),
+    "Constant": ("keras.src.initializers.constant_initializers", "Constant"),
+    "constant": ("keras.src.initializers.constant_initializers", "Constant"),
+    "Identity": ("keras.src.initializers.constant_initializers", "Identity"),
+    "IdentityInitializer": (
+        "keras.src.initializers.constant_initializers",
+        "Identity",
+    ),
+    "identity": ("keras.src.initializers.constant_initializers", "Identity"),
+    "Ones": ("keras.src.initializers.constant_initializers", "Ones"),
+    "ones": ("keras.src.initializers.constant_initializers", "Ones"),
+    "Zeros": ("keras.src.initializers.constant_initializers", "Zeros"),
+    "zeros": ("keras.src.initializers.constant_initializers", "Zeros"),
+    "Initializer": ("keras.src.initializers.initializer", "Initializer"),
+    "GlorotNormal": (
+        "keras.src.initializers.random_initializers",
+        "GlorotNormal",
+    ),
+    "glorot_normal": (
+        "keras.src.initializers.random_initializers",
+        "GlorotNormal",
+    ),
+    "GlorotUniform": (
+        "keras.src.initializers.random_initializers",
+        "GlorotUniform",
+    ),
+    "glorot_uniform": (
+        "keras.src.initializers.random_initializers",
+        "GlorotUniform",
+    ),
+    "HeNormal": ("keras.src.initializers.random_initializers", "HeNormal"),
+    "he_normal": ("keras.src.initializers.random_initializers", "HeNormal"),
+    "HeUniform": ("keras.src.initializers.random_initializers", "HeUniform"),
+    "he_uniform": ("keras.src.initializers.random_initializers", "HeUniform"),
+    "LecunNormal": (
+        "keras.src.initializers.random_initializers",
+        "LecunNormal",
+    ),
+    "lecun_normal": (
+        "keras.src.initializers.random_initializers",
+        "LecunNormal",
+    ),
+    "LecunUniform": (
+        "keras.src.initializers.random_initializers",
+        "LecunUniform",
+    ),
+    "lecun_uniform": (
+        "keras.src.initializers.random_initializers",
+        "LecunUniform",
+    ),
+    "Orthogonal": ("keras.src.initializers.random_initializers", "Orthogonal"),
+    "OrthogonalInitializer": (
+        "keras.src.initializers.random_initializers",
+        "Orthogonal",
+    ),
+    "orthogonal": ("keras.src.initializers.random_initializers", "Orthogonal"),
+    "RandomNormal": (
+        "keras.src.initializers.random_initializers",
+        "RandomNormal",
+    ),
+    "random_normal": (
+        "keras.src.initializers.random_initializers",
+        "RandomNormal",
+    ),
+    "RandomUniform": (
+        "keras.src.initializers.random_initializers",
+        "RandomUniform",
+    ),
+    "random_uniform": (
+        "keras.src.initializers.random_initializers",
+        "RandomUniform",
+    ),
+    "TruncatedNormal": (
+        "keras.src.initializers.random_initializers",
+        "TruncatedNormal",
+    ),
+    "truncated_normal": (
+        "keras.src.initializers.random_initializers",
+        "TruncatedNormal",
+    ),
+    "VarianceScaling": (
+        "keras.src.initializers.random_initializers",
+        "VarianceScaling",
+    ),
+    "variance_scaling": (
+        "keras.src.initializers.random_initializers",
+        "VarianceScaling",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,82 +4,203 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.legacy.losses import Reduction as Reduction
-from keras.src.losses import deserialize as deserialize
-from keras.src.losses import get as get
-from keras.src.losses import serialize as serialize
-from keras.src.losses.loss import Loss as Loss
-from keras.src.losses.losses import CTC as CTC
-from keras.src.losses.losses import BinaryCrossentropy as BinaryCrossentropy
-from keras.src.losses.losses import (
-    BinaryFocalCrossentropy as BinaryFocalCrossentropy,
-)
-from keras.src.losses.losses import (
-    CategoricalCrossentropy as CategoricalCrossentropy,
-)
-from keras.src.losses.losses import (
-    CategoricalFocalCrossentropy as CategoricalFocalCrossentropy,
-)
-from keras.src.losses.losses import (
-    CategoricalGeneralizedCrossEntropy as CategoricalGeneralizedCrossEntropy,
-)
-from keras.src.losses.losses import CategoricalHinge as CategoricalHinge
-from keras.src.losses.losses import Circle as Circle
-from keras.src.losses.losses import CosineSimilarity as CosineSimilarity
-from keras.src.losses.losses import Dice as Dice
-from keras.src.losses.losses import Hinge as Hinge
-from keras.src.losses.losses import Huber as Huber
-from keras.src.losses.losses import KLDivergence as KLDivergence
-from keras.src.losses.losses import LogCosh as LogCosh
-from keras.src.losses.losses import MeanAbsoluteError as MeanAbsoluteError
-from keras.src.losses.losses import (
-    MeanAbsolutePercentageError as MeanAbsolutePercentageError,
-)
-from keras.src.losses.losses import MeanSquaredError as MeanSquaredError
-from keras.src.losses.losses import (
-    MeanSquaredLogarithmicError as MeanSquaredLogarithmicError,
-)
-from keras.src.losses.losses import Poisson as Poisson
-from keras.src.losses.losses import (
-    SparseCategoricalCrossentropy as SparseCategoricalCrossentropy,
-)
-from keras.src.losses.losses import SquaredHinge as SquaredHinge
-from keras.src.losses.losses import Tversky as Tversky
-from keras.src.losses.losses import binary_crossentropy as binary_crossentropy
-from keras.src.losses.losses import (
-    binary_focal_crossentropy as binary_focal_crossentropy,
-)
-from keras.src.losses.losses import (
-    categorical_crossentropy as categorical_crossentropy,
-)
-from keras.src.losses.losses import (
-    categorical_focal_crossentropy as categorical_focal_crossentropy,
-)
-from keras.src.losses.losses import (
-    categorical_generalized_cross_entropy as categorical_generalized_cross_entropy,
-)
-from keras.src.losses.losses import categorical_hinge as categorical_hinge
-from keras.src.losses.losses import circle as circle
-from keras.src.losses.losses import cosine_similarity as cosine_similarity
-from keras.src.losses.losses import ctc as ctc
-from keras.src.losses.losses import dice as dice
-from keras.src.losses.losses import hinge as hinge
-from keras.src.losses.losses import huber as huber
-from keras.src.losses.losses import kl_divergence as KLD
-from keras.src.losses.losses import kl_divergence as kld
-from keras.src.losses.losses import kl_divergence as kullback_leibler_divergence
-from keras.src.losses.losses import log_cosh as logcosh
-from keras.src.losses.losses import mean_absolute_error as MAE
-from keras.src.losses.losses import mean_absolute_error as mae
-from keras.src.losses.losses import mean_absolute_percentage_error as MAPE
-from keras.src.losses.losses import mean_absolute_percentage_error as mape
-from keras.src.losses.losses import mean_squared_error as MSE
-from keras.src.losses.losses import mean_squared_error as mse
-from keras.src.losses.losses import mean_squared_logarithmic_error as MSLE
-from keras.src.losses.losses import mean_squared_logarithmic_error as msle
-from keras.src.losses.losses import poisson as poisson
-from keras.src.losses.losses import (
-    sparse_categorical_crossentropy as sparse_categorical_crossentropy,
-)
-from keras.src.losses.losses import squared_hinge as squared_hinge
-from keras.src.losses.losses import tversky as tversky
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.legacy.losses import Reduction as Reduction
+    from keras.src.losses import deserialize as deserialize
+    from keras.src.losses import get as get
+    from keras.src.losses import serialize as serialize
+    from keras.src.losses.loss import Loss as Loss
+    from keras.src.losses.losses import CTC as CTC
+    from keras.src.losses.losses import BinaryCrossentropy as BinaryCrossentropy
+    from keras.src.losses.losses import (
+        BinaryFocalCrossentropy as BinaryFocalCrossentropy,
+    )
+    from keras.src.losses.losses import (
+        CategoricalCrossentropy as CategoricalCrossentropy,
+    )
+    from keras.src.losses.losses import (
+        CategoricalFocalCrossentropy as CategoricalFocalCrossentropy,
+    )
+    from keras.src.losses.losses import (
+        CategoricalGeneralizedCrossEntropy as CategoricalGeneralizedCrossEntropy,
+    )
+    from keras.src.losses.losses import CategoricalHinge as CategoricalHinge
+    from keras.src.losses.losses import Circle as Circle
+    from keras.src.losses.losses import CosineSimilarity as CosineSimilarity
+    from keras.src.losses.losses import Dice as Dice
+    from keras.src.losses.losses import Hinge as Hinge
+    from keras.src.losses.losses import Huber as Huber
+    from keras.src.losses.losses import KLDivergence as KLDivergence
+    from keras.src.losses.losses import LogCosh as LogCosh
+    from keras.src.losses.losses import MeanAbsoluteError as MeanAbsoluteError
+    from keras.src.losses.losses import (
+        MeanAbsolutePercentageError as MeanAbsolutePercentageError,
+    )
+    from keras.src.losses.losses import MeanSquaredError as MeanSquaredError
+    from keras.src.losses.losses import (
+        MeanSquaredLogarithmicError as MeanSquaredLogarithmicError,
+    )
+    from keras.src.losses.losses import Poisson as Poisson
+    from keras.src.losses.losses import (
+        SparseCategoricalCrossentropy as SparseCategoricalCrossentropy,
+    )
+    from keras.src.losses.losses import SquaredHinge as SquaredHinge
+    from keras.src.losses.losses import Tversky as Tversky
+    from keras.src.losses.losses import (
+        binary_crossentropy as binary_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        binary_focal_crossentropy as binary_focal_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        categorical_crossentropy as categorical_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        categorical_focal_crossentropy as categorical_focal_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        categorical_generalized_cross_entropy as categorical_generalized_cross_entropy,
+    )
+    from keras.src.losses.losses import categorical_hinge as categorical_hinge
+    from keras.src.losses.losses import circle as circle
+    from keras.src.losses.losses import cosine_similarity as cosine_similarity
+    from keras.src.losses.losses import ctc as ctc
+    from keras.src.losses.losses import dice as dice
+    from keras.src.losses.losses import hinge as hinge
+    from keras.src.losses.losses import huber as huber
+    from keras.src.losses.losses import kl_divergence as KLD
+    from keras.src.losses.losses import kl_divergence as kld
+    from keras.src.losses.losses import (
+        kl_divergence as kullback_leibler_divergence,
+    )
+    from keras.src.losses.losses import log_cosh as logcosh
+    from keras.src.losses.losses import mean_absolute_error as MAE
+    from keras.src.losses.losses import mean_absolute_error as mae
+    from keras.src.losses.losses import mean_absolute_percentage_error as MAPE
+    from keras.src.losses.losses import mean_absolute_percentage_error as mape
+    from keras.src.losses.losses import mean_squared_error as MSE
+    from keras.src.losses.losses import mean_squared_error as mse
+    from keras.src.losses.losses import mean_squared_logarithmic_error as MSLE
+    from keras.src.losses.losses import mean_squared_logarithmic_error as msle
+    from keras.src.losses.losses import poisson as poisson
+    from keras.src.losses.losses import (
+        sparse_categorical_crossentropy as sparse_categorical_crossentropy,
+    )
+    from keras.src.losses.losses import squared_hinge as squared_hinge
+    from keras.src.losses.losses import tversky as tversky
+
+_LAZY_ATTRIBUTES = {
+    "Reduction": ("keras.src.legacy.losses", "Reduction"),
+    "deserialize": ("keras.src.losses", "deserialize"),
+    "get": ("keras.src.losses", "get"),
+    "serialize": ("keras.src.losses", "serialize"),
+    "Loss": ("keras.src.losses.loss", "Loss"),
+    "CTC": ("keras.src.losses.losses", "CTC"),
+    "BinaryCrossentropy": ("keras.src.losses.losses", "BinaryCrossentropy"),
+    "BinaryFocalCrossentropy": (
+        "keras.src.losses.losses",
+        "BinaryFocalCrossentropy",
+    ),
+    "CategoricalCrossentropy": (
+        "keras.src.losses.losses",
+        "CategoricalCrossentropy",
+    ),
+    "CategoricalFocalCrossentropy": (
+        "keras.src.losses.losses",
+        "CategoricalFocalCrossentropy",
+    ),
+    "CategoricalGeneralizedCrossEntropy": (
+        "keras.src.losses.losses",
+        "CategoricalGeneralizedCrossEntropy",
+    ),
+    "CategoricalHinge": ("keras.src.losses.losses", "CategoricalHinge"),
+    "Circle": ("keras.src.losses.losses", "Circle"),
+    "CosineSimilarity": ("keras.src.losses.losses", "CosineSimilarity"),
+    "Dice": ("keras.src.losses.losses", "Dice"),
+    "Hinge": ("keras.src.losses.losses", "Hinge"),
+    "Huber": ("keras.src.losses.losses", "Huber"),
+    "KLDivergence": ("keras.src.losses.losses", "KLDivergence"),
+    "LogCosh": ("keras.src.losses.losses", "LogCosh"),
+    "MeanAbsoluteError": ("keras.src.losses.losses", "MeanAbsoluteError"),
+    "MeanAbsolutePercentageError": (
+        "keras.src.losses.losses",
+        "MeanAbsolutePercentageError",
+    ),
+    "MeanSquaredError": ("keras.src.losses.losses", "MeanSquaredError"),
+    "MeanSquaredLogarithmicError": (
+        "keras.src.losses.losses",
+        "MeanSquaredLogarithmicError",
+    ),
+    "Poisson": ("keras.src.losses.losses", "Poisson"),
+    "SparseCategoricalCrossentropy": (
+        "keras.src.losses.losses",
+        "SparseCategoricalCrossentropy",
+    ),
+    "SquaredHinge": ("keras.src.losses.losses", "SquaredHinge"),
+    "Tversky": ("keras.src.losses.losses", "Tversky"),
+    "binary_crossentropy": ("keras.src.losses.losses", "binary_crossentropy"),
+    "binary_focal_crossentropy": (
+        "keras.src.losses.losses",
+        "binary_focal_crossentropy",
+    ),
+    "categorical_crossentropy": (
+        "keras.src.losses.losses",
+        "categorical_crossentropy",
+    ),
+    "categorical_focal_crossentropy": (
+        "keras.src.losses.losses",
+        "categorical_focal_crossentropy",
+    ),
+    "categorical_generalized_cross_entropy": (
+        "keras.src.losses.losses",
+        "categorical_generalized_cross_entropy",
+    ),
+    "categorical_hinge": ("keras.src.losses.losses", "categorical_hinge"),
+    "circle": ("keras.src.losses.losses", "circle"),
+    "cosine_similarity": ("keras.src.losses.losses", "cosine_similarity"),
+    "ctc": ("keras.src.losses.losses", "ctc"),
+    "dice": ("keras.src.losses.losses", "dice"),
+    "hinge": ("keras.src.losses.losses", "hinge"),
+    "huber": ("keras.src.losses.losses", "huber"),
+    "KLD": ("keras.src.losses.losses", "kl_divergence"),
+    "kld": ("keras.src.losses.losses", "kl_divergence"),
+    "kullback_leibler_divergence": ("keras.src.losses.losses", "kl_divergence"),
+    "logcosh": ("keras.src.losses.losses", "log_cosh"),
+    "MAE": ("keras.src.losses.losses", "mean_absolute_error"),
+    "mae": ("keras.src.losses.losses", "mean_absolute_error"),
+    "MAPE": ("keras.src.losses.losses", "mean_absolute_percentage_error"),
+    "mape": ("keras.src.losses.losses", "mean_absolute_percentage_error"),
+    "MSE": ("keras.src.losses.losses", "mean_squared_error"),
+    "mse": ("keras.src.losses.losses", "mean_squared_error"),
+    "MSLE": ("keras.src.losses.losses", "mean_squared_logarithmic_error"),
+    "msle": ("keras.src.losses.losses", "mean_squared_logarithmic_error"),
+    "poisson": ("keras.src.losses.losses", "poisson"),
+    "sparse_categorical_crossentropy": (
+        "keras.src.losses.losses",
+        "sparse_categorical_crossentropy",
+    ),
+    "squared_hinge": ("keras.src.losses.losses", "squared_hinge"),
+    "tversky": ("keras.src.losses.losses", "tversky"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,16 +4,62 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
-from keras.src.dtype_policies.dtype_policy import DTypePolicy as Policy
-from keras.src.dtype_policies.dtype_policy import dtype_policy as dtype_policy
-from keras.src.dtype_policies.dtype_policy import dtype_policy as global_policy
-from keras.src.dtype_policies.dtype_policy import (
-    set_dtype_policy as set_dtype_policy,
-)
-from keras.src.dtype_policies.dtype_policy import (
-    set_dtype_policy as set_global_policy,
-)
-from keras.src.optimizers.loss_scale_optimizer import (
-    LossScaleOptimizer as LossScaleOptimizer,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
+    from keras.src.dtype_policies.dtype_policy import DTypePolicy as Policy
+    from keras.src.dtype_policies.dtype_policy import (
+        dtype_policy as dtype_policy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        dtype_policy as global_policy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        set_dtype_policy as set_dtype_policy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        set_dtype_policy as set_global_policy,
+    )
+    from keras.src.optimizers.loss_scale_optimizer import (
+        LossScaleOptimizer as LossScaleOptimizer,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "DTypePolicy": ("keras.src.dtype_policies.dtype_policy", "DTypePolicy"),
+    "Policy": ("keras.src.dtype_policies.dtype_policy", "DTypePolicy"),
+    "dtype_policy": ("keras.src.dtype_policies.dtype_policy", "dtype_policy"),
+    "global_policy": ("keras.src.dtype_policies.dtype_policy", "dtype_policy"),
+    "set_dtype_policy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "set_dtype_policy",
+    ),
+    "set_global_policy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "set_dtype_policy",
+    ),
+    "LossScaleOptimizer": (
+        "keras.src.optimizers.loss_scale_optimizer",
+        "LossScaleOptimizer",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,9 +4,43 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.models.cloning import clone_model as clone_model
-from keras.src.models.model import Model as Model
-from keras.src.models.model import model_from_json as model_from_json
-from keras.src.models.sequential import Sequential as Sequential
-from keras.src.saving.saving_api import load_model as load_model
-from keras.src.saving.saving_api import save_model as save_model
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.models.cloning import clone_model as clone_model
+    from keras.src.models.model import Model as Model
+    from keras.src.models.model import model_from_json as model_from_json
+    from keras.src.models.sequential import Sequential as Sequential
+    from keras.src.models.streaming import StreamingModel as StreamingModel
+    from keras.src.saving.saving_api import load_model as load_model
+    from keras.src.saving.saving_api import save_model as save_model
+
+_LAZY_ATTRIBUTES = {
+    "clone_model": ("keras.src.models.cloning", "clone_model"),
+    "Model": ("keras.src.models.model", "Model"),
+    "model_from_json": ("keras.src.models.model", "model_from_json"),
+    "Sequential": ("keras.src.models.sequential", "Sequential"),
+    "StreamingModel": ("keras.src.models.streaming", "StreamingModel"),
+    "load_model": ("keras.src.saving.saving_api", "load_model"),
+    "save_model": ("keras.src.saving.saving_api", "save_model"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,17 +4,57 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.ops.linalg import cholesky as cholesky
-from keras.src.ops.linalg import cholesky_inverse as cholesky_inverse
-from keras.src.ops.linalg import det as det
-from keras.src.ops.linalg import eig as eig
-from keras.src.ops.linalg import eigh as eigh
-from keras.src.ops.linalg import inv as inv
-from keras.src.ops.linalg import jvp as jvp
-from keras.src.ops.linalg import lstsq as lstsq
-from keras.src.ops.linalg import lu_factor as lu_factor
-from keras.src.ops.linalg import norm as norm
-from keras.src.ops.linalg import qr as qr
-from keras.src.ops.linalg import solve as solve
-from keras.src.ops.linalg import solve_triangular as solve_triangular
-from keras.src.ops.linalg import svd as svd
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.ops.linalg import cholesky as cholesky
+    from keras.src.ops.linalg import cholesky_inverse as cholesky_inverse
+    from keras.src.ops.linalg import det as det
+    from keras.src.ops.linalg import eig as eig
+    from keras.src.ops.linalg import eigh as eigh
+    from keras.src.ops.linalg import inv as inv
+    from keras.src.ops.linalg import jvp as jvp
+    from keras.src.ops.linalg import lstsq as lstsq
+    from keras.src.ops.linalg import lu_factor as lu_factor
+    from keras.src.ops.linalg import norm as norm
+    from keras.src.ops.linalg import qr as qr
+    from keras.src.ops.linalg import solve as solve
+    from keras.src.ops.linalg import solve_triangular as solve_triangular
+    from keras.src.ops.linalg import svd as svd
+
+_LAZY_ATTRIBUTES = {
+    "cholesky": ("keras.src.ops.linalg", "cholesky"),
+    "cholesky_inverse": ("keras.src.ops.linalg", "cholesky_inverse"),
+    "det": ("keras.src.ops.linalg", "det"),
+    "eig": ("keras.src.ops.linalg", "eig"),
+    "eigh": ("keras.src.ops.linalg", "eigh"),
+    "inv": ("keras.src.ops.linalg", "inv"),
+    "jvp": ("keras.src.ops.linalg", "jvp"),
+    "lstsq": ("keras.src.ops.linalg", "lstsq"),
+    "lu_factor": ("keras.src.ops.linalg", "lu_factor"),
+    "norm": ("keras.src.ops.linalg", "norm"),
+    "qr": ("keras.src.ops.linalg", "qr"),
+    "solve": ("keras.src.ops.linalg", "solve"),
+    "solve_triangular": ("keras.src.ops.linalg", "solve_triangular"),
+    "svd": ("keras.src.ops.linalg", "svd"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
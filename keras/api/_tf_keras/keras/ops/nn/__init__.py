@@ -4,59 +4,143 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.ops.nn import adaptive_average_pool as adaptive_average_pool
-from keras.src.ops.nn import adaptive_max_pool as adaptive_max_pool
-from keras.src.ops.nn import average_pool as average_pool
-from keras.src.ops.nn import batch_normalization as batch_normalization
-from keras.src.ops.nn import binary_crossentropy as binary_crossentropy
-from keras.src.ops.nn import (
-    categorical_crossentropy as categorical_crossentropy,
-)
-from keras.src.ops.nn import celu as celu
-from keras.src.ops.nn import conv as conv
-from keras.src.ops.nn import conv_transpose as conv_transpose
-from keras.src.ops.nn import ctc_decode as ctc_decode
-from keras.src.ops.nn import ctc_loss as ctc_loss
-from keras.src.ops.nn import depthwise_conv as depthwise_conv
-from keras.src.ops.nn import dot_product_attention as dot_product_attention
-from keras.src.ops.nn import elu as elu
-from keras.src.ops.nn import gelu as gelu
-from keras.src.ops.nn import glu as glu
-from keras.src.ops.nn import hard_shrink as hard_shrink
-from keras.src.ops.nn import hard_sigmoid as hard_sigmoid
-from keras.src.ops.nn import hard_silu as hard_silu
-from keras.src.ops.nn import hard_silu as hard_swish
-from keras.src.ops.nn import hard_tanh as hard_tanh
-from keras.src.ops.nn import layer_normalization as layer_normalization
-from keras.src.ops.nn import leaky_relu as leaky_relu
-from keras.src.ops.nn import log_sigmoid as log_sigmoid
-from keras.src.ops.nn import log_softmax as log_softmax
-from keras.src.ops.nn import max_pool as max_pool
-from keras.src.ops.nn import moments as moments
-from keras.src.ops.nn import multi_hot as multi_hot
-from keras.src.ops.nn import normalize as normalize
-from keras.src.ops.nn import one_hot as one_hot
-from keras.src.ops.nn import polar as polar
-from keras.src.ops.nn import psnr as psnr
-from keras.src.ops.nn import relu as relu
-from keras.src.ops.nn import relu6 as relu6
-from keras.src.ops.nn import rms_normalization as rms_normalization
-from keras.src.ops.nn import selu as selu
-from keras.src.ops.nn import separable_conv as separable_conv
-from keras.src.ops.nn import sigmoid as sigmoid
-from keras.src.ops.nn import silu as silu
-from keras.src.ops.nn import silu as swish
-from keras.src.ops.nn import soft_shrink as soft_shrink
-from keras.src.ops.nn import softmax as softmax
-from keras.src.ops.nn import softplus as softplus
-from keras.src.ops.nn import softsign as softsign
-from keras.src.ops.nn import (
-    sparse_categorical_crossentropy as sparse_categorical_crossentropy,
-)
-from keras.src.ops.nn import sparse_plus as sparse_plus
-from keras.src.ops.nn import sparse_sigmoid as sparse_sigmoid
-from keras.src.ops.nn import sparsemax as sparsemax
-from keras.src.ops.nn import squareplus as squareplus
-from keras.src.ops.nn import tanh_shrink as tanh_shrink
-from keras.src.ops.nn import threshold as threshold
-from keras.src.ops.nn import unfold as unfold
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.ops.nn import adaptive_average_pool as adaptive_average_pool
+    from keras.src.ops.nn import adaptive_max_pool as adaptive_max_pool
+    from keras.src.ops.nn import average_pool as average_pool
+    from keras.src.ops.nn import batch_normalization as batch_normalization
+    from keras.src.ops.nn import binary_crossentropy as binary_crossentropy
+    from keras.src.ops.nn import (
+        categorical_crossentropy as categorical_crossentropy,
+    )
+    from keras.src.ops.nn import celu as celu
+    from keras.src.ops.nn import conv as conv
+    from keras.src.ops.nn import conv_transpose as conv_transpose
+    from keras.src.ops.nn import ctc_decode as ctc_decode
+    from keras.src.ops.nn import ctc_loss as ctc_loss
+    from keras.src.ops.nn import depthwise_conv as depthwise_conv
+    from keras.src.ops.nn import dot_product_attention as dot_product_attention
+    from keras.src.ops.nn import elu as elu
+    from keras.src.ops.nn import gelu as gelu
+    from keras.src.ops.nn import glu as glu
+    from keras.src.ops.nn import hard_shrink as hard_shrink
+    from keras.src.ops.nn import hard_sigmoid as hard_sigmoid
+    from keras.src.ops.nn import hard_silu as hard_silu
+    from keras.src.ops.nn import hard_silu as hard_swish
+    from keras.src.ops.nn import hard_tanh as hard_tanh
+    from keras.src.ops.nn import layer_normalization as layer_normalization
+    from keras.src.ops.nn import leaky_relu as leaky_relu
+    from keras.src.ops.nn import log_sigmoid as log_sigmoid
+    from keras.src.ops.nn import log_softmax as log_softmax
+    from keras.src.ops.nn import max_pool as max_pool
+    from keras.src.ops.nn import moments as moments
+    from keras.src.ops.nn import multi_hot as multi_hot
+    from keras.src.ops.nn import normalize as normalize
+    from keras.src.ops.nn import one_hot as one_hot
+    from keras.src.ops.nn import polar as polar
+    from keras.src.ops.nn import psnr as psnr
+    from keras.src.ops.nn import relu as relu
+    from keras.src.ops.nn import relu6 as relu6
+    from keras.src.ops.nn import rms_normalization as rms_normalization
+    from keras.src.ops.nn import selu as selu
+    from keras.src.ops.nn import separable_conv as separable_conv
+    from keras.src.ops.nn import sigmoid as sigmoid
+    from keras.src.ops.nn import silu as silu
+    from keras.src.ops.nn import silu as swish
+    from keras.src.ops.nn import soft_shrink as soft_shrink
+    from keras.src.ops.nn import softmax as softmax
+    from keras.src.ops.nn import softplus as softplus
+    from keras.src.ops.nn import softsign as softsign
+    from keras.src.ops.nn import (
+        sparse_categorical_crossentropy as sparse_categorical_crossentropy,
+    )
+    from keras.src.ops.nn import sparse_plus as sparse_plus
+    from keras.src.ops.nn import sparse_sigmoid as sparse_sigmoid
+    from keras.src.ops.nn import sparsemax as sparsemax
+    from keras.src.ops.nn import squareplus as squareplus
+    from keras.src.ops.nn import tanh_shrink as tanh_shrink
+    from keras.src.ops.nn import threshold as threshold
+    from keras.src.ops.nn import unfold as unfold
+
+_LAZY_ATTRIBUTES = {
+    "adaptive_average_pool": ("keras.src.ops.nn", "adaptive_average_pool"),
+    "adaptive_max_pool": ("keras.src.ops.nn", "adaptive_max_pool"),
+    "average_pool": ("keras.src.ops.nn", "average_pool"),
+    "batch_normalization": ("keras.src.ops.nn", "batch_normalization"),
+    "binary_crossentropy": ("keras.src.ops.nn", "binary_crossentropy"),
+    "categorical_crossentropy": (
+        "keras.src.ops.nn",
+        "categorical_crossentropy",
+    ),
+    "celu": ("keras.src.ops.nn", "celu"),
+    "conv": ("keras.src.ops.nn", "conv"),
+    "conv_transpose": ("keras.src.ops.nn", "conv_transpose"),
+    "ctc_decode": ("keras.src.ops.nn", "ctc_decode"),
+    "ctc_loss": ("keras.src.ops.nn", "ctc_loss"),
+    "depthwise_conv": ("keras.src.ops.nn", "depthwise_conv"),
+    "dot_product_attention": ("keras.src.ops.nn", "dot_product_attention"),
+    "elu": ("keras.src.ops.nn", "elu"),
+    "gelu": ("keras.src.ops.nn", "gelu"),
+    "glu": ("keras.src.ops.nn", "glu"),
+    "hard_shrink": ("keras.src.ops.nn", "hard_shrink"),
+    "hard_sigmoid": ("keras.src.ops.nn", "hard_sigmoid"),
+    "hard_silu": ("keras.src.ops.nn", "hard_silu"),
+    "hard_swish": ("keras.src.ops.nn", "hard_silu"),
+    "hard_tanh": ("keras.src.ops.nn", "hard_tanh"),
+    "layer_normalization": ("keras.src.ops.nn", "layer_normalization"),
+    "leaky_relu": ("keras.src.ops.nn", "leaky_relu"),
+    "log_sigmoid": ("keras.src.ops.nn", "log_sigmoid"),
+    "log_softmax": ("keras.src.ops.nn", "log_softmax"),
+    "max_pool": ("keras.src.ops.nn", "max_pool"),
+    "moments": ("keras.src.ops.nn", "moments"),
+    "multi_hot": ("keras.src.ops.nn", "multi_hot"),
+    "normalize": ("keras.src.ops.nn", "normalize"),
+    "one_hot": ("keras.src.ops.nn", "one_hot"),
+    "polar": ("keras.src.ops.nn", "polar"),
+    "psnr": ("keras.src.ops.nn", "psnr"),
+    "relu": ("keras.src.ops.nn", "relu"),
+    "relu6": ("keras.src.ops.nn", "relu6"),
+    "rms_normalization": ("keras.src.ops.nn", "rms_normalization"),
+    "selu": ("keras.src.ops.nn", "selu"),
+    "separable_conv": ("keras.src.ops.nn", "separable_conv"),
+    "sigmoid": ("keras.src.ops.nn", "sigmoid"),
+    "silu": ("keras.src.ops.nn", "silu"),
+    "swish": ("keras.src.ops.nn", "silu"),
+    "soft_shrink": ("keras.src.ops.nn", "soft_shrink"),
+    "softmax": ("keras.src.ops.nn", "softmax"),
+    "softplus": ("keras.src.ops.nn", "softplus"),
+    "softsign": ("keras.src.ops.nn", "softsign"),
+    "sparse_categorical_crossentropy": (
+        "keras.src.ops.nn",
+        "sparse_categorical_crossentropy",
+    ),
+    "sparse_plus": ("keras.src.ops.nn", "sparse_plus"),
+    "sparse_sigmoid": ("keras.src.ops.nn", "sparse_sigmoid"),
+    "sparsemax": ("keras.src.ops.nn", "sparsemax"),
+    "squareplus": ("keras.src.ops.nn", "squareplus"),
+    "tanh_shrink": ("keras.src.ops.nn", "tanh_shrink"),
+    "threshold": ("keras.src.ops.nn", "threshold"),
+    "unfold": ("keras.src.ops.nn", "unfold"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
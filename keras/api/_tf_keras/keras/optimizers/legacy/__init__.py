@@ -4,9 +4,41 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.optimizers import LegacyOptimizerWarning as Adagrad
-from keras.src.optimizers import LegacyOptimizerWarning as Adam
-from keras.src.optimizers import LegacyOptimizerWarning as Ftrl
-from keras.src.optimizers import LegacyOptimizerWarning as Optimizer
-from keras.src.optimizers import LegacyOptimizerWarning as RMSprop
-from keras.src.optimizers import LegacyOptimizerWarning as SGD
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.optimizers import LegacyOptimizerWarning as Adagrad
+    from keras.src.optimizers import LegacyOptimizerWarning as Adam
+    from keras.src.optimizers import LegacyOptimizerWarning as Ftrl
+    from keras.src.optimizers import LegacyOptimizerWarning as Optimizer
+    from keras.src.optimizers import LegacyOptimizerWarning as RMSprop
+    from keras.src.optimizers import LegacyOptimizerWarning as SGD
+
+_LAZY_ATTRIBUTES = {
+    "Adagrad": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+    "Adam": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+    "Ftrl": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+    "Optimizer": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+    "RMSprop": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+    "SGD": ("keras.src.optimizers", "LegacyOptimizerWarning"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,30 +4,92 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    CosineDecay as CosineDecay,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    CosineDecayRestarts as CosineDecayRestarts,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    ExponentialDecay as ExponentialDecay,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    InverseTimeDecay as InverseTimeDecay,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    LearningRateSchedule as LearningRateSchedule,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    PiecewiseConstantDecay as PiecewiseConstantDecay,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    PolynomialDecay as PolynomialDecay,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    deserialize as deserialize,
-)
-from keras.src.optimizers.schedules.learning_rate_schedule import (
-    serialize as serialize,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        CosineDecay as CosineDecay,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        CosineDecayRestarts as CosineDecayRestarts,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        ExponentialDecay as ExponentialDecay,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        InverseTimeDecay as InverseTimeDecay,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        LearningRateSchedule as LearningRateSchedule,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        PiecewiseConstantDecay as PiecewiseConstantDecay,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        PolynomialDecay as PolynomialDecay,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        deserialize as deserialize,
+    )
+    from keras.src.optimizers.schedules.learning_rate_schedule import (
+        serialize as serialize,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "CosineDecay": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "CosineDecay",
+    ),
+    "CosineDecayRestarts": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "CosineDecayRestarts",
+    ),
+    "ExponentialDecay": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "ExponentialDecay",
+    ),
+    "InverseTimeDecay": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "InverseTimeDecay",
+    ),
+    "LearningRateSchedule": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "LearningRateSchedule",
+    ),
+    "PiecewiseConstantDecay": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "PiecewiseConstantDecay",
+    ),
+    "PolynomialDecay": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "PolynomialDecay",
+    ),
+    "deserialize": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "deserialize",
+    ),
+    "serialize": (
+        "keras.src.optimizers.schedules.learning_rate_schedule",
+        "serialize",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
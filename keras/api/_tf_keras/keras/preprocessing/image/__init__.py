@@ -4,39 +4,114 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.legacy.preprocessing.image import (
-    DirectoryIterator as DirectoryIterator,
-)
-from keras.src.legacy.preprocessing.image import (
-    ImageDataGenerator as ImageDataGenerator,
-)
-from keras.src.legacy.preprocessing.image import Iterator as Iterator
-from keras.src.legacy.preprocessing.image import (
-    NumpyArrayIterator as NumpyArrayIterator,
-)
-from keras.src.legacy.preprocessing.image import (
-    apply_affine_transform as apply_affine_transform,
-)
-from keras.src.legacy.preprocessing.image import (
-    apply_brightness_shift as apply_brightness_shift,
-)
-from keras.src.legacy.preprocessing.image import (
-    apply_channel_shift as apply_channel_shift,
-)
-from keras.src.legacy.preprocessing.image import (
-    random_brightness as random_brightness,
-)
-from keras.src.legacy.preprocessing.image import (
-    random_channel_shift as random_channel_shift,
-)
-from keras.src.legacy.preprocessing.image import (
-    random_rotation as random_rotation,
-)
-from keras.src.legacy.preprocessing.image import random_shear as random_shear
-from keras.src.legacy.preprocessing.image import random_shift as random_shift
-from keras.src.legacy.preprocessing.image import random_zoom as random_zoom
-from keras.src.utils.image_utils import array_to_img as array_to_img
-from keras.src.utils.image_utils import img_to_array as img_to_array
-from keras.src.utils.image_utils import load_img as load_img
-from keras.src.utils.image_utils import save_img as save_img
-from keras.src.utils.image_utils import smart_resize as smart_resize
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.legacy.preprocessing.image import (
+        DirectoryIterator as DirectoryIterator,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        ImageDataGenerator as ImageDataGenerator,
+    )
+    from keras.src.legacy.preprocessing.image import Iterator as Iterator
+    from keras.src.legacy.preprocessing.image import (
+        NumpyArrayIterator as NumpyArrayIterator,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        apply_affine_transform as apply_affine_transform,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        apply_brightness_shift as apply_brightness_shift,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        apply_channel_shift as apply_channel_shift,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        random_brightness as random_brightness,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        random_channel_shift as random_channel_shift,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        random_rotation as random_rotation,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        random_shear as random_shear,
+    )
+    from keras.src.legacy.preprocessing.image import (
+        random_shift as random_shift,
+    )
+    from keras.src.legacy.preprocessing.image import random_zoom as random_zoom
+    from keras.src.utils.image_utils import array_to_img as array_to_img
+    from keras.src.utils.image_utils import img_to_array as img_to_array
+    from keras.src.utils.image_utils import load_img as load_img
+    from keras.src.utils.image_utils import save_img as save_img
+    from keras.src.utils.image_utils import smart_resize as smart_resize
+
+_LAZY_ATTRIBUTES = {
+    "DirectoryIterator": (
+        "keras.src.legacy.preprocessing.image",
+        "DirectoryIterator",
+    ),
+    "ImageDataGenerator": (
+        "keras.src.legacy.preprocessing.image",
+        "ImageDataGenerator",
+    ),
+    "Iterator": ("keras.src.legacy.preprocessing.image", "Iterator"),
+    "NumpyArrayIterator": (
+        "keras.src.legacy.preprocessing.image",
+        "NumpyArrayIterator",
+    ),
+    "apply_affine_transform": (
+        "keras.src.legacy.preprocessing.image",
+        "apply_affine_transform",
+    ),
+    "apply_brightness_shift": (
+        "keras.src.legacy.preprocessing.image",
+        "apply_brightness_shift",
+    ),
+    "apply_channel_shift": (
+        "keras.src.legacy.preprocessing.image",
+        "apply_channel_shift",
+    ),
+    "random_brightness": (
+        "keras.src.legacy.preprocessing.image",
+        "random_brightness",
+    ),
+    "random_channel_shift": (
+        "keras.src.legacy.preprocessing.image",
+        "random_channel_shift",
+    ),
+    "random_rotation": (
+        "keras.src.legacy.preprocessing.image",
+        "random_rotation",
+    ),
+    "random_shear": ("keras.src.legacy.preprocessing.image", "random_shear"),
+    "random_shift": ("keras.src.legacy.preprocessing.image", "random_shift"),
+    "random_zoom": ("keras.src.legacy.preprocessing.image", "random_zoom"),
+    "array_to_img": ("keras.src.utils.image_utils", "array_to_img"),
+    "img_to_array": ("keras.src.utils.image_utils", "img_to_array"),
+    "load_img": ("keras.src.utils.image_utils", "load_img"),
+    "save_img": ("keras.src.utils.image_utils", "save_img"),
+    "smart_resize": ("keras.src.utils.image_utils", "smart_resize"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,11 +4,47 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.legacy.preprocessing.sequence import (
-    TimeseriesGenerator as TimeseriesGenerator,
-)
-from keras.src.legacy.preprocessing.sequence import (
-    make_sampling_table as make_sampling_table,
-)
-from keras.src.legacy.preprocessing.sequence import skipgrams as skipgrams
-from keras.src.utils.sequence_utils import pad_sequences as pad_sequences
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.legacy.preprocessing.sequence import (
+        TimeseriesGenerator as TimeseriesGenerator,
+    )
+    from keras.src.legacy.preprocessing.sequence import (
+        make_sampling_table as make_sampling_table,
+    )
+    from keras.src.legacy.preprocessing.sequence import skipgrams as skipgrams
+    from keras.src.utils.sequence_utils import pad_sequences as pad_sequences
+
+_LAZY_ATTRIBUTES = {
+    "TimeseriesGenerator": (
+        "keras.src.legacy.preprocessing.sequence",
+        "TimeseriesGenerator",
+    ),
+    "make_sampling_table": (
+        "keras.src.legacy.preprocessing.sequence",
+        "make_sampling_table",
+    ),
+    "skipgrams": ("keras.src.legacy.preprocessing.sequence", "skipgrams"),
+    "pad_sequences": ("keras.src.utils.sequence_utils", "pad_sequences"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,12 +4,51 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.legacy.preprocessing.text import Tokenizer as Tokenizer
-from keras.src.legacy.preprocessing.text import hashing_trick as hashing_trick
-from keras.src.legacy.preprocessing.text import one_hot as one_hot
-from keras.src.legacy.preprocessing.text import (
-    text_to_word_sequence as text_to_word_sequence,
-)
-from keras.src.legacy.preprocessing.text import (
-    tokenizer_from_json as tokenizer_from_json,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.legacy.preprocessing.text import Tokenizer as Tokenizer
+    from keras.src.legacy.preprocessing.text import (
+        hashing_trick as hashing_trick,
+    )
+    from keras.src.legacy.preprocessing.text import one_hot as one_hot
+    from keras.src.legacy.preprocessing.text import (
+        text_to_word_sequence as text_to_word_sequence,
+    )
+    from keras.src.legacy.preprocessing.text import (
+        tokenizer_from_json as tokenizer_from_json,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "Tokenizer": ("keras.src.legacy.preprocessing.text", "Tokenizer"),
+    "hashing_trick": ("keras.src.legacy.preprocessing.text", "hashing_trick"),
+    "one_hot": ("keras.src.legacy.preprocessing.text", "one_hot"),
+    "text_to_word_sequence": (
+        "keras.src.legacy.preprocessing.text",
+        "text_to_word_sequence",
+    ),
+    "tokenizer_from_json": (
+        "keras.src.legacy.preprocessing.text",
+        "tokenizer_from_json",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,14 +4,51 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.random.random import beta as beta
-from keras.src.random.random import binomial as binomial
-from keras.src.random.random import categorical as categorical
-from keras.src.random.random import dropout as dropout
-from keras.src.random.random import gamma as gamma
-from keras.src.random.random import normal as normal
-from keras.src.random.random import randint as randint
-from keras.src.random.random import shuffle as shuffle
-from keras.src.random.random import truncated_normal as truncated_normal
-from keras.src.random.random import uniform as uniform
-from keras.src.random.seed_generator import SeedGenerator as SeedGenerator
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.random.random import beta as beta
+    from keras.src.random.random import binomial as binomial
+    from keras.src.random.random import categorical as categorical
+    from keras.src.random.random import dropout as dropout
+    from keras.src.random.random import gamma as gamma
+    from keras.src.random.random import normal as normal
+    from keras.src.random.random import randint as randint
+    from keras.src.random.random import shuffle as shuffle
+    from keras.src.random.random import truncated_normal as truncated_normal
+    from keras.src.random.random import uniform as uniform
+    from keras.src.random.seed_generator import SeedGenerator as SeedGenerator
+
+_LAZY_ATTRIBUTES = {
+    "beta": ("keras.src.random.random", "beta"),
+    "binomial": ("keras.src.random.random", "binomial"),
+    "categorical": ("keras.src.random.random", "categorical"),
+    "dropout": ("keras.src.random.random", "dropout"),
+    "gamma": ("keras.src.random.random", "gamma"),
+    "normal": ("keras.src.random.random", "normal"),
+    "randint": ("keras.src.random.random", "randint"),
+    "shuffle": ("keras.src.random.random", "shuffle"),
+    "truncated_normal": ("keras.src.random.random", "truncated_normal"),
+    "uniform": ("keras.src.random.random", "uniform"),
+    "SeedGenerator": ("keras.src.random.seed_generator", "SeedGenerator"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
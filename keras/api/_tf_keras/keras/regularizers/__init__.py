@@ -4,19 +4,63 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.regularizers import deserialize as deserialize
-from keras.src.regularizers import get as get
-from keras.src.regularizers import serialize as serialize
-from keras.src.regularizers.regularizers import L1 as L1
-from keras.src.regularizers.regularizers import L1 as l1
-from keras.src.regularizers.regularizers import L1L2 as L1L2
-from keras.src.regularizers.regularizers import L1L2 as l1_l2
-from keras.src.regularizers.regularizers import L2 as L2
-from keras.src.regularizers.regularizers import L2 as l2
-from keras.src.regularizers.regularizers import (
-    OrthogonalRegularizer as OrthogonalRegularizer,
-)
-from keras.src.regularizers.regularizers import (
-    OrthogonalRegularizer as orthogonal_regularizer,
-)
-from keras.src.regularizers.regularizers import Regularizer as Regularizer
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.regularizers import deserialize as deserialize
+    from keras.src.regularizers import get as get
+    from keras.src.regularizers import serialize as serialize
+    from keras.src.regularizers.regularizers import L1 as L1
+    from keras.src.regularizers.regularizers import L1 as l1
+    from keras.src.regularizers.regularizers import L1L2 as L1L2
+    from keras.src.regularizers.regularizers import L1L2 as l1_l2
+    from keras.src.regularizers.regularizers import L2 as L2
+    from keras.src.regularizers.regularizers import L2 as l2
+    from keras.src.regularizers.regularizers import (
+        OrthogonalRegularizer as OrthogonalRegularizer,
+    )
+    from keras.src.regularizers.regularizers import (
+        OrthogonalRegularizer as orthogonal_regularizer,
+    )
+    from keras.src.regularizers.regularizers import Regularizer as Regularizer
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.regularizers", "deserialize"),
+    "get": ("keras.src.regularizers", "get"),
+    "serialize": ("keras.src.regularizers", "serialize"),
+    "L1": ("keras.src.regularizers.regularizers", "L1"),
+    "l1": ("keras.src.regularizers.regularizers", "L1"),
+    "L1L2": ("keras.src.regularizers.regularizers", "L1L2"),
+    "l1_l2": ("keras.src.regularizers.regularizers", "L1L2"),
+    "L2": ("keras.src.regularizers.regularizers", "L2"),
+    "l2": ("keras.src.regularizers.regularizers", "L2"),
+    "OrthogonalRegularizer": (
+        "keras.src.regularizers.regularizers",
+        "OrthogonalRegularizer",
+    ),
+    "orthogonal_regularizer": (
+        "keras.src.regularizers.regularizers",
+        "OrthogonalRegularizer",
+    ),
+    "Regularizer": ("keras.src.regularizers.regularizers", "Regularizer"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
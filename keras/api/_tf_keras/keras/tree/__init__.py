@@ -4,17 +4,62 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.tree.tree_api import MAP_TO_NONE as MAP_TO_NONE
-from keras.src.tree.tree_api import assert_same_paths as assert_same_paths
-from keras.src.tree.tree_api import (
-    assert_same_structure as assert_same_structure,
-)
-from keras.src.tree.tree_api import flatten as flatten
-from keras.src.tree.tree_api import flatten_with_path as flatten_with_path
-from keras.src.tree.tree_api import is_nested as is_nested
-from keras.src.tree.tree_api import lists_to_tuples as lists_to_tuples
-from keras.src.tree.tree_api import map_shape_structure as map_shape_structure
-from keras.src.tree.tree_api import map_structure as map_structure
-from keras.src.tree.tree_api import map_structure_up_to as map_structure_up_to
-from keras.src.tree.tree_api import pack_sequence_as as pack_sequence_as
-from keras.src.tree.tree_api import traverse as traverse
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.tree.tree_api import MAP_TO_NONE as MAP_TO_NONE
+    from keras.src.tree.tree_api import assert_same_paths as assert_same_paths
+    from keras.src.tree.tree_api import (
+        assert_same_structure as assert_same_structure,
+    )
+    from keras.src.tree.tree_api import flatten as flatten
+    from keras.src.tree.tree_api import flatten_with_path as flatten_with_path
+    from keras.src.tree.tree_api import is_nested as is_nested
+    from keras.src.tree.tree_api import lists_to_tuples as lists_to_tuples
+    from keras.src.tree.tree_api import (
+        map_shape_structure as map_shape_structure,
+    )
+    from keras.src.tree.tree_api import map_structure as map_structure
+    from keras.src.tree.tree_api import (
+        map_structure_up_to as map_structure_up_to,
+    )
+    from keras.src.tree.tree_api import pack_sequence_as as pack_sequence_as
+    from keras.src.tree.tree_api import traverse as traverse
+
+_LAZY_ATTRIBUTES = {
+    "MAP_TO_NONE": ("keras.src.tree.tree_api", "MAP_TO_NONE"),
+    "assert_same_paths": ("keras.src.tree.tree_api", "assert_same_paths"),
+    "assert_same_structure": (
+        "keras.src.tree.tree_api",
+        "assert_same_structure",
+    ),
+    "flatten": ("keras.src.tree.tree_api", "flatten"),
+    "flatten_with_path": ("keras.src.tree.tree_api", "flatten_with_path"),
+    "is_nested": ("keras.src.tree.tree_api", "is_nested"),
+    "lists_to_tuples": ("keras.src.tree.tree_api", "lists_to_tuples"),
+    "map_shape_structure": ("keras.src.tree.tree_api", "map_shape_structure"),
+    "map_structure": ("keras.src.tree.tree_api", "map_structure"),
+    "map_structure_up_to": ("keras.src.tree.tree_api", "map_structure_up_to"),
+    "pack_sequence_as": ("keras.src.tree.tree_api", "pack_sequence_as"),
+    "traverse": ("keras.src.tree.tree_api", "traverse"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
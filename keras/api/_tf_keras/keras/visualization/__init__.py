@@ -4,18 +4,64 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.visualization.draw_bounding_boxes import (
-    draw_bounding_boxes as draw_bounding_boxes,
-)
-from keras.src.visualization.draw_segmentation_masks import (
-    draw_segmentation_masks as draw_segmentation_masks,
-)
-from keras.src.visualization.plot_bounding_box_gallery import (
-    plot_bounding_box_gallery as plot_bounding_box_gallery,
-)
-from keras.src.visualization.plot_image_gallery import (
-    plot_image_gallery as plot_image_gallery,
-)
-from keras.src.visualization.plot_segmentation_mask_gallery import (
-    plot_segmentation_mask_gallery as plot_segmentation_mask_gallery,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.visualization.draw_bounding_boxes import (
+        draw_bounding_boxes as draw_bounding_boxes,
+    )
+    from keras.src.visualization.draw_segmentation_masks import (
+        draw_segmentation_masks as draw_segmentation_masks,
+    )
+    from keras.src.visualization.plot_bounding_box_gallery import (
+        plot_bounding_box_gallery as plot_bounding_box_gallery,
+    )
+    from keras.src.visualization.plot_image_gallery import (
+        plot_image_gallery as plot_image_gallery,
+    )
+    from keras.src.visualization.plot_segmentation_mask_gallery import (
+        plot_segmentation_mask_gallery as plot_segmentation_mask_gallery,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "draw_bounding_boxes": (
+        "keras.src.visualization.draw_bounding_boxes",
+        "draw_bounding_boxes",
+    ),
+    "draw_segmentation_masks": (
+        "keras.src.visualization.draw_segmentation_masks",
+        "draw_segmentation_masks",
+    ),
+    "plot_bounding_box_gallery": (
+        "keras.src.visualization.plot_bounding_box_gallery",
+        "plot_bounding_box_gallery",
+    ),
+    "plot_image_gallery": (
+        "keras.src.visualization.plot_image_gallery",
+        "plot_image_gallery",
+    ),
+    "plot_segmentation_mask_gallery": (
+        "keras.src.visualization.plot_segmentation_mask_gallery",
+        "plot_segmentation_mask_gallery",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
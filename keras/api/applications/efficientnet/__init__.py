@@ -4,17 +4,75 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.applications.efficientnet import EfficientNetB0 as EfficientNetB0
-from keras.src.applications.efficientnet import EfficientNetB1 as EfficientNetB1
-from keras.src.applications.efficientnet import EfficientNetB2 as EfficientNetB2
-from keras.src.applications.efficientnet import EfficientNetB3 as EfficientNetB3
-from keras.src.applications.efficientnet import EfficientNetB4 as EfficientNetB4
-from keras.src.applications.efficientnet import EfficientNetB5 as EfficientNetB5
-from keras.src.applications.efficientnet import EfficientNetB6 as EfficientNetB6
-from keras.src.applications.efficientnet import EfficientNetB7 as EfficientNetB7
-from keras.src.applications.efficientnet import (
-    decode_predictions as decode_predictions,
-)
-from keras.src.applications.efficientnet import (
-    preprocess_input as preprocess_input,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.applications.efficientnet import (
+        EfficientNetB0 as EfficientNetB0,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB1 as EfficientNetB1,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB2 as EfficientNetB2,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB3 as EfficientNetB3,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB4 as EfficientNetB4,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB5 as EfficientNetB5,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB6 as EfficientNetB6,
+    )
+    from keras.src.applications.efficientnet import (
+        EfficientNetB7 as EfficientNetB7,
+    )
+    from keras.src.applications.efficientnet import (
+        decode_predictions as decode_predictions,
+    )
+    from keras.src.applications.efficientnet import (
+        preprocess_input as preprocess_input,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "EfficientNetB0": ("keras.src.applications.efficientnet", "EfficientNetB0"),
+    "EfficientNetB1": ("keras.src.applications.efficientnet", "EfficientNetB1"),
+    "EfficientNetB2": ("keras.src.applications.efficientnet", "EfficientNetB2"),
+    "EfficientNetB3": ("keras.src.applications.efficientnet", "EfficientNetB3"),
+    "EfficientNetB4": ("keras.src.applications.efficientnet", "EfficientNetB4"),
+    "EfficientNetB5": ("keras.src.applications.efficientnet", "EfficientNetB5"),
+    "EfficientNetB6": ("keras.src.applications.efficientnet", "EfficientNetB6"),
+    "EfficientNetB7": ("keras.src.applications.efficientnet", "EfficientNetB7"),
+    "decode_predictions": (
+        "keras.src.applications.efficientnet",
+        "decode_predictions",
+    ),
+    "preprocess_input": (
+        "keras.src.applications.efficientnet",
+        "preprocess_input",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
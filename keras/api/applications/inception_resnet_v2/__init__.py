@@ -4,12 +4,50 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.applications.inception_resnet_v2 import (
-    InceptionResNetV2 as InceptionResNetV2,
-)
-from keras.src.applications.inception_resnet_v2 import (
-    decode_predictions as decode_predictions,
-)
-from keras.src.applications.inception_resnet_v2 import (
-    preprocess_input as preprocess_input,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.applications.inception_resnet_v2 import (
+        InceptionResNetV2 as InceptionResNetV2,
+    )
+    from keras.src.applications.inception_resnet_v2 import (
+        decode_predictions as decode_predictions,
+    )
+    from keras.src.applications.inception_resnet_v2 import (
+        preprocess_input as preprocess_input,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "InceptionResNetV2": (
+        "keras.src.applications.inception_resnet_v2",
+        "InceptionResNetV2",
+    ),
+    "decode_predictions": (
+        "keras.src.applications.inception_resnet_v2",
+        "decode_predictions",
+    ),
+    "preprocess_input": (
+        "keras.src.applications.inception_resnet_v2",
+        "preprocess_input",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,23 +4,76 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.backend.common.dtypes import result_type as result_type
-from keras.src.backend.common.global_state import clear_session as clear_session
-from keras.src.backend.common.keras_tensor import (
-    is_keras_tensor as is_keras_tensor,
-)
-from keras.src.backend.common.variables import is_float_dtype as is_float_dtype
-from keras.src.backend.common.variables import is_int_dtype as is_int_dtype
-from keras.src.backend.common.variables import (
-    standardize_dtype as standardize_dtype,
-)
-from keras.src.backend.config import backend as backend
-from keras.src.backend.config import epsilon as epsilon
-from keras.src.backend.config import floatx as floatx
-from keras.src.backend.config import image_data_format as image_data_format
-from keras.src.backend.config import set_epsilon as set_epsilon
-from keras.src.backend.config import set_floatx as set_floatx
-from keras.src.backend.config import (
-    set_image_data_format as set_image_data_format,
-)
-from keras.src.utils.naming import get_uid as get_uid
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.backend.common.dtypes import result_type as result_type
+    from keras.src.backend.common.global_state import (
+        clear_session as clear_session,
+    )
+    from keras.src.backend.common.keras_tensor import (
+        is_keras_tensor as is_keras_tensor,
+    )
+    from keras.src.backend.common.variables import (
+        is_float_dtype as is_float_dtype,
+    )
+    from keras.src.backend.common.variables import is_int_dtype as is_int_dtype
+    from keras.src.backend.common.variables import (
+        standardize_dtype as standardize_dtype,
+    )
+    from keras.src.backend.config import backend as backend
+    from keras.src.backend.config import epsilon as epsilon
+    from keras.src.backend.config import floatx as floatx
+    from keras.src.backend.config import image_data_format as image_data_format
+    from keras.src.backend.config import set_epsilon as set_epsilon
+    from keras.src.backend.config import set_floatx as set_floatx
+    from keras.src.backend.config import (
+        set_image_data_format as set_image_data_format,
+    )
+    from keras.src.utils.naming import get_uid as get_uid
+
+_LAZY_ATTRIBUTES = {
+    "result_type": ("keras.src.backend.common.dtypes", "result_type"),
+    "clear_session": ("keras.src.backend.common.global_state", "clear_session"),
+    "is_keras_tensor": (
+        "keras.src.backend.common.keras_tensor",
+        "is_keras_tensor",
+    ),
+    "is_float_dtype": ("keras.src.backend.common.variables", "is_float_dtype"),
+    "is_int_dtype": ("keras.src.backend.common.variables", "is_int_dtype"),
+    "standardize_dtype": (
+        "keras.src.backend.common.variables",
+        "standardize_dtype",
+    ),
+    "backend": ("keras.src.backend.config", "backend"),
+    "epsilon": ("keras.src.backend.config", "epsilon"),
+    "floatx": ("keras.src.backend.config", "floatx"),
+    "image_data_format": ("keras.src.backend.config", "image_data_format"),
+    "set_epsilon": ("keras.src.backend.config", "set_epsilon"),
+    "set_floatx": ("keras.src.backend.config", "set_floatx"),
+    "set_image_data_format": (
+        "keras.src.backend.config",
+        "set_image_data_format",
+    ),
+    "get_uid": ("keras.src.utils.naming", "get_uid"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
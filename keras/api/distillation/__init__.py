@@ -4,13 +4,52 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.distillation.distillation_loss import (
-    DistillationLoss as DistillationLoss,
-)
-from keras.src.distillation.distillation_loss import (
-    FeatureDistillation as FeatureDistillation,
-)
-from keras.src.distillation.distillation_loss import (
-    LogitsDistillation as LogitsDistillation,
-)
-from keras.src.distillation.distiller import Distiller as Distiller
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.distillation.distillation_loss import (
+        DistillationLoss as DistillationLoss,
+    )
+    from keras.src.distillation.distillation_loss import (
+        FeatureDistillation as FeatureDistillation,
+    )
+    from keras.src.distillation.distillation_loss import (
+        LogitsDistillation as LogitsDistillation,
+    )
+    from keras.src.distillation.distiller import Distiller as Distiller
+
+_LAZY_ATTRIBUTES = {
+    "DistillationLoss": (
+        "keras.src.distillation.distillation_loss",
+        "DistillationLoss",
+    ),
+    "FeatureDistillation": (
+        "keras.src.distillation.distillation_loss",
+        "FeatureDistillation",
+    ),
+    "LogitsDistillation": (
+        "keras.src.distillation.distillation_loss",
+        "LogitsDistillation",
+    ),
+    "Distiller": ("keras.src.distillation.distiller", "Distiller"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,22 +4,94 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.distribution.distribution_lib import DataParallel as DataParallel
-from keras.src.distribution.distribution_lib import DeviceMesh as DeviceMesh
-from keras.src.distribution.distribution_lib import LayoutMap as LayoutMap
-from keras.src.distribution.distribution_lib import (
-    ModelParallel as ModelParallel,
-)
-from keras.src.distribution.distribution_lib import TensorLayout as TensorLayout
-from keras.src.distribution.distribution_lib import (
-    distribute_tensor as distribute_tensor,
-)
-from keras.src.distribution.distribution_lib import distribution as distribution
-from keras.src.distribution.distribution_lib import (
-    get_device_count as get_device_count,
-)
-from keras.src.distribution.distribution_lib import initialize as initialize
-from keras.src.distribution.distribution_lib import list_devices as list_devices
-from keras.src.distribution.distribution_lib import (
-    set_distribution as set_distribution,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.distribution.auto_sharding import (
+        ShardingPlan as ShardingPlan,
+    )
+    from keras.src.distribution.auto_sharding import (
+        plan_sharding as plan_sharding,
+    )
+    from keras.src.distribution.distribution_lib import (
+        DataParallel as DataParallel,
+    )
+    from keras.src.distribution.distribution_lib import DeviceMesh as DeviceMesh
+    from keras.src.distribution.distribution_lib import LayoutMap as LayoutMap
+    from keras.src.distribution.distribution_lib import (
+        ModelParallel as ModelParallel,
+    )
+    from keras.src.distribution.distribution_lib import (
+        PipelineParallel as PipelineParallel,
+    )
+    from keras.src.distribution.distribution_lib import (
+        TensorLayout as TensorLayout,
+    )
+    from keras.src.distribution.distribution_lib import (
+        distribute_tensor as distribute_tensor,
+    )
+    from keras.src.distribution.distribution_lib import (
+        distribution as distribution,
+    )
+    from keras.src.distribution.distribution_lib import (
+        get_device_count as get_device_count,
+    )
+    from keras.src.distribution.distribution_lib import initialize as initialize
+    from keras.src.distribution.distribution_lib import (
+        list_devices as list_devices,
+    )
+    from keras.src.distribution.distribution_lib import (
+        set_distribution as set_distribution,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "ShardingPlan": ("keras.src.distribution.auto_sharding", "ShardingPlan"),
+    "plan_sharding": ("keras.src.distribution.auto_sharding", "plan_sharding"),
+    "DataParallel": ("keras.src.distribution.distribution_lib", "DataParallel"),
+    "DeviceMesh": ("keras.src.distribution.distribution_lib", "DeviceMesh"),
+    "LayoutMap": ("keras.src.distribution.distribution_lib", "LayoutMap"),
+    "ModelParallel": (
+        "keras.src.distribution.distribution_lib",
+        "ModelParallel",
+    ),
+    "PipelineParallel": (
+        "keras.src.distribution.distribution_lib",
+        "PipelineParallel",
+    ),
+    "TensorLayout": ("keras.src.distribution.distribution_lib", "TensorLayout"),
+    "distribute_tensor": (
+        "keras.src.distribution.distribution_lib",
+        "distribute_tensor",
+    ),
+    "distribution": ("keras.src.distribution.distribution_lib", "distribution"),
+    "get_device_count": (
+        "keras.src.distribution.distribution_lib",
+        "get_device_count",
+    ),
+    "initialize": ("keras.src.distribution.distribution_lib", "initialize"),
+    "list_devices": ("keras.src.distribution.distribution_lib", "list_devices"),
+    "set_distribution": (
+        "keras.src.distribution.distribution_lib",
+        "set_distribution",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,22 +4,72 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.dtype_policies import deserialize as deserialize
-from keras.src.dtype_policies import get as get
-from keras.src.dtype_policies import serialize as serialize
-from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
-from keras.src.dtype_policies.dtype_policy import (
-    FloatDTypePolicy as FloatDTypePolicy,
-)
-from keras.src.dtype_policies.dtype_policy import (
-    GPTQDTypePolicy as GPTQDTypePolicy,
-)
-from keras.src.dtype_policies.dtype_policy import (
-    QuantizedDTypePolicy as QuantizedDTypePolicy,
-)
-from keras.src.dtype_policies.dtype_policy import (
-    QuantizedFloat8DTypePolicy as QuantizedFloat8DTypePolicy,
-)
-from keras.src.dtype_policies.dtype_policy_map import (
-    DTypePolicyMap as DTypePolicyMap,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.dtype_policies import deserialize as deserialize
+    from keras.src.dtype_policies import get as get
+    from keras.src.dtype_policies import serialize as serialize
+    from keras.src.dtype_policies.dtype_policy import DTypePolicy as DTypePolicy
+    from keras.src.dtype_policies.dtype_policy import (
+        FloatDTypePolicy as FloatDTypePolicy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        GPTQDTypePolicy as GPTQDTypePolicy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        QuantizedDTypePolicy as QuantizedDTypePolicy,
+    )
+    from keras.src.dtype_policies.dtype_policy import (
+        QuantizedFloat8DTypePolicy as QuantizedFloat8DTypePolicy,
+    )
+    from keras.src.dtype_policies.dtype_policy_map import (
+        DTypePolicyMap as DTypePolicyMap,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.dtype_policies", "deserialize"),
+    "get": ("keras.src.dtype_policies", "get"),
+    "serialize": ("keras.src.dtype_policies", "serialize"),
+    "DTypePolicy": ("keras.src.dtype_policies.dtype_policy", "DTypePolicy"),
+    "FloatDTypePolicy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "FloatDTypePolicy",
+    ),
+    "GPTQDTypePolicy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "GPTQDTypePolicy",
+    ),
+    "QuantizedDTypePolicy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "QuantizedDTypePolicy",
+    ),
+    "QuantizedFloat8DTypePolicy": (
+        "keras.src.dtype_policies.dtype_policy",
+        "QuantizedFloat8DTypePolicy",
+    ),
+    "DTypePolicyMap": (
+        "keras.src.dtype_policies.dtype_policy_map",
+        "DTypePolicyMap",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,141 +4,358 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.losses.losses import binary_crossentropy as binary_crossentropy
-from keras.src.losses.losses import (
-    binary_focal_crossentropy as binary_focal_crossentropy,
-)
-from keras.src.losses.losses import (
-    categorical_crossentropy as categorical_crossentropy,
-)
-from keras.src.losses.losses import (
-    categorical_focal_crossentropy as categorical_focal_crossentropy,
-)
-from keras.src.losses.losses import categorical_hinge as categorical_hinge
-from keras.src.losses.losses import hinge as hinge
-from keras.src.losses.losses import huber as huber
-from keras.src.losses.losses import kl_divergence as kl_divergence
-from keras.src.losses.losses import log_cosh as log_cosh
-from keras.src.losses.losses import mean_absolute_error as mean_absolute_error
-from keras.src.losses.losses import (
-    mean_absolute_percentage_error as mean_absolute_percentage_error,
-)
-from keras.src.losses.losses import mean_squared_error as mean_squared_error
-from keras.src.losses.losses import (
-    mean_squared_logarithmic_error as mean_squared_logarithmic_error,
-)
-from keras.src.losses.losses import poisson as poisson
-from keras.src.losses.losses import (
-    sparse_categorical_crossentropy as sparse_categorical_crossentropy,
-)
-from keras.src.losses.losses import squared_hinge as squared_hinge
-from keras.src.metrics import deserialize as deserialize
-from keras.src.metrics import get as get
-from keras.src.metrics import serialize as serialize
-from keras.src.metrics.accuracy_metrics import Accuracy as Accuracy
-from keras.src.metrics.accuracy_metrics import BinaryAccuracy as BinaryAccuracy
-from keras.src.metrics.accuracy_metrics import (
-    CategoricalAccuracy as CategoricalAccuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    SparseCategoricalAccuracy as SparseCategoricalAccuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    SparseTopKCategoricalAccuracy as SparseTopKCategoricalAccuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    TopKCategoricalAccuracy as TopKCategoricalAccuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    binary_accuracy as binary_accuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    categorical_accuracy as categorical_accuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    sparse_categorical_accuracy as sparse_categorical_accuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    sparse_top_k_categorical_accuracy as sparse_top_k_categorical_accuracy,
-)
-from keras.src.metrics.accuracy_metrics import (
-    top_k_categorical_accuracy as top_k_categorical_accuracy,
-)
-from keras.src.metrics.confusion_metrics import AUC as AUC
-from keras.src.metrics.confusion_metrics import FalseNegatives as FalseNegatives
-from keras.src.metrics.confusion_metrics import FalsePositives as FalsePositives
-from keras.src.metrics.confusion_metrics import Precision as Precision
-from keras.src.metrics.confusion_metrics import (
-    PrecisionAtRecall as PrecisionAtRecall,
-)
-from keras.src.metrics.confusion_metrics import Recall as Recall
-from keras.src.metrics.confusion_metrics import (
-    RecallAtPrecision as RecallAtPrecision,
-)
-from keras.src.metrics.confusion_metrics import (
-    SensitivityAtSpecificity as SensitivityAtSpecificity,
-)
-from keras.src.metrics.confusion_metrics import (
-    SpecificityAtSensitivity as SpecificityAtSensitivity,
-)
-from keras.src.metrics.confusion_metrics import TrueNegatives as TrueNegatives
-from keras.src.metrics.confusion_metrics import TruePositives as TruePositives
-from keras.src.metrics.correlation_metrics import (
-    ConcordanceCorrelation as ConcordanceCorrelation,
-)
-from keras.src.metrics.correlation_metrics import (
-    PearsonCorrelation as PearsonCorrelation,
-)
-from keras.src.metrics.correlation_metrics import (
-    concordance_correlation as concordance_correlation,
-)
-from keras.src.metrics.correlation_metrics import (
-    pearson_correlation as pearson_correlation,
-)
-from keras.src.metrics.f_score_metrics import F1Score as F1Score
-from keras.src.metrics.f_score_metrics import FBetaScore as FBetaScore
-from keras.src.metrics.hinge_metrics import CategoricalHinge as CategoricalHinge
-from keras.src.metrics.hinge_metrics import Hinge as Hinge
-from keras.src.metrics.hinge_metrics import SquaredHinge as SquaredHinge
-from keras.src.metrics.iou_metrics import BinaryIoU as BinaryIoU
-from keras.src.metrics.iou_metrics import IoU as IoU
-from keras.src.metrics.iou_metrics import MeanIoU as MeanIoU
-from keras.src.metrics.iou_metrics import OneHotIoU as OneHotIoU
-from keras.src.metrics.iou_metrics import OneHotMeanIoU as OneHotMeanIoU
-from keras.src.metrics.metric import Metric as Metric
-from keras.src.metrics.probabilistic_metrics import (
-    BinaryCrossentropy as BinaryCrossentropy,
-)
-from keras.src.metrics.probabilistic_metrics import (
-    CategoricalCrossentropy as CategoricalCrossentropy,
-)
-from keras.src.metrics.probabilistic_metrics import KLDivergence as KLDivergence
-from keras.src.metrics.probabilistic_metrics import Poisson as Poisson
-from keras.src.metrics.probabilistic_metrics import (
-    SparseCategoricalCrossentropy as SparseCategoricalCrossentropy,
-)
-from keras.src.metrics.reduction_metrics import Mean as Mean
-from keras.src.metrics.reduction_metrics import (
-    MeanMetricWrapper as MeanMetricWrapper,
-)
-from keras.src.metrics.reduction_metrics import Sum as Sum
-from keras.src.metrics.regression_metrics import (
-    CosineSimilarity as CosineSimilarity,
-)
-from keras.src.metrics.regression_metrics import LogCoshError as LogCoshError
-from keras.src.metrics.regression_metrics import (
-    MeanAbsoluteError as MeanAbsoluteError,
-)
-from keras.src.metrics.regression_metrics import (
-    MeanAbsolutePercentageError as MeanAbsolutePercentageError,
-)
-from keras.src.metrics.regression_metrics import (
-    MeanSquaredError as MeanSquaredError,
-)
-from keras.src.metrics.regression_metrics import (
-    MeanSquaredLogarithmicError as MeanSquaredLogarithmicError,
-)
-from keras.src.metrics.regression_metrics import R2Score as R2Score
-from keras.src.metrics.regression_metrics import (
-    RootMeanSquaredError as RootMeanSquaredError,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.losses.losses import (
+        binary_crossentropy as binary_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        binary_focal_crossentropy as binary_focal_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        categorical_crossentropy as categorical_crossentropy,
+    )
+    from keras.src.losses.losses import (
+        categorical_focal_crossentropy as categorical_focal_crossentropy,
+    )
+    from keras.src.losses.losses import categorical_hinge as categorical_hinge
+    from keras.src.losses.losses import hinge as hinge
+    from keras.src.losses.losses import huber as huber
+    from keras.src.losses.losses import kl_divergence as kl_divergence
+    from keras.src.losses.losses import log_cosh as log_cosh
+    from keras.src.losses.losses import (
+        mean_absolute_error as mean_absolute_error,
+    )
+    from keras.src.losses.losses import (
+        mean_absolute_percentage_error as mean_absolute_percentage_error,
+    )
+    from keras.src.losses.losses import mean_squared_error as mean_squared_error
+    from keras.src.losses.losses import (
+        mean_squared_logarithmic_error as mean_squared_logarithmic_error,
+    )
+    from keras.src.losses.losses import poisson as poisson
+    from keras.src.losses.losses import (
+        sparse_categorical_crossentropy as sparse_categorical_crossentropy,
+    )
+    from keras.src.losses.losses import squared_hinge as squared_hinge
+    from keras.src.metrics import deserialize as deserialize
+    from keras.src.metrics import get as get
+    from keras.src.metrics import serialize as serialize
+    from keras.src.metrics.accuracy_metrics import Accuracy as Accuracy
+    from keras.src.metrics.accuracy_metrics import (
+        BinaryAccuracy as BinaryAccuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        CategoricalAccuracy as CategoricalAccuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        SparseCategoricalAccuracy as SparseCategoricalAccuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        SparseTopKCategoricalAccuracy as SparseTopKCategoricalAccuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        TopKCategoricalAccuracy as TopKCategoricalAccuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        binary_accuracy as binary_accuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        categorical_accuracy as categorical_accuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        sparse_categorical_accuracy as sparse_categorical_accuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        sparse_top_k_categorical_accuracy as sparse_top_k_categorical_accuracy,
+    )
+    from keras.src.metrics.accuracy_metrics import (
+        top_k_categorical_accuracy as top_k_categorical_accuracy,
+    )
+    from keras.src.metrics.confusion_metrics import AUC as AUC
+    from keras.src.metrics.confusion_metrics import (
+        FalseNegatives as FalseNegatives,
+    )
+    from keras.src.metrics.confusion_metrics import (
+        FalsePositives as FalsePositives,
+    )
+    from keras.src.metrics.confusion_metrics import Precision as Precision
+    from keras.src.metrics.confusion_metrics import (
+        PrecisionAtRecall as PrecisionAtRecall,
+    )
+    from keras.src.metrics.confusion_metrics import Recall as Recall
+    from keras.src.metrics.confusion_metrics import (
+        RecallAtPrecision as RecallAtPrecision,
+    )
+    from keras.src.metrics.confusion_metrics import (
+        SensitivityAtSpecificity as SensitivityAtSpecificity,
+    )
+    from keras.src.metrics.confusion_metrics import (
+        SpecificityAtSensitivity as SpecificityAtSensitivity,
+    )
+    from keras.src.metrics.confusion_metrics import (
+        TrueNegatives as TrueNegatives,
+    )
+    from keras.src.metrics.confusion_metrics import (
+        TruePositives as TruePositives,
+    )
+    from keras.src.metrics.correlation_metrics import (
+        ConcordanceCorrelation as ConcordanceCorrelation,
+    )
+    from keras.src.metrics.correlation_metrics import (
+        PearsonCorrelation as PearsonCorrelation,
+    )
+    from keras.src.metrics.correlation_metrics import (
+        concordance_correlation as concordance_correlation,
+    )
+    from keras.src.metrics.correlation_metrics import (
+        pearson_correlation as pearson_correlation,
+    )
+    from keras.src.metrics.f_score_metrics import F1Score as F1Score
+    from keras.src.metrics.f_score_metrics import FBetaScore as FBetaScore
+    from keras.src.metrics.hinge_metrics import (
+        CategoricalHinge as CategoricalHinge,
+    )
+    from keras.src.metrics.hinge_metrics import Hinge as Hinge
+    from keras.src.metrics.hinge_metrics import SquaredHinge as SquaredHinge
+    from keras.src.metrics.iou_metrics import BinaryIoU as BinaryIoU
+    from keras.src.metrics.iou_metrics import IoU as IoU
+    from keras.src.metrics.iou_metrics import MeanIoU as MeanIoU
+    from keras.src.metrics.iou_metrics import OneHotIoU as OneHotIoU
+    from keras.src.metrics.iou_metrics import OneHotMeanIoU as OneHotMeanIoU
+    from keras.src.metrics.metric import Metric as Metric
+    from keras.src.metrics.probabilistic_metrics import (
+        BinaryCrossentropy as BinaryCrossentropy,
+    )
+    from keras.src.metrics.probabilistic_metrics import (
+        CategoricalCrossentropy as CategoricalCrossentropy,
+    )
+    from keras.src.metrics.probabilistic_metrics import (
+        KLDivergence as KLDivergence,
+    )
+    from keras.src.metrics.probabilistic_metrics import Poisson as Poisson
+    from keras.src.metrics.probabilistic_metrics import (
+        SparseCategoricalCrossentropy as SparseCategoricalCrossentropy,
+    )
+    from keras.src.metrics.reduction_metrics import Mean as Mean
+    from keras.src.metrics.reduction_metrics import (
+        MeanMetricWrapper as MeanMetricWrapper,
+    )
+    from keras.src.metrics.reduction_metrics import Sum as Sum
+    from keras.src.metrics.regression_metrics import (
+        CosineSimilarity as CosineSimilarity,
+    )
+    from keras.src.metrics.regression_metrics import (
+        LogCoshError as LogCoshError,
+    )
+    from keras.src.metrics.regression_metrics import (
+        MeanAbsoluteError as MeanAbsoluteError,
+    )
+    from keras.src.metrics.regression_metrics import (
+        MeanAbsolutePercentageError as MeanAbsolutePercentageError,
+    )
+    from keras.src.metrics.regression_metrics import (
+        MeanSquaredError as MeanSquaredError,
+    )
+    from keras.src.metrics.regression_metrics import (
+        MeanSquaredLogarithmicError as MeanSquaredLogarithmicError,
+    )
+    from keras.src.metrics.regression_metrics import R2Score as R2Score
+    from keras.src.metrics.regression_metrics import (
+        RootMeanSquaredError as RootMeanSquaredError,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "binary_crossentropy": ("keras.src.losses.losses", "binary_crossentropy"),
+    "binary_focal_crossentropy": (
+        "keras.src.losses.losses",
+        "binary_focal_crossentropy",
+    ),
+    "categorical_crossentropy": (
+        "keras.src.losses.losses",
+        "categorical_crossentropy",
+    ),
+    "categorical_focal_crossentropy": (
+        "keras.src.losses.losses",
+        "categorical_focal_crossentropy",
+    ),
+    "categorical_hinge": ("keras.src.losses.losses", "categorical_hinge"),
+    "hinge": ("keras.src.losses.losses", "hinge"),
+    "huber": ("keras.src.losses.losses", "huber"),
+    "kl_divergence": ("keras.src.losses.losses", "kl_divergence"),
+    "log_cosh": ("keras.src.losses.losses", "log_cosh"),
+    "mean_absolute_error": ("keras.src.losses.losses", "mean_absolute_error"),
+    "mean_absolute_percentage_error": (
+        "keras.src.losses.losses",
+        "mean_absolute_percentage_error",
+    ),
+    "mean_squared_error": ("keras.src.losses.losses", "mean_squared_error"),
+    "mean_squared_logarithmic_error": (
+        "keras.src.losses.losses",
+        "mean_squared_logarithmic_error",
+    ),
+    "poisson": ("keras.src.losses.losses", "poisson"),
+    "sparse_categorical_crossentropy": (
+        "keras.src.losses.losses",
+        "sparse_categorical_crossentropy",
+    ),
+    "squared_hinge": ("keras.src.losses.losses", "squared_hinge"),
+    "deserialize": ("keras.src.metrics", "deserialize"),
+    "get": ("keras.src.metrics", "get"),
+    "serialize": ("keras.src.metrics", "serialize"),
+    "Accuracy": ("keras.src.metrics.accuracy_metrics", "Accuracy"),
+    "BinaryAccuracy": ("keras.src.metrics.accuracy_metrics", "BinaryAccuracy"),
+    "CategoricalAccuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "CategoricalAccuracy",
+    ),
+    "SparseCategoricalAccuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "SparseCategoricalAccuracy",
+    ),
+    "SparseTopKCategoricalAccuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "SparseTopKCategoricalAccuracy",
+    ),
+    "TopKCategoricalAccuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "TopKCategoricalAccuracy",
+    ),
+    "binary_accuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "binary_accuracy",
+    ),
+    "categorical_accuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "categorical_accuracy",
+    ),
+    "sparse_categorical_accuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "sparse_categorical_accuracy",
+    ),
+    "sparse_top_k_categorical_accuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "sparse_top_k_categorical_accuracy",
+    ),
+    "top_k_categorical_accuracy": (
+        "keras.src.metrics.accuracy_metrics",
+        "top_k_categorical_accuracy",
+    ),
+    "AUC": ("keras.src.metrics.confusion_metrics", "AUC"),
+    "FalseNegatives": ("keras.src.metrics.confusion_metrics", "FalseNegatives"),
+    "FalsePositives": ("keras.src.metrics.confusion_metrics", "FalsePositives"),
+    "Precision": ("keras.src.metrics.confusion_metrics", "Precision"),
+    "PrecisionAtRecall": (
+        "keras.src.metrics.confusion_metrics",
+        "PrecisionAtRecall",
+    ),
+    "Recall": ("keras.src.metrics.confusion_metrics", "Recall"),
+    "RecallAtPrecision": (
+        "keras.src.metrics.confusion_metrics",
+        "RecallAtPrecision",
+    ),
+    "SensitivityAtSpecificity": (
+        "keras.src.metrics.confusion_metrics",
+        "SensitivityAtSpecificity",
+    ),
+    "SpecificityAtSensitivity": (
+        "keras.src.metrics.confusion_metrics",
+        "SpecificityAtSensitivity",
+    ),
+    "TrueNegatives": ("keras.src.metrics.confusion_metrics", "TrueNegatives"),
+    "TruePositives": ("keras.src.metrics.confusion_metrics", "TruePositives"),
+    "ConcordanceCorrelation": (
+        "keras.src.metrics.correlation_metrics",
+        "ConcordanceCorrelation",
+    ),
+    "PearsonCorrelation": (
+        "keras.src.metrics.correlation_metrics",
+        "PearsonCorrelation",
+    ),
+    "concordance_correlation": (
+        "keras.src.metrics.correlation_metrics",
+        "concordance_correlation",
+    ),
+    "pearson_correlation": (
+        "keras.src.metrics.correlation_metrics",
+        "pearson_correlation",
+    ),
+    "F1Score": ("keras.src.metrics.f_score_metrics", "F1Score"),
+    "FBetaScore": ("keras.src.metrics.f_score_metrics", "FBetaScore"),
+    "CategoricalHinge": ("keras.src.metrics.hinge_metrics", "CategoricalHinge"),
+    "Hinge": ("keras.src.metrics.hinge_metrics", "Hinge"),
+    "SquaredHinge": ("keras.src.metrics.hinge_metrics", "SquaredHinge"),
+    "BinaryIoU": ("keras.src.metrics.iou_metrics", "BinaryIoU"),
+    "IoU": ("keras.src.metrics.iou_metrics", "IoU"),
+    "MeanIoU": ("keras.src.metrics.iou_metrics", "MeanIoU"),
+    "OneHotIoU": ("keras.src.metrics.iou_metrics", "OneHotIoU"),
+    "OneHotMeanIoU": ("keras.src.metrics.iou_metrics", "OneHotMeanIoU"),
+    "Metric": ("keras.src.metrics.metric", "Metric"),
+    "BinaryCrossentropy": (
+        "keras.src.metrics.probabilistic_metrics",
+        "BinaryCrossentropy",
+    ),
+    "CategoricalCrossentropy": (
+        "keras.src.metrics.probabilistic_metrics",
+        "CategoricalCrossentropy",
+    ),
+    "KLDivergence": ("keras.src.metrics.probabilistic_metrics", "KLDivergence"),
+    "Poisson": ("keras.src.metrics.probabilistic_metrics", "Poisson"),
+    "SparseCategoricalCrossentropy": (
+        "keras.src.metrics.probabilistic_metrics",
+        "SparseCategoricalCrossentropy",
+    ),
+    "Mean": ("keras.src.metrics.reduction_metrics", "Mean"),
+    "MeanMetricWrapper": (
+        "keras.src.metrics.reduction_metrics",
+        "MeanMetricWrapper",
+    ),
+    "Sum": ("keras.src.metrics.reduction_metrics", "Sum"),
+    "CosineSimilarity": (
+        "keras.src.metrics.regression_metrics",
+        "CosineSimilarity",
+    ),
+    "LogCoshError": ("keras.src.metrics.regression_metrics", "LogCoshError"),
+    "MeanAbsoluteError": (
+        "keras.src.metrics.regression_metrics",
+        "MeanAbsoluteError",
+    ),
+    "MeanAbsolutePercentageError": (
+        "keras.src.metrics.regression_metrics",
+        "MeanAbsolutePercentageError",
+    ),
+    "MeanSquaredError": (
+        "keras.src.metrics.regression_metrics",
+        "MeanSquaredError",
+    ),
+    "MeanSquaredLogarithmicError": (
+        "keras.src.metrics.regression_metrics",
+        "MeanSquaredLogarithmicError",
+    ),
+    "R2Score": ("keras.src.metrics.regression_metrics", "R2Score"),
+    "RootMeanSquaredError": (
+        "keras.src.metrics.regression_metrics",
+        "RootMeanSquaredError",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
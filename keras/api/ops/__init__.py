@@ -4,306 +4,637 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.ops import image as image
-from keras.ops import linalg as linalg
-from keras.ops import nn as nn
-from keras.ops import numpy as numpy
-from keras.src.ops.core import associative_scan as associative_scan
-from keras.src.ops.core import cast as cast
-from keras.src.ops.core import cond as cond
-from keras.src.ops.core import convert_to_numpy as convert_to_numpy
-from keras.src.ops.core import convert_to_tensor as convert_to_tensor
-from keras.src.ops.core import custom_gradient as custom_gradient
-from keras.src.ops.core import dtype as dtype
-from keras.src.ops.core import fori_loop as fori_loop
-from keras.src.ops.core import is_tensor as is_tensor
-from keras.src.ops.core import map as map
-from keras.src.ops.core import saturate_cast as saturate_cast
-from keras.src.ops.core import scan as scan
-from keras.src.ops.core import scatter as scatter
-from keras.src.ops.core import scatter_update as scatter_update
-from keras.src.ops.core import shape as shape
-from keras.src.ops.core import slice as slice
-from keras.src.ops.core import slice_update as slice_update
-from keras.src.ops.core import stop_gradient as stop_gradient
-from keras.src.ops.core import switch as switch
-from keras.src.ops.core import unstack as unstack
-from keras.src.ops.core import vectorized_map as vectorized_map
-from keras.src.ops.core import while_loop as while_loop
-from keras.src.ops.einops import rearrange as rearrange
-from keras.src.ops.linalg import cholesky as cholesky
-from keras.src.ops.linalg import cholesky_inverse as cholesky_inverse
-from keras.src.ops.linalg import det as det
-from keras.src.ops.linalg import eig as eig
-from keras.src.ops.linalg import eigh as eigh
-from keras.src.ops.linalg import inv as inv
-from keras.src.ops.linalg import jvp as jvp
-from keras.src.ops.linalg import lstsq as lstsq
-from keras.src.ops.linalg import lu_factor as lu_factor
-from keras.src.ops.linalg import norm as norm
-from keras.src.ops.linalg import qr as qr
-from keras.src.ops.linalg import solve as solve
-from keras.src.ops.linalg import solve_triangular as solve_triangular
-from keras.src.ops.linalg import svd as svd
-from keras.src.ops.math import erf as erf
-from keras.src.ops.math import erfinv as erfinv
-from keras.src.ops.math import extract_sequences as extract_sequences
-from keras.src.ops.math import fft as fft
-from keras.src.ops.math import fft2 as fft2
-from keras.src.ops.math import ifft2 as ifft2
-from keras.src.ops.math import in_top_k as in_top_k
-from keras.src.ops.math import irfft as irfft
-from keras.src.ops.math import istft as istft
-from keras.src.ops.math import logdet as logdet
-from keras.src.ops.math import logsumexp as logsumexp
-from keras.src.ops.math import rfft as rfft
-from keras.src.ops.math import rsqrt as rsqrt
-from keras.src.ops.math import segment_max as segment_max
-from keras.src.ops.math import segment_sum as segment_sum
-from keras.src.ops.math import stft as stft
-from keras.src.ops.math import top_k as top_k
-from keras.src.ops.math import view_as_complex as view_as_complex
-from keras.src.ops.math import view_as_real as view_as_real
-from keras.src.ops.nn import adaptive_average_pool as adaptive_average_pool
-from keras.src.ops.nn import adaptive_max_pool as adaptive_max_pool
-from keras.src.ops.nn import average_pool as average_pool
-from keras.src.ops.nn import batch_normalization as batch_normalization
-from keras.src.ops.nn import binary_crossentropy as binary_crossentropy
-from keras.src.ops.nn import (
-    categorical_crossentropy as categorical_crossentropy,
-)
-from keras.src.ops.nn import celu as celu
-from keras.src.ops.nn import conv as conv
-from keras.src.ops.nn import conv_transpose as conv_transpose
-from keras.src.ops.nn import ctc_decode as ctc_decode
-from keras.src.ops.nn import ctc_loss as ctc_loss
-from keras.src.ops.nn import depthwise_conv as depthwise_conv
-from keras.src.ops.nn import dot_product_attention as dot_product_attention
-from keras.src.ops.nn import elu as elu
-from keras.src.ops.nn import gelu as gelu
-from keras.src.ops.nn import glu as glu
-from keras.src.ops.nn import hard_shrink as hard_shrink
-from keras.src.ops.nn import hard_sigmoid as hard_sigmoid
-from keras.src.ops.nn import hard_silu as hard_silu
-from keras.src.ops.nn import hard_silu as hard_swish
-from keras.src.ops.nn import hard_tanh as hard_tanh
-from keras.src.ops.nn import layer_normalization as layer_normalization
-from keras.src.ops.nn import leaky_relu as leaky_relu
-from keras.src.ops.nn import log_sigmoid as log_sigmoid
-from keras.src.ops.nn import log_softmax as log_softmax
-from keras.src.ops.nn import max_pool as max_pool
-from keras.src.ops.nn import moments as moments
-from keras.src.ops.nn import multi_hot as multi_hot
-from keras.src.ops.nn import normalize as normalize
-from keras.src.ops.nn import one_hot as one_hot
-from keras.src.ops.nn import polar as polar
-from keras.src.ops.nn import psnr as psnr
-from keras.src.ops.nn import relu as relu
-from keras.src.ops.nn import relu6 as relu6
-from keras.src.ops.nn import rms_normalization as rms_normalization
-from keras.src.ops.nn import selu as selu
-from keras.src.ops.nn import separable_conv as separable_conv
-from keras.src.ops.nn import sigmoid as sigmoid
-from keras.src.ops.nn import silu as silu
-from keras.src.ops.nn import silu as swish
-from keras.src.ops.nn import soft_shrink as soft_shrink
-from keras.src.ops.nn import softmax as softmax
-from keras.src.ops.nn import softplus as softplus
-from keras.src.ops.nn import softsign as softsign
-from keras.src.ops.nn import (
-    sparse_categorical_crossentropy as sparse_categorical_crossentropy,
-)
-from keras.src.ops.nn import sparse_plus as sparse_plus
-from keras.src.ops.nn import sparse_sigmoid as sparse_sigmoid
-from keras.src.ops.nn import sparsemax as sparsemax
-from keras.src.ops.nn import squareplus as squareplus
-from keras.src.ops.nn import tanh_shrink as tanh_shrink
-from keras.src.ops.nn import threshold as threshold
-from keras.src.ops.nn import unfold as unfold
-from keras.src.ops.numpy import abs as abs
-from keras.src.ops.numpy import absolute as absolute
-from keras.src.ops.numpy import add as add
-from keras.src.ops.numpy import all as all
-from keras.src.ops.numpy import amax as amax
-from keras.src.ops.numpy import amin as amin
-from keras.src.ops.numpy import angle as angle
-from keras.src.ops.numpy import any as any
-from keras.src.ops.numpy import append as append
-from keras.src.ops.numpy import arange as arange
-from keras.src.ops.numpy import arccos as arccos
-from keras.src.ops.numpy import arccosh as arccosh
-from keras.src.ops.numpy import arcsin as arcsin
-from keras.src.ops.numpy import arcsinh as arcsinh
-from keras.src.ops.numpy import arctan as arctan
-from keras.src.ops.numpy import arctan2 as arctan2
-from keras.src.ops.numpy import arctanh as arctanh
-from keras.src.ops.numpy import argmax as argmax
-from keras.src.ops.numpy import argmin as argmin
-from keras.src.ops.numpy import argpartition as argpartition
-from keras.src.ops.numpy import argsort as argsort
-from keras.src.ops.numpy import array as array
-from keras.src.ops.numpy import array_split as array_split
-from keras.src.ops.numpy import average as average
-from keras.src.ops.numpy import bartlett as bartlett
-from keras.src.ops.numpy import bincount as bincount
-from keras.src.ops.numpy import bitwise_and as bitwise_and
-from keras.src.ops.numpy import bitwise_invert as bitwise_invert
-from keras.src.ops.numpy import bitwise_left_shift as bitwise_left_shift
-from keras.src.ops.numpy import bitwise_not as bitwise_not
-from keras.src.ops.numpy import bitwise_or as bitwise_or
-from keras.src.ops.numpy import bitwise_right_shift as bitwise_right_shift
-from keras.src.ops.numpy import bitwise_xor as bitwise_xor
-from keras.src.ops.numpy import blackman as blackman
-from keras.src.ops.numpy import broadcast_to as broadcast_to
-from keras.src.ops.numpy import cbrt as cbrt
-from keras.src.ops.numpy import ceil as ceil
-from keras.src.ops.numpy import clip as clip
-from keras.src.ops.numpy import concatenate as concatenate
-from keras.src.ops.numpy import conj as conj
-from keras.src.ops.numpy import conjugate as conjugate
-from keras.src.ops.numpy import copy as copy
-from keras.src.ops.numpy import corrcoef as corrcoef
-from keras.src.ops.numpy import correlate as correlate
-from keras.src.ops.numpy import cos as cos
-from keras.src.ops.numpy import cosh as cosh
-from keras.src.ops.numpy import count_nonzero as count_nonzero
-from keras.src.ops.numpy import cross as cross
-from keras.src.ops.numpy import cumprod as cumprod
-from keras.src.ops.numpy import cumsum as cumsum
-from keras.src.ops.numpy import deg2rad as deg2rad
-from keras.src.ops.numpy import diag as diag
-from keras.src.ops.numpy import diagflat as diagflat
-from keras.src.ops.numpy import diagonal as diagonal
-from keras.src.ops.numpy import diff as diff
-from keras.src.ops.numpy import digitize as digitize
-from keras.src.ops.numpy import divide as divide
-from keras.src.ops.numpy import divide_no_nan as divide_no_nan
-from keras.src.ops.numpy import dot as dot
-from keras.src.ops.numpy import einsum as einsum
-from keras.src.ops.numpy import empty as empty
-from keras.src.ops.numpy import empty_like as empty_like
-from keras.src.ops.numpy import equal as equal
-from keras.src.ops.numpy import exp as exp
-from keras.src.ops.numpy import exp2 as exp2
-from keras.src.ops.numpy import expand_dims as expand_dims
-from keras.src.ops.numpy import expm1 as expm1
-from keras.src.ops.numpy import eye as eye
-from keras.src.ops.numpy import flip as flip
-from keras.src.ops.numpy import floor as floor
-from keras.src.ops.numpy import floor_divide as floor_divide
-from keras.src.ops.numpy import full as full
-from keras.src.ops.numpy import full_like as full_like
-from keras.src.ops.numpy import gcd as gcd
-from keras.src.ops.numpy import get_item as get_item
-from keras.src.ops.numpy import greater as greater
-from keras.src.ops.numpy import greater_equal as greater_equal
-from keras.src.ops.numpy import hamming as hamming
-from keras.src.ops.numpy import hanning as hanning
-from keras.src.ops.numpy import heaviside as heaviside
-from keras.src.ops.numpy import histogram as histogram
-from keras.src.ops.numpy import hstack as hstack
-from keras.src.ops.numpy import hypot as hypot
-from keras.src.ops.numpy import identity as identity
-from keras.src.ops.numpy import imag as imag
-from keras.src.ops.numpy import inner as inner
-from keras.src.ops.numpy import isclose as isclose
-from keras.src.ops.numpy import isfinite as isfinite
-from keras.src.ops.numpy import isin as isin
-from keras.src.ops.numpy import isinf as isinf
-from keras.src.ops.numpy import isnan as isnan
-from keras.src.ops.numpy import isneginf as isneginf
-from keras.src.ops.numpy import isposinf as isposinf
-from keras.src.ops.numpy import isreal as isreal
-from keras.src.ops.numpy import kaiser as kaiser
-from keras.src.ops.numpy import kron as kron
-from keras.src.ops.numpy import lcm as lcm
-from keras.src.ops.numpy import ldexp as ldexp
-from keras.src.ops.numpy import left_shift as left_shift
-from keras.src.ops.numpy import less as less
-from keras.src.ops.numpy import less_equal as less_equal
-from keras.src.ops.numpy import linspace as linspace
-from keras.src.ops.numpy import log as log
-from keras.src.ops.numpy import log1p as log1p
-from keras.src.ops.numpy import log2 as log2
-from keras.src.ops.numpy import log10 as log10
-from keras.src.ops.numpy import logaddexp as logaddexp
-from keras.src.ops.numpy import logaddexp2 as logaddexp2
-from keras.src.ops.numpy import logical_and as logical_and
-from keras.src.ops.numpy import logical_not as logical_not
-from keras.src.ops.numpy import logical_or as logical_or
-from keras.src.ops.numpy import logical_xor as logical_xor
-from keras.src.ops.numpy import logspace as logspace
-from keras.src.ops.numpy import matmul as matmul
-from keras.src.ops.numpy import max as max
-from keras.src.ops.numpy import maximum as maximum
-from keras.src.ops.numpy import mean as mean
-from keras.src.ops.numpy import median as median
-from keras.src.ops.numpy import meshgrid as meshgrid
-from keras.src.ops.numpy import min as min
-from keras.src.ops.numpy import minimum as minimum
-from keras.src.ops.numpy import mod as mod
-from keras.src.ops.numpy import moveaxis as moveaxis
-from keras.src.ops.numpy import multiply as multiply
-from keras.src.ops.numpy import nan_to_num as nan_to_num
-from keras.src.ops.numpy import ndim as ndim
-from keras.src.ops.numpy import negative as negative
-from keras.src.ops.numpy import nonzero as nonzero
-from keras.src.ops.numpy import not_equal as not_equal
-from keras.src.ops.numpy import ones as ones
-from keras.src.ops.numpy import ones_like as ones_like
-from keras.src.ops.numpy import outer as outer
-from keras.src.ops.numpy import pad as pad
-from keras.src.ops.numpy import power as power
-from keras.src.ops.numpy import prod as prod
-from keras.src.ops.numpy import quantile as quantile
-from keras.src.ops.numpy import ravel as ravel
-from keras.src.ops.numpy import real as real
-from keras.src.ops.numpy import reciprocal as reciprocal
-from keras.src.ops.numpy import repeat as repeat
-from keras.src.ops.numpy import reshape as reshape
-from keras.src.ops.numpy import right_shift as right_shift
-from keras.src.ops.numpy import roll as roll
-from keras.src.ops.numpy import rot90 as rot90
-from keras.src.ops.numpy import round as round
-from keras.src.ops.numpy import searchsorted as searchsorted
-from keras.src.ops.numpy import select as select
-from keras.src.ops.numpy import sign as sign
-from keras.src.ops.numpy import signbit as signbit
-from keras.src.ops.numpy import sin as sin
-from keras.src.ops.numpy import sinh as sinh
-from keras.src.ops.numpy import size as size
-from keras.src.ops.numpy import slogdet as slogdet
-from keras.src.ops.numpy import sort as sort
-from keras.src.ops.numpy import split as split
-from keras.src.ops.numpy import sqrt as sqrt
-from keras.src.ops.numpy import square as square
-from keras.src.ops.numpy import squeeze as squeeze
-from keras.src.ops.numpy import stack as stack
-from keras.src.ops.numpy import std as std
-from keras.src.ops.numpy import subtract as subtract
-from keras.src.ops.numpy import sum as sum
-from keras.src.ops.numpy import swapaxes as swapaxes
-from keras.src.ops.numpy import take as take
-from keras.src.ops.numpy import take_along_axis as take_along_axis
-from keras.src.ops.numpy import tan as tan
-from keras.src.ops.numpy import tanh as tanh
-from keras.src.ops.numpy import tensordot as tensordot
-from keras.src.ops.numpy import tile as tile
-from keras.src.ops.numpy import trace as trace
-from keras.src.ops.numpy import transpose as transpose
-from keras.src.ops.numpy import trapezoid as trapezoid
-from keras.src.ops.numpy import tri as tri
-from keras.src.ops.numpy import tril as tril
-from keras.src.ops.numpy import triu as triu
-from keras.src.ops.numpy import true_divide as true_divide
-from keras.src.ops.numpy import trunc as trunc
-from keras.src.ops.numpy import unravel_index as unravel_index
-from keras.src.ops.numpy import vander as vander
-from keras.src.ops.numpy import var as var
-from keras.src.ops.numpy import vdot as vdot
-from keras.src.ops.numpy import vectorize as vectorize
-from keras.src.ops.numpy import view as view
-from keras.src.ops.numpy import vstack as vstack
-from keras.src.ops.numpy import where as where
-from keras.src.ops.numpy import zeros as zeros
-from keras.src.ops.numpy import zeros_like as zeros_like
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.ops import image as image
+    from keras.ops import linalg as linalg
+    from keras.ops import nn as nn
+    from keras.ops import numpy as numpy
+    from keras.src.ops.core import associative_scan as associative_scan
+    from keras.src.ops.core import cast as cast
+    from keras.src.ops.core import cond as cond
+    from keras.src.ops.core import convert_to_numpy as convert_to_numpy
+    from keras.src.ops.core import convert_to_tensor as convert_to_tensor
+    from keras.src.ops.core import custom_gradient as custom_gradient
+    from keras.src.ops.core import dtype as dtype
+    from keras.src.ops.core import fori_loop as fori_loop
+    from keras.src.ops.core import is_tensor as is_tensor
+    from keras.src.ops.core import map as map
+    from keras.src.ops.core import saturate_cast as saturate_cast
+    from keras.src.ops.core import scan as scan
+    from keras.src.ops.core import scatter as scatter
+    from keras.src.ops.core import scatter_update as scatter_update
+    from keras.src.ops.core import shape as shape
+    from keras.src.ops.core import slice as slice
+    from keras.src.ops.core import slice_update as slice_update
+    from keras.src.ops.core import stop_gradient as stop_gradient
+    from keras.src.ops.core import switch as switch
+    from keras.src.ops.core import unstack as unstack
+    from keras.src.ops.core import vectorized_map as vectorized_map
+    from keras.src.ops.core import while_loop as while_loop
+    from keras.src.ops.einops import rearrange as rearrange
+    from keras.src.ops.linalg import cholesky as cholesky
+    from keras.src.ops.linalg import cholesky_inverse as cholesky_inverse
+    from keras.src.ops.linalg import det as det
+    from keras.src.ops.linalg import eig as eig
+    from keras.src.ops.linalg import eigh as eigh
+    from keras.src.ops.linalg import inv as inv
+    from keras.src.ops.linalg import jvp as jvp
+    from keras.src.ops.linalg import lstsq as lstsq
+    from keras.src.ops.linalg import lu_factor as lu_factor
+    from keras.src.ops.linalg import norm as norm
+    from keras.src.ops.linalg import qr as qr
+    from keras.src.ops.linalg import solve as solve
+    from keras.src.ops.linalg import solve_triangular as solve_triangular
+    from keras.src.ops.linalg import svd as svd
+    from keras.src.ops.math import erf as erf
+    from keras.src.ops.math import erfinv as erfinv
+    from keras.src.ops.math import extract_sequences as extract_sequences
+    from keras.src.ops.math import fft as fft
+    from keras.src.ops.math import fft2 as fft2
+    from keras.src.ops.math import ifft2 as ifft2
+    from keras.src.ops.math import in_top_k as in_top_k
+    from keras.src.ops.math import irfft as irfft
+    from keras.src.ops.math import istft as istft
+    from keras.src.ops.math import logdet as logdet
+    from keras.src.ops.math import logsumexp as logsumexp
+    from keras.src.ops.math import rfft as rfft
+    from keras.src.ops.math import rsqrt as rsqrt
+    from keras.src.ops.math import segment_max as segment_max
+    from keras.src.ops.math import segment_sum as segment_sum
+    from keras.src.ops.math import stft as stft
+    from keras.src.ops.math import top_k as top_k
+    from keras.src.ops.math import view_as_complex as view_as_complex
+    from keras.src.ops.math import view_as_real as view_as_real
+    from keras.src.ops.nn import adaptive_average_pool as adaptive_average_pool
+    from keras.src.ops.nn import adaptive_max_pool as adaptive_max_pool
+    from keras.src.ops.nn import average_pool as average_pool
+    from keras.src.ops.nn import batch_normalization as batch_normalization
+    from keras.src.ops.nn import binary_crossentropy as binary_crossentropy
+    from keras.src.ops.nn import (
+        categorical_crossentropy as categorical_crossentropy,
+    )
+    from keras.src.ops.nn import celu as celu
+    from keras.src.ops.nn import conv as conv
+    from keras.src.ops.nn import conv_transpose as conv_transpose
+    from keras.src.ops.nn import ctc_decode as ctc_decode
+    from keras.src.ops.nn import ctc_loss as ctc_loss
+    from keras.src.ops.nn import depthwise_conv as depthwise_conv
+    from keras.src.ops.nn import dot_product_attention as dot_product_attention
+    from keras.src.ops.nn import elu as elu
+    from keras.src.ops.nn import gelu as gelu
+    from keras.src.ops.nn import glu as glu
+    from keras.src.ops.nn import hard_shrink as hard_shrink
+    from keras.src.ops.nn import hard_sigmoid as hard_sigmoid
+    from keras.src.ops.nn import hard_silu as hard_silu
+    from keras.src.ops.nn import hard_silu as hard_swish
+    from keras.src.ops.nn import hard_tanh as hard_tanh
+    from keras.src.ops.nn import layer_normalization as layer_normalization
+    from keras.src.ops.nn import leaky_relu as leaky_relu
+    from keras.src.ops.nn import log_sigmoid as log_sigmoid
+    from keras.src.ops.nn import log_softmax as log_softmax
+    from keras.src.ops.nn import max_pool as max_pool
+    from keras.src.ops.nn import moments as moments
+    from keras.src.ops.nn import multi_hot as multi_hot
+    from keras.src.ops.nn import normalize as normalize
+    from keras.src.ops.nn import one_hot as one_hot
+    from keras.src.ops.nn import polar as polar
+    from keras.src.ops.nn import psnr as psnr
+    from keras.src.ops.nn import relu as relu
+    from keras.src.ops.nn import relu6 as relu6
+    from keras.src.ops.nn import rms_normalization as rms_normalization
+    from keras.src.ops.nn import selu as selu
+    from keras.src.ops.nn import separable_conv as separable_conv
+    from keras.src.ops.nn import sigmoid as sigmoid
+    from keras.src.ops.nn import silu as silu
+    from keras.src.ops.nn import silu as swish
+    from keras.src.ops.nn import soft_shrink as soft_shrink
+    from keras.src.ops.nn import softmax as softmax
+    from keras.src.ops.nn import softplus as softplus
+    from keras.src.ops.nn import softsign as softsign
+    from keras.src.ops.nn import (
+        sparse_categorical_crossentropy as sparse_categorical_crossentropy,
+    )
+    from keras.src.ops.nn import sparse_plus as sparse_plus
+    from keras.src.ops.nn import sparse_sigmoid as sparse_sigmoid
+    from keras.src.ops.nn import sparsemax as sparsemax
+    from keras.src.ops.nn import squareplus as squareplus
+    from keras.src.ops.nn import tanh_shrink as tanh_shrink
+    from keras.src.ops.nn import threshold as threshold
+    from keras.src.ops.nn import unfold as unfold
+    from keras.src.ops.numpy import abs as abs
+    from keras.src.ops.numpy import absolute as absolute
+    from keras.src.ops.numpy import add as add
+    from keras.src.ops.numpy import all as all
+    from keras.src.ops.numpy import amax as amax
+    from keras.src.ops.numpy import amin as amin
+    from keras.src.ops.numpy import angle as angle
+    from keras.src.ops.numpy import any as any
+    from keras.src.ops.numpy import append as append
+    from keras.src.ops.numpy import arange as arange
+    from keras.src.ops.numpy import arccos as arccos
+    from keras.src.ops.numpy import arccosh as arccosh
+    from keras.src.ops.numpy import arcsin as arcsin
+    from keras.src.ops.numpy import arcsinh as arcsinh
+    from keras.src.ops.numpy import arctan as arctan
+    from keras.src.ops.numpy import arctan2 as arctan2
+    from keras.src.ops.numpy import arctanh as arctanh
+    from keras.src.ops.numpy import argmax as argmax
+    from keras.src.ops.numpy import argmin as argmin
+    from keras.src.ops.numpy import argpartition as argpartition
+    from keras.src.ops.numpy import argsort as argsort
+    from keras.src.ops.numpy import array as array
+    from keras.src.ops.numpy import array_split as array_split
+    from keras.src.ops.numpy import average as average
+    from keras.src.ops.numpy import bartlett as bartlett
+    from keras.src.ops.numpy import bincount as bincount
+    from keras.src.ops.numpy import bitwise_and as bitwise_and
+    from keras.src.ops.numpy import bitwise_invert as bitwise_invert
+    from keras.src.ops.numpy import bitwise_left_shift as bitwise_left_shift
+    from keras.src.ops.numpy import bitwise_not as bitwise_not
+    from keras.src.ops.numpy import bitwise_or as bitwise_or
+    from keras.src.ops.numpy import bitwise_right_shift as bitwise_right_shift
+    from keras.src.ops.numpy import bitwise_xor as bitwise_xor
+    from keras.src.ops.numpy import blackman as blackman
+    from keras.src.ops.numpy import broadcast_to as broadcast_to
+    from keras.src.ops.numpy import cbrt as cbrt
+    from keras.src.ops.numpy import ceil as ceil
+    from keras.src.ops.numpy import clip as clip
+    from keras.src.ops.numpy import concatenate as concatenate
+    from keras.src.ops.numpy import conj as conj
+    from keras.src.ops.numpy import conjugate as conjugate
+    from keras.src.ops.numpy import copy as copy
+    from keras.src.ops.numpy import corrcoef as corrcoef
+    from keras.src.ops.numpy import correlate as correlate
+    from keras.src.ops.numpy import cos as cos
+    from keras.src.ops.numpy import cosh as cosh
+    from keras.src.ops.numpy import count_nonzero as count_nonzero
+    from keras.src.ops.numpy import cross as cross
+    from keras.src.ops.numpy import cumprod as cumprod
+    from keras.src.ops.numpy import cumsum as cumsum
+    from keras.src.ops.numpy import deg2rad as deg2rad
+    from keras.src.ops.numpy import diag as diag
+    from keras.src.ops.numpy import diagflat as diagflat
+    from keras.src.ops.numpy import diagonal as diagonal
+    from keras.src.ops.numpy import diff as diff
+    from keras.src.ops.numpy import digitize as digitize
+    from keras.src.ops.numpy import divide as divide
+    from keras.src.ops.numpy import divide_no_nan as divide_no_nan
+    from keras.src.ops.numpy import dot as dot
+    from keras.src.ops.numpy import einsum as einsum
+    from keras.src.ops.numpy import empty as empty
+    from keras.src.ops.numpy import empty_like as empty_like
+    from keras.src.ops.numpy import equal as equal
+    from keras.src.ops.numpy import exp as exp
+    from keras.src.ops.numpy import exp2 as exp2
+    from keras.src.ops.numpy import expand_dims as expand_dims
+    from keras.src.ops.numpy import expm1 as expm1
+    from keras.src.ops.numpy import eye as eye
+    from keras.src.ops.numpy import flip as flip
+    from keras.src.ops.numpy import floor as floor
+    from keras.src.ops.numpy import floor_divide as floor_divide
+    from keras.src.ops.numpy import full as full
+    from keras.src.ops.numpy import full_like as full_like
+    from keras.src.ops.numpy import gcd as gcd
+    from keras.src.ops.numpy import get_item as get_item
+    from keras.src.ops.numpy import greater as greater
+    from keras.src.ops.numpy import greater_equal as greater_equal
+    from keras.src.ops.numpy import hamming as hamming
+    from keras.src.ops.numpy import hanning as hanning
+    from keras.src.ops.numpy import heaviside as heaviside
+    from keras.src.ops.numpy import histogram as histogram
+    from keras.src.ops.numpy import hstack as hstack
+    from keras.src.ops.numpy import hypot as hypot
+    from keras.src.ops.numpy import identity as identity
+    from keras.src.ops.numpy import imag as imag
+    from keras.src.ops.numpy import inner as inner
+    from keras.src.ops.numpy import isclose as isclose
+    from keras.src.ops.numpy import isfinite as isfinite
+    from keras.src.ops.numpy import isin as isin
+    from keras.src.ops.numpy import isinf as isinf
+    from keras.src.ops.numpy import isnan as isnan
+    from keras.src.ops.numpy import isneginf as isneginf
+    from keras.src.ops.numpy import isposinf as isposinf
+    from keras.src.ops.numpy import isreal as isreal
+    from keras.src.ops.numpy import kaiser as kaiser
+    from keras.src.ops.numpy import kron as kron
+    from keras.src.ops.numpy import lcm as lcm
+    from keras.src.ops.numpy import ldexp as ldexp
+    from keras.src.ops.numpy import left_shift as left_shift
+    from keras.src.ops.numpy import less as less
+    from keras.src.ops.numpy import less_equal as less_equal
+    from keras.src.ops.numpy import linspace as linspace
+    from keras.src.ops.numpy import log as log
+    from keras.src.ops.numpy import log1p as log1p
+    from keras.src.ops.numpy import log2 as log2
+    from keras.src.ops.numpy import log10 as log10
+    from keras.src.ops.numpy import logaddexp as logaddexp
+    from keras.src.ops.numpy import logaddexp2 as logaddexp2
+    from keras.src.ops.numpy import logical_and as logical_and
+    from keras.src.ops.numpy import logical_not as logical_not
+    from keras.src.ops.numpy import logical_or as logical_or
+    from keras.src.ops.numpy import logical_xor as logical_xor
+    from keras.src.ops.numpy import logspace as logspace
+    from keras.src.ops.numpy import matmul as matmul
+    from keras.src.ops.numpy import max as max
+    from keras.src.ops.numpy import maximum as maximum
+    from keras.src.ops.numpy import mean as mean
+    from keras.src.ops.numpy import median as median
+    from keras.src.ops.numpy import meshgrid as meshgrid
+    from keras.src.ops.numpy import min as min
+    from keras.src.ops.numpy import minimum as minimum
+    from keras.src.ops.numpy import mod as mod
+    from keras.src.ops.numpy import moveaxis as moveaxis
+    from keras.src.ops.numpy import multiply as multiply
+    from keras.src.ops.numpy import nan_to_num as nan_to_num
+    from keras.src.ops.numpy import ndim as ndim
+    from keras.src.ops.numpy import negative as negative
+    from keras.src.ops.numpy import nonzero as nonzero
+    from keras.src.ops.numpy import not_equal as not_equal
+    from keras.src.ops.numpy import ones as ones
+    from keras.src.ops.numpy import ones_like as ones_like
+    from keras.src.ops.numpy import outer as outer
+    from keras.src.ops.numpy import pad as pad
+    from keras.src.ops.numpy import power as power
+    from keras.src.ops.numpy import prod as prod
+    from keras.src.ops.numpy import quantile as quantile
+    from keras.src.ops.numpy import ravel as ravel
+    from keras.src.ops.numpy import real as real
+    from keras.src.ops.numpy import reciprocal as reciprocal
+    from keras.src.ops.numpy import repeat as repeat
+    from keras.src.ops.numpy import reshape as reshape
+    from keras.src.ops.numpy import right_shift as right_shift
+    from keras.src.ops.numpy import roll as roll
+    from keras.src.ops.numpy import rot90 as rot90
+    from keras.src.ops.numpy import round as round
+    from keras.src.ops.numpy import searchsorted as searchsorted
+    from keras.src.ops.numpy import select as select
+    from keras.src.ops.numpy import sign as sign
+    from keras.src.ops.numpy import signbit as signbit
+    from keras.src.ops.numpy import sin as sin
+    from keras.src.ops.numpy import sinh as sinh
+    from keras.src.ops.numpy import size as size
+    from keras.src.ops.numpy import slogdet as slogdet
+    from keras.src.ops.numpy import sort as sort
+    from keras.src.ops.numpy import split as split
+    from keras.src.ops.numpy import sqrt as sqrt
+    from keras.src.ops.numpy import square as square
+    from keras.src.ops.numpy import squeeze as squeeze
+    from keras.src.ops.numpy import stack as stack
+    from keras.src.ops.numpy import std as std
+    from keras.src.ops.numpy import subtract as subtract
+    from keras.src.ops.numpy import sum as sum
+    from keras.src.ops.numpy import swapaxes as swapaxes
+    from keras.src.ops.numpy import take as take
+    from keras.src.ops.numpy import take_along_axis as take_along_axis
+    from keras.src.ops.numpy import tan as tan
+    from keras.src.ops.numpy import tanh as tanh
+    from keras.src.ops.numpy import tensordot as tensordot
+    from keras.src.ops.numpy import tile as tile
+    from keras.src.ops.numpy import trace as trace
+    from keras.src.ops.numpy import transpose as transpose
+    from keras.src.ops.numpy import trapezoid as trapezoid
+    from keras.src.ops.numpy import tri as tri
+    from keras.src.ops.numpy import tril as tril
+    from keras.src.ops.numpy import triu as triu
+    from keras.src.ops.numpy import true_divide as true_divide
+    from keras.src.ops.numpy import trunc as trunc
+    from keras.src.ops.numpy import unravel_index as unravel_index
+    from keras.src.ops.numpy import vander as vander
+    from keras.src.ops.numpy import var as var
+    from keras.src.ops.numpy import vdot as vdot
+    from keras.src.ops.numpy import vectorize as vectorize
+    from keras.src.ops.numpy import view as view
+    from keras.src.ops.numpy import vstack as vstack
+    from keras.src.ops.numpy import where as where
+    from keras.src.ops.numpy import zeros as zeros
+    from keras.src.ops.numpy import zeros_like as zeros_like
+
+_LAZY_ATTRIBUTES = {
+    "image": ("keras.ops.image", None),
+    "linalg": ("keras.ops.linalg", None),
+    "nn": ("keras.ops.nn", None),
+    "numpy": ("keras.ops.numpy", None),
+    "associative_scan": ("keras.src.ops.core", "associative_scan"),
+    "cast": ("keras.src.ops.core", "cast"),
+    "cond": ("keras.src.ops.core", "cond"),
+    "convert_to_numpy": ("keras.src.ops.core", "convert_to_numpy"),
+    "convert_to_tensor": ("keras.src.ops.core", "convert_to_tensor"),
+    "custom_gradient": ("keras.src.ops.core", "custom_gradient"),
+    "dtype": ("keras.src.ops.core", "dtype"),
+    "fori_loop": ("keras.src.ops.core", "fori_loop"),
+    "is_tensor": ("keras.src.ops.core", "is_tensor"),
+    "map": ("keras.src.ops.core", "map"),
+    "saturate_cast": ("keras.src.ops.core", "saturate_cast"),
+    "scan": ("keras.src.ops.core", "scan"),
+    "scatter": ("keras.src.ops.core", "scatter"),
+    "scatter_update": ("keras.src.ops.core", "scatter_update"),
+    "shape": ("keras.src.ops.core", "shape"),
+    "slice": ("keras.src.ops.core", "slice"),
+    "slice_update": ("keras.src.ops.core", "slice_update"),
+    "stop_gradient": ("keras.src.ops.core", "stop_gradient"),
+    "switch": ("keras.src.ops.core", "switch"),
+    "unstack": ("keras.src.ops.core", "unstack"),
+    "vectorized_map": ("keras.src.ops.core", "vectorized_map"),
+    "while_loop": ("keras.src.ops.core", "while_loop"),
+    "rearrange": ("keras.src.ops.einops", "rearrange"),
+    "cholesky": ("keras.src.ops.linalg", "cholesky"),
+    "cholesky_inverse": ("keras.src.ops.linalg", "cholesky_inverse"),
+    "det": ("keras.src.ops.linalg", "det"),
+    "eig": ("keras.src.ops.linalg", "eig"),
+    "eigh": ("keras.src.ops.linalg", "eigh"),
+    "inv": ("keras.src.ops.linalg", "inv"),
+    "jvp": ("keras.src.ops.linalg", "jvp"),
+    "lstsq": ("keras.src.ops.linalg", "lstsq"),
+    "lu_factor": ("keras.src.ops.linalg", "lu_factor"),
+    "norm": ("keras.src.ops.linalg", "norm"),
+    "qr": ("keras.src.ops.linalg", "qr"),
+    "solve": ("keras.src.ops.linalg", "solve"),
+    "solve_triangular": ("keras.src.ops.linalg", "solve_triangular"),
+    "svd": ("keras.src.ops.linalg", "svd"),
+    "erf": ("keras.src.ops.math", "erf"),
+    "erfinv": ("keras.src.ops.math", "erfinv"),
+    "extract_sequences": ("keras.src.ops.math", "extract_sequences"),
+    "fft": ("keras.src.ops.math", "fft"),
+    "fft2": ("keras.src.ops.math", "fft2"),
+    "ifft2": ("keras.src.ops.math", "ifft2"),
+    "in_top_k": ("keras.src.ops.math", "in_top_k"),
+    "irfft": ("keras.src.ops.math", "irfft"),
+    "istft": ("keras.src.ops.math", "istft"),
+    "logdet": ("keras.src.ops.math", "logdet"),
+    "logsumexp": ("keras.src.ops.math", "logsumexp"),
+    "rfft": ("keras.src.ops.math", "rfft"),
+    "rsqrt": ("keras.src.ops.math", "rsqrt"),
+    "segment_max": ("keras.src.ops.math", "segment_max"),
+    "segment_sum": ("keras.src.ops.math", "segment_sum"),
+    "stft": ("keras.src.ops.math", "stft"),
+    "top_k": ("keras.src.ops.math", "top_k"),
+    "view_as_complex": ("keras.src.ops.math", "view_as_complex"),
+    "view_as_real": ("keras.src.ops.math", "view_as_real"),
+    "adaptive_average_pool": ("keras.src.ops.nn", "adaptive_average_pool"),
+    "adaptive_max_pool": ("keras.src.ops.nn", "adaptive_max_pool"),
+    "average_pool": ("keras.src.ops.nn", "average_pool"),
+    "batch_normalization": ("keras.src.ops.nn", "batch_normalization"),
+    "binary_crossentropy": ("keras.src.ops.nn", "binary_crossentropy"),
+    "categorical_crossentropy": (
+        "keras.src.ops.nn",
+        "categorical_crossentropy",
+    ),
+    "celu": ("keras.src.ops.nn", "celu"),
+    "conv": ("keras.src.ops.nn", "conv"),
+    "conv_transpose": ("keras.src.ops.nn", "conv_transpose"),
+    "ctc_decode": ("keras.src.ops.nn", "ctc_decode"),
+    "ctc_loss": ("keras.src.ops.nn", "ctc_loss"),
+    "depthwise_conv": ("keras.src.ops.nn", "depthwise_conv"),
+    "dot_product_attention": ("keras.src.ops.nn", "dot_product_attention"),
+    "elu": ("keras.src.ops.nn", "elu"),
+    "gelu": ("keras.src.ops.nn", "gelu"),
+    "glu": ("keras.src.ops.nn", "glu"),
+    "hard_shrink": ("keras.src.ops.nn", "hard_shrink"),
+    "hard_sigmoid": ("keras.src.ops.nn", "hard_sigmoid"),
+    "hard_silu": ("keras.src.ops.nn", "hard_silu"),
+    "hard_swish": ("keras.src.ops.nn", "hard_silu"),
+    "hard_tanh": ("keras.src.ops.nn", "hard_tanh"),
+    "layer_normalization": ("keras.src.ops.nn", "layer_normalization"),
+    "leaky_relu": ("keras.src.ops.nn", "leaky_relu"),
+    "log_sigmoid": ("keras.src.ops.nn", "log_sigmoid"),
+    "log_softmax": ("keras.src.ops.nn", "log_softmax"),
+    "max_pool": ("keras.src.ops.nn", "max_pool"),
+    "moments": ("keras.src.ops.nn", "moments"),
+    "multi_hot": ("keras.src.ops.nn", "multi_hot"),
+    "normalize": ("keras.src.ops.nn", "normalize"),
+    "one_hot": ("keras.src.ops.nn", "one_hot"),
+    "polar": ("keras.src.ops.nn", "polar"),
+    "psnr": ("keras.src.ops.nn", "psnr"),
+    "relu": ("keras.src.ops.nn", "relu"),
+    "relu6": ("keras.src.ops.nn", "relu6"),
+    "rms_normalization": ("keras.src.ops.nn", "rms_normalization"),
+    "selu": ("keras.src.ops.nn", "selu"),
+    "separable_conv": ("keras.src.ops.nn", "separable_conv"),
+    "sigmoid": ("keras.src.ops.nn", "sigmoid"),
+    "silu": ("keras.src.ops.nn", "silu"),
+    "swish": ("keras.src.ops.nn", "silu"),
+    "soft_shrink": ("keras.src.ops.nn", "soft_shrink"),
+    "softmax": ("keras.src.ops.nn", "softmax"),
+    "softplus": ("keras.src.ops.nn", "softplus"),
+    "softsign": ("keras.src.ops.nn", "softsign"),
+    "sparse_categorical_crossentropy": (
+        "keras.src.ops.nn",
+        "sparse_categorical_crossentropy",
+    ),
+    "sparse_plus": ("keras.src.ops.nn", "sparse_plus"),
+    "sparse_sigmoid": ("keras.src.ops.nn", "sparse_sigmoid"),
+    "sparsemax": ("keras.src.ops.nn", "sparsemax"),
+    "squareplus": ("keras.src.ops.nn", "squareplus"),
+    "tanh_shrink": ("keras.src.ops.nn", "tanh_shrink"),
+    "threshold": ("keras.src.ops.nn", "threshold"),
+    "unfold": ("keras.src.ops.nn", "unfold"),
+    "abs": ("keras.src.ops.numpy", "abs"),
+    "absolute": ("keras.src.ops.numpy", "absolute"),
+    "add": ("keras.src.ops.numpy", "add"),
+    "all": ("keras.src.ops.numpy", "all"),
+    "amax": ("keras.src.ops.numpy", "amax"),
+    "amin": ("keras.src.ops.numpy", "amin"),
+    "angle": ("keras.src.ops.numpy", "angle"),
+    "any": ("keras.src.ops.numpy", "any"),
+    "append": ("keras.src.ops.numpy", "append"),
+    "arange": ("keras.src.ops.numpy", "arange"),
+    "arccos": ("keras.src.ops.numpy", "arccos"),
+    "arccosh": ("keras.src.ops.numpy", "arccosh"),
+    "arcsin": ("keras.src.ops.numpy", "arcsin"),
+    "arcsinh": ("keras.src.ops.numpy", "arcsinh"),
+    "arctan": ("keras.src.ops.numpy", "arctan"),
+    "arctan2": ("keras.src.ops.numpy", "arctan2"),
+    "arctanh": ("keras.src.ops.numpy", "arctanh"),
+    "argmax": ("keras.src.ops.numpy", "argmax"),
+    "argmin": ("keras.src.ops.numpy", "argmin"),
+    "argpartition": ("keras.src.ops.numpy", "argpartition"),
+    "argsort": ("keras.src.ops.numpy", "argsort"),
+    "array": ("keras.src.ops.numpy", "array"),
+    "array_split": ("keras.src.ops.numpy", "array_split"),
+    "average": ("keras.src.ops.numpy", "average"),
+    "bartlett": ("keras.src.ops.numpy", "bartlett"),
+    "bincount": ("keras.src.ops.numpy", "bincount"),
+    "bitwise_and": ("keras.src.ops.numpy", "bitwise_and"),
+    "bitwise_invert": ("keras.src.ops.numpy", "bitwise_invert"),
+    "bitwise_left_shift": ("keras.src.ops.numpy", "bitwise_left_shift"),
+    "bitwise_not": ("keras.src.ops.numpy", "bitwise_not"),
+    "bitwise_or": ("keras.src.ops.numpy", "bitwise_or"),
+    "bitwise_right_shift": ("keras.src.ops.numpy", "bitwise_right_shift"),
+    "bitwise_xor": ("keras.src.ops.numpy", "bitwise_xor"),
+    "blackman": ("keras.src.ops.numpy", "blackman"),
+    "broadcast_to": ("keras.src.ops.numpy", "broadcast_to"),
+    "cbrt": ("keras.src.ops.numpy", "cbrt"),
+    "ceil": ("keras.src.ops.numpy", "ceil"),
+    "clip": ("keras.src.ops.numpy", "clip"),
+    "concatenate": ("keras.src.ops.numpy", "concatenate"),
+    "conj": ("keras.src.ops.numpy", "conj"),
+    "conjugate": ("keras.src.ops.numpy", "conjugate"),
+    "copy": ("keras.src.ops.numpy", "copy"),
+    "corrcoef": ("keras.src.ops.numpy", "corrcoef"),
+    "correlate": ("keras.src.ops.numpy", "correlate"),
+    "cos": ("keras.src.ops.numpy", "cos"),
+    "cosh": ("keras.src.ops.numpy", "cosh"),
+    "count_nonzero": ("keras.src.ops.numpy", "count_nonzero"),
+    "cross": ("keras.src.ops.numpy", "cross"),
+    "cumprod": ("keras.src.ops.numpy", "cumprod"),
+    "cumsum": ("keras.src.ops.numpy", "cumsum"),
+    "deg2rad": ("keras.src.ops.numpy", "deg2rad"),
+    "diag": ("keras.src.ops.numpy", "diag"),
+    "diagflat": ("keras.src.ops.numpy", "diagflat"),
+    "diagonal": ("keras.src.ops.numpy", "diagonal"),
+    "diff": ("keras.src.ops.numpy", "diff"),
+    "digitize": ("keras.src.ops.numpy", "digitize"),
+    "divide": ("keras.src.ops.numpy", "divide"),
+    "divide_no_nan": ("keras.src.ops.numpy", "divide_no_nan"),
+    "dot": ("keras.src.ops.numpy", "dot"),
+    "einsum": ("keras.src.ops.numpy", "einsum"),
+    "empty": ("keras.src.ops.numpy", "empty"),
+    "empty_like": ("keras.src.ops.numpy", "empty_like"),
+    "equal": ("keras.src.ops.numpy", "equal"),
+    "exp": ("keras.src.ops.numpy", "exp"),
+    "exp2": ("keras.src.ops.numpy", "exp2"),
+    "expand_dims": ("keras.src.ops.numpy", "expand_dims"),
+    "expm1": ("keras.src.ops.numpy", "expm1"),
+    "eye": ("keras.src.ops.numpy", "eye"),
+    "flip": ("keras.src.ops.numpy", "flip"),
+    "floor": ("keras.src.ops.numpy", "floor"),
+    "floor_divide": ("keras.src.ops.numpy", "floor_divide"),
+    "full": ("keras.src.ops.numpy", "full"),
+    "full_like": ("keras.src.ops.numpy", "full_like"),
+    "gcd": ("keras.src.ops.numpy", "gcd"),
+    "get_item": ("keras.src.ops.numpy", "get_item"),
+    "greater": ("keras.src.ops.numpy", "greater"),
+    "greater_equal": ("keras.src.ops.numpy", "greater_equal"),
+    "hamming": ("keras.src.ops.numpy", "hamming"),
+    "hanning": ("keras.src.ops.numpy", "hanning"),
+    "heaviside": ("keras.src.ops.numpy", "heaviside"),
+    "histogram": ("keras.src.ops.numpy", "histogram"),
+    "hstack": ("keras.src.ops.numpy", "hstack"),
+    "hypot": ("keras.src.ops.numpy", "hypot"),
+    "identity": ("keras.src.ops.numpy", "identity"),
+    "imag": ("keras.src.ops.numpy", "imag"),
+    "inner": ("keras.src.ops.numpy", "inner"),
+    "isclose": ("keras.src.ops.numpy", "isclose"),
+    "isfinite": ("keras.src.ops.numpy", "isfinite"),
+    "isin": ("keras.src.ops.numpy", "isin"),
+    "isinf": ("keras.src.ops.numpy", "isinf"),
+    "isnan": ("keras.src.ops.numpy", "isnan"),
+    "isneginf": ("keras.src.ops.numpy", "isneginf"),
+    "isposinf": ("keras.src.ops.numpy", "isposinf"),
+    "isreal": ("keras.src.ops.numpy", "isreal"),
+    "kaiser": ("keras.src.ops.numpy", "kaiser"),
+    "kron": ("keras.src.ops.numpy", "kron"),
+    "lcm": ("keras.src.ops.numpy", "lcm"),
+    "ldexp": ("keras.src.ops.numpy", "ldexp"),
+    "left_shift": ("keras.src.ops.numpy", "left_shift"),
+    "less": ("keras.src.ops.numpy", "less"),
+    "less_equal": ("keras.src.ops.numpy", "less_equal"),
+    "linspace": ("keras.src.ops.numpy", "linspace"),
+    "log": ("keras.src.ops.numpy", "log"),
+    "log1p": ("keras.src.ops.numpy", "log1p"),
+    "log2": ("keras.src.ops.numpy", "log2"),
+    "log10": ("keras.src.ops.numpy", "log10"),
+    "logaddexp": ("keras.src.ops.numpy", "logaddexp"),
+    "logaddexp2": ("keras.src.ops.numpy", "logaddexp2"),
+    "logical_and": ("keras.src.ops.numpy", "logical_and"),
+    "logical_not": ("keras.src.ops.numpy", "logical_not"),
+    "logical_or": ("keras.src.ops.numpy", "logical_or"),
+    "logical_xor": ("keras.src.ops.numpy", "logical_xor"),
+    "logspace": ("keras.src.ops.numpy", "logspace"),
+    "matmul": ("keras.src.ops.numpy", "matmul"),
+    "max": ("keras.src.ops.numpy", "max"),
+    "maximum": ("keras.src.ops.numpy", "maximum"),
+    "mean": ("keras.src.ops.numpy", "mean"),
+    "median": ("keras.src.ops.numpy", "median"),
+    "meshgrid": ("keras.src.ops.numpy", "meshgrid"),
+    "min": ("keras.src.ops.numpy", "min"),
+    "minimum": ("keras.src.ops.numpy", "minimum"),
+    "mod": ("keras.src.ops.numpy", "mod"),
+    "moveaxis": ("keras.src.ops.numpy", "moveaxis"),
+    "multiply": ("keras.src.ops.numpy", "multiply"),
+    "nan_to_num": ("keras.src.ops.numpy", "nan_to_num"),
+    "ndim": ("keras.src.ops.numpy", "ndim"),
+    "negative": ("keras.src.ops.numpy", "negative"),
+    "nonzero": ("keras.src.ops.numpy", "nonzero"),
+    "not_equal": ("keras.src.ops.numpy", "not_equal"),
+    "ones": ("keras.src.ops.numpy", "ones"),
+    "ones_like": ("keras.src.ops.numpy", "ones_like"),
+    "outer": ("keras.src.ops.numpy", "outer"),
+    "pad": ("keras.src.ops.numpy", "pad"),
+    "power": ("keras.src.ops.numpy", "power"),
+    "prod": ("keras.src.ops.numpy", "prod"),
+    "quantile": ("keras.src.ops.numpy", "quantile"),
+    "ravel": ("keras.src.ops.numpy", "ravel"),
+    "real": ("keras.src.ops.numpy", "real"),
+    "reciprocal": ("keras.src.ops.numpy", "reciprocal"),
+    "repeat": ("keras.src.ops.numpy", "repeat"),
+    "reshape": ("keras.src.ops.numpy", "reshape"),
+    "right_shift": ("keras.src.ops.numpy", "right_shift"),
+    "roll": ("keras.src.ops.numpy", "roll"),
+    "rot90": ("keras.src.ops.numpy", "rot90"),
+    "round": ("keras.src.ops.numpy", "round"),
+    "searchsorted": ("keras.src.ops.numpy", "searchsorted"),
+    "select": ("keras.src.ops.numpy", "select"),
+    "sign": ("keras.src.ops.numpy", "sign"),
+    "signbit": ("keras.src.ops.numpy", "signbit"),
+    "sin": ("keras.src.ops.numpy", "sin"),
+    "sinh": ("keras.src.ops.numpy", "sinh"),
+    "size": ("keras.src.ops.numpy", "size"),
+    "slogdet": ("keras.src.ops.numpy", "slogdet"),
+    "sort": ("keras.src.ops.numpy", "sort"),
+    "split": ("keras.src.ops.numpy", "split"),
+    "sqrt": ("keras.src.ops.numpy", "sqrt"),
+    "square": ("keras.src.ops.numpy", "square"),
+    "squeeze": ("keras.src.ops.numpy", "squeeze"),
+    "stack": ("keras.src.ops.numpy", "stack"),
+    "std": ("keras.src.ops.numpy", "std"),
+    "subtract": ("keras.src.ops.numpy", "subtract"),
+    "sum": ("keras.src.ops.numpy", "sum"),
+    "swapaxes": ("keras.src.ops.numpy", "swapaxes"),
+    "take": ("keras.src.ops.numpy", "take"),
+    "take_along_axis": ("keras.src.ops.numpy", "take_along_axis"),
+    "tan": ("keras.src.ops.numpy", "tan"),
+    "tanh": ("keras.src.ops.numpy", "tanh"),
+    "tensordot": ("keras.src.ops.numpy", "tensordot"),
+    "tile": ("keras.src.ops.numpy", "tile"),
+    "trace": ("keras.src.ops.numpy", "trace"),
+    "transpose": ("keras.src.ops.numpy", "transpose"),
+    "trapezoid": ("keras.src.ops.numpy", "trapezoid"),
+    "tri": ("keras.src.ops.numpy", "tri"),
+    "tril": ("keras.src.ops.numpy", "tril"),
+    "triu": ("keras.src.ops.numpy", "triu"),
+    "true_divide": ("keras.src.ops.numpy", "true_divide"),
+    "trunc": ("keras.src.ops.numpy", "trunc"),
+    "unravel_index": ("keras.src.ops.numpy", "unravel_index"),
+    "vander": ("keras.src.ops.numpy", "vander"),
+    "var": ("keras.src.ops.numpy", "var"),
+    "vdot": ("keras.src.ops.numpy", "vdot"),
+    "vectorize": ("keras.src.ops.numpy", "vectorize"),
+    "view": ("keras.src.ops.numpy", "view"),
+    "vstack": ("keras.src.ops.numpy", "vstack"),
+    "where": ("keras.src.ops.numpy", "where"),
+    "zeros": ("keras.src.ops.numpy", "zeros"),
+    "zeros_like": ("keras.src.ops.numpy", "zeros_like"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
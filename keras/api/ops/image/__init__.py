@@ -4,17 +4,59 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.ops.image import affine_transform as affine_transform
-from keras.src.ops.image import crop_images as crop_images
-from keras.src.ops.image import elastic_transform as elastic_transform
-from keras.src.ops.image import extract_patches as extract_patches
-from keras.src.ops.image import extract_patches_3d as extract_patches_3d
-from keras.src.ops.image import gaussian_blur as gaussian_blur
-from keras.src.ops.image import hsv_to_rgb as hsv_to_rgb
-from keras.src.ops.image import map_coordinates as map_coordinates
-from keras.src.ops.image import pad_images as pad_images
-from keras.src.ops.image import perspective_transform as perspective_transform
-from keras.src.ops.image import resize as resize
-from keras.src.ops.image import rgb_to_grayscale as rgb_to_grayscale
-from keras.src.ops.image import rgb_to_hsv as rgb_to_hsv
-from keras.src.ops.image import scale_and_translate as scale_and_translate
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.ops.image import affine_transform as affine_transform
+    from keras.src.ops.image import crop_images as crop_images
+    from keras.src.ops.image import elastic_transform as elastic_transform
+    from keras.src.ops.image import extract_patches as extract_patches
+    from keras.src.ops.image import extract_patches_3d as extract_patches_3d
+    from keras.src.ops.image import gaussian_blur as gaussian_blur
+    from keras.src.ops.image import hsv_to_rgb as hsv_to_rgb
+    from keras.src.ops.image import map_coordinates as map_coordinates
+    from keras.src.ops.image import pad_images as pad_images
+    from keras.src.ops.image import (
+        perspective_transform as perspective_transform,
+    )
+    from keras.src.ops.image import resize as resize
+    from keras.src.ops.image import rgb_to_grayscale as rgb_to_grayscale
+    from keras.src.ops.image import rgb_to_hsv as rgb_to_hsv
+    from keras.src.ops.image import scale_and_translate as scale_and_translate
+
+_LAZY_ATTRIBUTES = {
+    "affine_transform": ("keras.src.ops.image", "affine_transform"),
+    "crop_images": ("keras.src.ops.image", "crop_images"),
+    "elastic_transform": ("keras.src.ops.image", "elastic_transform"),
+    "extract_patches": ("keras.src.ops.image", "extract_patches"),
+    "extract_patches_3d": ("keras.src.ops.image", "extract_patches_3d"),
+    "gaussian_blur": ("keras.src.ops.image", "gaussian_blur"),
+    "hsv_to_rgb": ("keras.src.ops.image", "hsv_to_rgb"),
+    "map_coordinates": ("keras.src.ops.image", "map_coordinates"),
+    "pad_images": ("keras.src.ops.image", "pad_images"),
+    "perspective_transform": ("keras.src.ops.image", "perspective_transform"),
+    "resize": ("keras.src.ops.image", "resize"),
+    "rgb_to_grayscale": ("keras.src.ops.image", "rgb_to_grayscale"),
+    "rgb_to_hsv": ("keras.src.ops.image", "rgb_to_hsv"),
+    "scale_and_translate": ("keras.src.ops.image", "scale_and_translate"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,25 +4,74 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.optimizers import legacy as legacy
-from keras.optimizers import schedules as schedules
-from keras.src.optimizers import deserialize as deserialize
-from keras.src.optimizers import get as get
-from keras.src.optimizers import serialize as serialize
-from keras.src.optimizers.adadelta import Adadelta as Adadelta
-from keras.src.optimizers.adafactor import Adafactor as Adafactor
-from keras.src.optimizers.adagrad import Adagrad as Adagrad
-from keras.src.optimizers.adam import Adam as Adam
-from keras.src.optimizers.adamax import Adamax as Adamax
-from keras.src.optimizers.adamw import AdamW as AdamW
-from keras.src.optimizers.ftrl import Ftrl as Ftrl
-from keras.src.optimizers.lamb import Lamb as Lamb
-from keras.src.optimizers.lion import Lion as Lion
-from keras.src.optimizers.loss_scale_optimizer import (
-    LossScaleOptimizer as LossScaleOptimizer,
-)
-from keras.src.optimizers.muon import Muon as Muon
-from keras.src.optimizers.nadam import Nadam as Nadam
-from keras.src.optimizers.optimizer import Optimizer as Optimizer
-from keras.src.optimizers.rmsprop import RMSprop as RMSprop
-from keras.src.optimizers.sgd import SGD as SGD
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.optimizers import legacy as legacy
+    from keras.optimizers import schedules as schedules
+    from keras.src.optimizers import deserialize as deserialize
+    from keras.src.optimizers import get as get
+    from keras.src.optimizers import serialize as serialize
+    from keras.src.optimizers.adadelta import Adadelta as Adadelta
+    from keras.src.optimizers.adafactor import Adafactor as Adafactor
+    from keras.src.optimizers.adagrad import Adagrad as Adagrad
+    from keras.src.optimizers.adam import Adam as Adam
+    from keras.src.optimizers.adamax import Adamax as Adamax
+    from keras.src.optimizers.adamw import AdamW as AdamW
+    from keras.src.optimizers.ftrl import Ftrl as Ftrl
+    from keras.src.optimizers.lamb import Lamb as Lamb
+    from keras.src.optimizers.lion import Lion as Lion
+    from keras.src.optimizers.loss_scale_optimizer import (
+        LossScaleOptimizer as LossScaleOptimizer,
+    )
+    from keras.src.optimizers.muon import Muon as Muon
+    from keras.src.optimizers.nadam import Nadam as Nadam
+    from keras.src.optimizers.optimizer import Optimizer as Optimizer
+    from keras.src.optimizers.rmsprop import RMSprop as RMSprop
+    from keras.src.optimizers.sgd import SGD as SGD
+
+_LAZY_ATTRIBUTES = {
+    "legacy": ("keras.optimizers.legacy", None),
+    "schedules": ("keras.optimizers.schedules", None),
+    "deserialize": ("keras.src.optimizers", "deserialize"),
+    "get": ("keras.src.optimizers", "get"),
+    "serialize": ("keras.src.optimizers", "serialize"),
+    "Adadelta": ("keras.src.optimizers.adadelta", "Adadelta"),
+    "Adafactor": ("keras.src.optimizers.adafactor", "Adafactor"),
+    "Adagrad": ("keras.src.optimizers.adagrad", "Adagrad"),
+    "Adam": ("keras.src.optimizers.adam", "Adam"),
+    "Adamax": ("keras.src.optimizers.adamax", "Adamax"),
+    "AdamW": ("keras.src.optimizers.adamw", "AdamW"),
+    "Ftrl": ("keras.src.optimizers.ftrl", "Ftrl"),
+    "Lamb": ("keras.src.optimizers.lamb", "Lamb"),
+    "Lion": ("keras.src.optimizers.lion", "Lion"),
+    "LossScaleOptimizer": (
+        "keras.src.optimizers.loss_scale_optimizer",
+        "LossScaleOptimizer",
+    ),
+    "Muon": ("keras.src.optimizers.muon", "Muon"),
+    "Nadam": ("keras.src.optimizers.nadam", "Nadam"),
+    "Optimizer": ("keras.src.optimizers.optimizer", "Optimizer"),
+    "RMSprop": ("keras.src.optimizers.rmsprop", "RMSprop"),
+    "SGD": ("keras.src.optimizers.sgd", "SGD"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,14 +4,54 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.preprocessing import image as image
-from keras.preprocessing import sequence as sequence
-from keras.src.utils.image_dataset_utils import (
-    image_dataset_from_directory as image_dataset_from_directory,
-)
-from keras.src.utils.text_dataset_utils import (
-    text_dataset_from_directory as text_dataset_from_directory,
-)
-from keras.src.utils.timeseries_dataset_utils import (
-    timeseries_dataset_from_array as timeseries_dataset_from_array,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.preprocessing import image as image
+    from keras.preprocessing import sequence as sequence
+    from keras.src.utils.image_dataset_utils import (
+        image_dataset_from_directory as image_dataset_from_directory,
+    )
+    from keras.src.utils.text_dataset_utils import (
+        text_dataset_from_directory as text_dataset_from_directory,
+    )
+    from keras.src.utils.timeseries_dataset_utils import (
+        timeseries_dataset_from_array as timeseries_dataset_from_array,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "image": ("keras.preprocessing.image", None),
+    "sequence": ("keras.preprocessing.sequence", None),
+    "image_dataset_from_directory": (
+        "keras.src.utils.image_dataset_utils",
+        "image_dataset_from_directory",
+    ),
+    "text_dataset_from_directory": (
+        "keras.src.utils.text_dataset_utils",
+        "text_dataset_from_directory",
+    ),
+    "timeseries_dataset_from_array": (
+        "keras.src.utils.timeseries_dataset_utils",
+        "timeseries_dataset_from_array",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
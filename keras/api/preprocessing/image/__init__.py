@@ -4,8 +4,39 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.utils.image_utils import array_to_img as array_to_img
-from keras.src.utils.image_utils import img_to_array as img_to_array
-from keras.src.utils.image_utils import load_img as load_img
-from keras.src.utils.image_utils import save_img as save_img
-from keras.src.utils.image_utils import smart_resize as smart_resize
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.utils.image_utils import array_to_img as array_to_img
+    from keras.src.utils.image_utils import img_to_array as img_to_array
+    from keras.src.utils.image_utils import load_img as load_img
+    from keras.src.utils.image_utils import save_img as save_img
+    from keras.src.utils.image_utils import smart_resize as smart_resize
+
+_LAZY_ATTRIBUTES = {
+    "array_to_img": ("keras.src.utils.image_utils", "array_to_img"),
+    "img_to_array": ("keras.src.utils.image_utils", "img_to_array"),
+    "load_img": ("keras.src.utils.image_utils", "load_img"),
+    "save_img": ("keras.src.utils.image_utils", "save_img"),
+    "smart_resize": ("keras.src.utils.image_utils", "smart_resize"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
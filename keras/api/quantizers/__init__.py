@@ -4,36 +4,159 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.quantizers import deserialize as deserialize
-from keras.src.quantizers import get as get
-from keras.src.quantizers import serialize as serialize
-from keras.src.quantizers.gptq_config import GPTQConfig as GPTQConfig
-from keras.src.quantizers.quantization_config import (
-    Float8QuantizationConfig as Float8QuantizationConfig,
-)
-from keras.src.quantizers.quantization_config import (
-    Int4QuantizationConfig as Int4QuantizationConfig,
-)
-from keras.src.quantizers.quantization_config import (
-    Int8QuantizationConfig as Int8QuantizationConfig,
-)
-from keras.src.quantizers.quantization_config import (
-    QuantizationConfig as QuantizationConfig,
-)
-from keras.src.quantizers.quantizers import AbsMaxQuantizer as AbsMaxQuantizer
-from keras.src.quantizers.quantizers import Quantizer as Quantizer
-from keras.src.quantizers.quantizers import abs_max_quantize as abs_max_quantize
-from keras.src.quantizers.quantizers import (
-    compute_float8_amax_history as compute_float8_amax_history,
-)
-from keras.src.quantizers.quantizers import (
-    compute_float8_scale as compute_float8_scale,
-)
-from keras.src.quantizers.quantizers import (
-    fake_quant_with_min_max_vars as fake_quant_with_min_max_vars,
-)
-from keras.src.quantizers.quantizers import pack_int4 as pack_int4
-from keras.src.quantizers.quantizers import (
-    quantize_and_dequantize as quantize_and_dequantize,
-)
-from keras.src.quantizers.quantizers import unpack_int4 as unpack_int4
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.quantizers import deserialize as deserialize
+    from keras.src.quantizers import get as get
+    from keras.src.quantizers import serialize as serialize
+    from keras.src.quantizers.gptq_config import GPTQConfig as GPTQConfig
+    from keras.src.quantizers.mixed_precision import (
+        apply_dtype_policy_map as apply_dtype_policy_map,
+    )
+    from keras.src.quantizers.mixed_precision import (
+        compute_layer_sensitivity as compute_layer_sensitivity,
+    )
+    from keras.src.quantizers.mixed_precision import (
+        plan_mixed_precision as plan_mixed_precision,
+    )
+    from keras.src.quantizers.observers import MinMaxObserver as MinMaxObserver
+    from keras.src.quantizers.observers import (
+        MovingAverageMinMaxObserver as MovingAverageMinMaxObserver,
+    )
+    from keras.src.quantizers.observers import MSEObserver as MSEObserver
+    from keras.src.quantizers.observers import Observer as Observer
+    from keras.src.quantizers.observers import (
+        PercentileObserver as PercentileObserver,
+    )
+    from keras.src.quantizers.quantization_config import (
+        Float8QuantizationConfig as Float8QuantizationConfig,
+    )
+    from keras.src.quantizers.quantization_config import (
+        Int4QuantizationConfig as Int4QuantizationConfig,
+    )
+    from keras.src.quantizers.quantization_config import (
+        Int8QuantizationConfig as Int8QuantizationConfig,
+    )
+    from keras.src.quantizers.quantization_config import (
+        QuantizationConfig as QuantizationConfig,
+    )
+    from keras.src.quantizers.quantization_config import (
+        StaticInt8QuantizationConfig as StaticInt8QuantizationConfig,
+    )
+    from keras.src.quantizers.quantizers import (
+        AbsMaxQuantizer as AbsMaxQuantizer,
+    )
+    from keras.src.quantizers.quantizers import Quantizer as Quantizer
+    from keras.src.quantizers.quantizers import (
+        StaticQuantizer as StaticQuantizer,
+    )
+    from keras.src.quantizers.quantizers import (
+        abs_max_quantize as abs_max_quantize,
+    )
+    from keras.src.quantizers.quantizers import (
+        compute_float8_amax_history as compute_float8_amax_history,
+    )
+    from keras.src.quantizers.quantizers import (
+        compute_float8_scale as compute_float8_scale,
+    )
+    from keras.src.quantizers.quantizers import (
+        fake_quant_with_min_max_vars as fake_quant_with_min_max_vars,
+    )
+    from keras.src.quantizers.quantizers import pack_int4 as pack_int4
+    from keras.src.quantizers.quantizers import (
+        quantize_and_dequantize as quantize_and_dequantize,
+    )
+    from keras.src.quantizers.quantizers import unpack_int4 as unpack_int4
+
+_LAZY_ATTRIBUTES = {
+    "deserialize": ("keras.src.quantizers", "deserialize"),
+    "get": ("keras.src.quantizers", "get"),
+    "serialize": ("keras.src.quantizers", "serialize"),
+    "GPTQConfig": ("keras.src.quantizers.gptq_config", "GPTQConfig"),
+    "apply_dtype_policy_map": (
+        "keras.src.quantizers.mixed_precision",
+        "apply_dtype_policy_map",
+    ),
+    "compute_layer_sensitivity": (
+        "keras.src.quantizers.mixed_precision",
+        "compute_layer_sensitivity",
+    ),
+    "plan_mixed_precision": (
+        "keras.src.quantizers.mixed_precision",
+        "plan_mixed_precision",
+    ),
+    "MSEObserver": ("keras.src.quantizers.observers", "MSEObserver"),
+    "MinMaxObserver": ("keras.src.quantizers.observers", "MinMaxObserver"),
+    "MovingAverageMinMaxObserver": (
+        "keras.src.quantizers.observers",
+        "MovingAverageMinMaxObserver",
+    ),
+    "Observer": ("keras.src.quantizers.observers", "Observer"),
+    "PercentileObserver": (
+        "keras.src.quantizers.observers",
+        "PercentileObserver",
+    ),
+    "Float8QuantizationConfig": (
+        "keras.src.quantizers.quantization_config",
+        "Float8QuantizationConfig",
+    ),
+    "Int4QuantizationConfig": (
+        "keras.src.quantizers.quantization_config",
+        "Int4QuantizationConfig",
+    ),
+    "Int8QuantizationConfig": (
+        "keras.src.quantizers.quantization_config",
+        "Int8QuantizationConfig",
+    ),
+    "QuantizationConfig": (
+        "keras.src.quantizers.quantization_config",
+        "QuantizationConfig",
+    ),
+    "StaticInt8QuantizationConfig": (
+        "keras.src.quantizers.quantization_config",
+        "StaticInt8QuantizationConfig",
+    ),
+    "AbsMaxQuantizer": ("keras.src.quantizers.quantizers", "AbsMaxQuantizer"),
+    "Quantizer": ("keras.src.quantizers.quantizers", "Quantizer"),
+    "StaticQuantizer": ("keras.src.quantizers.quantizers", "StaticQuantizer"),
+    "abs_max_quantize": ("keras.src.quantizers.quantizers", "abs_max_quantize"),
+    "compute_float8_amax_history": (
+        "keras.src.quantizers.quantizers",
+        "compute_float8_amax_history",
+    ),
+    "compute_float8_scale": (
+        "keras.src.quantizers.quantizers",
+        "compute_float8_scale",
+    ),
+    "fake_quant_with_min_max_vars": (
+        "keras.src.quantizers.quantizers",
+        "fake_quant_with_min_max_vars",
+    ),
+    "pack_int4": ("keras.src.quantizers.quantizers", "pack_int4"),
+    "quantize_and_dequantize": (
+        "keras.src.quantizers.quantizers",
+        "quantize_and_dequantize",
+    ),
+    "unpack_int4": ("keras.src.quantizers.quantizers", "unpack_int4"),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
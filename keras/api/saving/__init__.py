@@ -4,32 +4,95 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.saving.file_editor import KerasFileEditor as KerasFileEditor
-from keras.src.saving.object_registration import (
-    CustomObjectScope as CustomObjectScope,
-)
-from keras.src.saving.object_registration import (
-    CustomObjectScope as custom_object_scope,
-)
-from keras.src.saving.object_registration import (
-    get_custom_objects as get_custom_objects,
-)
-from keras.src.saving.object_registration import (
-    get_registered_name as get_registered_name,
-)
-from keras.src.saving.object_registration import (
-    get_registered_object as get_registered_object,
-)
-from keras.src.saving.object_registration import (
-    register_keras_serializable as register_keras_serializable,
-)
-from keras.src.saving.saving_api import load_model as load_model
-from keras.src.saving.saving_api import load_weights as load_weights
-from keras.src.saving.saving_api import save_model as save_model
-from keras.src.saving.saving_api import save_weights as save_weights
-from keras.src.saving.serialization_lib import (
-    deserialize_keras_object as deserialize_keras_object,
-)
-from keras.src.saving.serialization_lib import (
-    serialize_keras_object as serialize_keras_object,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.saving.file_editor import KerasFileEditor as KerasFileEditor
+    from keras.src.saving.object_registration import (
+        CustomObjectScope as CustomObjectScope,
+    )
+    from keras.src.saving.object_registration import (
+        CustomObjectScope as custom_object_scope,
+    )
+    from keras.src.saving.object_registration import (
+        get_custom_objects as get_custom_objects,
+    )
+    from keras.src.saving.object_registration import (
+        get_registered_name as get_registered_name,
+    )
+    from keras.src.saving.object_registration import (
+        get_registered_object as get_registered_object,
+    )
+    from keras.src.saving.object_registration import (
+        register_keras_serializable as register_keras_serializable,
+    )
+    from keras.src.saving.saving_api import load_model as load_model
+    from keras.src.saving.saving_api import load_weights as load_weights
+    from keras.src.saving.saving_api import save_model as save_model
+    from keras.src.saving.saving_api import save_weights as save_weights
+    from keras.src.saving.serialization_lib import (
+        deserialize_keras_object as deserialize_keras_object,
+    )
+    from keras.src.saving.serialization_lib import (
+        serialize_keras_object as serialize_keras_object,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "KerasFileEditor": ("keras.src.saving.file_editor", "KerasFileEditor"),
+    "CustomObjectScope": (
+        "keras.src.saving.object_registration",
+        "CustomObjectScope",
+    ),
+    "custom_object_scope": (
+        "keras.src.saving.object_registration",
+        "CustomObjectScope",
+    ),
+    "get_custom_objects": (
+        "keras.src.saving.object_registration",
+        "get_custom_objects",
+    ),
+    "get_registered_name": (
+        "keras.src.saving.object_registration",
+        "get_registered_name",
+    ),
+    "get_registered_object": (
+        "keras.src.saving.object_registration",
+        "get_registered_object",
+    ),
+    "register_keras_serializable": (
+        "keras.src.saving.object_registration",
+        "register_keras_serializable",
+    ),
+    "load_model": ("keras.src.saving.saving_api", "load_model"),
+    "load_weights": ("keras.src.saving.saving_api", "load_weights"),
+    "save_model": ("keras.src.saving.saving_api", "save_model"),
+    "save_weights": ("keras.src.saving.saving_api", "save_weights"),
+    "deserialize_keras_object": (
+        "keras.src.saving.serialization_lib",
+        "deserialize_keras_object",
+    ),
+    "serialize_keras_object": (
+        "keras.src.saving.serialization_lib",
+        "serialize_keras_object",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,87 +4,254 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.backend.common.global_state import clear_session as clear_session
-from keras.src.backend.common.keras_tensor import (
-    is_keras_tensor as is_keras_tensor,
-)
-from keras.src.backend.common.variables import (
-    standardize_dtype as standardize_dtype,
-)
-from keras.src.layers.preprocessing.feature_space import (
-    FeatureSpace as FeatureSpace,
-)
-from keras.src.ops.operation_utils import get_source_inputs as get_source_inputs
-from keras.src.saving.object_registration import (
-    CustomObjectScope as CustomObjectScope,
-)
-from keras.src.saving.object_registration import (
-    CustomObjectScope as custom_object_scope,
-)
-from keras.src.saving.object_registration import (
-    get_custom_objects as get_custom_objects,
-)
-from keras.src.saving.object_registration import (
-    get_registered_name as get_registered_name,
-)
-from keras.src.saving.object_registration import (
-    get_registered_object as get_registered_object,
-)
-from keras.src.saving.object_registration import (
-    register_keras_serializable as register_keras_serializable,
-)
-from keras.src.saving.serialization_lib import (
-    deserialize_keras_object as deserialize_keras_object,
-)
-from keras.src.saving.serialization_lib import (
-    serialize_keras_object as serialize_keras_object,
-)
-from keras.src.trainers.data_adapters.data_adapter_utils import (
-    pack_x_y_sample_weight as pack_x_y_sample_weight,
-)
-from keras.src.trainers.data_adapters.data_adapter_utils import (
-    unpack_x_y_sample_weight as unpack_x_y_sample_weight,
-)
-from keras.src.trainers.data_adapters.py_dataset_adapter import (
-    PyDataset as PyDataset,
-)
-from keras.src.trainers.data_adapters.py_dataset_adapter import (
-    PyDataset as Sequence,
-)
-from keras.src.utils.audio_dataset_utils import (
-    audio_dataset_from_directory as audio_dataset_from_directory,
-)
-from keras.src.utils.config import Config as Config
-from keras.src.utils.dataset_utils import split_dataset as split_dataset
-from keras.src.utils.file_utils import get_file as get_file
-from keras.src.utils.image_dataset_utils import (
-    image_dataset_from_directory as image_dataset_from_directory,
-)
-from keras.src.utils.image_utils import array_to_img as array_to_img
-from keras.src.utils.image_utils import img_to_array as img_to_array
-from keras.src.utils.image_utils import load_img as load_img
-from keras.src.utils.image_utils import save_img as save_img
-from keras.src.utils.io_utils import (
-    disable_interactive_logging as disable_interactive_logging,
-)
-from keras.src.utils.io_utils import (
-    enable_interactive_logging as enable_interactive_logging,
-)
-from keras.src.utils.io_utils import (
-    is_interactive_logging_enabled as is_interactive_logging_enabled,
-)
-from keras.src.utils.model_visualization import model_to_dot as model_to_dot
-from keras.src.utils.model_visualization import plot_model as plot_model
-from keras.src.utils.numerical_utils import normalize as normalize
-from keras.src.utils.numerical_utils import to_categorical as to_categorical
-from keras.src.utils.progbar import Progbar as Progbar
-from keras.src.utils.rng_utils import set_random_seed as set_random_seed
-from keras.src.utils.sequence_utils import pad_sequences as pad_sequences
-from keras.src.utils.text_dataset_utils import (
-    text_dataset_from_directory as text_dataset_from_directory,
-)
-from keras.src.utils.timeseries_dataset_utils import (
-    timeseries_dataset_from_array as timeseries_dataset_from_array,
-)
-from keras.utils import bounding_boxes as bounding_boxes
-from keras.utils import legacy as legacy
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.backend.common.global_state import (
+        clear_session as clear_session,
+    )
+    from keras.src.backend.common.keras_tensor import (
+        is_keras_tensor as is_keras_tensor,
+    )
+    from keras.src.backend.common.variables import (
+        standardize_dtype as standardize_dtype,
+    )
+    from keras.src.layers.preprocessing.feature_space import (
+        FeatureSpace as FeatureSpace,
+    )
+    from keras.src.ops.operation_utils import (
+        get_source_inputs as get_source_inputs,
+    )
+    from keras.src.saving.object_registration import (
+        CustomObjectScope as CustomObjectScope,
+    )
+    from keras.src.saving.object_registration import (
+        CustomObjectScope as custom_object_scope,
+    )
+    from keras.src.saving.object_registration import (
+        get_custom_objects as get_custom_objects,
+    )
+    from keras.src.saving.object_registration import (
+        get_registered_name as get_registered_name,
+    )
+    from keras.src.saving.object_registration import (
+        get_registered_object as get_registered_object,
+    )
+    from keras.src.saving.object_registration import (
+        register_keras_serializable as register_keras_serializable,
+    )
+    from keras.src.saving.serialization_lib import (
+        deserialize_keras_object as deserialize_keras_object,
+    )
+    from keras.src.saving.serialization_lib import (
+        serialize_keras_object as serialize_keras_object,
+    )
+    from keras.src.trainers.data_adapters.data_adapter_utils import (
+        pack_x_y_sample_weight as pack_x_y_sample_weight,
+    )
+    from keras.src.trainers.data_adapters.data_adapter_utils import (
+        unpack_x_y_sample_weight as unpack_x_y_sample_weight,
+    )
+    from keras.src.trainers.data_adapters.length_bucketing import (
+        LengthBucketing as LengthBucketing,
+    )
+    from keras.src.trainers.data_adapters.length_bucketing import (
+        pack_sequences as pack_sequences,
+    )
+    from keras.src.trainers.data_adapters.length_bucketing import (
+        packed_attention_mask as packed_attention_mask,
+    )
+    from keras.src.trainers.data_adapters.py_dataset_adapter import (
+        PyDataset as PyDataset,
+    )
+    from keras.src.trainers.data_adapters.py_dataset_adapter import (
+        PyDataset as Sequence,
+    )
+    from keras.src.trainers.shape_buckets import ShapeBuckets as ShapeBuckets
+    from keras.src.utils.audio_dataset_utils import (
+        audio_dataset_from_directory as audio_dataset_from_directory,
+    )
+    from keras.src.utils.config import Config as Config
+    from keras.src.utils.dataset_utils import split_dataset as split_dataset
+    from keras.src.utils.file_utils import get_file as get_file
+    from keras.src.utils.image_dataset_utils import (
+        image_dataset_from_directory as image_dataset_from_directory,
+    )
+    from keras.src.utils.image_utils import array_to_img as array_to_img
+    from keras.src.utils.image_utils import img_to_array as img_to_array
+    from keras.src.utils.image_utils import load_img as load_img
+    from keras.src.utils.image_utils import save_img as save_img
+    from keras.src.utils.io_utils import (
+        disable_interactive_logging as disable_interactive_logging,
+    )
+    from keras.src.utils.io_utils import (
+        enable_interactive_logging as enable_interactive_logging,
+    )
+    from keras.src.utils.io_utils import (
+        is_interactive_logging_enabled as is_interactive_logging_enabled,
+    )
+    from keras.src.utils.model_visualization import model_to_dot as model_to_dot
+    from keras.src.utils.model_visualization import plot_model as plot_model
+    from keras.src.utils.numerical_utils import normalize as normalize
+    from keras.src.utils.numerical_utils import to_categorical as to_categorical
+    from keras.src.utils.profiling_utils import ModelProfile as ModelProfile
+    from keras.src.utils.profiling_utils import profile_model as profile_model
+    from keras.src.utils.progbar import Progbar as Progbar
+    from keras.src.utils.remat_utils import RematPlan as RematPlan
+    from keras.src.utils.remat_utils import plan_remat as plan_remat
+    from keras.src.utils.rng_utils import set_random_seed as set_random_seed
+    from keras.src.utils.sequence_utils import pad_sequences as pad_sequences
+    from keras.src.utils.text_dataset_utils import (
+        text_dataset_from_directory as text_dataset_from_directory,
+    )
+    from keras.src.utils.timeseries_dataset_utils import (
+        timeseries_dataset_from_array as timeseries_dataset_from_array,
+    )
+    from keras.utils import bounding_boxes as bounding_boxes
+    from keras.utils import legacy as legacy
+
+_LAZY_ATTRIBUTES = {
+    "clear_session": ("keras.src.backend.common.global_state", "clear_session"),
+    "is_keras_tensor": (
+        "keras.src.backend.common.keras_tensor",
+        "is_keras_tensor",
+    ),
+    "standardize_dtype": (
+        "keras.src.backend.common.variables",
+        "standardize_dtype",
+    ),
+    "FeatureSpace": (
+        "keras.src.layers.preprocessing.feature_space",
+        "FeatureSpace",
+    ),
+    "get_source_inputs": ("keras.src.ops.operation_utils", "get_source_inputs"),
+    "CustomObjectScope": (
+        "keras.src.saving.object_registration",
+        "CustomObjectScope",
+    ),
+    "custom_object_scope": (
+        "keras.src.saving.object_registration",
+        "CustomObjectScope",
+    ),
+    "get_custom_objects": (
+        "keras.src.saving.object_registration",
+        "get_custom_objects",
+    ),
+    "get_registered_name": (
+        "keras.src.saving.object_registration",
+        "get_registered_name",
+    ),
+    "get_registered_object": (
+        "keras.src.saving.object_registration",
+        "get_registered_object",
+    ),
+    "register_keras_serializable": (
+        "keras.src.saving.object_registration",
+        "register_keras_serializable",
+    ),
+    "deserialize_keras_object": (
+        "keras.src.saving.serialization_lib",
+        "deserialize_keras_object",
+    ),
+    "serialize_keras_object": (
+        "keras.src.saving.serialization_lib",
+        "serialize_keras_object",
+    ),
+    "pack_x_y_sample_weight": (
+        "keras.src.trainers.data_adapters.data_adapter_utils",
+        "pack_x_y_sample_weight",
+    ),
+    "unpack_x_y_sample_weight": (
+        "keras.src.trainers.data_adapters.data_adapter_utils",
+        "unpack_x_y_sample_weight",
+    ),
+    "LengthBucketing": (
+        "keras.src.trainers.data_adapters.length_bucketing",
+        "LengthBucketing",
+    ),
+    "pack_sequences": (
+        "keras.src.trainers.data_adapters.length_bucketing",
+        "pack_sequences",
+    ),
+    "packed_attention_mask": (
+        "keras.src.trainers.data_adapters.length_bucketing",
+        "packed_attention_mask",
+    ),
+    "PyDataset": (
+        "keras.src.trainers.data_adapters.py_dataset_adapter",
+        "PyDataset",
+    ),
+    "Sequence": (
+        "keras.src.trainers.data_adapters.py_dataset_adapter",
+        "PyDataset",
+    ),
+    "ShapeBuckets": ("keras.src.trainers.shape_buckets", "ShapeBuckets"),
+    "audio_dataset_from_directory": (
+        "keras.src.utils.audio_dataset_utils",
+        "audio_dataset_from_directory",
+    ),
+    "Config": ("keras.src.utils.config", "Config"),
+    "split_dataset": ("keras.src.utils.dataset_utils", "split_dataset"),
+    "get_file": ("keras.src.utils.file_utils", "get_file"),
+    "image_dataset_from_directory": (
+        "keras.src.utils.image_dataset_utils",
+        "image_dataset_from_directory",
+    ),
+    "array_to_img": ("keras.src.utils.image_utils", "array_to_img"),
+    "img_to_array": ("keras.src.utils.image_utils", "img_to_array"),
+    "load_img": ("keras.src.utils.image_utils", "load_img"),
+    "save_img": ("keras.src.utils.image_utils", "save_img"),
+    "disable_interactive_logging": (
+        "keras.src.utils.io_utils",
+        "disable_interactive_logging",
+    ),
+    "enable_interactive_logging": (
+        "keras.src.utils.io_utils",
+        "enable_interactive_logging",
+    ),
+    "is_interactive_logging_enabled": (
+        "keras.src.utils.io_utils",
+        "is_interactive_logging_enabled",
+    ),
+    "model_to_dot": ("keras.src.utils.model_visualization", "model_to_dot"),
+    "plot_model": ("keras.src.utils.model_visualization", "plot_model"),
+    "normalize": ("keras.src.utils.numerical_utils", "normalize"),
+    "to_categorical": ("keras.src.utils.numerical_utils", "to_categorical"),
+    "ModelProfile": ("keras.src.utils.profiling_utils", "ModelProfile"),
+    "profile_model": ("keras.src.utils.profiling_utils", "profile_model"),
+    "Progbar": ("keras.src.utils.progbar", "Progbar"),
+    "RematPlan": ("keras.src.utils.remat_utils", "RematPlan"),
+    "plan_remat": ("keras.src.utils.remat_utils", "plan_remat"),
+    "set_random_seed": ("keras.src.utils.rng_utils", "set_random_seed"),
+    "pad_sequences": ("keras.src.utils.sequence_utils", "pad_sequences"),
+    "text_dataset_from_directory": (
+        "keras.src.utils.text_dataset_utils",
+        "text_dataset_from_directory",
+    ),
+    "timeseries_dataset_from_array": (
+        "keras.src.utils.timeseries_dataset_utils",
+        "timeseries_dataset_from_array",
+    ),
+    "bounding_boxes": ("keras.utils.bounding_boxes", None),
+    "legacy": ("keras.utils.legacy", None),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
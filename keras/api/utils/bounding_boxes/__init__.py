@@ -4,30 +4,92 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    affine_transform as affine_transform,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    clip_to_image_size as clip_to_image_size,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    convert_format as convert_format,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    crop as crop,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    decode_deltas_to_boxes as decode_deltas_to_boxes,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    encode_box_to_deltas as encode_box_to_deltas,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
-    pad as pad,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou import (
-    compute_ciou as compute_ciou,
-)
-from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou import (
-    compute_iou as compute_iou,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        affine_transform as affine_transform,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        clip_to_image_size as clip_to_image_size,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        convert_format as convert_format,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        crop as crop,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        decode_deltas_to_boxes as decode_deltas_to_boxes,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        encode_box_to_deltas as encode_box_to_deltas,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters import (
+        pad as pad,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou import (
+        compute_ciou as compute_ciou,
+    )
+    from keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou import (
+        compute_iou as compute_iou,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "affine_transform": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "affine_transform",
+    ),
+    "clip_to_image_size": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "clip_to_image_size",
+    ),
+    "convert_format": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "convert_format",
+    ),
+    "crop": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "crop",
+    ),
+    "decode_deltas_to_boxes": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "decode_deltas_to_boxes",
+    ),
+    "encode_box_to_deltas": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "encode_box_to_deltas",
+    ),
+    "pad": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.converters",
+        "pad",
+    ),
+    "compute_ciou": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou",
+        "compute_ciou",
+    ),
+    "compute_iou": (
+        "keras.src.layers.preprocessing.image_preprocessing.bounding_boxes.iou",
+        "compute_iou",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -4,9 +4,43 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
-from keras.src.legacy.saving.serialization import (
-    deserialize_keras_object as deserialize_keras_object,
-)
-from keras.src.legacy.saving.serialization import (
-    serialize_keras_object as serialize_keras_object,
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from keras.src.legacy.saving.serialization import (
+        deserialize_keras_object as deserialize_keras_object,
+    )
+    from keras.src.legacy.saving.serialization import (
+        serialize_keras_object as serialize_keras_object,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "deserialize_keras_object": (
+        "keras.src.legacy.saving.serialization",
+        "deserialize_keras_object",
+    ),
+    "serialize_keras_object": (
+        "keras.src.legacy.saving.serialization",
+        "serialize_keras_object",
+    ),
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+
+def __getattr__(name):
+    # The attributes are imported on first access, so that `import keras`
+    # doesn't import the whole of Keras and its backend.
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = _importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,8 +1,6 @@
 from keras.src import activations
-from keras.src import applications
 from keras.src import backend
 from keras.src import constraints
-from keras.src import datasets
 from keras.src import initializers
 from keras.src import layers
 from keras.src import models
@@ -10,7 +8,7 @@ from keras.src import ops
 from keras.src import optimizers
 from keras.src import regularizers
 from keras.src import utils
-from keras.src import visualization
+from keras.src.api_export import lazy_module_attributes
 from keras.src.backend import KerasTensor
 from keras.src.layers import Input
 from keras.src.layers import Layer
@@ -18,3 +16,14 @@ from keras.src.models import Functional
 from keras.src.models import Model
 from keras.src.models import Sequential
 from keras.src.version import __version__
+
+# The model builders, datasets and plotting utilities are only imported on
+# first access.
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "applications": ("keras.src.applications", None),
+        "datasets": ("keras.src.datasets", None),
+        "visualization": ("keras.src.visualization", None),
+    },
+)
@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 try:
     import namex
 except ImportError:
@@ -21,7 +24,17 @@ def register_internal_serializable(path, symbol):
 
 
 def get_symbol_from_name(name):
-    return REGISTERED_NAMES_TO_OBJS.get(name, None)
+    symbol = REGISTERED_NAMES_TO_OBJS.get(name, None)
+    if symbol is None and name.startswith("keras."):
+        # The API modules are loaded lazily, so the symbol may not have been
+        # registered yet. Loading it through its API module registers it.
+        module_name, _, attribute = name.rpartition(".")
+        try:
+            getattr(importlib.import_module(module_name), attribute)
+        except (ImportError, AttributeError):
+            return None
+        symbol = REGISTERED_NAMES_TO_OBJS.get(name, None)
+    return symbol
 
 
 def get_name_from_symbol(symbol):
@@ -47,3 +60,51 @@ else:
         def __call__(self, symbol):
             register_internal_serializable(self.path, symbol)
             return symbol
+
+
+def lazy_module_attributes(module_name, attributes, submodules=False):
+    """Returns the `__getattr__` and `__dir__` of a lazily loaded module.
+
+    The attributes are only imported when first accessed, so that importing
+    the module, e.g. `import keras`, doesn't import all of Keras.
+
+    Args:
+        module_name: The name of the module.
+        attributes: A dict mapping each attribute name to a tuple
+            `(module, name)`, to load the attribute as `module.name`, or to
+            `(module, None)`, to load the attribute as the module `module`.
+        submodules: Whether the other attributes are loaded as the
+            submodules of the same name, for packages whose submodules
+            used to be imported along with the package.
+
+    Returns:
+        A tuple `(__getattr__, __dir__)` to define in the module.
+    """
+
+    def __getattr__(name):
+        if name in attributes:
+            source, source_name = attributes[name]
+        elif submodules and not name.startswith("__"):
+            source, source_name = f"{module_name}.{name}", None
+        else:
+            raise AttributeError(
+                f"module '{module_name}' has no attribute '{name}'"
+            )
+        try:
+            value = importlib.import_module(source)
+        except ModuleNotFoundError as e:
+            if name in attributes or e.name != source:
+                raise
+            raise AttributeError(
+                f"module '{module_name}' has no attribute '{name}'"
+            ) from None
+        if source_name is not None:
+            value = getattr(value, source_name)
+        # Set the attribute, so that `__getattr__` isn't called again.
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import keras
+from keras.src import testing
+
+
+class ApiExportTest(testing.TestCase):
+    def test_star_import(self):
+        namespace = {}
+        exec("from keras import *", namespace)
+        for name in ("layers", "ops", "Model", "Sequential", "Input"):
+            self.assertIn(name, namespace)
+        self.assertNotIn("__version__", namespace)
+
+        namespace = {}
+        exec("from keras.layers import *", namespace)
+        self.assertIn("Dense", namespace)
+        self.assertIn("Layer", namespace)
+        self.assertNotIn("_LAZY_ATTRIBUTES", namespace)
+
+    def test_lazy_package_submodules(self):
+        # In a fresh process, where the submodules aren't imported yet.
+        code = (
+            "from keras.src import applications\n"
+            "from keras.src import visualization\n"
+            "applications.mobilenet.MobileNet\n"
+            "visualization.draw_segmentation_masks\n"
+            "assert not hasattr(applications, 'not_a_module')\n"
+        )
+        env = dict(os.environ, KERAS_BACKEND=keras.config.backend())
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,4 @@
+from keras.src.api_export import lazy_module_attributes
+
+# The submodules are imported on first access, e.g. `applications.mobilenet`.
+__getattr__, __dir__ = lazy_module_attributes(__name__, {}, submodules=True)
@@ -157,6 +157,10 @@ class Variable:
         # whether this variable should be overwritten by the computed gradient.
         # Ref: https://github.com/google/flax/blob/main/flax/linen/fp8_ops.py
         self._overwrite_with_gradient = False
+        # `self._assignment_count` is an internal counter of the direct
+        # assignments of this variable. Layers use it to invalidate values
+        # derived from the variable, such as unpacked quantized weights.
+        self._assignment_count = 0
         if isinstance(initializer, str):
             from keras.src import initializers
 
@@ -291,6 +295,7 @@ class Variable:
             scope.add_update((self, value))
         else:
             self._direct_assign(value)
+            self._assignment_count += 1
         return value
 
     def assign_add(self, value):
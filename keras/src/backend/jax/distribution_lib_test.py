@@ -313,6 +313,46 @@ class JaxDistributionLibTest(testing.TestCase):
             model.compile(loss="mse")
             model.fit(inputs, labels)
 
+    def test_e2e_data_parallel_model_with_sharded_optimizer_state(self):
+        def get_model():
+            inputs = layers.Input(shape=[16])
+            y = layers.Dense(units=64, activation="relu")(inputs)
+            y = layers.Dense(units=10)(y)
+            return models.Model(inputs=inputs, outputs=y)
+
+        inputs = np.random.normal(size=(32, 16))
+        labels = np.random.normal(size=(32, 10))
+        weights = get_model().get_weights()
+        results = []
+        for shard in (False, True):
+            distribution = distribution_lib.DataParallel(
+                devices=backend_dlib.list_devices(),
+                shard_optimizer_state=shard,
+                shard_gradients=shard,
+            )
+            with distribution.scope():
+                model = get_model()
+                model.set_weights(weights)
+                model.compile(loss="mse", optimizer="adam")
+                model.fit(inputs, labels, epochs=2, verbose=0)
+            results.append(model.get_weights())
+
+            for weight in model.weights:
+                self.assertTrue(weight._value.sharding.is_fully_replicated)
+            momentum = model.optimizer._momentums[0]
+            self.assertEqual(momentum.shape, (16, 64))
+            if shard:
+                self.assertEqual(
+                    tuple(momentum._value.sharding.spec), ("batch", None)
+                )
+                shard_shape = momentum._value.addressable_shards[0].data.shape
+                self.assertEqual(shard_shape, (2, 64))
+            else:
+                self.assertTrue(momentum._value.sharding.is_fully_replicated)
+
+        for replicated, sharded in zip(*results):
+            self.assertAllClose(replicated, sharded, atol=1e-5)
+
     def test_e2e_model_parallel_model(self):
         shape = (4, 2)
         axis_names = ["batch", "model"]
@@ -408,6 +448,26 @@ class JaxDistributionLibTest(testing.TestCase):
             )
         )
 
+    def test_output_layout_follows_layout_map_changes(self):
+        device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["batch", "model"], backend_dlib.list_devices()
+        )
+        layout_map = distribution_lib.LayoutMap(device_mesh)
+        distribution = distribution_lib.ModelParallel(
+            layout_map=layout_map, batch_dim_name="batch"
+        )
+        inputs = np.ones((8, 4))
+        with distribution.scope():
+            layer = layers.Dense(4, name="dense")
+            outputs = layer(inputs)
+            self.assertTrue(outputs.sharding.is_fully_replicated)
+            # The new layout applies to the next call.
+            layout_map["dense/output"] = (None, "model")
+            outputs = layer(inputs)
+        self.assertEqual(
+            outputs.sharding.spec, jax.sharding.PartitionSpec(None, "model")
+        )
+
     def test_distribute_data_input(self):
         per_process_batch = jax.numpy.arange(24).reshape(
             6, 4
@@ -7,12 +7,34 @@ by skipping conditionals entirely.
 """
 
 import jax
+import jax.experimental.sparse as jax_sparse
 from jax import numpy as jnp
 
 from keras.src.optimizers import base_optimizer
 
 
 class JaxOptimizer(base_optimizer.BaseOptimizer):
+    def _sparse_gradient_rows(self, gradient):
+        if (
+            not isinstance(gradient, jax_sparse.BCOO)
+            or gradient.n_batch != 0
+            or gradient.n_sparse != 1
+        ):
+            return None
+        # Deduplicate with a static size so that this works under `jit`.
+        # Padding uses an out of bounds row index, which is dropped by the
+        # scatter in `_assign_rows`.
+        indices, positions = jnp.unique(
+            gradient.indices[:, 0],
+            size=gradient.nse,
+            fill_value=gradient.shape[0],
+            return_inverse=True,
+        )
+        values = jax.ops.segment_sum(
+            gradient.data, positions.reshape(-1), num_segments=gradient.nse
+        )
+        return indices, values
+
     def _backend_apply_gradients(self, grads, trainable_variables):
         if self.gradient_accumulation_steps:
             is_update_step = (
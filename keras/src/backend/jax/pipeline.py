@@ -0,0 +1,882 @@
+"""Pipeline parallel execution of models for the JAX backend.
+
+The model is partitioned into stages of consecutive nodes of its graph. Each
+stage owns the variables of its layers, which are placed on the devices of
+the stage, and is executed by its own jitted functions. JAX dispatches these
+functions asynchronously, so that the stages process their micro-batches
+concurrently, each on its own devices.
+"""
+
+import jax
+import numpy as np
+
+from keras.src import backend
+from keras.src import tree
+from keras.src.models.functional import Functional
+from keras.src.models.functional import operation_fn
+from keras.src.models.sequential import Sequential
+from keras.src.optimizers.loss_scale_optimizer import LossScaleOptimizer
+from keras.src.trainers.data_adapters import data_adapter_utils
+
+FORWARD = "forward"
+BACKWARD = "backward"
+
+
+def get_schedule(schedule, num_stages, num_microbatches):
+    """Returns the per-stage sequences of passes of a pipeline schedule.
+
+    Args:
+        schedule: `"gpipe"` or `"1f1b"`.
+        num_stages: Number of stages.
+        num_microbatches: Number of micro-batches.
+
+    Returns:
+        A list with, for each stage, the list of its `(pass, microbatch)`
+        in execution order, where `pass` is `FORWARD` or `BACKWARD`. The
+        forward and backward passes of the last stage are fused, and only
+        appear as `FORWARD`.
+    """
+    sequences = []
+    for stage in range(num_stages):
+        forwards = [(FORWARD, m) for m in range(num_microbatches)]
+        if stage == num_stages - 1:
+            sequences.append(forwards)
+            continue
+        backwards = [(BACKWARD, m) for m in range(num_microbatches)]
+        if schedule == "gpipe":
+            sequences.append(forwards + backwards)
+            continue
+        # 1F1B: fill the pipeline, then alternate a forward and a backward
+        # pass, then drain the pipeline.
+        num_warmup = min(num_stages - stage - 1, num_microbatches)
+        sequence = forwards[:num_warmup]
+        for m in range(num_microbatches - num_warmup):
+            sequence.append(forwards[num_warmup + m])
+            sequence.append(backwards[m])
+        sequence.extend(backwards[num_microbatches - num_warmup :])
+        sequences.append(sequence)
+    return sequences
+
+
+def dispatch_order(sequences):
+    """Interleaves the stage sequences in an order respecting dependencies.
+
+    The forward pass of a micro-batch on a stage depends on its forward pass
+    on the previous stage, and its backward pass on its backward pass on the
+    next stage.
+
+    Returns:
+        A list of `(pass, stage, microbatch)`.
+    """
+    num_stages = len(sequences)
+    done = set()
+    positions = [0] * num_stages
+    order = []
+
+    def is_ready(kind, stage, microbatch):
+        if kind == FORWARD:
+            return stage == 0 or (FORWARD, stage - 1, microbatch) in done
+        if stage + 1 == num_stages - 1:
+            return (FORWARD, stage + 1, microbatch) in done
+        return (BACKWARD, stage + 1, microbatch) in done
+
+    while len(order) < sum(len(s) for s in sequences):
+        progressed = False
+        for stage, sequence in enumerate(sequences):
+            while positions[stage] < len(sequence):
+                kind, microbatch = sequence[positions[stage]]
+                if not is_ready(kind, stage, microbatch):
+                    break
+                order.append((kind, stage, microbatch))
+                done.add((kind, stage, microbatch))
+                positions[stage] += 1
+                progressed = True
+        if not progressed:
+            raise ValueError(f"The pipeline schedule deadlocks: {sequences}")
+    return order
+
+
+class Stage:
+    """A stage of a pipeline: consecutive nodes and the variables they use."""
+
+    def __init__(self, index, nodes, model):
+        self.index = index
+        self.nodes = nodes
+        self.layers = []
+        for node in nodes:
+            if node.operation not in self.layers:
+                self.layers.append(node.operation)
+        trainable_ids = {id(v) for v in model.trainable_variables}
+        self.trainable_variables = []
+        self.non_trainable_variables = []
+        for layer in self.layers:
+            for variable in getattr(layer, "variables", []):
+                if id(variable) in trainable_ids:
+                    self.trainable_variables.append(variable)
+                else:
+                    self.non_trainable_variables.append(variable)
+        self.input_tensors = []
+        self.output_tensors = []
+
+
+class Pipeline:
+    """Runs the train, test and predict steps of a model as a pipeline.
+
+    Args:
+        model: A built `Functional` or `Sequential` model.
+        distribution: The `PipelineParallel` distribution.
+    """
+
+    def __init__(self, model, distribution):
+        functional = model
+        if isinstance(model, Sequential):
+            functional = model._functional
+        if not isinstance(functional, Functional):
+            raise ValueError(
+                "`PipelineParallel` only supports built `Functional` and "
+                f"`Sequential` models. Received: model={model}"
+            )
+        self.model = model
+        self.functional = functional
+        self.distribution = distribution
+        self.num_stages = distribution.num_stages
+        self.stages = self._partition()
+        self._optimizer_variables = None
+        self._functions = {}
+
+        model_variables = (
+            model.trainable_variables + model.non_trainable_variables
+        )
+        stage_variables = {
+            id(v): stage
+            for stage in self.stages
+            for v in stage.trainable_variables + stage.non_trainable_variables
+        }
+        for variable in model_variables:
+            if id(variable) not in stage_variables:
+                raise ValueError(
+                    f"Variable '{variable.path}' isn't used by any layer of "
+                    "the model graph, and can't be placed on a stage."
+                )
+        # Move the variables to the devices of their stage.
+        for variable in model_variables:
+            self._move_variable(variable, stage_variables[id(variable)].index)
+
+    def _partition(self):
+        nodes = []
+        for depth in sorted(self.functional._nodes_by_depth, reverse=True):
+            for node in self.functional._nodes_by_depth[depth]:
+                if node.operation is not None and not node.is_input:
+                    nodes.append(node)
+        stage_indices = self._assign_stages(nodes)
+        for layer in {id(n.operation): n.operation for n in nodes}.values():
+            layer_stages = {
+                s for n, s in zip(nodes, stage_indices) if n.operation is layer
+            }
+            if len(layer_stages) > 1:
+                raise ValueError(
+                    f"Layer '{layer.name}' is called in several stages "
+                    f"{sorted(layer_stages)}. Shared layers must be in a "
+                    "single stage. Use `stage_boundaries` to place them."
+                )
+        stages = [
+            Stage(
+                i,
+                [n for n, s in zip(nodes, stage_indices) if s == i],
+                self.model,
+            )
+            for i in range(self.num_stages)
+        ]
+
+        # The tensors crossing each boundary between stages: those produced
+        # before it and consumed after it.
+        tensors = list(self.functional.inputs)
+        producers = {id(t): -1 for t in tensors}
+        last_consumers = {}
+        for node, stage in zip(nodes, stage_indices):
+            for tensor in node.input_tensors:
+                last_consumers[id(tensor)] = max(
+                    last_consumers.get(id(tensor), -1), stage
+                )
+            for tensor in node.outputs:
+                producers[id(tensor)] = stage
+                tensors.append(tensor)
+        for tensor in self.functional.outputs:
+            last_consumers[id(tensor)] = self.num_stages
+        for stage in stages:
+            stage.input_tensors = [
+                t
+                for t in tensors
+                if producers[id(t)] < stage.index
+                and last_consumers.get(id(t), -1) >= stage.index
+            ]
+            if stage.index < self.num_stages - 1:
+                stage.output_tensors = [
+                    t
+                    for t in tensors
+                    if producers[id(t)] <= stage.index
+                    and last_consumers.get(id(t), -1) > stage.index
+                ]
+            else:
+                stage.output_tensors = list(self.functional.outputs)
+        return stages
+
+    def _assign_stages(self, nodes):
+        boundaries = self.distribution.stage_boundaries
+        if boundaries is not None:
+            starts = {name: i + 1 for i, name in enumerate(boundaries)}
+            stage_indices = []
+            stage = 0
+            for node in nodes:
+                name = node.operation.name
+                if name in starts and starts[name] > stage:
+                    if starts[name] != stage + 1:
+                        raise ValueError(
+                            f"Layer '{name}' starts stage {starts[name]}, but "
+                            f"it is called before the layer starting stage "
+                            f"{stage + 1}. Received: "
+                            f"stage_boundaries={boundaries}"
+                        )
+                    stage = starts[name]
+                stage_indices.append(stage)
+            if stage != self.num_stages - 1:
+                missing = [
+                    name
+                    for name in boundaries
+                    if name not in {n.operation.name for n in nodes}
+                ]
+                raise ValueError(
+                    f"The layers {missing} of `stage_boundaries` aren't "
+                    "called by the model."
+                )
+            return stage_indices
+
+        # Split the nodes into consecutive stages, minimizing the largest
+        # number of parameters of a stage.
+        num_stages = self.num_stages
+        if len(nodes) < num_stages:
+            raise ValueError(
+                f"The model can't be split into {num_stages} stages, as it "
+                f"only calls {len(nodes)} layers."
+            )
+        seen = set()
+        cumulative = [0]
+        for node in nodes:
+            operation = node.operation
+            cost = 0
+            if id(operation) not in seen:
+                seen.add(id(operation))
+                cost = sum(
+                    int(np.prod(v.shape))
+                    for v in getattr(operation, "weights", [])
+                )
+            cumulative.append(cumulative[-1] + cost)
+        # `best[s][j]` is the cost of the best split of the first `j` nodes
+        # into `s + 1` stages, and `starts[s][j]` the start of its last stage.
+        best = [[cumulative[j] for j in range(len(nodes) + 1)]]
+        starts = [[0] * (len(nodes) + 1)]
+        for stage in range(1, num_stages):
+            best.append([None] * (len(nodes) + 1))
+            starts.append([None] * (len(nodes) + 1))
+            for j in range(stage + 1, len(nodes) + 1):
+                for i in range(stage, j):
+                    cost = max(
+                        best[stage - 1][i], cumulative[j] - cumulative[i]
+                    )
+                    if best[stage][j] is None or cost < best[stage][j]:
+                        best[stage][j] = cost
+                        starts[stage][j] = i
+        stage_indices = [0] * len(nodes)
+        end = len(nodes)
+        for stage in range(num_stages - 1, -1, -1):
+            start = starts[stage][end]
+            stage_indices[start:end] = [stage] * (end - start)
+            end = start
+        return stage_indices
+
+    def _stage_sharding(self, stage):
+        mesh = self.distribution.stage_meshes[stage].backend_mesh
+        return jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec())
+
+    def _data_sharding(self, stage, value):
+        layout = self.distribution.get_stage_data_layout(stage, value.shape)
+        return layout.backend_layout
+
+    def _move_variable(self, variable, stage):
+        sharding = self._stage_sharding(stage)
+        variable._layout = sharding
+        if variable._value is not None:
+            variable._value = jax.device_put(variable._value, sharding)
+
+    def _put_data(self, values, stage):
+        return [
+            None
+            if value is None
+            else jax.device_put(value, self._data_sharding(stage, value))
+            for value in values
+        ]
+
+    def _put_structure(self, values, stage):
+        return tree.map_structure(
+            lambda v: (
+                None
+                if v is None
+                else jax.device_put(v, self._data_sharding(stage, v))
+            ),
+            values,
+        )
+
+    def _put_variables(self, values, stage):
+        return jax.device_put(values, self._stage_sharding(stage))
+
+    # Stage functions.
+
+    def _forward(self, stage, trainable, non_trainable, inputs, training):
+        """Runs the nodes of a stage. Returns its outputs and new state."""
+        mapping = list(zip(stage.trainable_variables, trainable)) + list(
+            zip(stage.non_trainable_variables, non_trainable)
+        )
+        with backend.StatelessScope(
+            state_mapping=mapping, collect_losses=True
+        ) as scope:
+            tensor_dict = {
+                id(t): x for t, x in zip(stage.input_tensors, inputs)
+            }
+            for node in stage.nodes:
+                args, kwargs = node.arguments.fill_in(tensor_dict)
+                op = operation_fn(node.operation, training=training)
+                outputs = op(*args, **kwargs)
+                for x, y in zip(node.outputs, tree.flatten(outputs)):
+                    tensor_dict[id(x)] = y
+            outputs = [tensor_dict[id(t)] for t in stage.output_tensors]
+            aux_loss = 0.0
+            for layer in stage.layers:
+                for loss in getattr(layer, "losses", []):
+                    aux_loss += self.model._aggregate_additional_loss(loss)
+        non_trainable = [
+            scope.get_current_value(v) for v in stage.non_trainable_variables
+        ]
+        return outputs, non_trainable, aux_loss
+
+    def _compute_loss(self, y, y_pred, sample_weight):
+        # The loss trackers of the compiled loss are updated separately, with
+        # the metrics.
+        mapping = [
+            (v, jax.numpy.zeros(v.shape, v.dtype))
+            for v in self.model._compile_loss.variables
+        ]
+        with backend.StatelessScope(state_mapping=mapping):
+            return self.model._compile_loss(y, y_pred, sample_weight)
+
+    def _stage_backward(
+        self,
+        stage,
+        trainable,
+        non_trainable,
+        inputs,
+        output_grads,
+        gradients,
+        weight,
+    ):
+        """Recomputes a stage, and accumulates its gradients."""
+        input_mask = self._differentiable_mask(stage.input_tensors)
+        if stage.index == 0:
+            input_mask = [False] * len(input_mask)
+        output_mask = self._differentiable_mask(stage.output_tensors)
+
+        def forward(trainable, differentiable_inputs):
+            outputs, _, aux_loss = self._forward(
+                stage,
+                trainable,
+                non_trainable,
+                _merge(inputs, differentiable_inputs, input_mask),
+                training=True,
+            )
+            return _select(outputs, output_mask), aux_loss
+
+        _, vjp_fn = jax.vjp(forward, trainable, _select(inputs, input_mask))
+        trainable_grads, input_grads = vjp_fn(
+            (output_grads, jax.numpy.asarray(weight, "float32"))
+        )
+        gradients = jax.tree_util.tree_map(
+            jax.numpy.add, gradients, trainable_grads
+        )
+        return input_grads, gradients
+
+    def _last_stage_forward_backward(
+        self,
+        stage,
+        trainable,
+        non_trainable,
+        inputs,
+        y,
+        sample_weight,
+        gradients,
+        weight,
+    ):
+        """Runs the last stage and the loss, and accumulates its gradients."""
+        input_mask = self._differentiable_mask(stage.input_tensors)
+        if stage.index == 0:
+            input_mask = [False] * len(input_mask)
+
+        def compute_loss(trainable, differentiable_inputs):
+            outputs, new_non_trainable, aux_loss = self._forward(
+                stage,
+                trainable,
+                non_trainable,
+                _merge(inputs, differentiable_inputs, input_mask),
+                training=True,
+            )
+            y_pred = self._pack_outputs(outputs)
+            loss = self._compute_loss(y, y_pred, sample_weight) + aux_loss
+            return loss * weight, (loss, y_pred, new_non_trainable)
+
+        grad_fn = jax.value_and_grad(compute_loss, argnums=(0, 1), has_aux=True)
+        (_, (loss, y_pred, non_trainable)), grads = grad_fn(
+            trainable, _select(inputs, input_mask)
+        )
+        trainable_grads, input_grads = grads
+        gradients = jax.tree_util.tree_map(
+            jax.numpy.add, gradients, trainable_grads
+        )
+        return input_grads, gradients, non_trainable, loss, y_pred
+
+    def _last_stage_loss(self, stage, trainable, non_trainable, inputs, y, sw):
+        outputs, non_trainable, aux_loss = self._forward(
+            stage, trainable, non_trainable, inputs, training=False
+        )
+        y_pred = self._pack_outputs(outputs)
+        loss = self._compute_loss(y, y_pred, sw) + aux_loss
+        return loss, y_pred, non_trainable
+
+    def _apply_gradients(
+        self, stage, trainable, optimizer_variables, shared_variables, grads
+    ):
+        owned, shared = self._optimizer_variables
+        mapping = (
+            list(zip(stage.trainable_variables, trainable))
+            + list(zip(owned[stage.index], optimizer_variables))
+            + list(zip(shared, shared_variables))
+        )
+        with backend.StatelessScope(state_mapping=mapping) as scope:
+            self.model.optimizer.apply(grads, stage.trainable_variables)
+        return (
+            [scope.get_current_value(v) for v in stage.trainable_variables],
+            [scope.get_current_value(v) for v in owned[stage.index]],
+            [scope.get_current_value(v) for v in shared],
+        )
+
+    def _update_metrics(self, metrics_variables, loss, x, y, y_pred, sw):
+        model = self.model
+        mapping = list(zip(model.metrics_variables, metrics_variables))
+        with backend.StatelessScope(state_mapping=mapping) as scope:
+            model._compile_loss(y, y_pred, sw)
+            model._loss_tracker.update_state(
+                loss,
+                sample_weight=_batch_size(x),
+            )
+            logs = model.compute_metrics(x, y, y_pred, sw)
+        return logs, [
+            scope.get_current_value(v) for v in model.metrics_variables
+        ]
+
+    def _function(self, fn, stage, **kwargs):
+        """Returns the jitted function running `fn` for a stage."""
+        key = (fn.__name__, stage.index, tuple(kwargs.items()))
+        if key not in self._functions:
+
+            def stage_fn(*args):
+                return fn(stage, *args, **kwargs)
+
+            self._functions[key] = jax.jit(stage_fn)
+        return self._functions[key]
+
+    # Steps.
+
+    def _split_state(self, values, variables, attribute):
+        indices = {id(v): i for i, v in enumerate(variables)}
+        return [
+            self._put_variables(
+                [values[indices[id(v)]] for v in getattr(stage, attribute)],
+                stage.index,
+            )
+            for stage in self.stages
+        ]
+
+    def _merge_state(self, stage_values, variables, attribute):
+        indices = {id(v): i for i, v in enumerate(variables)}
+        values = [None] * len(variables)
+        for stage, stage_value in zip(self.stages, stage_values):
+            for v, value in zip(getattr(stage, attribute), stage_value):
+                values[indices[id(v)]] = value
+        return values
+
+    def _split_batch(self, data):
+        batch_size = _batch_size(data)
+        num_microbatches = min(self.distribution.num_microbatches, batch_size)
+        bounds = np.linspace(0, batch_size, num_microbatches + 1).astype(int)
+        microbatches = [
+            tree.map_structure(
+                lambda v: None if v is None else v[start:end], data
+            )
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        weights = [
+            (end - start) / batch_size
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        return microbatches, weights
+
+    def _run_forward(self, trainable, non_trainable, x, y, sw, compute_loss):
+        """Pipelines the forward passes of the micro-batches of a batch.
+
+        Returns:
+            The losses of the micro-batches, weighted by their size, if
+            `compute_loss` is `True`, and the outputs of the micro-batches.
+        """
+        microbatches, weights = self._split_batch((x, y, sw))
+        last = self.stages[-1]
+        received = {}
+        losses = []
+        y_preds = []
+        for m, (mx, my, msw) in enumerate(microbatches):
+            for stage in self.stages:
+                i = stage.index
+                if i == 0:
+                    inputs = self._put_data(
+                        self.functional._standardize_inputs(mx), 0
+                    )
+                else:
+                    inputs = received.pop((i, m))
+                if stage is last and compute_loss:
+                    my, msw = self._put_structure((my, msw), i)
+                    loss, y_pred, non_trainable[i] = self._function(
+                        self._last_stage_loss, stage
+                    )(trainable[i], non_trainable[i], inputs, my, msw)
+                    losses.append(loss * weights[m])
+                    y_preds.append(y_pred)
+                    continue
+                outputs, non_trainable[i], aux_loss = self._function(
+                    self._forward, stage, training=False
+                )(trainable[i], non_trainable[i], inputs)
+                if stage is last:
+                    y_preds.append(self._pack_outputs(outputs))
+                else:
+                    losses.append(aux_loss * weights[m])
+                    received[(i + 1, m)] = self._put_data(outputs, i + 1)
+        return losses, y_preds
+
+    def train_step(self, state, data):
+        model = self.model
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        trainable, non_trainable, optimizer_values, metrics_values = state
+        self._build_optimizer_variables()
+        owned, shared = self._optimizer_variables
+        optimizer_indices = {
+            id(v): i for i, v in enumerate(model.optimizer.variables)
+        }
+
+        trainable = self._split_state(
+            trainable, model.trainable_variables, "trainable_variables"
+        )
+        non_trainable = self._split_state(
+            non_trainable,
+            model.non_trainable_variables,
+            "non_trainable_variables",
+        )
+        stage_optimizer_values = [
+            self._put_variables(
+                [optimizer_values[optimizer_indices[id(v)]] for v in owned[i]],
+                i,
+            )
+            for i in range(self.num_stages)
+        ]
+        gradients = [
+            self._function(self._zeros_like, stage)(trainable[stage.index])
+            for stage in self.stages
+        ]
+
+        microbatches, weights = self._split_batch((x, y, sample_weight))
+        sequences = get_schedule(
+            self.distribution.schedule, self.num_stages, len(microbatches)
+        )
+        last = self.stages[-1]
+        activations = {}
+        stashed = {}
+        output_grads = {}
+        losses = []
+        y_preds = [None] * len(microbatches)
+        for kind, i, m in dispatch_order(sequences):
+            stage = self.stages[i]
+            mx, my, msw = microbatches[m]
+            if kind == FORWARD:
+                if i == 0:
+                    inputs = self._put_data(
+                        self.functional._standardize_inputs(mx), 0
+                    )
+                else:
+                    inputs = activations.pop((i, m))
+            if kind == FORWARD and stage is last:
+                my, msw = self._put_structure((my, msw), i)
+                (
+                    input_grads,
+                    gradients[i],
+                    non_trainable[i],
+                    loss,
+                    y_preds[m],
+                ) = self._function(self._last_stage_forward_backward, stage)(
+                    trainable[i],
+                    non_trainable[i],
+                    inputs,
+                    my,
+                    msw,
+                    gradients[i],
+                    weights[m],
+                )
+                losses.append(loss * weights[m])
+            elif kind == FORWARD:
+                stashed[(i, m)] = (inputs, non_trainable[i])
+                outputs, non_trainable[i], aux_loss = self._function(
+                    self._forward, stage, training=True
+                )(trainable[i], non_trainable[i], inputs)
+                losses.append(aux_loss * weights[m])
+                activations[(i + 1, m)] = self._put_data(outputs, i + 1)
+                continue
+            else:
+                inputs, stage_non_trainable = stashed.pop((i, m))
+                input_grads, gradients[i] = self._function(
+                    self._stage_backward, stage
+                )(
+                    trainable[i],
+                    stage_non_trainable,
+                    inputs,
+                    output_grads.pop((i, m)),
+                    gradients[i],
+                    weights[m],
+                )
+            if i > 0:
+                output_grads[(i - 1, m)] = self._put_data(input_grads, i - 1)
+
+        shared_values = [
+            optimizer_values[optimizer_indices[id(v)]] for v in shared
+        ]
+        new_shared_values = None
+        for stage in self.stages:
+            i = stage.index
+            trainable[i], stage_optimizer_values[i], stage_shared = (
+                self._function(self._apply_gradients, stage)(
+                    trainable[i],
+                    stage_optimizer_values[i],
+                    self._put_variables(shared_values, i),
+                    gradients[i],
+                )
+            )
+            if new_shared_values is None:
+                new_shared_values = stage_shared
+
+        optimizer_values = list(optimizer_values)
+        for stage in self.stages:
+            for v, value in zip(
+                owned[stage.index], stage_optimizer_values[stage.index]
+            ):
+                optimizer_values[optimizer_indices[id(v)]] = value
+        for v, value in zip(shared, new_shared_values):
+            optimizer_values[optimizer_indices[id(v)]] = value
+
+        logs, metrics_values = self._finish_step(
+            metrics_values, losses, x, y, sample_weight, y_preds
+        )
+        state = (
+            self._merge_state(
+                trainable, model.trainable_variables, "trainable_variables"
+            ),
+            self._merge_state(
+                non_trainable,
+                model.non_trainable_variables,
+                "non_trainable_variables",
+            ),
+            optimizer_values,
+            metrics_values,
+        )
+        return logs, state
+
+    def test_step(self, state, data):
+        model = self.model
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        trainable, non_trainable, metrics_values = state
+        trainable = self._split_state(
+            trainable, model.trainable_variables, "trainable_variables"
+        )
+        non_trainable = self._split_state(
+            non_trainable,
+            model.non_trainable_variables,
+            "non_trainable_variables",
+        )
+        losses, y_preds = self._run_forward(
+            trainable, non_trainable, x, y, sample_weight, compute_loss=True
+        )
+        logs, metrics_values = self._finish_step(
+            metrics_values, losses, x, y, sample_weight, y_preds
+        )
+        state = (
+            self._merge_state(
+                trainable, model.trainable_variables, "trainable_variables"
+            ),
+            self._merge_state(
+                non_trainable,
+                model.non_trainable_variables,
+                "non_trainable_variables",
+            ),
+            metrics_values,
+        )
+        return logs, state
+
+    def predict_step(self, state, data):
+        model = self.model
+        x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data)
+        trainable, non_trainable = state
+        stage_trainable = self._split_state(
+            trainable, model.trainable_variables, "trainable_variables"
+        )
+        stage_non_trainable = self._split_state(
+            non_trainable,
+            model.non_trainable_variables,
+            "non_trainable_variables",
+        )
+        _, y_preds = self._run_forward(
+            stage_trainable,
+            stage_non_trainable,
+            x,
+            None,
+            None,
+            compute_loss=False,
+        )
+        outputs = _concatenate(y_preds)
+        non_trainable = self._merge_state(
+            stage_non_trainable,
+            model.non_trainable_variables,
+            "non_trainable_variables",
+        )
+        return outputs, (trainable, non_trainable)
+
+    def _finish_step(
+        self, metrics_values, losses, x, y, sample_weight, y_preds
+    ):
+        # The loss and the metrics are computed on the first stage, with the
+        # whole batch.
+        y_pred = _concatenate(y_preds)
+        y_pred, y, sample_weight, losses = [
+            tree.map_structure(
+                lambda v: (
+                    None
+                    if v is None
+                    else jax.device_put(v, self._stage_sharding(0))
+                ),
+                value,
+            )
+            for value in (y_pred, y, sample_weight, losses)
+        ]
+        loss = sum(losses)
+        metrics_values = self._put_variables(metrics_values, 0)
+        if "metrics" not in self._functions:
+            self._functions["metrics"] = jax.jit(self._update_metrics)
+        return self._functions["metrics"](
+            metrics_values, loss, x, y, y_pred, sample_weight
+        )
+
+    def _build_optimizer_variables(self):
+        """Finds the optimizer variables updated by each stage.
+
+        The variables only updated for the variables of one stage, such as
+        momentums, are moved to the devices of the stage. The others, such as
+        the iteration count, are shared: each stage updates a copy of them.
+        """
+        if self._optimizer_variables is not None:
+            return
+        optimizer = self.model.optimizer
+        if isinstance(optimizer, LossScaleOptimizer):
+            raise ValueError(
+                "`PipelineParallel` doesn't support `LossScaleOptimizer`."
+            )
+        if optimizer.global_clipnorm is not None:
+            raise ValueError(
+                "`PipelineParallel` doesn't support `global_clipnorm`, as "
+                "each stage applies its gradients separately. Use `clipnorm` "
+                "instead."
+            )
+        updates = []
+        for stage in self.stages:
+            updated = []
+
+            def apply(trainable, optimizer_values, stage=stage):
+                mapping = list(zip(stage.trainable_variables, trainable))
+                mapping += list(zip(optimizer.variables, optimizer_values))
+                with backend.StatelessScope(state_mapping=mapping) as scope:
+                    initial = [
+                        scope.get_current_value(v) for v in optimizer.variables
+                    ]
+                    optimizer.apply(trainable, stage.trainable_variables)
+                    updated.extend(
+                        id(v)
+                        for v, value in zip(optimizer.variables, initial)
+                        if scope.get_current_value(v) is not value
+                    )
+
+            jax.eval_shape(
+                apply,
+                [
+                    jax.ShapeDtypeStruct(v.shape, v.dtype)
+                    for v in stage.trainable_variables
+                ],
+                [
+                    jax.ShapeDtypeStruct(v.shape, v.dtype)
+                    for v in optimizer.variables
+                ],
+            )
+            updates.append(set(updated))
+        owned = []
+        for i, stage_updates in enumerate(updates):
+            others = set().union(*(u for j, u in enumerate(updates) if j != i))
+            owned.append(
+                [
+                    v
+                    for v in optimizer.variables
+                    if id(v) in stage_updates and id(v) not in others
+                ]
+            )
+        owned_ids = {id(v) for stage_owned in owned for v in stage_owned}
+        shared = [v for v in optimizer.variables if id(v) not in owned_ids]
+        for i, stage_owned in enumerate(owned):
+            for variable in stage_owned:
+                self._move_variable(variable, i)
+        self._optimizer_variables = (owned, shared)
+
+    def _differentiable_mask(self, tensors):
+        return [backend.is_float_dtype(t.dtype) for t in tensors]
+
+    def _pack_outputs(self, outputs):
+        return tree.pack_sequence_as(self.functional._outputs_struct, outputs)
+
+    def _zeros_like(self, stage, values):
+        return [jax.numpy.zeros_like(v) for v in values]
+
+
+def _select(values, mask):
+    return [v for v, keep in zip(values, mask) if keep]
+
+
+def _merge(values, selected_values, mask):
+    selected_values = iter(selected_values)
+    return [
+        next(selected_values) if keep else v for v, keep in zip(values, mask)
+    ]
+
+
+def _batch_size(data):
+    return next(v for v in tree.flatten(data) if v is not None).shape[0]
+
+
+def _concatenate(values):
+    return tree.map_structure(
+        lambda *v: jax.numpy.concatenate(v, axis=0), *values
+    )
@@ -0,0 +1,299 @@
+"""Test for pipeline.py."""
+
+import os
+
+import jax
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import optimizers
+from keras.src import testing
+from keras.src.backend.common import global_state
+from keras.src.backend.jax import pipeline
+from keras.src.distribution import distribution_lib
+from keras.src.utils import rng_utils
+
+if backend.backend() == "jax":
+    # Due to https://github.com/google/jax/issues/17188, we can't
+    # override the XLA flag after the JAX back init. We have to
+    # run this at top level to let JAX pick the flag value.
+    xla_flags = os.getenv("XLA_FLAGS") or ""
+    # Don't override user-specified device count, or other XLA flags.
+    if "xla_force_host_platform_device_count" not in xla_flags:
+        os.environ["XLA_FLAGS"] = (
+            f"{xla_flags} --xla_force_host_platform_device_count=8"
+        )
+
+
+def get_mlp():
+    rng_utils.set_random_seed(1337)
+    inputs = layers.Input((8,))
+    x = layers.Dense(16, activation="relu", name="dense_0")(inputs)
+    x = layers.Dense(16, activation="relu", name="dense_1")(x)
+    x = layers.Dense(
+        16, activation="relu", kernel_regularizer="l2", name="dense_2"
+    )(x)
+    outputs = layers.Dense(2, name="dense_3")(x)
+    return models.Model(inputs, outputs)
+
+
+def get_skip_model():
+    # An integer input, a skip connection over a stage boundary, and two
+    # outputs.
+    rng_utils.set_random_seed(1337)
+    tokens = layers.Input((4,), dtype="int32")
+    features = layers.Input((8,))
+    x = layers.Embedding(10, 8, name="embedding")(tokens)
+    x = layers.Flatten(name="flatten")(x)
+    x = layers.Concatenate(name="concat")([x, features])
+    skip = layers.Dense(16, name="dense_0")(x)
+    x = layers.Dense(16, activation="relu", name="dense_1")(skip)
+    x = layers.Dense(16, activation="relu", name="dense_2")(x)
+    x = layers.Add(name="add")([x, skip])
+    output_1 = layers.Dense(2, name="output_1")(x)
+    output_2 = layers.Dense(1, name="output_2")(x)
+    return models.Model([tokens, features], [output_1, output_2])
+
+
+class ScheduleTest(testing.TestCase):
+    def test_gpipe(self):
+        sequences = pipeline.get_schedule("gpipe", 3, 2)
+        F, B = pipeline.FORWARD, pipeline.BACKWARD
+        self.assertEqual(sequences[0], [(F, 0), (F, 1), (B, 0), (B, 1)])
+        self.assertEqual(sequences[1], [(F, 0), (F, 1), (B, 0), (B, 1)])
+        # The forward and backward passes of the last stage are fused.
+        self.assertEqual(sequences[2], [(F, 0), (F, 1)])
+
+    def test_1f1b(self):
+        sequences = pipeline.get_schedule("1f1b", 3, 4)
+        F, B = pipeline.FORWARD, pipeline.BACKWARD
+        self.assertEqual(
+            sequences[0],
+            [(F, 0), (F, 1), (F, 2), (B, 0), (F, 3), (B, 1), (B, 2), (B, 3)],
+        )
+        self.assertEqual(
+            sequences[1],
+            [(F, 0), (F, 1), (B, 0), (F, 2), (B, 1), (F, 3), (B, 2), (B, 3)],
+        )
+
+    @parameterized.parameters(("gpipe",), ("1f1b",))
+    def test_dispatch_order(self, schedule):
+        num_stages, num_microbatches = 4, 6
+        sequences = pipeline.get_schedule(
+            schedule, num_stages, num_microbatches
+        )
+        order = pipeline.dispatch_order(sequences)
+        self.assertLen(
+            order,
+            (2 * num_stages - 1) * num_microbatches,
+        )
+        position = {item: i for i, item in enumerate(order)}
+        for kind, stage, m in order:
+            if kind == pipeline.FORWARD and stage > 0:
+                self.assertLess(
+                    position[(kind, stage - 1, m)], position[(kind, stage, m)]
+                )
+            if kind == pipeline.BACKWARD:
+                next_kind = (
+                    pipeline.FORWARD
+                    if stage + 1 == num_stages - 1
+                    else pipeline.BACKWARD
+                )
+                self.assertLess(
+                    position[(next_kind, stage + 1, m)],
+                    position[(kind, stage, m)],
+                )
+        # Each stage runs its passes in the order of its schedule.
+        for stage, sequence in enumerate(sequences):
+            self.assertEqual(
+                [(kind, m) for kind, s, m in order if s == stage], sequence
+            )
+
+
+@pytest.mark.skipif(
+    backend.backend() != "jax" or len(jax.devices()) != 8,
+    reason="Backend specific test and requires 8 devices",
+)
+class PipelineTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        global_state.clear_session()
+
+    def tearDown(self):
+        super().tearDown()
+        global_state.clear_session()
+
+    def fit_and_evaluate(self, get_model, x, y, distribution=None):
+        if distribution is None:
+            model = get_model()
+        else:
+            with distribution.scope():
+                model = get_model()
+        metrics = ["mae"]
+        if len(model.outputs) > 1:
+            metrics = [["mae"] for _ in model.outputs]
+        model.compile(optimizer="adam", loss="mse", metrics=metrics)
+        if distribution is None:
+            return self._fit_and_evaluate(model, x, y)
+        with distribution.scope():
+            return self._fit_and_evaluate(model, x, y)
+
+    def _fit_and_evaluate(self, model, x, y):
+        history = model.fit(
+            x, y, batch_size=16, epochs=2, shuffle=False, verbose=0
+        )
+        return (
+            model,
+            history.history,
+            model.evaluate(x, y, batch_size=16, verbose=0),
+            model.predict(x, batch_size=16, verbose=0),
+        )
+
+    @parameterized.parameters(("gpipe",), ("1f1b",))
+    def test_fit_matches_single_device(self, schedule):
+        x = np.random.random((32, 8)).astype("float32")
+        y = np.random.random((32, 2)).astype("float32")
+        ref_model, ref_history, ref_eval, ref_pred = self.fit_and_evaluate(
+            get_mlp, x, y
+        )
+        global_state.clear_session()
+        distribution = distribution_lib.PipelineParallel(
+            devices=jax.devices()[:4], num_microbatches=4, schedule=schedule
+        )
+        model, history, evaluation, pred = self.fit_and_evaluate(
+            get_mlp, x, y, distribution
+        )
+        self.assertEqual(
+            [
+                [layer.name for layer in s.layers]
+                for s in model._pipeline.stages
+            ],
+            [["dense_0"], ["dense_1"], ["dense_2"], ["dense_3"]],
+        )
+        for i in range(4):
+            kernel = model.get_layer(f"dense_{i}").kernel
+            self.assertEqual(
+                kernel.value.sharding.device_set, {jax.devices()[i]}
+            )
+        # The momentums are placed with their variables.
+        self.assertEqual(
+            model.optimizer._momentums[-1].value.sharding.device_set,
+            {jax.devices()[3]},
+        )
+        self.assertAllClose(history["loss"], ref_history["loss"])
+        self.assertAllClose(history["mae"], ref_history["mae"])
+        self.assertAllClose(evaluation, ref_eval)
+        self.assertAllClose(pred, ref_pred)
+        for weight, ref_weight in zip(
+            model.get_weights(), ref_model.get_weights()
+        ):
+            self.assertAllClose(weight, ref_weight)
+
+    def test_fit_with_replicated_stages(self):
+        x = np.random.random((32, 8)).astype("float32")
+        y = np.random.random((32, 2)).astype("float32")
+        ref_model, ref_history, _, ref_pred = self.fit_and_evaluate(
+            get_mlp, x, y
+        )
+        global_state.clear_session()
+        device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["stage", "batch"], jax.devices()
+        )
+        distribution = distribution_lib.PipelineParallel(
+            device_mesh=device_mesh, num_microbatches=2, schedule="1f1b"
+        )
+        model, history, _, pred = self.fit_and_evaluate(
+            get_mlp, x, y, distribution
+        )
+        kernel = model.get_layer("dense_1").kernel
+        self.assertEqual(
+            kernel.value.sharding.device_set, set(jax.devices()[2:4])
+        )
+        self.assertAllClose(history["loss"], ref_history["loss"])
+        self.assertAllClose(pred, ref_pred)
+        for weight, ref_weight in zip(
+            model.get_weights(), ref_model.get_weights()
+        ):
+            self.assertAllClose(weight, ref_weight)
+
+    def test_fit_with_stage_boundaries(self):
+        x = [
+            np.random.randint(0, 10, size=(32, 4)).astype("int32"),
+            np.random.random((32, 8)).astype("float32"),
+        ]
+        y = [
+            np.random.random((32, 2)).astype("float32"),
+            np.random.random((32, 1)).astype("float32"),
+        ]
+        ref_model, ref_history, ref_eval, ref_pred = self.fit_and_evaluate(
+            get_skip_model, x, y
+        )
+        global_state.clear_session()
+        distribution = distribution_lib.PipelineParallel(
+            devices=jax.devices()[:3],
+            num_microbatches=3,
+            schedule="1f1b",
+            stage_boundaries=["dense_1", "add"],
+        )
+        model, history, evaluation, pred = self.fit_and_evaluate(
+            get_skip_model, x, y, distribution
+        )
+        stages = model._pipeline.stages
+        self.assertEqual(
+            [layer.name for layer in stages[1].layers], ["dense_1", "dense_2"]
+        )
+        # The skip connection crosses the second stage.
+        self.assertEqual(
+            stages[1].output_tensors,
+            [
+                model.get_layer("dense_0").output,
+                model.get_layer("dense_2").output,
+            ],
+        )
+        self.assertAllClose(history["loss"], ref_history["loss"])
+        self.assertAllClose(evaluation, ref_eval)
+        for output, ref_output in zip(pred, ref_pred):
+            self.assertAllClose(output, ref_output)
+        for weight, ref_weight in zip(
+            model.get_weights(), ref_model.get_weights()
+        ):
+            self.assertAllClose(weight, ref_weight)
+
+    def test_errors(self):
+        x = np.random.random((8, 8)).astype("float32")
+        y = np.random.random((8, 2)).astype("float32")
+        distribution = distribution_lib.PipelineParallel(
+            devices=jax.devices()[:2]
+        )
+        with distribution.scope():
+            inputs = layers.Input((8,))
+            shared = layers.Dense(8)
+            outputs = layers.Dense(2)(shared(shared(inputs)))
+            model = models.Model(inputs, outputs)
+            model.compile(optimizer="sgd", loss="mse")
+            with self.assertRaisesRegex(ValueError, "called in several"):
+                model.fit(x, y, verbose=0)
+
+        distribution = distribution_lib.PipelineParallel(
+            devices=jax.devices()[:2], stage_boundaries=["missing"]
+        )
+        with distribution.scope():
+            model = get_mlp()
+            model.compile(optimizer="sgd", loss="mse")
+            with self.assertRaisesRegex(ValueError, "aren't called"):
+                model.fit(x, y, verbose=0)
+
+        distribution = distribution_lib.PipelineParallel(
+            devices=jax.devices()[:2]
+        )
+        with distribution.scope():
+            model = get_mlp()
+            model.compile(
+                optimizer=optimizers.SGD(global_clipnorm=1.0), loss="mse"
+            )
+            with self.assertRaisesRegex(ValueError, "global_clipnorm"):
+                model.fit(x, y, verbose=0)
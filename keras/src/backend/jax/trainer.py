@@ -13,6 +13,7 @@ from keras.src import tree
 from keras.src.backend import config
 from keras.src.backend import distribution_lib as jax_distribution_lib
 from keras.src.backend.config import is_nnx_enabled
+from keras.src.callbacks import step_profiler
 from keras.src.distribution import distribution_lib
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
@@ -34,6 +35,7 @@ class JAXTrainer(base_trainer.Trainer):
         self.train_function = None
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
         self._jax_state_synced = True
 
     def compute_loss_and_updates(
@@ -258,9 +260,26 @@ class JAXTrainer(base_trainer.Trainer):
 
         return iterator_step
 
+    def _get_pipeline(self):
+        """Returns the `Pipeline` running the steps with `PipelineParallel`."""
+        from keras.src.backend.jax.pipeline import Pipeline
+
+        distribution = distribution_lib.distribution()
+        if not isinstance(distribution, distribution_lib.PipelineParallel):
+            return None
+        pipeline = getattr(self, "_pipeline", None)
+        if pipeline is None or pipeline.distribution is not distribution:
+            pipeline = Pipeline(self, distribution)
+            self._pipeline = pipeline
+        return pipeline
+
     def make_train_function(self, force=False):
         if self.train_function is not None and not force:
             return
+        pipeline = self._get_pipeline()
+        if pipeline is not None:
+            self.train_function = self._make_function(pipeline.train_step)
+            return
         if not self.run_eagerly and self.jit_compile:
             out_shardings = None
             if distribution_lib.distribution() is not None:
@@ -287,6 +306,10 @@ class JAXTrainer(base_trainer.Trainer):
     def make_test_function(self, force=False):
         if self.test_function is not None and not force:
             return
+        pipeline = self._get_pipeline()
+        if pipeline is not None:
+            self.test_function = self._make_function(pipeline.test_step)
+            return
         if not self.run_eagerly and self.jit_compile:
             out_shardings = None
             if distribution_lib.distribution() is not None:
@@ -323,6 +346,12 @@ class JAXTrainer(base_trainer.Trainer):
     def make_predict_function(self, force=False):
         if self.predict_function is not None and not force:
             return self.predict_function
+        pipeline = self._get_pipeline()
+        if pipeline is not None:
+            self.predict_function = self._make_function(
+                pipeline.predict_step, concatenate_outputs=True
+            )
+            return self.predict_function
 
         def predict_step(state, data):
             outputs, non_trainable_variables = self.predict_step(state, data)
@@ -348,6 +377,9 @@ class JAXTrainer(base_trainer.Trainer):
                 out_shardings=out_shardings,
             )
 
+        if self.shape_buckets is not None:
+            predict_step = self._bucketed_predict_step(predict_step)
+
         _step_function = self._make_function(
             predict_step, concatenate_outputs=True
         )
@@ -358,7 +390,58 @@ class JAXTrainer(base_trainer.Trainer):
 
         self.predict_function = step_function
 
+    def make_predict_on_tensors_function(self, force=False):
+        if self.predict_on_tensors_function is not None and not force:
+            return self.predict_on_tensors_function
+
+        def predict_step(state, x):
+            outputs, non_trainable_variables = self.predict_step(state, (x,))
+            # Only return the variables updated by the call, which are
+            # usually none in inference.
+            updates = {
+                i: new_value
+                for i, (new_value, value) in enumerate(
+                    zip(non_trainable_variables, state[1])
+                )
+                if new_value is not value
+            }
+            return outputs, updates
+
+        if not self.run_eagerly and self.jit_compile:
+            # The variables are not donated, so that they stay valid.
+            predict_step = jit(predict_step)
+
+        def predict_on_tensors_function(x):
+            non_trainable_variables = self.non_trainable_variables
+            state = (
+                [v.value for v in self.trainable_variables],
+                [v.value for v in non_trainable_variables],
+            )
+            if self.shape_buckets is not None:
+                x, padding = self.shape_buckets.pad(x)
+            outputs, updates = predict_step(state, x)
+            for i, value in updates.items():
+                non_trainable_variables[i].assign(value)
+            if self.shape_buckets is not None:
+                outputs = self.shape_buckets.unpad(outputs, padding)
+            return outputs
+
+        self.predict_on_tensors_function = predict_on_tensors_function
+        return self.predict_on_tensors_function
+
+    def _bucketed_predict_step(self, predict_step):
+        """Pads the inputs of `predict_step` to the `shape_buckets`."""
+
+        def bucketed_predict_step(state, data):
+            x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data)
+            x, padding = self.shape_buckets.pad(x)
+            outputs, state = predict_step(state, (x,))
+            return self.shape_buckets.unpad(outputs, padding), state
+
+        return bucketed_predict_step
+
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def fit(
         self,
         x=None,
@@ -377,6 +460,7 @@ class JAXTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         self._assert_compile_called("fit")
         # Possibly cap epochs for debugging runs.
@@ -413,6 +497,7 @@ class JAXTrainer(base_trainer.Trainer):
             shuffle=shuffle,
             class_weight=class_weight,
             steps_per_execution=self.steps_per_execution,
+            length_bucketing=length_bucketing,
         )
 
         self._symbolic_build(iterator=epoch_iterator)
@@ -547,6 +632,7 @@ class JAXTrainer(base_trainer.Trainer):
         return self.history
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def evaluate(
         self,
         x=None,
@@ -649,6 +735,7 @@ class JAXTrainer(base_trainer.Trainer):
         return self._flatten_metrics_in_order(logs)
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def predict(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
@@ -874,6 +961,15 @@ class JAXTrainer(base_trainer.Trainer):
         batch_outputs = tree.map_structure(lambda x: np.array(x), batch_outputs)
         return batch_outputs
 
+    def predict_on_tensors(self, x):
+        if not all(layer.built for layer in self._flatten_layers()):
+            # Build model
+            with backend.StatelessScope():
+                self(x)
+        self.jax_state_sync()
+        self.make_predict_on_tensors_function()
+        return self.predict_on_tensors_function(x)
+
     def jax_state_sync(self):
         if not getattr(self, "_jax_state", None) or self._jax_state_synced:
             return
@@ -979,21 +1075,22 @@ class JAXTrainer(base_trainer.Trainer):
 
 
 def _distribute_data(data, layouts=None):
-    distribution = distribution_lib.distribution()
+    with step_profiler.profile_phase("host_to_device"):
+        distribution = distribution_lib.distribution()
 
-    if distribution is not None:
-        if layouts is None:
-            layouts = tree.map_structure(
-                lambda d: distribution.get_data_layout(d.shape),
-                data,
+        if distribution is not None:
+            if layouts is None:
+                layouts = tree.map_structure(
+                    lambda d: distribution.get_data_layout(d.shape),
+                    data,
+                )
+            jax_dist_data_input = partial(
+                jax_distribution_lib.distribute_data_input,
+                batch_dim_name=distribution.batch_dim_name,
             )
-        jax_dist_data_input = partial(
-            jax_distribution_lib.distribute_data_input,
-            batch_dim_name=distribution.batch_dim_name,
-        )
-        return tree.map_structure(jax_dist_data_input, data, layouts)
+            return tree.map_structure(jax_dist_data_input, data, layouts)
 
-    return tree.map_structure(jax.device_put, data)
+        return tree.map_structure(jax.device_put, data)
 
 
 class JAXEpochIterator(EpochIterator):
@@ -1017,9 +1114,9 @@ class JAXEpochIterator(EpochIterator):
         for data in self.data_adapter.get_jax_iterator():
             if layouts is None:
                 layouts = tree.map_structure(
-                    lambda d: distribution.get_data_layout(
-                        d.shape
-                    ).backend_layout,
+                    lambda d: (
+                        distribution.get_data_layout(d.shape).backend_layout
+                    ),
                     data,
                 )
             yield _distribute_data(data, layouts)
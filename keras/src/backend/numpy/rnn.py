@@ -1,6 +1,7 @@
 import numpy as np
 
 from keras.src import tree
+from keras.src.backend.numpy.core import convert_to_tensor
 
 
 def rnn(
@@ -200,12 +201,148 @@ def rnn(
     return last_output, outputs, new_states
 
 
-def lstm(*args, **kwargs):
-    raise NotImplementedError
+def lstm(
+    inputs,
+    initial_state_h,
+    initial_state_c,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+):
+    """Fused LSTM: the input projection of all timesteps is computed with a
+    single matmul and only the recurrent part runs in the time loop.
 
+    Masked LSTMs raise `NotImplementedError` so that the layer falls back to
+    the generic `rnn` loop. `unroll` has no effect with NumPy.
+    """
+    if mask is not None:
+        raise NotImplementedError
+
+    projected_inputs = _project_inputs(
+        inputs, kernel, bias, go_backwards, time_major
+    )
+    recurrent_kernel = convert_to_tensor(recurrent_kernel)
+    dtype = projected_inputs.dtype
+    h = convert_to_tensor(initial_state_h, dtype)
+    c = convert_to_tensor(initial_state_c, dtype)
+    outputs = _allocate_outputs(projected_inputs, h, return_sequences)
+
+    for t, x in enumerate(projected_inputs):
+        z = x + np.matmul(h, recurrent_kernel)
+        z_i, z_f, z_c, z_o = np.split(z, 4, axis=-1)
+        i = recurrent_activation(z_i)
+        f = recurrent_activation(z_f)
+        c = f * c + i * activation(z_c)
+        o = recurrent_activation(z_o)
+        h = o * activation(c)
+        if outputs is not None:
+            outputs[t] = h
+    return _format_fused_outputs(outputs, h, [h, c], time_major)
+
+
+def gru(
+    inputs,
+    initial_state,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+    reset_after=True,
+):
+    """Fused GRU: the input projection of all timesteps is computed with a
+    single matmul and only the recurrent part runs in the time loop.
+
+    Masked GRUs raise `NotImplementedError` so that the layer falls back to
+    the generic `rnn` loop. `unroll` has no effect with NumPy.
+    """
+    if mask is not None:
+        raise NotImplementedError
+
+    input_bias, recurrent_bias = _split_gru_bias(bias, reset_after)
+    projected_inputs = _project_inputs(
+        inputs, kernel, input_bias, go_backwards, time_major
+    )
+    recurrent_kernel = convert_to_tensor(recurrent_kernel)
+    units = recurrent_kernel.shape[0]
+    if not reset_after:
+        recurrent_kernel_zr = recurrent_kernel[:, : 2 * units]
+        recurrent_kernel_h = recurrent_kernel[:, 2 * units :]
+    dtype = projected_inputs.dtype
+    h = convert_to_tensor(initial_state, dtype)
+    outputs = _allocate_outputs(projected_inputs, h, return_sequences)
+
+    for t, x in enumerate(projected_inputs):
+        x_z, x_r, x_h = np.split(x, 3, axis=-1)
+        if reset_after:
+            matrix_inner = np.matmul(h, recurrent_kernel)
+            if recurrent_bias is not None:
+                matrix_inner = matrix_inner + recurrent_bias
+        else:
+            matrix_inner = np.matmul(h, recurrent_kernel_zr)
+        z = recurrent_activation(x_z + matrix_inner[:, :units])
+        r = recurrent_activation(x_r + matrix_inner[:, units : units * 2])
+        if reset_after:
+            recurrent_h = r * matrix_inner[:, units * 2 :]
+        else:
+            recurrent_h = np.matmul(r * h, recurrent_kernel_h)
+        hh = activation(x_h + recurrent_h)
+        h = z * h + (1 - z) * hh
+        if outputs is not None:
+            outputs[t] = h
+    return _format_fused_outputs(outputs, h, [h], time_major)
 
-def gru(*args, **kwargs):
-    raise NotImplementedError
+
+def _project_inputs(inputs, kernel, bias, go_backwards, time_major):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if not time_major:
+        inputs = np.swapaxes(inputs, 0, 1)
+    if go_backwards:
+        inputs = np.flip(inputs, axis=0)
+    # A single (timesteps * batch, features) x (features, gates) matmul.
+    projected_inputs = np.matmul(inputs, kernel)
+    if bias is not None:
+        projected_inputs = projected_inputs + convert_to_tensor(bias)
+    return projected_inputs
+
+
+def _split_gru_bias(bias, reset_after):
+    if bias is None:
+        return None, None
+    bias = convert_to_tensor(bias)
+    if reset_after:
+        return bias[0], bias[1]
+    return bias, None
+
+
+def _allocate_outputs(projected_inputs, state, return_sequences):
+    if not return_sequences:
+        return None
+    return np.empty(
+        (projected_inputs.shape[0],) + state.shape, dtype=state.dtype
+    )
+
+
+def _format_fused_outputs(outputs, last_output, states, time_major):
+    # Match the format of `rnn()`.
+    if outputs is None:
+        outputs = np.expand_dims(last_output, axis=0 if time_major else 1)
+    elif not time_major:
+        outputs = np.swapaxes(outputs, 0, 1)
+    return last_output, outputs, states
 
 
 def unstack(x, axis=0):
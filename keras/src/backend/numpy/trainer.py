@@ -6,6 +6,7 @@ from keras.src import tree
 from keras.src.backend.common import standardize_dtype
 from keras.src.backend.common.keras_tensor import KerasTensor
 from keras.src.backend.numpy.core import is_tensor
+from keras.src.callbacks import step_profiler
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import data_adapter_utils
 from keras.src.trainers.epoch_iterator import EpochIterator
@@ -17,6 +18,7 @@ class NumpyTrainer(base_trainer.Trainer):
         super().__init__()
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
 
     def test_step(self, data):
         (
@@ -70,7 +72,12 @@ class NumpyTrainer(base_trainer.Trainer):
 
         def one_predict_step(data):
             data = data[0]
-            return self.predict_step(data)
+            if self.shape_buckets is None:
+                return self.predict_step(data)
+            x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data)
+            x, padding = self.shape_buckets.pad(x)
+            outputs = self.predict_step((x,))
+            return self.shape_buckets.unpad(outputs, padding)
 
         def multi_predict_steps(data):
             outputs = one_predict_step(data[:1])
@@ -165,10 +172,12 @@ class NumpyTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         raise NotImplementedError("fit not implemented for NumPy backend.")
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def predict(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
@@ -222,6 +231,7 @@ class NumpyTrainer(base_trainer.Trainer):
         return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def evaluate(
         self,
         x=None,
@@ -329,3 +339,21 @@ class NumpyTrainer(base_trainer.Trainer):
             backend.convert_to_numpy, batch_outputs
         )
         return batch_outputs
+
+    def make_predict_on_tensors_function(self, force=False):
+        if self.predict_on_tensors_function is not None and not force:
+            return self.predict_on_tensors_function
+
+        def predict_on_tensors_function(x):
+            if self.shape_buckets is None:
+                return self.predict_step((x,))
+            x, padding = self.shape_buckets.pad(x)
+            outputs = self.predict_step((x,))
+            return self.shape_buckets.unpad(outputs, padding)
+
+        self.predict_on_tensors_function = predict_on_tensors_function
+        return self.predict_on_tensors_function
+
+    def predict_on_tensors(self, x):
+        self.make_predict_on_tensors_function()
+        return self.predict_on_tensors_function(x)
@@ -8,6 +8,7 @@ from keras.src import tree
 from keras.src.backend.openvino.core import OPENVINO_DTYPES
 from keras.src.backend.openvino.core import OpenVINOKerasTensor
 from keras.src.backend.openvino.core import get_device
+from keras.src.callbacks import step_profiler
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import data_adapter_utils
 from keras.src.trainers.epoch_iterator import EpochIterator
@@ -19,6 +20,7 @@ class OpenVINOTrainer(base_trainer.Trainer):
         super().__init__()
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
         self.ov_compiled_model = None
         self.ov_device = None
         self.struct_params = None
@@ -164,12 +166,14 @@ class OpenVINOTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         raise NotImplementedError(
             "`fit` is not supported with openvino backend"
         )
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def predict(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
@@ -224,6 +228,7 @@ class OpenVINOTrainer(base_trainer.Trainer):
         return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def evaluate(
         self,
         x=None,
@@ -270,3 +275,17 @@ class OpenVINOTrainer(base_trainer.Trainer):
             backend.convert_to_numpy, batch_outputs
         )
         return batch_outputs
+
+    def make_predict_on_tensors_function(self, force=False):
+        if self.predict_on_tensors_function is not None and not force:
+            return self.predict_on_tensors_function
+
+        def predict_on_tensors_function(x):
+            return self.predict_step((x,))
+
+        self.predict_on_tensors_function = predict_on_tensors_function
+        return self.predict_on_tensors_function
+
+    def predict_on_tensors(self, x):
+        self.make_predict_on_tensors_function()
+        return self.predict_on_tensors_function(x)
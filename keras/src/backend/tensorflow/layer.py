@@ -51,9 +51,13 @@ class TFLayer(KerasAutoTrackable):
             train_function = getattr(self, "train_function", None)
             test_function = getattr(self, "test_function", None)
             predict_function = getattr(self, "predict_function", None)
+            predict_on_tensors_function = getattr(
+                self, "predict_on_tensors_function", None
+            )
             self.train_function = None
             self.test_function = None
             self.predict_function = None
+            self.predict_on_tensors_function = None
 
         children = super()._trackable_children(save_type, **kwargs)
 
@@ -61,6 +65,7 @@ class TFLayer(KerasAutoTrackable):
             self.train_function = train_function
             self.test_function = test_function
             self.predict_function = predict_function
+            self.predict_on_tensors_function = predict_on_tensors_function
 
             # Convert Keras tracked collections to plain Python structures
             # without creating TensorFlow trackable dependencies
@@ -71,6 +71,18 @@ class TFOptimizer(KerasAutoTrackable, base_optimizer.BaseOptimizer):
         else:
             variable.assign_sub(value)
 
+    def _sparse_gradient_rows(self, gradient):
+        if not isinstance(gradient, tf.IndexedSlices):
+            return None
+        indices, positions = tf.unique(gradient.indices)
+        values = tf.math.unsorted_segment_sum(
+            gradient.values, positions, tf.shape(indices)[0]
+        )
+        return indices, values
+
+    def _assign_rows(self, variable, indices, values):
+        self.assign(variable, tf.IndexedSlices(values, indices))
+
     def _var_key(self, variable):
         if isinstance(variable, backend.Variable):
             variable = variable.value  # Convert to tf.Variable
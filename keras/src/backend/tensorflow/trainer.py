@@ -11,6 +11,7 @@ from keras.src import metrics as metrics_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
 from keras.src.backend import config
+from keras.src.callbacks import step_profiler
 from keras.src.losses import loss as loss_module
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
@@ -25,6 +26,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self.train_function = None
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
 
         # Specifies how many steps of the step_per_execution loop to unroll.
         # Increasing this value can reduce kernel launch overhead,
@@ -312,6 +314,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self.predict_function = predict_function
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def fit(
         self,
         x=None,
@@ -330,6 +333,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         self._assert_compile_called("fit")
         # Possibly cap epochs for debugging runs.
@@ -367,6 +371,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
             class_weight=class_weight,
             distribute_strategy=self.distribute_strategy,
             steps_per_execution=self.steps_per_execution,
+            length_bucketing=length_bucketing,
         )
 
         self._maybe_symbolic_build(iterator=epoch_iterator)
@@ -453,6 +458,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         return self.history
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def evaluate(
         self,
         x=None,
@@ -520,6 +526,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         return self._flatten_metrics_in_order(logs)
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def predict(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
@@ -656,12 +663,44 @@ class TensorFlowTrainer(base_trainer.Trainer):
 
     def predict_on_batch(self, x):
         self.make_predict_function()
+        # `predict()` batches have a dynamic batch size in the traced
+        # function, so only the eager batches of `predict_on_batch()` and
+        # `predict_on_tensors()` are padded to the `shape_buckets`.
+        if self.shape_buckets is not None:
+            x, padding = self.shape_buckets.pad(x)
         batch_outputs = self.predict_function([(x,)])
+        if self.shape_buckets is not None:
+            batch_outputs = self.shape_buckets.unpad(batch_outputs, padding)
         batch_outputs = tree.map_structure(
             convert_to_np_if_not_ragged, batch_outputs
         )
         return batch_outputs
 
+    def make_predict_on_tensors_function(self, force=False):
+        if self.predict_on_tensors_function is not None and not force:
+            return self.predict_on_tensors_function
+
+        @tf.autograph.experimental.do_not_convert
+        def predict_on_tensors_function(x):
+            return self.predict_step((x,))
+
+        if not self.run_eagerly:
+            predict_on_tensors_function = tf.function(
+                predict_on_tensors_function,
+                reduce_retracing=True,
+                jit_compile=self.jit_compile,
+            )
+        self.predict_on_tensors_function = predict_on_tensors_function
+        return self.predict_on_tensors_function
+
+    def predict_on_tensors(self, x):
+        self.make_predict_on_tensors_function()
+        if self.shape_buckets is None:
+            return self.predict_on_tensors_function(x)
+        x, padding = self.shape_buckets.pad(x)
+        outputs = self.predict_on_tensors_function(x)
+        return self.shape_buckets.unpad(outputs, padding)
+
     # Backwards compatibility shims.
     @property
     def compiled_metrics(self):
@@ -757,6 +796,11 @@ class TFEpochIterator(EpochIterator):
     def _get_iterator(self):
         return self._distributed_dataset
 
+    def _make_iterator(self):
+        # The step function fetches the batches with `tf.data`, so they can't
+        # be timed separately.
+        return iter(self._get_iterator())
+
     def tf_sync(self):
         tf_context.async_wait()
 
@@ -9,6 +9,7 @@ from keras.src import callbacks as callbacks_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
 from keras.src.backend import config
+from keras.src.callbacks import step_profiler
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -22,6 +23,7 @@ class TorchTrainer(base_trainer.Trainer):
         self.train_function = None
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
 
     def _should_torch_compile(self):
         # require torch>=2.1.0 to enable dynamo since it
@@ -166,11 +168,21 @@ class TorchTrainer(base_trainer.Trainer):
                 return self.predict_step(data)
 
         if self._should_torch_compile():
-            self.predict_function = torch.compile(one_step_on_data)
-        else:
-            self.predict_function = one_step_on_data
+            one_step_on_data = torch.compile(one_step_on_data)
+
+        if self.shape_buckets is not None:
+            compiled_step_on_data = one_step_on_data
+
+            def one_step_on_data(data):
+                x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data[0])
+                x, padding = self.shape_buckets.pad(x)
+                outputs = compiled_step_on_data([(x,)])
+                return self.shape_buckets.unpad(outputs, padding)
+
+        self.predict_function = one_step_on_data
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def fit(
         self,
         x=None,
@@ -189,6 +201,7 @@ class TorchTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         if not self.compiled:
             raise ValueError(
@@ -230,6 +243,7 @@ class TorchTrainer(base_trainer.Trainer):
             shuffle=shuffle,
             class_weight=class_weight,
             steps_per_execution=self.steps_per_execution,
+            length_bucketing=length_bucketing,
         )
 
         self._symbolic_build(iterator=epoch_iterator)
@@ -327,6 +341,7 @@ class TorchTrainer(base_trainer.Trainer):
         return self.history
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def evaluate(
         self,
         x=None,
@@ -394,6 +409,7 @@ class TorchTrainer(base_trainer.Trainer):
         return self._flatten_metrics_in_order(logs)
 
     @traceback_utils.filter_traceback
+    @step_profiler.restore_active_profiler
     def predict(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
@@ -512,6 +528,35 @@ class TorchTrainer(base_trainer.Trainer):
         )
         return batch_outputs
 
+    def make_predict_on_tensors_function(self, force=False):
+        if self.predict_on_tensors_function is not None and not force:
+            return self.predict_on_tensors_function
+
+        def predict_on_tensors_function(x):
+            with torch.no_grad():
+                return self.predict_step((x,))
+
+        if self._should_torch_compile():
+            predict_on_tensors_function = torch.compile(
+                predict_on_tensors_function
+            )
+
+        if self.shape_buckets is not None:
+            compiled_function = predict_on_tensors_function
+
+            def predict_on_tensors_function(x):
+                x, padding = self.shape_buckets.pad(x)
+                outputs = compiled_function(x)
+                return self.shape_buckets.unpad(outputs, padding)
+
+        self.predict_on_tensors_function = predict_on_tensors_function
+        return self.predict_on_tensors_function
+
+    def predict_on_tensors(self, x):
+        self.eval()
+        self.make_predict_on_tensors_function()
+        return self.predict_on_tensors_function(x)
+
 
 class TorchEpochIterator(EpochIterator):
     def _get_iterator(self):
@@ -7,6 +7,7 @@ from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
 from keras.src.callbacks.history import History
 from keras.src.callbacks.progbar_logger import ProgbarLogger
+from keras.src.callbacks.step_profiler import StepProfiler
 from keras.src.utils import python_utils
 
 
@@ -45,6 +46,11 @@ class CallbackList(Callback):
         self._async_test = False
         self._async_predict = False
         self._futures = []
+        # A `StepProfiler` times the batch hooks of the other callbacks.
+        self._profiler = None
+        for callback in self.callbacks:
+            if isinstance(callback, StepProfiler):
+                self._profiler = callback
         self._configure_async_dispatch(callbacks)
         self._add_default_callbacks(add_history, add_progbar)
         self.set_model(model)
@@ -172,16 +178,31 @@ class CallbackList(Callback):
 
     def on_train_batch_begin(self, batch, logs=None):
         logs = python_utils.pythonify_logs(logs)
+        if self._profiler is not None:
+            self._profiler._on_batch_begin(
+                self.callbacks, "on_train_batch_begin", batch, logs
+            )
+            return
         for callback in self.callbacks:
             callback.on_train_batch_begin(batch, logs=logs)
 
     def on_test_batch_begin(self, batch, logs=None):
         logs = python_utils.pythonify_logs(logs)
+        if self._profiler is not None:
+            self._profiler._on_batch_begin(
+                self.callbacks, "on_test_batch_begin", batch, logs
+            )
+            return
         for callback in self.callbacks:
             callback.on_test_batch_begin(batch, logs=logs)
 
     def on_predict_batch_begin(self, batch, logs=None):
         logs = python_utils.pythonify_logs(logs)
+        if self._profiler is not None:
+            self._profiler._on_batch_begin(
+                self.callbacks, "on_predict_batch_begin", batch, logs
+            )
+            return
         for callback in self.callbacks:
             callback.on_predict_batch_begin(batch, logs=logs)
 
@@ -192,18 +213,33 @@ class CallbackList(Callback):
             self._on_batch_end(batch, logs)
 
     def on_train_batch_end(self, batch, logs=None):
+        if self._profiler is not None:
+            self._profiler._on_batch_end(
+                self.callbacks, "on_train_batch_end", batch, logs
+            )
+            return
         if self._async_train:
             self._async_dispatch(self._on_train_batch_end, batch, logs)
         else:
             self._on_train_batch_end(batch, logs)
 
     def on_test_batch_end(self, batch, logs=None):
+        if self._profiler is not None:
+            self._profiler._on_batch_end(
+                self.callbacks, "on_test_batch_end", batch, logs
+            )
+            return
         if self._async_test:
             self._async_dispatch(self._on_test_batch_end, batch, logs)
         else:
             self._on_test_batch_end(batch, logs)
 
     def on_predict_batch_end(self, batch, logs=None):
+        if self._profiler is not None:
+            self._profiler._on_batch_end(
+                self.callbacks, "on_predict_batch_end", batch, logs
+            )
+            return
         if self._async_predict:
             self._async_dispatch(self._on_predict_batch_end, batch, logs)
         else:
@@ -0,0 +1,390 @@
+import contextlib
+import functools
+import json
+import os
+import time
+
+import numpy as np
+
+from keras.src.api_export import keras_export
+from keras.src.backend.common import global_state
+from keras.src.callbacks.callback import Callback
+from keras.src.utils import file_utils
+from keras.src.utils import python_utils
+
+MODES = ("train", "test", "predict")
+PHASES = ("data_fetch", "host_to_device", "step", "sync", "callbacks")
+
+
+def profile_phase(name):
+    """Returns a context manager timing a phase for the active `StepProfiler`.
+
+    It does nothing when no `StepProfiler` is active.
+
+    Args:
+        name: The name of the phase, e.g. `"host_to_device"`.
+    """
+    profiler = global_state.get_global_attribute("step_profiler")
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler._phase(name)
+
+
+def profile_data_iterator(iterator):
+    """Times the batches fetched from `iterator` for the active profiler.
+
+    Returns `iterator` itself when no `StepProfiler` is active.
+    """
+    profiler = global_state.get_global_attribute("step_profiler")
+    if profiler is None:
+        return iterator
+    return profiler._time_data_iterator(iterator)
+
+
+def restore_active_profiler(fn):
+    """Decorator restoring the active `StepProfiler` when `fn` exits.
+
+    The profiler registers itself in `on_*_begin` and unregisters in
+    `on_*_end`, which isn't called when `fit()`, `evaluate()` or `predict()`
+    raises. This keeps a failed call from leaving it active for the later
+    calls.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profiler = global_state.get_global_attribute("step_profiler")
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            global_state.set_global_attribute("step_profiler", profiler)
+
+    return wrapper
+
+
+@keras_export("keras.callbacks.StepProfiler")
+class StepProfiler(Callback):
+    """Callback that times each phase of the steps of `fit()`, `evaluate()`
+    and `predict()`.
+
+    For each step, the time is broken down into the phases:
+
+    - `"data_fetch"`: fetching the batches from the dataset.
+    - `"host_to_device"`: transferring the batches to the devices.
+    - `"step"`: running the step function.
+    - `"sync"`: waiting for the results of the step, and converting the
+        metrics to Python values for the callbacks.
+    - `"callbacks"`: running the batch hooks of the callbacks.
+
+    The report gives, for each mode (`"train"`, `"test"` and `"predict"`), the
+    statistics and the histogram of the per-step time of each phase, the
+    overhead of each callback, and whether the steps are input-bound,
+    compute-bound or callback-bound.
+
+    Notes:
+
+    - The profiled steps are run synchronously, the callbacks aren't
+        dispatched asynchronously.
+    - With asynchronous dispatch (JAX, TensorFlow), the step function
+        returns before the device finishes, and the rest of the computation
+        is counted in `"sync"`.
+    - Only the JAX backend transfers the batches outside of the step function.
+        With the TensorFlow backend, `tf.data` fetches the batches within the
+        step function, so they are counted in `"step"`.
+
+    Args:
+        warmup_steps: Number of steps at the beginning of each call to
+            `fit()`, `evaluate()` or `predict()` that aren't included in the
+            report, e.g. because they compile the step function. They are
+            still included in the trace. Defaults to `1`.
+        num_bins: Number of bins of the histograms. Defaults to `20`.
+        report_path: Optional path of a JSON file to write the report to, at
+            the end of each call to `fit()`, `evaluate()` or `predict()`.
+        trace_path: Optional path of a file to write the trace to, in the
+            Chrome trace format, at the end of each call to `fit()`,
+            `evaluate()` or `predict()`. It can be opened with
+            `chrome://tracing` or [Perfetto](https://ui.perfetto.dev).
+
+    Example:
+
+    ```python
+    profiler = keras.callbacks.StepProfiler(trace_path="/tmp/trace.json")
+    model.fit(x, y, callbacks=[profiler])
+    report = profiler.get_report()
+    print(report["train"]["diagnosis"])
+    print(report["train"]["phases"]["data_fetch"]["mean"])
+    ```
+    """
+
+    def __init__(
+        self, warmup_steps=1, num_bins=20, report_path=None, trace_path=None
+    ):
+        super().__init__()
+        self.warmup_steps = warmup_steps
+        self.num_bins = num_bins
+        self.report_path = (
+            file_utils.path_to_string(report_path) if report_path else None
+        )
+        self.trace_path = (
+            file_utils.path_to_string(trace_path) if trace_path else None
+        )
+        self.reset()
+
+    def reset(self):
+        """Clears the recorded steps."""
+        # Per mode, the per-step times of each phase and of each callback.
+        self._phase_times = {}
+        self._callback_times = {}
+        self._trace_events = []
+        # Stack of the active modes, e.g. `["train", "test"]` in validation.
+        self._modes = []
+        # Per mode, the time of each phase in the current step.
+        self._pending = {}
+        self._num_steps = {}
+        # Stack of `[name, start, nested time]` of the active phases, and its
+        # depth at the beginning of each active mode.
+        self._frames = []
+        self._depths = []
+        self._origin = time.perf_counter()
+
+    @property
+    def _mode(self):
+        return self._modes[-1] if self._modes else None
+
+    def _begin(self, mode):
+        self._modes.append(mode)
+        self._depths.append(len(self._frames))
+        self._pending[mode] = {}
+        self._num_steps[mode] = 0
+        self._phase_times.setdefault(mode, {phase: [] for phase in PHASES})
+        self._callback_times.setdefault(mode, {})
+        global_state.set_global_attribute("step_profiler", self)
+
+    def _end(self):
+        self._modes.pop()
+        # Drop the phases interrupted by an error, e.g. the end of the data
+        # in the step function.
+        del self._frames[self._depths.pop() :]
+        if self._modes:
+            return
+        global_state.set_global_attribute("step_profiler", None)
+        if self.report_path:
+            self.save_report(self.report_path)
+        if self.trace_path:
+            self.save_trace(self.trace_path)
+
+    def on_train_begin(self, logs=None):
+        self._begin("train")
+
+    def on_train_end(self, logs=None):
+        self._end()
+
+    def on_test_begin(self, logs=None):
+        self._begin("test")
+
+    def on_test_end(self, logs=None):
+        self._end()
+
+    def on_predict_begin(self, logs=None):
+        self._begin("predict")
+
+    def on_predict_end(self, logs=None):
+        self._end()
+
+    def _push(self, name):
+        self._frames.append([name, time.perf_counter(), 0.0])
+
+    def _pop(self, args=None):
+        name, start, nested = self._frames.pop()
+        elapsed = time.perf_counter() - start
+        if self._frames:
+            self._frames[-1][2] += elapsed
+        mode = self._mode
+        if mode is not None:
+            pending = self._pending[mode]
+            pending[name] = pending.get(name, 0.0) + elapsed - nested
+            self._trace_events.append(
+                {
+                    "name": name if args is None else args["callback"],
+                    "cat": name,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": elapsed * 1e6,
+                    "pid": os.getpid(),
+                    "tid": MODES.index(mode),
+                    "args": {"step": self._num_steps[mode], **(args or {})},
+                }
+            )
+        return elapsed - nested
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        self._push(name)
+        try:
+            yield
+        finally:
+            self._pop()
+
+    def _time_data_iterator(self, iterator):
+        iterator = iter(iterator)
+        while True:
+            self._push("data_fetch")
+            try:
+                data = next(iterator)
+            except StopIteration:
+                # The end of the data isn't a fetch.
+                self._frames.pop()
+                return
+            except Exception:
+                self._frames.pop()
+                raise
+            self._pop()
+            yield data
+
+    def _run_callbacks(self, callbacks, hook, batch, logs):
+        mode = self._mode
+        for callback in callbacks:
+            if callback is self:
+                continue
+            self._push("callbacks")
+            getattr(callback, hook)(batch, logs=logs)
+            name = callback.__class__.__name__
+            elapsed = self._pop(args={"callback": name, "hook": hook})
+            pending = self._pending[mode].setdefault("per_callback", {})
+            pending[name] = pending.get(name, 0.0) + elapsed
+
+    def _on_batch_begin(self, callbacks, hook, batch, logs):
+        """Runs the `hook` of the `callbacks` and starts timing the step.
+
+        Called by `CallbackList` instead of the batch begin hooks.
+        """
+        del self._frames[self._depths[-1] :]
+        self._run_callbacks(callbacks, hook, batch, logs)
+        self._push("step")
+
+    def _on_batch_end(self, callbacks, hook, batch, logs):
+        """Stops timing the step and runs the `hook` of the `callbacks`.
+
+        Called by `CallbackList` instead of the batch end hooks.
+        """
+        self._pop()
+        with self._phase("sync"):
+            logs = python_utils.pythonify_logs(logs)
+        self._run_callbacks(callbacks, hook, batch, logs)
+        self._finish_step()
+
+    def _finish_step(self):
+        mode = self._mode
+        pending = self._pending[mode]
+        self._pending[mode] = {}
+        self._num_steps[mode] += 1
+        if self._num_steps[mode] <= self.warmup_steps:
+            return
+        for phase, times in self._phase_times[mode].items():
+            times.append(pending.get(phase, 0.0))
+        callback_times = self._callback_times[mode]
+        for name, elapsed in pending.get("per_callback", {}).items():
+            callback_times.setdefault(name, []).append(elapsed)
+
+    def get_report(self):
+        """Returns the report of the recorded steps.
+
+        Returns:
+            A dict mapping each profiled mode (`"train"`, `"test"` or
+            `"predict"`) to a dict with the entries:
+
+            - `"num_steps"`: the number of steps in the report.
+            - `"phases"`: a dict mapping each phase to the statistics of its
+                per-step time in seconds: `"total"`, `"mean"`, `"p50"`,
+                `"p90"`, `"p99"`, `"max"`, and its `"histogram"`, a dict with
+                the `"bin_edges"` and the `"counts"`.
+            - `"callbacks"`: a dict mapping the class name of each callback
+                to the `"total"` and `"mean"` per-step time of its hooks.
+            - `"fractions"`: the fractions of the time spent on the input
+                (`"data_fetch"` and `"host_to_device"`), on the computation
+                (`"step"` and `"sync"`), and on the callbacks.
+            - `"diagnosis"`: `"input-bound"`, `"compute-bound"` or
+                `"callback-bound"`, whichever of the three takes the most
+                time.
+        """
+        report = {}
+        for mode, phase_times in self._phase_times.items():
+            num_steps = len(phase_times["step"])
+            if not num_steps:
+                continue
+            phases = {
+                phase: self._get_statistics(times)
+                for phase, times in phase_times.items()
+            }
+            callbacks = {}
+            for name, times in self._callback_times[mode].items():
+                callbacks[name] = {
+                    "total": float(np.sum(times)),
+                    "mean": float(np.sum(times)) / num_steps,
+                }
+            totals = {
+                "input": phases["data_fetch"]["total"]
+                + phases["host_to_device"]["total"],
+                "compute": phases["step"]["total"] + phases["sync"]["total"],
+                "callbacks": phases["callbacks"]["total"],
+            }
+            total = sum(totals.values()) or 1.0
+            diagnosis = max(totals, key=totals.get)
+            report[mode] = {
+                "num_steps": num_steps,
+                "phases": phases,
+                "callbacks": callbacks,
+                "fractions": {k: v / total for k, v in totals.items()},
+                "diagnosis": {
+                    "input": "input-bound",
+                    "compute": "compute-bound",
+                    "callbacks": "callback-bound",
+                }[diagnosis],
+            }
+        return report
+
+    def _get_statistics(self, times):
+        times = np.asarray(times, dtype="float64")
+        counts, bin_edges = np.histogram(times, bins=self.num_bins)
+        return {
+            "total": float(np.sum(times)),
+            "mean": float(np.mean(times)),
+            "p50": float(np.percentile(times, 50)),
+            "p90": float(np.percentile(times, 90)),
+            "p99": float(np.percentile(times, 99)),
+            "max": float(np.max(times)),
+            "histogram": {
+                "bin_edges": bin_edges.tolist(),
+                "counts": counts.tolist(),
+            },
+        }
+
+    def save_report(self, filepath):
+        """Writes the report returned by `get_report()` to a JSON file."""
+        with file_utils.File(filepath, "w") as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    def save_trace(self, filepath):
+        """Writes the timeline of the recorded phases to a JSON file.
+
+        The file is in the Chrome trace format, with a track per mode. It
+        includes the warmup steps.
+        """
+        # Name the track of each mode.
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": mode},
+            }
+            for tid, mode in enumerate(MODES)
+        ]
+        with file_utils.File(filepath, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": events + self._trace_events,
+                    "displayTimeUnit": "ms",
+                },
+                f,
+            )
@@ -0,0 +1,149 @@
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import callbacks
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.backend.common import global_state
+from keras.src.trainers.data_adapters import py_dataset_adapter
+
+
+class SlowCallback(callbacks.Callback):
+    def on_train_batch_end(self, batch, logs=None):
+        time.sleep(0.01)
+
+
+class FailingCallback(callbacks.Callback):
+    def on_train_batch_end(self, batch, logs=None):
+        raise RuntimeError("Failing callback")
+
+
+class SlowPyDataset(py_dataset_adapter.PyDataset):
+    def __init__(self, delay, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        time.sleep(self.delay)
+        return np.ones((2, 3)), np.ones((2, 1))
+
+
+def get_model():
+    model = models.Sequential([layers.Input((3,)), layers.Dense(1)])
+    model.compile(optimizer="sgd", loss="mse", metrics=["mae"])
+    return model
+
+
+@pytest.mark.requires_trainable_backend
+class StepProfilerTest(testing.TestCase):
+    def test_report(self):
+        profiler = callbacks.StepProfiler(num_bins=5)
+        model = get_model()
+        x = np.ones((8, 3))
+        y = np.ones((8, 1))
+        model.fit(
+            x,
+            y,
+            batch_size=2,
+            epochs=2,
+            validation_data=(x, y),
+            callbacks=[profiler, SlowCallback()],
+            verbose=0,
+        )
+        model.predict(x, batch_size=2, callbacks=[profiler], verbose=0)
+
+        report = profiler.get_report()
+        self.assertEqual(set(report.keys()), {"train", "test", "predict"})
+        # The first step of each call is excluded.
+        self.assertEqual(report["train"]["num_steps"], 7)
+        self.assertEqual(report["test"]["num_steps"], 6)
+        self.assertEqual(report["predict"]["num_steps"], 3)
+
+        train = report["train"]
+        self.assertEqual(
+            set(train["phases"].keys()),
+            {"data_fetch", "host_to_device", "step", "sync", "callbacks"},
+        )
+        for statistics in train["phases"].values():
+            self.assertLen(statistics["histogram"]["counts"], 5)
+            self.assertEqual(sum(statistics["histogram"]["counts"]), 7)
+            self.assertLessEqual(statistics["p50"], statistics["max"])
+        self.assertGreater(train["phases"]["step"]["total"], 0)
+        # The time of the callbacks is attributed to each of them.
+        self.assertGreater(train["callbacks"]["SlowCallback"]["mean"], 0.01)
+        self.assertAllClose(
+            sum(c["total"] for c in train["callbacks"].values()),
+            train["phases"]["callbacks"]["total"],
+        )
+        self.assertEqual(train["diagnosis"], "callback-bound")
+        self.assertAllClose(sum(train["fractions"].values()), 1.0)
+        self.assertLess(
+            report["test"]["callbacks"]["SlowCallback"]["mean"], 0.01
+        )
+
+    @pytest.mark.skipif(
+        backend.backend() == "tensorflow",
+        reason="`tf.data` fetches the batches in the step function.",
+    )
+    def test_input_bound(self):
+        profiler = callbacks.StepProfiler()
+        model = get_model()
+        model.fit(SlowPyDataset(0.02), callbacks=[profiler], verbose=0)
+        report = profiler.get_report()["train"]
+        self.assertGreater(report["phases"]["data_fetch"]["total"], 0.03)
+        self.assertEqual(report["diagnosis"], "input-bound")
+
+    def test_export(self):
+        temp_dir = self.get_temp_dir()
+        report_path = os.path.join(temp_dir, "report.json")
+        trace_path = os.path.join(temp_dir, "trace.json")
+        profiler = callbacks.StepProfiler(
+            report_path=report_path, trace_path=trace_path
+        )
+        model = get_model()
+        x = np.ones((8, 3))
+        y = np.ones((8, 1))
+        model.fit(x, y, batch_size=2, callbacks=[profiler], verbose=0)
+
+        with open(report_path) as f:
+            self.assertEqual(json.load(f), profiler.get_report())
+        with open(trace_path) as f:
+            events = json.load(f)["traceEvents"]
+        steps = [e for e in events if e["name"] == "step"]
+        # The trace includes the warmup step.
+        self.assertLen(steps, 4)
+        for event in steps:
+            self.assertEqual(event["ph"], "X")
+            self.assertGreaterEqual(event["dur"], 0)
+        self.assertIn("History", [e["name"] for e in events])
+
+    def test_unregistered_after_error(self):
+        profiler = callbacks.StepProfiler()
+        model = get_model()
+        x = np.ones((8, 3))
+        y = np.ones((8, 1))
+        with self.assertRaisesRegex(RuntimeError, "Failing callback"):
+            model.fit(
+                x,
+                y,
+                batch_size=2,
+                callbacks=[profiler, FailingCallback()],
+                verbose=0,
+            )
+        self.assertIsNone(global_state.get_global_attribute("step_profiler"))
+
+        # The later calls without the profiler aren't timed.
+        report = profiler.get_report()
+        model.fit(x, y, batch_size=2, verbose=0)
+        model.predict(x, batch_size=2, verbose=0)
+        self.assertEqual(profiler.get_report(), report)
+        self.assertEqual(profiler._phase_times["train"]["data_fetch"], [])
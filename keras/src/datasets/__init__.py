@@ -1,5 +1,6 @@
 """Small NumPy datasets for debugging/testing."""
 
+from keras.src.api_export import lazy_module_attributes
 from keras.src.datasets import boston_housing
 from keras.src.datasets import california_housing
 from keras.src.datasets import cifar10
@@ -8,3 +9,6 @@ from keras.src.datasets import fashion_mnist
 from keras.src.datasets import imdb
 from keras.src.datasets import mnist
 from keras.src.datasets import reuters
+
+# The other submodules are imported on first access, e.g. `datasets.cifar`.
+__getattr__, __dir__ = lazy_module_attributes(__name__, {}, submodules=True)
@@ -0,0 +1,561 @@
+"""Automatic planning of the variable layouts of `ModelParallel`."""
+
+import collections
+
+import numpy as np
+
+from keras.src import backend
+from keras.src.api_export import keras_export
+from keras.src.distribution.distribution_lib import LayoutMap
+
+VariableSharding = collections.namedtuple(
+    "VariableSharding",
+    ["path", "shape", "axes", "memory_per_device", "communication", "reason"],
+)
+
+
+@keras_export("keras.distribution.ShardingPlan")
+class ShardingPlan:
+    """The result of `keras.distribution.plan_sharding()`.
+
+    Attributes:
+        layout_map: The `LayoutMap` with a layout for every variable of the
+            model, to pass to `keras.distribution.ModelParallel`.
+        variables: A list with one `VariableSharding` named tuple per
+            variable, with the fields `path`, `shape`, `axes` (the layout),
+            `memory_per_device` (in bytes), `communication` (the estimated
+            bytes communicated per device per token in the forward pass
+            because of this layout) and `reason` (why this layout was
+            chosen).
+        model_dim_name: The axis of the device mesh variables are sharded
+            on.
+    """
+
+    def __init__(self, layout_map, variables, model_dim_name):
+        self.layout_map = layout_map
+        self.variables = variables
+        self.model_dim_name = model_dim_name
+
+    @property
+    def memory_per_device(self):
+        """The memory used by the variables on each device, in bytes."""
+        return sum(v.memory_per_device for v in self.variables)
+
+    @property
+    def replicated_memory(self):
+        """The memory used by the variables if fully replicated, in bytes."""
+        num_shards = _num_shards(
+            self.layout_map.device_mesh, self.model_dim_name
+        )
+        return sum(
+            v.memory_per_device
+            * (num_shards if self.model_dim_name in v.axes else 1)
+            for v in self.variables
+        )
+
+    @property
+    def communication(self):
+        """The estimated bytes communicated per device per token."""
+        return sum(v.communication for v in self.variables)
+
+    def report(self):
+        """Returns a human-readable table explaining the plan."""
+        mesh = self.layout_map.device_mesh
+        num_shards = _num_shards(mesh, self.model_dim_name)
+        rows = [("Variable", "Shape", "Layout", "Memory", "Comm", "Reason")]
+        for v in self.variables:
+            rows.append(
+                (
+                    v.path,
+                    str(v.shape),
+                    str(v.axes),
+                    _format_bytes(v.memory_per_device),
+                    _format_bytes(v.communication),
+                    v.reason,
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(5)]
+        lines = [
+            f"Sharding plan for a {tuple(mesh.shape)} mesh, sharding on axis "
+            f"'{self.model_dim_name}' ({num_shards} devices).",
+            "Memory is per device, Comm is the estimated bytes communicated "
+            "per device per token in the forward pass.",
+            "",
+        ]
+        for row in rows:
+            cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+            lines.append("  ".join(cells + [row[5]]))
+        lines += [
+            "",
+            "Variable memory per device: "
+            f"{_format_bytes(self.memory_per_device)} (replicated: "
+            f"{_format_bytes(self.replicated_memory)})",
+            "Estimated communication per token: "
+            f"{_format_bytes(self.communication)}",
+        ]
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+@keras_export("keras.distribution.plan_sharding")
+def plan_sharding(
+    model,
+    device_mesh,
+    model_dim_name=None,
+    min_shard_size=2**16,
+    communication_weight=1.0,
+):
+    """Proposes a layout for every variable of a model on a device mesh.
+
+    The planner inspects the layers of `model` in order and chooses, for the
+    kernel of every `Dense`, `EinsumDense` (including the projections of
+    attention layers) and `Embedding` layer, one of:
+
+    - Replicating it.
+    - Sharding an output axis of the kernel ("column-parallel"). The outputs
+        of the layer are sharded on the features, and gathered with an
+        all-gather unless a later row-parallel layer consumes them directly.
+    - Sharding a contracted axis of the kernel ("row-parallel"). The partial
+        outputs of the devices are summed with an all-reduce. When the
+        inputs are the sharded outputs of earlier column-parallel layers
+        (e.g. the up and down projections of a MLP, or the query, key, value
+        and output projections of an attention layer), they don't need to be
+        gathered, which saves the all-gathers of these layers.
+
+    In functional models, a row-parallel layer only consumes the outputs of
+    the layer feeding it, possibly through elementwise layers like
+    `Dropout`, when they aren't used anywhere else. In other models, the
+    layers are assumed to be applied in order.
+
+    The projections of `MultiHeadAttention` and `GroupedQueryAttention`
+    layers are sharded on their heads axis, so that the attention of every
+    head is computed on a single device.
+
+    Every choice minimizes the memory used by the kernel on each device plus
+    `communication_weight` times the bytes communicated per device per
+    token. Other variables, and variables smaller than `min_shard_size`
+    elements, are replicated.
+
+    Args:
+        model: A built model, whose variable paths are the same as the ones
+            of the model to distribute.
+        device_mesh: The `keras.distribution.DeviceMesh` to plan for.
+        model_dim_name: The axis of `device_mesh` to shard variables on.
+            Defaults to the last axis.
+        min_shard_size: The minimum number of elements of a variable to
+            consider sharding it.
+        communication_weight: The number of bytes of memory per device that
+            saving one byte of communication per token is worth.
+
+    Returns:
+        A `keras.distribution.ShardingPlan`, with the `LayoutMap` and a
+        report explaining every layout.
+
+    Example:
+
+    ```python
+    device_mesh = keras.distribution.DeviceMesh(
+        (2, 4), ("batch", "model"), keras.distribution.list_devices()
+    )
+    model = get_model()
+    plan = keras.distribution.plan_sharding(model, device_mesh)
+    print(plan.report())
+
+    # Create the model again in the distribution scope, with the same
+    # variable paths.
+    keras.backend.clear_session()
+    distribution = keras.distribution.ModelParallel(
+        layout_map=plan.layout_map, batch_dim_name="batch"
+    )
+    with distribution.scope():
+        model = get_model()
+    ```
+    """
+    if not model.built:
+        raise ValueError(
+            "The model must be built before planning its sharding. "
+            f"Model '{model.name}' is not built yet."
+        )
+    if model_dim_name is None:
+        model_dim_name = device_mesh.axis_names[-1]
+    if model_dim_name not in device_mesh.axis_names:
+        raise ValueError(
+            f"`model_dim_name` '{model_dim_name}' is not an axis of the "
+            f"device mesh. Expected one of {list(device_mesh.axis_names)}."
+        )
+    num_shards = _num_shards(device_mesh, model_dim_name)
+    planner = _Planner(
+        num_shards, model_dim_name, min_shard_size, communication_weight
+    )
+    for layer in model._flatten_layers(include_self=False):
+        planner.plan_layer(layer)
+    for variable in model.variables:
+        planner.replicate(variable, "No sharding rule for this variable.")
+
+    order = {variable.path: i for i, variable in enumerate(model.variables)}
+    planner.variables.sort(key=lambda v: order[v.path])
+    layout_map = LayoutMap(device_mesh)
+    for v in planner.variables:
+        layout_map[v.path] = v.axes
+    return ShardingPlan(layout_map, planner.variables, model_dim_name)
+
+
+class _Planner:
+    def __init__(
+        self, num_shards, model_dim_name, min_shard_size, communication_weight
+    ):
+        self.num_shards = num_shards
+        self.model_dim_name = model_dim_name
+        self.min_shard_size = min_shard_size
+        self.communication_weight = communication_weight
+        self.variables = []
+        self.planned_paths = set()
+        self.planned_layers = set()
+        # The column-parallel kernels whose sharded outputs haven't been
+        # consumed by a row-parallel layer yet, as tuples of (index in
+        # `self.variables`, output size, all-gather cost, layer).
+        self.pending_outputs = []
+
+    def add(self, variable, axes, communication, reason):
+        if variable.path in self.planned_paths:
+            return
+        self.planned_paths.add(variable.path)
+        shards = self.num_shards if self.model_dim_name in axes else 1
+        self.variables.append(
+            VariableSharding(
+                variable.path,
+                tuple(variable.shape),
+                tuple(axes),
+                _num_bytes(variable.shape, shards, variable.dtype),
+                communication,
+                reason,
+            )
+        )
+
+    def replicate(self, variable, reason):
+        self.add(variable, (None,) * len(variable.shape), 0, reason)
+
+    def plan_layer(self, layer):
+        from keras.src.layers.attention.grouped_query_attention import (
+            GroupedQueryAttention,
+        )
+        from keras.src.layers.attention.multi_head_attention import (
+            MultiHeadAttention,
+        )
+        from keras.src.layers.core.dense import Dense
+        from keras.src.layers.core.einsum_dense import EinsumDense
+        from keras.src.layers.core.embedding import Embedding
+
+        if id(layer) in self.planned_layers:
+            return
+        if not layer.weights:
+            # Layers like `Add`, `Concatenate` or `Reshape` combine or move
+            # the features, so the sharded outputs of earlier layers are
+            # all-gathered before them.
+            if not _is_elementwise(layer):
+                self.discard_pending_outputs(layer)
+            return
+        self.planned_layers.add(id(layer))
+        if isinstance(layer, (MultiHeadAttention, GroupedQueryAttention)):
+            self.plan_attention(layer)
+            return
+        if len(list(layer._flatten_layers())) != 1:
+            return
+        if not isinstance(layer, (Dense, EinsumDense, Embedding)):
+            # Layers like `LayerNormalization` need all the features, so the
+            # sharded outputs of earlier layers are all-gathered before them.
+            self.discard_pending_outputs(layer)
+            return
+        if layer.quantization_mode is not None:
+            for variable in layer.weights:
+                self.replicate(variable, "Quantized layers aren't sharded.")
+            return
+        if isinstance(layer, Dense):
+            self.plan_kernel(layer, layer._kernel, [0], [1], bias_axis=0)
+        elif isinstance(layer, EinsumDense):
+            contracted, outputs = _einsum_kernel_axes(layer.equation)
+            self.plan_kernel(layer, layer._kernel, contracted, outputs)
+        else:
+            # A lookup contracts the vocabulary axis like a one-hot matmul.
+            # Embeddings are usually followed by a normalization or a residual
+            # connection, so sharded outputs are always all-gathered.
+            self.plan_kernel(
+                layer, layer._embeddings, [0], [1], consumable=False
+            )
+
+    def plan_attention(self, layer):
+        """Shards the heads of the projections of an attention layer.
+
+        The query, key and value projections are column-parallel and the
+        output projection row-parallel on the heads axis, so that every
+        device computes the attention of a subset of the heads without
+        communicating.
+        """
+        projections = [
+            layer._query_dense,
+            layer._key_dense,
+            layer._value_dense,
+        ]
+        self.planned_layers.update(
+            id(sublayer) for sublayer in layer._flatten_layers()
+        )
+        if any(
+            sublayer.quantization_mode is not None
+            for sublayer in projections + [layer._output_dense]
+        ):
+            for variable in layer.weights:
+                self.replicate(variable, "Quantized layers aren't sharded.")
+            return
+        self.pending_outputs = []
+        for projection in projections:
+            contracted, outputs = _einsum_kernel_axes(projection.equation)
+            # The heads axis is the first output axis.
+            self.plan_kernel(
+                projection,
+                projection._kernel,
+                contracted,
+                outputs,
+                column_axes=outputs[:1],
+                row_axes=[],
+            )
+        output_dense = layer._output_dense
+        contracted, outputs = _einsum_kernel_axes(output_dense.equation)
+        self.plan_kernel(
+            output_dense,
+            output_dense._kernel,
+            contracted,
+            outputs,
+            column_axes=[],
+            row_axes=contracted[:1],
+            consumes=list(self.pending_outputs),
+        )
+        self.pending_outputs = []
+
+    def plan_kernel(
+        self,
+        layer,
+        kernel,
+        contracted,
+        outputs,
+        bias_axis=None,
+        consumable=True,
+        column_axes=None,
+        row_axes=None,
+        consumes=None,
+    ):
+        shape = tuple(kernel.shape)
+        itemsize = _itemsize(layer.compute_dtype)
+        if int(np.prod(shape)) < self.min_shard_size:
+            self.replicate(
+                kernel,
+                f"Smaller than min_shard_size={self.min_shard_size}.",
+            )
+            return
+        if self.num_shards == 1:
+            self.replicate(kernel, "The model axis has a single device.")
+            return
+
+        in_size = int(np.prod([shape[i] for i in contracted]))
+        out_size = int(np.prod([shape[i] for i in outputs]))
+        ring = (self.num_shards - 1) / self.num_shards
+        full_memory = _num_bytes(shape, 1, kernel.dtype)
+        shard_memory = _num_bytes(shape, self.num_shards, kernel.dtype)
+        all_gather = ring * out_size * itemsize
+        all_reduce = 2 * ring * out_size * itemsize
+        if consumes is None:
+            consumes = self.consumable_outputs(layer, in_size)
+        saved_all_gathers = sum(p[2] for p in consumes)
+
+        # Tuples of (score, name, sharded axis, communication, reason).
+        candidates = [(full_memory, "replicated", None, 0, "Replicated.")]
+        column_axis = self.divisible_axis(
+            shape, outputs if column_axes is None else column_axes
+        )
+        if column_axis is not None:
+            candidates.append(
+                (
+                    shard_memory + self.communication_weight * all_gather,
+                    "column",
+                    column_axis,
+                    all_gather,
+                    f"Column-parallel: output axis {column_axis} sharded, "
+                    "outputs all-gathered.",
+                )
+            )
+        row_axis = self.divisible_axis(
+            shape, contracted if row_axes is None else row_axes
+        )
+        if row_axis is not None:
+            communication = all_reduce - saved_all_gathers
+            candidates.append(
+                (
+                    shard_memory + self.communication_weight * communication,
+                    "row",
+                    row_axis,
+                    all_reduce,
+                    f"Row-parallel: contracted axis {row_axis} sharded, "
+                    "outputs all-reduced.",
+                )
+            )
+        _, name, axis, communication, reason = min(
+            candidates, key=lambda candidate: candidate[0]
+        )
+
+        if name == "replicated":
+            if column_axis is None and row_axis is None:
+                reason = (
+                    f"No axis is divisible by the {self.num_shards} devices "
+                    f"of axis '{self.model_dim_name}'."
+                )
+            else:
+                reason = (
+                    "Replicated: sharding doesn't save enough memory for "
+                    "its communication."
+                )
+            self.replicate(kernel, reason)
+            return
+        axes = [None] * len(shape)
+        axes[axis] = self.model_dim_name
+        self.add(kernel, axes, communication, reason)
+        if name == "column":
+            if consumable:
+                self.pending_outputs.append(
+                    (len(self.variables) - 1, out_size, all_gather, layer)
+                )
+            if bias_axis is not None and layer.bias is not None:
+                self.add(
+                    layer.bias,
+                    (self.model_dim_name,),
+                    0,
+                    "Sharded like the outputs of the column-parallel kernel.",
+                )
+            return
+        # The sharded outputs consumed by this row-parallel layer don't need
+        # to be all-gathered.
+        for index, _, _, _ in consumes:
+            entry = self.variables[index]
+            column_axis = entry.axes.index(self.model_dim_name)
+            self.variables[index] = entry._replace(
+                communication=0,
+                reason=(
+                    f"Column-parallel: output axis {column_axis} sharded, "
+                    f"outputs consumed by row-parallel '{kernel.path}'."
+                ),
+            )
+        if consumes:
+            self.variables[-1] = self.variables[-1]._replace(
+                reason=f"{reason} Inputs are sharded outputs of "
+                "column-parallel layers."
+            )
+        self.pending_outputs = [
+            p for p in self.pending_outputs if p not in consumes
+        ]
+
+    def discard_pending_outputs(self, layer):
+        """Discards the pending outputs when `layer` needs all the features.
+
+        In a functional model, the layers are paired through the graph
+        instead, in `consumable_outputs()`.
+        """
+        if not layer._inbound_nodes:
+            self.pending_outputs = []
+
+    def consumable_outputs(self, layer, in_size):
+        """Returns the pending sharded outputs that are the inputs of `layer`.
+
+        In a functional model, these are the outputs of the layer that feeds
+        `layer`, possibly through elementwise layers like `Dropout`, if they
+        are used nowhere else. Otherwise, the layers are assumed to be
+        sequential, and any pending outputs with the right size are used.
+        """
+        if not layer._inbound_nodes:
+            return [p for p in self.pending_outputs if p[1] == in_size]
+        producer = _producer(layer)
+        return [
+            p
+            for p in self.pending_outputs
+            if p[3] is producer and p[1] == in_size
+        ]
+
+    def divisible_axis(self, shape, candidate_axes):
+        for axis in candidate_axes:
+            if shape[axis] % self.num_shards == 0:
+                return axis
+        return None
+
+
+def _producer(layer):
+    """Returns the operation whose outputs are the only inputs of `layer`.
+
+    Elementwise layers in between are skipped. Returns `None` if `layer` is
+    called more than once, has several inputs, or if the outputs of the
+    operation are also used by other operations, e.g. a residual connection.
+    """
+    while True:
+        if len(layer._inbound_nodes) != 1:
+            return None
+        node = layer._inbound_nodes[0]
+        if len(node.input_tensors) != 1 or len(node.parent_nodes) != 1:
+            return None
+        producer = node.parent_nodes[0].operation
+        if len(producer._outbound_nodes) != 1:
+            return None
+        if not _is_elementwise(producer):
+            return producer
+        layer = producer
+
+
+def _is_elementwise(operation):
+    """Whether `operation` keeps every feature of its input in place."""
+    from keras.src.layers.activations.activation import Activation
+    from keras.src.layers.activations.elu import ELU
+    from keras.src.layers.activations.leaky_relu import LeakyReLU
+    from keras.src.layers.activations.relu import ReLU
+    from keras.src.layers.regularization.dropout import Dropout
+
+    if isinstance(operation, Activation):
+        # Softmax normalizes over all the features.
+        return getattr(operation.activation, "__name__", None) not in (
+            "softmax",
+            "log_softmax",
+        )
+    return isinstance(operation, (Dropout, ELU, LeakyReLU, ReLU))
+
+
+def _einsum_kernel_axes(equation):
+    """Returns the contracted and output axes of an `EinsumDense` kernel."""
+    inputs, outputs_spec = equation.split("->")
+    inputs_spec, kernel_spec = inputs.split(",")
+    contracted = [
+        i
+        for i, char in enumerate(kernel_spec)
+        if char in inputs_spec and char not in outputs_spec
+    ]
+    outputs = [
+        i
+        for i, char in enumerate(kernel_spec)
+        if char in outputs_spec and char not in inputs_spec
+    ]
+    return contracted, outputs
+
+
+def _num_shards(device_mesh, axis_name):
+    return device_mesh.shape[list(device_mesh.axis_names).index(axis_name)]
+
+
+def _itemsize(dtype):
+    return np.dtype(backend.standardize_dtype(dtype)).itemsize
+
+
+def _num_bytes(shape, num_shards, dtype="float32"):
+    return int(np.prod(shape)) * _itemsize(dtype) // num_shards
+
+
+def _format_bytes(num_bytes):
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
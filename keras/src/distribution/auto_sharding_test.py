@@ -0,0 +1,189 @@
+"""Test for auto_sharding.py."""
+
+import os
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.backend.common import global_state
+from keras.src.distribution import distribution_lib
+from keras.src.distribution.auto_sharding import plan_sharding
+
+if backend.backend() == "jax":
+    # The XLA flag must be set before the JAX backend is initialized.
+    xla_flags = os.getenv("XLA_FLAGS") or ""
+    if "xla_force_host_platform_device_count" not in xla_flags:
+        os.environ["XLA_FLAGS"] = (
+            f"{xla_flags} --xla_force_host_platform_device_count=8"
+        )
+
+
+def get_model():
+    inputs = layers.Input((4,), dtype="int32")
+    x = layers.Embedding(1000, 64, name="embedding")(inputs)
+    y = layers.MultiHeadAttention(8, 8, name="attention")(x, x)
+    x = layers.LayerNormalization(name="norm")(x + y)
+    y = layers.Dense(256, activation="relu", name="up")(x)
+    outputs = x + layers.Dense(64, name="down")(y)
+    return models.Model(inputs, outputs)
+
+
+class AutoShardingTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.device_mesh = distribution_lib.DeviceMesh(
+            (2, 4), ["batch", "model"], [f"cpu:{i}" for i in range(8)]
+        )
+
+    def test_transformer_block(self):
+        model = get_model()
+        plan = plan_sharding(model, self.device_mesh, min_shard_size=1024)
+        layout_map = plan.layout_map
+        self.assertLen(layout_map, len(model.variables))
+        for variable in model.variables:
+            self.assertIsNotNone(layout_map[variable.path])
+        layouts = {v.path: v.axes for v in plan.variables}
+        self.assertEqual(layouts["embedding/embeddings"], (None, "model"))
+        for name in ("query", "key", "value"):
+            self.assertEqual(
+                layouts[f"attention/{name}/kernel"], (None, "model", None)
+            )
+        self.assertEqual(
+            layouts["attention/attention_output/kernel"],
+            ("model", None, None),
+        )
+        self.assertEqual(layouts["up/kernel"], (None, "model"))
+        self.assertEqual(layouts["up/bias"], ("model",))
+        self.assertEqual(layouts["down/kernel"], ("model", None))
+        self.assertEqual(layouts["down/bias"], (None,))
+        self.assertEqual(layouts["norm/gamma"], (None,))
+
+        reasons = {v.path: v.reason for v in plan.variables}
+        self.assertIn(
+            "Inputs are sharded", reasons["attention/attention_output/kernel"]
+        )
+        self.assertIn(
+            "consumed by row-parallel 'down/kernel'", reasons["up/kernel"]
+        )
+        # Only the all-reduces of the row-parallel layers and the all-gather
+        # of the embeddings remain.
+        ring = 3 / 4
+        self.assertAllClose(plan.communication, ring * 64 * 4 * (1 + 2 + 2))
+        self.assertEqual(plan.replicated_memory, model.count_params() * 4)
+        self.assertLess(plan.memory_per_device, plan.replicated_memory / 3)
+
+        report = plan.report()
+        self.assertIn("'model' (4 devices)", report)
+        self.assertIn("attention/query/kernel", report)
+        self.assertIn("Variable memory per device", report)
+
+    def test_pairing_follows_the_graph(self):
+        inputs = layers.Input((64,))
+        x = layers.Dense(256, name="up")(inputs)
+        y = layers.Dense(256, activation="relu", name="branch_up")(inputs)
+        y = layers.Dropout(0.5)(y)
+        y = layers.Dense(64, name="branch_down")(y)
+        x = layers.Add()([x, layers.Dense(256, name="gate")(inputs)])
+        x = layers.Dense(64, name="down")(x)
+        model = models.Model(inputs, [x, y])
+        plan = plan_sharding(model, self.device_mesh, min_shard_size=1024)
+        variables = {v.path: v for v in plan.variables}
+
+        # The parallel branch consumes its own sharded outputs only, through
+        # the elementwise `Dropout`.
+        self.assertEqual(variables["branch_down/kernel"].axes, ("model", None))
+        self.assertEqual(variables["branch_up/kernel"].communication, 0)
+        self.assertIn(
+            "consumed by row-parallel 'branch_down/kernel'",
+            variables["branch_up/kernel"].reason,
+        )
+        # The outputs combined by the residual `Add` are all-gathered.
+        for name in ("up", "gate"):
+            self.assertEqual(variables[f"{name}/kernel"].axes, (None, "model"))
+            self.assertGreater(variables[f"{name}/kernel"].communication, 0)
+            self.assertIn(
+                "outputs all-gathered", variables[f"{name}/kernel"].reason
+            )
+        self.assertEqual(variables["down/kernel"].axes, (None, "model"))
+
+    def test_weightless_layers_gather_outputs(self):
+        class FlattenModel(models.Model):
+            def __init__(self):
+                super().__init__()
+                self.up = layers.Dense(256, name="up")
+                self.flatten = layers.Flatten()
+                self.down = layers.Dense(64, name="down")
+
+            def call(self, x):
+                return self.down(self.flatten(self.up(x)))
+
+        # Without a functional graph, the layers are paired in order.
+        model = FlattenModel()
+        model(np.ones((1, 64)))
+        plan = plan_sharding(model, self.device_mesh, min_shard_size=1024)
+        variables = {v.path: v for v in plan.variables}
+        self.assertGreater(variables[model.up.kernel.path].communication, 0)
+        self.assertEqual(
+            variables[model.down.kernel.path].axes, (None, "model")
+        )
+
+    def test_replicated_variables(self):
+        model = models.Sequential(
+            [layers.Input((60,)), layers.Dense(10), layers.Dense(20)]
+        )
+        device_mesh = distribution_lib.DeviceMesh(
+            (3,), ["model"], [f"cpu:{i}" for i in range(3)]
+        )
+        plan = plan_sharding(model, device_mesh, min_shard_size=500)
+        reasons = {v.path: v.reason for v in plan.variables}
+        layouts = {v.path: v.axes for v in plan.variables}
+        self.assertEqual(layouts["sequential/dense/kernel"], ("model", None))
+        self.assertIn("Smaller than", reasons["sequential/dense_1/kernel"])
+
+        plan = plan_sharding(model, device_mesh, min_shard_size=1)
+        reasons = {v.path: v.reason for v in plan.variables}
+        self.assertIn(
+            "No axis is divisible", reasons["sequential/dense_1/kernel"]
+        )
+
+        plan = plan_sharding(model, device_mesh, communication_weight=1e6)
+        self.assertEqual(plan.memory_per_device, plan.replicated_memory)
+        self.assertEqual(plan.communication, 0)
+
+    def test_errors(self):
+        model = models.Sequential([layers.Dense(10)])
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            plan_sharding(model, self.device_mesh)
+        model.build((None, 4))
+        with self.assertRaisesRegex(ValueError, "not an axis"):
+            plan_sharding(model, self.device_mesh, model_dim_name="typo")
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax" or len(distribution_lib.list_devices()) != 8,
+        reason="Requires the JAX backend and 8 devices",
+    )
+    def test_model_parallel(self):
+        model = get_model()
+        x = np.random.randint(0, 1000, (8, 4))
+        expected = model.predict(x, verbose=0)
+        weights = model.get_weights()
+
+        devices = distribution_lib.list_devices()
+        device_mesh = distribution_lib.DeviceMesh(
+            (2, 4), ["batch", "model"], devices
+        )
+        plan = plan_sharding(model, device_mesh, min_shard_size=1024)
+        global_state.clear_session()
+        distribution = distribution_lib.ModelParallel(
+            layout_map=plan.layout_map
+        )
+        with distribution.scope():
+            model = get_model()
+            model.set_weights(weights)
+            self.assertAllClose(model.predict(x, verbose=0), expected)
+        kernel = model.get_layer("up")._kernel
+        self.assertEqual(tuple(kernel.value.sharding.spec), (None, "model"))
@@ -349,6 +349,36 @@ class Distribution:
         """
         raise NotImplementedError()
 
+    def get_optimizer_variable_layout(self, reference_variable):
+        """Retrieve the `TensorLayout` for an optimizer variable.
+
+        Optimizer variables such as momentums are created from the model
+        variable they track, see `Optimizer.add_variable_from_reference()`.
+
+        Args:
+            reference_variable: The model `Variable` tracked by the optimizer
+                variable.
+
+        return:
+            The `TensorLayout` for the optimizer variable, or `None` to use
+            the layout of `reference_variable`.
+        """
+        return None
+
+    def get_gradient_layout(self, variable):
+        """Retrieve the `TensorLayout` for the gradient of a variable.
+
+        The layout is applied to the gradient before the optimizer update.
+
+        Args:
+            variable: The model `Variable` the gradient is computed for.
+
+        return:
+            The `TensorLayout` for the gradient, or `None` to leave the layout
+            of the gradient unchanged.
+        """
+        return None
+
     def get_tensor_layout(self, path):
         """Retrieve the `TensorLayout` for the intermediate tensor.
 
@@ -431,15 +461,43 @@ class DataParallel(Distribution):
     will be used to detect any available devices and create a 1D mesh from
     them.
 
+    By default, every device holds a full copy of the optimizer variables,
+    e.g. the momentums and velocities of `Adam`, which take twice the memory
+    of the model variables. With `shard_optimizer_state=True`, each optimizer
+    variable is instead sharded across the data parallel dimension, on its
+    first axis divisible by the number of devices, in the manner of ZeRO
+    (stage 1). Each device only updates its shard of the model variables,
+    which are then all-gathered. With `shard_gradients=True`, the gradients
+    are sharded the same way before the optimizer update (ZeRO stage 2), so
+    that their all-reduce becomes a reduce-scatter.
+
     Args:
         device_mesh: Optional `DeviceMesh` instance.
         devices: Optional list of devices.
         auto_shard_dataset: Automatically shard the dataset amongst
             processes in a multi-process setting. Set to `False` if the dataset
             is already sharded across hosts.  Defaults to `True`.
+        shard_optimizer_state: Whether to shard the optimizer variables across
+            the data parallel dimension. Defaults to `False`.
+        shard_gradients: Whether to shard the gradients across the data
+            parallel dimension. Requires `shard_optimizer_state=True`.
+            Defaults to `False`.
     """
 
-    def __init__(self, device_mesh=None, devices=None, auto_shard_dataset=True):
+    def __init__(
+        self,
+        device_mesh=None,
+        devices=None,
+        auto_shard_dataset=True,
+        shard_optimizer_state=False,
+        shard_gradients=False,
+    ):
+        if shard_gradients and not shard_optimizer_state:
+            raise ValueError(
+                "`shard_gradients=True` requires `shard_optimizer_state=True`."
+            )
+        self._shard_optimizer_state = shard_optimizer_state
+        self._shard_gradients = shard_gradients
         if device_mesh:
             self._initialize_with_device_mesh(device_mesh, auto_shard_dataset)
         elif devices:
@@ -504,10 +562,40 @@ class DataParallel(Distribution):
         variable_shard_spec = [None] * len(variable.shape)
         return TensorLayout(variable_shard_spec, self.device_mesh)
 
+    def get_optimizer_variable_layout(self, reference_variable):
+        if not self._shard_optimizer_state:
+            return None
+        return self._get_sharded_layout(reference_variable.shape)
+
+    def get_gradient_layout(self, variable):
+        if not self._shard_gradients:
+            return None
+        return self._get_sharded_layout(variable.shape)
+
     def get_tensor_layout(self, path):
         # For data parallel training, the intermediate state is not changed.
         return None
 
+    @property
+    def shard_optimizer_state(self):
+        return self._shard_optimizer_state
+
+    @property
+    def shard_gradients(self):
+        return self._shard_gradients
+
+    def _get_sharded_layout(self, shape):
+        # Shard the first axis divisible by the number of replicas. Tensors
+        # without such an axis, e.g. scalars, stay replicated.
+        axis_index = self.device_mesh.axis_names.index(self.batch_dim_name)
+        num_replicas = self.device_mesh.shape[axis_index]
+        shard_spec = [None] * len(shape)
+        for i, dim in enumerate(shape):
+            if num_replicas > 1 and dim is not None and dim % num_replicas == 0:
+                shard_spec[i] = self.batch_dim_name
+                break
+        return TensorLayout(shard_spec, self.device_mesh)
+
     def distribute_dataset(self, dataset):
         if not self._is_multi_process or not self.auto_shard_dataset:
             return dataset
@@ -756,6 +844,219 @@ class ModelParallel(Distribution):
             return distributed_dataset.prefetch(tf.data.AUTOTUNE)
 
 
+@keras_export("keras.distribution.PipelineParallel")
+class PipelineParallel(Distribution):
+    """Distribution that places consecutive stages of a model on devices.
+
+    `PipelineParallel` partitions a `Functional` or `Sequential` model into
+    stages of consecutive layers, and places the variables of each stage on
+    its own devices. Every training step splits the batch into
+    micro-batches, which flow through the stages so that different stages
+    process different micro-batches at the same time. The gradients of the
+    micro-batches are accumulated, and each stage then updates its own
+    variables.
+
+    This is the configuration of choice for deep models whose variables
+    don't fit on one device, but whose layers are small enough not to need
+    `ModelParallel` sharding.
+
+    The first axis of the `device_mesh` indexes the stages. If the mesh has a
+    second axis, the devices along it hold replicas of the stage, among which
+    the micro-batches are split as with `DataParallel`.
+
+    Two schedules of the micro-batches are supported:
+
+    - `"gpipe"`: all the forward passes of the micro-batches, then all their
+        backward passes, as in GPipe.
+    - `"1f1b"`: each stage alternates between the forward pass of a
+        micro-batch and the backward pass of an earlier one, as soon as the
+        pipeline is full. This keeps at most `num_stages` micro-batches in
+        flight, and less activation memory than `"gpipe"`.
+
+    With both schedules, the forward pass of each stage is recomputed during
+    its backward pass, so that a stage only keeps the inputs of the
+    micro-batches in flight.
+
+    Example:
+
+    ```python
+    devices = keras.distribution.list_devices()
+    distribution = keras.distribution.PipelineParallel(
+        devices=devices[:4], num_microbatches=8, schedule="1f1b"
+    )
+    with distribution.scope():
+        model = keras.Sequential([...])
+        model.compile(optimizer="adam", loss="mse")
+        model.fit(x, y, batch_size=64)
+    ```
+
+    Pipeline parallelism is only supported with the JAX backend, and with
+    `fit()`, `evaluate()` and `predict()`. The model is partitioned when one
+    of them is first called. Since the variables of the model are then spread
+    across devices, the model must not be called directly anymore.
+
+    Args:
+        device_mesh: Optional `DeviceMesh` instance, whose first axis indexes
+            the stages.
+        devices: Optional list of devices, one per stage.
+        num_microbatches: Number of micro-batches each batch is split into.
+            Defaults to `4`.
+        schedule: The schedule of the micro-batches, `"gpipe"` or `"1f1b"`.
+            Defaults to `"gpipe"`.
+        stage_boundaries: Optional list of the names of the layers starting
+            each stage after the first, of length `num_stages - 1`. By
+            default, the layers are split into the stages minimizing the
+            largest number of parameters of a stage.
+        auto_shard_dataset: Automatically shard the dataset amongst
+            processes in a multi-process setting. Set to `False` if the dataset
+            is already sharded across hosts.  Defaults to `True`.
+    """
+
+    def __init__(
+        self,
+        device_mesh=None,
+        devices=None,
+        num_microbatches=4,
+        schedule="gpipe",
+        stage_boundaries=None,
+        auto_shard_dataset=True,
+    ):
+        if device_mesh is None:
+            devices = np.array(devices if devices else list_devices())
+            device_mesh = DeviceMesh(
+                shape=(len(devices),), axis_names=["stage"], devices=devices
+            )
+        elif not isinstance(device_mesh, DeviceMesh):
+            raise ValueError(
+                "Expect `device_mesh` to be an instance of `DeviceMesh`. "
+                f"Received: device_mesh={device_mesh} "
+                f"(of type {type(device_mesh)})"
+            )
+        if len(device_mesh.shape) > 2:
+            raise ValueError(
+                "Expect `device_mesh` to have one or two axes. Received: "
+                f"device_mesh.shape={device_mesh.shape}"
+            )
+        if schedule not in ("gpipe", "1f1b"):
+            raise ValueError(
+                "Argument `schedule` must be one of 'gpipe' or '1f1b'. "
+                f"Received: schedule={schedule}"
+            )
+        if not isinstance(num_microbatches, int) or num_microbatches < 1:
+            raise ValueError(
+                "Argument `num_microbatches` must be a positive integer. "
+                f"Received: num_microbatches={num_microbatches}"
+            )
+        num_stages = device_mesh.shape[0]
+        if stage_boundaries is not None and (
+            len(stage_boundaries) != num_stages - 1
+        ):
+            raise ValueError(
+                f"Expected {num_stages - 1} `stage_boundaries` for "
+                f"{num_stages} stages. Received: "
+                f"stage_boundaries={stage_boundaries}"
+            )
+        if len(device_mesh.shape) == 2:
+            batch_dim_name = device_mesh.axis_names[1]
+        else:
+            batch_dim_name = DEFAULT_BATCH_DIM_NAME
+        super().__init__(device_mesh, batch_dim_name, auto_shard_dataset)
+        self._num_microbatches = num_microbatches
+        self._schedule = schedule
+        self._stage_boundaries = stage_boundaries
+        self._stage_meshes = [
+            DeviceMesh(
+                shape=(np.size(stage_devices),),
+                axis_names=[batch_dim_name],
+                devices=np.reshape(stage_devices, (-1,)),
+            )
+            for stage_devices in device_mesh.devices
+        ]
+
+    @property
+    def num_stages(self):
+        return len(self._stage_meshes)
+
+    @property
+    def num_microbatches(self):
+        return self._num_microbatches
+
+    @property
+    def schedule(self):
+        return self._schedule
+
+    @property
+    def stage_boundaries(self):
+        return self._stage_boundaries
+
+    @property
+    def stage_meshes(self):
+        """The 1D `DeviceMesh` of the devices of each stage."""
+        return self._stage_meshes
+
+    def get_data_layout(self, data_shape):
+        # The inputs are fed to the first stage.
+        return self.get_stage_data_layout(0, data_shape)
+
+    def get_stage_data_layout(self, stage, data_shape):
+        """Retrieve the `TensorLayout` of a tensor of a stage.
+
+        Args:
+            stage: Index of the stage.
+            data_shape: shape of the tensor, whose first dimension is the
+                batch dimension.
+
+        Returns:
+            The `TensorLayout` sharding the tensor across the replicas of the
+            stage.
+        """
+        data_shard_spec = [None] * len(data_shape)
+        if data_shard_spec:
+            data_shard_spec[0] = self.batch_dim_name
+        return TensorLayout(data_shard_spec, self._stage_meshes[stage])
+
+    def get_variable_layout(self, variable):
+        # First check if the variable already has a layout assigned.
+        if getattr(variable, "_layout", None) is not None:
+            return variable._layout
+        # The variables are moved to their stage when the model is
+        # partitioned. Until then, they are placed on the first stage.
+        return self.get_stage_variable_layout(0, variable)
+
+    def get_stage_variable_layout(self, stage, variable):
+        """Retrieve the `TensorLayout` of a variable of a stage.
+
+        Args:
+            stage: Index of the stage.
+            variable: A `Variable` instance.
+
+        Returns:
+            The `TensorLayout` replicating the variable across the replicas
+            of the stage.
+        """
+        variable_shard_spec = [None] * len(variable.shape)
+        return TensorLayout(variable_shard_spec, self._stage_meshes[stage])
+
+    def get_tensor_layout(self, path):
+        return None
+
+    def distribute_dataset(self, dataset):
+        if distribution_lib.num_processes() > 1 and self.auto_shard_dataset:
+            raise ValueError(
+                "`PipelineParallel` doesn't support auto-sharding the dataset "
+                "in a multi-process setting. Shard the dataset and set "
+                "`auto_shard_dataset=False`."
+            )
+        return dataset
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} device_mesh={self.device_mesh} "
+            f"num_microbatches={self.num_microbatches} "
+            f"schedule={self.schedule}>"
+        )
+
+
 @keras_export("keras.distribution.LayoutMap")
 class LayoutMap(collections.abc.MutableMapping):
     """A dict-like object that maps string to `TensorLayout` instances.
@@ -792,6 +1093,10 @@ class LayoutMap(collections.abc.MutableMapping):
     layout_8 = layout_map['my_model/conv3d_1/bias']     # layout_8 == None
     ```
 
+    Regex keys are compiled once, and the keys matching each queried path
+    are memoized until the `LayoutMap` is modified, so resolving the layouts
+    of all the variables of a large model stays fast.
+
     Args:
         device_mesh: `keras.distribution.DeviceMesh` instance.
     """
@@ -799,6 +1104,8 @@ class LayoutMap(collections.abc.MutableMapping):
     def __init__(self, device_mesh):
         self._layout_map = collections.OrderedDict()
         self._device_mesh = device_mesh
+        self._pattern_index = None
+        self._matching_keys_cache = {}
 
     def __getitem__(self, key):
         """Retrieves the corresponding layout by the string key.
@@ -817,10 +1124,10 @@ class LayoutMap(collections.abc.MutableMapping):
         if key in self._layout_map:
             return self._layout_map[key]
 
-        matching_keys = []
-        for k in self._layout_map:
-            if re.search(k, key):
-                matching_keys.append(k)
+        matching_keys = self._matching_keys_cache.get(key)
+        if matching_keys is None:
+            matching_keys = self._find_matching_keys(key)
+            self._matching_keys_cache[key] = matching_keys
         if len(matching_keys) > 1:
             raise ValueError(
                 f"Path '{key}' matches multiple layout "
@@ -855,10 +1162,13 @@ class LayoutMap(collections.abc.MutableMapping):
             )
         self._maybe_populate_device_mesh(layout)
         self._layout_map[key] = layout
+        self._invalidate_index()
 
     def __delitem__(self, key):
         # let the dict to handle the key missing error
-        return self._layout_map.pop(key)
+        layout = self._layout_map.pop(key)
+        self._invalidate_index()
+        return layout
 
     def __len__(self):
         return len(self._layout_map)
@@ -874,6 +1184,110 @@ class LayoutMap(collections.abc.MutableMapping):
         if layout.device_mesh is None and self.device_mesh is not None:
             layout.device_mesh = self.device_mesh
 
+    def _invalidate_index(self):
+        self._pattern_index = None
+        self._matching_keys_cache = {}
+
+    def _build_index(self):
+        """Groups the compiled keys by a literal substring they require.
+
+        A key can only match paths containing its required literal, so a
+        cheap substring test skips most of the regex searches. Keys without
+        a required literal are always searched.
+        """
+        index = collections.defaultdict(list)
+        for order, k in enumerate(self._layout_map):
+            index[_required_literal(k)].append((order, k, re.compile(k)))
+        return index
+
+    def _find_matching_keys(self, key):
+        if self._pattern_index is None:
+            self._pattern_index = self._build_index()
+        matches = []
+        for literal, patterns in self._pattern_index.items():
+            if literal not in key:
+                continue
+            for order, k, pattern in patterns:
+                if pattern.search(key):
+                    matches.append((order, k))
+        # Report the matches in insertion order.
+        return [k for _, k in sorted(matches)]
+
+
+def _required_literal(pattern):
+    """Returns a substring of every string matched by the regex `pattern`.
+
+    This is the longest run of literal characters at the top level of the
+    pattern, or `""` if there is none (or the pattern can't be analyzed).
+    The scan is conservative: groups, character classes and escapes other
+    than escaped punctuation end a run.
+    """
+    try:
+        flags = re.compile(pattern).flags
+    except re.error:
+        return ""
+    if flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+    # The top-level atoms of the pattern: a literal character, `None` for
+    # any other atom, or `("quantifier", char)`.
+    atoms = []
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if depth == 0:
+                atoms.append(escaped if not escaped.isalnum() else None)
+            i += 2
+            continue
+        if char == "[":
+            # A `]` right after `[` or `[^` is part of the class.
+            i += 1
+            if pattern[i : i + 1] == "^":
+                i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            if depth == 0:
+                atoms.append(None)
+        elif char == "(":
+            if depth == 0:
+                atoms.append(None)
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0:
+            if char == "|":
+                return ""
+            if char == "{" and "}" in pattern[i:]:
+                atoms.append(("quantifier", char))
+                i = pattern.index("}", i)
+            elif char in "*+?":
+                atoms.append(("quantifier", char))
+            elif char in ".^${":
+                atoms.append(None)
+            else:
+                atoms.append(char)
+        i += 1
+
+    longest = ""
+    current = ""
+    previous = None
+    for atom in atoms:
+        if isinstance(atom, str):
+            current += atom
+        else:
+            if isinstance(atom, tuple) and isinstance(previous, str):
+                # The repeated character is only required with `+`.
+                if atom[1] != "+":
+                    current = current[:-1]
+            longest = max(longest, current, key=len)
+            current = ""
+        previous = atom
+    return max(longest, current, key=len)
+
 
 LayoutMap.get.__doc__ = LayoutMap.__getitem__.__doc__
 
@@ -258,6 +258,37 @@ class DataParallelDistributionTest(testing.TestCase):
         tensor_layout = distribution.get_tensor_layout(path)
         self.assertIsNone(tensor_layout)
 
+    @pytest.mark.skipif(testing.jax_uses_gpu(), reason="CI segfault")
+    def test_get_optimizer_variable_layout(self):
+        distribution = distribution_lib.DataParallel(
+            device_mesh=self.device_mesh
+        )
+        variable = backend.Variable(initializer=np.zeros((4, 16)))
+        self.assertIsNone(distribution.get_optimizer_variable_layout(variable))
+        self.assertIsNone(distribution.get_gradient_layout(variable))
+
+        distribution = distribution_lib.DataParallel(
+            device_mesh=self.device_mesh,
+            shard_optimizer_state=True,
+            shard_gradients=True,
+        )
+        self.assertTrue(distribution.shard_optimizer_state)
+        self.assertTrue(distribution.shard_gradients)
+        # The first axis divisible by the number of replicas is sharded.
+        layout = distribution.get_optimizer_variable_layout(variable)
+        self.assertIs(layout.device_mesh, self.device_mesh)
+        self.assertEqual(layout.axes, (None, "data"))
+        layout = distribution.get_gradient_layout(variable)
+        self.assertEqual(layout.axes, (None, "data"))
+        variable = backend.Variable(initializer=np.zeros((3,)))
+        layout = distribution.get_optimizer_variable_layout(variable)
+        self.assertEqual(layout.axes, (None,))
+
+        with self.assertRaisesRegex(ValueError, "shard_optimizer_state=True"):
+            distribution_lib.DataParallel(
+                device_mesh=self.device_mesh, shard_gradients=True
+            )
+
     def test_distribute_dataset(self):
         # We can only verify the single worker/process case in OSS for now.
         dataset = tf.data.Dataset.range(8)
@@ -362,6 +393,84 @@ class ModelParallelDistributionTest(testing.TestCase):
         self.assertIs(dataset, distributed_dataset)
 
 
+@pytest.mark.skipif(
+    backend.backend() != "jax",
+    reason="Only JAX has the proper backend distribution lib",
+)
+class PipelineParallelDistributionTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.devices = [f"cpu:{i}" for i in range(8)]
+
+    def test_create_with_devices(self):
+        distribution = distribution_lib.PipelineParallel(
+            devices=self.devices[:4], num_microbatches=8, schedule="1f1b"
+        )
+        self.assertEqual(distribution.device_mesh.shape, (4,))
+        self.assertEqual(distribution.device_mesh.axis_names, ["stage"])
+        self.assertEqual(distribution.num_stages, 4)
+        self.assertEqual(distribution.num_microbatches, 8)
+        self.assertEqual(distribution.schedule, "1f1b")
+        self.assertEqual(distribution.batch_dim_name, "batch")
+        for stage, mesh in enumerate(distribution.stage_meshes):
+            self.assertEqual(mesh.axis_names, ["batch"])
+            self.assertEqual(list(mesh.devices), [self.devices[stage]])
+
+    def test_create_with_device_mesh(self):
+        device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["stage", "data"], self.devices
+        )
+        distribution = distribution_lib.PipelineParallel(
+            device_mesh=device_mesh
+        )
+        self.assertEqual(distribution.num_stages, 4)
+        self.assertEqual(distribution.batch_dim_name, "data")
+        self.assertEqual(
+            list(distribution.stage_meshes[1].devices), self.devices[2:4]
+        )
+
+    def test_get_layouts(self):
+        device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["stage", "data"], self.devices
+        )
+        distribution = distribution_lib.PipelineParallel(
+            device_mesh=device_mesh
+        )
+        data_layout = distribution.get_data_layout((16, 8))
+        self.assertIs(data_layout.device_mesh, distribution.stage_meshes[0])
+        self.assertEqual(data_layout.axes, ("data", None))
+        data_layout = distribution.get_stage_data_layout(2, (16, 8))
+        self.assertIs(data_layout.device_mesh, distribution.stage_meshes[2])
+
+        variable = backend.Variable(initializer=np.ones((4, 2)))
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertIs(variable_layout.device_mesh, distribution.stage_meshes[0])
+        self.assertEqual(variable_layout.axes, (None, None))
+        variable_layout = distribution.get_stage_variable_layout(3, variable)
+        self.assertIs(variable_layout.device_mesh, distribution.stage_meshes[3])
+        self.assertIsNone(distribution.get_tensor_layout("/model/tensor"))
+
+    def test_validation(self):
+        with self.assertRaisesRegex(ValueError, "one or two axes"):
+            distribution_lib.PipelineParallel(
+                device_mesh=distribution_lib.DeviceMesh(
+                    (2, 2, 2), ["a", "b", "c"], self.devices
+                )
+            )
+        with self.assertRaisesRegex(ValueError, "`schedule` must be"):
+            distribution_lib.PipelineParallel(
+                devices=self.devices, schedule="interleaved"
+            )
+        with self.assertRaisesRegex(ValueError, "`num_microbatches`"):
+            distribution_lib.PipelineParallel(
+                devices=self.devices, num_microbatches=0
+            )
+        with self.assertRaisesRegex(ValueError, "`stage_boundaries`"):
+            distribution_lib.PipelineParallel(
+                devices=self.devices[:2], stage_boundaries=["a", "b"]
+            )
+
+
 class LayoutMapTest(testing.TestCase):
     def setUp(self):
         super().setUp()
@@ -431,6 +540,60 @@ class LayoutMapTest(testing.TestCase):
         self.assertIsNone(layout_map["conv2d/kernel"])
         self.assertEqual(layout_map["conv2d/bias"], self.sharded_1d)
 
+    def test_get_after_modification(self):
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        layout_map["dense.*kernel"] = self.sharded_2d
+        layout_map["(query|key)/kernel"] = self.replicated_2d
+        self.assertEqual(layout_map["dense_1/kernel"], self.sharded_2d)
+        self.assertEqual(layout_map["mha/query/kernel"], self.replicated_2d)
+        self.assertIsNone(layout_map["dense_1/bias"])
+
+        # The memoized resolutions are updated when the map is modified.
+        layout_map[".*bias"] = self.sharded_1d
+        self.assertEqual(layout_map["dense_1/bias"], self.sharded_1d)
+        layout_map["mha/.*kernel"] = self.sharded_2d
+        for _ in range(2):
+            with self.assertRaisesRegex(
+                ValueError,
+                r"matches multiple layout specification keys: "
+                r"\['\(query\|key\)/kernel', 'mha/\.\*kernel'\]",
+            ):
+                layout_map["mha/query/kernel"]
+        del layout_map["(query|key)/kernel"]
+        self.assertEqual(layout_map["mha/query/kernel"], self.sharded_2d)
+        del layout_map[".*bias"]
+        self.assertIsNone(layout_map["dense_1/bias"])
+
+    def test_required_literal(self):
+        self.assertEqual(
+            distribution_lib._required_literal("dense.*kernel"), "kernel"
+        )
+        self.assertEqual(
+            distribution_lib._required_literal(r"encoder/layer_\d+/ffw"),
+            "encoder/layer_",
+        )
+        # Optional or alternative characters aren't required.
+        self.assertEqual(distribution_lib._required_literal("ab?c"), "a")
+        self.assertEqual(distribution_lib._required_literal("a|bc"), "")
+        self.assertEqual(distribution_lib._required_literal("(?i)dense"), "")
+        self.assertEqual(distribution_lib._required_literal("[invalid"), "")
+        self.assertEqual(distribution_lib._required_literal("(?x)dense"), "")
+        # Repeated characters are required with `+` only.
+        self.assertEqual(distribution_lib._required_literal("ab+c"), "ab")
+        self.assertEqual(distribution_lib._required_literal("abc{2}d"), "ab")
+        # Escaped punctuation is literal, groups and classes aren't.
+        self.assertEqual(
+            distribution_lib._required_literal(r"dense\.kernel"),
+            "dense.kernel",
+        )
+        self.assertEqual(
+            distribution_lib._required_literal("(query|key)/kernel"),
+            "/kernel",
+        )
+        self.assertEqual(
+            distribution_lib._required_literal("[]a]bc[^]d]e"), "bc"
+        )
+
     def test_delete(self):
         layout_map = distribution_lib.LayoutMap(self.device_mesh)
 
@@ -24,6 +24,7 @@ from keras.src.layers.convolutional.separable_conv2d import SeparableConv2D
 from keras.src.layers.core.dense import Dense
 from keras.src.layers.core.einsum_dense import EinsumDense
 from keras.src.layers.core.embedding import Embedding
+from keras.src.layers.core.hashed_embedding import HashedEmbedding
 from keras.src.layers.core.identity import Identity
 from keras.src.layers.core.input_layer import Input
 from keras.src.layers.core.input_layer import InputLayer
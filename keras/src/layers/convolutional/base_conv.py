@@ -2,13 +2,20 @@
 
 from keras.src import activations
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import ops
+from keras.src import quantizers
 from keras.src import regularizers
 from keras.src.backend import standardize_data_format
 from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 from keras.src.ops.operation_utils import compute_conv_output_shape
+from keras.src.quantizers.quantization_config import Int8QuantizationConfig
+from keras.src.quantizers.quantization_config import QuantizationConfig
+from keras.src.quantizers.utils import WeightCache
+from keras.src.quantizers.utils import can_use_weight_cache
+from keras.src.saving import serialization_lib
 from keras.src.utils.argument_validation import standardize_padding
 from keras.src.utils.argument_validation import standardize_tuple
 
@@ -85,6 +92,10 @@ class BaseConv(Layer):
             trainable matrices) during the forward pass. The delta is scaled by
             `lora_alpha / lora_rank`, allowing you to fine-tune the strength of
             the LoRA adjustment independently of `lora_rank`.
+        quantization_config: Optional `QuantizationConfig` used when the layer
+            is quantized with `quantize("int8")`. By default, only the
+            kernel is quantized. The inputs are also quantized if an
+            `activation_quantizer` is passed explicitly to the config.
     """
 
     def __init__(
@@ -108,6 +119,7 @@ class BaseConv(Layer):
         bias_constraint=None,
         lora_rank=None,
         lora_alpha=None,
+        quantization_config=None,
         **kwargs,
     ):
         super().__init__(activity_regularizer=activity_regularizer, **kwargs)
@@ -132,6 +144,8 @@ class BaseConv(Layer):
         self.lora_rank = lora_rank
         self.lora_alpha = lora_alpha if lora_alpha is not None else lora_rank
         self.lora_enabled = False
+        self.quantization_config = quantization_config
+        self._weight_cache = WeightCache()
         self.input_spec = InputSpec(min_ndim=self.rank + 2)
         self.data_format = self.data_format
 
@@ -199,15 +213,22 @@ class BaseConv(Layer):
         # shape, and make sure the output shape has all positive dimensions.
         self.compute_output_shape(input_shape)
 
-        self._kernel = self.add_weight(
-            name="kernel",
-            shape=kernel_shape,
-            initializer=self.kernel_initializer,
-            regularizer=self.kernel_regularizer,
-            constraint=self.kernel_constraint,
-            trainable=True,
-            dtype=self.dtype,
-        )
+        if self.quantization_mode:
+            self.quantized_build(
+                kernel_shape,
+                mode=self.quantization_mode,
+                config=self.quantization_config,
+            )
+        else:
+            self._kernel = self.add_weight(
+                name="kernel",
+                shape=kernel_shape,
+                initializer=self.kernel_initializer,
+                regularizer=self.kernel_regularizer,
+                constraint=self.kernel_constraint,
+                trainable=True,
+                dtype=self.dtype,
+            )
         if self.use_bias:
             self.bias = self.add_weight(
                 name="bias",
@@ -230,11 +251,21 @@ class BaseConv(Layer):
             raise AttributeError(
                 "You must build the layer before accessing `kernel`."
             )
+        kernel = self._kernel
+        if self.quantization_mode == "int8":
+            # The convolution itself runs on the dequantized kernel, since
+            # backends don't provide integer convolutions.
+            kernel = dequantize_conv_kernel(
+                kernel,
+                self.kernel_scale,
+                self.compute_dtype,
+                cache=self._weight_cache,
+            )
         if self.lora_enabled:
-            return self._kernel + (
-                self.lora_alpha / self.lora_rank
-            ) * ops.matmul(self.lora_kernel_a, self.lora_kernel_b)
-        return self._kernel
+            return kernel + (self.lora_alpha / self.lora_rank) * ops.matmul(
+                self.lora_kernel_a, self.lora_kernel_b
+            )
+        return kernel
 
     def convolution_op(self, inputs, kernel):
         return ops.conv(
@@ -318,11 +349,29 @@ class BaseConv(Layer):
         # Do nothing if the layer isn't yet built
         if not self.built:
             return
-        target_variables = [self.kernel]
-        if self.use_bias:
-            target_variables.append(self.bias)
-        for i, variable in enumerate(target_variables):
-            store[str(i)] = variable
+        mode = self.quantization_mode
+        if mode not in self.variable_serialization_spec:
+            raise self._quantization_mode_error(mode)
+
+        if mode == "int8" and self.lora_enabled:
+            # Re-quantize the kernel with the LoRA delta merged in.
+            kernel_value, kernel_scale = quantize_conv_kernel(
+                self.kernel, self._kernel_reduced_axes, self.quantization_config
+            )
+        else:
+            kernel_value = self.kernel if mode is None else self._kernel
+            kernel_scale = getattr(self, "kernel_scale", None)
+        idx = 0
+        for name in self.variable_serialization_spec[mode]:
+            if name == "kernel":
+                store[str(idx)] = kernel_value
+            elif name == "bias" and self.bias is None:
+                continue
+            elif name == "kernel_scale":
+                store[str(idx)] = kernel_scale
+            else:
+                store[str(idx)] = getattr(self, name)
+            idx += 1
 
     def load_own_variables(self, store):
         if not self.lora_enabled:
@@ -330,11 +379,19 @@ class BaseConv(Layer):
         # Do nothing if the layer isn't yet built
         if not self.built:
             return
-        target_variables = [self._kernel]
-        if self.use_bias:
-            target_variables.append(self.bias)
-        for i, variable in enumerate(target_variables):
-            variable.assign(store[str(i)])
+        mode = self.quantization_mode
+        if mode not in self.variable_serialization_spec:
+            raise self._quantization_mode_error(mode)
+
+        idx = 0
+        for name in self.variable_serialization_spec[mode]:
+            if name == "kernel":
+                self._kernel.assign(store[str(idx)])
+            elif name == "bias" and self.bias is None:
+                continue
+            else:
+                getattr(self, name).assign(store[str(idx)])
+            idx += 1
         if self.lora_enabled:
             self.lora_kernel_a.assign(ops.zeros(self.lora_kernel_a.shape))
             self.lora_kernel_b.assign(ops.zeros(self.lora_kernel_b.shape))
@@ -371,6 +428,9 @@ class BaseConv(Layer):
                     self.kernel_constraint
                 ),
                 "bias_constraint": constraints.serialize(self.bias_constraint),
+                "quantization_config": serialization_lib.serialize_keras_object(
+                    self.quantization_config
+                ),
             }
         )
         if self.lora_rank:
@@ -378,6 +438,101 @@ class BaseConv(Layer):
             config["lora_alpha"] = self.lora_alpha
         return config
 
+    @classmethod
+    def from_config(cls, config):
+        config = config.copy()
+        config["quantization_config"] = (
+            serialization_lib.deserialize_keras_object(
+                config.get("quantization_config", None)
+            )
+        )
+        return super().from_config(config)
+
+    @property
+    def variable_serialization_spec(self):
+        """Returns a dict mapping quantization modes to variable names in order.
+
+        This spec is used by `save_own_variables` and `load_own_variables` to
+        determine the correct ordering of variables during serialization for
+        each quantization mode. `None` means no quantization.
+        """
+        return {
+            None: [
+                "kernel",
+                "bias",
+            ],
+            "int8": [
+                "kernel",
+                "bias",
+                "kernel_scale",
+            ],
+        }
+
+    @property
+    def _kernel_reduced_axes(self):
+        # One scale per output channel, the last axis of the kernel.
+        return tuple(range(self.rank + 1))
+
+    def quantized_build(self, kernel_shape, mode, config=None):
+        if mode == "int8":
+            self._int8_build(kernel_shape, config)
+        else:
+            raise self._quantization_mode_error(mode)
+        self._is_quantized = True
+
+    def _int8_build(self, kernel_shape, config=None):
+        self.inputs_quantizer = (
+            QuantizationConfig.activation_quantizer_or_default(config, None)
+        )
+        self._kernel = self.add_weight(
+            name="kernel",
+            shape=kernel_shape,
+            initializer="zeros",
+            dtype="int8",
+            trainable=False,
+        )
+        self.kernel_scale = self.add_weight(
+            name="kernel_scale",
+            shape=(self.filters,),
+            initializer="ones",
+            trainable=False,
+        )
+
+    def _int8_call(self, inputs, training=None):
+        if self.inputs_quantizer:
+            inputs = quantize_conv_inputs(self.inputs_quantizer, inputs)
+        # `call()` convolves with `self.kernel`, which is dequantized.
+        return self.call(inputs)
+
+    def quantize(self, mode=None, type_check=True, config=None):
+        # Prevent quantization of the subclasses, which may change how the
+        # kernel is used.
+        if type_check and not is_builtin_conv_layer(self):
+            raise self._not_implemented_error(self.quantize)
+        if mode != "int8":
+            raise self._quantization_mode_error(mode)
+
+        self.quantization_config = conv_quantization_config(config)
+        kernel_shape = self._kernel.shape
+        kernel_value, kernel_scale = quantize_conv_kernel(
+            self._kernel, self._kernel_reduced_axes, self.quantization_config
+        )
+        del self._kernel
+        self.quantized_build(kernel_shape, mode, self.quantization_config)
+        self._kernel.assign(kernel_value)
+        self.kernel_scale.assign(kernel_scale)
+
+        # Set new dtype policy.
+        if self.dtype_policy.quantization_mode is None:
+            policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
+            self.dtype_policy = policy
+
+    def _quantization_mode_error(self, mode):
+        return NotImplementedError(
+            "Invalid quantization mode. Expected one of ('int8',). "
+            f"Received: quantization_mode={mode}"
+        )
+
     def _check_load_own_variables(self, store):
         all_vars = self._trainable_variables + self._non_trainable_variables
         if len(store.keys()) != len(all_vars):
@@ -411,3 +566,107 @@ class BaseConv(Layer):
                 f"{len(store.keys())} variables during loading. "
                 f"Expected: {[v.name for v in all_vars]}"
             )
+
+
+def is_builtin_conv_layer(layer):
+    # Imported here to avoid circular imports, since the layers subclass
+    # `BaseConv`.
+    from keras.src.layers.convolutional.conv1d import Conv1D
+    from keras.src.layers.convolutional.conv2d import Conv2D
+    from keras.src.layers.convolutional.conv3d import Conv3D
+    from keras.src.layers.convolutional.depthwise_conv1d import DepthwiseConv1D
+    from keras.src.layers.convolutional.depthwise_conv2d import DepthwiseConv2D
+    from keras.src.layers.convolutional.separable_conv1d import SeparableConv1D
+    from keras.src.layers.convolutional.separable_conv2d import SeparableConv2D
+
+    return type(layer) in (
+        Conv1D,
+        Conv2D,
+        Conv3D,
+        DepthwiseConv1D,
+        DepthwiseConv2D,
+        SeparableConv1D,
+        SeparableConv2D,
+    )
+
+
+def conv_quantization_config(config):
+    """Returns the quantization config of a convolution layer.
+
+    The convolution runs on the dequantized kernel, so quantizing its inputs
+    adds error and latency without making it faster. The default activation
+    quantizer of an `Int8QuantizationConfig` is thus dropped: the inputs are
+    only quantized with an explicitly passed `activation_quantizer`.
+    """
+    if getattr(config, "_default_activation_quantizer", False):
+        return Int8QuantizationConfig(
+            weight_quantizer=config.weight_quantizer,
+            activation_quantizer=None,
+        )
+    return config
+
+
+def quantize_conv_kernel(kernel, reduced_axes, config=None):
+    """Quantizes a convolution kernel to int8.
+
+    Args:
+        kernel: The float kernel.
+        reduced_axes: The axes sharing a scale. The scales have the shape of
+            the remaining axes, e.g. one scale per output channel.
+        config: Optional `QuantizationConfig` providing the weight quantizer.
+
+    Returns:
+        A tuple `(quantized_kernel, kernel_scale)`.
+    """
+    weight_quantizer = QuantizationConfig.weight_quantizer_or_default(
+        config, quantizers.AbsMaxQuantizer(axis=reduced_axes)
+    )
+    kernel_value, kernel_scale = weight_quantizer(kernel, to_numpy=True)
+    kernel_scale = ops.squeeze(kernel_scale, axis=reduced_axes)
+    return kernel_value, kernel_scale
+
+
+def dequantize_conv_kernel(kernel, kernel_scale, dtype, cache=None):
+    """Dequantizes an int8 convolution kernel.
+
+    Args:
+        kernel: The int8 kernel variable.
+        kernel_scale: The scale variable, with the shape of the last axes of
+            the kernel.
+        dtype: The dtype of the dequantized kernel.
+        cache: Optional `WeightCache`. In eager inference, the dequantized
+            kernel is kept in it until `kernel` or `kernel_scale` is
+            assigned a new value.
+
+    Returns:
+        The float kernel.
+    """
+
+    def dequantize():
+        return ops.divide(ops.cast(kernel, dtype), kernel_scale)
+
+    if cache is None or not can_use_weight_cache(None):
+        return dequantize()
+    return cache.get((kernel, kernel_scale), dtype, dequantize)
+
+
+def quantize_conv_inputs(inputs_quantizer, inputs):
+    """Quantizes and dequantizes the inputs of a convolution.
+
+    Spatial positions are mixed by the convolution, so a single scale is used
+    for each sample. The gradient is passed through unchanged.
+    """
+    axis = tuple(range(1, len(inputs.shape)))
+
+    @ops.custom_gradient
+    def quantize_and_dequantize(inputs):
+        def grad_fn(*args, upstream=None):
+            if upstream is None:
+                (upstream,) = args
+            return upstream
+
+        inputs_q, inputs_scale = inputs_quantizer(inputs, axis=axis)
+        outputs = ops.divide(ops.cast(inputs_q, inputs.dtype), inputs_scale)
+        return outputs, grad_fn
+
+    return quantize_and_dequantize(inputs)
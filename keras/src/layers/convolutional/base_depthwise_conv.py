@@ -2,13 +2,22 @@
 
 from keras.src import activations
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import ops
 from keras.src import regularizers
 from keras.src.backend import standardize_data_format
+from keras.src.layers.convolutional.base_conv import conv_quantization_config
+from keras.src.layers.convolutional.base_conv import dequantize_conv_kernel
+from keras.src.layers.convolutional.base_conv import is_builtin_conv_layer
+from keras.src.layers.convolutional.base_conv import quantize_conv_inputs
+from keras.src.layers.convolutional.base_conv import quantize_conv_kernel
 from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 from keras.src.ops.operation_utils import compute_conv_output_shape
+from keras.src.quantizers.quantization_config import QuantizationConfig
+from keras.src.quantizers.utils import WeightCache
+from keras.src.saving import serialization_lib
 from keras.src.utils.argument_validation import standardize_padding
 from keras.src.utils.argument_validation import standardize_tuple
 
@@ -79,6 +88,10 @@ class BaseDepthwiseConv(Layer):
             are not safe to use when doing asynchronous distributed training.
         bias_constraint: Optional projection function to be applied to the
             bias after being updated by an `Optimizer`.
+        quantization_config: Optional `QuantizationConfig` used when the layer
+            is quantized with `quantize("int8")`. By default, only the
+            kernel is quantized. The inputs are also quantized if an
+            `activation_quantizer` is passed explicitly to the config.
     """
 
     def __init__(
@@ -101,6 +114,7 @@ class BaseDepthwiseConv(Layer):
         bias_constraint=None,
         trainable=True,
         name=None,
+        quantization_config=None,
         **kwargs,
     ):
         super().__init__(
@@ -126,6 +140,8 @@ class BaseDepthwiseConv(Layer):
         self.bias_regularizer = regularizers.get(bias_regularizer)
         self.depthwise_constraint = constraints.get(depthwise_constraint)
         self.bias_constraint = constraints.get(bias_constraint)
+        self.quantization_config = quantization_config
+        self._weight_cache = WeightCache()
         self.input_spec = InputSpec(min_ndim=self.rank + 2)
         self.data_format = self.data_format
 
@@ -169,15 +185,22 @@ class BaseDepthwiseConv(Layer):
             input_channel,
             self.depth_multiplier,
         )
-        self.kernel = self.add_weight(
-            name="kernel",
-            shape=depthwise_shape,
-            initializer=self.depthwise_initializer,
-            regularizer=self.depthwise_regularizer,
-            constraint=self.depthwise_constraint,
-            trainable=True,
-            dtype=self.dtype,
-        )
+        if self.quantization_mode:
+            self.quantized_build(
+                depthwise_shape,
+                mode=self.quantization_mode,
+                config=self.quantization_config,
+            )
+        else:
+            self._kernel = self.add_weight(
+                name="kernel",
+                shape=depthwise_shape,
+                initializer=self.depthwise_initializer,
+                regularizer=self.depthwise_regularizer,
+                constraint=self.depthwise_constraint,
+                trainable=True,
+                dtype=self.dtype,
+            )
         if self.use_bias:
             self.bias = self.add_weight(
                 name="bias",
@@ -191,6 +214,21 @@ class BaseDepthwiseConv(Layer):
         else:
             self.bias = None
 
+    @property
+    def kernel(self):
+        if not self.built:
+            raise AttributeError(
+                "You must build the layer before accessing `kernel`."
+            )
+        if self.quantization_mode == "int8":
+            return dequantize_conv_kernel(
+                self._kernel,
+                self.kernel_scale,
+                self.compute_dtype,
+                cache=self._weight_cache,
+            )
+        return self._kernel
+
     def _get_input_channel(self, input_shape):
         if self.data_format == "channels_last":
             input_channel = input_shape[-1]
@@ -268,6 +306,80 @@ class BaseDepthwiseConv(Layer):
                     self.depthwise_constraint
                 ),
                 "bias_constraint": constraints.serialize(self.bias_constraint),
+                "quantization_config": serialization_lib.serialize_keras_object(
+                    self.quantization_config
+                ),
             }
         )
         return config
+
+    @classmethod
+    def from_config(cls, config):
+        config = config.copy()
+        config["quantization_config"] = (
+            serialization_lib.deserialize_keras_object(
+                config.get("quantization_config", None)
+            )
+        )
+        return super().from_config(config)
+
+    def quantized_build(self, kernel_shape, mode, config=None):
+        if mode == "int8":
+            self._int8_build(kernel_shape, config)
+        else:
+            raise self._quantization_mode_error(mode)
+        self._is_quantized = True
+
+    def _int8_build(self, kernel_shape, config=None):
+        self.inputs_quantizer = (
+            QuantizationConfig.activation_quantizer_or_default(config, None)
+        )
+        self._kernel = self.add_weight(
+            name="kernel",
+            shape=kernel_shape,
+            initializer="zeros",
+            dtype="int8",
+            trainable=False,
+        )
+        # One scale per output channel, i.e. per input channel and depthwise
+        # filter.
+        self.kernel_scale = self.add_weight(
+            name="kernel_scale",
+            shape=kernel_shape[-2:],
+            initializer="ones",
+            trainable=False,
+        )
+
+    def _int8_call(self, inputs, training=None):
+        if self.inputs_quantizer:
+            inputs = quantize_conv_inputs(self.inputs_quantizer, inputs)
+        # `call()` convolves with `self.kernel`, which is dequantized.
+        return self.call(inputs)
+
+    def quantize(self, mode=None, type_check=True, config=None):
+        # Prevent quantization of the subclasses.
+        if type_check and not is_builtin_conv_layer(self):
+            raise self._not_implemented_error(self.quantize)
+        if mode != "int8":
+            raise self._quantization_mode_error(mode)
+
+        self.quantization_config = conv_quantization_config(config)
+        kernel_shape = self._kernel.shape
+        kernel_value, kernel_scale = quantize_conv_kernel(
+            self._kernel, tuple(range(self.rank)), self.quantization_config
+        )
+        del self._kernel
+        self.quantized_build(kernel_shape, mode, self.quantization_config)
+        self._kernel.assign(kernel_value)
+        self.kernel_scale.assign(kernel_scale)
+
+        # Set new dtype policy.
+        if self.dtype_policy.quantization_mode is None:
+            policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
+            self.dtype_policy = policy
+
+    def _quantization_mode_error(self, mode):
+        return NotImplementedError(
+            "Invalid quantization mode. Expected one of ('int8',). "
+            f"Received: quantization_mode={mode}"
+        )
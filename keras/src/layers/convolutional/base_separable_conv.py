@@ -2,13 +2,22 @@
 
 from keras.src import activations
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import ops
 from keras.src import regularizers
 from keras.src.backend import standardize_data_format
+from keras.src.layers.convolutional.base_conv import conv_quantization_config
+from keras.src.layers.convolutional.base_conv import dequantize_conv_kernel
+from keras.src.layers.convolutional.base_conv import is_builtin_conv_layer
+from keras.src.layers.convolutional.base_conv import quantize_conv_inputs
+from keras.src.layers.convolutional.base_conv import quantize_conv_kernel
 from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 from keras.src.ops.operation_utils import compute_conv_output_shape
+from keras.src.quantizers.quantization_config import QuantizationConfig
+from keras.src.quantizers.utils import WeightCache
+from keras.src.saving import serialization_lib
 from keras.src.utils.argument_validation import standardize_padding
 from keras.src.utils.argument_validation import standardize_tuple
 
@@ -73,6 +82,10 @@ class BaseSeparableConv(Layer):
             pointwise kernel after being updated by an `Optimizer`.
         bias_constraint: Optional projection function to be applied to the
             bias after being updated by an `Optimizer`.
+        quantization_config: Optional `QuantizationConfig` used when the layer
+            is quantized with `quantize("int8")`. By default, only the
+            kernel is quantized. The inputs are also quantized if an
+            `activation_quantizer` is passed explicitly to the config.
     """
 
     def __init__(
@@ -99,6 +112,7 @@ class BaseSeparableConv(Layer):
         bias_constraint=None,
         trainable=True,
         name=None,
+        quantization_config=None,
         **kwargs,
     ):
         super().__init__(
@@ -128,6 +142,9 @@ class BaseSeparableConv(Layer):
         self.depthwise_constraint = constraints.get(depthwise_constraint)
         self.pointwise_constraint = constraints.get(pointwise_constraint)
         self.bias_constraint = constraints.get(bias_constraint)
+        self.quantization_config = quantization_config
+        self._depthwise_weight_cache = WeightCache()
+        self._pointwise_weight_cache = WeightCache()
         self.data_format = self.data_format
 
         self.input_spec = InputSpec(min_ndim=self.rank + 2)
@@ -183,24 +200,31 @@ class BaseSeparableConv(Layer):
             self.filters,
         )
 
-        self.depthwise_kernel = self.add_weight(
-            name="depthwise_kernel",
-            shape=depthwise_kernel_shape,
-            initializer=self.depthwise_initializer,
-            regularizer=self.depthwise_regularizer,
-            constraint=self.depthwise_constraint,
-            trainable=True,
-            dtype=self.dtype,
-        )
-        self.pointwise_kernel = self.add_weight(
-            name="pointwise_kernel",
-            shape=pointwise_kernel_shape,
-            initializer=self.pointwise_initializer,
-            regularizer=self.pointwise_regularizer,
-            constraint=self.pointwise_constraint,
-            trainable=True,
-            dtype=self.dtype,
-        )
+        if self.quantization_mode:
+            self.quantized_build(
+                (depthwise_kernel_shape, pointwise_kernel_shape),
+                mode=self.quantization_mode,
+                config=self.quantization_config,
+            )
+        else:
+            self._depthwise_kernel = self.add_weight(
+                name="depthwise_kernel",
+                shape=depthwise_kernel_shape,
+                initializer=self.depthwise_initializer,
+                regularizer=self.depthwise_regularizer,
+                constraint=self.depthwise_constraint,
+                trainable=True,
+                dtype=self.dtype,
+            )
+            self._pointwise_kernel = self.add_weight(
+                name="pointwise_kernel",
+                shape=pointwise_kernel_shape,
+                initializer=self.pointwise_initializer,
+                regularizer=self.pointwise_regularizer,
+                constraint=self.pointwise_constraint,
+                trainable=True,
+                dtype=self.dtype,
+            )
         if self.use_bias:
             self.bias = self.add_weight(
                 name="bias",
@@ -214,6 +238,36 @@ class BaseSeparableConv(Layer):
         else:
             self.bias = None
 
+    @property
+    def depthwise_kernel(self):
+        if not self.built:
+            raise AttributeError(
+                "You must build the layer before accessing `depthwise_kernel`."
+            )
+        if self.quantization_mode == "int8":
+            return dequantize_conv_kernel(
+                self._depthwise_kernel,
+                self.depthwise_kernel_scale,
+                self.compute_dtype,
+                cache=self._depthwise_weight_cache,
+            )
+        return self._depthwise_kernel
+
+    @property
+    def pointwise_kernel(self):
+        if not self.built:
+            raise AttributeError(
+                "You must build the layer before accessing `pointwise_kernel`."
+            )
+        if self.quantization_mode == "int8":
+            return dequantize_conv_kernel(
+                self._pointwise_kernel,
+                self.pointwise_kernel_scale,
+                self.compute_dtype,
+                cache=self._pointwise_weight_cache,
+            )
+        return self._pointwise_kernel
+
     def call(self, inputs):
         outputs = ops.separable_conv(
             inputs,
@@ -289,6 +343,108 @@ class BaseSeparableConv(Layer):
                     self.pointwise_constraint
                 ),
                 "bias_constraint": constraints.serialize(self.bias_constraint),
+                "quantization_config": serialization_lib.serialize_keras_object(
+                    self.quantization_config
+                ),
             }
         )
         return config
+
+    @classmethod
+    def from_config(cls, config):
+        config = config.copy()
+        config["quantization_config"] = (
+            serialization_lib.deserialize_keras_object(
+                config.get("quantization_config", None)
+            )
+        )
+        return super().from_config(config)
+
+    def quantized_build(self, kernel_shapes, mode, config=None):
+        if mode == "int8":
+            self._int8_build(kernel_shapes, config)
+        else:
+            raise self._quantization_mode_error(mode)
+        self._is_quantized = True
+
+    def _int8_build(self, kernel_shapes, config=None):
+        depthwise_kernel_shape, pointwise_kernel_shape = kernel_shapes
+        self.inputs_quantizer = (
+            QuantizationConfig.activation_quantizer_or_default(config, None)
+        )
+        self._depthwise_kernel = self.add_weight(
+            name="depthwise_kernel",
+            shape=depthwise_kernel_shape,
+            initializer="zeros",
+            dtype="int8",
+            trainable=False,
+        )
+        self._pointwise_kernel = self.add_weight(
+            name="pointwise_kernel",
+            shape=pointwise_kernel_shape,
+            initializer="zeros",
+            dtype="int8",
+            trainable=False,
+        )
+        # One scale per output channel of each convolution.
+        self.depthwise_kernel_scale = self.add_weight(
+            name="depthwise_kernel_scale",
+            shape=depthwise_kernel_shape[-2:],
+            initializer="ones",
+            trainable=False,
+        )
+        self.pointwise_kernel_scale = self.add_weight(
+            name="pointwise_kernel_scale",
+            shape=(self.filters,),
+            initializer="ones",
+            trainable=False,
+        )
+
+    def _int8_call(self, inputs, training=None):
+        # Only the inputs of the depthwise convolution are quantized, since
+        # `ops.separable_conv` doesn't expose the intermediate outputs.
+        if self.inputs_quantizer:
+            inputs = quantize_conv_inputs(self.inputs_quantizer, inputs)
+        # `call()` convolves with the dequantized kernels.
+        return self.call(inputs)
+
+    def quantize(self, mode=None, type_check=True, config=None):
+        # Prevent quantization of the subclasses.
+        if type_check and not is_builtin_conv_layer(self):
+            raise self._not_implemented_error(self.quantize)
+        if mode != "int8":
+            raise self._quantization_mode_error(mode)
+
+        self.quantization_config = conv_quantization_config(config)
+        kernel_shapes = (
+            self._depthwise_kernel.shape,
+            self._pointwise_kernel.shape,
+        )
+        depthwise_value, depthwise_scale = quantize_conv_kernel(
+            self._depthwise_kernel,
+            tuple(range(self.rank)),
+            self.quantization_config,
+        )
+        pointwise_value, pointwise_scale = quantize_conv_kernel(
+            self._pointwise_kernel,
+            tuple(range(self.rank + 1)),
+            self.quantization_config,
+        )
+        del self._depthwise_kernel
+        del self._pointwise_kernel
+        self.quantized_build(kernel_shapes, mode, self.quantization_config)
+        self._depthwise_kernel.assign(depthwise_value)
+        self._pointwise_kernel.assign(pointwise_value)
+        self.depthwise_kernel_scale.assign(depthwise_scale)
+        self.pointwise_kernel_scale.assign(pointwise_scale)
+
+        # Set new dtype policy.
+        if self.dtype_policy.quantization_mode is None:
+            policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
+            self.dtype_policy = policy
+
+    def _quantization_mode_error(self, mode):
+        return NotImplementedError(
+            "Invalid quantization mode. Expected one of ('int8',). "
+            f"Received: quantization_mode={mode}"
+        )
@@ -147,7 +147,61 @@ class Conv1D(BaseConv):
             # Apply causal padding to inputs.
             inputs = ops.pad(inputs, self._compute_causal_padding())
             padding = "valid"
+        return self._convolve(inputs, padding)
+
+    def get_initial_stream_state(self, batch_size):
+        """Returns the state of `batch_size` new streams for `stream_step()`.
+
+        The state holds the last `dilation_rate * (kernel_size - 1)` input
+        frames of each stream, initialized with zeros as with causal padding.
+        """
+        context = self.dilation_rate[0] * (self.kernel_size[0] - 1)
+        if self.strides[0] != 1 or (context and self.padding != "causal"):
+            raise ValueError(
+                "Only `Conv1D` layers with `padding='causal'` and `strides=1` "
+                "(or with a kernel of size 1) can be used for streaming "
+                f"inference. Received: padding={self.padding}, "
+                f"strides={self.strides}, kernel_size={self.kernel_size} for "
+                f"layer '{self.name}'."
+            )
+        input_channels = self.kernel.shape[-2] * self.groups
+        if self.data_format == "channels_last":
+            shape = (batch_size, context, input_channels)
+        else:
+            shape = (batch_size, input_channels, context)
+        return ops.zeros(shape, dtype=self.compute_dtype)
+
+    def stream_step(self, inputs, stream_state):
+        """Processes the next frames of a batch of streams.
+
+        Running the layer on consecutive chunks of a sequence with
+        `stream_step()` gives the same outputs as running it once on the full
+        sequence, at a cost proportional to the chunk length.
+
+        Args:
+            inputs: Tensor of the next frames of each stream, with shape
+                `(batch_size, chunk_length, channels)` (or
+                `(batch_size, channels, chunk_length)`).
+            stream_state: The state returned by the previous call, or by
+                `get_initial_stream_state()` for new streams.
+
+        Returns:
+            A tuple `(outputs, new_stream_state)`.
+        """
+        time_axis = 1 if self.data_format == "channels_last" else 2
+        context = stream_state.shape[time_axis]
+        inputs = ops.concatenate(
+            [ops.cast(stream_state, inputs.dtype), inputs], axis=time_axis
+        )
+        outputs = self._convolve(inputs, "valid")
+        if context:
+            if time_axis == 1:
+                stream_state = inputs[:, -context:]
+            else:
+                stream_state = inputs[:, :, -context:]
+        return outputs, stream_state
 
+    def _convolve(self, inputs, padding):
         outputs = ops.conv(
             inputs,
             self.kernel,
@@ -12,6 +12,8 @@ from keras.src import models
 from keras.src import ops
 from keras.src import saving
 from keras.src import testing
+from keras.src.quantizers.quantization_config import Int8QuantizationConfig
+from keras.src.quantizers.quantizers import AbsMaxQuantizer
 
 
 def _same_padding(input_size, kernel_size, stride):
@@ -807,6 +809,154 @@ class ConvBasicTest(testing.TestCase):
             supports_masking=False,
         )
 
+    # Test quantization-related methods.
+
+    @parameterized.named_parameters(
+        ("conv1d", layers.Conv1D, (2, 8, 4), "causal"),
+        ("conv2d", layers.Conv2D, (2, 8, 8, 4), "valid"),
+        ("conv3d", layers.Conv3D, (2, 4, 4, 4, 4), "same"),
+    )
+    def test_quantize_int8(self, layer_cls, input_shape, padding):
+        layer = layer_cls(filters=6, kernel_size=3, padding=padding)
+        layer.build(input_shape)
+        x = np.random.random(input_shape)
+        y_float = layer(x)
+        layer.quantize("int8")
+
+        # Verify the dtype of the weights.
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        self.assertEqual(layer.kernel_scale.shape, (6,))
+        self.assertEqual(layer.dtype_policy.name, "int8_from_float32")
+        self.assertLen(layer.trainable_weights, 1)  # bias
+
+        # Verify the correctness of the outputs.
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-3)  # A weak correctness test
+
+        # Check model save / load round-trip.
+        model = models.Sequential([layers.Input(input_shape[1:]), layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Check weights-only save / load round-trip.
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.weights.h5"
+        )
+        model.save_weights(temp_filepath)
+        new_model = models.Sequential(
+            [
+                layers.Input(input_shape[1:]),
+                layer_cls(filters=6, kernel_size=3, padding=padding),
+            ]
+        )
+        new_model.quantize("int8")
+        new_model.load_weights(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+    def test_quantize_int8_weight_only(self):
+        config = Int8QuantizationConfig(
+            weight_quantizer=AbsMaxQuantizer(axis=(0, 1, 2)),
+            activation_quantizer=None,
+        )
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        x = np.random.random((2, 6, 6, 3)).astype("float32")
+        layer.quantize("int8", config=config)
+        self.assertIsNone(layer.inputs_quantizer)
+        # Without input quantization, the outputs are exactly those of the
+        # dequantized kernel.
+        expected = ops.conv(x, layer.kernel) + layer.bias
+        self.assertAllClose(layer(x), expected)
+
+        new_layer = layers.Conv2D.from_config(layer.get_config())
+        self.assertIsInstance(
+            new_layer.quantization_config, Int8QuantizationConfig
+        )
+        self.assertIsNone(new_layer.quantization_config.activation_quantizer)
+
+    def test_quantize_int8_inputs_quantizer(self):
+        x = np.random.random((2, 6, 6, 3)).astype("float32")
+        # By default, only the kernel is quantized.
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        layer.quantize("int8")
+        self.assertIsNone(layer.inputs_quantizer)
+        self.assertAllClose(layer(x), ops.conv(x, layer.kernel) + layer.bias)
+
+        # The inputs are only quantized with an explicit activation
+        # quantizer.
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        y_float = layer(x)
+        config = Int8QuantizationConfig(activation_quantizer=AbsMaxQuantizer())
+        layer.quantize("int8", config=config)
+        self.assertIsInstance(layer.inputs_quantizer, AbsMaxQuantizer)
+        y_quantized = layer(x)
+        self.assertNotAllClose(
+            y_quantized, ops.conv(x, layer.kernel) + layer.bias
+        )
+        self.assertLess(ops.mean(ops.square(y_float - y_quantized)), 1e-3)
+        new_layer = layers.Conv2D.from_config(layer.get_config())
+        new_layer.build((None, 6, 6, 3))
+        self.assertIsInstance(new_layer.inputs_quantizer, AbsMaxQuantizer)
+
+    def test_quantize_int8_kernel_cache(self):
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        layer.quantize("int8")
+        # The dequantized kernel is computed once in eager mode.
+        kernel = layer.kernel
+        self.assertIs(layer.kernel, kernel)
+        # It is recomputed when the quantized variables change.
+        layer.kernel_scale.assign(layer.kernel_scale * 2)
+        self.assertIsNot(layer.kernel, kernel)
+        self.assertAllClose(layer.kernel, kernel / 2)
+
+    def test_quantize_int8_with_lora(self):
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        layer.quantize("int8")
+        layer.enable_lora(rank=2)
+        layer.lora_kernel_b.assign(np.random.random((2, 4)))
+        x = np.random.random((2, 6, 6, 3))
+        model = models.Sequential([layers.Input((6, 6, 3)), layer])
+        y = model.predict(x)
+
+        # LoRA weights are merged into the quantized kernel when saving.
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.weights.h5"
+        )
+        model.save_weights(temp_filepath)
+        new_model = models.Sequential(
+            [layers.Input((6, 6, 3)), layers.Conv2D(filters=4, kernel_size=3)]
+        )
+        new_model.quantize("int8")
+        new_model.load_weights(temp_filepath)
+        self.assertAllClose(y, new_model.predict(x), atol=0.1)
+
+    def test_quantize_errors(self):
+        class MyConv2D(layers.Conv2D):
+            pass
+
+        layer = MyConv2D(filters=4, kernel_size=3)
+        layer.build((None, 6, 6, 3))
+        with self.assertRaises(NotImplementedError):
+            layer.quantize("int8")
+        layer.quantize("int8", type_check=False)  # No error
+
+        layer = layers.Conv2D(filters=4, kernel_size=3)
+        with self.assertRaisesRegex(ValueError, "isn't yet built"):
+            layer.quantize("int8")
+        layer.build((None, 6, 6, 3))
+        with self.assertRaisesRegex(NotImplementedError, "Expected one of"):
+            layer.quantize("int4")
+        self.assertEqual(layer.dtype_policy.name, "float32")
+
 
 class ConvCorrectnessTest(testing.TestCase):
     @parameterized.parameters(
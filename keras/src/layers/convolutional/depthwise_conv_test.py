@@ -1,9 +1,15 @@
+import os
+
 import numpy as np
 import pytest
 from absl.testing import parameterized
 from numpy.lib.stride_tricks import as_strided
 
+from keras.src import backend
 from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import saving
 from keras.src import testing
 
 
@@ -335,6 +341,51 @@ class DepthwiseConvBasicTest(testing.TestCase):
                 dilation_rate=(2, 1),
             )
 
+    @parameterized.named_parameters(
+        ("depthwise_conv1d", layers.DepthwiseConv1D, (2, 8, 4)),
+        ("depthwise_conv2d", layers.DepthwiseConv2D, (2, 8, 8, 4)),
+    )
+    def test_quantize_int8(self, layer_cls, input_shape):
+        layer = layer_cls(kernel_size=3, depth_multiplier=2)
+        layer.build(input_shape)
+        x = np.random.random(input_shape)
+        y_float = layer(x)
+        layer.quantize("int8")
+
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        # One scale per output channel.
+        self.assertEqual(layer.kernel_scale.shape, (4, 2))
+        self.assertIsNone(layer.inputs_quantizer)
+        # The dequantized kernel is cached in eager mode.
+        self.assertIs(layer.kernel, layer.kernel)
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-3)  # A weak correctness test
+
+        # Check model save / load round-trip.
+        model = models.Sequential([layers.Input(input_shape[1:]), layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Check weights-only save / load round-trip.
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.weights.h5"
+        )
+        model.save_weights(temp_filepath)
+        new_model = models.Sequential(
+            [
+                layers.Input(input_shape[1:]),
+                layer_cls(kernel_size=3, depth_multiplier=2),
+            ]
+        )
+        new_model.quantize("int8")
+        new_model.load_weights(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
 
 class DepthwiseConvCorrectnessTest(testing.TestCase):
     @parameterized.parameters(
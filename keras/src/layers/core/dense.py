@@ -13,6 +13,9 @@ from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 from keras.src.quantizers.quantization_config import QuantizationConfig
 from keras.src.quantizers.quantizers import dequantize_with_sz_map
+from keras.src.quantizers.utils import WeightCache
+from keras.src.quantizers.utils import can_use_weight_cache
+from keras.src.quantizers.utils import validate_weight_cache_mode
 from keras.src.saving import serialization_lib
 
 
@@ -119,6 +122,8 @@ class Dense(Layer):
         self.quantization_config = quantization_config
         self.input_spec = InputSpec(min_ndim=2)
         self.supports_masking = True
+        self._inference_weight_cache = None
+        self._weight_cache = WeightCache()
 
     def build(self, input_shape):
         kernel_shape = (input_shape[-1], self.units)
@@ -199,6 +204,34 @@ class Dense(Layer):
 
         return kernel
 
+    @property
+    def inference_weight_cache(self):
+        """The weights cached for inference when the layer is quantized.
+
+        `int4` and `gptq` layers store packed kernels which are unpacked (and
+        for `gptq` dequantized) in every call. For eager inference (e.g.
+        serving requests one by one without `jit_compile`), this work can be
+        cached at the cost of memory:
+
+        - `None` (default): nothing is cached.
+        - `"unpacked"`: caches the unpacked integer kernel, which uses one
+            byte per weight.
+        - `"dequantized"`: caches the floating-point kernel, which uses as
+            much memory as the unquantized kernel but removes all per-call
+            work on the kernel.
+
+        The cache is computed in the first call and recomputed when the
+        quantized variables are assigned. It is not used when training or
+        tracing (e.g. in `jit_compile`d functions), where the compiler
+        already optimizes the unpacking.
+        """
+        return self._inference_weight_cache
+
+    @inference_weight_cache.setter
+    def inference_weight_cache(self, value):
+        self._inference_weight_cache = validate_weight_cache_mode(value)
+        self._weight_cache.clear()
+
     def call(self, inputs, training=None):
         x = ops.matmul(inputs, self.kernel)
         if self.bias is not None:
@@ -481,32 +514,25 @@ class Dense(Layer):
         )
 
     def _gptq_call(self, inputs, training=False):
-        from keras.src.quantizers import gptq_core
-
         if not self.is_gptq_calibrated:
             W = self._kernel
-        else:
-            should_unpack = (
-                gptq_core.get_weight_bits_for_layer(self, config=None) == 4
-            )
-            W = (
-                quantizers.unpack_int4(
+        elif self._inference_weight_cache and can_use_weight_cache(
+            inputs, training
+        ):
+            W = self._weight_cache.get(
+                (
                     self.quantized_kernel,
-                    orig_len=self.units,
-                    axis=0,
-                    dtype="uint8",
-                )
-                if should_unpack
-                else self.quantized_kernel
-            )
-            W = ops.transpose(
-                dequantize_with_sz_map(
-                    W,
                     self.kernel_scale,
                     self.kernel_zero,
                     self.g_idx,
-                )
+                ),
+                (self._inference_weight_cache, self.compute_dtype),
+                self._get_gptq_cached_kernel,
             )
+            if self._inference_weight_cache == "unpacked":
+                W = self._dequantize_gptq_kernel(W)
+        else:
+            W = self._dequantize_gptq_kernel(self._unpack_gptq_kernel())
 
         y = ops.matmul(inputs, W)
         if self.bias is not None:
@@ -515,6 +541,34 @@ class Dense(Layer):
             y = self.activation(y)
         return y
 
+    def _unpack_gptq_kernel(self):
+        from keras.src.quantizers import gptq_core
+
+        if gptq_core.get_weight_bits_for_layer(self, config=None) == 4:
+            return quantizers.unpack_int4(
+                self.quantized_kernel,
+                orig_len=self.units,
+                axis=0,
+                dtype="uint8",
+            )
+        return ops.convert_to_tensor(self.quantized_kernel)
+
+    def _dequantize_gptq_kernel(self, W):
+        return ops.transpose(
+            dequantize_with_sz_map(
+                W,
+                self.kernel_scale,
+                self.kernel_zero,
+                self.g_idx,
+            )
+        )
+
+    def _get_gptq_cached_kernel(self):
+        W = self._unpack_gptq_kernel()
+        if self._inference_weight_cache == "dequantized":
+            W = self._dequantize_gptq_kernel(W)
+        return W
+
     def _int4_build(self, kernel_shape, config=None):
         """Build variables for int4 quantization.
 
@@ -646,7 +700,7 @@ class Dense(Layer):
         """Forward pass for int4 quantized Dense layer."""
 
         @ops.custom_gradient
-        def matmul_with_inputs_gradient(inputs, kernel, kernel_scale):
+        def matmul_with_inputs_gradient(inputs, unpacked_kernel, kernel_scale):
             """Custom gradient function for int4 quantized weights.
 
             Automatic differentiation will not know how to handle the
@@ -657,10 +711,6 @@ class Dense(Layer):
             compute the gradient.
             """
 
-            unpacked_kernel = quantizers.unpack_int4(
-                kernel, self._orig_input_dim
-            )
-
             def grad_fn(*args, upstream=None):
                 if upstream is None:
                     (upstream,) = args
@@ -682,11 +732,41 @@ class Dense(Layer):
             x = ops.divide(x, output_scale)
             return x, grad_fn
 
-        x = matmul_with_inputs_gradient(
-            inputs,
-            ops.convert_to_tensor(self._kernel),
-            ops.convert_to_tensor(self.kernel_scale),
+        use_cache = self._inference_weight_cache and can_use_weight_cache(
+            inputs, training
         )
+        if use_cache and self._inference_weight_cache == "dequantized":
+            float_kernel = self._weight_cache.get(
+                (self._kernel, self.kernel_scale),
+                (self._inference_weight_cache, self.compute_dtype),
+                lambda: ops.divide(
+                    ops.cast(self._unpack_int4_kernel(), self.compute_dtype),
+                    self.kernel_scale,
+                ),
+            )
+            if self.inputs_quantizer:
+                # Same as the integer matmul, with the kernel scale folded
+                # into the cached kernel.
+                inputs_q, inputs_scale = self.inputs_quantizer(inputs, axis=-1)
+                inputs_q = ops.cast(inputs_q, self.compute_dtype)
+                x = ops.matmul(inputs_q, float_kernel)
+                x = ops.divide(x, inputs_scale)
+            else:
+                x = ops.matmul(inputs, float_kernel)
+        else:
+            if use_cache:
+                unpacked_kernel = self._weight_cache.get(
+                    (self._kernel,),
+                    self._inference_weight_cache,
+                    self._unpack_int4_kernel,
+                )
+            else:
+                unpacked_kernel = self._unpack_int4_kernel()
+            x = matmul_with_inputs_gradient(
+                inputs,
+                unpacked_kernel,
+                ops.convert_to_tensor(self.kernel_scale),
+            )
 
         if self.lora_enabled:
             lora_x = ops.matmul(inputs, self.lora_kernel_a)
@@ -700,6 +780,11 @@ class Dense(Layer):
             x = self.activation(x)
         return x
 
+    def _unpack_int4_kernel(self):
+        return quantizers.unpack_int4(
+            ops.convert_to_tensor(self._kernel), self._orig_input_dim
+        )
+
     def _float8_call(self, inputs, training=None):
         if self.lora_enabled:
             raise NotImplementedError(
@@ -18,6 +18,9 @@ from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 from keras.src.quantizers.quantization_config import QuantizationConfig
 from keras.src.quantizers.quantizers import dequantize_with_sz_map
+from keras.src.quantizers.utils import WeightCache
+from keras.src.quantizers.utils import can_use_weight_cache
+from keras.src.quantizers.utils import validate_weight_cache_mode
 from keras.src.saving import serialization_lib
 
 
@@ -159,6 +162,8 @@ class EinsumDense(Layer):
         self.lora_enabled = False
         self.gptq_unpacked_column_size = gptq_unpacked_column_size
         self.quantization_config = quantization_config
+        self._inference_weight_cache = None
+        self._weight_cache = WeightCache()
 
     def build(self, input_shape):
         shape_data = _analyze_einsum_string(
@@ -260,6 +265,32 @@ class EinsumDense(Layer):
     def compute_output_shape(self, _):
         return self.full_output_shape
 
+    @property
+    def inference_weight_cache(self):
+        """The weights cached for inference when the layer is quantized.
+
+        `int4` and `gptq` layers store packed kernels which are unpacked (and
+        for `gptq` dequantized) in every call. For eager inference, this work
+        can be cached at the cost of memory:
+
+        - `None` (default): nothing is cached.
+        - `"unpacked"`: caches the unpacked integer kernel, which uses one
+            byte per weight.
+        - `"dequantized"`: caches the floating-point kernel, which uses as
+            much memory as the unquantized kernel but removes all per-call
+            work on the kernel.
+
+        The cache is computed in the first call and recomputed when the
+        quantized variables are assigned. It is not used when training or
+        tracing (e.g. in `jit_compile`d functions).
+        """
+        return self._inference_weight_cache
+
+    @inference_weight_cache.setter
+    def inference_weight_cache(self, value):
+        self._inference_weight_cache = validate_weight_cache_mode(value)
+        self._weight_cache.clear()
+
     def call(self, inputs, training=None):
         x = ops.einsum(self.equation, inputs, self.kernel)
         if self.bias is not None:
@@ -581,33 +612,25 @@ class EinsumDense(Layer):
         )
 
     def _gptq_call(self, inputs, training=False):
-        from keras.src.quantizers import gptq_core
-
         if not self.is_gptq_calibrated:
             W = self._kernel
-        else:
-            should_unpack = (
-                gptq_core.get_weight_bits_for_layer(self, config=None) == 4
-            )
-            W = (
-                quantizers.unpack_int4(
+        elif self._inference_weight_cache and can_use_weight_cache(
+            inputs, training
+        ):
+            W = self._weight_cache.get(
+                (
                     self.quantized_kernel,
-                    orig_len=self.gptq_unpacked_column_size,
-                    axis=0,
-                    dtype="uint8",
-                )
-                if should_unpack
-                else self.quantized_kernel
-            )
-            W = dequantize_with_sz_map(
-                W,
-                self.kernel_scale,
-                self.kernel_zero,
-                self.g_idx,
+                    self.kernel_scale,
+                    self.kernel_zero,
+                    self.g_idx,
+                ),
+                self._inference_weight_cache,
+                self._get_gptq_cached_kernel,
             )
-            W = ops.transpose(W)
-
-            W = ops.reshape(W, self.original_kernel_shape)
+            if self._inference_weight_cache == "unpacked":
+                W = self._dequantize_gptq_kernel(W)
+        else:
+            W = self._dequantize_gptq_kernel(self._unpack_gptq_kernel())
 
         y = ops.einsum(self.equation, inputs, W)
         if self.bias is not None:
@@ -616,6 +639,34 @@ class EinsumDense(Layer):
             y = self.activation(y)
         return y
 
+    def _unpack_gptq_kernel(self):
+        from keras.src.quantizers import gptq_core
+
+        if gptq_core.get_weight_bits_for_layer(self, config=None) == 4:
+            return quantizers.unpack_int4(
+                self.quantized_kernel,
+                orig_len=self.gptq_unpacked_column_size,
+                axis=0,
+                dtype="uint8",
+            )
+        return ops.convert_to_tensor(self.quantized_kernel)
+
+    def _dequantize_gptq_kernel(self, W):
+        W = dequantize_with_sz_map(
+            W,
+            self.kernel_scale,
+            self.kernel_zero,
+            self.g_idx,
+        )
+        W = ops.transpose(W)
+        return ops.reshape(W, self.original_kernel_shape)
+
+    def _get_gptq_cached_kernel(self):
+        W = self._unpack_gptq_kernel()
+        if self._inference_weight_cache == "dequantized":
+            W = self._dequantize_gptq_kernel(W)
+        return W
+
     def _int4_build(self, kernel_shape, config=None):
         """Build variables for int4 quantization.
 
@@ -812,7 +863,7 @@ class EinsumDense(Layer):
         orig_len = getattr(self, "_orig_length_along_pack_axis", None)
 
         @ops.custom_gradient
-        def einsum_with_inputs_gradient(inputs, packed_kernel, kernel_scale):
+        def einsum_with_inputs_gradient(inputs, unpacked_kernel, kernel_scale):
             """Performs int4 quantized einsum with a custom gradient.
 
             Computes the einsum operation with quantized inputs and a quantized
@@ -823,7 +874,7 @@ class EinsumDense(Layer):
 
             Args:
                 inputs: The full-precision input tensor.
-                packed_kernel: The int4-packed kernel tensor.
+                unpacked_kernel: The unpacked int4 kernel tensor.
                 kernel_scale: The float32 scale factor for the kernel.
 
             Returns:
@@ -835,10 +886,6 @@ class EinsumDense(Layer):
             Raises:
                 ValueError: If the quantization mode is not supported.
             """
-            # Unpack the int4-packed kernel back to int8 values [-8, 7].
-            unpacked_kernel = quantizers.unpack_int4(
-                packed_kernel, orig_len, axis=pack_axis
-            )
 
             def grad_fn(*args, upstream=None):
                 if upstream is None:
@@ -891,11 +938,52 @@ class EinsumDense(Layer):
                     x = ops.divide(x, kernel_scale)
             return x, grad_fn
 
-        x = einsum_with_inputs_gradient(
-            inputs,
-            ops.convert_to_tensor(self._kernel),
-            ops.convert_to_tensor(self.kernel_scale),
+        def unpack_kernel():
+            # Unpack the int4-packed kernel back to int8 values [-8, 7].
+            return quantizers.unpack_int4(
+                ops.convert_to_tensor(self._kernel), orig_len, axis=pack_axis
+            )
+
+        use_cache = self._inference_weight_cache and can_use_weight_cache(
+            inputs, training
         )
+        if use_cache and self._inference_weight_cache == "dequantized":
+            float_kernel = self._weight_cache.get(
+                (self._kernel, self.kernel_scale),
+                (self._inference_weight_cache, self.compute_dtype),
+                lambda: ops.divide(
+                    ops.cast(unpack_kernel(), self.compute_dtype),
+                    self._adjust_scale_for_dequant(self.kernel_scale),
+                ),
+            )
+            if self.inputs_quantizer:
+                # Same as the integer einsum, with the kernel scale folded
+                # into the cached kernel.
+                inputs_q, inputs_scale = self.inputs_quantizer(
+                    inputs, axis=self.quantization_axis
+                )
+                inputs_scale = self._adjust_scale_for_quant(
+                    inputs_scale, "input"
+                )
+                inputs_q = ops.cast(inputs_q, self.compute_dtype)
+                x = ops.einsum(self.equation, inputs_q, float_kernel)
+                x = ops.divide(x, inputs_scale)
+            else:
+                x = ops.einsum(self.equation, inputs, float_kernel)
+        else:
+            if use_cache:
+                unpacked_kernel = self._weight_cache.get(
+                    (self._kernel,),
+                    self._inference_weight_cache,
+                    unpack_kernel,
+                )
+            else:
+                unpacked_kernel = unpack_kernel()
+            x = einsum_with_inputs_gradient(
+                inputs,
+                unpacked_kernel,
+                ops.convert_to_tensor(self.kernel_scale),
+            )
 
         # Add LoRA contribution if enabled
         if self.lora_enabled:
@@ -1207,6 +1207,73 @@ class EinsumDenseTest(testing.TestCase):
         self.assertAllClose(layer.kernel_zero, gptq_store["3"])
         self.assertAllClose(layer.g_idx, gptq_store["4"])
 
+    @parameterized.named_parameters(
+        ("int4_unpacked", "int4", "unpacked"),
+        ("int4_dequantized", "int4", "dequantized"),
+        ("gptq_unpacked", "gptq", "unpacked"),
+        ("gptq_dequantized", "gptq", "dequantized"),
+    )
+    def test_inference_weight_cache(self, mode, cache_mode):
+        config = dict(
+            equation="ab,bcd->acd", output_shape=(4, 8), bias_axes="d"
+        )
+
+        def get_layer():
+            if mode == "int4":
+                layer = layers.EinsumDense(**config)
+                layer.build((None, 6))
+                layer.quantize("int4")
+            else:
+                layer = layers.EinsumDense(
+                    **config, dtype="gptq/4/8_from_float32"
+                )
+                layer.build((None, 6))
+                layer.load_own_variables(
+                    {
+                        "0": np.random.random((8,)).astype("float32"),
+                        "1": np.random.randint(
+                            0, 255, size=(4, 24), dtype="uint8"
+                        ),
+                        "2": np.random.random((8, 3)).astype("float32"),
+                        "3": np.full((8, 3), 8, dtype="uint8"),
+                        "4": np.repeat(np.arange(3), 8).astype("float32"),
+                    }
+                )
+            return layer
+
+        def get_kernel_variables(layer):
+            if mode == "int4":
+                return [layer._kernel, layer.kernel_scale]
+            return [layer.quantized_kernel, layer.kernel_scale]
+
+        layer = get_layer()
+        reference = get_layer()
+        reference.set_weights(layer.get_weights())
+        x = np.random.random((2, 6)).astype("float32")
+
+        layer.inference_weight_cache = cache_mode
+        # The cache is not used for training.
+        layer(x, training=True)
+        self.assertIsNone(layer._weight_cache._value)
+        self.assertAllClose(layer(x), reference(x), atol=1e-5)
+        cached_kernel = layer._weight_cache._value
+        self.assertIsNotNone(cached_kernel)
+        self.assertAllClose(layer(x), reference(x), atol=1e-5)
+        self.assertIs(layer._weight_cache._value, cached_kernel)
+
+        # Assigning the weights invalidates the cache.
+        for layer_variable, reference_variable in zip(
+            get_kernel_variables(layer), get_kernel_variables(reference)
+        ):
+            value = ops.flip(reference_variable, axis=0)
+            layer_variable.assign(value)
+            reference_variable.assign(value)
+        self.assertAllClose(layer(x), reference(x), atol=1e-5)
+        self.assertIsNot(layer._weight_cache._value, cached_kernel)
+
+        with self.assertRaisesRegex(ValueError, "inference_weight_cache"):
+            layer.inference_weight_cache = "float"
+
     def test_int4_gptq_kernel_returns_unpacked_form(self):
         """Test that the `kernel` property returns the unpacked int4 GPTQ
         kernel."""
@@ -0,0 +1,315 @@
+from keras.src import backend
+from keras.src import ops
+from keras.src.api_export import keras_export
+from keras.src.layers.core.embedding import Embedding
+
+# Seeds of the hash functions used to index the embedding tables and the
+# admission sketch. They only need to be distinct from one another.
+_TABLE_SEED_OFFSET = 0x2545F491
+_SKETCH_SEED_OFFSET = 0x68E31DA4
+# Number of rows of the count-min sketch used by the admission policy.
+_SKETCH_DEPTH = 2
+
+
+def _fold_to_int32(x):
+    """Fold integer ids into int32 so that hashing is identical on backends.
+
+    int64 ids are mixed down to 32 bits (high bits included) and then
+    reinterpreted as signed int32 values. Ids in the int32 range are left
+    unchanged, since backends without int64 support only receive those.
+    """
+    x = ops.convert_to_tensor(x)
+    if backend.standardize_dtype(x.dtype) != "int64":
+        return ops.cast(x, "int32")
+
+    def int64(value):
+        return ops.convert_to_tensor(value, dtype="int64")
+
+    mask = int64(0xFFFFFFFF)
+    low = ops.bitwise_and(x, mask)
+    # `high` is zero for ids that fit in int32 (shifts are arithmetic).
+    high = ops.subtract(
+        ops.right_shift(x, int64(32)), ops.right_shift(x, int64(31))
+    )
+    x = ops.bitwise_and(
+        ops.bitwise_xor(low, ops.multiply(high, int64(0x9E3779B9))), mask
+    )
+    x = ops.where(
+        ops.greater_equal(x, int64(2**31)), ops.subtract(x, int64(2**32)), x
+    )
+    return ops.cast(x, "int32")
+
+
+def _hash_int32(x, seed, num_buckets):
+    """Hash int32 `x` into `[0, num_buckets)` with the murmur3 finalizer.
+
+    Multiplications wrap around in int32 on all backends, and right shifts
+    are masked to behave as logical shifts.
+    """
+    x = ops.bitwise_xor(x, seed)
+    x = ops.bitwise_xor(x, ops.bitwise_and(ops.right_shift(x, 16), 0xFFFF))
+    x = ops.multiply(x, -2048144789)  # 0x85EBCA6B
+    x = ops.bitwise_xor(x, ops.bitwise_and(ops.right_shift(x, 13), 0x7FFFF))
+    x = ops.multiply(x, -1028477387)  # 0xC2B2AE35
+    x = ops.bitwise_xor(x, ops.bitwise_and(ops.right_shift(x, 16), 0xFFFF))
+    return ops.mod(x, num_buckets)
+
+
+@keras_export("keras.layers.HashedEmbedding")
+class HashedEmbedding(Embedding):
+    """Embedding layer for unbounded integer ids with bounded memory.
+
+    Instead of a `(vocabulary_size, output_dim)` table, this layer stores
+    `num_tables` small tables of `num_buckets` rows each, so that the memory
+    does not depend on the size of the id space. Each id is mapped to one row
+    of each table and the selected rows are combined with `combiner`. Two ids
+    only share an embedding if they collide in every table.
+
+    Two strategies are available to map ids to rows:
+
+    - `"multi_hash"`: `num_hashes` independent hash functions, one per table.
+    - `"quotient_remainder"`: two complementary partitions of the id space,
+        `id % num_buckets` and `(id // num_buckets) % num_buckets`. All ids
+        in `[0, num_buckets ** 2)` get a unique pair of rows.
+
+    Optionally, a frequency-based admission policy only gives ids their own
+    embedding once they have been seen `admission_threshold` times during
+    training. Frequencies are estimated with a count-min sketch of
+    `admission_sketch_size` columns, so the memory used by the policy is also
+    bounded. Ids that are not admitted yet are embedded as zeros.
+
+    Example:
+
+    >>> layer = keras.layers.HashedEmbedding(num_buckets=1000, output_dim=8)
+    >>> ids = np.array([[3, 14159265358], [27182818284, 3]])
+    >>> layer(ids).shape
+    (2, 2, 8)
+
+    Args:
+        num_buckets: Integer. Number of rows of each embedding table.
+        output_dim: Integer. Dimension of the dense embedding.
+        strategy: String, `"multi_hash"` or `"quotient_remainder"`. How ids
+            are mapped to rows of the tables. Defaults to `"multi_hash"`.
+        num_hashes: Integer. Number of hash functions, and thus of tables,
+            when `strategy="multi_hash"`. Defaults to `2`.
+        combiner: String, `"sum"`, `"mean"` or `"multiply"`. How the rows
+            selected in each table are combined. Defaults to `"sum"`.
+        admission_threshold: Optional integer. If set, ids seen fewer than
+            `admission_threshold` times during training are embedded as
+            zeros.
+        admission_sketch_size: Optional integer. Number of columns of the
+            count-min sketch used to count ids when `admission_threshold` is
+            set. Defaults to `num_buckets`.
+        embeddings_initializer: Initializer for the `embeddings`
+            matrix (see `keras.initializers`).
+        embeddings_regularizer: Regularizer function applied to
+            the `embeddings` matrix (see `keras.regularizers`).
+        embeddings_constraint: Constraint function applied to
+            the `embeddings` matrix (see `keras.constraints`).
+        mask_zero: Boolean, whether or not the input value 0 is a special
+            "padding" value that should be masked out.
+        **kwargs: other keyword arguments passed to `keras.layers.Embedding`,
+            including `name`, `trainable`, `dtype` etc.
+
+    Call arguments:
+        inputs: Integer tensor of ids. Negative ids are supported.
+        training: Python boolean indicating whether the layer should behave in
+            training mode, in which case the admission counts are updated.
+
+    Input shape:
+        N-D integer tensor with shape: `(batch_size, ..., input_length)`.
+
+    Output shape:
+        (N+1)-D tensor with shape: `(batch_size, ..., input_length,
+        output_dim)`.
+
+    References:
+    - [Shi et al., 2020](https://arxiv.org/abs/1909.02107)
+    - [Svenstrup et al., 2017](https://arxiv.org/abs/1709.03933)
+    """
+
+    def __init__(
+        self,
+        num_buckets,
+        output_dim,
+        strategy="multi_hash",
+        num_hashes=2,
+        combiner="sum",
+        admission_threshold=None,
+        admission_sketch_size=None,
+        embeddings_initializer="uniform",
+        embeddings_regularizer=None,
+        embeddings_constraint=None,
+        mask_zero=False,
+        **kwargs,
+    ):
+        if strategy not in ("multi_hash", "quotient_remainder"):
+            raise ValueError(
+                "`strategy` must be one of 'multi_hash' or "
+                f"'quotient_remainder'. Received: strategy={strategy}"
+            )
+        if combiner not in ("sum", "mean", "multiply"):
+            raise ValueError(
+                "`combiner` must be one of 'sum', 'mean' or 'multiply'. "
+                f"Received: combiner={combiner}"
+            )
+        if not isinstance(num_buckets, int) or num_buckets < 1:
+            raise ValueError(
+                "`num_buckets` must be a positive integer. "
+                f"Received: num_buckets={num_buckets}"
+            )
+        if not isinstance(num_hashes, int) or num_hashes < 1:
+            raise ValueError(
+                "`num_hashes` must be a positive integer. "
+                f"Received: num_hashes={num_hashes}"
+            )
+        if admission_threshold is not None and admission_threshold < 1:
+            raise ValueError(
+                "`admission_threshold` must be a positive integer or `None`. "
+                f"Received: admission_threshold={admission_threshold}"
+            )
+        self.num_buckets = num_buckets
+        self.strategy = strategy
+        self.num_hashes = num_hashes
+        self.combiner = combiner
+        self.admission_threshold = admission_threshold
+        self.admission_sketch_size = admission_sketch_size or num_buckets
+        if strategy == "multi_hash":
+            self.num_tables = num_hashes
+        else:
+            self.num_tables = 2
+        super().__init__(
+            input_dim=self.num_tables * num_buckets,
+            output_dim=output_dim,
+            embeddings_initializer=embeddings_initializer,
+            embeddings_regularizer=embeddings_regularizer,
+            embeddings_constraint=embeddings_constraint,
+            mask_zero=mask_zero,
+            **kwargs,
+        )
+
+    def build(self, input_shape=None):
+        if self.built:
+            return
+        if self.admission_threshold is not None:
+            self.admission_counts = self.add_weight(
+                shape=(_SKETCH_DEPTH, self.admission_sketch_size),
+                initializer="zeros",
+                dtype="int32",
+                name="admission_counts",
+                trainable=False,
+            )
+        super().build(input_shape)
+
+    def call(self, inputs, training=None):
+        inputs = ops.convert_to_tensor(inputs)
+        if backend.standardize_dtype(inputs.dtype) not in ("int32", "int64"):
+            inputs = ops.cast(inputs, "int32")
+        outputs = ops.take(
+            self.embeddings, self.compute_bucket_indices(inputs), axis=0
+        )
+        if self.combiner == "sum":
+            outputs = ops.sum(outputs, axis=-2)
+        elif self.combiner == "mean":
+            outputs = ops.mean(outputs, axis=-2)
+        else:
+            outputs = ops.prod(outputs, axis=-2)
+        outputs = ops.cast(outputs, dtype=self.compute_dtype)
+        if self.admission_threshold is not None:
+            admitted = self._update_and_check_admission(inputs, training)
+            outputs = ops.multiply(
+                outputs,
+                ops.expand_dims(ops.cast(admitted, self.compute_dtype), -1),
+            )
+        return outputs
+
+    def compute_bucket_indices(self, inputs):
+        """Returns the rows of the stacked tables selected for each id.
+
+        Args:
+            inputs: Integer tensor of ids.
+
+        Returns:
+            An int32 tensor of shape `inputs.shape + (num_tables,)`, indexing
+            into the first axis of `embeddings`.
+        """
+        inputs = ops.convert_to_tensor(inputs)
+        if self.strategy == "quotient_remainder":
+            # Use `floor_divide`/`mod` on the original dtype so that int64
+            # ids are partitioned exactly.
+            remainder = ops.mod(inputs, self.num_buckets)
+            quotient = ops.mod(
+                ops.floor_divide(inputs, self.num_buckets), self.num_buckets
+            )
+            indices = [
+                ops.cast(remainder, "int32"),
+                ops.cast(quotient, "int32"),
+            ]
+        else:
+            folded = _fold_to_int32(inputs)
+            indices = [
+                _hash_int32(folded, _TABLE_SEED_OFFSET + i, self.num_buckets)
+                for i in range(self.num_hashes)
+            ]
+        indices = [
+            ops.add(index, i * self.num_buckets)
+            for i, index in enumerate(indices)
+        ]
+        return ops.stack(indices, axis=-1)
+
+    def _update_and_check_admission(self, inputs, training):
+        folded = _fold_to_int32(inputs)
+        sketch_indices = ops.stack(
+            [
+                ops.add(
+                    _hash_int32(
+                        folded,
+                        _SKETCH_SEED_OFFSET + i,
+                        self.admission_sketch_size,
+                    ),
+                    i * self.admission_sketch_size,
+                )
+                for i in range(_SKETCH_DEPTH)
+            ],
+            axis=-1,
+        )
+        counts = ops.reshape(self.admission_counts, (-1,))
+        if training:
+            flat_indices = ops.reshape(sketch_indices, (-1,))
+            increments = ops.segment_sum(
+                ops.ones_like(flat_indices),
+                flat_indices,
+                num_segments=_SKETCH_DEPTH * self.admission_sketch_size,
+            )
+            # Saturate at the threshold: larger counts carry no information
+            # and this prevents overflows.
+            counts = ops.minimum(
+                ops.add(counts, increments), self.admission_threshold
+            )
+            self.admission_counts.assign(
+                ops.reshape(counts, self.admission_counts.shape)
+            )
+        frequencies = ops.min(ops.take(counts, sketch_indices, axis=0), -1)
+        return ops.greater_equal(frequencies, self.admission_threshold)
+
+    @property
+    def variable_serialization_spec(self):
+        spec = super().variable_serialization_spec
+        if self.admission_threshold is not None:
+            spec[None] = spec[None] + ["admission_counts"]
+        return spec
+
+    def get_config(self):
+        config = super().get_config()
+        config.pop("input_dim")
+        config.update(
+            {
+                "num_buckets": self.num_buckets,
+                "strategy": self.strategy,
+                "num_hashes": self.num_hashes,
+                "combiner": self.combiner,
+                "admission_threshold": self.admission_threshold,
+                "admission_sketch_size": self.admission_sketch_size,
+            }
+        )
+        return config
@@ -0,0 +1,188 @@
+import os
+
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import saving
+from keras.src.testing import test_case
+
+
+class HashedEmbeddingTest(test_case.TestCase):
+    @parameterized.named_parameters(
+        ("multi_hash", "multi_hash", "sum"),
+        ("quotient_remainder", "quotient_remainder", "multiply"),
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_hashed_embedding_basics(self, strategy, combiner):
+        self.run_layer_test(
+            layers.HashedEmbedding,
+            {
+                "num_buckets": 7,
+                "output_dim": 4,
+                "strategy": strategy,
+                "combiner": combiner,
+            },
+            input_shape=(2, 3),
+            input_dtype="int32",
+            expected_output_shape=(2, 3, 4),
+            expected_num_trainable_weights=1,
+            expected_num_non_trainable_weights=0,
+            expected_num_seed_generators=0,
+            expected_num_losses=0,
+            supports_masking=False,
+        )
+        self.run_layer_test(
+            layers.HashedEmbedding,
+            {
+                "num_buckets": 7,
+                "output_dim": 4,
+                "strategy": strategy,
+                "admission_threshold": 2,
+                "mask_zero": True,
+            },
+            input_shape=(2, 3),
+            input_dtype="int64",
+            expected_output_shape=(2, 3, 4),
+            expected_num_trainable_weights=1,
+            expected_num_non_trainable_weights=1,
+            expected_num_seed_generators=0,
+            expected_num_losses=0,
+            supports_masking=True,
+        )
+
+    def test_table_size(self):
+        layer = layers.HashedEmbedding(num_buckets=10, output_dim=2)
+        layer.build()
+        self.assertEqual(layer.embeddings.shape, (20, 2))
+        layer = layers.HashedEmbedding(
+            num_buckets=10, output_dim=2, num_hashes=3
+        )
+        layer.build()
+        self.assertEqual(layer.embeddings.shape, (30, 2))
+
+    def test_multi_hash_bucket_indices(self):
+        layer = layers.HashedEmbedding(
+            num_buckets=16, output_dim=2, num_hashes=3
+        )
+        inputs = np.arange(-500, 500, dtype="int32")
+        indices = backend.convert_to_numpy(layer.compute_bucket_indices(inputs))
+        self.assertEqual(indices.shape, (1000, 3))
+        for i in range(3):
+            self.assertTrue(np.all(indices[:, i] >= i * 16))
+            self.assertTrue(np.all(indices[:, i] < (i + 1) * 16))
+        # Hashing is deterministic and the hash functions are independent.
+        self.assertAllClose(
+            indices,
+            backend.convert_to_numpy(layer.compute_bucket_indices(inputs)),
+        )
+        # With independent hashes, ~887 of the 16 ** 3 combinations are
+        # expected to be used by 1000 ids.
+        self.assertGreater(len(set(map(tuple, indices.tolist()))), 800)
+
+    def test_quotient_remainder_bucket_indices(self):
+        layer = layers.HashedEmbedding(
+            num_buckets=8, output_dim=2, strategy="quotient_remainder"
+        )
+        inputs = np.arange(64, dtype="int32")
+        indices = backend.convert_to_numpy(layer.compute_bucket_indices(inputs))
+        self.assertAllClose(indices[:, 0], inputs % 8)
+        self.assertAllClose(indices[:, 1], inputs // 8 + 8)
+        # All ids in `[0, num_buckets ** 2)` get a unique pair of rows.
+        self.assertLen(set(map(tuple, indices.tolist())), 64)
+
+    @pytest.mark.skipif(
+        backend.backend() not in ("tensorflow", "torch"),
+        reason="Backend does not support int64 inputs.",
+    )
+    def test_int64_inputs(self):
+        layer = layers.HashedEmbedding(num_buckets=1000, output_dim=2)
+        small = np.array([3, -3], dtype="int64")
+        large = np.array([2**40 + 3, 2**40 + 4], dtype="int64")
+        # Ids in the int32 range hash the same as int32 inputs.
+        self.assertAllClose(
+            layer.compute_bucket_indices(small),
+            layer.compute_bucket_indices(small.astype("int32")),
+        )
+        # High bits are not discarded.
+        self.assertNotAllClose(
+            layer.compute_bucket_indices(large),
+            layer.compute_bucket_indices(large - 2**40),
+        )
+
+    def test_combiner(self):
+        inputs = np.array([[1, 2], [3, 4]])
+        outputs = {}
+        for combiner in ("sum", "mean", "multiply"):
+            layer = layers.HashedEmbedding(
+                num_buckets=5,
+                output_dim=3,
+                combiner=combiner,
+                embeddings_initializer="ones",
+            )
+            outputs[combiner] = layer(inputs)
+        self.assertAllClose(outputs["sum"], 2 * np.ones((2, 2, 3)))
+        self.assertAllClose(outputs["mean"], np.ones((2, 2, 3)))
+        self.assertAllClose(outputs["multiply"], np.ones((2, 2, 3)))
+
+    def test_admission(self):
+        layer = layers.HashedEmbedding(
+            num_buckets=100,
+            output_dim=2,
+            admission_threshold=2,
+            embeddings_initializer="ones",
+        )
+        inputs = np.array([1, 2, 3])
+
+        # Ids are not counted at inference.
+        self.assertAllClose(layer(inputs), np.zeros((3, 2)))
+        self.assertAllClose(layer(inputs), np.zeros((3, 2)))
+
+        # First occurrence during training: not admitted yet.
+        outputs = layer(np.array([1, 2, 1]), training=True)
+        self.assertAllClose(outputs, [[2, 2], [0, 0], [2, 2]])
+        self.assertAllClose(layer(inputs), [[2, 2], [0, 0], [0, 0]])
+
+        layer(np.array([2]), training=True)
+        self.assertAllClose(layer(inputs), [[2, 2], [2, 2], [0, 0]])
+
+        # Counts saturate at the threshold.
+        layer(np.array([1] * 10), training=True)
+        self.assertLessEqual(int(ops.max(layer.admission_counts)), 2)
+
+    @pytest.mark.requires_trainable_backend
+    def test_save_load_with_admission(self):
+        model = models.Sequential(
+            [
+                layers.Input(shape=(3,), dtype="int32"),
+                layers.HashedEmbedding(
+                    num_buckets=50, output_dim=4, admission_threshold=1
+                ),
+            ]
+        )
+        model.layers[0](np.array([[1, 2, 3]]), training=True)
+        temp_filepath = os.path.join(self.get_temp_dir(), "model.keras")
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(
+            new_model.layers[0].admission_counts,
+            model.layers[0].admission_counts,
+        )
+        x = np.array([[1, 2, 4]])
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, "`strategy` must be"):
+            layers.HashedEmbedding(10, 2, strategy="unknown")
+        with self.assertRaisesRegex(ValueError, "`combiner` must be"):
+            layers.HashedEmbedding(10, 2, combiner="max")
+        with self.assertRaisesRegex(ValueError, "`num_buckets` must be"):
+            layers.HashedEmbedding(0, 2)
+        with self.assertRaisesRegex(ValueError, "`num_hashes` must be"):
+            layers.HashedEmbedding(10, 2, num_hashes=0)
+        with self.assertRaisesRegex(ValueError, "`admission_threshold` must"):
+            layers.HashedEmbedding(10, 2, admission_threshold=0)
@@ -66,6 +66,9 @@ else:
         f"Backend '{backend.backend()}' must implement a layer mixin class."
     )
 
+# Marks that `Layer._get_autocast_scope()` doesn't enter a scope.
+_NO_SCOPE = object()
+
 
 @keras_export(["keras.Layer", "keras.layers.Layer"])
 class Layer(BackendLayer, Operation):
@@ -325,6 +328,10 @@ class Layer(BackendLayer, Operation):
             arg: (arg in self.call_signature_parameters)
             for arg in self._call_context_args
         }
+        # `CallPlan`s of the steady-state calls, by keyword argument names.
+        self._call_plans = {}
+        # Last decision of `_get_autocast_scope()`, with what it depends on.
+        self._autocast_scope_cache = None
 
         self._supports_masking = not utils.is_default(self.compute_mask)
         # Whether to automatically convert (+ auto-cast) inputs to `call()`.
@@ -833,39 +840,60 @@ class Layer(BackendLayer, Operation):
         original_args = args
         original_kwargs = kwargs
 
-        #############################################################
-        # 1. Convert any array arguments to tensors of correct dtype.
-        def maybe_convert(x):
-            return self.dtype_policy.convert_input(
-                x, self.autocast, self.input_dtype
-            )
+        # Steady-state calls, with a single tensor and context arguments
+        # like `training`, reuse the binding of their first call.
+        plan_key = self._get_call_plan_key(args, kwargs)
+        plan = self._call_plans.get(plan_key) if plan_key is not None else None
+        if plan is not None:
+            x = args[0]
+            if (
+                self._convert_input_args
+                and backend.standardize_dtype(x.dtype) != self.input_dtype
+            ):
+                x = self.dtype_policy.convert_input(
+                    x, self.autocast, self.input_dtype
+                )
+                args = (x,) + args[1:]
+            call_spec = plan.bind(x, kwargs)
+        else:
+            #############################################################
+            # 1. Convert any array arguments to tensors of correct dtype.
+            def maybe_convert(x):
+                return self.dtype_policy.convert_input(
+                    x, self.autocast, self.input_dtype
+                )
 
-        # Used to avoid expensive `tree` operations in the most common case.
-        if (
-            kwargs
-            or len(args) != 1
-            or not is_backend_tensor_or_symbolic(args[0], allow_none=False)
-            or backend.standardize_dtype(args[0].dtype) != self.input_dtype
-        ) and self._convert_input_args:
-            args = tree.map_structure(maybe_convert, args)
-            kwargs = tree.map_structure(maybe_convert, kwargs)
-
-        ##########################################################
-        # 2. Enforce that only tensors can be passed positionally.
-        if not self._allow_non_tensor_positional_args:
-            for arg in tree.flatten(args):
-                if not is_backend_tensor_or_symbolic(arg, allow_none=True):
-                    raise ValueError(
-                        "Only input tensors may be passed as "
-                        "positional arguments. The following argument value "
-                        f"should be passed as a keyword argument: {arg} "
-                        f"(of type {type(arg)})"
-                    )
+            # Used to avoid expensive `tree` operations in the most common case.
+            if (
+                kwargs
+                or len(args) != 1
+                or not is_backend_tensor_or_symbolic(args[0], allow_none=False)
+                or backend.standardize_dtype(args[0].dtype) != self.input_dtype
+            ) and self._convert_input_args:
+                args = tree.map_structure(maybe_convert, args)
+                kwargs = tree.map_structure(maybe_convert, kwargs)
+
+            ##########################################################
+            # 2. Enforce that only tensors can be passed positionally.
+            if not self._allow_non_tensor_positional_args:
+                for arg in tree.flatten(args):
+                    if not is_backend_tensor_or_symbolic(arg, allow_none=True):
+                        raise ValueError(
+                            "Only input tensors may be passed as "
+                            "positional arguments. The following argument "
+                            "value should be passed as a keyword argument: "
+                            f"{arg} "
+                            f"(of type {type(arg)})"
+                        )
 
-        # Caches info about `call()` signature, args, kwargs.
-        call_spec = CallSpec(
-            self._call_signature, self._call_context_args, args, kwargs
-        )
+            # Caches info about `call()` signature, args, kwargs.
+            call_spec = CallSpec(
+                self._call_signature, self._call_context_args, args, kwargs
+            )
+            if plan_key is not None and plan_key not in self._call_plans:
+                self._call_plans[plan_key] = CallPlan.from_call_spec(
+                    call_spec, self._call_signature, plan_key
+                )
 
         ############################################
         # 3. Check input spec for 1st positional arg.
@@ -874,8 +902,9 @@ class Layer(BackendLayer, Operation):
 
         ################
         # 4. Call build
-        with self._open_name_scope():
-            self._maybe_build(call_spec)
+        if not self.built:
+            with self._open_name_scope():
+                self._maybe_build(call_spec)
 
         ##########################
         # 5. Infer training value
@@ -896,7 +925,11 @@ class Layer(BackendLayer, Operation):
 
         ##############################
         # 6. Populate mask argument(s)
-        if len(call_spec.tensor_arguments_dict) == 1:
+        if plan is not None:
+            previous_mask = backend.get_keras_mask(call_spec.first_arg)
+            if plan.populate_mask:
+                kwargs["mask"] = previous_mask
+        elif len(call_spec.tensor_arguments_dict) == 1:
             if (
                 "mask" in call_spec.argument_names
                 and call_spec.arguments_dict["mask"] is None
@@ -918,7 +951,10 @@ class Layer(BackendLayer, Operation):
 
         # We need to cache the `previous_mask` before `__call__` because the
         # mask might be removed during the call, such as `MultiHeadAttention`.
-        if "mask" in kwargs and kwargs["mask"] is not None:
+        if plan is not None:
+            # The first argument is the only tensor, its mask was read in 6.
+            pass
+        elif "mask" in kwargs and kwargs["mask"] is not None:
             # Case 1: Mask was explicitly passed or auto-populated in step 6.
             previous_mask = kwargs["mask"]
         else:
@@ -931,21 +967,7 @@ class Layer(BackendLayer, Operation):
         # 7. Call the layer.
         try:
             with self._open_name_scope():
-                current_scope = backend.get_autocast_scope()
-                new_scope = None
-                if current_scope is not None:
-                    # Clear or update the current scope if necessary.
-                    if not self.autocast:
-                        new_scope = backend.AutocastScope(None)
-                    elif not backend.is_float_dtype(self.compute_dtype):
-                        # Some preprocessing layers might have a non-float
-                        # dtype, we should not autocast in this case.
-                        new_scope = backend.AutocastScope(None)
-                    elif current_scope.dtype != self.compute_dtype:
-                        new_scope = backend.AutocastScope(self.compute_dtype)
-                elif self.compute_dtype != self.variable_dtype:
-                    # Enter a new scope if our dtypes are "mixed".
-                    new_scope = backend.AutocastScope(self.compute_dtype)
+                new_scope = self._get_autocast_scope()
                 if new_scope is not None:
                     with new_scope:
                         outputs = super().__call__(*args, **kwargs)
@@ -992,7 +1014,9 @@ class Layer(BackendLayer, Operation):
 
         ################################################
         # 8. Add a node in the graph for symbolic calls.
-        if any_symbolic_tensors(original_args, original_kwargs):
+        if plan is None and any_symbolic_tensors(
+            original_args, original_kwargs
+        ):
             Node(
                 operation=self,
                 call_args=original_args,
@@ -1005,6 +1029,55 @@ class Layer(BackendLayer, Operation):
     def call(self, *args, **kwargs):
         raise self._not_implemented_error(self.call)
 
+    def _get_call_plan_key(self, args, kwargs):
+        """Returns the key of the `CallPlan` of a call, if it can have one.
+
+        Only calls with a single positional tensor, and context arguments
+        (like `training`) with Python scalar values as keyword arguments, use
+        a `CallPlan`. Their key is the names of the keyword arguments.
+        """
+        if len(args) != 1 or not backend.is_tensor(args[0]):
+            return None
+        for name, value in kwargs.items():
+            if name not in self._call_context_args or not (
+                value is None or isinstance(value, (bool, int, float, str))
+            ):
+                return None
+        return tuple(kwargs)
+
+    def _get_autocast_scope(self):
+        """Returns the `AutocastScope` to enter to call the layer, if any."""
+        current_scope = backend.get_autocast_scope()
+        current_dtype = (
+            current_scope.dtype if current_scope is not None else _NO_SCOPE
+        )
+        cache = self._autocast_scope_cache
+        if not (
+            cache is not None
+            and cache[0] is self.dtype_policy
+            and cache[1] == self.autocast
+            and cache[2] == current_dtype
+        ):
+            new_dtype = _NO_SCOPE
+            if current_scope is not None:
+                # Clear or update the current scope if necessary.
+                if not self.autocast:
+                    new_dtype = None
+                elif not backend.is_float_dtype(self.compute_dtype):
+                    # Some preprocessing layers might have a non-float
+                    # dtype, we should not autocast in this case.
+                    new_dtype = None
+                elif current_scope.dtype != self.compute_dtype:
+                    new_dtype = self.compute_dtype
+            elif self.compute_dtype != self.variable_dtype:
+                # Enter a new scope if our dtypes are "mixed".
+                new_dtype = self.compute_dtype
+            cache = (self.dtype_policy, self.autocast, current_dtype, new_dtype)
+            self._autocast_scope_cache = cache
+        if cache[3] is _NO_SCOPE:
+            return None
+        return backend.AutocastScope(cache[3])
+
     def _resolve_and_populate_arg(
         self, arg_name, call_spec, call_context, kwargs
     ):
@@ -1564,12 +1637,17 @@ class Layer(BackendLayer, Operation):
                 self._initialize_tracker()
             value = self._tracker.track(value)
 
-        # NNX-specific bypass for `_called` and `built` attributes
+        # NNX-specific bypass for `_called`, `built` and the call caches
         # bypass nnx.Module.__setattr__ which cannot be called while tracing
         if (
             backend.backend() == "jax"
             and is_nnx_enabled()
-            and (name == "_called" or name == "built")
+            and name
+            in (
+                "_called",
+                "built",
+                "_autocast_scope_cache",
+            )
         ):
             object.__setattr__(self, name, value)
             return
@@ -1885,6 +1963,68 @@ class CallSpec:
             self.eager = False
 
 
+class CallPlan:
+    """The binding of the arguments of calls with the same structure.
+
+    Created from the `CallSpec` of a call with a single positional tensor and
+    context arguments (like `training`) as keyword arguments, it binds the
+    following calls with the same keyword arguments without inspecting the
+    `call()` signature again.
+    """
+
+    def __init__(self, call_spec, signature, kwarg_names):
+        self.first_arg_name = call_spec.argument_names[0]
+        self.argument_names = call_spec.argument_names
+        # The other arguments take their default values.
+        self.arguments_dict = dict(call_spec.arguments_dict)
+        self.kwarg_names = kwarg_names
+        self.bound_kwarg_names = tuple(
+            name for name in kwarg_names if name in signature.parameters
+        )
+        self.populate_mask = (
+            "mask" in self.arguments_dict
+            and self.arguments_dict["mask"] is None
+        )
+
+    @classmethod
+    def from_call_spec(cls, call_spec, signature, kwarg_names):
+        """Returns the `CallPlan` of a call, or `None` if it can't have one."""
+        if call_spec.tensor_arguments_names != [call_spec.argument_names[0]]:
+            # Some default values are tensors.
+            return None
+        if "mask" in kwarg_names:
+            return None
+        return cls(call_spec, signature, kwarg_names)
+
+    def bind(self, first_arg, kwargs):
+        """Returns the `CallSpec` of a call.
+
+        Like `CallSpec`, it removes from `kwargs` the context arguments that
+        aren't in the `call()` signature.
+        """
+        arguments_dict = self.arguments_dict.copy()
+        arguments_dict[self.first_arg_name] = first_arg
+        user_arguments_dict = {}
+        for name in self.kwarg_names:
+            if name in self.bound_kwarg_names:
+                user_arguments_dict[name] = kwargs[name]
+                arguments_dict[name] = kwargs[name]
+            else:
+                user_arguments_dict[name] = kwargs.pop(name)
+        user_arguments_dict[self.first_arg_name] = first_arg
+
+        call_spec = CallSpec.__new__(CallSpec)
+        call_spec.user_arguments_dict = user_arguments_dict
+        call_spec.arguments_dict = arguments_dict
+        call_spec.argument_names = self.argument_names
+        call_spec.tensor_arguments_dict = {self.first_arg_name: first_arg}
+        call_spec.tensor_arguments_names = [self.first_arg_name]
+        call_spec.nested_tensor_argument_names = []
+        call_spec.first_arg = first_arg
+        call_spec.eager = True
+        return call_spec
+
+
 def get_arguments_dict(fn, args, kwargs):
     """Return a dict mapping argument names to their values."""
     sig = inspect.signature(fn)
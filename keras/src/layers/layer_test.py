@@ -15,6 +15,7 @@ from keras.src import ops
 from keras.src import testing
 from keras.src.backend.common import global_state
 from keras.src.backend.common.remat import RematScope
+from keras.src.layers import layer as layer_lib
 from keras.src.models import Model
 from keras.src.utils import traceback_utils
 
@@ -693,6 +694,68 @@ class LayerTest(testing.TestCase):
         backend.backend() == "torch",
         reason="Some torch ops not implemented for float16 on CPU.",
     )
+    def test_call_plan(self):
+        class ArgsLayer(layers.Layer):
+            def __init__(self):
+                super().__init__()
+                self.calls = []
+
+            def call(self, x, training=None, mask=None, scale=2.0):
+                self.calls.append((training, mask, scale))
+                return x * scale
+
+        layer = ArgsLayer()
+        x = ops.ones((2, 3))
+        self.assertAllClose(layer(x), 2 * np.ones((2, 3)))
+        self.assertAllClose(layer(x, training=True), 2 * np.ones((2, 3)))
+        self.assertEqual(set(layer._call_plans.keys()), {(), ("training",)})
+
+        # The steady-state calls don't bind their arguments again.
+        with mock.patch.object(
+            layer_lib.CallSpec, "__init__", side_effect=AssertionError
+        ):
+            self.assertAllClose(layer(x), 2 * np.ones((2, 3)))
+            layer(x, training=False)
+            layer(x, training=True)
+        self.assertEqual(
+            layer.calls[2:],
+            [(None, None, 2.0), (False, None, 2.0), (True, None, 2.0)],
+        )
+
+        # Other calls are bound as usual.
+        self.assertAllClose(layer(x, scale=3.0), 3 * np.ones((2, 3)))
+        self.assertEqual(layer.calls[-1], (None, None, 3.0))
+        self.assertEqual(set(layer._call_plans.keys()), {(), ("training",)})
+
+        # The `training` value of the outer call is propagated.
+        class OuterLayer(layers.Layer):
+            def __init__(self):
+                super().__init__()
+                self.inner = ArgsLayer()
+
+            def call(self, x):
+                return self.inner(x)
+
+        layer = OuterLayer()
+        layer(x, training=True)
+        layer(x, training=True)
+        layer(x)
+        self.assertEqual(
+            [training for training, _, _ in layer.inner.calls[-3:]],
+            [True, True, None],
+        )
+
+    @pytest.mark.skipif(
+        backend.backend() == "torch",
+        reason="Some torch ops not implemented for float16 on CPU.",
+    )
+    def test_call_plan_casts_inputs(self):
+        layer = layers.Dense(2, dtype="mixed_float16")
+        x = ops.ones((4, 4), dtype="float32")
+        for _ in range(3):
+            self.assertDType(layer(x), "float16")
+        self.assertEqual(set(layer._call_plans.keys()), {()})
+
     def test_mixed_precision(self):
         x = np.ones((4, 4))
 
@@ -400,3 +400,30 @@ class GRUTest(testing.TestCase):
             tpu_atol=1e-3,
             tpu_rtol=1e-3,
         )
+
+    @parameterized.product(
+        return_sequences=[True, False],
+        go_backwards=[True, False],
+        reset_after=[True, False],
+        use_bias=[True, False],
+    )
+    def test_fused_matches_generic_loop(
+        self, return_sequences, go_backwards, reset_after, use_bias
+    ):
+        sequence = np.random.random((3, 5, 4)).astype("float32")
+        kwargs = {
+            "return_sequences": return_sequences,
+            "return_state": True,
+            "go_backwards": go_backwards,
+            "reset_after": reset_after,
+            "use_bias": use_bias,
+            "bias_initializer": "random_normal",
+        }
+        fused_layer = layers.GRU(6, use_cudnn="auto", **kwargs)
+        generic_layer = layers.GRU(6, use_cudnn=False, **kwargs)
+        fused_outputs = fused_layer(sequence)
+        generic_layer.build(sequence.shape)
+        generic_layer.set_weights(fused_layer.get_weights())
+        generic_outputs = generic_layer(sequence)
+        for fused, generic in zip(fused_outputs, generic_outputs):
+            self.assertAllClose(fused, generic, atol=1e-5)
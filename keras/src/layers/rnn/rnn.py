@@ -327,6 +327,55 @@ class RNN(Layer):
             for v in self.states:
                 v.assign(ops.zeros_like(v.value))
 
+    def get_initial_stream_state(self, batch_size):
+        """Returns the state of `batch_size` new streams for `stream_step()`.
+
+        Unlike `stateful=True`, stream states are plain tensors that are
+        passed explicitly, so streams can be batched together in any
+        combination from one call to the next.
+        """
+        if self.go_backwards:
+            raise ValueError(
+                "A `RNN` layer with `go_backwards=True` cannot be used for "
+                f"streaming inference. Received layer '{self.name}'."
+            )
+        return self.get_initial_state(batch_size)
+
+    def stream_step(self, sequences, stream_state):
+        """Processes the next timesteps of a batch of streams.
+
+        Running the layer on consecutive chunks of a sequence with
+        `stream_step()` gives the same outputs as running it once on the full
+        sequence, at a cost proportional to the chunk length.
+
+        Args:
+            sequences: Tensor of the next timesteps of each stream, with shape
+                `(batch_size, chunk_length, ...)`.
+            stream_state: The state returned by the previous call, or by
+                `get_initial_stream_state()` for new streams.
+
+        Returns:
+            A tuple `(outputs, new_stream_state)`, where `outputs` is what the
+            layer returns for the chunk, without the states.
+        """
+        initial_state = tree.map_structure(
+            lambda x: backend.convert_to_tensor(
+                x, dtype=self.cell.compute_dtype
+            ),
+            list(stream_state),
+        )
+        last_output, outputs, states = self.inner_loop(
+            sequences=sequences,
+            initial_state=initial_state,
+            mask=None,
+            training=False,
+        )
+        output = outputs if self.return_sequences else last_output
+        states = tree.map_structure(
+            lambda x: ops.cast(x, dtype=self.compute_dtype), states
+        )
+        return ops.cast(output, self.compute_dtype), list(states)
+
     def inner_loop(self, sequences, initial_state, mask, training=False):
         cell_kwargs = {}
         if isinstance(self.cell, Layer) and self.cell._call_has_training_arg:
@@ -9,7 +9,11 @@ from keras.src import utils
 from keras.src.api_export import keras_export
 from keras.src.layers.layer import Layer
 from keras.src.models.variable_mapping import map_saveable_variables
+from keras.src.quantizers.calibration import calibrate_static_activations
 from keras.src.quantizers.gptq_core import gptq_quantize
+from keras.src.quantizers.quantization_config import (
+    StaticInt8QuantizationConfig,
+)
 from keras.src.quantizers.utils import should_quantize_layer
 from keras.src.saving import saving_api
 from keras.src.trainers import trainer as base_trainer
@@ -515,6 +519,18 @@ class Model(Trainer, base_trainer.Trainer, Layer):
         # Quantize with custom config
         model.quantize(config=config)
         ```
+
+        Quantize a model to int8 with activation scales calibrated on
+        representative data, instead of computed in every call:
+
+        ```python
+        from keras.quantizers import StaticInt8QuantizationConfig
+
+        config = StaticInt8QuantizationConfig(
+            dataset=x_calibration, observer="percentile"
+        )
+        model.quantize(config=config)
+        ```
         """
         # Validate inputs.
         type_check = kwargs.pop("type_check", True)
@@ -532,6 +548,13 @@ class Model(Trainer, base_trainer.Trainer, Layer):
                     f"{type(filters)}"
                 )
 
+        layer_configs = {}
+        if isinstance(config, StaticInt8QuantizationConfig):
+            # Calibrate the activation scales on the float model.
+            layer_configs = calibrate_static_activations(
+                self, config, filters=filters
+            )
+
         graph_modified = False
         for layer in self._flatten_layers():
             # Apply filters
@@ -539,8 +562,11 @@ class Model(Trainer, base_trainer.Trainer, Layer):
                 continue
 
             if len(list(layer._flatten_layers())) == 1:
+                layer_config = layer_configs.get(id(layer), config)
                 try:
-                    layer.quantize(mode, type_check=type_check, config=config)
+                    layer.quantize(
+                        mode, type_check=type_check, config=layer_config
+                    )
                     graph_modified = True
                 except NotImplementedError as e:
                     warnings.warn(str(e))
@@ -573,6 +599,7 @@ class Model(Trainer, base_trainer.Trainer, Layer):
             self.train_function = None
             self.test_function = None
             self.predict_function = None
+            self.predict_on_tensors_function = None
             self._post_quantize(mode, **kwargs)
 
     def _post_quantize(self, mode, **kwargs):
@@ -0,0 +1,258 @@
+import collections
+import contextlib
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.layers import Bidirectional
+from keras.src.models.functional import Functional
+from keras.src.models.functional import unpack_singleton
+from keras.src.models.sequential import Sequential
+
+
+@keras_export("keras.models.StreamingModel")
+class StreamingModel:
+    """Runs a sequence model incrementally on streams of frames.
+
+    Streaming audio or sensor data arrives in chunks of a few frames. Instead
+    of re-running the model on overlapping windows, `StreamingModel` keeps a
+    state per stream for each layer that carries information across time:
+
+    - `RNN` layers (`LSTM`, `GRU`, ...) keep their hidden states.
+    - `Conv1D` layers with `padding="causal"` keep their last
+        `dilation_rate * (kernel_size - 1)` input frames.
+
+    Each chunk thus only costs work proportional to its length, and the
+    outputs for consecutive chunks are the same as the outputs of the model
+    for the full sequence. All other layers are applied to each chunk
+    independently, so they must process frames independently (e.g. `Dense`,
+    `LayerNormalization` or activations).
+
+    Any layer implementing `get_initial_stream_state(batch_size)` and
+    `stream_step(inputs, stream_state)` is streamed the same way.
+
+    There are two ways to use it:
+
+    - `step(inputs, state)` is a pure function: states are explicit tensors
+        with the batch as their first axis, which can be stored, batched and
+        split freely by a serving system.
+    - `process(chunks)` manages the states of any number of streams, and
+        runs the chunks of several streams in one batched call.
+
+    Example:
+
+    ```python
+    model = keras.Sequential(
+        [
+            keras.Input((None, 40)),
+            keras.layers.Conv1D(64, 5, padding="causal", activation="relu"),
+            keras.layers.GRU(64, return_sequences=True),
+            keras.layers.Dense(10),
+        ]
+    )
+    streaming_model = keras.models.StreamingModel(model)
+
+    # Each call takes the next chunk of frames of some of the streams.
+    outputs = streaming_model.process(
+        {"user_1": np.random.rand(20, 40), "user_2": np.random.rand(20, 40)}
+    )
+    outputs["user_1"].shape  # (20, 10)
+    outputs = streaming_model.process({"user_1": np.random.rand(20, 40)})
+    streaming_model.close_stream("user_2")
+    ```
+
+    Args:
+        model: A built `Sequential` or functional model processing sequences
+            of shape `(batch_size, timesteps, ...)`. Nested models are
+            supported. Shared layers (called more than once in the model)
+            cannot have a stream state.
+    """
+
+    def __init__(self, model):
+        if not isinstance(model, (Sequential, Functional)):
+            raise ValueError(
+                "`StreamingModel` only supports `Sequential` and functional "
+                f"models. Received: model={model}"
+            )
+        if not model.built:
+            raise ValueError(
+                "The model must be built before streaming. Add an `Input` to "
+                "your model or call it on a batch of data first."
+            )
+        self.model = model
+        self._streams = {}
+        # Validate the model early.
+        _get_initial_state(model, 1)
+
+    def get_initial_state(self, batch_size):
+        """Returns the states of `batch_size` new streams.
+
+        Args:
+            batch_size: Integer, the number of streams.
+
+        Returns:
+            A dict mapping layer names to the stream state of each stateful
+            layer.
+        """
+        return _get_initial_state(self.model, batch_size)
+
+    def step(self, inputs, state):
+        """Processes the next chunk of frames of a batch of streams.
+
+        Args:
+            inputs: The next frames of each stream, with shape
+                `(batch_size, chunk_length, ...)`, or a structure of such
+                tensors for models with several inputs.
+            state: The state returned by the previous call, or by
+                `get_initial_state()` for new streams.
+
+        Returns:
+            A tuple `(outputs, new_state)`.
+        """
+        return _stream_step(self.model, inputs, state)
+
+    @property
+    def stream_ids(self):
+        """The ids of the open streams."""
+        return list(self._streams.keys())
+
+    def open_stream(self, stream_id):
+        """Starts a new stream, or restarts an existing stream."""
+        self._streams[stream_id] = self.get_initial_state(1)
+
+    def close_stream(self, stream_id):
+        """Releases the state of a stream."""
+        self._streams.pop(stream_id)
+
+    def process(self, chunks):
+        """Processes the next chunk of frames of several streams at once.
+
+        The chunks are batched, so that a single call of the model serves all
+        streams. Streams that are not open yet are opened.
+
+        Args:
+            chunks: A dict mapping stream ids to the next frames of each
+                stream, of shape `(chunk_length, ...)` without batch axis.
+                All chunks must have the same shape.
+
+        Returns:
+            A dict mapping stream ids to the outputs of each stream, without
+            batch axis.
+        """
+        stream_ids = list(chunks.keys())
+        if not stream_ids:
+            return {}
+        for stream_id in stream_ids:
+            if stream_id not in self._streams:
+                self.open_stream(stream_id)
+
+        shapes = {
+            tuple(tuple(ops.shape(x)) for x in tree.flatten(chunk))
+            for chunk in chunks.values()
+        }
+        if len(shapes) > 1:
+            raise ValueError(
+                "All chunks passed to `process()` must have the same shape. "
+                f"Received chunks with shapes: {sorted(shapes)}"
+            )
+        inputs = tree.map_structure(
+            lambda *xs: ops.stack(xs), *[chunks[i] for i in stream_ids]
+        )
+        state = tree.map_structure(
+            lambda *xs: ops.concatenate(xs, axis=0),
+            *[self._streams[i] for i in stream_ids],
+        )
+        outputs, state = self.step(inputs, state)
+
+        results = {}
+        for index, stream_id in enumerate(stream_ids):
+            self._streams[stream_id] = tree.map_structure(
+                lambda x: x[index : index + 1], state
+            )
+            results[stream_id] = tree.map_structure(lambda x: x[index], outputs)
+        return results
+
+
+def _get_initial_state(layer, batch_size):
+    if isinstance(layer, (Sequential, Functional)):
+        num_calls = collections.Counter()
+        if isinstance(layer, Functional):
+            for nodes in layer._nodes_by_depth.values():
+                num_calls.update(id(node.operation) for node in nodes)
+        state = {}
+        for sublayer in layer.layers:
+            sublayer_state = _get_initial_state(sublayer, batch_size)
+            if sublayer_state is None or (
+                isinstance(sublayer_state, dict) and not sublayer_state
+            ):
+                continue
+            if num_calls[id(sublayer)] > 1:
+                raise ValueError(
+                    f"Layer '{sublayer.name}' is called more than once in the "
+                    "model and has a stream state, which is not supported "
+                    "for streaming inference."
+                )
+            state[sublayer.name] = sublayer_state
+        return state
+    if isinstance(layer, Bidirectional):
+        raise ValueError(
+            "A `Bidirectional` layer needs the full sequence and cannot be "
+            f"used for streaming inference. Received layer '{layer.name}'."
+        )
+    if hasattr(layer, "get_initial_stream_state"):
+        return layer.get_initial_stream_state(batch_size)
+    return None
+
+
+def _stream_step(layer, inputs, state):
+    if isinstance(layer, Sequential):
+        new_state = {}
+        outputs = inputs
+        for sublayer in layer.layers:
+            if sublayer.name in state:
+                outputs, new_state[sublayer.name] = _stream_step(
+                    sublayer, outputs, state[sublayer.name]
+                )
+            else:
+                outputs = sublayer(outputs)
+        return outputs, new_state
+
+    if isinstance(layer, Functional):
+        new_state = {}
+
+        def operation_fn(operation):
+            if operation.name not in state:
+                return operation
+
+            def call(inputs, *args, **kwargs):
+                outputs, new_state[operation.name] = _stream_step(
+                    operation, inputs, state[operation.name]
+                )
+                return outputs
+
+            return call
+
+        outputs = layer._run_through_graph(
+            layer._standardize_inputs(inputs), operation_fn=operation_fn
+        )
+        return unpack_singleton(outputs), new_state
+
+    inputs = tree.map_structure(
+        lambda x: backend.convert_to_tensor(x, dtype=layer.compute_dtype),
+        inputs,
+    )
+    with _autocast_scope(layer):
+        return layer.stream_step(inputs, state)
+
+
+def _autocast_scope(layer):
+    # `stream_step()` bypasses `Layer.__call__()`, so we enter the autocast
+    # scope it would use for mixed precision layers.
+    if (
+        layer.autocast
+        and backend.is_float_dtype(layer.compute_dtype)
+        and layer.compute_dtype != layer.variable_dtype
+    ):
+        return backend.AutocastScope(layer.compute_dtype)
+    return contextlib.nullcontext()
@@ -0,0 +1,137 @@
+import numpy as np
+from absl.testing import parameterized
+
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import testing
+from keras.src.models.streaming import StreamingModel
+
+
+def get_sequential_model():
+    return models.Sequential(
+        [
+            layers.Input((None, 3)),
+            layers.Conv1D(4, 3, padding="causal", activation="relu"),
+            layers.Conv1D(4, 2, padding="causal", dilation_rate=2),
+            layers.LSTM(5, return_sequences=True),
+            layers.Dense(2),
+        ]
+    )
+
+
+def get_functional_model():
+    inputs = layers.Input((None, 3))
+    x = layers.Conv1D(4, 3, padding="causal")(inputs)
+    y = layers.GRU(4, return_sequences=True)(x)
+    y = layers.SimpleRNN(4, return_sequences=True)(y)
+    z = layers.Conv1D(4, 1)(inputs)
+    outputs = layers.Add()([y, z])
+    outputs = models.Sequential(
+        [layers.Conv1D(2, 2, padding="causal"), layers.Dense(2)]
+    )(outputs)
+    return models.Model(inputs, outputs)
+
+
+def run_in_chunks(streaming_model, sequences, chunk_length):
+    state = streaming_model.get_initial_state(len(sequences))
+    outputs = []
+    for start in range(0, sequences.shape[1], chunk_length):
+        chunk = sequences[:, start : start + chunk_length]
+        chunk_outputs, state = streaming_model.step(chunk, state)
+        outputs.append(ops.convert_to_numpy(chunk_outputs))
+    return np.concatenate(outputs, axis=1)
+
+
+class StreamingModelTest(testing.TestCase):
+    @parameterized.named_parameters(
+        ("sequential", get_sequential_model),
+        ("functional", get_functional_model),
+    )
+    def test_chunks_match_full_sequence(self, model_fn):
+        model = model_fn()
+        sequences = np.random.random((2, 12, 3)).astype("float32")
+        expected = model.predict(sequences, verbose=0)
+        streaming_model = StreamingModel(model)
+        for chunk_length in (1, 4, 5):
+            self.assertAllClose(
+                run_in_chunks(streaming_model, sequences, chunk_length),
+                expected,
+                atol=1e-5,
+            )
+
+    def test_initial_state(self):
+        model = get_sequential_model()
+        state = StreamingModel(model).get_initial_state(3)
+        conv_1, conv_2, lstm = (layer.name for layer in model.layers[:3])
+        self.assertEqual(set(state.keys()), {conv_1, conv_2, lstm})
+        self.assertEqual(state[conv_1].shape, (3, 2, 3))
+        # `dilation_rate * (kernel_size - 1)` frames.
+        self.assertEqual(state[conv_2].shape, (3, 2, 4))
+        self.assertEqual([s.shape for s in state[lstm]], [(3, 5), (3, 5)])
+
+    def test_process_multiplexes_streams(self):
+        model = get_sequential_model()
+        streaming_model = StreamingModel(model)
+        sequences = {
+            "a": np.random.random((8, 3)).astype("float32"),
+            "b": np.random.random((8, 3)).astype("float32"),
+            "c": np.random.random((4, 3)).astype("float32"),
+        }
+        outputs = {"a": [], "b": [], "c": []}
+        # Streams join, interleave and leave in arbitrary order.
+        for step_ids in (["a"], ["b", "a"], ["c", "b"], ["b", "a", "c"]):
+            results = streaming_model.process(
+                {i: sequences[i][len(outputs[i]) * 2 :][:2] for i in step_ids}
+            )
+            for i in step_ids:
+                outputs[i].append(ops.convert_to_numpy(results[i]))
+        self.assertEqual(set(streaming_model.stream_ids), {"a", "b", "c"})
+
+        for i, chunks in outputs.items():
+            num_frames = 2 * len(chunks)
+            expected = model.predict(sequences[i][None, :num_frames], verbose=0)
+            self.assertAllClose(np.concatenate(chunks), expected[0], atol=1e-5)
+
+        streaming_model.close_stream("a")
+        self.assertEqual(set(streaming_model.stream_ids), {"b", "c"})
+        # Reopening a stream resets it.
+        streaming_model.open_stream("b")
+        results = streaming_model.process({"b": sequences["b"][:2]})
+        self.assertAllClose(
+            results["b"], np.concatenate(outputs["b"])[:2], atol=1e-5
+        )
+
+    def test_errors(self):
+        streaming_model = StreamingModel(get_sequential_model())
+        with self.assertRaisesRegex(ValueError, "same shape"):
+            streaming_model.process(
+                {"a": np.zeros((2, 3)), "b": np.zeros((3, 3))}
+            )
+        with self.assertRaisesRegex(ValueError, "padding='causal'"):
+            StreamingModel(
+                models.Sequential(
+                    [layers.Input((None, 3)), layers.Conv1D(2, 3)]
+                )
+            )
+        with self.assertRaisesRegex(ValueError, "go_backwards"):
+            StreamingModel(
+                models.Sequential(
+                    [layers.Input((None, 3)), layers.GRU(2, go_backwards=True)]
+                )
+            )
+        with self.assertRaisesRegex(ValueError, "Bidirectional"):
+            StreamingModel(
+                models.Sequential(
+                    [
+                        layers.Input((None, 3)),
+                        layers.Bidirectional(layers.GRU(2)),
+                    ]
+                )
+            )
+        inputs = layers.Input((None, 3))
+        shared = layers.GRU(3, return_sequences=True)
+        with self.assertRaisesRegex(ValueError, "more than once"):
+            StreamingModel(models.Model(inputs, shared(shared(inputs))))
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            StreamingModel(models.Sequential([layers.Dense(2)]))
@@ -58,7 +58,8 @@ class Function(Operation):
         self._inputs_struct = tree.map_structure(lambda x: x, inputs)
         self._outputs_struct = tree.map_structure(lambda x: x, outputs)
         self._inputs = tree.flatten(inputs)
-        self._outputs = tree.flatten(outputs)
+        # The definition of the outputs packs the outputs of each call.
+        self._outputs, self._outputs_def = tree.flatten_with_cached_def(outputs)
         if not self._inputs:
             raise ValueError(
                 "`inputs` argument cannot be empty. Received:\n"
@@ -137,9 +138,12 @@ class Function(Operation):
                 shortcut = False
                 break
         if shortcut:
-            return tree.map_structure(
-                lambda x: KerasTensor(shape=x.shape, dtype=x.dtype),
-                self._outputs_struct,
+            return tree.unflatten(
+                self._outputs_def,
+                [
+                    KerasTensor(shape=x.shape, dtype=x.dtype)
+                    for x in self._outputs
+                ],
             )
         # No luck; take the long road through the graph.
         # Original Keras used a cache to avoid recomputing all this
@@ -213,7 +217,7 @@ class Function(Operation):
         for x in self.outputs:
             output_tensors.append(tensor_dict[id(x)])
 
-        return tree.pack_sequence_as(self._outputs_struct, output_tensors)
+        return tree.unflatten(self._outputs_def, output_tensors)
 
     def _assert_input_compatibility(self, inputs):
         try:
@@ -24,6 +24,16 @@ class Adagrad(optimizer.Optimizer):
         initial_accumulator_value: Floating point value. Starting value for the
             accumulators (per-parameter momentum values). Must be non-negative.
         epsilon: Small floating point value for maintaining numerical stability.
+        lazy_updates: Boolean. If `True`, row-wise sparse gradients (such as
+            the gradients of an `Embedding` table with the TensorFlow
+            backend, or `jax.experimental.sparse.BCOO` gradients passed to
+            `apply()` with the JAX backend) only update the rows of the
+            variable and of the accumulator that appear in the gradient. The
+            result is the same as with a dense update, but the cost of an
+            update scales with the size of the batch instead of the size of
+            the variable. Dense gradients, such as the gradients of an
+            `Embedding` table with the JAX backend, are not affected.
+            Defaults to `False`.
         {{base_optimizer_keyword_args}}
 
     Reference:
@@ -37,6 +47,7 @@ class Adagrad(optimizer.Optimizer):
         learning_rate=0.001,
         initial_accumulator_value=0.1,
         epsilon=1e-7,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -65,6 +76,7 @@ class Adagrad(optimizer.Optimizer):
         )
         self.initial_accumulator_value = initial_accumulator_value
         self.epsilon = epsilon
+        self.lazy_updates = lazy_updates
 
     def build(self, var_list):
         if self.built:
@@ -77,6 +89,13 @@ class Adagrad(optimizer.Optimizer):
 
     def update_step(self, gradient, variable, learning_rate):
         """Update step given gradient and the associated model variable."""
+        if self.lazy_updates:
+            sparse_gradient = self._sparse_gradient_rows(gradient)
+            if sparse_gradient is not None:
+                return self._lazy_update_step(
+                    *sparse_gradient, variable, learning_rate
+                )
+
         lr = ops.cast(learning_rate, variable.dtype)
         gradient = ops.cast(gradient, variable.dtype)
 
@@ -91,6 +110,29 @@ class Adagrad(optimizer.Optimizer):
             ),
         )
 
+    def _lazy_update_step(self, indices, values, variable, learning_rate):
+        """Update only the rows `indices` of the variable and accumulator."""
+        lr = ops.cast(learning_rate, variable.dtype)
+        values = ops.cast(values, variable.dtype)
+
+        accumulator = self._accumulators[self._get_variable_index(variable)]
+
+        accumulator_rows = ops.add(
+            ops.take(accumulator, indices, axis=0), ops.square(values)
+        )
+        self._assign_rows(accumulator, indices, accumulator_rows)
+        self._assign_rows(
+            variable,
+            indices,
+            ops.subtract(
+                ops.take(variable, indices, axis=0),
+                ops.divide(
+                    ops.multiply(lr, values),
+                    ops.sqrt(ops.add(accumulator_rows, self.epsilon)),
+                ),
+            ),
+        )
+
     def get_config(self):
         config = super().get_config()
 
@@ -98,6 +140,7 @@ class Adagrad(optimizer.Optimizer):
             {
                 "initial_accumulator_value": self.initial_accumulator_value,
                 "epsilon": self.epsilon,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
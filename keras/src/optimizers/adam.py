@@ -37,6 +37,16 @@ class Adam(optimizer.Optimizer):
         amsgrad: Boolean. Whether to apply AMSGrad variant of this algorithm
             from the paper "On the Convergence of Adam and beyond". Defaults
             to `False`.
+        lazy_updates: Boolean. If `True`, row-wise sparse gradients (such as
+            the gradients of an `Embedding` table with the TensorFlow
+            backend, or `jax.experimental.sparse.BCOO` gradients passed to
+            `apply()` with the JAX backend) only update the rows of the
+            variable and of the moment estimates that appear in the gradient.
+            This reduces the cost of an update from the size of the variable
+            to the size of the batch, but the moments of the other rows do
+            not decay ("lazy Adam"). Dense gradients, such as the gradients
+            of an `Embedding` table with the JAX backend, are not affected.
+            Defaults to `False`.
         {{base_optimizer_keyword_args}}
     """
 
@@ -47,6 +57,7 @@ class Adam(optimizer.Optimizer):
         beta_2=0.999,
         epsilon=1e-7,
         amsgrad=False,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -77,6 +88,7 @@ class Adam(optimizer.Optimizer):
         self.beta_2 = beta_2
         self.epsilon = epsilon
         self.amsgrad = amsgrad
+        self.lazy_updates = lazy_updates
 
     def build(self, var_list):
         """Initialize optimizer variables.
@@ -101,6 +113,13 @@ class Adam(optimizer.Optimizer):
 
     def update_step(self, gradient, variable, learning_rate):
         """Update step given gradient and the associated model variable."""
+        if self.lazy_updates:
+            sparse_gradient = self._sparse_gradient_rows(gradient)
+            if sparse_gradient is not None:
+                return self._lazy_update_step(
+                    *sparse_gradient, variable, learning_rate
+                )
+
         lr = ops.cast(learning_rate, variable.dtype)
         gradient = ops.cast(gradient, variable.dtype)
         local_step = ops.cast(self.iterations + 1, variable.dtype)
@@ -136,6 +155,49 @@ class Adam(optimizer.Optimizer):
             ),
         )
 
+    def _lazy_update_step(self, indices, values, variable, learning_rate):
+        """Update only the rows `indices` of the variable and its moments."""
+        lr = ops.cast(learning_rate, variable.dtype)
+        values = ops.cast(values, variable.dtype)
+        local_step = ops.cast(self.iterations + 1, variable.dtype)
+        beta_1_power = ops.power(
+            ops.cast(self.beta_1, variable.dtype), local_step
+        )
+        beta_2_power = ops.power(
+            ops.cast(self.beta_2, variable.dtype), local_step
+        )
+
+        m = self._momentums[self._get_variable_index(variable)]
+        v = self._velocities[self._get_variable_index(variable)]
+
+        alpha = lr * ops.sqrt(1 - beta_2_power) / (1 - beta_1_power)
+
+        m_rows = ops.take(m, indices, axis=0)
+        m_rows = ops.add(
+            m_rows, ops.multiply(ops.subtract(values, m_rows), 1 - self.beta_1)
+        )
+        v_rows = ops.take(v, indices, axis=0)
+        v_rows = ops.add(
+            v_rows,
+            ops.multiply(
+                ops.subtract(ops.square(values), v_rows), 1 - self.beta_2
+            ),
+        )
+        self._assign_rows(m, indices, m_rows)
+        self._assign_rows(v, indices, v_rows)
+        if self.amsgrad:
+            v_hat = self._velocity_hats[self._get_variable_index(variable)]
+            v_rows = ops.maximum(ops.take(v_hat, indices, axis=0), v_rows)
+            self._assign_rows(v_hat, indices, v_rows)
+        variable_rows = ops.subtract(
+            ops.take(variable, indices, axis=0),
+            ops.divide(
+                ops.multiply(m_rows, alpha),
+                ops.add(ops.sqrt(v_rows), self.epsilon),
+            ),
+        )
+        self._assign_rows(variable, indices, variable_rows)
+
     def get_config(self):
         config = super().get_config()
         config.update(
@@ -144,6 +206,7 @@ class Adam(optimizer.Optimizer):
                 "beta_2": self.beta_2,
                 "epsilon": self.epsilon,
                 "amsgrad": self.amsgrad,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
@@ -4,6 +4,7 @@ import warnings
 from keras.src import backend
 from keras.src import initializers
 from keras.src import ops
+from keras.src.distribution import distribution_lib
 from keras.src.optimizers.schedules import learning_rate_schedule
 from keras.src.saving import serialization_lib
 from keras.src.saving.keras_saveable import KerasSaveable
@@ -316,12 +317,20 @@ class BaseOptimizer(KerasSaveable):
                 str(reference_variable.name).replace("/", "_").replace(":", "_")
             )
             name = f"{sanitised_ref_name}_{name}"
+        layout = getattr(reference_variable, "_layout", None)
+        distribution = distribution_lib.distribution()
+        if distribution is not None:
+            tensor_layout = distribution.get_optimizer_variable_layout(
+                reference_variable
+            )
+            if tensor_layout is not None:
+                layout = tensor_layout.backend_layout
         return self.add_variable(
             shape=reference_variable.shape,
             initializer=initializer,
             dtype=reference_variable.dtype,
             name=name,
-            layout=getattr(reference_variable, "_layout", None),
+            layout=layout,
         )
 
     def add_optimizer_variables(
@@ -454,6 +463,37 @@ class BaseOptimizer(KerasSaveable):
         """
         variable.assign_sub(value)
 
+    def _sparse_gradient_rows(self, gradient):
+        """Decompose a row-wise sparse gradient into `(indices, values)`.
+
+        Row-wise sparse gradients are typically produced by `Embedding`
+        lookups. Backends that support sparse gradients override this method.
+        The returned `indices` are unique so that they can be used for
+        scatter updates; `values` contains the summed gradient for each row.
+
+        Args:
+            gradient: The gradient to decompose.
+
+        Returns:
+            A tuple `(indices, values)`, or `None` if `gradient` is dense or
+            cannot be represented row-wise.
+        """
+        return None
+
+    def _assign_rows(self, variable, indices, values):
+        """Overwrite the rows `indices` of `variable` with `values`.
+
+        Args:
+            variable: The variable to update.
+            indices: 1D tensor of row indices, as returned by
+                `_sparse_gradient_rows`.
+            values: The new values of the rows.
+        """
+        self.assign(
+            variable,
+            ops.scatter_update(variable, ops.expand_dims(indices, -1), values),
+        )
+
     def update_step(self, gradient, variable, learning_rate):
         raise NotImplementedError
 
@@ -522,6 +562,8 @@ class BaseOptimizer(KerasSaveable):
                 if scale is not None:
                     grads = [g if g is None else g / scale for g in grads]
 
+                grads = self._distribute_gradients(grads, trainable_variables)
+
                 # Apply gradient updates.
                 self._backend_apply_gradients(grads, trainable_variables)
                 # Apply variable constraints after applying gradients.
@@ -532,6 +574,19 @@ class BaseOptimizer(KerasSaveable):
         # Update iteration counter.
         self._iterations.assign_add(1)
 
+    def _distribute_gradients(self, grads, trainable_variables):
+        """Apply the gradient layouts of the current distribution, if any."""
+        distribution = distribution_lib.distribution()
+        if distribution is None:
+            return grads
+        distributed_grads = []
+        for grad, variable in zip(grads, trainable_variables):
+            layout = distribution.get_gradient_layout(variable)
+            if layout is not None:
+                grad = distribution_lib.distribute_tensor(grad, layout)
+            distributed_grads.append(grad)
+        return distributed_grads
+
     def _backend_apply_gradients(self, grads, trainable_variables):
         """Apply method that can be overridden by different backends.
 
@@ -72,6 +72,16 @@ class Ftrl(optimizer.Optimizer):
             on the active weights.
         beta: A float value, representing the beta value from the paper.
             Defaults to `0.0`.
+        lazy_updates: Boolean. If `True`, row-wise sparse gradients (such as
+            the gradients of an `Embedding` table with the TensorFlow
+            backend, or `jax.experimental.sparse.BCOO` gradients passed to
+            `apply()` with the JAX backend) only update the rows of the
+            variable, accumulator and linear slot that appear in the
+            gradient. This reduces the cost of an update from the size of the
+            variable to the size of the batch. Shrinkage is then only applied
+            to the active rows. Dense gradients, such as the gradients of an
+            `Embedding` table with the JAX backend, are not affected.
+            Defaults to `False`.
         {{base_optimizer_keyword_args}}
     """
 
@@ -84,6 +94,7 @@ class Ftrl(optimizer.Optimizer):
         l2_regularization_strength=0.0,
         l2_shrinkage_regularization_strength=0.0,
         beta=0.0,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -149,6 +160,7 @@ class Ftrl(optimizer.Optimizer):
             l2_shrinkage_regularization_strength
         )
         self.beta = beta
+        self.lazy_updates = lazy_updates
 
     def build(self, var_list):
         """Initialize optimizer variables.
@@ -170,6 +182,12 @@ class Ftrl(optimizer.Optimizer):
 
     def update_step(self, gradient, variable, learning_rate):
         """Update step given gradient and the associated model variable."""
+        if self.lazy_updates:
+            sparse_gradient = self._sparse_gradient_rows(gradient)
+            if sparse_gradient is not None:
+                return self._lazy_update_step(
+                    *sparse_gradient, variable, learning_rate
+                )
 
         lr = ops.cast(learning_rate, variable.dtype)
         gradient = ops.cast(gradient, variable.dtype)
@@ -218,6 +236,59 @@ class Ftrl(optimizer.Optimizer):
         )
         self.assign(accum, new_accum)
 
+    def _lazy_update_step(self, indices, values, variable, learning_rate):
+        """Update only the rows `indices` of the variable and its slots."""
+        lr = ops.cast(learning_rate, variable.dtype)
+        values = ops.cast(values, variable.dtype)
+
+        accum = self._accumulators[self._get_variable_index(variable)]
+        linear = self._linears[self._get_variable_index(variable)]
+
+        lr_power = self.learning_rate_power
+        l2_reg = self.l2_regularization_strength
+        l2_reg = l2_reg + self.beta / (2.0 * lr)
+
+        variable_rows = ops.take(variable, indices, axis=0)
+        accum_rows = ops.take(accum, indices, axis=0)
+        grad_to_use = ops.add(
+            values,
+            ops.multiply(
+                2 * self.l2_shrinkage_regularization_strength, variable_rows
+            ),
+        )
+        new_accum_rows = ops.add(accum_rows, ops.square(values))
+        linear_rows = ops.add(
+            ops.take(linear, indices, axis=0),
+            ops.subtract(
+                grad_to_use,
+                ops.multiply(
+                    ops.divide(
+                        ops.subtract(
+                            ops.power(new_accum_rows, -lr_power),
+                            ops.power(accum_rows, -lr_power),
+                        ),
+                        lr,
+                    ),
+                    variable_rows,
+                ),
+            ),
+        )
+        quadratic = ops.add(
+            ops.divide(ops.power(new_accum_rows, (-lr_power)), lr), 2 * l2_reg
+        )
+        linear_clipped = ops.clip(
+            linear_rows,
+            -self.l1_regularization_strength,
+            self.l1_regularization_strength,
+        )
+        self._assign_rows(linear, indices, linear_rows)
+        self._assign_rows(
+            variable,
+            indices,
+            ops.divide(ops.subtract(linear_clipped, linear_rows), quadratic),
+        )
+        self._assign_rows(accum, indices, new_accum_rows)
+
     def get_config(self):
         config = super().get_config()
 
@@ -229,6 +300,7 @@ class Ftrl(optimizer.Optimizer):
                 "l2_regularization_strength": self.l2_regularization_strength,
                 "l2_shrinkage_regularization_strength": self.l2_shrinkage_regularization_strength,  # noqa: E501
                 "beta": self.beta,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
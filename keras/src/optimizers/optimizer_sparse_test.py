@@ -1,9 +1,12 @@
 from unittest import mock
 
+import numpy as np
 import pytest
 from absl.testing import parameterized
 
 from keras.src import backend
+from keras.src import layers
+from keras.src import models
 from keras.src import ops
 from keras.src import optimizers
 from keras.src import testing
@@ -308,3 +311,112 @@ class OptimizerSparseTest(testing.TestCase):
                 optimizer_sparse.apply([grad_sparse], [var_sparse])
                 optimizer_dense.apply([grad_dense], [var_dense])
                 self.assertAllClose(var_sparse.value, var_dense.value)
+
+    @parameterized.named_parameters(
+        ("adagrad", optimizers.Adagrad, {}),
+        ("adam", optimizers.Adam, {}),
+        ("adam_amsgrad", optimizers.Adam, {"amsgrad": True}),
+        ("ftrl", optimizers.Ftrl, {}),
+        ("sgd", optimizers.SGD, {}),
+        ("sgd_momentum", optimizers.SGD, {"momentum": 0.05}),
+        (
+            "sgd_momentum_nesterov",
+            optimizers.SGD,
+            {"momentum": 0.05, "nesterov": True},
+        ),
+    )
+    def test_lazy_updates(self, optimizer_class, init_kwargs):
+        # This test verifies that with `lazy_updates=True`, the rows present
+        # in the sparse gradient get the same values as with a dense update
+        # while the other rows are left untouched.
+
+        optimizer_lazy = optimizer_class(lazy_updates=True, **init_kwargs)
+        optimizer_dense = optimizer_class(**init_kwargs)
+        var_lazy = backend.Variable(initializer="ones", shape=(5, 3, 2))
+        var_dense = backend.Variable(initializer="ones", shape=(5, 3, 2))
+        stateless = backend.backend() == "jax"
+        if stateless:
+            optimizer_lazy.build([var_lazy])
+            optimizer_dense.build([var_dense])
+
+        optimizer_lazy_vars = optimizer_lazy.variables
+        optimizer_dense_vars = optimizer_dense.variables
+        var_lazy_values = [var_lazy.value]
+        var_dense_values = [var_dense.value]
+
+        for i in range(5):
+            # Row 2 appears twice and must be accumulated.
+            values = ops.ones((4, 3, 2)) * (10.0 - i)
+            if backend.backend() == "tensorflow":
+                import tensorflow as tf
+
+                grad_sparse = tf.IndexedSlices(
+                    values=values, indices=(0, 2, 4, 2), dense_shape=(5, 3, 2)
+                )
+            elif backend.backend() == "jax":
+                import jax.experimental.sparse as jax_sparse
+
+                grad_sparse = jax_sparse.BCOO(
+                    (values, ((0,), (2,), (4,), (2,))), shape=(5, 3, 2)
+                )
+            else:
+                self.fail(
+                    f"Sparse is unsupported with backend {backend.backend()}"
+                )
+
+            grad_dense = ops.convert_to_tensor(
+                backend.convert_to_numpy(grad_sparse)
+            )
+            if stateless:
+                (
+                    var_lazy_values,
+                    optimizer_lazy_vars,
+                ) = optimizer_lazy.stateless_apply(
+                    optimizer_lazy_vars, [grad_sparse], var_lazy_values
+                )
+                (
+                    var_dense_values,
+                    optimizer_dense_vars,
+                ) = optimizer_dense.stateless_apply(
+                    optimizer_dense_vars, [grad_dense], var_dense_values
+                )
+                lazy_value = var_lazy_values[0]
+                dense_value = var_dense_values[0]
+            else:
+                optimizer_lazy.apply([grad_sparse], [var_lazy])
+                optimizer_dense.apply([grad_dense], [var_dense])
+                lazy_value = var_lazy.value
+                dense_value = var_dense.value
+
+            touched = (0, 2, 4)
+            untouched = (1, 3)
+            self.assertAllClose(
+                ops.take(lazy_value, touched, axis=0),
+                ops.take(dense_value, touched, axis=0),
+            )
+            self.assertAllClose(
+                ops.take(lazy_value, untouched, axis=0), ops.ones((2, 3, 2))
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow",
+        reason="Only the `Embedding` gradients of TensorFlow are sparse.",
+    )
+    def test_lazy_updates_embedding_fit(self):
+        optimizer = optimizers.Adam(lazy_updates=True)
+        model = models.Sequential(
+            [layers.Embedding(100, 4), layers.Flatten(), layers.Dense(1)]
+        )
+        model.compile(optimizer=optimizer, loss="mse")
+        x = np.random.randint(0, 100, size=(8, 3))
+        y = np.ones((8, 1))
+        with mock.patch.object(
+            optimizer,
+            "_lazy_update_step",
+            wraps=optimizer._lazy_update_step,
+        ) as lazy_update_step:
+            model.fit(x, y, batch_size=4, verbose=0)
+        # Only the embedding table gets the lazy update.
+        lazy_update_step.assert_called()
+        for call in lazy_update_step.call_args_list:
+            self.assertEqual(tuple(call.args[2].shape), (100, 4))
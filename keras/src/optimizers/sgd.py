@@ -37,6 +37,16 @@ class SGD(optimizer.Optimizer):
             gradient descent. Defaults to `0.0`.
         nesterov: boolean. Whether to apply Nesterov momentum.
             Defaults to `False`.
+        lazy_updates: Boolean. If `True`, row-wise sparse gradients (such as
+            the gradients of an `Embedding` table with the TensorFlow
+            backend, or `jax.experimental.sparse.BCOO` gradients passed to
+            `apply()` with the JAX backend) only update the rows of the
+            variable and of the momentum that appear in the gradient. This
+            reduces the cost of an update from the size of the variable to
+            the size of the batch, but the momentum of the other rows does
+            not decay. Dense gradients, such as the gradients of an
+            `Embedding` table with the JAX backend, are not affected.
+            Defaults to `False`.
         {{base_optimizer_keyword_args}}
     """
 
@@ -45,6 +55,7 @@ class SGD(optimizer.Optimizer):
         learning_rate=0.01,
         momentum=0.0,
         nesterov=False,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -75,6 +86,7 @@ class SGD(optimizer.Optimizer):
             raise ValueError("`momentum` must be a float between [0, 1].")
         self.momentum = momentum
         self.nesterov = nesterov
+        self.lazy_updates = lazy_updates
 
     def build(self, variables):
         """Initialize optimizer variables.
@@ -94,6 +106,13 @@ class SGD(optimizer.Optimizer):
 
     def update_step(self, gradient, variable, learning_rate):
         """Update step given gradient and the associated model variable."""
+        if self.lazy_updates:
+            sparse_gradient = self._sparse_gradient_rows(gradient)
+            if sparse_gradient is not None:
+                return self._lazy_update_step(
+                    *sparse_gradient, variable, learning_rate
+                )
+
         learning_rate = ops.cast(learning_rate, variable.dtype)
         gradient = ops.cast(gradient, variable.dtype)
         m = None
@@ -122,12 +141,47 @@ class SGD(optimizer.Optimizer):
         else:
             self.assign_sub(variable, ops.multiply(gradient, learning_rate))
 
+    def _lazy_update_step(self, indices, values, variable, learning_rate):
+        """Update only the rows `indices` of the variable and its momentum."""
+        learning_rate = ops.cast(learning_rate, variable.dtype)
+        values = ops.cast(values, variable.dtype)
+        variable_rows = ops.take(variable, indices, axis=0)
+        if self.momentum == 0:
+            self._assign_rows(
+                variable,
+                indices,
+                ops.subtract(
+                    variable_rows, ops.multiply(values, learning_rate)
+                ),
+            )
+            return
+
+        m = self.momentums[self._get_variable_index(variable)]
+        momentum = ops.cast(self.momentum, variable.dtype)
+        m_rows = ops.subtract(
+            ops.multiply(ops.take(m, indices, axis=0), momentum),
+            ops.multiply(values, learning_rate),
+        )
+        self._assign_rows(m, indices, m_rows)
+        if self.nesterov:
+            variable_rows = ops.add(
+                variable_rows,
+                ops.subtract(
+                    ops.multiply(m_rows, momentum),
+                    ops.multiply(values, learning_rate),
+                ),
+            )
+        else:
+            variable_rows = ops.add(variable_rows, m_rows)
+        self._assign_rows(variable, indices, variable_rows)
+
     def get_config(self):
         config = super().get_config()
         config.update(
             {
                 "momentum": self.momentum,
                 "nesterov": self.nesterov,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
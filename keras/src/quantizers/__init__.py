@@ -5,8 +5,12 @@ from keras.src.quantizers.quantization_config import Float8QuantizationConfig
 from keras.src.quantizers.quantization_config import Int4QuantizationConfig
 from keras.src.quantizers.quantization_config import Int8QuantizationConfig
 from keras.src.quantizers.quantization_config import QuantizationConfig
+from keras.src.quantizers.quantization_config import (
+    StaticInt8QuantizationConfig,
+)
 from keras.src.quantizers.quantizers import AbsMaxQuantizer
 from keras.src.quantizers.quantizers import Quantizer
+from keras.src.quantizers.quantizers import StaticQuantizer
 from keras.src.quantizers.quantizers import abs_max_quantize
 from keras.src.quantizers.quantizers import compute_float8_amax_history
 from keras.src.quantizers.quantizers import compute_float8_scale
@@ -20,6 +24,7 @@ from keras.src.utils.naming import to_snake_case
 ALL_OBJECTS = {
     Quantizer,
     AbsMaxQuantizer,
+    StaticQuantizer,
     QuantizationConfig,
     Int8QuantizationConfig,
     Int4QuantizationConfig,
@@ -0,0 +1,112 @@
+"""Calibration of static activation scales for int8 quantization."""
+
+from keras.src import backend
+from keras.src.layers.convolutional.base_conv import BaseConv
+from keras.src.layers.convolutional.base_depthwise_conv import BaseDepthwiseConv
+from keras.src.layers.convolutional.base_separable_conv import BaseSeparableConv
+from keras.src.layers.core.dense import Dense
+from keras.src.layers.core.einsum_dense import EinsumDense
+from keras.src.quantizers import observers as observers_lib
+from keras.src.quantizers.quantization_config import Int8QuantizationConfig
+from keras.src.quantizers.quantizers import AbsMaxQuantizer
+from keras.src.quantizers.quantizers import StaticQuantizer
+from keras.src.quantizers.utils import should_quantize_layer
+from keras.src.trainers.data_adapters import data_adapter_utils
+from keras.src.trainers.data_adapters import get_data_adapter
+from keras.src.utils import profiling_utils
+
+CONV_LAYERS = (BaseConv, BaseDepthwiseConv, BaseSeparableConv)
+
+
+def observe_inputs(layers_map, observers):
+    """Temporarily patches the `call` method of layers to observe inputs.
+
+    Args:
+        layers_map: Dict mapping names to the layers to patch.
+        observers: Dict mapping the same names to `Observer` instances.
+    """
+    names = {id(layer): name for name, layer in layers_map.items()}
+
+    def create_hook(layer, original_call_func):
+        observer = observers[names[id(layer)]]
+
+        def hook(*args, **kwargs):
+            inputs = args[0] if args else kwargs["inputs"]
+            dtype = backend.standardize_dtype(inputs.dtype)
+            # Integer inputs (e.g. token ids) aren't quantized.
+            if backend.is_float_dtype(dtype):
+                observer.update_state(inputs)
+            return original_call_func(*args, **kwargs)
+
+        return hook
+
+    return profiling_utils.hook_calls(layers_map.values(), create_hook)
+
+
+def calibrate_static_activations(model, config, filters=None):
+    """Calibrates the activation scales of the layers of a float model.
+
+    Runs `model` on the calibration dataset of `config` and observes the
+    inputs of every layer that quantizes its inputs in int8 mode.
+
+    Args:
+        model: The float model to calibrate.
+        config: A `StaticInt8QuantizationConfig`.
+        filters: Optional filters selecting the layers to quantize, as in
+            `Model.quantize()`.
+
+    Returns:
+        A dict mapping the id of each calibrated layer to the
+        `Int8QuantizationConfig` to quantize it with. Layers which didn't
+        receive any float inputs keep a dynamic `AbsMaxQuantizer`.
+    """
+    layers_map = {}
+    observers = {}
+    for layer in model._flatten_layers():
+        if len(list(layer._flatten_layers())) != 1:
+            continue
+        if not isinstance(layer, (Dense, EinsumDense) + CONV_LAYERS):
+            continue
+        if not should_quantize_layer(layer, filters):
+            continue
+        name = str(id(layer))
+        layers_map[name] = layer
+        observers[name] = observers_lib.get(
+            config.observer, axis=_get_channel_axis(layer, config)
+        )
+
+    adapter = get_data_adapter(
+        config.dataset,
+        batch_size=config.batch_size or 32,
+        steps_per_epoch=config.num_batches,
+        shuffle=False,
+    )
+    with observe_inputs(layers_map, observers):
+        for step, data in enumerate(adapter.get_numpy_iterator()):
+            if config.num_batches is not None and step >= config.num_batches:
+                break
+            x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data)
+            model(x, training=False)
+
+    layer_configs = {}
+    for name, layer in layers_map.items():
+        observer = observers[name]
+        if observer.num_updates:
+            activation_quantizer = StaticQuantizer(observer.compute_scale())
+        else:
+            activation_quantizer = AbsMaxQuantizer()
+        layer_configs[id(layer)] = Int8QuantizationConfig(
+            weight_quantizer=config.weight_quantizer,
+            activation_quantizer=activation_quantizer,
+        )
+    return layer_configs
+
+
+def _get_channel_axis(layer, config):
+    if config.granularity == "per_tensor":
+        return None
+    if not isinstance(layer, CONV_LAYERS):
+        # A scale per channel of the contracted axis can't be factored out of
+        # the integer matmul of `Dense` and `EinsumDense`.
+        return None
+    return -1 if layer.data_format == "channels_last" else 1
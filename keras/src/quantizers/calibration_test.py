@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+from absl.testing import parameterized
+
+from keras.src import layers
+from keras.src import models
+from keras.src import saving
+from keras.src import testing
+from keras.src.quantizers.quantization_config import Int8QuantizationConfig
+from keras.src.quantizers.quantization_config import (
+    StaticInt8QuantizationConfig,
+)
+from keras.src.quantizers.quantizers import AbsMaxQuantizer
+from keras.src.quantizers.quantizers import StaticQuantizer
+
+
+def get_model():
+    inputs = layers.Input((6, 6, 3))
+    x = layers.Conv2D(8, 3, activation="relu")(inputs)
+    x = layers.Reshape((16, 8))(x)
+    x = layers.EinsumDense("abc,cd->abd", (16, 8))(x)
+    outputs = layers.Dense(4)(x)
+    return models.Model(inputs, outputs)
+
+
+class CalibrationTest(testing.TestCase):
+    @parameterized.named_parameters(
+        ("minmax", "minmax", "per_tensor"),
+        ("moving_average", "moving_average", "per_tensor"),
+        ("percentile", "percentile", "per_channel"),
+        ("mse", "mse", "per_channel"),
+    )
+    def test_static_quantization(self, observer, granularity):
+        model = get_model()
+        x = np.random.random((64, 6, 6, 3)).astype("float32")
+        y_float = model.predict(x, verbose=0)
+        config = StaticInt8QuantizationConfig(
+            x, observer=observer, granularity=granularity, batch_size=16
+        )
+        model.quantize(config=config)
+
+        conv, einsum_dense, dense = (model.layers[i] for i in (1, 3, 4))
+        for layer in (conv, einsum_dense, dense):
+            # The calibration hooks are removed from the layers.
+            self.assertNotIn("call", layer.__dict__)
+            self.assertEqual(layer.quantization_mode, "int8")
+            self.assertIsInstance(layer.inputs_quantizer, StaticQuantizer)
+            self.assertIsInstance(
+                layer.quantization_config, Int8QuantizationConfig
+            )
+        if granularity == "per_channel":
+            self.assertEqual(conv.inputs_quantizer.scale.shape, (3,))
+        else:
+            self.assertEqual(conv.inputs_quantizer.scale.shape, ())
+        # Matmul layers always use per-tensor scales.
+        self.assertEqual(dense.inputs_quantizer.scale.shape, ())
+
+        y_quantized = model.predict(x, verbose=0)
+        self.assertLess(np.mean(np.square(y_float - y_quantized)), 1e-3)
+
+        # The static scales are saved with the model.
+        temp_filepath = os.path.join(self.get_temp_dir(), "model.keras")
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertIsInstance(
+            new_model.layers[4].inputs_quantizer, StaticQuantizer
+        )
+        self.assertAllClose(new_model.predict(x, verbose=0), y_quantized)
+
+    def test_num_batches_and_filters(self):
+        model = get_model()
+        x = np.random.random((64, 6, 6, 3)).astype("float32")
+        x[32:] *= 10.0
+        reference = get_model()
+        reference.set_weights(model.get_weights())
+        config = StaticInt8QuantizationConfig(x, num_batches=2, batch_size=16)
+        model.quantize(config=config, filters="dense")
+        conv, einsum_dense, dense = (model.layers[i] for i in (1, 3, 4))
+        self.assertIsNone(conv.quantization_mode)
+        self.assertIsInstance(dense.inputs_quantizer, StaticQuantizer)
+        self.assertIsInstance(einsum_dense.inputs_quantizer, StaticQuantizer)
+
+        # Only the first 2 batches were observed.
+        reference.quantize(
+            config=StaticInt8QuantizationConfig(x[:32], batch_size=16),
+            filters="dense",
+        )
+        self.assertAllClose(
+            dense.inputs_quantizer.scale,
+            reference.layers[4].inputs_quantizer.scale,
+        )
+
+    def test_integer_inputs_keep_dynamic_quantizer(self):
+        model = models.Sequential(
+            [
+                layers.Input((4,), dtype="int32"),
+                layers.Embedding(10, 8),
+                layers.Dense(2),
+            ]
+        )
+        x = np.random.randint(0, 10, (8, 4))
+        model.quantize(config=StaticInt8QuantizationConfig(x))
+        self.assertIsInstance(model.layers[1].inputs_quantizer, StaticQuantizer)
+
+        # Layers receiving integer inputs are not calibrated.
+        model = models.Sequential(
+            [layers.Input((4,), dtype="int32"), layers.Dense(2)]
+        )
+        model.quantize(config=StaticInt8QuantizationConfig(x))
+        self.assertIsInstance(model.layers[0].inputs_quantizer, AbsMaxQuantizer)
+
+    def test_invalid_config(self):
+        with self.assertRaisesRegex(ValueError, "granularity"):
+            StaticInt8QuantizationConfig(None, granularity="per_token")
+        with self.assertRaisesRegex(ValueError, "Unknown observer"):
+            StaticInt8QuantizationConfig(None, observer="typo")
+        with self.assertRaisesRegex(ValueError, "num_batches"):
+            StaticInt8QuantizationConfig(None, num_batches=0)
@@ -343,6 +343,24 @@ class GPTQ:
                 `input_batch` does not match the dimensions of the
                 pre-initialized Hessian matrix `self.hessian`.
         """
+        gram_matrix, num_new_samples = self.compute_gram_matrix(input_batch)
+        self.update_hessian_with_gram_matrix(gram_matrix, num_new_samples)
+
+    def compute_gram_matrix(self, input_batch):
+        """Computes the Gram matrix of a batch of input activations.
+
+        This is the expensive part of `update_hessian_with_batch()`. It
+        doesn't modify the state of the object, so it can run concurrently
+        for several batches, e.g. in a thread pool.
+
+        Args:
+            input_batch: A 2D or higher-dimensional tensor of input activations
+                from a calibration batch.
+
+        Returns:
+            A tuple `(gram_matrix, num_samples)`, to pass to
+            `update_hessian_with_gram_matrix()`.
+        """
         if input_batch is None:
             raise ValueError("Input tensor cannot be None.")
 
@@ -358,10 +376,6 @@ class GPTQ:
             input_batch = ops.reshape(input_batch, (-1, input_batch.shape[-1]))
         x = ops.cast(input_batch, "float32")
 
-        num_new_samples = ops.shape(x)[0]
-        num_prev_samples = self.num_samples
-        total_samples = ops.add(num_prev_samples, num_new_samples)
-
         if ops.shape(self.hessian)[0] != ops.shape(x)[-1]:
             raise ValueError(
                 f"Hessian dimensions ({ops.shape(self.hessian)[0]}) do not "
@@ -375,6 +389,17 @@ class GPTQ:
         gram_matrix = ops.divide(
             ops.add(gram_matrix, ops.transpose(gram_matrix)), 2.0
         )
+        return gram_matrix, ops.shape(x)[0]
+
+    def update_hessian_with_gram_matrix(self, gram_matrix, num_new_samples):
+        """Adds a Gram matrix from `compute_gram_matrix()` to the Hessian.
+
+        Args:
+            gram_matrix: The Gram matrix of a batch of input activations.
+            num_new_samples: The number of samples in the batch.
+        """
+        num_prev_samples = self.num_samples
+        total_samples = ops.add(num_prev_samples, num_new_samples)
 
         # Decay previous mean and add current per-sample contribution
         # (factor 2/N)
@@ -388,7 +413,7 @@ class GPTQ:
             ops.multiply(ops.divide(2.0, total_samples), gram_matrix),
         )
 
-        self.num_samples = self.num_samples + ops.shape(x)[0] or 0
+        self.num_samples = self.num_samples + num_new_samples or 0
 
     def quantize_and_correct_layer(
         self,
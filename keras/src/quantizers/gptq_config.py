@@ -138,6 +138,15 @@ class GPTQConfig(QuantizationConfig):
             - "sequential_blocks": list of blocks to be quantized sequentially.
             If not provided, the model must implement
             `get_quantization_layer_structure`.
+        num_workers: (int, optional) The number of threads used to compute
+            the Hessians of the calibration batches while the forward passes
+            run, and to quantize the layers of a block concurrently. Defaults
+            to 1, which does everything sequentially in the calling thread.
+        offload_dir: (str, optional) A directory where the activations
+            passed from one block to the next are stored, instead of keeping
+            the activations of all calibration samples in memory. They are
+            read back one sample at a time, and deleted once the next block
+            is processed. Defaults to `None` (in memory).
     """
 
     def __init__(
@@ -154,6 +163,8 @@ class GPTQConfig(QuantizationConfig):
         symmetric: bool = False,
         activation_order: bool = False,
         quantization_layer_structure: dict = None,
+        num_workers: int = 1,
+        offload_dir: str = None,
     ):
         super().__init__()
         if weight_bits not in [2, 3, 4, 8]:
@@ -173,6 +184,11 @@ class GPTQConfig(QuantizationConfig):
                 "or a positive integer, "
                 f"but got {group_size}."
             )
+        if num_workers < 1:
+            raise ValueError(
+                "num_workers must be a positive integer. "
+                f"Received: num_workers={num_workers}"
+            )
         self.dataset = dataset
         self.tokenizer = tokenizer
         self.num_samples = num_samples
@@ -184,6 +200,8 @@ class GPTQConfig(QuantizationConfig):
         self.symmetric = symmetric
         self.activation_order = activation_order
         self.quantization_layer_structure = quantization_layer_structure
+        self.num_workers = num_workers
+        self.offload_dir = offload_dir
 
     def get_config(self):
         return {
@@ -200,6 +218,9 @@ class GPTQConfig(QuantizationConfig):
             "symmetric": self.symmetric,
             "activation_order": self.activation_order,
             "quantization_layer_structure": self.quantization_layer_structure,
+            # Like the dataset, these only affect the calibration.
+            "num_workers": 1,
+            "offload_dir": None,
         }
 
     @classmethod
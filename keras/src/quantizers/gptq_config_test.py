@@ -45,6 +45,12 @@ class TestGPTQConfig(testing.TestCase):
         with self.assertRaisesRegex(ValueError, "Invalid group_size"):
             GPTQConfig(dataset=None, tokenizer=None, group_size=-2)
 
+    def test_invalid_num_workers(self):
+        with self.assertRaisesRegex(
+            ValueError, "num_workers must be a positive"
+        ):
+            GPTQConfig(dataset=None, tokenizer=None, num_workers=0)
+
     def test_dtype_policy_string(self):
         config = GPTQConfig(
             dataset=None, tokenizer=None, weight_bits=4, group_size=64
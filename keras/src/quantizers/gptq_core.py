@@ -1,4 +1,10 @@
+import collections
 import math
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from contextlib import contextmanager
 
 import numpy as np
@@ -16,7 +22,7 @@ from keras.src.quantizers.utils import should_quantize_layer
 
 
 @contextmanager
-def stream_hessians(layers_map, gptq_objects):
+def stream_hessians(layers_map, gptq_objects, executor=None, num_workers=1):
     """
     Temporarily monkey-patch each target layer's `call` method so
     that input activations are streamed into the GPTQ instance
@@ -34,6 +40,12 @@ def stream_hessians(layers_map, gptq_objects):
     On `__exit__`: All original `layer.call` methods are restored even if an
      exception occurs.
 
+    If an `executor` is given, step 3 is split: the Gram matrix of each
+     batch is computed in the executor while the forward pass goes on, and
+     added to the Hessian in the calling thread, in the order of the calls.
+     At most `2 * num_workers` batches are in flight at a time, to
+     bound the memory used by pending activations.
+
     * Space complexity: O(d**2) per layer (for the Hessian).
     * No weights are modified; only GPTQ statistics are updated.
 
@@ -42,6 +54,9 @@ def stream_hessians(layers_map, gptq_objects):
          the Keras layers that should be patched during calibration. Keys must
          match `gptq_objects`.
         gptq_objects: Dict[str, GPTQ]. Mapping from names to GPTQ instances.
+        executor: Optional `concurrent.futures.Executor` computing the Gram
+         matrices of the batches.
+        num_workers: int. The number of workers of `executor`.
 
     Yields:
         None: The patched state is active only within the `with` block. After
@@ -58,6 +73,12 @@ def stream_hessians(layers_map, gptq_objects):
     ```
     """
     original_calls = {}
+    pending = collections.deque()
+    max_pending = 2 * num_workers if executor is not None else 0
+
+    def accumulate_oldest():
+        name, future = pending.popleft()
+        gptq_objects[name].update_hessian_with_gram_matrix(*future.result())
 
     def create_hook(name, original_call_func):
         def hook(*args, **kwargs):
@@ -69,7 +90,15 @@ def stream_hessians(layers_map, gptq_objects):
             # (e.g., 3D or 4D).
             num_features = gptq_objects[name].rows
             input_2d = ops.reshape(inp, (-1, num_features))
-            gptq_objects[name].update_hessian_with_batch(input_2d)
+            if executor is None:
+                gptq_objects[name].update_hessian_with_batch(input_2d)
+            else:
+                future = executor.submit(
+                    gptq_objects[name].compute_gram_matrix, input_2d
+                )
+                pending.append((name, future))
+                while len(pending) > max_pending:
+                    accumulate_oldest()
             return original_call_func(*args, **kwargs)
 
         return hook
@@ -79,11 +108,66 @@ def stream_hessians(layers_map, gptq_objects):
             original_calls[name] = layer.call
             layer.call = create_hook(name, layer.call)
         yield
+        while pending:
+            accumulate_oldest()
     finally:
         for name, layer in layers_map.items():
             layer.call = original_calls[name]
 
 
+class ActivationBuffer:
+    """Stores the per-sample activations passed between blocks.
+
+    By default, the activations are kept in memory. If `directory` is given,
+    each sample is written to a file in a temporary subdirectory of it, and
+    read back as a memory-mapped array, so that the activations of the whole
+    calibration set never need to fit in memory at once.
+
+    The buffer is a context manager that releases the activations on exit.
+
+    Args:
+        directory: Optional directory to store the activations in.
+    """
+
+    def __init__(self, directory=None):
+        self._samples = []
+        self._path = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._path = tempfile.mkdtemp(prefix="gptq_", dir=directory)
+
+    def append(self, sample):
+        if self._path is None:
+            self._samples.append(sample)
+            return
+        sample = ops.convert_to_numpy(sample)
+        filename = os.path.join(self._path, f"{len(self._samples)}.bin")
+        sample.tofile(filename)
+        self._samples.append((filename, sample.shape, sample.dtype))
+
+    def __getitem__(self, index):
+        if self._path is None:
+            return self._samples[index]
+        filename, shape, dtype = self._samples[index]
+        return np.memmap(filename, dtype=dtype, mode="r", shape=shape)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def close(self):
+        """Releases the stored activations."""
+        self._samples = []
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 def get_dataloader(
     tokenizer,
     sequence_length,
@@ -229,6 +313,11 @@ def apply_gptq_layerwise(dataloader, config, structure, filters=None):
         input for the next block, ensuring that quantization errors are
         accounted for throughout the model.
 
+    With `config.num_workers > 1`, the Hessian updates of step 2 and the
+    quantization of the layers of a block in step 3 run in a thread pool.
+    With `config.offload_dir`, the activations passed between blocks in step
+    4 are stored on disk instead of in memory.
+
     Args:
         dataloader: An iterable providing calibration data.
         config: A GPTQConfiguration object.
@@ -253,18 +342,55 @@ def apply_gptq_layerwise(dataloader, config, structure, filters=None):
             "No sequential blocks found in the provided structure to quantize."
         )
 
-    # Initial inputs are the outputs of the pre-block layers
-    inputs = []
-    for batch in dataloader:
-        batch = ops.convert_to_tensor(batch, dtype="int32")
-        for layer in pre_layers:
-            batch = layer(batch)
-        inputs.append(batch)
+    # The activation buffers and the executor are released even if the
+    # quantization fails, e.g. on a `KeyboardInterrupt`.
+    with ExitStack() as resources:
+        executor = None
+        if config.num_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=config.num_workers)
+            resources.callback(executor.shutdown)
+
+        # Initial inputs are the outputs of the pre-block layers
+        inputs = resources.enter_context(ActivationBuffer(config.offload_dir))
+        for batch in dataloader:
+            batch = ops.convert_to_tensor(batch, dtype="int32")
+            for layer in pre_layers:
+                batch = layer(batch)
+            inputs.append(batch)
+
+        num_samples = min(num_samples, len(inputs))
+
+        progbar = keras_utils.Progbar(target=len(transformer_blocks))
+
+        _quantize_blocks(
+            transformer_blocks,
+            inputs,
+            num_samples,
+            config,
+            filters,
+            executor,
+            progbar,
+            resources,
+        )
+
+    logging.info("Quantization process complete.")
+
 
-    num_samples = min(num_samples, len(inputs))
+def _quantize_and_free(gptq_object):
+    gptq_object.quantize_and_correct_layer()
+    gptq_object.free()
 
-    progbar = keras_utils.Progbar(target=len(transformer_blocks))
 
+def _quantize_blocks(
+    transformer_blocks,
+    inputs,
+    num_samples,
+    config,
+    filters,
+    executor,
+    progbar,
+    resources,
+):
     for block_idx, block in enumerate(transformer_blocks):
         logging.info(f"Quantizing Block {block_idx}")
         sub_layers_map = find_layers_in_block(block)
@@ -290,33 +416,41 @@ def apply_gptq_layerwise(dataloader, config, structure, filters=None):
                 for name, layer in sub_layers_map.items()
             }
 
-            with stream_hessians(sub_layers_map, gptq_objects):
+            with stream_hessians(
+                sub_layers_map, gptq_objects, executor, config.num_workers
+            ):
                 for sample_idx in range(num_samples):
                     current_input = inputs[sample_idx]
                     if len(current_input.shape) == 2:
                         current_input = ops.expand_dims(current_input, axis=0)
                     _ = block(current_input)
 
-            for name, gptq_object in gptq_objects.items():
-                logging.info(f"Quantizing {name}...")
-                gptq_object.quantize_and_correct_layer()
-                gptq_object.free()
+            logging.info(f"Quantizing {list(gptq_objects.keys())}...")
+            if executor is None:
+                for gptq_object in gptq_objects.values():
+                    _quantize_and_free(gptq_object)
+            else:
+                # The layers of a block are independent once their Hessians
+                # are computed.
+                list(executor.map(_quantize_and_free, gptq_objects.values()))
 
             del gptq_objects
 
         if block_idx < len(transformer_blocks) - 1:
             logging.info(f"Generating inputs for block {block_idx + 1}...")
-            next_block_inputs = []
+            next_block_inputs = resources.enter_context(
+                ActivationBuffer(config.offload_dir)
+            )
             for sample_idx in range(num_samples):
                 current_input = inputs[sample_idx]
                 if len(current_input.shape) == 2:
                     current_input = ops.expand_dims(current_input, axis=0)
                 output = block(current_input)[0]
                 next_block_inputs.append(output)
+            inputs.close()
             inputs = next_block_inputs
         progbar.update(current=block_idx + 1)
-
-    logging.info("Quantization process complete.")
+    inputs.close()
 
 
 def gptq_quantize(config, quantization_layer_structure, filters=None):
@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 import numpy as np
 import pytest
 from absl.testing import parameterized
@@ -6,7 +9,9 @@ from keras.src import layers
 from keras.src import models
 from keras.src import ops
 from keras.src import testing
+from keras.src.quantizers import gptq_core
 from keras.src.quantizers.gptq_config import GPTQConfig
+from keras.src.quantizers.gptq_core import ActivationBuffer
 from keras.src.quantizers.gptq_core import get_dataloader
 from keras.src.quantizers.gptq_core import gptq_quantize
 
@@ -284,6 +289,109 @@ class TestGPTQCore(testing.TestCase):
         )
         model.quantize("gptq", config=config)
 
+    def test_parallel_and_offloaded_calibration_matches_serial(self):
+        def quantize(**kwargs):
+            model = models.Sequential(
+                [
+                    layers.Embedding(VOCAB_SIZE, 128),
+                    TransformerBlock(),
+                    TransformerBlock(),
+                    TransformerBlock(),
+                ]
+            )
+            model.build(input_shape=(None, 10))
+            model.set_weights(weights)
+            layer_structure = {
+                "pre_block_layers": [model.layers[0]],
+                "sequential_blocks": model.layers[1:],
+            }
+            config = GPTQConfig(
+                dataset=["test data for the calibration"],
+                tokenizer=MockTokenizer(),
+                num_samples=8,
+                sequence_length=10,
+                group_size=32,
+                quantization_layer_structure=layer_structure,
+                **kwargs,
+            )
+            model.quantize("gptq", config=config)
+            return [
+                ops.convert_to_numpy(layer.dense.quantized_kernel)
+                for layer in model.layers[1:]
+            ]
+
+        reference = models.Sequential(
+            [
+                layers.Embedding(VOCAB_SIZE, 128),
+                TransformerBlock(),
+                TransformerBlock(),
+                TransformerBlock(),
+            ]
+        )
+        reference.build(input_shape=(None, 10))
+        weights = reference.get_weights()
+
+        offload_dir = self.get_temp_dir()
+        serial_kernels = quantize()
+        parallel_kernels = quantize(num_workers=2, offload_dir=offload_dir)
+        for serial, parallel in zip(serial_kernels, parallel_kernels):
+            self.assertAllClose(serial, parallel)
+        # The offloaded activations are deleted after the calibration.
+        self.assertEqual(os.listdir(offload_dir), [])
+
+    def test_activation_buffer(self):
+        samples = [
+            np.random.random((1, 4, 8)).astype("float32") for _ in range(3)
+        ]
+        offload_dir = self.get_temp_dir()
+        for directory in (None, offload_dir):
+            buffer = ActivationBuffer(directory)
+            for sample in samples:
+                buffer.append(ops.convert_to_tensor(sample))
+            self.assertLen(buffer, 3)
+            for i, sample in enumerate(samples):
+                self.assertAllClose(buffer[i], sample)
+            buffer.close()
+            self.assertLen(buffer, 0)
+        self.assertEqual(os.listdir(offload_dir), [])
+
+    def test_offloaded_activations_deleted_on_error(self):
+        model = models.Sequential(
+            [
+                layers.Embedding(VOCAB_SIZE, 128),
+                TransformerBlock(),
+                TransformerBlock(),
+            ]
+        )
+        model.build(input_shape=(None, 10))
+        offload_dir = self.get_temp_dir()
+        config = GPTQConfig(
+            dataset=["test data for the calibration"],
+            tokenizer=MockTokenizer(),
+            num_samples=4,
+            sequence_length=10,
+            group_size=32,
+            num_workers=2,
+            offload_dir=offload_dir,
+            quantization_layer_structure={
+                "pre_block_layers": [model.layers[0]],
+                "sequential_blocks": model.layers[1:],
+            },
+        )
+        find_layers_in_block = gptq_core.find_layers_in_block
+
+        def interrupt_second_block(block):
+            if block is model.layers[2]:
+                raise KeyboardInterrupt
+            return find_layers_in_block(block)
+
+        with mock.patch.object(
+            gptq_core, "find_layers_in_block", interrupt_second_block
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                model.quantize("gptq", config=config)
+        self.assertEqual(os.listdir(offload_dir), [])
+
     @parameterized.named_parameters(
         (
             "no_embedding_layer",
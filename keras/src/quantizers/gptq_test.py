@@ -177,6 +177,24 @@ class GPTQTest(testing.TestCase):
         # Both the one-shot and streamed hessian updates should match
         self.assertAllClose(g1.hessian, g2.hessian, rtol=1e-6, atol=1e-6)
 
+    def test_gram_matrix_accumulation_equals_batch_update(self):
+        x = np.random.randn(100, 7).astype("float32")
+        layer = layers.Dense(5, use_bias=False)
+        layer.build(input_shape=(None, 7))
+
+        g1 = GPTQ(layer)
+        g1.update_hessian_with_batch(x[:30])
+        g1.update_hessian_with_batch(x[30:])
+
+        g2 = GPTQ(layer)
+        for batch in (x[:30], x[30:]):
+            gram_matrix, num_rows = g2.compute_gram_matrix(batch)
+            self.assertEqual(num_rows, batch.shape[0])
+            g2.update_hessian_with_gram_matrix(gram_matrix, num_rows)
+
+        self.assertEqual(g1.num_samples, g2.num_samples)
+        self.assertAllClose(g1.hessian, g2.hessian, rtol=1e-6, atol=1e-6)
+
     def test_hessian_matches_closed_form(self):
         """Tests that the Hessian matches the closed-form solution."""
         x = ops.array(np.random.randn(128, 7), "float32")
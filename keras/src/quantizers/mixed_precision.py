@@ -0,0 +1,370 @@
+"""Mixed-precision quantization planning from per-layer sensitivities."""
+
+import time
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import losses as losses_module
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.dtype_policies.dtype_policy_map import DTypePolicyMap
+from keras.src.quantizers.utils import should_quantize_layer
+from keras.src.trainers.data_adapters import data_adapter_utils
+from keras.src.trainers.data_adapters import get_data_adapter
+from keras.src.utils import profiling_utils
+
+FLOAT_OPTION = "float"
+
+
+@keras_export("keras.quantizers.compute_layer_sensitivity")
+def compute_layer_sensitivity(
+    model,
+    x,
+    y=None,
+    modes=("int8", "int4"),
+    loss=None,
+    batch_size=None,
+    num_batches=None,
+    filters=None,
+    measure_latency=False,
+):
+    """Measures how much quantizing each layer of a model degrades it.
+
+    Every quantizable layer of the float `model` is quantized on its own,
+    with every mode in `modes`, while all the other layers are kept in float,
+    and the model is evaluated on the calibration data. The model itself is
+    not modified: each layer is quantized in a copy, which temporarily
+    replaces it.
+
+    The degradation is measured as the increase of `loss` if it is given, or
+    as the mean squared error between the outputs of the float and of the
+    partially quantized model otherwise.
+
+    Args:
+        model: The float model to analyze. It must be built.
+        x: The calibration inputs. Any input supported by `Model.fit()`,
+            e.g. a NumPy array, a `tf.data.Dataset` or a generator. If it
+            yields `(x, y)` tuples, `y` is used with `loss`.
+        y: Optional targets, if `x` is an array.
+        modes: The quantization modes to evaluate for every layer. `"gptq"`
+            isn't supported, as it requires a calibration of its own.
+        loss: Optional loss identifier or callable `loss(y_true, y_pred)`.
+            Requires targets.
+        batch_size: The batch size to use if `x` is an array. Defaults to 32.
+        num_batches: Optional number of batches to evaluate. Defaults to all
+            of `x`.
+        filters: Optional filters selecting the layers to analyze, as in
+            `Model.quantize()`.
+        measure_latency: Whether to also measure the latency of a call of
+            every layer in every mode, on the inputs it received in the
+            first batch.
+
+    Returns:
+        A dict mapping the path of every analyzed layer to a dict mapping
+        `"float"` and every mode the layer supports to a dict with the
+        entries:
+        - `"error"`: The degradation of the model when only this layer is
+            quantized with this mode (`0.0` for `"float"`).
+        - `"size"`: The size in bytes of the weights of the layer.
+        - `"dtype_policy"`: The name of the dtype policy of the layer.
+        - `"latency"`: The latency of a call of the layer in seconds, if
+            `measure_latency=True`.
+
+        The result only contains Python scalars and strings, so it can be
+        saved as JSON and passed to `plan_mixed_precision()` later.
+
+    Example:
+
+    ```python
+    sensitivity = keras.quantizers.compute_layer_sensitivity(
+        model, x_calibration, num_batches=8
+    )
+    policy_map = keras.quantizers.plan_mixed_precision(
+        model, sensitivity, max_size=0.3 * model_size
+    )
+    keras.quantizers.apply_dtype_policy_map(model, policy_map)
+    ```
+    """
+    if not model.built:
+        raise ValueError(
+            "The model must be built before computing the sensitivity of its "
+            "layers."
+        )
+    for mode in modes:
+        if mode == "gptq":
+            raise ValueError(
+                "`compute_layer_sensitivity()` doesn't support the 'gptq' "
+                "mode, which requires a calibration of its own."
+            )
+    if loss is not None:
+        loss = losses_module.get(loss)
+        if not isinstance(loss, losses_module.Loss):
+            loss = losses_module.LossFunctionWrapper(loss)
+
+    adapter = get_data_adapter(
+        x,
+        y,
+        batch_size=batch_size or 32,
+        steps_per_epoch=num_batches,
+        shuffle=False,
+    )
+    batches = []
+    for step, data in enumerate(adapter.get_numpy_iterator()):
+        if num_batches is not None and step >= num_batches:
+            break
+        batches.append(data_adapter_utils.unpack_x_y_sample_weight(data))
+    if loss is not None and any(y_batch is None for _, y_batch, _ in batches):
+        raise ValueError(
+            "Computing the sensitivity with a `loss` requires targets. "
+            "Pass `y`, or `x` yielding `(inputs, targets)` tuples."
+        )
+
+    candidates = []
+    for layer in model._flatten_layers():
+        if len(list(layer._flatten_layers())) != 1 or not layer.weights:
+            continue
+        if layer.quantization_mode is not None:
+            continue
+        if not should_quantize_layer(layer, filters):
+            continue
+        candidates.append(layer)
+
+    # Record the reference outputs, and the first inputs of every layer to
+    # measure latencies.
+    layer_inputs = {}
+
+    def create_recorder(layer, original_call_func):
+        def recorder(*args, **kwargs):
+            layer_inputs.setdefault(id(layer), (args, kwargs))
+            return original_call_func(*args, **kwargs)
+
+        return recorder
+
+    reference_outputs = []
+    reference_error = 0.0
+    for i, (x_batch, y_batch, sample_weight) in enumerate(batches):
+        if i == 0 and measure_latency:
+            with profiling_utils.hook_calls(candidates, create_recorder):
+                outputs = model(x_batch, training=False)
+        else:
+            outputs = model(x_batch, training=False)
+        reference_outputs.append(outputs)
+    if loss is not None:
+        reference_error = _evaluate(model, batches, reference_outputs, loss)
+
+    sensitivity = {}
+    for layer in candidates:
+        float_option = {
+            "error": 0.0,
+            "size": _weights_size(layer),
+            "dtype_policy": layer.dtype_policy.name,
+        }
+        if measure_latency:
+            float_option["latency"] = _measure_latency(
+                layer.call, *layer_inputs[id(layer)]
+            )
+        options = {FLOAT_OPTION: float_option}
+        for mode in modes:
+            quantized_layer = _quantized_copy(layer, mode)
+            if quantized_layer is None:
+                continue
+            quantized_call = quantized_layer.quantized_call
+            with profiling_utils.hook_calls([layer], lambda *_: quantized_call):
+                error = _evaluate(model, batches, reference_outputs, loss)
+            option = {
+                "error": float(error - reference_error),
+                "size": _weights_size(quantized_layer),
+                "dtype_policy": quantized_layer.dtype_policy.name,
+            }
+            if measure_latency:
+                option["latency"] = _measure_latency(
+                    quantized_layer.quantized_call, *layer_inputs[id(layer)]
+                )
+            options[mode] = option
+            del quantized_layer
+        if len(options) > 1:
+            sensitivity[layer.path] = options
+    return sensitivity
+
+
+@keras_export("keras.quantizers.plan_mixed_precision")
+def plan_mixed_precision(
+    model, sensitivity, max_size=None, max_latency=None, default_policy=None
+):
+    """Chooses a quantization mode per layer to meet a size or latency budget.
+
+    Starting from the float model, layers are quantized one step at a time:
+    each step applies the change of mode of a single layer with the lowest
+    increase of error per unit of saved budget, as measured by
+    `compute_layer_sensitivity()`, until the budget is met. The errors of the
+    layers are assumed to add up.
+
+    Args:
+        model: The float model the sensitivity was computed for.
+        sensitivity: The result of `compute_layer_sensitivity()`.
+        max_size: Optional maximum size in bytes of all the weights of the
+            model, including the weights of the layers which aren't
+            quantized.
+        max_latency: Optional maximum sum of the latencies of the analyzed
+            layers, in seconds. Requires the sensitivity to be computed with
+            `measure_latency=True`.
+        default_policy: The default policy of the returned map. Defaults to
+            the dtype policy of `model`.
+
+    Returns:
+        A `DTypePolicyMap` mapping the path of every layer to quantize to its
+        quantized dtype policy. It can be serialized with
+        `keras.dtype_policies.serialize()`, passed to `apply_dtype_policy_map()`
+        or used as the `dtype` of a model built from the same config.
+    """
+    if max_size is None and max_latency is None:
+        raise ValueError(
+            "At least one of `max_size` and `max_latency` must be specified."
+        )
+    budgets = {}
+    if max_size is not None:
+        float_size = sum(
+            options[FLOAT_OPTION]["size"] for options in sensitivity.values()
+        )
+        # The size of the weights which aren't affected by the plan.
+        fixed_size = _weights_size(model) - float_size
+        budgets["size"] = max_size - fixed_size
+    if max_latency is not None:
+        for path, options in sensitivity.items():
+            if "latency" not in options[FLOAT_OPTION]:
+                raise ValueError(
+                    "Planning with `max_latency` requires the sensitivity to "
+                    "be computed with `measure_latency=True`. The sensitivity "
+                    f"of layer '{path}' has no latency."
+                )
+        budgets["latency"] = max_latency
+
+    plan = {path: FLOAT_OPTION for path in sensitivity}
+
+    def total(key):
+        return sum(
+            sensitivity[path][option][key] for path, option in plan.items()
+        )
+
+    while True:
+        excess = {
+            key: total(key) - budget
+            for key, budget in budgets.items()
+            if total(key) > budget
+        }
+        if not excess:
+            break
+        best_move = None
+        best_ratio = None
+        for path, current in plan.items():
+            current_option = sensitivity[path][current]
+            for option_name, option in sensitivity[path].items():
+                # Only consider moves which don't increase any cost, so that
+                # the search terminates.
+                savings = {
+                    key: current_option[key] - option[key] for key in budgets
+                }
+                if any(saving < 0 for saving in savings.values()):
+                    continue
+                # Savings are weighted by how much each budget is exceeded.
+                gain = sum(
+                    min(savings[key], excess[key]) / excess[key]
+                    for key in excess
+                )
+                if gain <= 0:
+                    continue
+                ratio = (option["error"] - current_option["error"]) / gain
+                if best_ratio is None or ratio < best_ratio:
+                    best_move = (path, option_name)
+                    best_ratio = ratio
+        if best_move is None:
+            raise ValueError(
+                "The budget can't be met by quantizing the analyzed layers. "
+                f"Received: max_size={max_size}, max_latency={max_latency}"
+            )
+        plan[best_move[0]] = best_move[1]
+
+    if default_policy is None:
+        default_policy = model.dtype_policy
+    policy_map = DTypePolicyMap(default_policy=default_policy)
+    for path, option_name in plan.items():
+        if option_name != FLOAT_OPTION:
+            policy_map[path] = sensitivity[path][option_name]["dtype_policy"]
+    return policy_map
+
+
+@keras_export("keras.quantizers.apply_dtype_policy_map")
+def apply_dtype_policy_map(model, policy_map):
+    """Quantizes the layers of a float model according to a `DTypePolicyMap`.
+
+    Every layer of `model` whose path maps to a quantized dtype policy in
+    `policy_map` is quantized with the mode of that policy, using
+    `Model.quantize()`. The other layers are left unchanged.
+
+    Args:
+        model: The float model to quantize. It must be built.
+        policy_map: A `DTypePolicyMap`, e.g. returned by
+            `plan_mixed_precision()`.
+    """
+    layers_by_mode = {}
+    for layer in model._flatten_layers():
+        if len(list(layer._flatten_layers())) != 1 or not layer.path:
+            continue
+        mode = policy_map[layer.path].quantization_mode
+        if mode is None or layer.quantization_mode is not None:
+            continue
+        layers_by_mode.setdefault(mode, set()).add(id(layer))
+    for mode, layer_ids in layers_by_mode.items():
+        model.quantize(
+            mode, filters=lambda layer, ids=layer_ids: id(layer) in ids
+        )
+
+
+def _quantized_copy(layer, mode):
+    """Returns a quantized copy of `layer`, or `None` if not supported."""
+    quantized_layer = layer.__class__.from_config(layer.get_config())
+    quantized_layer.build_from_config(layer.get_build_config())
+    quantized_layer.set_weights(layer.get_weights())
+    try:
+        quantized_layer.quantize(mode)
+    except NotImplementedError:
+        return None
+    return quantized_layer
+
+
+def _weights_size(layer):
+    return sum(
+        int(np.prod(weight.shape))
+        * np.dtype(backend.standardize_dtype(weight.dtype)).itemsize
+        for weight in layer.weights
+    )
+
+
+def _evaluate(model, batches, reference_outputs, loss):
+    errors = []
+    for (x, y, sample_weight), reference in zip(batches, reference_outputs):
+        outputs = model(x, training=False)
+        if loss is not None:
+            value = loss(y, outputs, sample_weight=sample_weight)
+        else:
+            value = sum(
+                ops.mean(ops.square(output - ref))
+                for output, ref in zip(
+                    tree.flatten(outputs), tree.flatten(reference)
+                )
+            )
+        errors.append(float(ops.convert_to_numpy(value)))
+    return float(np.mean(errors))
+
+
+def _measure_latency(call_fn, args, kwargs, num_runs=5):
+    # The first call isn't timed, as it may include tracing and caching.
+    tree.map_structure(ops.convert_to_numpy, call_fn(*args, **kwargs))
+    latencies = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        tree.map_structure(ops.convert_to_numpy, call_fn(*args, **kwargs))
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
@@ -0,0 +1,165 @@
+import json
+
+import numpy as np
+import pytest
+
+from keras.src import dtype_policies
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.quantizers.mixed_precision import _weights_size
+from keras.src.quantizers.mixed_precision import apply_dtype_policy_map
+from keras.src.quantizers.mixed_precision import compute_layer_sensitivity
+from keras.src.quantizers.mixed_precision import plan_mixed_precision
+
+
+def get_model():
+    model = models.Sequential(
+        [
+            layers.Input((16,)),
+            layers.Dense(64, activation="relu", name="dense_a"),
+            layers.BatchNormalization(name="batch_norm"),
+            layers.Dense(64, activation="relu", name="dense_b"),
+            layers.Dense(4, name="dense_c"),
+        ],
+        name="model",
+    )
+    return model
+
+
+@pytest.mark.requires_trainable_backend
+class MixedPrecisionTest(testing.TestCase):
+    def test_compute_layer_sensitivity(self):
+        model = get_model()
+        weights = model.get_weights()
+        x = np.random.random((64, 16)).astype("float32")
+        sensitivity = compute_layer_sensitivity(
+            model, x, batch_size=16, num_batches=2
+        )
+        # `BatchNormalization` can't be quantized.
+        self.assertEqual(
+            set(sensitivity.keys()),
+            {"model/dense_a", "model/dense_b", "model/dense_c"},
+        )
+        for options in sensitivity.values():
+            self.assertEqual(set(options.keys()), {"float", "int8", "int4"})
+            self.assertEqual(options["float"]["error"], 0.0)
+            self.assertEqual(options["float"]["dtype_policy"], "float32")
+            self.assertEqual(
+                options["int8"]["dtype_policy"], "int8_from_float32"
+            )
+            self.assertGreater(options["int8"]["error"], 0.0)
+            self.assertGreater(
+                options["int4"]["error"], options["int8"]["error"]
+            )
+            self.assertLess(options["int8"]["size"], options["float"]["size"])
+            self.assertLess(options["int4"]["size"], options["int8"]["size"])
+        self.assertEqual(
+            sensitivity["model/dense_a"]["float"]["size"], 17 * 64 * 4
+        )
+        # The result can be saved as JSON.
+        self.assertEqual(json.loads(json.dumps(sensitivity)), sensitivity)
+
+        # The model is unchanged.
+        for layer in model.layers:
+            self.assertIsNone(layer.quantization_mode)
+            self.assertNotIn("call", layer.__dict__)
+        for weight, value in zip(model.get_weights(), weights):
+            self.assertAllClose(weight, value)
+
+    def test_compute_layer_sensitivity_with_loss_and_latency(self):
+        model = get_model()
+        x = np.random.random((32, 16)).astype("float32")
+        y = np.random.random((32, 4)).astype("float32")
+        sensitivity = compute_layer_sensitivity(
+            model,
+            x,
+            y,
+            modes=("int8",),
+            loss="mse",
+            filters="dense_[ab]",
+            measure_latency=True,
+        )
+        self.assertEqual(
+            set(sensitivity.keys()), {"model/dense_a", "model/dense_b"}
+        )
+        for options in sensitivity.values():
+            self.assertEqual(set(options.keys()), {"float", "int8"})
+            self.assertGreater(options["float"]["latency"], 0.0)
+            self.assertGreater(options["int8"]["latency"], 0.0)
+
+        with self.assertRaisesRegex(ValueError, "requires targets"):
+            compute_layer_sensitivity(model, x, loss="mse")
+        with self.assertRaisesRegex(ValueError, "gptq"):
+            compute_layer_sensitivity(model, x, modes=("gptq",))
+
+    def test_plan_and_apply(self):
+        model = get_model()
+        x = np.random.random((64, 16)).astype("float32")
+        y_float = model.predict(x, verbose=0)
+        sensitivity = compute_layer_sensitivity(model, x)
+        float_size = _weights_size(model)
+        max_size = float_size * 0.5
+        policy_map = plan_mixed_precision(model, sensitivity, max_size=max_size)
+        self.assertIsInstance(policy_map, dtype_policies.DTypePolicyMap)
+        self.assertGreater(len(policy_map), 0)
+        self.assertEqual(policy_map.default_policy.name, "float32")
+
+        # The map can be serialized and reused.
+        config = dtype_policies.serialize(policy_map)
+        policy_map = dtype_policies.deserialize(json.loads(json.dumps(config)))
+        apply_dtype_policy_map(model, policy_map)
+        for layer in model.layers:
+            self.assertEqual(
+                layer.quantization_mode,
+                policy_map[layer.path].quantization_mode,
+            )
+        self.assertLessEqual(_weights_size(model), max_size)
+        y_quantized = model.predict(x, verbose=0)
+        self.assertLess(np.mean(np.square(y_float - y_quantized)), 1e-2)
+
+    def test_plan_prefers_less_sensitive_layers(self):
+        model = get_model()
+        sizes = {
+            path: _weights_size(model.get_layer(path.split("/")[-1]))
+            for path in ("model/dense_a", "model/dense_b", "model/dense_c")
+        }
+
+        def options(path, error):
+            return {
+                "float": {
+                    "error": 0.0,
+                    "size": sizes[path],
+                    "dtype_policy": "float32",
+                },
+                "int8": {
+                    "error": error,
+                    "size": sizes[path] // 4,
+                    "dtype_policy": "int8_from_float32",
+                },
+            }
+
+        sensitivity = {
+            "model/dense_a": options("model/dense_a", 1.0),
+            "model/dense_b": options("model/dense_b", 0.1),
+            "model/dense_c": options("model/dense_c", 0.0),
+        }
+        # Quantizing either `dense_a` or `dense_b` meets the budget, and the
+        # least sensitive one is chosen.
+        max_size = _weights_size(model) - sizes["model/dense_a"] // 2
+        policy_map = plan_mixed_precision(model, sensitivity, max_size=max_size)
+        self.assertEqual(
+            set(policy_map.keys()), {"model/dense_b", "model/dense_c"}
+        )
+
+    def test_plan_errors(self):
+        model = get_model()
+        sensitivity = compute_layer_sensitivity(
+            model, np.random.random((8, 16)), modes=("int8",)
+        )
+        with self.assertRaisesRegex(ValueError, "At least one"):
+            plan_mixed_precision(model, sensitivity)
+        with self.assertRaisesRegex(ValueError, "can't be met"):
+            plan_mixed_precision(model, sensitivity, max_size=100)
+        with self.assertRaisesRegex(ValueError, "measure_latency=True"):
+            plan_mixed_precision(model, sensitivity, max_latency=1.0)
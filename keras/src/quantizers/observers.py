@@ -0,0 +1,341 @@
+"""Observers collecting activation statistics for static quantization."""
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import ops
+from keras.src.api_export import keras_export
+
+
+@keras_export("keras.quantizers.Observer")
+class Observer:
+    """Base class for observers.
+
+    An observer collects statistics about the values of a tensor (typically
+    the inputs of a layer) over a calibration dataset, and computes the scale
+    of a symmetric quantization of that tensor from them.
+
+    Subclasses must implement `update_state()`, `reset_state()` and
+    `compute_amax()`.
+
+    Args:
+        axis: The channel axis of the observed tensor, for per-channel
+            statistics. If `None`, statistics are computed over the whole
+            tensor.
+    """
+
+    def __init__(self, axis=None):
+        self.axis = axis
+        self.reset_state()
+
+    def update_state(self, x):
+        """Updates the statistics with the values of `x`."""
+        raise NotImplementedError
+
+    def reset_state(self):
+        """Resets the statistics."""
+        raise NotImplementedError
+
+    def compute_amax(self, value_range=(-127, 127)):
+        """Returns the absolute value to map to the end of `value_range`.
+
+        Returns a scalar for per-tensor statistics, or an array with one
+        value per channel.
+        """
+        raise NotImplementedError
+
+    def compute_scale(self, value_range=(-127, 127), epsilon=None):
+        """Returns the quantization scale of the observed tensor.
+
+        The scale is a scalar for per-tensor statistics. For per-channel
+        statistics, the scale is shaped to broadcast against the observed
+        tensor, e.g. `(channels,)` for `axis=-1` or `(channels, 1, 1)` for
+        `axis=1` and 4D inputs.
+        """
+        if not self.num_updates:
+            raise ValueError(
+                f"{self.__class__.__name__} can't compute a scale before "
+                "observing any values. Call `update_state()` first."
+            )
+        if epsilon is None:
+            epsilon = backend.epsilon()
+        amax = np.asarray(self.compute_amax(value_range), dtype="float32")
+        scale = value_range[1] / (amax + epsilon)
+        if self.axis is not None:
+            # Add unit dimensions for the axes after the channel axis.
+            axis = self.axis if self.axis < 0 else self.axis - self._ndim
+            scale = np.reshape(scale, scale.shape + (1,) * (-axis - 1))
+        return scale.astype("float32")
+
+    def get_config(self):
+        return {"axis": self.axis}
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+    def _to_channels(self, x):
+        """Returns `x` as a 2D array of shape `(channels, values)`."""
+        x = ops.convert_to_numpy(x).astype("float32")
+        self._ndim = x.ndim
+        if self.axis is None:
+            return np.reshape(x, (1, -1))
+        x = np.moveaxis(x, self.axis, 0)
+        return np.reshape(x, (x.shape[0], -1))
+
+    def _from_channels(self, values):
+        if self.axis is None:
+            return values[0]
+        return values
+
+
+@keras_export("keras.quantizers.MinMaxObserver")
+class MinMaxObserver(Observer):
+    """Observer tracking the minimum and maximum of the observed values.
+
+    The quantization range covers all the observed values, so no value is
+    clipped, but a single outlier reduces the resolution of all the others.
+
+    Args:
+        axis: The channel axis of the observed tensor, for per-channel
+            statistics. If `None`, statistics are computed over the whole
+            tensor.
+    """
+
+    def update_state(self, x):
+        x = self._to_channels(x)
+        batch_min = np.min(x, axis=-1)
+        batch_max = np.max(x, axis=-1)
+        if self.num_updates:
+            batch_min = np.minimum(self.min_value, batch_min)
+            batch_max = np.maximum(self.max_value, batch_max)
+        self.min_value = batch_min
+        self.max_value = batch_max
+        self.num_updates += 1
+
+    def reset_state(self):
+        self.min_value = None
+        self.max_value = None
+        self.num_updates = 0
+
+    def compute_amax(self, value_range=(-127, 127)):
+        amax = np.maximum(np.abs(self.min_value), np.abs(self.max_value))
+        return self._from_channels(amax)
+
+
+@keras_export("keras.quantizers.MovingAverageMinMaxObserver")
+class MovingAverageMinMaxObserver(MinMaxObserver):
+    """Observer tracking moving averages of the batch minimum and maximum.
+
+    Less sensitive to rare outliers than `MinMaxObserver`.
+
+    Args:
+        momentum: Momentum of the moving averages.
+        axis: The channel axis of the observed tensor, for per-channel
+            statistics. If `None`, statistics are computed over the whole
+            tensor.
+    """
+
+    def __init__(self, momentum=0.9, axis=None):
+        if not 0.0 <= momentum < 1.0:
+            raise ValueError(
+                "Argument `momentum` must be in the interval [0, 1). "
+                f"Received: momentum={momentum}"
+            )
+        self.momentum = momentum
+        super().__init__(axis=axis)
+
+    def update_state(self, x):
+        x = self._to_channels(x)
+        batch_min = np.min(x, axis=-1)
+        batch_max = np.max(x, axis=-1)
+        if self.num_updates:
+            m = self.momentum
+            batch_min = m * self.min_value + (1.0 - m) * batch_min
+            batch_max = m * self.max_value + (1.0 - m) * batch_max
+        self.min_value = batch_min
+        self.max_value = batch_max
+        self.num_updates += 1
+
+    def get_config(self):
+        return {"momentum": self.momentum, "axis": self.axis}
+
+
+class HistogramObserver(Observer):
+    """Base class for observers keeping a histogram of absolute values.
+
+    The histogram of each channel has `num_bins` bins spanning `[0, range]`.
+    When a larger value is observed, the range is doubled as many times as
+    needed and adjacent bins are merged, so the memory stays constant.
+    """
+
+    def __init__(self, num_bins=2048, axis=None):
+        if num_bins < 2 or num_bins & (num_bins - 1):
+            raise ValueError(
+                "Argument `num_bins` must be a power of 2 greater than 1. "
+                f"Received: num_bins={num_bins}"
+            )
+        self.num_bins = num_bins
+        super().__init__(axis=axis)
+
+    def update_state(self, x):
+        x = np.abs(self._to_channels(x))
+        num_channels = x.shape[0]
+        batch_max = np.max(x, axis=-1)
+        if not self.num_updates:
+            self.histogram = np.zeros((num_channels, self.num_bins), "int64")
+            self.range = np.maximum(batch_max, np.finfo("float32").tiny)
+        else:
+            self._grow_range(batch_max)
+        bins = np.floor(x / self.range[:, None] * self.num_bins)
+        bins = np.minimum(bins.astype("int64"), self.num_bins - 1)
+        bins += np.arange(num_channels)[:, None] * self.num_bins
+        self.histogram += np.bincount(
+            bins.ravel(), minlength=num_channels * self.num_bins
+        ).reshape(num_channels, self.num_bins)
+        self.num_updates += 1
+
+    def reset_state(self):
+        self.histogram = None
+        self.range = None
+        self.num_updates = 0
+
+    def get_config(self):
+        return {"num_bins": self.num_bins, "axis": self.axis}
+
+    def _grow_range(self, batch_max):
+        ratio = batch_max / self.range
+        for channel in np.nonzero(ratio > 1.0)[0]:
+            factor = 2 ** int(np.ceil(np.log2(ratio[channel])))
+            self.range[channel] *= factor
+            histogram = self.histogram[channel]
+            if factor >= self.num_bins:
+                merged = np.zeros_like(histogram)
+                merged[0] = np.sum(histogram)
+            else:
+                merged = np.zeros_like(histogram)
+                merged[: self.num_bins // factor] = np.sum(
+                    np.reshape(histogram, (-1, factor)), axis=-1
+                )
+            self.histogram[channel] = merged
+
+    def _bin_edges(self):
+        """Returns the upper edge of every bin, per channel."""
+        return (
+            self.range[:, None]
+            * np.arange(1, self.num_bins + 1)[None, :]
+            / self.num_bins
+        )
+
+
+@keras_export("keras.quantizers.PercentileObserver")
+class PercentileObserver(HistogramObserver):
+    """Observer clipping the range to a percentile of the absolute values.
+
+    Ignores the largest `100 - percentile` percent of the observed values,
+    which are clipped at inference time, in exchange for a finer resolution
+    for all the others.
+
+    Args:
+        percentile: The percentile of the absolute values to use as the
+            range, in `(0, 100]`.
+        num_bins: The number of bins of the histogram used to estimate the
+            percentile. Must be a power of 2.
+        axis: The channel axis of the observed tensor, for per-channel
+            statistics. If `None`, statistics are computed over the whole
+            tensor.
+    """
+
+    def __init__(self, percentile=99.99, num_bins=2048, axis=None):
+        if not 0.0 < percentile <= 100.0:
+            raise ValueError(
+                "Argument `percentile` must be in the interval (0, 100]. "
+                f"Received: percentile={percentile}"
+            )
+        self.percentile = percentile
+        super().__init__(num_bins=num_bins, axis=axis)
+
+    def compute_amax(self, value_range=(-127, 127)):
+        cdf = np.cumsum(self.histogram, axis=-1)
+        target = cdf[:, -1:] * self.percentile / 100.0
+        index = np.argmax(cdf >= target, axis=-1)
+        amax = np.take_along_axis(self._bin_edges(), index[:, None], axis=-1)
+        return self._from_channels(amax[:, 0])
+
+    def get_config(self):
+        config = super().get_config()
+        config["percentile"] = self.percentile
+        return config
+
+
+@keras_export("keras.quantizers.MSEObserver")
+class MSEObserver(HistogramObserver):
+    """Observer choosing the range minimizing the quantization error.
+
+    Estimates, from the histogram of the observed values, the mean squared
+    error of the quantization for every candidate range (the upper edges of
+    the bins): values within the range incur a rounding error, values beyond
+    it a clipping error. The range with the lowest total error is used.
+
+    Args:
+        num_bins: The number of bins of the histogram, which are also the
+            candidate ranges. Must be a power of 2.
+        axis: The channel axis of the observed tensor, for per-channel
+            statistics. If `None`, statistics are computed over the whole
+            tensor.
+    """
+
+    def compute_amax(self, value_range=(-127, 127)):
+        histogram = self.histogram.astype("float64")
+        edges = self._bin_edges()
+        centers = edges - self.range[:, None] / (2 * self.num_bins)
+
+        # Sums over the bins above each candidate range.
+        def sum_above(values):
+            total = np.cumsum(values[:, ::-1], axis=-1)[:, ::-1]
+            return np.concatenate(
+                [total[:, 1:], np.zeros_like(total[:, :1])], axis=-1
+            )
+
+        count_above = sum_above(histogram)
+        sum_above_1 = sum_above(histogram * centers)
+        sum_above_2 = sum_above(histogram * centers**2)
+        clipping_error = (
+            sum_above_2 - 2 * edges * sum_above_1 + edges**2 * count_above
+        )
+        step = edges / value_range[1]
+        rounding_error = step**2 / 12 * np.cumsum(histogram, axis=-1)
+        index = np.argmin(clipping_error + rounding_error, axis=-1)
+        amax = np.take_along_axis(edges, index[:, None], axis=-1)
+        return self._from_channels(amax[:, 0])
+
+
+ALL_OBSERVERS = {
+    "minmax": MinMaxObserver,
+    "moving_average": MovingAverageMinMaxObserver,
+    "percentile": PercentileObserver,
+    "mse": MSEObserver,
+}
+
+
+def get(identifier, axis=None):
+    """Returns a new observer from a string, a class or an observer.
+
+    Observers are stateful, so an observer instance is used as a template:
+    a new observer with the same config (and the given `axis`) is returned.
+    """
+    if isinstance(identifier, str):
+        if identifier not in ALL_OBSERVERS:
+            raise ValueError(
+                f"Unknown observer: '{identifier}'. Expected one of "
+                f"{list(ALL_OBSERVERS.keys())} or an `Observer` instance."
+            )
+        return ALL_OBSERVERS[identifier](axis=axis)
+    if isinstance(identifier, Observer):
+        config = identifier.get_config()
+        config["axis"] = axis
+        return identifier.__class__.from_config(config)
+    raise ValueError(
+        f"Could not interpret observer identifier: {identifier}. Expected "
+        f"one of {list(ALL_OBSERVERS.keys())} or an `Observer` instance."
+    )
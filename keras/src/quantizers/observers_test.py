@@ -0,0 +1,98 @@
+import numpy as np
+from absl.testing import parameterized
+
+from keras.src import testing
+from keras.src.quantizers import observers
+
+
+class ObserversTest(testing.TestCase):
+    def test_min_max_observer(self):
+        observer = observers.MinMaxObserver()
+        observer.update_state(np.array([[-1.0, 2.0], [0.5, 0.0]]))
+        observer.update_state(np.array([[-3.0, 1.0]]))
+        self.assertAllClose(observer.min_value, -3.0)
+        self.assertAllClose(observer.max_value, 2.0)
+        self.assertAllClose(observer.compute_amax(), 3.0)
+        self.assertAllClose(observer.compute_scale(), 127.0 / 3.0)
+
+        observer.reset_state()
+        with self.assertRaisesRegex(ValueError, "before observing"):
+            observer.compute_scale()
+
+    def test_moving_average_min_max_observer(self):
+        observer = observers.MovingAverageMinMaxObserver(momentum=0.5)
+        observer.update_state(np.array([-1.0, 1.0]))
+        observer.update_state(np.array([-3.0, 5.0]))
+        self.assertAllClose(observer.min_value, -2.0)
+        self.assertAllClose(observer.max_value, 3.0)
+        self.assertAllClose(observer.compute_amax(), 3.0)
+
+        with self.assertRaisesRegex(ValueError, "momentum"):
+            observers.MovingAverageMinMaxObserver(momentum=1.0)
+
+    def test_percentile_observer(self):
+        observer = observers.PercentileObserver(percentile=99.0, num_bins=1024)
+        x = np.linspace(-1.0, 1.0, 10001)
+        observer.update_state(x)
+        self.assertAllClose(observer.compute_amax(), 0.99, atol=2e-3)
+
+        # The range grows with larger values.
+        observer.update_state(x * 4.0)
+        self.assertAllClose(observer.range, 4.0)
+        self.assertEqual(np.sum(observer.histogram), 2 * 10001)
+        # 99% of the values of both batches are in [-3.92, 3.92].
+        self.assertAllClose(observer.compute_amax(), 3.92, atol=2e-2)
+
+        with self.assertRaisesRegex(ValueError, "percentile"):
+            observers.PercentileObserver(percentile=0.0)
+        with self.assertRaisesRegex(ValueError, "power of 2"):
+            observers.PercentileObserver(num_bins=1000)
+
+    def test_mse_observer_clips_outliers(self):
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal((1000000,)).astype("float32")
+        x[0] = 100.0
+        min_max = observers.MinMaxObserver()
+        mse = observers.MSEObserver()
+        min_max.update_state(x)
+        mse.update_state(x)
+        self.assertAllClose(min_max.compute_amax(), 100.0)
+        amax = mse.compute_amax()
+        self.assertLess(amax, 25.0)
+        self.assertGreater(amax, 2.0)
+
+    @parameterized.named_parameters(
+        ("min_max", "minmax"),
+        ("moving_average", "moving_average"),
+        ("percentile", "percentile"),
+        ("mse", "mse"),
+    )
+    def test_per_channel(self, identifier):
+        rng = np.random.default_rng(0)
+        channel_ranges = np.array([1.0, 10.0, 100.0], dtype="float32")
+        # Channels first, so the scale needs trailing unit dimensions.
+        x = rng.uniform(-1.0, 1.0, (8, 3, 4, 4)).astype("float32")
+        x = x * channel_ranges[:, None, None]
+        observer = observers.get(identifier, axis=1)
+        observer.update_state(x)
+        scale = observer.compute_scale()
+        self.assertEqual(scale.shape, (3, 1, 1))
+        self.assertAllClose(
+            scale[:, 0, 0] * channel_ranges, [127.0] * 3, rtol=0.1
+        )
+
+    def test_get(self):
+        observer = observers.get("percentile", axis=-1)
+        self.assertIsInstance(observer, observers.PercentileObserver)
+        self.assertEqual(observer.axis, -1)
+
+        template = observers.PercentileObserver(percentile=99.0)
+        template.update_state(np.ones((2,)))
+        observer = observers.get(template, axis=1)
+        self.assertIsNot(observer, template)
+        self.assertEqual(observer.percentile, 99.0)
+        self.assertEqual(observer.axis, 1)
+        self.assertEqual(observer.num_updates, 0)
+
+        with self.assertRaisesRegex(ValueError, "Unknown observer"):
+            observers.get("typo")
@@ -69,12 +69,15 @@ class Int8QuantizationConfig(QuantizationConfig):
     Args:
         weight_quantizer: Quantizer for weights.
         activation_quantizer: Quantizer for activations. If "default", uses
-            AbsMaxQuantizer with axis=-1.
+            AbsMaxQuantizer with axis=-1. Convolution layers don't quantize
+            their inputs with the default quantizer.
     """
 
     def __init__(self, weight_quantizer=None, activation_quantizer="default"):
         from keras.src.quantizers.quantizers import AbsMaxQuantizer
 
+        # Whether the activation quantizer wasn't passed explicitly.
+        self._default_activation_quantizer = activation_quantizer == "default"
         if activation_quantizer == "default":
             activation_quantizer = AbsMaxQuantizer()
         super().__init__(weight_quantizer, activation_quantizer)
@@ -91,6 +94,91 @@ class Int8QuantizationConfig(QuantizationConfig):
         return "int8"
 
 
+@keras_export("keras.quantizers.StaticInt8QuantizationConfig")
+class StaticInt8QuantizationConfig(Int8QuantizationConfig):
+    """Int8 quantization config with calibrated (static) activation scales.
+
+    By default, int8 layers quantize their inputs with an `AbsMaxQuantizer`,
+    which reduces over the inputs in every call to compute their scale. With
+    this config, `Model.quantize()` first runs the float model on a
+    calibration dataset, while observers collect statistics about the inputs
+    of each layer. The inputs of each layer are then quantized with a
+    `StaticQuantizer` using the scale computed by its observer, which skips
+    the runtime reduction.
+
+    The calibrated scales are stored in the `quantization_config` of each
+    layer, so they are saved with the model.
+
+    Example:
+
+    ```python
+    config = keras.quantizers.StaticInt8QuantizationConfig(
+        dataset=x_calibration, observer="percentile", num_batches=16
+    )
+    model.quantize(config=config)
+    ```
+
+    Args:
+        dataset: The calibration data, in any format accepted by
+            `Model.predict()` (NumPy arrays, a `tf.data.Dataset`, a
+            `keras.utils.PyDataset`, a generator...). Targets are ignored.
+        observer: The observer computing the activation scales. One of
+            `"minmax"`, `"moving_average"`, `"percentile"` or `"mse"`, or a
+            `keras.quantizers.Observer` instance used as a template.
+            Defaults to `"minmax"`.
+        granularity: `"per_tensor"` or `"per_channel"`. Per-channel scales
+            are only used by convolution layers, whose inputs are quantized
+            and dequantized before a float convolution. `Dense` and
+            `EinsumDense` layers always use per-tensor scales, since a scale
+            per channel of the contracted axis can't be factored out of the
+            integer matmul. Defaults to `"per_tensor"`.
+        num_batches: The number of batches of `dataset` to calibrate on. If
+            `None`, the whole dataset is used.
+        batch_size: The batch size used when `dataset` is an array.
+            Defaults to 32.
+        weight_quantizer: Quantizer for weights.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        observer="minmax",
+        granularity="per_tensor",
+        num_batches=None,
+        batch_size=None,
+        weight_quantizer=None,
+    ):
+        from keras.src.quantizers import observers
+
+        super().__init__(weight_quantizer=weight_quantizer)
+        # Validate the observer early.
+        observers.get(observer)
+        if granularity not in ("per_tensor", "per_channel"):
+            raise ValueError(
+                "Argument `granularity` must be one of 'per_tensor' or "
+                f"'per_channel'. Received: granularity={granularity}"
+            )
+        if num_batches is not None and num_batches < 1:
+            raise ValueError(
+                "Argument `num_batches` must be a positive integer. "
+                f"Received: num_batches={num_batches}"
+            )
+        self.dataset = dataset
+        self.observer = observer
+        self.granularity = granularity
+        self.num_batches = num_batches
+        self.batch_size = batch_size
+
+    def get_config(self):
+        # The calibration dataset isn't serializable. The calibrated layers
+        # use an `Int8QuantizationConfig` with static activation quantizers.
+        return super().get_config()
+
+    @classmethod
+    def from_config(cls, config):
+        return Int8QuantizationConfig.from_config(config)
+
+
 @keras_export("keras.quantizers.Int4QuantizationConfig")
 class Int4QuantizationConfig(QuantizationConfig):
     """Int4 quantization config.
@@ -187,6 +187,88 @@ class AbsMaxQuantizer(Quantizer):
         return config
 
 
+@keras_export("keras.quantizers.StaticQuantizer")
+class StaticQuantizer(Quantizer):
+    """Quantizes inputs with a scale fixed ahead of time.
+
+    Unlike `AbsMaxQuantizer`, which computes the scale from the absolute
+    maximum of each input, `StaticQuantizer` uses a scale computed once,
+    usually by calibrating the model on representative data (see
+    `keras.quantizers.StaticInt8QuantizationConfig`). This skips the runtime
+    reduction over the inputs.
+
+    Args:
+        scale: A float or an array of floats. A scalar gives a per-tensor
+            scale. An array gives a per-channel scale, and must broadcast
+            against the inputs.
+        value_range: Tuple of the minimum and maximum values of the
+            quantization range.
+        output_dtype: Data type of the quantized output.
+    """
+
+    def __init__(self, scale, value_range=(-127, 127), output_dtype="int8"):
+        Quantizer.__init__(self, output_dtype=output_dtype)
+        self.scale = np.asarray(scale, dtype="float32")
+        self.value_range = tuple(value_range)
+        if output_dtype == "int8":
+            if value_range[0] < -128 or value_range[1] > 127:
+                raise ValueError(
+                    f"Quantizer with output_dtype='int8' requires value_range "
+                    f"to be within the interval [-128, 127]. Received: "
+                    f"value_range={value_range}"
+                )
+
+    def __call__(self, x, axis=None, to_numpy=False):
+        """
+        Quantizes the input tensor.
+
+        Args:
+            x: Input tensor to quantize.
+            axis: Unused. Only accepted for compatibility with
+                `AbsMaxQuantizer`.
+            to_numpy: Whether to perform the quantization in numpy.
+
+        Returns:
+            A tuple of the quantized tensor and the scale. A per-tensor scale
+            is returned with as many (unit) dimensions as the inputs, like the
+            scales of `AbsMaxQuantizer`.
+        """
+        scale = self.scale
+        if to_numpy:
+            original_dtype = backend.standardize_dtype(x.dtype)
+            x = ops.convert_to_numpy(x)
+            if scale.ndim == 0:
+                scale = np.reshape(scale, (1,) * x.ndim)
+            outputs = np.multiply(x, scale)
+            outputs = np.clip(
+                np.round(outputs), self.value_range[0], self.value_range[1]
+            )
+            outputs = outputs.astype(self.output_dtype)
+            return ops.convert_to_tensor(outputs), ops.convert_to_tensor(
+                scale, dtype=original_dtype
+            )
+
+        x = ops.convert_to_tensor(x)
+        if scale.ndim == 0:
+            scale = np.reshape(scale, (1,) * len(x.shape))
+        scale = ops.convert_to_tensor(
+            scale, dtype=backend.standardize_dtype(x.dtype)
+        )
+        outputs = ops.multiply(x, scale)
+        outputs = ops.clip(
+            ops.round(outputs), self.value_range[0], self.value_range[1]
+        )
+        outputs = ops.cast(outputs, self.output_dtype)
+        return outputs, scale
+
+    def get_config(self):
+        return {
+            "scale": self.scale.tolist(),
+            "value_range": self.value_range,
+            "output_dtype": self.output_dtype,
+        }
+
+
 def adjust_and_nudge(min_range, max_range, num_bits, narrow_range):
     """Adjusts and nudges the quantization range for better accuracy."""
     # Use higher precision for the computation.
@@ -72,6 +72,37 @@ class QuantizersTest(testing.TestCase):
         self.assertAllClose(quantized_values, ref_quantized_values)
         self.assertAllClose(scale, ref_scale)
 
+    def test_static_quantizer(self):
+        values = random.uniform([3, 4, 5], minval=-1, maxval=1, dtype="float32")
+        quantizer = quantizers.StaticQuantizer(scale=100.0)
+        quantized_values, scale = quantizer(values, axis=-1)
+        self.assertDType(quantized_values, "int8")
+        self.assertDType(scale, "float32")
+        # The scale broadcasts like the scales of `AbsMaxQuantizer`.
+        self.assertEqual(tuple(scale.shape), (1, 1, 1))
+        self.assertAllClose(
+            quantized_values, ops.round(ops.multiply(values, 100.0))
+        )
+
+        # Values beyond the range are clipped.
+        quantized_values, _ = quantizer(ops.array([[-2.0, 2.0]]))
+        self.assertAllClose(quantized_values, [[-127, 127]])
+
+        # Per-channel scales.
+        quantizer = quantizers.StaticQuantizer(scale=[10.0, 20.0, 40.0, 80.0])
+        quantized_values, scale = quantizer(ops.ones((2, 4)))
+        self.assertEqual(tuple(scale.shape), (4,))
+        self.assertAllClose(quantized_values, [[10, 20, 40, 80]] * 2)
+        quantized_values_np, scale_np = quantizer(
+            ops.ones((2, 4)), to_numpy=True
+        )
+        self.assertAllClose(quantized_values_np, quantized_values)
+        self.assertAllClose(scale_np, scale)
+
+        self.run_class_serialization_test(quantizer)
+        with self.assertRaisesRegex(ValueError, "value_range"):
+            quantizers.StaticQuantizer(scale=1.0, value_range=(-256, 255))
+
     def test_compute_float8_scale(self):
         amax = 3.0
         scale = 4.0
@@ -1,5 +1,10 @@
 import re
 
+from keras.src.backend.common.stateless_scope import in_stateless_scope
+from keras.src.backend.common.symbolic_scope import in_symbolic_scope
+from keras.src.utils import backend_utils
+from keras.src.utils import jax_utils
+
 
 def should_quantize_layer(layer, filters):
     """Determines if a layer should be quantized based on filters.
@@ -21,3 +26,65 @@ def should_quantize_layer(layer, filters):
     if callable(filters):
         return filters(layer)
     return True
+
+
+WEIGHT_CACHE_MODES = (None, "unpacked", "dequantized")
+
+
+def validate_weight_cache_mode(mode):
+    if mode not in WEIGHT_CACHE_MODES:
+        raise ValueError(
+            "Invalid value for `inference_weight_cache`. Expected one of "
+            f"{WEIGHT_CACHE_MODES}. Received: inference_weight_cache={mode}"
+        )
+    return mode
+
+
+def can_use_weight_cache(inputs, training=None):
+    """Returns whether a layer call can use concrete cached weights.
+
+    Cached weights are regular tensors computed from the current values of
+    the variables. They are only used for eager inference: when tracing
+    (`jax.jit`, `tf.function`), in a stateless scope (where variables may be
+    overridden) or while training, the weights are recomputed from the
+    variables instead.
+    """
+    if training:
+        return False
+    if in_stateless_scope() or in_symbolic_scope():
+        return False
+    if backend_utils.in_tf_graph():
+        return False
+    if jax_utils.is_in_jax_tracing_scope(inputs):
+        return False
+    return True
+
+
+class WeightCache:
+    """Caches a tensor computed from some variables.
+
+    The cached tensor is recomputed when any of the variables is assigned
+    a new value, or when the `key` passed to `get()` changes.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._value = None
+
+    def get(self, variables, key, fn):
+        key = (
+            key,
+            tuple(
+                (id(v), getattr(v, "_assignment_count", 0)) for v in variables
+            ),
+        )
+        if key != self._key:
+            # Release the previous value before computing the new one.
+            self._value = None
+            self._value = fn()
+            self._key = key
+        return self._value
+
+    def clear(self):
+        self._key = None
+        self._value = None
@@ -35,6 +35,40 @@ class MetricsList(metrics_module.Metric):
         raise NotImplementedError
 
 
+def get_structure_key(structure):
+    """Returns a hashable description of the nesting of `structure`.
+
+    Two structures with the same key have the same flat order of their
+    leaves. Returns `None` if `structure` contains other containers than
+    lists, tuples and dicts, which can't be described cheaply.
+    """
+    if isinstance(structure, dict):
+        children = []
+        for key, value in structure.items():
+            child = get_structure_key(value)
+            if child is None:
+                return None
+            children.append((key, child))
+        return (type(structure), tuple(children))
+    if isinstance(structure, (list, tuple)):
+        children = []
+        for value in structure:
+            child = get_structure_key(value)
+            if child is None:
+                return None
+            children.append(child)
+        return (type(structure), tuple(children))
+    if tree.is_nested(structure):
+        return None
+    return ()
+
+
+def resolve_path(path, structure):
+    for key in path:
+        structure = structure[key]
+    return structure
+
+
 def is_function_like(value):
     if value is None:
         return True
@@ -457,6 +491,8 @@ class CompileLoss(losses_module.Loss):
         self._flat_losses = None
         self._y_pred_build_structure = None
         self._y_true_build_structure = None
+        # The flat plans of the losses, by structure of the inputs.
+        self._flat_plans = {}
 
     @property
     def metrics(self):
@@ -679,6 +715,7 @@ class CompileLoss(losses_module.Loss):
         self._y_true_build_structure = tree.map_structure(
             lambda x: None, y_true
         )
+        self._flat_plans = {}
         self.built = True
 
     def _get_y_pred_output_names(self, y_pred):
@@ -699,11 +736,6 @@ class CompileLoss(losses_module.Loss):
             return self.call(y_true, y_pred, sample_weight)
 
     def call(self, y_true, y_pred, sample_weight=None):
-        def resolve_path(path, object):
-            for _path in path:
-                object = object[_path]
-            return object
-
         if not tree.is_nested(y_true) and not tree.is_nested(y_pred):
             # Fast path: single output case / no loss-tracking metric.
             if not self.built:
@@ -728,6 +760,102 @@ class CompileLoss(losses_module.Loss):
                 loss_values.append(value)
             return loss_values[0]
 
+        flat_plan = self._get_flat_plan(y_true, y_pred) if self.built else None
+        if flat_plan is not None:
+            # The structures were already matched for these inputs: index the
+            # flat inputs directly.
+            flat_y_true = tree.flatten(y_true)
+            flat_y_pred = tree.flatten(y_pred)
+            targets = [
+                (flat_y_true[true_index], flat_y_pred[pred_index])
+                for true_index, pred_index in flat_plan
+            ]
+        else:
+            y_true = self._match_y_true_to_y_pred(y_true, y_pred)
+            if not self.built:
+                self.build(y_true, y_pred)
+            y_true, y_pred = self._match_build_structures(y_true, y_pred)
+            targets = [
+                (resolve_path(path, y_true), resolve_path(path, y_pred))
+                for path, _, _, _ in self._flat_losses
+            ]
+
+        # We need to add a dummy `None` if the model has only a single output.
+        metrics = [None] if len(self.metrics) == 0 else self.metrics
+
+        # Iterate all losses in flat form.
+        loss_values = []
+
+        for (path, loss_fn, loss_weight, _), metric, (y_t, y_p) in zip(
+            self._flat_losses, metrics, targets
+        ):
+            if sample_weight is not None and tree.is_nested(sample_weight):
+                _sample_weight = resolve_path(path, sample_weight)
+            else:
+                _sample_weight = sample_weight
+
+            value = ops.cast(
+                loss_fn(y_t, y_p, _sample_weight), dtype=self.dtype
+            )
+            # Record *unweighted* individual losses.
+            if metric:
+                metric.update_state(
+                    loss_module.unscale_loss_for_distribution(value),
+                    sample_weight=tree.flatten(y_p)[0].shape[0],
+                )
+            if loss_weight is not None:
+                value = ops.multiply(value, loss_weight)
+            loss_values.append(value)
+
+        if loss_values:
+            total_loss = sum(loss_values)
+            return total_loss
+        return None
+
+    def _get_flat_plan(self, y_true, y_pred):
+        """Returns the flat indices of the targets of each loss, or `None`.
+
+        The plan is a list of `(y_true_index, y_pred_index)` pairs, one per
+        entry of `self._flat_losses`, indexing `tree.flatten(y_true)` and
+        `tree.flatten(y_pred)`. It is computed once per structure of the
+        inputs, so that the steps skip the matching of the structures.
+        """
+        key = (get_structure_key(y_true), get_structure_key(y_pred))
+        if None in key:
+            return None
+        if key not in self._flat_plans:
+            self._flat_plans[key] = self._build_flat_plan(y_true, y_pred)
+        return self._flat_plans[key]
+
+    def _build_flat_plan(self, y_true, y_pred):
+        # Match the structures with the flat indices as leaves, to find where
+        # the leaves end up.
+        y_true = tree.pack_sequence_as(
+            y_true, list(range(len(tree.flatten(y_true))))
+        )
+        y_pred = tree.pack_sequence_as(
+            y_pred, list(range(len(tree.flatten(y_pred))))
+        )
+        try:
+            y_true = self._match_y_true_to_y_pred(y_true, y_pred)
+            y_true, y_pred = self._match_build_structures(y_true, y_pred)
+            flat_plan = []
+            for path, _, _, _ in self._flat_losses:
+                true_index = resolve_path(path, y_true)
+                pred_index = resolve_path(path, y_pred)
+                if not isinstance(true_index, int) or not isinstance(
+                    pred_index, int
+                ):
+                    # The loss doesn't apply to a single leaf.
+                    return None
+                flat_plan.append((true_index, pred_index))
+        except Exception:
+            # Let the matching of the actual inputs raise the error.
+            return None
+        return flat_plan
+
+    def _match_y_true_to_y_pred(self, y_true, y_pred):
+        """Packs `y_true` in the structure of `y_pred`."""
         try:
             tree.assert_same_structure(y_pred, y_true)
         except ValueError:
@@ -782,10 +910,10 @@ class CompileLoss(losses_module.Loss):
                             f"y_true: {y_true_struct}\n"
                             f"y_pred: {y_pred_struct}\n"
                         )
+        return y_true
 
-        if not self.built:
-            self.build(y_true, y_pred)
-
+    def _match_build_structures(self, y_true, y_pred):
+        """Packs `y_true` and `y_pred` in their structures at build time."""
         try:
             tree.assert_same_structure(self._y_pred_build_structure, y_pred)
         except ValueError:
@@ -798,39 +926,7 @@ class CompileLoss(losses_module.Loss):
             y_true = tree.pack_sequence_as(
                 self._y_true_build_structure, tree.flatten(y_true)
             )
-
-        # We need to add a dummy `None` if the model has only a single output.
-        metrics = [None] if len(self.metrics) == 0 else self.metrics
-
-        # Iterate all losses in flat form.
-        loss_values = []
-
-        for (path, loss_fn, loss_weight, _), metric in zip(
-            self._flat_losses, metrics
-        ):
-            y_t, y_p = resolve_path(path, y_true), resolve_path(path, y_pred)
-            if sample_weight is not None and tree.is_nested(sample_weight):
-                _sample_weight = resolve_path(path, sample_weight)
-            else:
-                _sample_weight = sample_weight
-
-            value = ops.cast(
-                loss_fn(y_t, y_p, _sample_weight), dtype=self.dtype
-            )
-            # Record *unweighted* individual losses.
-            if metric:
-                metric.update_state(
-                    loss_module.unscale_loss_for_distribution(value),
-                    sample_weight=tree.flatten(y_p)[0].shape[0],
-                )
-            if loss_weight is not None:
-                value = ops.multiply(value, loss_weight)
-            loss_values.append(value)
-
-        if loss_values:
-            total_loss = sum(loss_values)
-            return total_loss
-        return None
+        return y_true, y_pred
 
     def get_config(self):
         raise NotImplementedError
@@ -620,3 +620,31 @@ class TestCompileLoss(testing.TestCase):
         # built call
         loss = compile_loss(y_true, y_pred)
         self.assertEqual(loss, 0.0)
+
+    def test_flat_plan(self):
+        compile_loss = CompileLoss(
+            loss={"a": "mse", "b": "mae"},
+            loss_weights={"a": 1.0, "b": 0.5},
+            output_names=["a", "b"],
+        )
+        y_pred = {"a": np.zeros((4, 2)), "b": np.ones((4, 2))}
+        y_true = [np.ones((4, 2)), np.full((4, 2), 3.0)]
+        self.assertAllClose(compile_loss(y_true, y_pred), 2.0)
+        self.assertAllClose(compile_loss(y_true, y_pred), 2.0)
+        self.assertEqual(
+            list(compile_loss._flat_plans.values()), [[(0, 0), (1, 1)]]
+        )
+
+        # The plan indexes the new inputs of the same structure.
+        y_true = [np.full((4, 2), 2.0), np.zeros((4, 2))]
+        self.assertAllClose(compile_loss(y_true, y_pred), 4.5)
+        self.assertLen(compile_loss._flat_plans, 1)
+
+        # Other structures get their own plan.
+        y_true = {"a": np.zeros((4, 2)), "b": np.full((4, 2), 2.0)}
+        self.assertAllClose(compile_loss(y_true, y_pred), 0.5)
+        self.assertLen(compile_loss._flat_plans, 2)
+        with self.assertRaisesRegex(
+            ValueError, "y_true and y_pred have different structures."
+        ):
+            compile_loss([np.zeros((4, 2))], y_pred)
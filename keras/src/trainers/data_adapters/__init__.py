@@ -26,7 +26,18 @@ def get_data_adapter(
     steps_per_epoch=None,
     shuffle=False,
     class_weight=None,
+    length_bucketing=None,
 ):
+    if length_bucketing is not None and not (
+        array_data_adapter.can_convert_arrays((x, y, sample_weight))
+    ):
+        raise ValueError(
+            "Argument `length_bucketing` is only supported when the data is "
+            "an array or a tensor. To bucket the batches of a `PyDataset`, "
+            "pass `length_bucketing` to its constructor instead. "
+            f"Received: type(x)={type(x)}"
+        )
+
     # Allow passing a custom data adapter.
     if isinstance(x, data_adapter.DataAdapter):
         return x
@@ -56,6 +67,7 @@ def get_data_adapter(
             shuffle=shuffle,
             batch_size=batch_size,
             steps=steps_per_epoch,
+            length_bucketing=length_bucketing,
         )
     elif is_tf_dataset(x):
         # Unsupported args: y, sample_weight, shuffle
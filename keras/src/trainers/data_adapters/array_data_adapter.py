@@ -10,7 +10,12 @@ from keras.src.trainers.data_adapters.data_adapter import DataAdapter
 
 
 class ArrayDataAdapter(DataAdapter):
-    """Adapter for array-like objects, e.g. TF/JAX Tensors, NumPy arrays."""
+    """Adapter for array-like objects, e.g. TF/JAX Tensors, NumPy arrays.
+
+    If `length_bucketing` (a `keras.utils.LengthBucketing` instance) is
+    passed, samples are grouped into batches of similar sequence lengths and
+    the padding of each batch is trimmed.
+    """
 
     def __init__(
         self,
@@ -21,6 +26,7 @@ class ArrayDataAdapter(DataAdapter):
         steps=None,
         shuffle=False,
         class_weight=None,
+        length_bucketing=None,
     ):
         if not can_convert_arrays((x, y, sample_weight)):
             raise ValueError(
@@ -91,6 +97,9 @@ class ArrayDataAdapter(DataAdapter):
         self._batch_size = batch_size
         self._partial_batch_size = num_samples % batch_size
         self._shuffle = shuffle
+        self._length_bucketing = length_bucketing
+        if length_bucketing is not None:
+            self._sequence_lengths = length_bucketing.sequence_lengths(x)
 
     def get_numpy_iterator(self):
         inputs = array_slicing.convert_to_sliceable(
@@ -107,6 +116,24 @@ class ArrayDataAdapter(DataAdapter):
     def get_tf_dataset(self):
         from keras.src.utils.module_utils import tensorflow as tf
 
+        if self._length_bucketing is not None:
+            # Batch shapes vary, so we go through the NumPy iterator.
+            inputs = array_slicing.convert_to_sliceable(
+                self._inputs, target_backend="numpy"
+            )
+            first_batch = tree.map_structure(
+                lambda x: x.convert_to_numpy(x[: self._batch_size]),
+                inputs,
+                none_is_leaf=False,
+            )
+            dataset = tf.data.Dataset.from_generator(
+                self.get_numpy_iterator,
+                output_signature=self._length_bucketing.get_tensor_spec(
+                    [first_batch]
+                ),
+            )
+            return dataset.prefetch(tf.data.AUTOTUNE)
+
         shuffle = self._shuffle
         batch_size = self._batch_size
         num_samples = self._num_samples
@@ -260,6 +287,11 @@ class ArrayDataAdapter(DataAdapter):
 
         from keras.src.backend.torch.core import convert_to_tensor
 
+        if self._length_bucketing is not None:
+            return data_adapter_utils.get_torch_dataloader(
+                self.get_numpy_iterator()
+            )
+
         class ArrayDataset(torch.utils.data.Dataset):
             def __init__(self, array):
                 self.array = array
@@ -324,6 +356,10 @@ class ArrayDataAdapter(DataAdapter):
         )
 
     def _get_iterator(self, slice_and_convert_fn, inputs):
+        if self._length_bucketing is not None:
+            yield from self._get_bucketed_iterator(slice_and_convert_fn, inputs)
+            return
+
         global_permutation = None
         if self._shuffle and self._shuffle != "batch":
             global_permutation = np.random.permutation(self._num_samples)
@@ -345,6 +381,21 @@ class ArrayDataAdapter(DataAdapter):
                 slice_indices_and_convert_fn, inputs, none_is_leaf=False
             )
 
+    def _get_bucketed_iterator(self, slice_and_convert_fn, inputs):
+        batch_indices = self._length_bucketing.batch_indices(
+            self._sequence_lengths, self._batch_size, shuffle=self._shuffle
+        )
+        for indices in batch_indices:
+            slice_indices_and_convert_fn = functools.partial(
+                slice_and_convert_fn, indices=indices
+            )
+            batch = tree.map_structure(
+                slice_indices_and_convert_fn, inputs, none_is_leaf=False
+            )
+            yield self._length_bucketing.trim_batch(
+                batch, self._sequence_lengths[indices]
+            )
+
     @property
     def num_batches(self):
         return self._size
@@ -8,18 +8,11 @@ from keras.src import tree
 from keras.src.trainers.data_adapters import data_adapter_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
-try:
-    import pandas
-except ImportError:
-    pandas = None
-
-
-# Leave jax, tf, and torch arrays off this list. Instead we will use
+# Leave jax, tf, torch and pandas arrays off this list. Instead we will use
 # `__array__` to detect these types. Doing so allows us to avoid importing a
-# backend framework we are not currently using just to do type-checking.
+# backend framework or pandas we are not currently using just to do
+# type-checking.
 ARRAY_TYPES = (np.ndarray,)
-if pandas:
-    ARRAY_TYPES = ARRAY_TYPES + (pandas.Series, pandas.DataFrame)
 
 
 class Sliceable:
@@ -397,9 +390,9 @@ def convert_to_sliceable(arrays, target_backend=None):
                 sliceable_class = NumpySliceable
         elif data_adapter_utils.is_torch_tensor(x):
             sliceable_class = TorchSliceable
-        elif pandas is not None and isinstance(x, pandas.DataFrame):
+        elif data_adapter_utils.is_pandas_dataframe(x):
             sliceable_class = PandasDataFrameSliceable
-        elif pandas is not None and isinstance(x, pandas.Series):
+        elif data_adapter_utils.is_pandas_series(x):
             sliceable_class = PandasSeriesSliceable
         elif data_adapter_utils.is_scipy_sparse(x):
             sliceable_class = ScipySparseSliceable
@@ -424,7 +417,7 @@ def convert_to_sliceable(arrays, target_backend=None):
             )
 
         cast_dtype = None
-        if pandas is not None and isinstance(x, pandas.DataFrame):
+        if data_adapter_utils.is_pandas_dataframe(x):
             if any(is_non_floatx_float(d) for d in x.dtypes.values):
                 cast_dtype = backend.floatx()
         else:
@@ -355,6 +355,28 @@ def is_torch_tensor(value):
     return False
 
 
+def is_pandas_dataframe(value):
+    if hasattr(value, "__class__"):
+        for parent in value.__class__.__mro__:
+            if (
+                parent.__name__ == "DataFrame"
+                and str(parent.__module__).split(".")[0] == "pandas"
+            ):
+                return True
+    return False
+
+
+def is_pandas_series(value):
+    if hasattr(value, "__class__"):
+        for parent in value.__class__.__mro__:
+            if (
+                parent.__name__ == "Series"
+                and str(parent.__module__).split(".")[0] == "pandas"
+            ):
+                return True
+    return False
+
+
 def is_scipy_sparse(x):
     return str(x.__class__.__module__).startswith("scipy.sparse") and hasattr(
         x, "tocoo"
@@ -0,0 +1,398 @@
+import bisect
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.trainers.data_adapters import data_adapter_utils
+
+
+@keras_export("keras.utils.LengthBucketing")
+class LengthBucketing:
+    """Groups variable-length sequences of similar length into batches.
+
+    Sequences padded to a common length waste compute on padding when
+    batched in arrival order. With length bucketing, the data adapter reads
+    `window_size` batches worth of samples at a time, sorts them by length
+    within this window and cuts them into batches again. The padding of each
+    batch is then trimmed to the smallest of `bucket_boundaries` that fits its
+    longest sequence, which bounds both the padding and the number of distinct
+    batch shapes (and thus of retracings).
+
+    The length of a sample is the position of its last element that differs
+    from `padding_value` in the first input array, which must have shape
+    `(batch_size, sequence_length, ...)`. Every array of the batch (inputs,
+    targets and sample weights) whose second dimension is `sequence_length`
+    is trimmed.
+
+    The ratio of non-padding elements over all emitted sequence elements is
+    tracked in `padding_efficiency`.
+
+    With arrays, pass the bucketing to `fit()`:
+
+    ```python
+    bucketing = keras.utils.LengthBucketing(
+        bucket_boundaries=[32, 64, 128, 256], window_size=32
+    )
+    model.fit(x, y, batch_size=32, epochs=10, length_bucketing=bucketing)
+    print(bucketing.padding_efficiency)
+    ```
+
+    With a `keras.utils.PyDataset`, pass it to the constructor of the dataset:
+
+    ```python
+    class TextDataset(keras.utils.PyDataset):
+        def __init__(self, **kwargs):
+            super().__init__(length_bucketing=bucketing, **kwargs)
+        ...
+
+    model.fit(TextDataset(), epochs=10)
+    print(bucketing.padding_efficiency)
+    ```
+
+    Args:
+        bucket_boundaries: Optional list of increasing integers. The allowed
+            padded lengths. Batches whose longest sequence exceeds the last
+            boundary are not trimmed. If `None`, batches are trimmed to
+            their longest sequence.
+        window_size: Integer. Number of batches within which samples are
+            sorted by length. Larger windows reduce padding further but
+            make batches less random. Defaults to `16`.
+        padding_value: The value used for padding. Defaults to `0`.
+    """
+
+    def __init__(self, bucket_boundaries=None, window_size=16, padding_value=0):
+        if bucket_boundaries is not None:
+            bucket_boundaries = [int(b) for b in bucket_boundaries]
+            if (
+                not bucket_boundaries
+                or bucket_boundaries[0] <= 0
+                or any(
+                    b >= c
+                    for b, c in zip(bucket_boundaries, bucket_boundaries[1:])
+                )
+            ):
+                raise ValueError(
+                    "`bucket_boundaries` must be a non-empty list of "
+                    "strictly increasing positive integers. "
+                    f"Received: bucket_boundaries={bucket_boundaries}"
+                )
+        if not isinstance(window_size, int) or window_size < 1:
+            raise ValueError(
+                "`window_size` must be a positive integer. "
+                f"Received: window_size={window_size}"
+            )
+        self.bucket_boundaries = bucket_boundaries
+        self.window_size = window_size
+        self.padding_value = padding_value
+        self.reset_statistics()
+
+    @property
+    def padding_efficiency(self):
+        """Fraction of the emitted sequence elements that are not padding.
+
+        Returns `None` if no batch has been emitted since the last call to
+        `reset_statistics()`.
+        """
+        if not self._num_padded_elements:
+            return None
+        return self._num_elements / self._num_padded_elements
+
+    def reset_statistics(self):
+        """Resets the counters used to compute `padding_efficiency`."""
+        self._num_elements = 0
+        self._num_padded_elements = 0
+
+    def sequence_lengths(self, x):
+        """Computes the length of each sample of a batch.
+
+        Args:
+            x: The inputs of a batch, or a batch as a tuple
+                `(x, y, sample_weight)`. The lengths are computed from the
+                first input array.
+
+        Returns:
+            A NumPy int array of shape `(batch_size,)`.
+        """
+        sequences = _first_sequence_array(x)
+        not_padding = sequences != self.padding_value
+        if not_padding.ndim > 2:
+            not_padding = np.any(
+                not_padding, axis=tuple(range(2, not_padding.ndim))
+            )
+        positions = np.arange(1, not_padding.shape[1] + 1)
+        return np.max(not_padding * positions, axis=1, initial=0)
+
+    def padded_length(self, max_length, sequence_length):
+        """Returns the length to trim a batch to given its longest sample."""
+        if self.bucket_boundaries is None:
+            return max(int(max_length), 1)
+        index = bisect.bisect_left(self.bucket_boundaries, max_length)
+        if index == len(self.bucket_boundaries):
+            return sequence_length
+        return min(self.bucket_boundaries[index], sequence_length)
+
+    def batch_indices(self, lengths, batch_size, shuffle=False):
+        """Splits samples into batches of similar lengths.
+
+        Args:
+            lengths: NumPy int array with the length of each sample.
+            batch_size: Integer. Number of samples per batch. Only the last
+                batch can be smaller.
+            shuffle: Whether to shuffle the samples before windowing and the
+                batches within each window.
+
+        Returns:
+            A list of NumPy arrays of sample indices, one per batch.
+        """
+        num_samples = len(lengths)
+        if shuffle:
+            order = np.random.permutation(num_samples)
+        else:
+            order = np.arange(num_samples)
+        window = self.window_size * batch_size
+        batches = []
+        for start in range(0, num_samples, window):
+            window_indices = order[start : start + window]
+            window_indices = window_indices[
+                np.argsort(lengths[window_indices], kind="stable")
+            ]
+            window_batches = [
+                window_indices[i : i + batch_size]
+                for i in range(0, len(window_indices), batch_size)
+            ]
+            if shuffle:
+                np.random.shuffle(window_batches)
+            batches.extend(window_batches)
+        return batches
+
+    def trim_batch(self, batch, lengths=None):
+        """Trims the padding of a batch to its bucket boundary.
+
+        Args:
+            batch: A structure of arrays, as `(x, y, sample_weight)`.
+            lengths: Optional lengths of the samples of the batch, computed
+                with `sequence_lengths` if not provided.
+
+        Returns:
+            The trimmed batch.
+        """
+        if lengths is None:
+            lengths = self.sequence_lengths(batch)
+        sequence_length = _first_sequence_array(batch).shape[1]
+        padded_length = self.padded_length(
+            np.max(lengths, initial=0), sequence_length
+        )
+        self._num_elements += int(np.sum(lengths))
+        self._num_padded_elements += len(lengths) * padded_length
+        if padded_length == sequence_length:
+            return batch
+
+        def trim(x):
+            if _is_trimmable(x, sequence_length):
+                return x[:, :padded_length]
+            return x
+
+        return tree.map_structure(trim, batch, none_is_leaf=False)
+
+    def bucket_batches(self, batches, shuffle=False):
+        """Re-batches a stream of batches by sequence length.
+
+        `window_size` batches are read at a time, their samples are sorted by
+        length and split into batches with the original batch sizes, which
+        are then trimmed.
+
+        Args:
+            batches: An iterable of batches, structures of NumPy arrays.
+            shuffle: Whether to shuffle the batches within each window.
+
+        Yields:
+            The bucketed batches.
+        """
+        window = []
+        for batch in batches:
+            window.append(batch)
+            if len(window) == self.window_size:
+                yield from self._bucket_window(window, shuffle)
+                window = []
+        if window:
+            yield from self._bucket_window(window, shuffle)
+
+    def _bucket_window(self, window, shuffle):
+        batch_sizes = [_first_sequence_array(b).shape[0] for b in window]
+        samples = tree.map_structure(
+            lambda *xs: np.concatenate(xs, axis=0), *window, none_is_leaf=False
+        )
+        lengths = self.sequence_lengths(samples)
+        order = np.argsort(lengths, kind="stable")
+        boundaries = np.cumsum(batch_sizes)[:-1]
+        batch_indices = np.split(order, boundaries)
+        if shuffle:
+            np.random.shuffle(batch_indices)
+        for indices in batch_indices:
+            batch = tree.map_structure(
+                lambda x: x[indices], samples, none_is_leaf=False
+            )
+            yield self.trim_batch(batch, lengths[indices])
+
+    def get_tensor_spec(self, batches):
+        """Returns a `tf.TensorSpec` structure accepting trimmed batches.
+
+        Args:
+            batches: List of untrimmed batches.
+        """
+        sequence_length = _first_sequence_array(batches[0]).shape[1]
+        keras_specs = data_adapter_utils.get_keras_tensor_spec(batches)
+
+        def relax_sequence_axis(keras_tensor, x):
+            if keras_tensor is not None and _is_trimmable(x, sequence_length):
+                shape = list(keras_tensor.shape)
+                shape[1] = None
+                keras_tensor = backend.KerasTensor(
+                    shape=shape, dtype=keras_tensor.dtype
+                )
+            return data_adapter_utils.convert_to_tf_tensor_spec(keras_tensor)
+
+        return tree.map_structure(
+            relax_sequence_axis, keras_specs, batches[0], none_is_leaf=False
+        )
+
+
+def _first_sequence_array(batch):
+    if isinstance(batch, tuple):
+        batch = batch[0]
+    sequences = tree.flatten(batch)[0]
+    if len(sequences.shape) < 2:
+        raise ValueError(
+            "Length bucketing and sequence packing require the first input "
+            "array to have shape `(batch_size, sequence_length, ...)`. "
+            f"Received an array of shape {sequences.shape}."
+        )
+    return np.asarray(sequences)
+
+
+def _is_trimmable(x, sequence_length):
+    return (
+        (isinstance(x, np.ndarray) or data_adapter_utils.is_jax_array(x))
+        and len(x.shape) >= 2
+        and x.shape[1] == sequence_length
+    )
+
+
+@keras_export("keras.utils.pack_sequences")
+def pack_sequences(inputs, sequence_length, padding_value=0, lengths=None):
+    """Packs variable-length sequences into rows of a fixed length.
+
+    Samples are concatenated into rows of `sequence_length` elements with a
+    best-fit-decreasing strategy, so that little padding remains. The
+    `segment_ids` output identifies the sample each element comes from
+    (starting at `1` in each row, `0` for padding) and `positions` gives the
+    position of each element within its sample. Use
+    `keras.utils.packed_attention_mask(segment_ids)` to prevent attention
+    across samples.
+
+    Example:
+
+    >>> tokens = np.array([[1, 2, 3, 0], [4, 5, 0, 0], [6, 0, 0, 0]])
+    >>> packed, segment_ids, positions = keras.utils.pack_sequences(
+    ...     tokens, sequence_length=4
+    ... )
+    >>> packed
+    array([[1, 2, 3, 6],
+           [4, 5, 0, 0]])
+    >>> segment_ids
+    array([[1, 1, 1, 2],
+           [1, 1, 0, 0]], dtype=int32)
+
+    Args:
+        inputs: A NumPy array of shape `(num_samples, max_length, ...)`, or a
+            nested structure of such arrays (e.g. token ids and per-token
+            targets) sharing the same sample lengths.
+        sequence_length: Integer. The length of the packed rows.
+        padding_value: The value used for padding, both to compute the
+            sample lengths and to fill the packed rows. Defaults to `0`.
+        lengths: Optional int array of shape `(num_samples,)` with the
+            length of each sample. If `None`, it is computed from the first
+            array of `inputs` as the position of its last non-padding
+            element.
+
+    Returns:
+        A tuple `(packed_inputs, segment_ids, positions)` where
+        `packed_inputs` has the structure of `inputs` with arrays of shape
+        `(num_rows, sequence_length, ...)`, and `segment_ids` and `positions`
+        are int32 arrays of shape `(num_rows, sequence_length)`.
+    """
+    inputs = tree.map_structure(np.asarray, inputs)
+    if lengths is None:
+        lengths = LengthBucketing(padding_value=padding_value).sequence_lengths(
+            inputs
+        )
+    lengths = np.asarray(lengths, dtype="int64")
+    if np.any(lengths > sequence_length):
+        raise ValueError(
+            "All samples must fit in `sequence_length`. Received "
+            f"sequence_length={sequence_length} and a sample of length "
+            f"{int(np.max(lengths))}."
+        )
+
+    # Best-fit decreasing: place each sample, longest first, in the row with
+    # the least remaining space that can hold it.
+    remaining = []  # Sorted list of `(remaining_space, row)`.
+    row_lengths = []
+    placements = np.zeros((len(lengths), 2), dtype="int64")
+    for i in np.argsort(-lengths, kind="stable"):
+        length = lengths[i]
+        index = bisect.bisect_left(remaining, (length, -1))
+        if index == len(remaining):
+            row = len(row_lengths)
+            row_lengths.append(0)
+        else:
+            row = remaining.pop(index)[1]
+        placements[i] = (row, row_lengths[row])
+        row_lengths[row] += length
+        bisect.insort(remaining, (sequence_length - row_lengths[row], row))
+
+    num_rows = len(row_lengths)
+    segment_ids = np.zeros((num_rows, sequence_length), dtype="int32")
+    positions = np.zeros((num_rows, sequence_length), dtype="int32")
+    packed_inputs = tree.map_structure(
+        lambda x: np.full(
+            (num_rows, sequence_length) + x.shape[2:], padding_value, x.dtype
+        ),
+        inputs,
+    )
+    num_segments = np.zeros((num_rows,), dtype="int32")
+    # Fill rows in sample order so that segment ids follow the input order.
+    for i, (row, offset) in enumerate(placements):
+        length = lengths[i]
+        num_segments[row] += 1
+        segment_ids[row, offset : offset + length] = num_segments[row]
+        positions[row, offset : offset + length] = np.arange(length)
+        for packed, x in zip(tree.flatten(packed_inputs), tree.flatten(inputs)):
+            packed[row, offset : offset + length] = x[i, :length]
+    return packed_inputs, segment_ids, positions
+
+
+@keras_export("keras.utils.packed_attention_mask")
+def packed_attention_mask(segment_ids):
+    """Creates an attention mask for sequences packed with `pack_sequences`.
+
+    Each element can only attend to elements of the same sample, and padding
+    (segment id `0`) neither attends nor is attended to. The mask can be
+    passed as the `mask` argument of `keras.ops.dot_product_attention`;
+    combine it with `is_causal=True` for causal attention.
+
+    Args:
+        segment_ids: Int tensor of shape `(batch_size, sequence_length)`.
+
+    Returns:
+        A boolean tensor of shape
+        `(batch_size, 1, sequence_length, sequence_length)`.
+    """
+    segment_ids = ops.convert_to_tensor(segment_ids)
+    queries = ops.expand_dims(segment_ids, axis=-1)
+    keys = ops.expand_dims(segment_ids, axis=-2)
+    mask = ops.logical_and(ops.equal(queries, keys), ops.not_equal(keys, 0))
+    return ops.expand_dims(mask, axis=1)
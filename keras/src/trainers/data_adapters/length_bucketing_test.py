@@ -0,0 +1,323 @@
+import math
+
+import numpy as np
+import pytest
+import tensorflow as tf
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import testing
+from keras.src.trainers.data_adapters import array_data_adapter
+from keras.src.trainers.data_adapters import py_dataset_adapter
+from keras.src.trainers.data_adapters.length_bucketing import LengthBucketing
+from keras.src.trainers.data_adapters.length_bucketing import pack_sequences
+from keras.src.trainers.data_adapters.length_bucketing import (
+    packed_attention_mask,
+)
+
+
+def make_sequences(num_samples, sequence_length, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, sequence_length + 1, size=(num_samples,))
+    x = np.zeros((num_samples, sequence_length), dtype="int32")
+    for i, length in enumerate(lengths):
+        x[i, :length] = rng.integers(1, 100, size=(length,))
+    return x, lengths
+
+
+class SequenceDataset(py_dataset_adapter.PyDataset):
+    def __init__(self, x, y, batch_size, **kwargs):
+        super().__init__(**kwargs)
+        self.x = x
+        self.y = y
+        self.batch_size = batch_size
+
+    def __len__(self):
+        return math.ceil(len(self.x) / self.batch_size)
+
+    def __getitem__(self, idx):
+        batch = slice(idx * self.batch_size, (idx + 1) * self.batch_size)
+        return self.x[batch], self.y[batch]
+
+
+class LengthBucketingTest(testing.TestCase):
+    def test_sequence_lengths(self):
+        bucketing = LengthBucketing()
+        x = np.array([[1, 2, 0, 0], [1, 0, 3, 0], [0, 0, 0, 0]])
+        self.assertAllClose(bucketing.sequence_lengths(x), [2, 3, 0])
+        self.assertAllClose(bucketing.sequence_lengths((x, x)), [2, 3, 0])
+        # Feature axes are reduced.
+        x = np.zeros((2, 3, 2))
+        x[0, 1, 1] = 1.0
+        self.assertAllClose(bucketing.sequence_lengths(x), [2, 0])
+
+    def test_padded_length(self):
+        bucketing = LengthBucketing(bucket_boundaries=[4, 8])
+        self.assertEqual(bucketing.padded_length(3, 16), 4)
+        self.assertEqual(bucketing.padded_length(4, 16), 4)
+        self.assertEqual(bucketing.padded_length(5, 16), 8)
+        self.assertEqual(bucketing.padded_length(9, 16), 16)
+        self.assertEqual(bucketing.padded_length(5, 6), 6)
+        self.assertEqual(LengthBucketing().padded_length(5, 16), 5)
+
+    def test_batch_indices(self):
+        bucketing = LengthBucketing(window_size=2)
+        lengths = np.array([5, 1, 4, 2, 3, 6, 7, 8, 1])
+        batches = bucketing.batch_indices(lengths, batch_size=2)
+        self.assertEqual([len(b) for b in batches], [2, 2, 2, 2, 1])
+        # Samples are sorted by length within windows of 4 samples.
+        self.assertAllClose(np.concatenate(batches[:2]), [1, 3, 2, 0])
+        self.assertAllClose(np.concatenate(batches[2:4]), [4, 5, 6, 7])
+
+        batches = bucketing.batch_indices(lengths, batch_size=2, shuffle=True)
+        self.assertAllClose(np.sort(np.concatenate(batches)), np.arange(9))
+
+    def test_trim_batch(self):
+        bucketing = LengthBucketing(bucket_boundaries=[2, 4])
+        x = np.array([[1, 2, 3, 0, 0, 0], [1, 0, 0, 0, 0, 0]])
+        y = np.ones((2, 6, 3))
+        sample_weight = np.ones((2,))
+        x_out, y_out, sw_out = bucketing.trim_batch((x, y, sample_weight))
+        self.assertAllClose(x_out, x[:, :4])
+        self.assertEqual(y_out.shape, (2, 4, 3))
+        self.assertEqual(sw_out.shape, (2,))
+        self.assertAllClose(bucketing.padding_efficiency, 4 / 8)
+
+        bucketing.reset_statistics()
+        self.assertIsNone(bucketing.padding_efficiency)
+
+    def test_bucket_batches(self):
+        x, lengths = make_sequences(40, 16)
+        bucketing = LengthBucketing(window_size=4)
+        batches = [(x[i : i + 8], lengths[i : i + 8]) for i in range(0, 40, 8)]
+        outputs = list(bucketing.bucket_batches(batches))
+        self.assertEqual([len(b[0]) for b in outputs], [8] * 5)
+        for x_batch, lengths_batch in outputs:
+            self.assertEqual(x_batch.shape[1], np.max(lengths_batch))
+        # Samples only move within their window.
+        self.assertAllClose(
+            np.sort(np.concatenate([b[1] for b in outputs[:4]])),
+            np.sort(lengths[:32]),
+        )
+        # Sorting within windows reduces padding.
+        efficiency = np.sum(lengths) / (40 * 16)
+        self.assertGreater(bucketing.padding_efficiency, efficiency)
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, "`bucket_boundaries` must"):
+            LengthBucketing(bucket_boundaries=[4, 2])
+        with self.assertRaisesRegex(ValueError, "`bucket_boundaries` must"):
+            LengthBucketing(bucket_boundaries=[])
+        with self.assertRaisesRegex(ValueError, "`window_size` must"):
+            LengthBucketing(window_size=0)
+        with self.assertRaisesRegex(ValueError, "first input array"):
+            LengthBucketing().sequence_lengths(np.ones((4,)))
+
+    @parameterized.named_parameters(
+        [
+            ("np", "np"),
+            ("tf", "tf"),
+            ("jax", "jax"),
+            ("torch", "torch"),
+        ]
+    )
+    def test_array_data_adapter(self, iterator_type):
+        x, lengths = make_sequences(64, 32)
+        y = (x > 0).astype("float32")
+        bucketing = LengthBucketing(bucket_boundaries=[8, 16, 24])
+        adapter = array_data_adapter.ArrayDataAdapter(
+            x, y, batch_size=8, shuffle=True, length_bucketing=bucketing
+        )
+        self.assertEqual(adapter.num_batches, 8)
+
+        if iterator_type == "np":
+            it = adapter.get_numpy_iterator()
+            expected_class = np.ndarray
+        elif iterator_type == "tf":
+            it = adapter.get_tf_dataset()
+            expected_class = tf.Tensor
+        elif iterator_type == "jax":
+            it = adapter.get_jax_iterator()
+            # NumPy inputs are already JAX compatible.
+            expected_class = np.ndarray
+        elif iterator_type == "torch":
+            torch = pytest.importorskip("torch")
+            it = adapter.get_torch_dataloader()
+            expected_class = torch.Tensor
+
+        num_samples = 0
+        sequence_lengths = set()
+        for bx, by in it:
+            self.assertIsInstance(bx, expected_class)
+            self.assertEqual(bx.shape, by.shape)
+            self.assertIn(bx.shape[1], (8, 16, 24, 32))
+            bx = backend.convert_to_numpy(bx)
+            self.assertAllClose(backend.convert_to_numpy(by), bx > 0)
+            num_samples += bx.shape[0]
+            sequence_lengths.add(bx.shape[1])
+        self.assertEqual(num_samples, 64)
+        self.assertGreater(len(sequence_lengths), 1)
+        self.assertGreater(
+            bucketing.padding_efficiency, np.sum(lengths) / (64 * 32)
+        )
+
+    @parameterized.named_parameters(
+        [
+            ("np", "np", False),
+            ("tf", "tf", False),
+            ("jax_multithreading", "jax", True),
+        ]
+    )
+    def test_py_dataset_adapter(self, iterator_type, multithreading):
+        x, lengths = make_sequences(64, 32)
+        y = (x > 0).astype("float32")
+        bucketing = LengthBucketing(window_size=4)
+        kwargs = {"workers": 2} if multithreading else {}
+        py_dataset = SequenceDataset(
+            x, y, batch_size=8, length_bucketing=bucketing, **kwargs
+        )
+        adapter = py_dataset_adapter.PyDatasetAdapter(py_dataset, shuffle=True)
+
+        if iterator_type == "np":
+            it = adapter.get_numpy_iterator()
+        elif iterator_type == "tf":
+            it = adapter.get_tf_dataset()
+        elif iterator_type == "jax":
+            it = adapter.get_jax_iterator()
+
+        num_samples = 0
+        for bx, by in it:
+            bx = backend.convert_to_numpy(bx)
+            self.assertAllClose(backend.convert_to_numpy(by), bx > 0)
+            # Batches are trimmed to their longest sequence.
+            self.assertEqual(
+                bx.shape[1], np.max(bucketing.sequence_lengths(bx))
+            )
+            num_samples += bx.shape[0]
+        self.assertEqual(num_samples, 64)
+
+    @pytest.mark.requires_trainable_backend
+    def test_fit_with_py_dataset(self):
+        from keras.src import layers
+        from keras.src import models
+
+        x, _ = make_sequences(32, 16)
+        y = np.ones((32, 1), dtype="float32")
+        bucketing = LengthBucketing(bucket_boundaries=[4, 8, 12])
+        model = models.Sequential(
+            [
+                layers.Embedding(100, 4, mask_zero=True),
+                layers.GlobalAveragePooling1D(),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer="sgd", loss="mse")
+        history = model.fit(
+            SequenceDataset(x, y, batch_size=4, length_bucketing=bucketing),
+            epochs=2,
+            verbose=0,
+        )
+        self.assertLen(history.history["loss"], 2)
+
+    @pytest.mark.requires_trainable_backend
+    def test_fit_with_arrays(self):
+        from keras.src import layers
+        from keras.src import models
+
+        x, lengths = make_sequences(32, 16)
+        y = np.ones((32, 1), dtype="float32")
+        bucketing = LengthBucketing(bucket_boundaries=[4, 8, 12])
+        model = models.Sequential(
+            [
+                layers.Embedding(100, 4, mask_zero=True),
+                layers.GlobalAveragePooling1D(),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer="sgd", loss="mse")
+        history = model.fit(
+            x, y, batch_size=4, epochs=2, verbose=0, length_bucketing=bucketing
+        )
+        self.assertLen(history.history["loss"], 2)
+        # The padding of the batches was trimmed.
+        self.assertGreater(
+            bucketing.padding_efficiency, np.sum(lengths) / x.size
+        )
+
+        with self.assertRaisesRegex(ValueError, "`length_bucketing` is only"):
+            model.fit(
+                SequenceDataset(x, y, batch_size=4),
+                verbose=0,
+                length_bucketing=bucketing,
+            )
+
+
+class PackSequencesTest(testing.TestCase):
+    def test_pack_sequences(self):
+        x, lengths = make_sequences(50, 16, seed=1)
+        y = x * 2
+        (px, py), segment_ids, positions = pack_sequences(
+            (x, y), sequence_length=32
+        )
+        self.assertEqual(px.shape, segment_ids.shape)
+        self.assertEqual(positions.dtype, "int32")
+        # Best-fit decreasing leaves little padding.
+        self.assertLessEqual(
+            px.shape[0], math.ceil(np.sum(lengths) / 32 * 1.25)
+        )
+        self.assertEqual(np.count_nonzero(segment_ids), np.sum(lengths))
+        self.assertAllClose(py, px * 2)
+        self.assertAllClose(px[segment_ids == 0], 0)
+
+        # Every sample is recovered from its segment.
+        recovered = []
+        for row in range(px.shape[0]):
+            for segment in range(1, segment_ids[row].max() + 1):
+                tokens = px[row][segment_ids[row] == segment]
+                self.assertAllClose(
+                    positions[row][segment_ids[row] == segment],
+                    np.arange(len(tokens)),
+                )
+                recovered.append(tuple(tokens))
+        expected = [tuple(x[i, :length]) for i, length in enumerate(lengths)]
+        self.assertEqual(sorted(recovered), sorted(expected))
+
+    def test_pack_sequences_with_lengths(self):
+        x = np.array([[1, 0, 0], [2, 2, 0], [3, 0, 0]])
+        packed, segment_ids, positions = pack_sequences(
+            x, sequence_length=3, lengths=[1, 2, 1]
+        )
+        self.assertAllClose(packed, [[2, 2, 1], [3, 0, 0]])
+        self.assertAllClose(segment_ids, [[2, 2, 1], [1, 0, 0]])
+        self.assertAllClose(positions, [[0, 1, 0], [0, 0, 0]])
+
+    def test_pack_sequences_errors(self):
+        with self.assertRaisesRegex(ValueError, "must fit"):
+            pack_sequences(np.ones((2, 8)), sequence_length=4)
+
+    def test_packed_attention_mask(self):
+        segment_ids = np.array([[1, 1, 2, 0]])
+        mask = backend.convert_to_numpy(packed_attention_mask(segment_ids))
+        self.assertEqual(mask.shape, (1, 1, 4, 4))
+        self.assertAllClose(
+            mask[0, 0],
+            [
+                [True, True, False, False],
+                [True, True, False, False],
+                [False, False, True, False],
+                [False, False, False, False],
+            ],
+        )
+
+    def test_packed_attention_matches_unpacked(self):
+        rng = np.random.default_rng(0)
+        q = rng.standard_normal((1, 5, 2, 4)).astype("float32")
+        segment_ids = np.array([[1, 1, 1, 2, 2]])
+        mask = packed_attention_mask(segment_ids)
+        packed = ops.dot_product_attention(q, q, q, mask=mask)
+        first = ops.dot_product_attention(q[:, :3], q[:, :3], q[:, :3])
+        second = ops.dot_product_attention(q[:, 3:], q[:, 3:], q[:, 3:])
+        self.assertAllClose(
+            packed, ops.concatenate([first, second], axis=1), atol=1e-5
+        )
@@ -40,6 +40,11 @@ class PyDataset:
             multiprocessed setting.
             Reduce this value to reduce the CPU memory consumption of
             your dataset. Defaults to 10.
+        length_bucketing: Optional `keras.utils.LengthBucketing` instance.
+            If set, the samples of consecutive batches are regrouped by
+            sequence length and the padding of each batch is trimmed when
+            iterating over the dataset in `fit()`, `evaluate()` and
+            `predict()`.
 
     Notes:
 
@@ -90,10 +95,17 @@ class PyDataset:
     ```
     """
 
-    def __init__(self, workers=1, use_multiprocessing=False, max_queue_size=10):
+    def __init__(
+        self,
+        workers=1,
+        use_multiprocessing=False,
+        max_queue_size=10,
+        length_bucketing=None,
+    ):
         self._workers = workers
         self._use_multiprocessing = use_multiprocessing
         self._max_queue_size = max_queue_size
+        self._length_bucketing = length_bucketing
 
     def _warn_if_super_not_called(self):
         warn = False
@@ -143,6 +155,14 @@ class PyDataset:
     def max_queue_size(self, value):
         self._max_queue_size = value
 
+    @property
+    def length_bucketing(self):
+        return getattr(self, "_length_bucketing", None)
+
+    @length_bucketing.setter
+    def length_bucketing(self, value):
+        self._length_bucketing = value
+
     def __getitem__(self, index):
         """Gets batch at position `index`.
 
@@ -280,14 +300,21 @@ class PyDatasetAdapter(DataAdapter):
     def _get_iterator(self):
         if self.enqueuer is None:
             if self.py_dataset.num_batches is None:
-                return self._infinite_generator()
+                iterator = self._infinite_generator()
             else:
-                return self._finite_generator()
+                iterator = self._finite_generator()
         else:
             if self.py_dataset.num_batches is None:
-                return self._infinite_enqueuer_generator()
+                iterator = self._infinite_enqueuer_generator()
             else:
-                return self._finite_enqueuer_generator()
+                iterator = self._finite_enqueuer_generator()
+        length_bucketing = self.py_dataset.length_bucketing
+        if length_bucketing is not None:
+            iterator = length_bucketing.bucket_batches(
+                data_adapter_utils.get_numpy_iterator(iterator),
+                shuffle=self.shuffle,
+            )
+        return iterator
 
     def get_numpy_iterator(self):
         return data_adapter_utils.get_numpy_iterator(self._get_iterator())
@@ -309,7 +336,16 @@ class PyDatasetAdapter(DataAdapter):
             ]
             if len(batches) == 0:
                 raise ValueError("The PyDataset has length 0")
-            self._output_signature = data_adapter_utils.get_tensor_spec(batches)
+            length_bucketing = self.py_dataset.length_bucketing
+            if length_bucketing is not None:
+                batches = list(data_adapter_utils.get_numpy_iterator(batches))
+                self._output_signature = length_bucketing.get_tensor_spec(
+                    batches
+                )
+            else:
+                self._output_signature = data_adapter_utils.get_tensor_spec(
+                    batches
+                )
 
         ds = tf.data.Dataset.from_generator(
             self._get_iterator,
@@ -43,6 +43,7 @@ import contextlib
 import warnings
 
 from keras.src.backend import config
+from keras.src.callbacks import step_profiler
 from keras.src.trainers import data_adapters
 
 
@@ -57,6 +58,7 @@ class EpochIterator:
         shuffle=False,
         class_weight=None,
         steps_per_execution=1,
+        length_bucketing=None,
     ):
         # Possibly cap steps_per_epoch for debugging runs.
         max_steps_per_epoch = config.max_steps_per_epoch()
@@ -79,12 +81,16 @@ class EpochIterator:
             steps_per_epoch=steps_per_epoch,
             shuffle=shuffle,
             class_weight=class_weight,
+            length_bucketing=length_bucketing,
         )
         self._num_batches = self.data_adapter.num_batches
 
     def _get_iterator(self):
         return self.data_adapter.get_numpy_iterator()
 
+    def _make_iterator(self):
+        return step_profiler.profile_data_iterator(iter(self._get_iterator()))
+
     def _interrupted_warning(self):
         warnings.warn(
             "Your input ran out of data; interrupting training. "
@@ -108,7 +114,7 @@ class EpochIterator:
 
         if steps_per_epoch > 0:
             if self._current_iterator is None or self.steps_per_epoch is None:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._make_iterator()
                 self._steps_seen = 0
             for step in range(0, steps_per_epoch, self.steps_per_execution):
                 if self._num_batches and self._steps_seen >= self._num_batches:
@@ -122,10 +128,10 @@ class EpochIterator:
                     self._current_iterator,
                 )
             if self._num_batches and self._steps_seen >= self._num_batches:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._make_iterator()
                 self._steps_seen = 0
         else:
-            iterator = iter(self._get_iterator())
+            iterator = self._make_iterator()
             step = -self.steps_per_execution
             while True:
                 step += self.steps_per_execution
@@ -0,0 +1,260 @@
+import bisect
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+
+
+@keras_export("keras.utils.ShapeBuckets")
+class ShapeBuckets:
+    """Pads the inputs of inference to a fixed set of bucket shapes.
+
+    Compiled functions are specialized to the shapes of their inputs: with
+    the JAX backend, and with `torch.compile`, every new batch size (such as
+    the last, partial batch of `predict()`) or sequence length triggers a new
+    compilation. When serving requests of varying sizes, these compilations
+    cause latency spikes.
+
+    With shape buckets, the batch size (and optionally the sequence length)
+    of the inputs is padded up to the smallest bucket that fits it, so that
+    only one compilation per bucket happens. The outputs are then sliced
+    back to the original batch size and sequence length. Sizes larger than
+    the largest bucket are not padded.
+
+    The buckets apply to `predict()`, `predict_on_batch()` and
+    `predict_on_tensors()`. Pass them to `compile()`:
+
+    ```python
+    buckets = keras.utils.ShapeBuckets(batch_sizes=[1, 8, 32, 128])
+    model.compile(shape_buckets=buckets)
+    for request in requests:
+        model.predict_on_batch(request)
+    print(buckets.cache_info())
+    ```
+
+    When padding the sequence length, the model should ignore the padded
+    positions, e.g. with an `Embedding` layer using `mask_zero=True`, for
+    the outputs at the other positions to be unchanged.
+
+    Args:
+        batch_sizes: The allowed padded batch sizes. Either
+            `"powers_of_two"`, a list of positive integers, or `None` to
+            not pad the batch size. Defaults to `"powers_of_two"`.
+        sequence_lengths: The allowed padded sequence lengths, in the same
+            format as `batch_sizes`. Defaults to `None`.
+        sequence_axis: Integer. The axis of the sequence length in the
+            inputs. Only the inputs with more than `sequence_axis` dimensions
+            are padded along it. Defaults to `1`.
+        padding_value: The value used for padding. Defaults to `0`.
+    """
+
+    def __init__(
+        self,
+        batch_sizes="powers_of_two",
+        sequence_lengths=None,
+        sequence_axis=1,
+        padding_value=0,
+    ):
+        self.batch_sizes = _standardize_buckets(batch_sizes, "batch_sizes")
+        self.sequence_lengths = _standardize_buckets(
+            sequence_lengths, "sequence_lengths"
+        )
+        if not isinstance(sequence_axis, int) or sequence_axis < 1:
+            raise ValueError(
+                "`sequence_axis` must be a positive integer. "
+                f"Received: sequence_axis={sequence_axis}"
+            )
+        self.sequence_axis = sequence_axis
+        self.padding_value = padding_value
+        self.reset_statistics()
+
+    def get_config(self):
+        return {
+            "batch_sizes": self.batch_sizes,
+            "sequence_lengths": self.sequence_lengths,
+            "sequence_axis": self.sequence_axis,
+            "padding_value": self.padding_value,
+        }
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+    def reset_statistics(self):
+        """Resets the counters returned by `cache_info()`."""
+        self._signatures = set()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self):
+        """Returns the number of hits and misses of the padded shapes.
+
+        A miss is a padded input signature (shapes and dtypes) seen for the
+        first time, which triggers a compilation of the compiled function.
+        A hit is a signature seen before, which reuses it.
+
+        Returns:
+            A dict with the integer entries `"hits"`, `"misses"` and
+            `"signatures"`, the number of distinct signatures.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "signatures": len(self._signatures),
+        }
+
+    def bucket_size(self, size, buckets):
+        """Returns the bucket of `size` among `buckets`.
+
+        Args:
+            size: Integer. The size to pad.
+            buckets: The buckets, as standardized in `batch_sizes` or
+                `sequence_lengths`.
+
+        Returns:
+            The smallest bucket greater than or equal to `size`, or `size`
+            if there is none.
+        """
+        if buckets is None or size == 0:
+            return size
+        if buckets == "powers_of_two":
+            return 1 << (size - 1).bit_length()
+        index = bisect.bisect_left(buckets, size)
+        if index == len(buckets):
+            return size
+        return buckets[index]
+
+    def pad(self, x):
+        """Pads a batch of inputs to its bucket shape.
+
+        Args:
+            x: A structure of input arrays or tensors. The batch size is the
+                first dimension of its first array.
+
+        Returns:
+            A tuple `(padded_x, padding)`, where `padding` is passed to
+            `unpad()` to slice the outputs back.
+        """
+        flat_x = [v for v in tree.flatten(x) if _get_shape(v) is not None]
+        if not flat_x:
+            return x, None
+        batch_size = _get_shape(flat_x[0])[0]
+        padded_batch_size = self.bucket_size(batch_size, self.batch_sizes)
+        sequence_length = padded_sequence_length = None
+        axis = self.sequence_axis
+        for v in flat_x:
+            if len(_get_shape(v)) > axis:
+                sequence_length = _get_shape(v)[axis]
+                padded_sequence_length = self.bucket_size(
+                    sequence_length, self.sequence_lengths
+                )
+                break
+
+        def pad_array(v):
+            shape = _get_shape(v)
+            if shape is None or not shape:
+                return v
+            pad_width = [[0, 0] for _ in shape]
+            if shape[0] == batch_size:
+                pad_width[0][1] = padded_batch_size - batch_size
+            if len(shape) > axis and self.sequence_lengths is not None:
+                pad_width[axis][1] = (
+                    self.bucket_size(shape[axis], self.sequence_lengths)
+                    - shape[axis]
+                )
+            if not any(after for _, after in pad_width):
+                return v
+            if isinstance(v, np.ndarray):
+                return np.pad(v, pad_width, constant_values=self.padding_value)
+            return ops.pad(v, pad_width, constant_values=self.padding_value)
+
+        x = tree.map_structure(pad_array, x)
+        signature = tuple(
+            (tuple(_get_shape(v)), backend.standardize_dtype(v.dtype))
+            for v in tree.flatten(x)
+            if _get_shape(v) is not None
+        )
+        if signature in self._signatures:
+            self._hits += 1
+        else:
+            self._signatures.add(signature)
+            self._misses += 1
+        return x, (
+            batch_size,
+            padded_batch_size,
+            sequence_length,
+            padded_sequence_length,
+        )
+
+    def unpad(self, outputs, padding):
+        """Slices the outputs of padded inputs back to the original shape.
+
+        The outputs whose first dimension is the padded batch size are sliced
+        to the original batch size, and those whose `sequence_axis` dimension
+        is the padded sequence length to the original sequence length.
+
+        Args:
+            outputs: A structure of output arrays or tensors.
+            padding: The padding returned by `pad()`.
+
+        Returns:
+            The sliced outputs.
+        """
+        if padding is None:
+            return outputs
+        (
+            batch_size,
+            padded_batch_size,
+            sequence_length,
+            padded_sequence_length,
+        ) = padding
+        if (
+            batch_size == padded_batch_size
+            and sequence_length == padded_sequence_length
+        ):
+            return outputs
+        axis = self.sequence_axis
+
+        def unpad_array(v):
+            shape = _get_shape(v)
+            if shape is None or not shape:
+                return v
+            if shape[0] == padded_batch_size != batch_size:
+                v = v[:batch_size]
+            if (
+                len(shape) > axis
+                and shape[axis] == padded_sequence_length != sequence_length
+            ):
+                v = v[(slice(None),) * axis + (slice(0, sequence_length),)]
+            return v
+
+        return tree.map_structure(unpad_array, outputs)
+
+
+def _standardize_buckets(buckets, name):
+    if buckets is None or buckets == "powers_of_two":
+        return buckets
+    if not isinstance(buckets, str):
+        try:
+            standardized = sorted(set(int(b) for b in buckets))
+        except (TypeError, ValueError):
+            standardized = None
+        if standardized and standardized[0] > 0:
+            return standardized
+    raise ValueError(
+        f"`{name}` must be `'powers_of_two'`, a non-empty list of positive "
+        f"integers or `None`. Received: {name}={buckets}"
+    )
+
+
+def _get_shape(x):
+    shape = getattr(x, "shape", None)
+    if shape is None:
+        return None
+    shape = tuple(shape)
+    if any(d is None for d in shape):
+        return None
+    return shape
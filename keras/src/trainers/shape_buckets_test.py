@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import saving
+from keras.src import testing
+from keras.src.trainers.shape_buckets import ShapeBuckets
+
+
+class ShapeBucketsTest(testing.TestCase):
+    def test_bucket_size(self):
+        buckets = ShapeBuckets()
+        self.assertEqual(
+            [buckets.bucket_size(n, "powers_of_two") for n in (1, 2, 3, 5)],
+            [1, 2, 4, 8],
+        )
+        self.assertEqual(
+            [buckets.bucket_size(n, [4, 16]) for n in (1, 4, 5, 17)],
+            [4, 4, 16, 17],
+        )
+        self.assertEqual(buckets.bucket_size(5, None), 5)
+
+    def test_pad_and_unpad(self):
+        buckets = ShapeBuckets(batch_sizes=[4, 8], sequence_lengths=[16])
+        x = {
+            "tokens": np.ones((3, 10), dtype="int32"),
+            "features": ops.ones((3,)),
+        }
+        padded, padding = buckets.pad(x)
+        self.assertEqual(padded["tokens"].shape, (4, 16))
+        self.assertEqual(tuple(padded["features"].shape), (4,))
+        self.assertAllClose(padded["tokens"][:3, :10], x["tokens"])
+        self.assertAllClose(padded["tokens"][3], np.zeros((16,)))
+        self.assertAllClose(padded["tokens"][:, 10:], np.zeros((4, 6)))
+
+        outputs = (ops.ones((4, 16, 2)), ops.ones((4,)), ops.ones(()))
+        outputs = buckets.unpad(outputs, padding)
+        self.assertEqual(tuple(outputs[0].shape), (3, 10, 2))
+        self.assertEqual(tuple(outputs[1].shape), (3,))
+        self.assertEqual(tuple(outputs[2].shape), ())
+
+    def test_no_padding_above_largest_bucket(self):
+        buckets = ShapeBuckets(batch_sizes=[4])
+        x = np.ones((5, 2))
+        padded, padding = buckets.pad(x)
+        self.assertIs(padded, x)
+        self.assertIs(buckets.unpad(x, padding), x)
+
+    def test_cache_info(self):
+        buckets = ShapeBuckets()
+        for batch_size in (3, 4, 5, 8, 2):
+            buckets.pad(np.ones((batch_size, 2)))
+        self.assertEqual(
+            buckets.cache_info(), {"hits": 2, "misses": 3, "signatures": 3}
+        )
+        buckets.pad(np.ones((3, 2), dtype="int32"))
+        self.assertEqual(buckets.cache_info()["misses"], 4)
+        buckets.reset_statistics()
+        self.assertEqual(
+            buckets.cache_info(), {"hits": 0, "misses": 0, "signatures": 0}
+        )
+
+    def test_serialization(self):
+        buckets = ShapeBuckets(
+            batch_sizes=[8, 1],
+            sequence_lengths="powers_of_two",
+            sequence_axis=2,
+        )
+        new_buckets = ShapeBuckets.from_config(buckets.get_config())
+        self.assertEqual(new_buckets.get_config(), buckets.get_config())
+        self.assertEqual(new_buckets.batch_sizes, [1, 8])
+
+        # The buckets are saved with the compile config of the model.
+        model = models.Sequential([layers.Input((4,)), layers.Dense(2)])
+        model.compile(loss="mse", shape_buckets=buckets)
+        temp_filepath = os.path.join(self.get_temp_dir(), "model.keras")
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertIsInstance(new_model.shape_buckets, ShapeBuckets)
+        self.assertEqual(
+            new_model.shape_buckets.get_config(), buckets.get_config()
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, "`batch_sizes` must be"):
+            ShapeBuckets(batch_sizes=[0, 4])
+        with self.assertRaisesRegex(ValueError, "`batch_sizes` must be"):
+            ShapeBuckets(batch_sizes="linear")
+        with self.assertRaisesRegex(ValueError, "`sequence_lengths` must be"):
+            ShapeBuckets(sequence_lengths=[])
+        with self.assertRaisesRegex(ValueError, "`sequence_axis` must be"):
+            ShapeBuckets(sequence_axis=0)
+        model = models.Sequential([layers.Dense(2)])
+        with self.assertRaisesRegex(ValueError, "`shape_buckets` must be"):
+            model.compile(shape_buckets=[8])
+
+    @pytest.mark.skipif(
+        backend.backend() == "numpy", reason="masking not supported with numpy"
+    )
+    def test_predict_with_shape_buckets(self):
+        inputs = layers.Input((None,), dtype="int32")
+        embeddings = layers.Embedding(10, 4, mask_zero=True)(inputs)
+        outputs = layers.GlobalAveragePooling1D()(embeddings)
+        model = models.Model(inputs, outputs)
+        rng = np.random.default_rng(0)
+        x = rng.integers(1, 10, size=(13, 5)).astype("int32")
+        expected = model.predict(x, batch_size=13, verbose=0)
+
+        buckets = ShapeBuckets(sequence_lengths=[8])
+        model.compile(shape_buckets=buckets)
+        outputs = model.predict(x, batch_size=5, verbose=0)
+        self.assertAllClose(outputs, expected, atol=1e-6)
+        for batch_size in (1, 3, 4):
+            self.assertAllClose(
+                model.predict_on_batch(x[:batch_size]),
+                expected[:batch_size],
+                atol=1e-6,
+            )
+            self.assertAllClose(
+                model.predict_on_tensors(ops.convert_to_tensor(x[:batch_size])),
+                expected[:batch_size],
+                atol=1e-6,
+            )
+        # The inputs are padded to the shapes (8, 8), (4, 8) and (1, 8). With
+        # TensorFlow, the batches of `predict()` are not padded.
+        self.assertEqual(
+            buckets.cache_info()["signatures"],
+            2 if backend.backend() == "tensorflow" else 3,
+        )
@@ -12,6 +12,7 @@ from keras.src.saving import serialization_lib
 from keras.src.trainers.compile_utils import CompileLoss
 from keras.src.trainers.compile_utils import CompileMetrics
 from keras.src.trainers.data_adapters import data_adapter_utils
+from keras.src.trainers.shape_buckets import ShapeBuckets
 from keras.src.utils import python_utils
 from keras.src.utils import traceback_utils
 from keras.src.utils import tracking
@@ -35,6 +36,7 @@ class Trainer:
         self._compile_loss = None
         self._compile_metrics = None
         self._loss_tracker = None
+        self.shape_buckets = None
 
     @traceback_utils.filter_traceback
     @tracking.no_automatic_dependency_tracking
@@ -49,6 +51,7 @@ class Trainer:
         steps_per_execution=1,
         jit_compile="auto",
         auto_scale_loss=True,
+        shape_buckets=None,
     ):
         """Configures the model for training.
 
@@ -139,6 +142,12 @@ class Trainer:
                 `"mixed_float16"`, the passed optimizer will be automatically
                 wrapped in a `LossScaleOptimizer`, which will dynamically
                 scale the loss to prevent underflow.
+            shape_buckets: Optional `keras.utils.ShapeBuckets`. If set, the
+                inputs of `predict()`, `predict_on_batch()` and
+                `predict_on_tensors()` are padded to the bucket shapes, to
+                avoid recompiling the predict function for every new batch
+                size or sequence length. The buckets are saved with the
+                compile config of the model.
         """
         optimizer = optimizers.get(optimizer)
         self.optimizer = optimizer
@@ -164,6 +173,13 @@ class Trainer:
             self._compile_metrics = CompileMetrics(
                 metrics, weighted_metrics, output_names=output_names
             )
+        if shape_buckets is not None and not isinstance(
+            shape_buckets, ShapeBuckets
+        ):
+            raise ValueError(
+                "`shape_buckets` must be a `keras.utils.ShapeBuckets` "
+                f"instance or `None`. Received: shape_buckets={shape_buckets}"
+            )
         if jit_compile == "auto":
             if run_eagerly:
                 jit_compile = False
@@ -183,10 +199,12 @@ class Trainer:
         self.compiled = True
         self._loss_tracker = metrics_module.Mean(name="loss")
         self.steps_per_execution = steps_per_execution
+        self.shape_buckets = shape_buckets
 
         self.train_function = None
         self.test_function = None
         self.predict_function = None
+        self.predict_on_tensors_function = None
 
         self._compile_config = serialization_lib.SerializableDict(
             optimizer=optimizer,
@@ -197,6 +215,7 @@ class Trainer:
             run_eagerly=run_eagerly,
             steps_per_execution=steps_per_execution,
             jit_compile=jit_compile,
+            shape_buckets=shape_buckets,
         )
 
     @property
@@ -527,6 +546,7 @@ class Trainer:
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        length_bucketing=None,
     ):
         """Trains the model for a fixed number of epochs (dataset iterations).
 
@@ -676,6 +696,13 @@ class Trainer:
                 Specifies how many training epochs to run
                 before a new validation run is performed,
                 e.g. `validation_freq=2` runs validation every 2 epochs.
+            length_bucketing: Optional `keras.utils.LengthBucketing`
+                instance, only supported when `x` is an array or a tensor.
+                If set, the training samples of consecutive batches are
+                regrouped by sequence length and the padding of each batch
+                is trimmed. To bucket the batches of a
+                `keras.utils.PyDataset`, pass `length_bucketing` to its
+                constructor instead.
 
         Unpacking behavior for iterator-like inputs:
             A common pattern is to pass an iterator like object such as a
@@ -942,6 +969,36 @@ class Trainer:
         """
         raise NotImplementedError
 
+    def predict_on_tensors(self, x):
+        """Returns predictions for a batch of tensors, with low latency.
+
+        This is the entry point for online inference on small batches, where
+        the overhead of `predict()` and `predict_on_batch()` can exceed the
+        time of the model itself. The inputs are passed as they are to a
+        function created on the first call, and compiled per input signature
+        when the model is (e.g. with `jax.jit` or `tf.function`). There is no
+        data adapter, no callbacks, and the outputs are not converted to
+        NumPy.
+
+        Example:
+
+        ```python
+        x = keras.ops.convert_to_tensor(request)
+        y = model.predict_on_tensors(x)
+        ```
+
+        Distribution strategies and `steps_per_execution` are not used by
+        this method: use `predict()` for batch inference.
+
+        Args:
+            x: Input tensor(s) of the backend, or NumPy arrays, in the
+                structure expected by the model.
+
+        Returns:
+            Tensor(s) of predictions of the backend.
+        """
+        raise NotImplementedError
+
     def get_compile_config(self):
         """Returns a serialized config with information for compiling the model.
 
@@ -1969,6 +1969,54 @@ class TestTrainer(testing.TestCase):
         self.assertEqual(len(logs), 2)
         self.assertAlmostEqual(logs["loss"], 16.0)
 
+    @parameterized.named_parameters(
+        [
+            ("eager", True, False),
+            ("graph_fn", False, False),
+            ("jit", False, True),
+        ]
+    )
+    def test_predict_on_tensors(self, run_eagerly, jit_compile):
+        if backend.backend() == "torch" and jit_compile:
+            self.skipTest(
+                "predict_on_tensors with jit_compile=True not supported in "
+                "torch backend yet."
+            )
+
+        class CallCounter(layers.Layer):
+            def build(self, input_shape):
+                self.count = self.add_weight(
+                    shape=(), initializer="zeros", trainable=False
+                )
+
+            def call(self, x):
+                self.count.assign_add(1.0)
+                return x
+
+        counter = CallCounter()
+        inputs = layers.Input((4,))
+        x = layers.Dense(3)(inputs)
+        x = layers.BatchNormalization()(x)
+        x = layers.Dropout(0.5)(x)
+        model = keras.Model(inputs, counter(x))
+        model.compile(run_eagerly=run_eagerly, jit_compile=jit_compile)
+
+        x = np.random.rand(8, 4).astype("float32")
+        expected = model.predict_on_batch(x)
+        self.assertAllClose(model.predict_on_tensors(x), expected)
+        self.assertAllClose(
+            model.predict_on_tensors(ops.convert_to_tensor(x[:2])),
+            expected[:2],
+        )
+        # The updates of the variables in inference are applied.
+        self.assertAllClose(counter.count, 3.0)
+        # The function is reused.
+        predict_on_tensors_function = model.predict_on_tensors_function
+        model.predict_on_tensors(x)
+        self.assertIs(
+            model.predict_on_tensors_function, predict_on_tensors_function
+        )
+
     def test_nested_input_predict(self):
         # https://github.com/keras-team/keras/issues/325
 
@@ -1,6 +1,7 @@
 from keras.src.tree.tree_api import assert_same_paths
 from keras.src.tree.tree_api import assert_same_structure
 from keras.src.tree.tree_api import flatten
+from keras.src.tree.tree_api import flatten_with_cached_def
 from keras.src.tree.tree_api import flatten_with_path
 from keras.src.tree.tree_api import is_nested
 from keras.src.tree.tree_api import lists_to_tuples
@@ -10,3 +11,4 @@ from keras.src.tree.tree_api import map_structure_up_to
 from keras.src.tree.tree_api import pack_sequence_as
 from keras.src.tree.tree_api import register_tree_node_class
 from keras.src.tree.tree_api import traverse
+from keras.src.tree.tree_api import unflatten
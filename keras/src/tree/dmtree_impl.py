@@ -159,6 +159,16 @@ def flatten(structure):
     return flattened
 
 
+def flatten_with_cached_def(structure):
+    # dm-tree has no tree definitions, the structure with `None` leaves is
+    # used instead.
+    return flatten(structure), map_structure(lambda _: None, structure)
+
+
+def unflatten(treedef, leaves):
+    return pack_sequence_as(treedef, leaves)
+
+
 def _recursive_flatten_with_path(path, structure, flattened):
     registration = REGISTERED_CLASSES.get(type(structure), None)
     if registration is not None:
@@ -86,6 +86,14 @@ def flatten(structure):
     return leaves
 
 
+def flatten_with_cached_def(structure):
+    return optree.tree_flatten(structure, none_is_leaf=True, namespace="keras")
+
+
+def unflatten(treedef, leaves):
+    return optree.tree_unflatten(treedef, leaves)
+
+
 def flatten_with_path(structure):
     paths, leaves, _ = optree.tree_flatten_with_path(
         structure, none_is_leaf=True, namespace="keras"
@@ -96,6 +96,17 @@ def flatten(structure):
     return leaves
 
 
+def flatten_with_cached_def(structure):
+    # We need to first sort dicts to ensure a deterministic order that is
+    # consistent with other tree implementations.
+    structure = _dict_to_ordered_dict(structure)
+    return torch_tree.tree_flatten(structure)
+
+
+def unflatten(treedef, leaves):
+    return torch_tree.tree_unflatten(leaves, treedef)
+
+
 def flatten_with_path(structure):
     # We need to first sort dicts to ensure a deterministic order that is
     # consistent with other tree implementations.
@@ -138,6 +138,52 @@ def flatten(structure):
     return tree_impl.flatten(structure)
 
 
+def flatten_with_cached_def(structure):
+    """Flattens a possibly nested structure and returns its definition.
+
+    This is the fast path for structures that are flattened and packed again
+    many times with the same layout, like the outputs of a model. The
+    definition can be kept by the caller and passed to `unflatten()`, which
+    packs new leaves without traversing a reference structure like
+    `pack_sequence_as()` does.
+
+    The leaves are in the same order as with `flatten()`. The definition is
+    specific to the tree implementation and should be treated as opaque.
+
+    Args:
+        structure: An arbitrarily nested structure.
+
+    Returns:
+        A tuple `(leaves, treedef)`, the list of leaves of `structure` and
+        the definition of its layout.
+    """
+    return tree_impl.flatten_with_cached_def(structure)
+
+
+def unflatten(treedef, leaves):
+    """Packs a flat sequence of leaves in the layout of a definition.
+
+    This is the inverse of `flatten_with_cached_def()`:
+
+    ```python
+    leaves, treedef = tree.flatten_with_cached_def(structure)
+    structure = tree.unflatten(treedef, leaves)
+    ```
+
+    Args:
+        treedef: A definition returned by `flatten_with_cached_def()`.
+        leaves: Flat sequence to pack, with as many leaves as the structure
+            the definition was created from.
+
+    Returns:
+        `leaves` packed in the layout of `treedef`.
+
+    Raises:
+        ValueError: If `leaves` has too few or too many elements.
+    """
+    return tree_impl.unflatten(treedef, leaves)
+
+
 @keras_export("keras.tree.flatten_with_path")
 def flatten_with_path(structure):
     """Flattens a possibly nested structure into a list.
@@ -550,6 +550,38 @@ class TreeTest(testing.TestCase):
         with self.assertRaisesRegex(ValueError, "[Too many leaves|holds 3]"):
             t.pack_sequence_as([10, 20], [1, 2, 3])
 
+    def test_flatten_with_cached_def(self, t):
+        structures = [
+            10,
+            None,
+            (10, [20, None]),
+            Point(y=20, x=10),
+            {"b": [20, 30], "a": (10,)},
+            OrderedDict([("b", 20), ("a", 10)]),
+            [{"x": 10, "mask": None}, Point(x=20, y={"c": 30})],
+        ]
+        for structure in structures:
+            leaves, treedef = t.flatten_with_cached_def(structure)
+            self.assertEqualStrict(leaves, t.flatten(structure))
+            # The definition packs new leaves like `pack_sequence_as`.
+            new_leaves = list(range(len(leaves)))
+            self.assertEqualStrict(
+                t.unflatten(treedef, new_leaves),
+                t.pack_sequence_as(structure, new_leaves),
+            )
+            # The definition can be reused.
+            self.assertEqualStrict(
+                t.unflatten(treedef, leaves),
+                t.pack_sequence_as(structure, leaves),
+            )
+
+        # Error cases.
+        _, treedef = t.flatten_with_cached_def([10, 20])
+        with self.assertRaises(ValueError):
+            t.unflatten(treedef, [1])
+        with self.assertRaises(ValueError):
+            t.unflatten(treedef, [1, 2, 3])
+
     @pytest.mark.skipif(backend.backend() != "tensorflow", reason="tf only")
     def test_pack_sequence_as_tf_wrappers(self, t):
         from tensorflow.python.trackable.data_structures import ListWrapper
@@ -0,0 +1,268 @@
+import atexit
+import os
+
+from keras.src import backend
+from keras.src.api_export import keras_export
+from keras.src.backend.config import keras_home
+
+# The directory of the cache of the current backend, and its maximum size in
+# bytes, when the cache is enabled.
+_CACHE_DIR = None
+_MAX_SIZE = None
+# The settings of the backend before the cache was enabled, restored when it
+# is disabled.
+_PREVIOUS_SETTINGS = None
+_TF_XLA_CACHE_FLAG = "--tf_xla_persistent_cache_directory"
+
+
+@keras_export("keras.config.enable_compilation_cache")
+def enable_compilation_cache(directory=None, max_size=2**30):
+    """Turn on the persistent compilation cache.
+
+    Compiling the train, test and predict functions of a model can take from
+    seconds to minutes for large models, and happens again in every new
+    process. With the persistent compilation cache, the compiled executables
+    are stored in a local directory, and reused by the later processes that
+    compile the same functions, for the same input shapes and dtypes, with
+    the same backend version and compiler flags.
+
+    The cache relies on the facilities of the backend:
+
+    - JAX: the persistent compilation cache of `jax.jit`.
+    - TensorFlow: the persistent cache of XLA, which only applies to the
+        functions compiled with `jit_compile=True`. It must be enabled
+        before the first XLA compilation of the process.
+    - PyTorch: the FX graph cache of `torch.compile`, which applies with
+        `jit_compile=True`.
+
+    The NumPy and OpenVINO backends don't compile functions, and ignore the
+    cache.
+
+    The entries of each backend version are stored in a separate
+    subdirectory of `directory`. When it exceeds `max_size`, the least
+    recently used entries are removed. The size is only checked when the
+    cache is enabled and when the process exits, so a long-running process
+    can exceed `max_size` in between. Calling `enable_compilation_cache()`
+    again removes the entries over the limit.
+
+    Example:
+
+    ```python
+    keras.config.enable_compilation_cache()
+    model = keras.models.load_model("model.keras")
+    # The first call reuses the executable compiled by a previous process.
+    model.predict(x)
+    ```
+
+    Args:
+        directory: Path of the cache directory. Defaults to
+            `~/.keras/compilation_cache` (or under `$KERAS_HOME` if set).
+        max_size: Integer. Maximum size of the cache of the current backend,
+            in bytes, or `None` for no limit. Defaults to 1 GiB.
+    """
+    global _CACHE_DIR, _MAX_SIZE
+
+    if max_size is not None and (
+        not isinstance(max_size, int)
+        or isinstance(max_size, bool)
+        or max_size <= 0
+    ):
+        raise ValueError(
+            "`max_size` must be a positive integer or `None`. "
+            f"Received: max_size={max_size}"
+        )
+    if directory is None:
+        directory = os.path.join(keras_home(), "compilation_cache")
+    cache_dir = os.path.join(
+        os.path.expanduser(directory), _backend_subdirectory()
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    _set_backend_cache(cache_dir)
+    _CACHE_DIR = cache_dir
+    _MAX_SIZE = max_size
+    _evict()
+
+
+@keras_export("keras.config.disable_compilation_cache")
+def disable_compilation_cache():
+    """Turn off the persistent compilation cache.
+
+    See `keras.config.enable_compilation_cache()`. The cache settings of the
+    backend are restored to their values before the cache was enabled. With
+    the TensorFlow backend, the XLA cache stays enabled after the first XLA
+    compilation of the process.
+    """
+    global _CACHE_DIR, _MAX_SIZE
+
+    if _CACHE_DIR is None:
+        return
+    _set_backend_cache(None)
+    _CACHE_DIR = None
+    _MAX_SIZE = None
+
+
+@keras_export("keras.config.compilation_cache_directory")
+def compilation_cache_directory():
+    """Returns the directory of the persistent compilation cache.
+
+    See `keras.config.enable_compilation_cache()`.
+
+    Returns:
+        The path of the cache of the current backend, or `None` if the cache
+        is disabled.
+    """
+    return _CACHE_DIR
+
+
+def evict_least_recently_used(directory, max_size):
+    """Removes the least recently used files until they fit in `max_size`.
+
+    The files are ordered by their last access or modification time.
+
+    Args:
+        directory: Path of the cache directory.
+        max_size: Integer. Maximum total size of the files, in bytes.
+
+    Returns:
+        The number of removed files.
+    """
+    entries = []
+    total_size = 0
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append(
+                (max(stat.st_atime, stat.st_mtime), stat.st_size, path)
+            )
+            total_size += stat.st_size
+    num_removed = 0
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            # Removed concurrently by another process.
+            pass
+        total_size -= size
+        num_removed += 1
+    return num_removed
+
+
+@atexit.register
+def _evict():
+    # The eviction of JAX requires the optional `filelock` package, so the
+    # entries of all backends are evicted here.
+    if _CACHE_DIR is not None and _MAX_SIZE is not None:
+        evict_least_recently_used(_CACHE_DIR, _MAX_SIZE)
+
+
+def _backend_subdirectory():
+    # Executables are only valid for the backend version that compiled them.
+    name = backend.backend()
+    if name == "jax":
+        import jax
+
+        return f"jax-{jax.__version__}"
+    if name == "tensorflow":
+        import tensorflow as tf
+
+        return f"tensorflow-{tf.__version__}"
+    if name == "torch":
+        import torch
+
+        return f"torch-{torch.__version__}"
+    return name
+
+
+def _set_backend_cache(cache_dir):
+    global _PREVIOUS_SETTINGS
+
+    if cache_dir is None:
+        if _PREVIOUS_SETTINGS is not None:
+            _set_backend_settings(_PREVIOUS_SETTINGS)
+            _PREVIOUS_SETTINGS = None
+        return
+    if _PREVIOUS_SETTINGS is None:
+        _PREVIOUS_SETTINGS = _get_backend_settings()
+    name = backend.backend()
+    if name == "jax":
+        _set_backend_settings(
+            {
+                "jax_compilation_cache_dir": cache_dir,
+                # Cache every function, not only the ones slower than 1s to
+                # compile.
+                "jax_persistent_cache_min_compile_time_secs": 0,
+            }
+        )
+    elif name == "tensorflow":
+        _set_backend_settings({_TF_XLA_CACHE_FLAG: cache_dir})
+    elif name == "torch":
+        _set_backend_settings(
+            {"TORCHINDUCTOR_CACHE_DIR": cache_dir, "fx_graph_cache": True}
+        )
+
+
+def _get_backend_settings():
+    name = backend.backend()
+    if name == "jax":
+        import jax
+
+        return {
+            "jax_compilation_cache_dir": jax.config.jax_compilation_cache_dir,
+            "jax_persistent_cache_min_compile_time_secs": (
+                jax.config.jax_persistent_cache_min_compile_time_secs
+            ),
+        }
+    if name == "tensorflow":
+        value = None
+        for flag in os.environ.get("TF_XLA_FLAGS", "").split():
+            if flag.startswith(f"{_TF_XLA_CACHE_FLAG}="):
+                value = flag.split("=", 1)[1]
+        return {_TF_XLA_CACHE_FLAG: value}
+    if name == "torch":
+        from torch._inductor import config as inductor_config
+
+        return {
+            "TORCHINDUCTOR_CACHE_DIR": os.environ.get(
+                "TORCHINDUCTOR_CACHE_DIR"
+            ),
+            "fx_graph_cache": inductor_config.fx_graph_cache,
+        }
+    return {}
+
+
+def _set_backend_settings(settings):
+    name = backend.backend()
+    if name == "jax":
+        import jax
+        from jax.experimental.compilation_cache import compilation_cache
+
+        for key, value in settings.items():
+            jax.config.update(key, value)
+        # The cache is initialized once, at the first compilation.
+        compilation_cache.reset_cache()
+    elif name == "tensorflow":
+        # The XLA flags are parsed at the first XLA compilation.
+        flags = [
+            flag
+            for flag in os.environ.get("TF_XLA_FLAGS", "").split()
+            if not flag.startswith(_TF_XLA_CACHE_FLAG)
+        ]
+        if settings[_TF_XLA_CACHE_FLAG] is not None:
+            flags.append(f"{_TF_XLA_CACHE_FLAG}={settings[_TF_XLA_CACHE_FLAG]}")
+        os.environ["TF_XLA_FLAGS"] = " ".join(flags)
+    elif name == "torch":
+        from torch._inductor import config as inductor_config
+
+        if settings["TORCHINDUCTOR_CACHE_DIR"] is not None:
+            os.environ["TORCHINDUCTOR_CACHE_DIR"] = settings[
+                "TORCHINDUCTOR_CACHE_DIR"
+            ]
+        else:
+            os.environ.pop("TORCHINDUCTOR_CACHE_DIR", None)
+        inductor_config.fx_graph_cache = settings["fx_graph_cache"]
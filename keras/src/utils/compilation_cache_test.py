@@ -0,0 +1,155 @@
+import os
+import time
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.utils import compilation_cache
+
+
+class CompilationCacheTest(testing.TestCase):
+    def tearDown(self):
+        compilation_cache.disable_compilation_cache()
+        super().tearDown()
+
+    def test_enable_and_disable(self):
+        directory = self.get_temp_dir()
+        compilation_cache.enable_compilation_cache(directory)
+        cache_dir = compilation_cache.compilation_cache_directory()
+        self.assertTrue(cache_dir.startswith(directory))
+        self.assertTrue(
+            os.path.basename(cache_dir).startswith(backend.backend())
+        )
+        self.assertTrue(os.path.isdir(cache_dir))
+        compilation_cache.disable_compilation_cache()
+        self.assertIsNone(compilation_cache.compilation_cache_directory())
+
+    def test_invalid_max_size(self):
+        with self.assertRaisesRegex(ValueError, "`max_size` must be"):
+            compilation_cache.enable_compilation_cache(max_size=0)
+        with self.assertRaisesRegex(ValueError, "`max_size` must be"):
+            compilation_cache.enable_compilation_cache(max_size=1.5)
+
+    def test_evict_least_recently_used(self):
+        directory = self.get_temp_dir()
+        os.makedirs(os.path.join(directory, "sub"))
+        paths = [
+            os.path.join(directory, "a"),
+            os.path.join(directory, "sub", "b"),
+            os.path.join(directory, "c"),
+        ]
+        now = time.time()
+        for i, path in enumerate(paths):
+            with open(path, "wb") as f:
+                f.write(b"0" * 100)
+            os.utime(path, (now - 100 + i, now - 100 + i))
+        # Accessing the first file makes it the most recently used.
+        os.utime(paths[0], (now, now))
+
+        num_removed = compilation_cache.evict_least_recently_used(
+            directory, 200
+        )
+        self.assertEqual(num_removed, 1)
+        self.assertEqual(
+            [os.path.exists(path) for path in paths], [True, False, True]
+        )
+        num_removed = compilation_cache.evict_least_recently_used(
+            directory, 200
+        )
+        self.assertEqual(num_removed, 0)
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax", reason="JAX-specific configuration."
+    )
+    def test_restores_jax_config(self):
+        import jax
+
+        name = "jax_persistent_cache_min_compile_time_secs"
+        original_value = getattr(jax.config, name)
+        original_directory = jax.config.jax_compilation_cache_dir
+        user_directory = self.get_temp_dir()
+        jax.config.update(name, 2.5)
+        jax.config.update("jax_compilation_cache_dir", user_directory)
+        try:
+            compilation_cache.enable_compilation_cache(self.get_temp_dir())
+            self.assertEqual(getattr(jax.config, name), 0)
+            self.assertEqual(
+                jax.config.jax_compilation_cache_dir,
+                compilation_cache.compilation_cache_directory(),
+            )
+            # Enabling again keeps the value to restore.
+            compilation_cache.enable_compilation_cache(self.get_temp_dir())
+            compilation_cache.disable_compilation_cache()
+            self.assertEqual(getattr(jax.config, name), 2.5)
+            self.assertEqual(
+                jax.config.jax_compilation_cache_dir, user_directory
+            )
+        finally:
+            jax.config.update(name, original_value)
+            jax.config.update("jax_compilation_cache_dir", original_directory)
+
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow",
+        reason="TensorFlow-specific configuration.",
+    )
+    def test_restores_tf_xla_flags(self):
+        user_flags = (
+            "--tf_xla_auto_jit=2 --tf_xla_persistent_cache_directory=/user"
+        )
+        with mock.patch.dict(os.environ, {"TF_XLA_FLAGS": user_flags}):
+            compilation_cache.enable_compilation_cache(self.get_temp_dir())
+            cache_dir = compilation_cache.compilation_cache_directory()
+            self.assertEqual(
+                os.environ["TF_XLA_FLAGS"].split(),
+                [
+                    "--tf_xla_auto_jit=2",
+                    f"--tf_xla_persistent_cache_directory={cache_dir}",
+                ],
+            )
+            compilation_cache.disable_compilation_cache()
+            self.assertEqual(
+                os.environ["TF_XLA_FLAGS"].split(), user_flags.split()
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch", reason="PyTorch-specific configuration."
+    )
+    def test_restores_torch_config(self):
+        from torch._inductor import config as inductor_config
+
+        original_value = inductor_config.fx_graph_cache
+        inductor_config.fx_graph_cache = False
+        try:
+            with mock.patch.dict(
+                os.environ, {"TORCHINDUCTOR_CACHE_DIR": "/user"}
+            ):
+                compilation_cache.enable_compilation_cache(self.get_temp_dir())
+                self.assertTrue(inductor_config.fx_graph_cache)
+                self.assertEqual(
+                    os.environ["TORCHINDUCTOR_CACHE_DIR"],
+                    compilation_cache.compilation_cache_directory(),
+                )
+                compilation_cache.disable_compilation_cache()
+                self.assertFalse(inductor_config.fx_graph_cache)
+                self.assertEqual(os.environ["TORCHINDUCTOR_CACHE_DIR"], "/user")
+        finally:
+            inductor_config.fx_graph_cache = original_value
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="Only JAX can enable its cache after the first compilation.",
+    )
+    def test_stores_compiled_functions(self):
+        compilation_cache.enable_compilation_cache(self.get_temp_dir())
+        model = models.Sequential([layers.Input((4,)), layers.Dense(2)])
+        model.compile(loss="mse")
+        model.train_on_batch(np.ones((2, 4)), np.ones((2, 2)))
+        cache_dir = compilation_cache.compilation_cache_directory()
+        self.assertTrue(
+            any("train_step" in name for name in os.listdir(cache_dir))
+        )
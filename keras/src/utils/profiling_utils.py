@@ -0,0 +1,668 @@
+"""Per-layer profiling of the time, FLOPs and memory of a model."""
+
+import collections
+import math
+import shutil
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import rich
+import rich.console
+import rich.markup
+import rich.table
+
+from keras.src import backend
+from keras.src import layers as layers_module
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.layers.convolutional.base_conv import BaseConv
+from keras.src.layers.convolutional.base_conv_transpose import BaseConvTranspose
+from keras.src.layers.convolutional.base_depthwise_conv import BaseDepthwiseConv
+from keras.src.layers.convolutional.base_separable_conv import BaseSeparableConv
+from keras.src.layers.pooling.base_global_pooling import BaseGlobalPooling
+from keras.src.layers.pooling.base_pooling import BasePooling
+from keras.src.utils import io_utils
+from keras.src.utils import summary_utils
+
+LayerProfile = collections.namedtuple(
+    "LayerProfile",
+    [
+        "path",
+        "name",
+        "class_name",
+        "depth",
+        "num_calls",
+        "forward_time",
+        "forward_self_time",
+        "backward_time",
+        "backward_self_time",
+        "flops",
+        "self_flops",
+        "parameter_memory",
+        "activation_memory",
+    ],
+)
+
+SORT_KEYS = (
+    "total_time",
+    "forward_time",
+    "backward_time",
+    "flops",
+    "parameter_memory",
+    "activation_memory",
+)
+
+_ELEMENTWISE_LAYERS = (
+    layers_module.Activation,
+    layers_module.ELU,
+    layers_module.LeakyReLU,
+    layers_module.PReLU,
+    layers_module.ReLU,
+    layers_module.Softmax,
+)
+_MERGE_LAYERS = (
+    layers_module.Add,
+    layers_module.Average,
+    layers_module.Maximum,
+    layers_module.Minimum,
+    layers_module.Multiply,
+    layers_module.Subtract,
+)
+
+
+@keras_export("keras.utils.ModelProfile")
+class ModelProfile:
+    """The per-layer profile of a model, returned by `profile_model()`.
+
+    Attributes:
+        layers: The `LayerProfile` of the model and of every layer it
+            called, in call order, i.e. each layer is followed by the
+            sublayers it called. Each `LayerProfile` has the fields:
+            - `path`, `name` and `class_name`: identify the layer. The path
+                is made of the names of the layers calling it, e.g.
+                `"block/dense"`.
+            - `depth`: the nesting depth of the layer, `0` for the model.
+            - `num_calls`: the number of calls of the layer in a forward
+                pass of the model.
+            - `forward_time` and `backward_time`: the time in seconds of the
+                forward and backward passes of the layer, including its
+                sublayers. `backward_time` is `None` if it wasn't measured.
+            - `forward_self_time` and `backward_self_time`: the same,
+                excluding the sublayers.
+            - `flops` and `self_flops`: the estimated number of floating
+                point operations of the forward pass of the layer, with and
+                without its sublayers, or `None` if they can't be
+                estimated from the shapes.
+            - `parameter_memory`: the size in bytes of the weights of the
+                layer, including its sublayers.
+            - `activation_memory`: the size in bytes of the outputs of the
+                layer.
+    """
+
+    def __init__(self, model_name, layers):
+        self.model_name = model_name
+        self.layers = layers
+
+    @property
+    def forward_time(self):
+        """The time in seconds of the forward pass of the model."""
+        return self.layers[0].forward_time
+
+    @property
+    def backward_time(self):
+        """The time in seconds of the backward pass of the model."""
+        return self.layers[0].backward_time
+
+    def hotspots(self, sort_by="total_time", num_layers=None):
+        """Returns the layers with the highest cost.
+
+        The times and FLOPs exclude the sublayers of each layer, so that
+        a layer doesn't rank above the sublayers it is made of.
+
+        Args:
+            sort_by: The cost to sort by, one of `"total_time"` (forward
+                and backward), `"forward_time"`, `"backward_time"`,
+                `"flops"`, `"parameter_memory"` or `"activation_memory"`.
+                Defaults to `"total_time"`.
+            num_layers: Maximum number of layers to return. Defaults to all
+                of them.
+
+        Returns:
+            A list of `LayerProfile`, sorted by decreasing cost.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(
+                f"Argument `sort_by` must be one of {SORT_KEYS}. "
+                f"Received: sort_by={sort_by}"
+            )
+        layers = [p for p in self.layers if _get_cost(p, sort_by) is not None]
+        layers.sort(key=lambda p: _get_cost(p, sort_by), reverse=True)
+        return layers[:num_layers]
+
+    def summary(
+        self, sort_by=None, num_layers=None, line_length=None, print_fn=None
+    ):
+        """Prints the profile as a table.
+
+        By default, the layers are printed in call order, indented under
+        the layers calling them, with their costs including their
+        sublayers. With `sort_by`, the hotspots are printed instead, see
+        `hotspots()`.
+
+        Args:
+            sort_by: Optional cost to sort the layers by, see `hotspots()`.
+            num_layers: Maximum number of layers to print.
+            line_length: Total length of the printed lines.
+            print_fn: Print function to use. It will be called on the
+                printed summary. It defaults to `print` (prints to stdout).
+        """
+        if sort_by is None:
+            rows = self.layers[:num_layers]
+            self_costs = False
+        else:
+            rows = self.hotspots(sort_by, num_layers)
+            self_costs = True
+        if not print_fn and not io_utils.is_interactive_logging_enabled():
+            print_fn = io_utils.print_msg
+
+        line_length = line_length or min(
+            120, shutil.get_terminal_size().columns - 4
+        )
+        header = [
+            "Layer (type)",
+            "Forward",
+            "Backward",
+            "Time %",
+            "FLOPs",
+            "Activations",
+            "Params",
+        ]
+        positions = [0.3, 0.42, 0.54, 0.63, 0.75, 0.88, 1.0]
+        columns = []
+        current = 0
+        for i, name in enumerate(header):
+            width = int(positions[i] * line_length) - current
+            if width < 4:
+                raise ValueError("Insufficient console width to print profile.")
+            current += width
+            columns.append(
+                rich.table.Column(
+                    name, justify="left" if i == 0 else "right", width=width
+                )
+            )
+        table = rich.table.Table(*columns, width=line_length, show_lines=True)
+
+        model_time = _get_cost(self.layers[0], "total_time", self_cost=False)
+        for profile in rows:
+            name = rich.markup.escape(
+                profile.path if self_costs else profile.name
+            )
+            if not self_costs and profile.depth:
+                name = "   " * (profile.depth - 1) + "└ " + name
+            name += " " + summary_utils.highlight_symbol(
+                f"({rich.markup.escape(profile.class_name)})"
+            )
+            if self_costs:
+                forward = profile.forward_self_time
+                backward = profile.backward_self_time
+                flops = profile.self_flops
+            else:
+                forward = profile.forward_time
+                backward = profile.backward_time
+                flops = profile.flops
+            layer_time = _get_cost(profile, "total_time", self_costs)
+            table.add_row(
+                name,
+                _format_time(forward),
+                _format_time(backward),
+                f"{100 * layer_time / model_time:.1f}%" if model_time else "-",
+                _format_flops(flops),
+                summary_utils.readable_memory_size(profile.activation_memory),
+                summary_utils.readable_memory_size(profile.parameter_memory),
+            )
+
+        if print_fn:
+            console = rich.console.Console(
+                highlight=False,
+                force_terminal=False,
+                color_system=None,
+                width=line_length,
+            )
+            console.begin_capture()
+        else:
+            console = rich.console.Console(highlight=False, width=line_length)
+        title = f'Profile of "{rich.markup.escape(self.model_name)}"'
+        if self_costs:
+            title += f" (sorted by {sort_by}, excluding sublayers)"
+        console.print(summary_utils.bold_text(title))
+        console.print(table)
+        console.print(
+            summary_utils.bold_text(" Forward time: ")
+            + _format_time(self.forward_time)
+        )
+        console.print(
+            summary_utils.bold_text(" Backward time: ")
+            + _format_time(self.backward_time)
+        )
+        console.print(
+            summary_utils.bold_text(" Forward FLOPs: ")
+            + _format_flops(self.layers[0].flops)
+        )
+        if print_fn:
+            if print_fn is io_utils.print_msg:
+                print_fn(console.end_capture(), line_break=False)
+            else:
+                print_fn(console.end_capture())
+
+
+@keras_export("keras.utils.profile_model")
+def profile_model(model, x, training=False, backward=True, num_runs=3):
+    """Profiles the time, FLOPs and memory of each layer of a model.
+
+    The model is run eagerly on the batch `x`, and the following are
+    attributed to the model and to every layer it calls, including the
+    nested sublayers:
+
+    - The time of its forward pass, waiting for the results of each layer
+        before the next one runs.
+    - The time of its backward pass, i.e. of computing the gradients of
+        the sum of its outputs with respect to its trainable weights and
+        floating point inputs. Each layer is differentiated on its own,
+        with the inputs it received in the forward pass. The backward pass
+        can't be measured with the NumPy backend.
+    - The number of floating point operations of its forward pass,
+        estimated from the shapes of its inputs and weights for the common
+        layers (e.g. `Dense`, `EinsumDense`, convolutions, pooling,
+        attention, element-wise layers).
+    - The size of its weights and of its outputs.
+
+    Example:
+
+    ```python
+    profile = keras.utils.profile_model(model, x_batch)
+    profile.summary()
+    profile.summary(sort_by="backward_time", num_layers=10)
+    ```
+
+    Args:
+        model: The model to profile.
+        x: A batch of inputs of the model.
+        training: Whether to run the model in training mode. Defaults to
+            `False`.
+        backward: Whether to profile the backward passes. Defaults to
+            `True`.
+        num_runs: Number of timed runs. The times are the medians over the
+            runs. Defaults to `3`.
+
+    Returns:
+        A `ModelProfile`.
+    """
+    if num_runs < 1:
+        raise ValueError(
+            f"Argument `num_runs` must be at least 1. Received: {num_runs}"
+        )
+    x = tree.map_structure(backend.convert_to_tensor, x)
+    # Per layer, in call order: its calling layer, its `(args, kwargs)` and
+    # its FLOPs and output size in the last run, and its times in each run.
+    order = []
+    layers = {}
+    parents = {}
+    recorded_calls = collections.defaultdict(list)
+    self_flops = {}
+    activation_memory = {}
+    forward_times = []
+    forward_self_times = []
+    # Stack of the time spent in the sublayers of the active calls.
+    stack = []
+    record = False
+
+    def create_hook(layer, call):
+        key = id(layer)
+
+        def hook(*args, **kwargs):
+            if key not in layers:
+                layers[key] = layer
+                parents[key] = stack[-1][0] if stack else None
+                order.append(key)
+            stack.append([key, 0.0])
+            start = time.perf_counter()
+            try:
+                outputs = call(*args, **kwargs)
+                _synchronize(outputs)
+            finally:
+                elapsed = time.perf_counter() - start
+                _, nested = stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+            forward_times[-1][key] += elapsed
+            forward_self_times[-1][key] += elapsed - nested
+            if record:
+                recorded_calls[key].append((args, kwargs))
+                flops = _estimate_flops(layer, args, kwargs, outputs)
+                if flops is not None:
+                    self_flops[key] = self_flops.get(key, 0) + flops
+                activation_memory[key] = activation_memory.get(
+                    key, 0
+                ) + summary_utils.tensors_memory_size(outputs)
+            return outputs
+
+        return hook
+
+    with hook_calls(model._flatten_layers(), create_hook):
+        # The first run isn't timed, as it may build the layers.
+        for run in range(num_runs + 1):
+            record = run == num_runs
+            forward_times.append(collections.defaultdict(float))
+            forward_self_times.append(collections.defaultdict(float))
+            model(x, training=training)
+    forward_times = forward_times[1:]
+    forward_self_times = forward_self_times[1:]
+
+    children = collections.defaultdict(list)
+    for key in order:
+        if parents[key] is not None:
+            children[parents[key]].append(key)
+
+    backward_times = {}
+    if backward and backend.backend() != "numpy":
+        for key in order:
+            times = [
+                _time_backward(layers[key], args, kwargs, num_runs)
+                for args, kwargs in recorded_calls[key]
+            ]
+            backward_times[key] = None if None in times else sum(times)
+
+    def get_inclusive_flops(key):
+        flops = [get_inclusive_flops(child) for child in children[key]]
+        flops = [f for f in flops if f is not None]
+        if key in self_flops:
+            flops.append(self_flops[key])
+        elif not children[key]:
+            return None
+        return sum(flops) if flops else None
+
+    def get_names(key):
+        # The names of the calling layers, from the model to the layer.
+        names = []
+        while key is not None:
+            names.append(layers[key].name)
+            key = parents[key]
+        return names[::-1]
+
+    profiles = []
+    for key in order:
+        layer = layers[key]
+        names = get_names(key)
+        backward_time = backward_times.get(key)
+        backward_self_time = backward_time
+        if backward_time is not None:
+            nested = [backward_times.get(child) for child in children[key]]
+            nested = sum(t for t in nested if t is not None)
+            backward_self_time = max(backward_time - nested, 0.0)
+        layer_self_flops = self_flops.get(key)
+        if layer_self_flops is None and children[key]:
+            layer_self_flops = 0
+        profiles.append(
+            LayerProfile(
+                path="/".join(names[1:]) or layer.name,
+                name=layer.name,
+                class_name=layer.__class__.__name__,
+                depth=len(names) - 1,
+                num_calls=len(recorded_calls[key]),
+                forward_time=float(
+                    np.median([times[key] for times in forward_times])
+                ),
+                forward_self_time=float(
+                    np.median([times[key] for times in forward_self_times])
+                ),
+                backward_time=backward_time,
+                backward_self_time=backward_self_time,
+                flops=get_inclusive_flops(key),
+                self_flops=layer_self_flops,
+                parameter_memory=int(
+                    summary_utils.weight_memory_size(layer.weights)
+                ),
+                activation_memory=activation_memory.get(key, 0),
+            )
+        )
+    return ModelProfile(model.name, profiles)
+
+
+@contextmanager
+def hook_calls(layers, create_hook):
+    """Temporarily replaces the `call` method of `layers` with hooks.
+
+    Args:
+        layers: The layers to hook.
+        create_hook: A function `create_hook(layer, call)` returning the
+            function replacing `call`.
+    """
+    # The `call` set on the instances, if any, to restore them afterwards.
+    original_calls = {}
+    try:
+        for layer in layers:
+            original_calls[id(layer)] = layer.__dict__.get("call")
+            layer.call = create_hook(layer, layer.call)
+        yield
+    finally:
+        for layer in layers:
+            if id(layer) not in original_calls:
+                continue
+            if original_calls[id(layer)] is None:
+                del layer.call
+            else:
+                layer.call = original_calls[id(layer)]
+
+
+def _synchronize(outputs):
+    """Waits for the computation of `outputs` to finish."""
+    if backend.backend() == "jax":
+        import jax
+
+        jax.block_until_ready(outputs)
+    elif backend.backend() == "tensorflow":
+        import tensorflow as tf
+
+        tf.test.experimental.sync_devices()
+    elif backend.backend() == "torch":
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+
+
+def _time_backward(layer, args, kwargs, num_runs):
+    """Returns the median time of the backward pass of a call of `layer`."""
+    flat_inputs = tree.flatten((args, kwargs))
+    indices = [
+        i
+        for i, x in enumerate(flat_inputs)
+        if backend.is_tensor(x) and backend.is_float_dtype(x.dtype)
+    ]
+    trainable_variables = [v.value for v in layer.trainable_variables]
+    non_trainable_variables = [v.value for v in layer.non_trainable_variables]
+    if not indices and not trainable_variables:
+        return None
+
+    def forward(trainable_variables, inputs):
+        flat = list(flat_inputs)
+        for i, value in zip(indices, inputs):
+            flat[i] = value
+        call_args, call_kwargs = tree.pack_sequence_as((args, kwargs), flat)
+        outputs, _ = layer.stateless_call(
+            trainable_variables,
+            non_trainable_variables,
+            *call_args,
+            **call_kwargs,
+        )
+        outputs = tree.flatten(outputs)
+        if not all(backend.is_float_dtype(y.dtype) for y in outputs):
+            return None
+        return outputs
+
+    inputs = [flat_inputs[i] for i in indices]
+    if backend.backend() == "jax":
+        import jax
+        import jax.numpy as jnp
+
+        outputs, vjp_fn = jax.vjp(forward, trainable_variables, inputs)
+        if outputs is None:
+            return None
+        cotangents = [jnp.ones_like(y) for y in outputs]
+
+        def run():
+            start = time.perf_counter()
+            jax.block_until_ready(vjp_fn(cotangents))
+            return time.perf_counter() - start
+
+    elif backend.backend() == "tensorflow":
+        import tensorflow as tf
+
+        sources = [
+            tf.convert_to_tensor(x) for x in trainable_variables + inputs
+        ]
+        num_variables = len(trainable_variables)
+
+        def run():
+            with tf.GradientTape() as tape:
+                tape.watch(sources)
+                outputs = forward(
+                    sources[:num_variables], sources[num_variables:]
+                )
+            if outputs is None:
+                return None
+            start = time.perf_counter()
+            tape.gradient(outputs, sources)
+            _synchronize(None)
+            return time.perf_counter() - start
+
+    elif backend.backend() == "torch":
+        import torch
+
+        num_variables = len(trainable_variables)
+
+        def run():
+            sources = [
+                x.detach().requires_grad_()
+                for x in trainable_variables + inputs
+            ]
+            outputs = forward(sources[:num_variables], sources[num_variables:])
+            if outputs is None:
+                return None
+            loss = sum(y.sum() for y in outputs)
+            start = time.perf_counter()
+            torch.autograd.grad(loss, sources, allow_unused=True)
+            _synchronize(None)
+            return time.perf_counter() - start
+
+    else:
+        return None
+
+    # The first run isn't timed, as it may include tracing and caching.
+    times = [run() for _ in range(num_runs + 1)][1:]
+    if None in times:
+        return None
+    return float(np.median(times))
+
+
+def _estimate_flops(layer, args, kwargs, outputs):
+    """Returns the FLOPs of a call of `layer`, or `None` if unknown."""
+    inputs = args[0] if args else next(iter(kwargs.values()), None)
+    outputs = tree.flatten(outputs)
+    if isinstance(layer, layers_module.Dense):
+        return 2 * math.prod(inputs.shape) * layer.units
+    if isinstance(layer, layers_module.EinsumDense):
+        return _estimate_einsum_flops(
+            layer.equation, inputs.shape, layer.kernel.shape
+        )
+    if isinstance(layer, BaseSeparableConv):
+        spatial_size = math.prod(outputs[0].shape) // layer.filters
+        depthwise_shape = layer.depthwise_kernel.shape
+        channels = depthwise_shape[-2] * depthwise_shape[-1]
+        kernel_size = math.prod(depthwise_shape[:-2])
+        return 2 * spatial_size * channels * (kernel_size + layer.filters)
+    if isinstance(layer, BaseDepthwiseConv):
+        return 2 * math.prod(outputs[0].shape) * math.prod(layer.kernel_size)
+    if isinstance(layer, BaseConvTranspose):
+        return 2 * math.prod(inputs.shape) * math.prod(layer.kernel.shape[:-1])
+    if isinstance(layer, BaseConv):
+        return (
+            2 * math.prod(outputs[0].shape) * math.prod(layer.kernel.shape[:-1])
+        )
+    if isinstance(layer, BasePooling):
+        return math.prod(outputs[0].shape) * math.prod(layer.pool_size)
+    if isinstance(layer, BaseGlobalPooling):
+        return math.prod(inputs.shape)
+    if isinstance(layer, layers_module.MultiHeadAttention):
+        # The projections are counted in the `EinsumDense` sublayers, this
+        # is the computation of the attention scores and outputs.
+        query = inputs
+        value = args[1] if len(args) > 1 else kwargs["value"]
+        query_size = math.prod(query.shape[1:-1])
+        value_size = math.prod(value.shape[1:-1])
+        return (
+            2
+            * query.shape[0]
+            * layer.num_heads
+            * query_size
+            * value_size
+            * (layer.key_dim + layer.value_dim)
+        )
+    if isinstance(layer, _ELEMENTWISE_LAYERS):
+        return math.prod(outputs[0].shape)
+    if isinstance(layer, _MERGE_LAYERS):
+        return math.prod(outputs[0].shape) * (len(inputs) - 1)
+    if isinstance(layer, layers_module.Embedding):
+        return 0
+    return None
+
+
+def _estimate_einsum_flops(equation, input_shape, kernel_shape):
+    operands, _ = equation.split("->")
+    input_spec, kernel_spec = operands.split(",")
+    sizes = dict(zip(kernel_spec, kernel_shape))
+    if "..." in input_spec:
+        # The leading dimensions of the inputs are matched by the ellipsis.
+        input_spec = input_spec.replace("...", "")
+        num_leading = len(input_shape) - len(input_spec)
+        leading_size = math.prod(input_shape[:num_leading])
+        input_shape = input_shape[num_leading:]
+    else:
+        leading_size = 1
+    sizes.update(zip(input_spec, input_shape))
+    return 2 * leading_size * math.prod(sizes.values())
+
+
+def _get_cost(profile, sort_by, self_cost=True):
+    if sort_by == "total_time":
+        if self_cost:
+            times = (profile.forward_self_time, profile.backward_self_time)
+        else:
+            times = (profile.forward_time, profile.backward_time)
+        return sum(t for t in times if t is not None)
+    if self_cost and sort_by in ("forward_time", "backward_time"):
+        return getattr(profile, sort_by.replace("_time", "_self_time"))
+    if self_cost and sort_by == "flops":
+        return profile.self_flops
+    return getattr(profile, sort_by)
+
+
+def _format_time(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _format_flops(flops):
+    if flops is None:
+        return "-"
+    for unit in ("", "K", "M", "G", "T"):
+        if flops < 1000:
+            return f"{flops:.3g} {unit}FLOPs"
+        flops /= 1000
+    return f"{flops:.3g} PFLOPs"
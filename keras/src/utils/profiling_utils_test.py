@@ -0,0 +1,155 @@
+import numpy as np
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.utils import profiling_utils
+
+
+def get_model():
+    inputs = layers.Input((6, 6, 3))
+    x = layers.Conv2D(4, 3, activation="relu")(inputs)
+    x = layers.MaxPooling2D()(x)
+    x = layers.Flatten()(x)
+    x = models.Sequential([layers.Dense(8), layers.ReLU()], name="block")(x)
+    outputs = layers.Dense(2, name="head")(x)
+    return models.Model(inputs, outputs, name="model")
+
+
+class ProfilingUtilsTest(testing.TestCase):
+    def test_profile_model(self):
+        model = get_model()
+        x = np.ones((2, 6, 6, 3), dtype="float32")
+        profile = profiling_utils.profile_model(model, x, num_runs=2)
+
+        self.assertEqual(
+            [(p.path, p.depth) for p in profile.layers],
+            [
+                ("model", 0),
+                ("conv2d", 1),
+                ("max_pooling2d", 1),
+                ("flatten", 1),
+                ("block", 1),
+                ("block/dense", 2),
+                ("block/re_lu", 2),
+                ("head", 1),
+            ],
+        )
+        profiles = {p.path: p for p in profile.layers}
+        # The FLOPs are estimated from the shapes.
+        self.assertEqual(profiles["conv2d"].flops, 2 * (2 * 4 * 4 * 4) * 27)
+        self.assertEqual(profiles["max_pooling2d"].flops, 2 * 2 * 2 * 4 * 4)
+        self.assertIsNone(profiles["flatten"].flops)
+        self.assertEqual(profiles["block/dense"].flops, 2 * 2 * 16 * 8)
+        self.assertEqual(profiles["block/re_lu"].flops, 2 * 8)
+        self.assertEqual(profiles["block"].self_flops, 0)
+        self.assertEqual(profiles["block"].flops, 2 * 2 * 16 * 8 + 2 * 8)
+        self.assertEqual(
+            profiles["model"].flops,
+            sum(p.flops or 0 for p in profile.layers if p.depth == 1),
+        )
+        # The memory is computed from the weights and outputs.
+        self.assertEqual(profiles["conv2d"].parameter_memory, (108 + 4) * 4)
+        self.assertEqual(profiles["block"].parameter_memory, (128 + 8) * 4)
+        self.assertEqual(profiles["head"].activation_memory, 2 * 2 * 4)
+        for p in profile.layers:
+            self.assertEqual(p.num_calls, 1)
+            self.assertGreater(p.forward_time, 0)
+            self.assertLessEqual(p.forward_self_time, p.forward_time)
+            if backend.backend() == "numpy":
+                self.assertIsNone(p.backward_time)
+            else:
+                self.assertGreater(p.backward_time, 0)
+                self.assertLessEqual(p.backward_self_time, p.backward_time)
+        self.assertEqual(profile.forward_time, profiles["model"].forward_time)
+
+        # The calls of the layers are restored.
+        for layer in model._flatten_layers():
+            self.assertNotIn("call", layer.__dict__)
+
+    @parameterized.named_parameters(
+        (
+            "einsum_dense",
+            layers.EinsumDense("...b,bc->...c", 6),
+            2 * 10 * 8 * 6,
+        ),
+        ("separable_conv", layers.SeparableConv1D(6, 3), 2 * 6 * 8 * (3 + 6)),
+        ("depthwise_conv", layers.DepthwiseConv1D(3), 2 * 2 * 3 * 8 * 3),
+        ("conv_transpose", layers.Conv1DTranspose(6, 3), 2 * 2 * 5 * 8 * 18),
+    )
+    def test_flops(self, layer, expected_flops):
+        inputs = layers.Input((5, 8))
+        model = models.Model(inputs, layer(inputs))
+        x = np.ones((2, 5, 8), dtype="float32")
+        profile = profiling_utils.profile_model(
+            model, x, backward=False, num_runs=1
+        )
+        self.assertEqual(profile.layers[1].flops, expected_flops)
+        self.assertIsNone(profile.backward_time)
+
+    def test_flops_multi_head_attention(self):
+        query = layers.Input((5, 8))
+        value = layers.Input((7, 8))
+        outputs = layers.MultiHeadAttention(num_heads=2, key_dim=4)(
+            query, value
+        )
+        model = models.Model([query, value], outputs)
+        x = [np.ones((2, 5, 8), "float32"), np.ones((2, 7, 8), "float32")]
+        profile = profiling_utils.profile_model(
+            model, x, backward=False, num_runs=1
+        )
+        attention = profile.layers[1]
+        self.assertEqual(attention.self_flops, 2 * 2 * 2 * 5 * 7 * (4 + 4))
+        projections = 2 * 2 * 8 * 8 * (5 + 7 + 7 + 5)
+        self.assertEqual(attention.flops, attention.self_flops + projections)
+
+    def test_hotspots(self):
+        model = get_model()
+        x = np.ones((2, 6, 6, 3), dtype="float32")
+        profile = profiling_utils.profile_model(model, x, num_runs=1)
+
+        hotspots = profile.hotspots(sort_by="flops", num_layers=2)
+        self.assertEqual([p.path for p in hotspots], ["conv2d", "block/dense"])
+        hotspots = profile.hotspots(sort_by="parameter_memory")
+        self.assertEqual(hotspots[0].path, "model")
+        # The layers are sorted by their own time.
+        hotspots = profile.hotspots()
+        self.assertLen(hotspots, len(profile.layers))
+        costs = [
+            p.forward_self_time + (p.backward_self_time or 0) for p in hotspots
+        ]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+
+        with self.assertRaisesRegex(ValueError, "must be one of"):
+            profile.hotspots(sort_by="latency")
+
+    def test_summary(self):
+        model = get_model()
+        x = np.ones((2, 6, 6, 3), dtype="float32")
+        profile = profiling_utils.profile_model(model, x, num_runs=1)
+
+        summary_content = []
+
+        def print_to_variable(text, line_break=False):
+            summary_content.append(text)
+
+        profile.summary(line_length=120, print_fn=print_to_variable)
+        summary_content = "\n".join(summary_content)
+        self.assertIn('Profile of "model"', summary_content)
+        self.assertIn("└ dense (Dense)", summary_content)
+        self.assertIn("512 FLOPs", summary_content)
+        self.assertIn("Forward time:", summary_content)
+
+        summary_content = []
+        profile.summary(
+            sort_by="flops",
+            num_layers=1,
+            line_length=120,
+            print_fn=print_to_variable,
+        )
+        summary_content = "\n".join(summary_content)
+        self.assertIn("sorted by flops", summary_content)
+        self.assertIn("conv2d (Conv2D)", summary_content)
+        self.assertNotIn("block/dense", summary_content)
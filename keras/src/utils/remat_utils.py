@@ -0,0 +1,364 @@
+"""Rematerialization planning from per-layer activation profiles."""
+
+import collections
+import time
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.backend.common.remat import RematMode
+from keras.src.backend.common.remat import RematScope
+from keras.src.layers import InputLayer
+from keras.src.utils import profiling_utils
+from keras.src.utils import summary_utils
+from keras.src.utils.summary_utils import readable_memory_size
+
+LayerRematProfile = collections.namedtuple(
+    "LayerRematProfile",
+    [
+        "path",
+        "name",
+        "output_memory",
+        "activation_memory",
+        "recompute_time",
+    ],
+)
+
+
+@keras_export("keras.utils.RematPlan")
+class RematPlan:
+    """The rematerialization plan of a model, returned by `plan_remat()`.
+
+    Attributes:
+        profiles: The `LayerRematProfile` of every profiled layer, in call
+            order, with the path and name of the layer, the size in bytes of
+            its outputs, the size in bytes of the activations it keeps for
+            the backward pass besides its outputs, and the time in seconds of
+            its forward call.
+        layer_names: The names of the layers to rematerialize.
+        layer_paths: The paths of the layers to rematerialize.
+        memory_budget: The activation memory budget in bytes.
+        activation_memory: The predicted activation memory in bytes without
+            rematerialization.
+        predicted_activation_memory: The predicted activation memory in bytes
+            with the plan.
+        predicted_savings: The predicted activation memory savings in bytes.
+        recompute_time: The predicted extra time in seconds of a training
+            step, spent recomputing the forward calls of the rematerialized
+            layers.
+        measured_savings: The measured activation memory savings in bytes,
+            if `plan_remat()` was called with `measure_savings=True`.
+            Otherwise `None`.
+    """
+
+    def __init__(self, profiles, layer_paths, memory_budget):
+        selected = set(layer_paths)
+        self.profiles = profiles
+        self.layer_paths = [p.path for p in profiles if p.path in selected]
+        self.memory_budget = memory_budget
+        self.measured_savings = None
+        self.measured_activation_memory = None
+        self.layer_names = [p.name for p in profiles if p.path in selected]
+        self.activation_memory = sum(
+            p.output_memory + p.activation_memory for p in profiles
+        )
+        self.predicted_savings = sum(
+            p.activation_memory for p in profiles if p.path in selected
+        )
+        self.predicted_activation_memory = (
+            self.activation_memory - self.predicted_savings
+        )
+        self.recompute_time = sum(
+            p.recompute_time for p in profiles if p.path in selected
+        )
+
+    def apply(self, model):
+        """Applies the plan to the layers of `model`.
+
+        The selected layers are fully rematerialized, and the
+        rematerialization of the other profiled layers is disabled. The
+        compiled train, test and predict functions of the model are reset.
+
+        Args:
+            model: The model the plan was computed for.
+        """
+        selected = set(self.layer_paths)
+        profiled = {p.path for p in self.profiles}
+        for layer in _get_candidate_layers(model):
+            if layer.path in selected:
+                layer._remat_mode = RematMode("full", None, [])
+            elif layer.path in profiled:
+                layer._remat_mode = None
+        model.train_function = None
+        model.test_function = None
+        model.predict_function = None
+        model.predict_on_tensors_function = None
+
+    def scope(self):
+        """Returns a `RematScope` rematerializing the selected layers.
+
+        This can be used to create the model again with the plan, as long as
+        the layers get the same names.
+        """
+        return RematScope(mode="list_of_layers", layer_names=self.layer_names)
+
+    def report(self):
+        """Returns a human-readable summary of the plan."""
+        selected = set(self.layer_paths)
+        path_width = max([len(p.path) for p in self.profiles] + [5])
+        lines = [
+            f"{'Layer':<{path_width}}  {'Activations':>12}  "
+            f"{'Recompute':>10}  Remat",
+        ]
+        for p in self.profiles:
+            lines.append(
+                f"{p.path:<{path_width}}  "
+                f"{readable_memory_size(p.activation_memory):>12}  "
+                f"{p.recompute_time * 1000:>8.2f}ms  "
+                f"{'yes' if p.path in selected else ''}"
+            )
+        lines.append(
+            "Activation memory: "
+            f"{readable_memory_size(self.activation_memory)} -> "
+            f"{readable_memory_size(self.predicted_activation_memory)} "
+            f"(budget: {readable_memory_size(self.memory_budget)})"
+        )
+        lines.append(
+            "Predicted savings: "
+            f"{readable_memory_size(self.predicted_savings)}, "
+            f"for {self.recompute_time * 1000:.2f}ms of extra compute per "
+            "step"
+        )
+        if self.measured_savings is not None:
+            remat_memory = self.measured_activation_memory - (
+                self.measured_savings
+            )
+            lines.append(
+                "Measured savings: "
+                f"{readable_memory_size(self.measured_savings)} "
+                "(activation memory: "
+                f"{readable_memory_size(self.measured_activation_memory)} -> "
+                f"{readable_memory_size(remat_memory)})"
+            )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+@keras_export("keras.utils.plan_remat")
+def plan_remat(model, x, memory_budget, num_runs=3, measure_savings=False):
+    """Finds the cheapest set of layers to rematerialize to fit a budget.
+
+    The layers of `model` are profiled with a short run of the model on the
+    batch `x`: for every layer called by the model, the size of its outputs,
+    the size of the other activations it keeps for the backward pass (the
+    outputs of its sublayers and the inputs of its activation function), and
+    the time of its forward call, which is the extra compute of a
+    training step if the layer is rematerialized.
+
+    A rematerialized layer only keeps its inputs for the backward pass, and
+    recomputes its other activations. The plan selects the layers saving
+    enough activation memory to fit `memory_budget`, for the least
+    recompute time.
+
+    Example:
+
+    ```python
+    plan = keras.utils.plan_remat(model, x_batch, memory_budget=2**30)
+    print(plan.report())
+    plan.apply(model)
+    model.fit(...)
+    ```
+
+    Args:
+        model: The model to plan for. It must be built.
+        x: A batch of inputs of the model. The activation memory is
+            proportional to its batch size.
+        memory_budget: The activation memory budget, in bytes.
+        num_runs: Number of timed runs of the model. Defaults to `3`.
+        measure_savings: Whether to also measure the activation memory
+            savings of the plan, by computing the gradients of the model with
+            and without the plan. Only supported with the JAX backend.
+            Defaults to `False`.
+
+    Returns:
+        A `RematPlan`.
+    """
+    if not model.built:
+        raise ValueError(
+            "The model must be built before planning its rematerialization."
+        )
+    if measure_savings and backend.backend() != "jax":
+        raise ValueError(
+            "`measure_savings=True` is only supported with the JAX backend. "
+            f"Received: backend={backend.backend()}"
+        )
+    profiles = _profile_layers(model, x, num_runs)
+    activation_memory = sum(
+        p.output_memory + p.activation_memory for p in profiles
+    )
+    required = activation_memory - memory_budget
+    selected = []
+    if required > 0:
+        # Greedily pick the layers saving the most memory per second of
+        # recompute, then drop the ones the others make unnecessary.
+        candidates = sorted(
+            (p for p in profiles if p.activation_memory > 0),
+            key=lambda p: p.recompute_time / p.activation_memory,
+        )
+        savings = 0
+        for profile in candidates:
+            if savings >= required:
+                break
+            selected.append(profile)
+            savings += profile.activation_memory
+        if savings < required:
+            raise ValueError(
+                "The memory budget of "
+                f"{readable_memory_size(memory_budget)} can't "
+                "be met: rematerializing all the layers leaves "
+                f"{readable_memory_size(activation_memory - savings)} of "
+                "activations."
+            )
+        for profile in sorted(selected, key=lambda p: -p.recompute_time):
+            if savings - profile.activation_memory >= required:
+                selected.remove(profile)
+                savings -= profile.activation_memory
+    plan = RematPlan(profiles, [p.path for p in selected], memory_budget)
+
+    if measure_savings:
+        remat_modes = {
+            id(layer): layer._remat_mode
+            for layer in _get_candidate_layers(model)
+        }
+        RematPlan(profiles, [], memory_budget).apply(model)
+        plan.measured_activation_memory = _measure_activation_memory(model, x)
+        plan.apply(model)
+        plan.measured_savings = (
+            plan.measured_activation_memory
+            - _measure_activation_memory(model, x)
+        )
+        for layer in _get_candidate_layers(model):
+            layer._remat_mode = remat_modes[id(layer)]
+    return plan
+
+
+def _get_candidate_layers(model):
+    return [
+        layer
+        for layer in model._flatten_layers(include_self=False, recursive=False)
+        if not isinstance(layer, InputLayer)
+    ]
+
+
+def _profile_layers(model, x, num_runs):
+    candidates = _get_candidate_layers(model)
+    owners = {}
+    for candidate in candidates:
+        for layer in candidate._flatten_layers():
+            owners.setdefault(id(layer), candidate)
+    layers = [
+        layer
+        for layer in model._flatten_layers(include_self=False)
+        if id(layer) in owners
+    ]
+    # Per candidate layer: its output size, the size of its other
+    # activations and its call durations.
+    output_memory = {}
+    activation_memory = {}
+    durations = collections.defaultdict(list)
+    call_order = []
+
+    def create_hook(layer, call):
+        candidate = owners[id(layer)]
+
+        def hook(*args, **kwargs):
+            start = time.perf_counter()
+            outputs = call(*args, **kwargs)
+            size = summary_utils.tensors_memory_size(outputs)
+            key = id(candidate)
+            if _has_activation(layer):
+                activation_memory[key] = activation_memory.get(key, 0) + size
+            if layer is not candidate:
+                activation_memory[key] = activation_memory.get(key, 0) + size
+                return outputs
+            # Wait for the computation to finish.
+            tree.map_structure(ops.convert_to_numpy, outputs)
+            durations[key].append(time.perf_counter() - start)
+            output_memory[key] = output_memory.get(key, 0) + size
+            if key not in call_order:
+                call_order.append(key)
+            return outputs
+
+        return hook
+
+    # The stateless scope discards the updates of the non-trainable state,
+    # e.g. the moving statistics of `BatchNormalization`.
+    with (
+        profiling_utils.hook_calls(layers, create_hook),
+        backend.StatelessScope(),
+    ):
+        # The first run isn't timed, as it may include tracing and caching.
+        for run in range(num_runs + 1):
+            output_memory.clear()
+            activation_memory.clear()
+            if run == 1:
+                durations.clear()
+            model(x, training=True)
+
+    candidates = {id(layer): layer for layer in candidates}
+    profiles = []
+    for key in call_order:
+        layer = candidates[key]
+        num_calls = len(durations[key]) // num_runs
+        profiles.append(
+            LayerRematProfile(
+                path=layer.path,
+                name=layer.name,
+                output_memory=output_memory[key],
+                activation_memory=activation_memory.get(key, 0),
+                recompute_time=float(np.median(durations[key])) * num_calls,
+            )
+        )
+    return profiles
+
+
+def _has_activation(layer):
+    activation = getattr(layer, "activation", None)
+    return activation is not None and getattr(
+        activation, "__name__", None
+    ) not in ("linear", None)
+
+
+def _measure_activation_memory(model, x):
+    """Returns the size of the activations kept for the backward pass."""
+    import jax
+
+    trainable_variables = [v.value for v in model.trainable_variables]
+    non_trainable_variables = [v.value for v in model.non_trainable_variables]
+    x = tree.map_structure(ops.convert_to_tensor, x)
+
+    def forward(trainable_variables, x):
+        outputs, _ = model.stateless_call(
+            trainable_variables, non_trainable_variables, x, training=True
+        )
+        return outputs
+
+    _, vjp_fn = jax.vjp(forward, trainable_variables, x)
+    inputs = {
+        id(value)
+        for value in tree.flatten((trainable_variables, x))
+        + non_trainable_variables
+    }
+    residuals = {
+        id(value): value
+        for value in jax.tree_util.tree_leaves(vjp_fn)
+        if id(value) not in inputs
+    }
+    return sum(
+        summary_utils.tensors_memory_size(value) for value in residuals.values()
+    )
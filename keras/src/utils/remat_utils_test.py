@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.backend.common import global_state
+from keras.src.backend.common.remat import get_current_remat_mode
+from keras.src.utils.remat_utils import plan_remat
+
+
+class Block(layers.Layer):
+    def __init__(self, dim, **kwargs):
+        super().__init__(**kwargs)
+        self.up = layers.Dense(4 * dim, activation="relu")
+        self.down = layers.Dense(dim)
+
+    def build(self, input_shape):
+        self.up.build(input_shape)
+        self.down.build(input_shape[:-1] + (self.up.units,))
+
+    def call(self, x):
+        return x + self.down(self.up(x))
+
+
+def get_model():
+    inputs = layers.Input((8,))
+    x = layers.Dense(8, name="stem")(inputs)
+    for i in range(3):
+        x = Block(8, name=f"block_{i}")(x)
+    outputs = layers.Dense(2, name="head")(x)
+    return models.Model(inputs, outputs)
+
+
+def min_budget(model, x):
+    # The activation memory with all the layers rematerialized.
+    plan = plan_remat(model, x, memory_budget=10**9)
+    return sum(p.output_memory for p in plan.profiles)
+
+
+class RematUtilsTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        global_state.clear_session()
+
+    def test_plan_remat(self):
+        model = get_model()
+        x = np.random.random((16, 8)).astype("float32")
+        plan = plan_remat(model, x, memory_budget=10**9)
+        self.assertEqual(
+            [p.path for p in plan.profiles],
+            ["stem", "block_0", "block_1", "block_2", "head"],
+        )
+        profiles = {p.path: p for p in plan.profiles}
+        self.assertEqual(profiles["stem"].output_memory, 16 * 8 * 4)
+        self.assertEqual(profiles["stem"].activation_memory, 0)
+        # The outputs of the sublayers, and the inputs of the activation.
+        self.assertEqual(
+            profiles["block_0"].activation_memory, 16 * (32 + 32 + 8) * 4
+        )
+        for profile in plan.profiles:
+            self.assertGreater(profile.recompute_time, 0.0)
+        # The budget is met without rematerialization.
+        self.assertEqual(plan.layer_paths, [])
+        self.assertEqual(plan.predicted_savings, 0)
+
+        block_memory = profiles["block_0"].activation_memory
+        budget = plan.activation_memory - 2 * block_memory
+        plan = plan_remat(model, x, memory_budget=budget)
+        self.assertLen(plan.layer_paths, 2)
+        self.assertEqual(plan.layer_names, plan.layer_paths)
+        self.assertEqual(plan.predicted_savings, 2 * block_memory)
+        self.assertLessEqual(plan.predicted_activation_memory, budget)
+        report = plan.report()
+        self.assertIn("block_0", report)
+        self.assertIn("Predicted savings", report)
+
+        with self.assertRaisesRegex(ValueError, "can't be met"):
+            plan_remat(model, x, memory_budget=100)
+
+    def test_model_unchanged(self):
+        inputs = layers.Input((8,))
+        x = layers.Dense(8)(inputs)
+        x = layers.BatchNormalization()(x)
+        outputs = layers.Dropout(0.5)(x)
+        model = models.Model(inputs, outputs)
+        weights = model.get_weights()
+        x = np.random.random((16, 8)).astype("float32")
+        plan_remat(model, x, memory_budget=10**9)
+        for value, expected in zip(model.get_weights(), weights):
+            self.assertAllClose(value, expected)
+        # The hooked `call` methods are removed from the layers.
+        self.assertEqual(
+            [layer.name for layer in model.layers if "call" in layer.__dict__],
+            [],
+        )
+
+    @pytest.mark.requires_trainable_backend
+    def test_apply(self):
+        model = get_model()
+        x = np.random.random((16, 8)).astype("float32")
+        y = np.random.random((16, 2)).astype("float32")
+        expected = model(x)
+        plan = plan_remat(model, x, memory_budget=min_budget(model, x))
+        self.assertEqual(plan.layer_paths, ["block_0", "block_1", "block_2"])
+        plan.apply(model)
+        for path in plan.layer_paths:
+            self.assertEqual(model.get_layer(path)._remat_mode.mode, "full")
+        self.assertIsNone(model.get_layer("head")._remat_mode)
+        self.assertAllClose(model(x), expected)
+        model.compile(optimizer="sgd", loss="mse")
+        model.fit(x, y, verbose=0)
+
+        with plan.scope():
+            self.assertEqual(get_current_remat_mode().mode, "list_of_layers")
+            self.assertEqual(
+                get_current_remat_mode().layer_names, plan.layer_names
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax", reason="Requires the JAX backend"
+    )
+    def test_measure_savings(self):
+        model = get_model()
+        x = np.random.random((16, 8)).astype("float32")
+        plan = plan_remat(
+            model, x, memory_budget=min_budget(model, x), measure_savings=True
+        )
+        self.assertGreater(plan.measured_savings, 0)
+        self.assertIn("Measured savings", plan.report())
+        # The model is unchanged.
+        self.assertIsNone(model.get_layer("block_0")._remat_mode)
+
+    def test_errors(self):
+        model = models.Sequential([layers.Dense(2)])
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            plan_remat(model, np.zeros((2, 2)), memory_budget=0)
+        if backend.backend() != "jax":
+            model.build((None, 2))
+            with self.assertRaisesRegex(ValueError, "JAX backend"):
+                plan_remat(
+                    model,
+                    np.zeros((2, 2)),
+                    memory_budget=0,
+                    measure_savings=True,
+                )
@@ -3,6 +3,7 @@ import math
 import re
 import shutil
 
+import numpy as np
 import rich
 import rich.console
 import rich.markup
@@ -46,6 +47,26 @@ def weight_memory_size(weights):
     return total_memory_size / 8
 
 
+def tensors_memory_size(tensors):
+    """Compute the memory footprint of a structure of tensors.
+
+    Args:
+        tensors: A nested structure. Its leaves without a `shape` and a
+            `dtype` are ignored.
+
+    Returns:
+        The total memory size (in Bytes) of the tensors.
+    """
+    size = 0
+    for tensor in tree.flatten(tensors):
+        if hasattr(tensor, "shape") and hasattr(tensor, "dtype"):
+            size += (
+                math.prod(tensor.shape)
+                * np.dtype(backend.standardize_dtype(tensor.dtype)).itemsize
+            )
+    return size
+
+
 def readable_memory_size(weight_memory_size):
     """Convert the weight memory size (Bytes) to a readable string."""
     units = ["B", "KB", "MB", "GB", "TB", "PB"]
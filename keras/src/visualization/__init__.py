@@ -1,2 +1,6 @@
+from keras.src.api_export import lazy_module_attributes
 from keras.src.visualization import draw_bounding_boxes
 from keras.src.visualization import plot_image_gallery
+
+# The other submodules are imported on first access.
+__getattr__, __dir__ = lazy_module_attributes(__name__, {}, submodules=True)